@@ -1,3 +1,8 @@
+feature_cols = [
+    "seed", "weight_employed", "weight_promoted", "weight_change", "weight_left",
+    "min_employees_for_leaving", "min_events_per_week", "max_events_per_day", "max_events_per_type"
+]
+
 target_cols = [
     "total_num_hired", "total_num_left", "total_num_promoted", "org_saturation_day",
     "vp_team_size_skew", "director_team_size_skew", "manager_team_size_skew",
@@ -14,3 +19,9 @@ automl_settings = {
     "early_stop": True,
     "n_jobs": 4,  # Set to >1 if you want parallelism
 }
+
+# Whole-job training parallelism: targets (and CV folds) are fitted concurrently
+training_settings = {
+    "n_workers": None,           # worker processes; None = one per core, capped at the number of models
+    "total_time_budget": None,   # wall-clock seconds for a whole fit / CV run; None = `time_budget` per model
+}
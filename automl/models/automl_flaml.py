@@ -1,25 +1,125 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import get_context
 from flaml.automl import AutoML
 from sklearn.base import BaseEstimator, RegressorMixin
 import numpy as np
 import joblib
+import math
 import os
+import time
+
+# Floor for a single model's FLAML time budget (seconds) under a whole-job budget
+MIN_TIME_BUDGET = 1.0
+# Share of the remaining wall-clock handed to FLAML; the rest covers retraining and IPC
+BUDGET_SAFETY = 0.85
+
+
+def _fit_one(X, y, settings):
+    model = AutoML()
+    model.fit(X, y, **settings)
+    return model
+
+
+def fit_automl_models(tasks, settings, n_workers=None, total_time_budget=None):
+    """
+    Fit one FLAML AutoML per (X, y) task, running tasks concurrently.
+
+    - Up to `n_workers` tasks run at once in separate processes; the machine's
+      cores are split between them through FLAML's `n_jobs`
+    - With `total_time_budget`, each task's `time_budget` is set as it starts
+      from the time left and the number of task waves still to run, so the
+      whole call finishes within roughly that many seconds
+    - Without it, every task uses `settings["time_budget"]` as before
+
+    Args:
+        tasks (list): (X, y) pairs, one per model.
+        settings (dict): FLAML `AutoML.fit` settings shared by all tasks.
+        n_workers (int, optional): Worker processes. Defaults to one per core,
+            capped at the number of tasks; 1 fits sequentially in-process.
+        total_time_budget (float, optional): Wall-clock seconds for all tasks.
+
+    Returns:
+        list: Fitted AutoML models, in task order.
+    """
+    cores = os.cpu_count() or 1
+    n_workers = max(1, min(len(tasks), n_workers or cores))
+    parallel = n_workers > 1
+    deadline = time.monotonic() + total_time_budget if total_time_budget else None
+
+    def task_settings(i):
+        task = dict(settings)
+        if parallel:
+            task["n_jobs"] = max(1, cores // n_workers)
+            # Separate log per task; concurrent writers would interleave
+            if task.get("log_file_name"):
+                stem, ext = os.path.splitext(task["log_file_name"])
+                task["log_file_name"] = f"{stem}.{i}{ext}"
+        if deadline is not None:
+            waves = math.ceil((len(tasks) - i) / n_workers)
+            left = deadline - time.monotonic()
+            task["time_budget"] = max(MIN_TIME_BUDGET, BUDGET_SAFETY * left / waves)
+        return task
+
+    if not parallel:
+        return [_fit_one(X, y, task_settings(i)) for i, (X, y) in enumerate(tasks)]
+
+    models = [None] * len(tasks)
+    # Spawned workers: forking after XGBoost/OpenMP has run in the parent can deadlock
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=get_context("spawn")) as pool:
+        running = {}
+        next_task = 0
+        while next_task < len(tasks) or running:
+            # Submit lazily so each task's budget reflects the time actually left
+            while next_task < len(tasks) and len(running) < n_workers:
+                X, y = tasks[next_task]
+                running[pool.submit(_fit_one, X, y, task_settings(next_task))] = next_task
+                next_task += 1
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                models[running.pop(future)] = future.result()
+    return models
+
 
 class MultiOutputFLAML(BaseEstimator, RegressorMixin):
-    def __init__(self, settings=None):
+    def __init__(self, settings=None, n_workers=None, total_time_budget=None):
         self.settings = settings or {}
+        self.n_workers = n_workers
+        self.total_time_budget = total_time_budget
         self.models = []
 
     def fit(self, X, Y):
-        self.models = []
-        for col in Y.columns:
-            model = AutoML()
-            model.fit(X, Y[col], **self.settings)
-            self.models.append(model)
+        """
+        Fit one FLAML model per target column, concurrently (see `fit_automl_models`).
+        """
+        self.models = fit_automl_models(
+            [(X, Y[col]) for col in Y.columns],
+            self.settings,
+            n_workers=self.n_workers,
+            total_time_budget=self.total_time_budget,
+        )
         return self
 
+    def __sklearn_is_fitted__(self):
+        return bool(self.models)
+
     def predict(self, X):
         return np.stack([m.predict(X) for m in self.models], axis=1)
 
+    def boosters(self):
+        """
+        The fitted XGBoost booster behind each target's best model.
+
+        Raises:
+            ValueError: If a target's best estimator is not XGBoost.
+        """
+        boosters = []
+        for i, model in enumerate(self.models):
+            if not str(model.best_estimator).startswith("xgboost"):
+                raise ValueError(f"Target {i} uses {model.best_estimator!r}, not XGBoost")
+            estimator = model.model.estimator
+            boosters.append(estimator.get_booster() if hasattr(estimator, "get_booster") else estimator)
+        return boosters
+
     def save(self, path: str):
         """
         Save the model list and settings to the given path.
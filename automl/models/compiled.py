@@ -0,0 +1,169 @@
+import copy
+import json
+from pathlib import Path
+from typing import List, Sequence
+
+import numpy as np
+
+# Bump when the on-disk layout changes
+COMPILED_FORMAT_VERSION = 1
+
+COMPILED_MODEL_PATH = "automl/models/surrogate_compiled.json"
+
+# Objectives whose prediction is the raw margin (no link function)
+IDENTITY_OBJECTIVES = {"reg:squarederror", "reg:absoluteerror", "reg:pseudohubererror"}
+
+
+class CompiledSurrogate:
+    """
+    Lightweight inference artefact for the multi-output XGBoost surrogate.
+
+    The per-target boosters found by FLAML are merged into a single
+    multi-target XGBoost model (each tree tagged with the target it feeds),
+    and the StandardScaler is reduced to its mean/scale vectors. Prediction
+    is one affine step plus one `inplace_predict` call that returns every
+    target at once, matching `Pipeline(StandardScaler, MultiOutputFLAML)`.
+
+    Loading needs only numpy and xgboost: no FLAML, joblib or pickles.
+    """
+
+    def __init__(
+        self,
+        booster,
+        mean: np.ndarray,
+        scale: np.ndarray,
+        feature_names: Sequence[str],
+        target_names: Sequence[str],
+    ):
+        self.booster = booster
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.feature_names = list(feature_names)
+        self.target_names = list(target_names)
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Predict every target for every row.
+
+        Args:
+            X (array-like): (n_rows, n_features) inputs in `feature_names` order.
+
+        Returns:
+            np.ndarray: (n_rows, n_targets) predictions.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim != 2 or X.shape[1] != len(self.feature_names):
+            raise ValueError(f"Expected shape (n, {len(self.feature_names)}), got {X.shape}")
+        # Same arithmetic as StandardScaler.transform
+        y = self.booster.inplace_predict((X - self.mean) / self.scale)
+        return np.asarray(y, dtype=np.float64).reshape(len(X), len(self.target_names))
+
+    # ==== Building ====
+
+    @classmethod
+    def from_boosters(
+        cls,
+        boosters: List,
+        mean: np.ndarray,
+        scale: np.ndarray,
+        feature_names: Sequence[str],
+        target_names: Sequence[str],
+    ) -> "CompiledSurrogate":
+        """
+        Merge fitted single-output XGBoost boosters (one per target) into one model.
+
+        Args:
+            boosters (List[xgboost.Booster]): One tree booster per target, in `target_names` order.
+            mean (np.ndarray): Scaler mean per feature.
+            scale (np.ndarray): Scaler scale per feature.
+            feature_names (Sequence[str]): Input feature order.
+            target_names (Sequence[str]): Output target order.
+
+        Raises:
+            ValueError: If a booster uses an unsupported objective or booster type.
+        """
+        import xgboost
+
+        models = [json.loads(booster.save_raw("json")) for booster in boosters]
+        rounds, base_scores = [], []
+        for name, booster, model in zip(target_names, boosters, models):
+            learner = model["learner"]
+            if learner["objective"]["name"] not in IDENTITY_OBJECTIVES:
+                raise ValueError(f"Cannot compile objective {learner['objective']['name']!r} for {name}")
+            if learner["gradient_booster"]["name"] != "gbtree":
+                raise ValueError(f"Cannot compile booster {learner['gradient_booster']['name']!r} for {name}")
+
+            # Newer XGBoost stores base_score as a vector, e.g. "[1.5E2]"
+            base_scores.append(learner["learner_model_param"]["base_score"].strip("[]"))
+
+            gbtree = learner["gradient_booster"]["model"]
+            per_round = int(gbtree["gbtree_model_param"]["num_parallel_tree"])
+            trees = gbtree["trees"]
+            best_iteration = booster.attributes().get("best_iteration")
+            if best_iteration is not None:
+                trees = trees[:(int(best_iteration) + 1) * per_round]
+            rounds.append([trees[i:i + per_round] for i in range(0, len(trees), per_round)])
+
+        # Interleave by boosting round; `tree_info` routes each tree to its target
+        trees, tree_info, iteration_indptr = [], [], [0]
+        for r in range(max(len(target_rounds) for target_rounds in rounds)):
+            for target, target_rounds in enumerate(rounds):
+                for tree in target_rounds[r] if r < len(target_rounds) else ():
+                    tree = dict(tree, id=len(trees))
+                    trees.append(tree)
+                    tree_info.append(target)
+            iteration_indptr.append(len(trees))
+
+        merged = copy.deepcopy(models[0])
+        learner = merged["learner"]
+        learner["learner_model_param"]["num_target"] = str(len(boosters))
+        learner["learner_model_param"]["base_score"] = "[" + ",".join(base_scores) + "]"
+        learner["attributes"] = {}
+        gbtree = learner["gradient_booster"]["model"]
+        gbtree["trees"] = trees
+        gbtree["tree_info"] = tree_info
+        gbtree["iteration_indptr"] = iteration_indptr
+        gbtree["gbtree_model_param"] = {"num_parallel_tree": "1", "num_trees": str(len(trees))}
+
+        booster = xgboost.Booster()
+        booster.load_model(bytearray(json.dumps(merged).encode()))
+        return cls(booster, mean, scale, feature_names, target_names)
+
+    # ==== Persistence ====
+
+    def save(self, path) -> None:
+        """
+        Write the artefact as one JSON file: metadata, scaler vectors and the XGBoost model.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({
+                "version": COMPILED_FORMAT_VERSION,
+                "feature_names": self.feature_names,
+                "target_names": self.target_names,
+                "mean": self.mean.tolist(),
+                "scale": self.scale.tolist(),
+                "booster": json.loads(self.booster.save_raw("json")),
+            }, f)
+
+    @classmethod
+    def load(cls, path) -> "CompiledSurrogate":
+        import xgboost
+
+        with open(path, "r") as f:
+            artefact = json.load(f)
+        if artefact["version"] != COMPILED_FORMAT_VERSION:
+            raise ValueError(
+                f"Compiled surrogate format {artefact['version']} is not supported "
+                f"(expected {COMPILED_FORMAT_VERSION}); re-export the model"
+            )
+        booster = xgboost.Booster()
+        booster.load_model(bytearray(json.dumps(artefact["booster"]).encode()))
+        return cls(
+            booster,
+            np.array(artefact["mean"]),
+            np.array(artefact["scale"]),
+            artefact["feature_names"],
+            artefact["target_names"],
+        )
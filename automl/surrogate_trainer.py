@@ -7,32 +7,57 @@ from joblib import dump, load
 from pathlib import Path
 
 from automl.data_loader import load_simteam_data
-from automl.models.automl_flaml import MultiOutputFLAML
-from automl.config import automl_settings, target_cols
+from automl.models.automl_flaml import MultiOutputFLAML, fit_automl_models
+from automl.models.compiled import COMPILED_MODEL_PATH, CompiledSurrogate
+from automl.config import automl_settings, feature_cols, target_cols, training_settings
 
 class SurrogateTrainer:
-    def __init__(self, model_path="automl/models/flaml_pipeline.joblib", settings=None):
+    def __init__(self, model_path="automl/models/flaml_pipeline.joblib", settings=None,
+                 n_workers=None, total_time_budget=None):
         self.model_path = Path(model_path)
         self.settings = settings or automl_settings
-        self.pipeline = Pipeline([
-            ("scaler", StandardScaler()),
-            ("automl", MultiOutputFLAML(settings=self.settings))
-        ])
+        self.n_workers = n_workers or training_settings["n_workers"]
+        self.total_time_budget = total_time_budget or training_settings["total_time_budget"]
+        self.pipeline = self._new_pipeline()
         self.fitted = False  # Track whether pipeline has been trained
 
+    def _new_pipeline(self, scaler=None):
+        return Pipeline([
+            ("scaler", scaler or StandardScaler()),
+            ("automl", MultiOutputFLAML(
+                settings=self.settings,
+                n_workers=self.n_workers,
+                total_time_budget=self.total_time_budget,
+            ))
+        ])
+
     def train_with_cv(self, n_splits=5, random_state=42):
+        """
+        Cross-validate the surrogate, fitting all folds x targets concurrently.
+
+        `total_time_budget` (if set) covers the whole CV run, not each fold.
+        """
         X, y = load_simteam_data()
         kf = KFold(n_splits=n_splits, shuffle=True, random_state=random_state)
-        rmse_scores = []
+        folds = list(kf.split(X))
+
+        # Scale per fold (cheap), then hand every (fold, target) model to one pool
+        scalers, tasks = [], []
+        for train_idx, _ in folds:
+            scaler = StandardScaler().fit(X.iloc[train_idx])
+            X_train = scaler.transform(X.iloc[train_idx])
+            scalers.append(scaler)
+            tasks.extend((X_train, y.iloc[train_idx][col]) for col in target_cols)
 
-        for fold, (train_idx, test_idx) in enumerate(kf.split(X), 1):
-            print(f"Training fold {fold}/{n_splits}...")
-            X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
-            y_train, y_test = y.iloc[train_idx], y.iloc[test_idx]
+        print(f"Training {n_splits} folds x {len(target_cols)} targets...")
+        models = fit_automl_models(tasks, self.settings, self.n_workers, self.total_time_budget)
 
-            self.pipeline.fit(X_train, y_train)
-            preds = self.pipeline.predict(X_test)
-            fold_rmse = np.sqrt(((preds - y_test.values) ** 2).mean(axis=0))
+        rmse_scores = []
+        for fold, (scaler, (_, test_idx)) in enumerate(zip(scalers, folds)):
+            self.pipeline = self._new_pipeline(scaler)
+            self.pipeline.named_steps["automl"].models = models[fold * len(target_cols):(fold + 1) * len(target_cols)]
+            preds = self.pipeline.predict(X.iloc[test_idx])
+            fold_rmse = np.sqrt(((preds - y.iloc[test_idx].values) ** 2).mean(axis=0))
             rmse_scores.append(fold_rmse)
 
         self.fitted = True
@@ -57,6 +82,43 @@ class SurrogateTrainer:
         self.fitted = True
         print(f"Model loaded from {self.model_path}")
 
+    def compile(self) -> CompiledSurrogate:
+        """
+        Flatten the fitted pipeline (scaler + per-target XGBoost models) into a
+        single numpy-only inference object.
+        """
+        if not self.fitted:
+            raise RuntimeError("Model not fitted. Call `fit_full()` or `load()` first.")
+        scaler = self.pipeline.named_steps["scaler"]
+        return CompiledSurrogate.from_boosters(
+            self.pipeline.named_steps["automl"].boosters(),
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            feature_names=list(getattr(scaler, "feature_names_in_", feature_cols)),
+            target_names=target_cols,
+        )
+
+    def export_compiled(self, path=COMPILED_MODEL_PATH, check_rows=256) -> CompiledSurrogate:
+        """
+        Compile the fitted pipeline, check it against the full pipeline and save it.
+
+        Args:
+            path (str): Output JSON path; load it with `CompiledSurrogate.load`.
+            check_rows (int): Training rows used to verify the compiled predictions.
+        """
+        compiled = self.compile()
+        X, _ = load_simteam_data()
+        X_check = X[compiled.feature_names].iloc[:check_rows]
+        expected = self.pipeline.predict(X_check)
+        actual = compiled.predict(X_check.to_numpy())
+        max_error = float(np.abs(expected - actual).max())
+        if not np.allclose(expected, actual, rtol=1e-4, atol=1e-3):
+            raise RuntimeError(f"Compiled surrogate disagrees with the pipeline (max abs error {max_error:.3g})")
+
+        compiled.save(path)
+        print(f"Compiled surrogate (max abs error {max_error:.2g}) saved to {path}")
+        return compiled
+
     def predict(self, X_new):
         if not self.fitted:
             raise RuntimeError("Model not fitted. Call `fit_full()` or `load()` first.")
@@ -0,0 +1,232 @@
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.stats import qmc
+
+from automl.config import automl_settings, feature_cols, target_cols
+from automl.models.automl_flaml import fit_automl_models
+from automl.training_data.generate_training_data import (
+    build_task,
+    max_events_per_day_list,
+    max_events_per_type_list,
+    min_employees_list,
+    min_events_per_week_list,
+    start_date,
+)
+from simteam.core.batch import BatchRunner
+
+ACTIVE_PATH = Path(__file__).resolve().parent / "sim_training_data.active.csv"
+
+# Inclusive integer bounds per feature; weights span the API's 1..5 range,
+# the rest match the ranges covered by the fixed grid. Seeds are assigned, not sampled.
+PARAM_SPACE: Dict[str, Tuple[int, int]] = {
+    "weight_employed": (1, 5),
+    "weight_promoted": (1, 5),
+    "weight_change": (1, 5),
+    "weight_left": (1, 5),
+    "min_employees_for_leaving": (min(min_employees_list), max(min_employees_list)),
+    "min_events_per_week": (min(min_events_per_week_list), max(min_events_per_week_list)),
+    "max_events_per_day": (min(max_events_per_day_list), max(max_events_per_day_list)),
+    "max_events_per_type": (min(max_events_per_type_list), max(max_events_per_type_list)),
+}
+
+# Cheap committee models: small budget, quiet, no log file
+COMMITTEE_SETTINGS = {**automl_settings, "verbose": 0, "log_file_name": ""}
+
+# Labelled neighbours used to estimate local out-of-fold error
+N_NEIGHBOURS = 5
+# Weight of local out-of-fold error in the acquisition score. Off by default:
+# per-point error is dominated by seed noise, which more samples cannot reduce,
+# whereas committee disagreement tracks reducible (model) uncertainty.
+ERROR_WEIGHT = 0.0
+
+
+def latin_hypercube(n: int, seed: int) -> List[dict]:
+    """
+    `n` space-filling parameter points over PARAM_SPACE (without seeds).
+    """
+    unit = qmc.LatinHypercube(d=len(PARAM_SPACE), seed=seed).random(n)
+    lows = np.array([lo for lo, _ in PARAM_SPACE.values()])
+    spans = np.array([hi - lo + 1 for lo, hi in PARAM_SPACE.values()])
+    values = lows + np.minimum(np.floor(unit * spans), spans - 1).astype(int)
+    return [dict(zip(PARAM_SPACE, map(int, row))) for row in values]
+
+
+def _with_seeds(points: List[dict], first_seed: int) -> List[dict]:
+    # Order matches `feature_cols`, so output rows line up with the grid CSV
+    return [{"seed": first_seed + i, **point} for i, point in enumerate(points)]
+
+
+def _simulate(points: List[dict], output_path: Path, n_workers: Optional[int]) -> None:
+    runner = BatchRunner(n_workers=n_workers, start_date=start_date)
+    for _ in runner.run([build_task(point) for point in points], output_path=output_path):
+        pass
+
+
+class Committee:
+    """
+    One surrogate per CV fold, trained on the labelled data so far.
+
+    The fold models provide both out-of-fold predictions (CV error, overall
+    and per labelled point) and a committee whose disagreement on unlabelled
+    candidates measures model uncertainty.
+    """
+
+    def __init__(self, data: pd.DataFrame, n_folds: int, time_budget: float,
+                 n_workers: Optional[int], random_state: int):
+        X = data[feature_cols].to_numpy(dtype=np.float64)
+        y = data[target_cols].to_numpy(dtype=np.float64)
+        self.mean, self.scale = X.mean(axis=0), X.std(axis=0)
+        self.scale[self.scale == 0] = 1.0
+        # Errors are compared across targets in units of each target's spread
+        self.target_scale = y.std(axis=0)
+        self.target_scale[self.target_scale == 0] = 1.0
+
+        folds = np.random.default_rng(random_state).permutation(len(X)) % n_folds
+        Xs = self._scale(X)
+        tasks = [
+            (Xs[folds != k], y[folds != k, t])
+            for k in range(n_folds) for t in range(len(target_cols))
+        ]
+        models = fit_automl_models(tasks, COMMITTEE_SETTINGS, n_workers, time_budget)
+        self.members = [models[k * len(target_cols):(k + 1) * len(target_cols)] for k in range(n_folds)]
+
+        oof = np.empty_like(y)
+        for k, member in enumerate(self.members):
+            oof[folds == k] = self._predict_member(member, Xs[folds == k])
+        self.point_error = np.sqrt((((oof - y) / self.target_scale) ** 2).mean(axis=1))
+        self.cv_rmse = np.sqrt(((oof - y) ** 2).mean(axis=0))
+        self.X = X
+
+    def _scale(self, X: np.ndarray) -> np.ndarray:
+        return (X - self.mean) / self.scale
+
+    @staticmethod
+    def _predict_member(member, Xs: np.ndarray) -> np.ndarray:
+        return np.stack([model.predict(Xs) for model in member], axis=1)
+
+    def score(self, candidates: List[dict]) -> np.ndarray:
+        """
+        Acquisition score per candidate: committee disagreement plus
+        `ERROR_WEIGHT` x the out-of-fold error of its nearest labelled
+        neighbours (both in target-std units).
+        """
+        C = np.array([[c[col] for col in feature_cols] for c in candidates], dtype=np.float64)
+        Cs = self._scale(C)
+        preds = np.stack([self._predict_member(member, Cs) for member in self.members])
+        disagreement = (preds.std(axis=0) / self.target_scale).mean(axis=1)
+
+        # Seeds carry no structure; leave them out of the neighbourhood metric
+        dims = [i for i, col in enumerate(feature_cols) if col != "seed"]
+        labelled = self._scale(self.X)[:, dims]
+        points = Cs[:, dims]
+        distances = (
+            (points ** 2).sum(axis=1)[:, None]
+            + (labelled ** 2).sum(axis=1)[None, :]
+            - 2 * points @ labelled.T
+        )
+        k = min(N_NEIGHBOURS, len(labelled))
+        nearest = np.argpartition(distances, k - 1, axis=1)[:, :k]
+        local_error = self.point_error[nearest].mean(axis=1)
+
+        return disagreement + ERROR_WEIGHT * local_error
+
+
+def _select(candidates: List[dict], scores: np.ndarray, n: int) -> List[dict]:
+    """
+    Highest-scoring candidates, at most one per distinct parameter point.
+    """
+    chosen, seen = [], set()
+    for idx in np.argsort(-scores):
+        point = tuple(candidates[idx][col] for col in PARAM_SPACE)
+        if point not in seen:
+            seen.add(point)
+            chosen.append(candidates[idx])
+            if len(chosen) == n:
+                break
+    return chosen
+
+
+def generate_active_learning_data(
+    output_path=ACTIVE_PATH,
+    total_sims: int = 1500,
+    initial_sims: int = 300,
+    batch_sims: int = 150,
+    candidates_per_sim: int = 20,
+    n_folds: int = 5,
+    round_time_budget: float = 60.0,
+    n_workers: Optional[int] = None,
+    random_state: int = 0,
+) -> pd.DataFrame:
+    """
+    Generate surrogate training data adaptively instead of over a fixed grid.
+
+    1. Simulate a Latin hypercube design of `initial_sims` points
+    2. Train a CV committee on everything simulated so far
+    3. Score a fresh Latin hypercube of candidates by committee disagreement
+       (see `Committee.score`) and simulate the top `batch_sims`
+    4. Repeat until `total_sims` simulations have run
+
+    Rows are streamed to `output_path`; re-running resumes from it.
+
+    Args:
+        output_path (Path): CSV of simulated rows (same columns as the grid data).
+        total_sims (int): Simulation budget.
+        initial_sims (int): Size of the space-filling design.
+        batch_sims (int): Simulations added per active-learning round.
+        candidates_per_sim (int): Candidates scored per simulation to pick.
+        n_folds (int): Committee size (CV folds).
+        round_time_budget (float): Wall-clock seconds to train each committee.
+        n_workers (int, optional): Processes for simulations and training.
+        random_state (int): Seed for designs and fold assignment.
+
+    Returns:
+        pd.DataFrame: All simulated rows.
+    """
+    output_path = Path(output_path)
+    _simulate(_with_seeds(latin_hypercube(initial_sims, random_state), 0), output_path, n_workers)
+    data = pd.read_csv(output_path)
+
+    round_no = 0
+    while len(data) < total_sims:
+        round_no += 1
+        committee = Committee(data, n_folds, round_time_budget, n_workers, random_state + round_no)
+        print(
+            f"Round {round_no}: {len(data)} sims, CV RMSE (target-std units) "
+            f"{(committee.cv_rmse / committee.target_scale).mean():.3f}"
+        )
+
+        n_new = min(batch_sims, total_sims - len(data))
+        candidates = _with_seeds(
+            latin_hypercube(n_new * candidates_per_sim, random_state + round_no),
+            int(data["seed"].max()) + 1,
+        )
+        chosen = _select(candidates, committee.score(candidates), n_new)
+        _simulate(chosen, output_path, n_workers)
+        data = pd.read_csv(output_path)
+
+    return data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Active-learning training data for the surrogate.")
+    parser.add_argument("--output", default=str(ACTIVE_PATH))
+    parser.add_argument("--total-sims", type=int, default=1500)
+    parser.add_argument("--initial-sims", type=int, default=300)
+    parser.add_argument("--batch-sims", type=int, default=150)
+    parser.add_argument("--round-time-budget", type=float, default=60.0)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    df = generate_active_learning_data(
+        output_path=args.output,
+        total_sims=args.total_sims,
+        initial_sims=args.initial_sims,
+        batch_sims=args.batch_sims,
+        round_time_budget=args.round_time_budget,
+        n_workers=args.workers,
+    )
+    print(f"✅ {len(df)} simulations saved to {args.output}")
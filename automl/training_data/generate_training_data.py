@@ -5,11 +5,12 @@ from itertools import product
 from datetime import datetime
 from tqdm import tqdm
 
+from simteam.core.batch import BatchProgress, BatchRunner, BatchTask
 from simteam.core.config import SimulationConfig, get_default_config
-from simteam.core.orgsimulator import OrgSimulator
 from simteam.core.enums import Role, EventType
 
 DATA_PATH = Path(__file__).resolve().parent / "sim_training_data.csv"
+PARTIAL_PATH = DATA_PATH.with_suffix(".partial.csv")
 
 # 8 valid weight combos: (LEFT, CHANGE, PROMOTED, EMPLOYED)
 event_type_weight_combinations = [
@@ -35,55 +36,72 @@ max_employees = 100
 start_date = datetime(2025, 1, 1)
 
 
-def generate_surrogate_training_data() -> pd.DataFrame:
-    results = []
-    grid = product(
-        event_type_weight_combinations,
-        min_employees_list,
-        min_events_per_week_list,
-        max_events_per_day_list,
-        max_events_per_type_list,
-        seeds,
+def build_config(
+    event_type_weights: tuple,
+    min_employees_for_leaving: int,
+    min_events_per_week: int,
+    max_events_per_day: int,
+    max_events_per_type: int,
+    seed: int,
+) -> SimulationConfig:
+    w_left, w_change, w_promoted, w_employed = event_type_weights
+    base_cfg = get_default_config()
+
+    return SimulationConfig(
+        role_quotas={**base_cfg.role_quotas, Role.MANAGER: manager_quota},
+        max_employees=max_employees,
+        max_events_per_type=max_events_per_type,
+        max_events_per_day=max_events_per_day,
+        vacancy_fill_deadline_days=10,
+        min_employees_for_leaving=min_employees_for_leaving,
+        promotion_order=base_cfg.promotion_order,
+        allowed_manager_mapping=base_cfg.allowed_manager_mapping,
+        event_type_weights={
+            EventType.EMPLOYED: w_employed,
+            EventType.PROMOTED: w_promoted,
+            EventType.LEFT: w_left,
+            EventType.CHANGE: w_change,
+        },
+        event_type_caps=base_cfg.event_type_caps,
+        min_events_per_week=min_events_per_week,
+        random_seed=seed,
     )
 
+
+def build_task(params: dict, sim_days: int = 365) -> BatchTask:
+    """
+    Build one batch task from surrogate feature values (see `automl.config.feature_cols`).
+    """
+    config = build_config(
+        (params["weight_left"], params["weight_change"], params["weight_promoted"], params["weight_employed"]),
+        params["min_employees_for_leaving"],
+        params["min_events_per_week"],
+        params["max_events_per_day"],
+        params["max_events_per_type"],
+        params["seed"],
+    )
+    return BatchTask(config=config, params=dict(params), sim_days=sim_days)
+
+
+def build_tasks() -> list[BatchTask]:
+    tasks = []
     for (
-        (w_left, w_change, w_promoted, w_employed),
+        weights,
         min_employees_for_leaving,
         min_events_per_week,
         max_events_per_day,
         max_events_per_type,
         seed,
-    ) in tqdm(grid, total=8 * 3 * 2 * 3 * 2 * 20):
-
-        base_cfg = get_default_config()
-        event_type_weights = {
-            EventType.EMPLOYED: w_employed,
-            EventType.PROMOTED: w_promoted,
-            EventType.LEFT: w_left,
-            EventType.CHANGE: w_change,
-        }
-
-        config = SimulationConfig(
-            role_quotas={**base_cfg.role_quotas, Role.MANAGER: manager_quota},
-            max_employees=max_employees,
-            max_events_per_type=max_events_per_type,
-            max_events_per_day=max_events_per_day,
-            vacancy_fill_deadline_days=10,
-            min_employees_for_leaving=min_employees_for_leaving,
-            promotion_order=base_cfg.promotion_order,
-            allowed_manager_mapping=base_cfg.allowed_manager_mapping,
-            event_type_weights=event_type_weights,
-            event_type_caps=base_cfg.event_type_caps,
-            min_events_per_week=min_events_per_week,
-            random_seed=seed,
-        )
-
-        sim = OrgSimulator(start_date=start_date, config=config)
-        sim.simulate_for_days(365)
-        sim.compute_hiring_statistics()
-        row = sim.compute_hiring_statistics()
-
-        row.update({
+    ) in product(
+        event_type_weight_combinations,
+        min_employees_list,
+        min_events_per_week_list,
+        max_events_per_day_list,
+        max_events_per_type_list,
+        seeds,
+    ):
+        w_left, w_change, w_promoted, w_employed = weights
+        tasks.append(build_task({
             "seed": seed,
             "weight_employed": w_employed,
             "weight_promoted": w_promoted,
@@ -92,20 +110,39 @@ def generate_surrogate_training_data() -> pd.DataFrame:
             "min_employees_for_leaving": min_employees_for_leaving,
             "min_events_per_week": min_events_per_week,
             "max_events_per_day": max_events_per_day,
-            "max_events_per_type": max_events_per_type
-        })
+            "max_events_per_type": max_events_per_type,
+        }))
+    return tasks
+
+
+def generate_surrogate_training_data(output_path=PARTIAL_PATH, n_workers=None) -> pd.DataFrame:
+    """
+    Run the full grid across a process pool, streaming rows to `output_path`.
+
+    Re-running after an interruption resumes from the rows already written.
+    """
+    tasks = build_tasks()
+    with tqdm(total=len(tasks)) as bar:
+        def report(progress: BatchProgress):
+            bar.n = progress.done + progress.skipped
+            bar.set_postfix(sims_per_sec=f"{progress.sims_per_sec:.1f}")
+            bar.refresh()
 
-        results.append(row)
+        runner = BatchRunner(n_workers=n_workers, start_date=start_date, progress=report)
+        for _ in runner.run(tasks, output_path=output_path):
+            pass
 
-    return pd.DataFrame(results)
+    if runner.last_progress:
+        print(f"⏱️ {runner.last_progress.sims_per_sec:.1f} sims/sec")
+    return pd.read_csv(output_path)
 
 
 if __name__ == "__main__":
     if not os.path.exists(DATA_PATH):
         print("📦 Training data not found. Generating synthetic dataset...")
         df = generate_surrogate_training_data()
-        os.makedirs("training_data", exist_ok=True)
         df.to_csv(DATA_PATH, index=False)
+        os.remove(PARTIAL_PATH)
         print(f"✅ Saved to {DATA_PATH}")
     else:
         print("✅ Training data already exists. Skipping generation.")
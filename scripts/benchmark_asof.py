@@ -0,0 +1,69 @@
+# benchmark_asof.py
+#
+# As-of query latency vs. event log length: replaying the whole log up to
+# the requested day against OrgTimeline snapshots every K days.
+#
+#   python scripts/benchmark_asof.py [--days 1000 4000 16000 64000] [--intervals 7 30 90] [--queries 200]
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from simteam.core.config import get_default_config
+from simteam.core.models.timeline import OrgTimeline
+from simteam.core.orgsimulator import OrgSimulator
+
+# Interval that never materialises a snapshot: every query replays from the first event
+FULL_REPLAY = 10**6
+
+
+def median_query_ms(timeline: OrgTimeline, days, repeats: int = 3) -> float:
+    times = []
+    for day in days:
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            timeline.latest_rows(day)
+            best = min(best, time.perf_counter() - start)
+        times.append(best)
+    return statistics.median(times) * 1000
+
+
+def main(day_counts, intervals, n_queries: int):
+    rng = random.Random(0)
+    start_date = datetime(2025, 1, 1)
+    sim = OrgSimulator(start_date, get_default_config())
+
+    labels = ["full replay"] + [f"K={k}" for k in intervals]
+    # Snapshot memory is reported for the last interval
+    print(f"{'days':>6} {'events':>9} " + " ".join(f"{label:>12}" for label in labels) + f" {'snap KiB':>9}")
+
+    simulated = 0
+    for n_days in sorted(day_counts):
+        sim.simulate_for_days(n_days - simulated)
+        simulated = n_days
+        query_days = [start_date + timedelta(days=rng.randrange(n_days)) for _ in range(n_queries)]
+
+        results = []
+        for interval in [FULL_REPLAY] + list(intervals):
+            timeline = OrgTimeline(sim.event_log, interval)
+            timeline.refresh()
+            results.append(median_query_ms(timeline, query_days))
+        snapshot_kib = timeline.snapshot_nbytes / 1024
+
+        print(
+            f"{n_days:>6} {len(sim.event_log):>9} "
+            + " ".join(f"{ms:>10.3f}ms" for ms in results)
+            + f" {snapshot_kib:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark as-of org queries over the event log.")
+    parser.add_argument("--days", type=int, nargs="+", default=[1000, 4000, 16000, 64000])
+    parser.add_argument("--intervals", type=int, nargs="+", default=[7, 30, 90])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+    main(args.days, args.intervals, args.queries)
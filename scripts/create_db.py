@@ -1,10 +1,15 @@
 # create_db.py
 
+import argparse
+import csv
+import io
 import json
 import os
 import time
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
+from typing import Iterable, Iterator, List
 
 from sqlalchemy.exc import OperationalError
 from simteam.server.db.session import Base, engine, Session
@@ -53,9 +58,156 @@ def insert_data(db_session, data: dict):
     db_session.commit()
 
 
+# ==== Bulk loading ====
+
+DEFAULT_CHUNK_SIZE = 10_000
+COPY_NULL = r"\N"
+
+EMPLOYEE_COLUMNS = ["emp_id", "role", "manager_id", "department", "team", "hire_date", "active"]
+EVENT_COLUMNS = ["date", "event_type", "employee_id", "role", "manager_id", "department", "team"]
+
+
+def employee_rows_from_json(data: dict) -> Iterator[dict]:
+    for entry in data.get("employees", []) + data.get("temp_employees", []):
+        yield {
+            "emp_id": entry["emp_id"],
+            "role": Role(entry["role"]),
+            "manager_id": entry.get("manager_id"),
+            "department": entry.get("department"),
+            "team": entry.get("team"),
+            "hire_date": parse_datetime(entry["hire_date"]),
+            "active": entry["active"],
+        }
+
+
+def event_rows_from_json(data: dict) -> Iterator[dict]:
+    for entry in data.get("event_log", []):
+        yield {
+            "date": parse_datetime(entry["date"]),
+            "event_type": EventType(entry["event_type"]),
+            "employee_id": entry["employee_id"],
+            "role": Role(entry["role"]),
+            "manager_id": entry.get("manager_id"),
+            "department": entry.get("department"),
+            "team": entry.get("team"),
+        }
+
+
+def employee_rows_from_simulator(sim) -> Iterator[dict]:
+    for emp in list(sim.employees.values()) + list(sim.temp_employees.values()):
+        state = emp.state
+        yield {col: getattr(state, col) for col in EMPLOYEE_COLUMNS}
+
+
+def event_rows_from_simulator(sim) -> Iterator[dict]:
+    # to_records() is built from the columnar log, no per-event models involved
+    yield from sim.event_log.to_records()
+
+
+def _chunks(rows: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _copy_csv(rows: List[dict], columns: List[str]) -> io.StringIO:
+    """
+    Render rows as CSV for Postgres COPY.
+
+    Enums are written by name (how SQLAlchemy's Enum type stores them) and
+    None as the COPY_NULL marker, so empty strings stay distinct from NULL.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow([
+            COPY_NULL if value is None
+            else value.name if isinstance(value, (Role, EventType))
+            else value.isoformat(sep=" ") if isinstance(value, datetime)
+            else value
+            for value in (row[col] for col in columns)
+        ])
+    buf.seek(0)
+    return buf
+
+
+def _load_table(conn, table, columns: List[str], rows: Iterable[dict], chunk_size: int) -> int:
+    """
+    Stream rows into `table` chunk by chunk.
+
+    Postgres (psycopg2 or psycopg 3) uses COPY; other databases (e.g. SQLite)
+    use executemany.
+
+    Returns:
+        int: Rows loaded.
+    """
+    driver = conn.dialect.driver if conn.dialect.name == "postgresql" else None
+    copy_sql = f"COPY {table.name} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+    total = 0
+
+    for chunk in _chunks(rows, chunk_size):
+        if driver == "psycopg2":
+            with conn.connection.cursor() as cursor:
+                cursor.copy_expert(copy_sql, _copy_csv(chunk, columns))
+        elif driver == "psycopg":
+            with conn.connection.cursor() as cursor, cursor.copy(copy_sql) as copy:
+                copy.write(_copy_csv(chunk, columns).getvalue())
+        else:
+            conn.execute(table.insert(), chunk)
+        total += len(chunk)
+
+    return total
+
+
+def bulk_load(
+    employee_rows: Iterable[dict],
+    event_rows: Iterable[dict],
+    db_engine=None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> dict:
+    """
+    Bulk-insert employees and events in one transaction, without ORM objects.
+
+    Employees are loaded first so every event's `employee_id` foreign key
+    resolves. Rows are consumed lazily in chunks of `chunk_size`.
+
+    Args:
+        employee_rows (Iterable[dict]): Rows keyed by EMPLOYEE_COLUMNS.
+        event_rows (Iterable[dict]): Rows keyed by EVENT_COLUMNS.
+        db_engine (Engine, optional): Target database. Defaults to the app engine.
+        chunk_size (int): Rows per COPY / executemany call.
+
+    Returns:
+        dict: Rows loaded per table and overall rows/sec.
+    """
+    db_engine = db_engine or engine
+    started = time.perf_counter()
+    with db_engine.begin() as conn:
+        n_employees = _load_table(conn, models.EmployeeORM.__table__, EMPLOYEE_COLUMNS, employee_rows, chunk_size)
+        n_events = _load_table(conn, models.EventLogORM.__table__, EVENT_COLUMNS, event_rows, chunk_size)
+    elapsed = time.perf_counter() - started
+    return {
+        "employees": n_employees,
+        "event_log": n_events,
+        "seconds": round(elapsed, 3),
+        "rows_per_sec": round((n_employees + n_events) / elapsed) if elapsed > 0 else None,
+    }
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load a simulator JSON export into the database.")
+    parser.add_argument("path", nargs="?", default="sim_output.json")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--orm", action="store_true", help="Use the slow per-row ORM path")
+    args = parser.parse_args()
+
     reset_database()
-    session = Session()
-    json_data = load_json(Path("sim_output.json"))
-    insert_data(session, json_data)
-    session.close()
+    json_data = load_json(Path(args.path))
+    if args.orm:
+        session = Session()
+        insert_data(session, json_data)
+        session.close()
+    else:
+        summary = bulk_load(employee_rows_from_json(json_data), event_rows_from_json(json_data), chunk_size=args.chunk_size)
+        print(f"✅ Loaded {summary['employees']:,} employees and {summary['event_log']:,} events "
+              f"in {summary['seconds']}s ({summary['rows_per_sec']:,} rows/sec)")
@@ -0,0 +1,57 @@
+# measure_cold_start.py
+#
+# Cold-start cost of the API process: each measurement runs in a fresh
+# interpreter so nothing is already imported or cached in memory.
+#
+#   python scripts/measure_cold_start.py [--repeats 5]
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+MEASUREMENTS = {
+    # What uvicorn pays before it can serve anything
+    "import simteam.server.router": "import simteam.server.router",
+    "import simulate router": "import simteam.server.api.v1.simulate",
+    # What the API used to pay at import (and now pays on first surrogate use)
+    "import automl.surrogate_trainer": "import automl.surrogate_trainer",
+    "import + load surrogate": (
+        "from simteam.server.surrogate import surrogate_model; surrogate_model.get()"
+    ),
+}
+
+TIMER = """
+import time
+_t = time.perf_counter()
+{stmt}
+print(time.perf_counter() - _t)
+"""
+
+
+def time_in_fresh_process(stmt: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", TIMER.format(stmt=stmt)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def main(repeats: int):
+    print(f"{'measurement':<34} {'median':>9} {'min':>9}")
+    for name, stmt in MEASUREMENTS.items():
+        try:
+            times = [time_in_fresh_process(stmt) for _ in range(repeats)]
+        except subprocess.CalledProcessError as exc:
+            error = exc.stderr.strip().splitlines()[-1] if exc.stderr else "failed"
+            print(f"{name:<34} {'-':>9} {'-':>9}  ({error})")
+            continue
+        print(f"{name:<34} {statistics.median(times):>8.3f}s {min(times):>8.3f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure API cold-start import costs.")
+    parser.add_argument("--repeats", type=int, default=5)
+    main(parser.parse_args().repeats)
@@ -9,3 +9,6 @@ print(cv_df)
 # Fit final model and save
 trainer.fit_full()
 trainer.save()
+
+# Export the FLAML-free inference artefact used by the API
+trainer.export_compiled()
@@ -0,0 +1,244 @@
+import csv
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from itertools import product
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from simteam.core.config import SimulationConfig
+from simteam.core.orgsimulator import OrgSimulator
+
+
+@dataclass
+class BatchTask:
+    """
+    A single simulation run in a batch.
+
+    `params` identifies the task: it is written alongside the statistics in
+    every output row and used as the resume key.
+    """
+    config: SimulationConfig
+    params: Dict[str, Any] = field(default_factory=dict)
+    sim_days: int = 365
+
+    @property
+    def key(self) -> tuple:
+        return tuple(str(v) for v in self.params.values())
+
+
+@dataclass
+class BatchProgress:
+    """
+    Throughput snapshot reported after every completed chunk.
+    """
+    done: int
+    total: int
+    skipped: int
+    elapsed: float
+
+    @property
+    def sims_per_sec(self) -> float:
+        return self.done / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def grid_tasks(
+    build_config: Callable[..., SimulationConfig],
+    grid: Dict[str, Sequence],
+    sim_days: int = 365,
+) -> List[BatchTask]:
+    """
+    Expand a parameter grid into tasks (cartesian product, in key order).
+
+    Args:
+        build_config (Callable): Maps one grid point (as keyword arguments) to a config.
+        grid (Dict[str, Sequence]): Parameter name -> values to sweep.
+        sim_days (int): Days to simulate per task.
+
+    Returns:
+        List[BatchTask]: One task per grid point.
+    """
+    names = list(grid)
+    return [
+        BatchTask(config=build_config(**params), params=params, sim_days=sim_days)
+        for params in (dict(zip(names, values)) for values in product(*grid.values()))
+    ]
+
+
+def seed_tasks(
+    config: SimulationConfig,
+    n_seeds: int,
+    base_seed: int = 0,
+    sim_days: int = 365,
+) -> List[BatchTask]:
+    """
+    Replicate one config across `n_seeds` deterministic seeds (base_seed, base_seed + 1, ...).
+    """
+    tasks = []
+    for i in range(n_seeds):
+        seed = base_seed + i
+        tasks.append(BatchTask(
+            config=replace(config, random_seed=seed),
+            params={"seed": seed},
+            sim_days=sim_days,
+        ))
+    return tasks
+
+
+def run_task(task: BatchTask, start_date: datetime) -> dict:
+    """
+    Run one simulation and return its statistics row (statistics, then params).
+    """
+    sim = OrgSimulator(start_date=start_date, config=task.config)
+    sim.simulate_for_days(task.sim_days)
+    row = sim.compute_hiring_statistics()
+    row.update(task.params)
+    return row
+
+
+def _run_chunk(chunk: List[BatchTask], start_date: datetime) -> List[dict]:
+    return [run_task(task, start_date) for task in chunk]
+
+
+def _read_header(path: str) -> List[str]:
+    with open(path, "r", newline="") as f:
+        return next(csv.reader(f))
+
+
+def _completed_keys(path: Path, key_fields: List[str]) -> set:
+    """
+    Read the resume keys already present in a partially written CSV.
+
+    A trailing partial line (from an interrupted write) is truncated away.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return set()
+
+    with open(path, "rb+") as f:
+        data = f.read()
+        if not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+    with open(path, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        return {
+            tuple(row[k] for k in key_fields)
+            for row in reader
+            if all(row.get(k) is not None for k in key_fields)
+        }
+
+
+class BatchRunner:
+    """
+    Fans simulation tasks out across a process pool.
+
+    - Tasks are grouped into chunks to amortise inter-process overhead
+    - Rows are streamed back to the caller as chunks complete (unordered)
+    - With `output_path`, rows are appended to a CSV and already-present
+      tasks are skipped, so an interrupted batch can be resumed
+    """
+
+    def __init__(
+        self,
+        n_workers: Optional[int] = None,
+        chunksize: int = 16,
+        start_date: datetime = datetime(2025, 1, 1),
+        progress: Optional[Callable[[BatchProgress], None]] = None,
+    ):
+        """
+        Args:
+            n_workers (int, optional): Worker processes. Defaults to the CPU count;
+                0 or 1 runs everything in-process.
+            chunksize (int): Tasks sent to a worker per submission.
+            start_date (datetime): Simulation start date for every task.
+            progress (Callable, optional): Called with a BatchProgress after each chunk.
+        """
+        self.n_workers = (os.cpu_count() or 1) if n_workers is None else n_workers
+        self.chunksize = max(1, chunksize)
+        self.start_date = start_date
+        self.progress = progress
+        self.last_progress: Optional[BatchProgress] = None
+
+    def run(self, tasks: Iterable[BatchTask], output_path: Optional[str] = None) -> Iterator[dict]:
+        """
+        Run all tasks, yielding one statistics row per completed simulation.
+
+        Args:
+            tasks (Iterable[BatchTask]): Tasks to run.
+            output_path (str, optional): CSV to append rows to and resume from.
+
+        Yields:
+            dict: `compute_hiring_statistics()` merged with the task params.
+        """
+        tasks = list(tasks)
+        skipped = 0
+        writer = None
+        out_file = None
+        is_new = False
+
+        if output_path is not None and tasks:
+            path = Path(output_path)
+            key_fields = list(tasks[0].params)
+            done_keys = _completed_keys(path, key_fields)
+            remaining = [t for t in tasks if t.key not in done_keys]
+            skipped = len(tasks) - len(remaining)
+            tasks = remaining
+            path.parent.mkdir(parents=True, exist_ok=True)
+            is_new = not path.exists() or path.stat().st_size == 0
+            out_file = open(path, "a", newline="")
+
+        chunks = [tasks[i:i + self.chunksize] for i in range(0, len(tasks), self.chunksize)]
+        started = time.perf_counter()
+        done = 0
+
+        try:
+            for rows in self._run_chunks(chunks):
+                if out_file is not None:
+                    if writer is None:
+                        # Match the existing header when appending to a partial file
+                        fieldnames = list(rows[0]) if is_new else _read_header(output_path)
+                        writer = csv.DictWriter(out_file, fieldnames=fieldnames)
+                        if is_new:
+                            writer.writeheader()
+                    writer.writerows(rows)
+                    out_file.flush()
+
+                done += len(rows)
+                self.last_progress = BatchProgress(
+                    done=done,
+                    total=len(tasks),
+                    skipped=skipped,
+                    elapsed=time.perf_counter() - started,
+                )
+                if self.progress:
+                    self.progress(self.last_progress)
+                yield from rows
+        finally:
+            if out_file is not None:
+                out_file.close()
+
+    def _run_chunks(self, chunks: List[List[BatchTask]]) -> Iterator[List[dict]]:
+        if self.n_workers <= 1:
+            for chunk in chunks:
+                yield _run_chunk(chunk, self.start_date)
+            return
+
+        # Keep a bounded number of chunks in flight so huge batches don't
+        # queue every pickled task up front.
+        max_in_flight = self.n_workers * 2
+        pending_chunks = iter(chunks)
+        with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+            in_flight = set()
+            for chunk in pending_chunks:
+                in_flight.add(pool.submit(_run_chunk, chunk, self.start_date))
+                if len(in_flight) >= max_in_flight:
+                    break
+            while in_flight:
+                finished, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+                    next_chunk = next(pending_chunks, None)
+                    if next_chunk is not None:
+                        in_flight.add(pool.submit(_run_chunk, next_chunk, self.start_date))
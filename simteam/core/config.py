@@ -30,6 +30,15 @@ class SimulationConfig:
     })
     min_events_per_week: int = 1
 
+    # Draw daily event counts/types in NumPy blocks rather than once per call
+    presample_events: bool = True
+
+    # Keep employees in a struct-of-arrays store instead of Pydantic models
+    columnar_employees: bool = False
+
+    # Days between the org snapshots that answer as-of queries (see OrgTimeline)
+    asof_snapshot_days: int = 30
+
     
 def get_default_config() -> SimulationConfig:
 
@@ -1,7 +1,7 @@
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from simteam.core.enums import Role, EventType
 from simteam.core.models.base import EventLog, EmployeeState
@@ -12,6 +12,7 @@ class Employee(BaseModel):
     A wrapper around EmployeeState with helper methods for mutation.
     """
     state: EmployeeState = Field(..., description="Current state of the employee")
+    _registry: Any = PrivateAttr(default=None)
 
     @classmethod
     def create(
@@ -48,7 +49,31 @@ class Employee(BaseModel):
         )
         return cls(state=state)
 
+    @property
+    def last_event(self) -> EventLog:
+        """
+        The most recent event in this employee's history.
+        """
+        return self.state.history[-1]
+
+    def fork(self) -> "Employee":
+        """
+        Independent, unbound copy for a forked simulator.
+
+        Events are never mutated once logged, so the copy shares them and
+        only the history list itself is duplicated.
+        """
+        state = self.state.model_copy(update={"history": list(self.state.history)})
+        return Employee.model_construct(state=state)
+
+    def bind_registry(self, registry: Any) -> None:
+        """
+        Attach an OrgRegistry to be notified of role, manager and activity changes.
+        """
+        self._registry = registry
+
     def promote(self, new_role: Role, date: datetime):
+        old_role = self.state.role
         self.state.role = new_role
         self.state.history.append(
             EventLog(
@@ -61,8 +86,11 @@ class Employee(BaseModel):
                 team=self.state.team,
             )
         )
+        if self._registry is not None:
+            self._registry.on_promote(self, old_role)
 
     def change_manager(self, new_manager_id: str, date: datetime):
+        old_manager_id = self.state.manager_id
         self.state.manager_id = new_manager_id
         self.state.history.append(
             EventLog(
@@ -75,6 +103,8 @@ class Employee(BaseModel):
                 team=self.state.team,
             )
         )
+        if self._registry is not None:
+            self._registry.on_manager_change(self, old_manager_id)
 
     def leave(self, date: datetime):
         self.state.active = False
@@ -89,3 +119,5 @@ class Employee(BaseModel):
                 team=self.state.team,
             )
         )
+        if self._registry is not None:
+            self._registry.on_leave(self)
@@ -0,0 +1,323 @@
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from simteam.core.enums import Role, EventType
+from simteam.core.models.base import EventLog
+
+EVENT_TYPES: List[EventType] = list(EventType)
+EVENT_TYPE_CODES: Dict[EventType, int] = {etype: code for code, etype in enumerate(EVENT_TYPES)}
+ROLES: List[Role] = list(Role)
+ROLE_CODES: Dict[Role, int] = {role: code for code, role in enumerate(ROLES)}
+
+# Storage columns of EventLogStore, one GrowableColumn each
+COLUMN_NAMES = ("days", "seconds", "event_type", "role", "employee_id", "manager_id", "department", "team")
+
+EPOCH = datetime(1970, 1, 1)
+SECONDS_PER_DAY = 86_400
+
+
+class GrowableColumn:
+    """
+    An append-only NumPy column with amortised O(1) appends.
+
+    `view()` returns a zero-copy slice of the filled part. Because the column
+    is append-only and reallocation never touches the old buffer, a view is an
+    immutable snapshot that stays valid while the column keeps growing.
+    """
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, dtype, capacity: int = 1024):
+        self._data = np.empty(capacity, dtype=dtype)
+        self._size = 0
+
+    def append(self, value) -> None:
+        if self._size == len(self._data):
+            grown = np.empty(max(2 * len(self._data), 16), dtype=self._data.dtype)
+            grown[:self._size] = self._data
+            self._data = grown
+        self._data[self._size] = value
+        self._size += 1
+
+    def view(self) -> np.ndarray:
+        return self._data[:self._size]
+
+    def fork(self) -> "GrowableColumn":
+        """
+        Copy-on-write clone: shares the filled buffer until either side appends.
+
+        The clone's capacity is clipped to its size, so its first append
+        reallocates; the original only ever writes past the shared prefix.
+        """
+        clone = GrowableColumn.__new__(GrowableColumn)
+        clone._data = self.view()
+        clone._size = self._size
+        return clone
+
+    def __getstate__(self):
+        # Only the filled part is worth persisting
+        return self.view()
+
+    def __setstate__(self, data: np.ndarray) -> None:
+        self._data = data
+        self._size = len(data)
+
+    def __len__(self) -> int:
+        return self._size
+
+
+class EventLogStore:
+    """
+    Columnar, append-only event log.
+
+    Each event is stored as one row across typed columns:
+    - `days` / `seconds`: date as int days since 1970-01-01 plus seconds into the day
+    - `event_type` / `role`: small categorical codes (see EVENT_TYPES / ROLES)
+    - `employee_id` / `manager_id` / `department` / `team`: codes into a shared
+      interned string table (-1 for None)
+
+    It keeps the list-like API used throughout the simulator (`append`, `len`,
+    iteration and indexing yield `EventLog` models, built on demand), and adds
+    cheap vectorised exports via `columns()`, `to_pandas()` and `to_arrow()`.
+    """
+
+    def __init__(self, events: Iterable[EventLog] = ()):
+        self.days = GrowableColumn(np.int32)
+        self.seconds = GrowableColumn(np.int32)
+        self.event_type = GrowableColumn(np.int8)
+        self.role = GrowableColumn(np.int8)
+        self.employee_id = GrowableColumn(np.int32)
+        self.manager_id = GrowableColumn(np.int32)
+        self.department = GrowableColumn(np.int32)
+        self.team = GrowableColumn(np.int32)
+
+        self.strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+        self._listeners: List[Callable[[int, int], None]] = []
+
+        for event in events:
+            self.append(event)
+
+    # ==== Writing ====
+
+    def subscribe(self, listener: Callable[[int, int], None]) -> None:
+        """
+        Call `listener(event_type_code, timestamp_seconds)` on every appended event.
+        """
+        self._listeners.append(listener)
+
+    def intern(self, value: Optional[str]) -> int:
+        """
+        Return the string-table code for `value` (-1 for None), adding it if new.
+        """
+        if value is None:
+            return -1
+        code = self._string_codes.get(value)
+        if code is None:
+            code = len(self.strings)
+            self._string_codes[value] = code
+            self.strings.append(value)
+        return code
+
+    def record(
+        self,
+        date: datetime,
+        event_type: EventType,
+        employee_id: str,
+        role: Role,
+        manager_id: Optional[str] = None,
+        department: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> None:
+        """
+        Append one event directly from its fields, without building an `EventLog`.
+        """
+        delta = date - EPOCH
+        # str-valued enums hash like their values, so plain strings work as keys too
+        event_code = EVENT_TYPE_CODES[event_type]
+        self.days.append(delta.days)
+        self.seconds.append(delta.seconds)
+        self.event_type.append(event_code)
+        self.role.append(ROLE_CODES[role])
+        self.employee_id.append(self.intern(employee_id))
+        self.manager_id.append(self.intern(manager_id))
+        self.department.append(self.intern(department))
+        self.team.append(self.intern(team))
+
+        for listener in self._listeners:
+            listener(event_code, delta.days * SECONDS_PER_DAY + delta.seconds)
+
+    def append(self, event: EventLog) -> None:
+        self.record(
+            event.date,
+            event.event_type,
+            event.employee_id,
+            event.role,
+            event.manager_id,
+            event.department,
+            event.team,
+        )
+
+    def extend(self, events: Iterable[EventLog]) -> None:
+        for event in events:
+            self.append(event)
+
+    def fork(self) -> "EventLogStore":
+        """
+        Clone the log for a forked simulator without copying its columns.
+
+        Columns are shared copy-on-write (see `GrowableColumn.fork`); the
+        string table is copied. Listeners are not carried over.
+        """
+        clone = EventLogStore.__new__(EventLogStore)
+        for name in COLUMN_NAMES:
+            setattr(clone, name, getattr(self, name).fork())
+        clone.strings = list(self.strings)
+        clone._string_codes = dict(self._string_codes)
+        clone._listeners = []
+        return clone
+
+    # ==== List-like reading ====
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def _string(self, code: int) -> Optional[str]:
+        return None if code < 0 else self.strings[code]
+
+    def _row(self, idx: int) -> EventLog:
+        return EventLog.model_construct(
+            date=EPOCH + timedelta(days=int(self.days.view()[idx]), seconds=int(self.seconds.view()[idx])),
+            event_type=EVENT_TYPES[self.event_type.view()[idx]],
+            employee_id=self.strings[self.employee_id.view()[idx]],
+            role=ROLES[self.role.view()[idx]],
+            manager_id=self._string(self.manager_id.view()[idx]),
+            department=self._string(self.department.view()[idx]),
+            team=self._string(self.team.view()[idx]),
+        )
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self._row(i) for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("event log index out of range")
+        return self._row(idx)
+
+    def __iter__(self) -> Iterator[EventLog]:
+        for record in self.to_records():
+            yield EventLog.model_construct(**record)
+
+    def to_records(self) -> List[dict]:
+        """
+        Export as a list of dicts matching `EventLog.model_dump()`.
+        """
+        return list(self.iter_records())
+
+    def iter_records(self, chunk_size: int = 65_536) -> Iterator[dict]:
+        """
+        Yield dicts matching `EventLog.model_dump()`, decoding `chunk_size` rows at a time.
+
+        Only one chunk of Python objects is alive at once, so exports can
+        stream logs far larger than would fit in memory as dicts.
+        """
+        cols = self.columns()
+        strings = self.strings + [None]  # code -1 maps to None
+        for start in range(0, len(self), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            dates = cols["date"][chunk].astype("datetime64[s]").astype(datetime).tolist()
+            yield from (
+                {
+                    "date": date,
+                    "event_type": EVENT_TYPES[etype],
+                    "employee_id": strings[emp],
+                    "role": ROLES[role],
+                    "manager_id": strings[mgr],
+                    "department": strings[dept],
+                    "team": strings[team],
+                }
+                for date, etype, emp, role, mgr, dept, team in zip(
+                    dates,
+                    cols["event_type"][chunk].tolist(),
+                    cols["employee_id"][chunk].tolist(),
+                    cols["role"][chunk].tolist(),
+                    cols["manager_id"][chunk].tolist(),
+                    cols["department"][chunk].tolist(),
+                    cols["team"][chunk].tolist(),
+                )
+            )
+
+    # ==== Vectorised export ====
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """
+        Zero-copy views of the raw columns (plus a datetime64 `date`).
+
+        Returns:
+            Dict[str, np.ndarray]: Column name -> array of length `len(self)`.
+        """
+        days = self.days.view()
+        seconds = self.seconds.view()
+        date = days.astype("int64") * SECONDS_PER_DAY + seconds
+        return {
+            "date": date.view("datetime64[s]"),
+            "days": days,
+            "event_type": self.event_type.view(),
+            "employee_id": self.employee_id.view(),
+            "role": self.role.view(),
+            "manager_id": self.manager_id.view(),
+            "department": self.department.view(),
+            "team": self.team.view(),
+        }
+
+    def to_pandas(self):
+        """
+        Export as a `pandas.DataFrame` with categorical columns.
+
+        Code columns are wrapped with `Categorical.from_codes`, which reuses the
+        underlying arrays instead of materialising one Python object per row.
+        """
+        import pandas as pd
+
+        cols = self.columns()
+        strings = pd.Index(self.strings, dtype="object")
+        return pd.DataFrame({
+            "date": cols["date"],
+            "event_type": pd.Categorical.from_codes(cols["event_type"], categories=[e.value for e in EVENT_TYPES]),
+            "employee_id": pd.Categorical.from_codes(cols["employee_id"], categories=strings),
+            "role": pd.Categorical.from_codes(cols["role"], categories=[r.value for r in ROLES]),
+            "manager_id": pd.Categorical.from_codes(cols["manager_id"], categories=strings),
+            "department": pd.Categorical.from_codes(cols["department"], categories=strings),
+            "team": pd.Categorical.from_codes(cols["team"], categories=strings),
+        })
+
+    def to_arrow(self):
+        """
+        Export as a `pyarrow.Table` with dictionary-encoded columns.
+
+        Requires the optional `pyarrow` dependency.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError("EventLogStore.to_arrow() requires `pyarrow` to be installed") from exc
+
+        cols = self.columns()
+        strings = pa.array(self.strings, type=pa.string())
+
+        def dictionary(codes: np.ndarray, values) -> "pa.DictionaryArray":
+            return pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), values
+            )
+
+        return pa.table({
+            "date": pa.array(cols["date"]),
+            "event_type": dictionary(cols["event_type"], pa.array([e.value for e in EVENT_TYPES])),
+            "employee_id": dictionary(cols["employee_id"], strings),
+            "role": dictionary(cols["role"], pa.array([r.value for r in ROLES])),
+            "manager_id": dictionary(cols["manager_id"], strings),
+            "department": dictionary(cols["department"], strings),
+            "team": dictionary(cols["team"], strings),
+        })
@@ -0,0 +1,263 @@
+from array import array
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from simteam.core.enums import Role, EventType
+from simteam.core.models.base import EventLog, EmployeeState
+from simteam.core.models.employee import Employee
+from simteam.core.models.eventlog import ROLES, ROLE_CODES, EventLogStore
+
+
+class EmployeeView:
+    """
+    A lightweight handle onto one row of a ColumnarEmployeeStore.
+
+    Mirrors the parts of the `Employee` API used by the simulator: it is its
+    own `state`, exposes the same fields, and supports promote/change_manager/
+    leave. Nothing is validated or copied until `to_employee()` is called.
+    """
+    __slots__ = ("_store", "_idx")
+
+    def __init__(self, store: "ColumnarEmployeeStore", idx: int):
+        self._store = store
+        self._idx = idx
+
+    @property
+    def state(self) -> "EmployeeView":
+        return self
+
+    @property
+    def emp_id(self) -> str:
+        return self._store.emp_ids[self._idx]
+
+    @property
+    def role(self) -> Role:
+        return ROLES[self._store.roles[self._idx]]
+
+    @property
+    def manager_id(self) -> Optional[str]:
+        return self._store.manager_ids[self._idx]
+
+    @property
+    def department(self) -> Optional[str]:
+        return self._store.departments[self._idx]
+
+    @property
+    def team(self) -> Optional[str]:
+        return self._store.teams[self._idx]
+
+    @property
+    def hire_date(self) -> datetime:
+        return self._store.hire_dates[self._idx]
+
+    @property
+    def active(self) -> bool:
+        return bool(self._store.active[self._idx])
+
+    @property
+    def last_event(self) -> EventLog:
+        return self._store.last_events[self._idx]
+
+    def bind_registry(self, registry: Any) -> None:
+        self._store.bind_registry(registry)
+
+    def promote(self, new_role: Role, date: datetime):
+        store = self._store
+        old_role = self.role
+        store.roles[self._idx] = ROLE_CODES[new_role]
+        store.record(self._idx, EventType.PROMOTED, date)
+        if store.registry is not None:
+            store.registry.on_promote(self, old_role)
+
+    def change_manager(self, new_manager_id: str, date: datetime):
+        store = self._store
+        old_manager_id = self.manager_id
+        store.manager_ids[self._idx] = new_manager_id
+        store.record(self._idx, EventType.CHANGE, date)
+        if store.registry is not None:
+            store.registry.on_manager_change(self, old_manager_id)
+
+    def leave(self, date: datetime):
+        store = self._store
+        store.active[self._idx] = 0
+        store.record(self._idx, EventType.LEFT, date)
+        if store.registry is not None:
+            store.registry.on_leave(self)
+
+    def to_employee(self, history: Optional[List[EventLog]] = None) -> Employee:
+        """
+        Materialise a validated `Employee` for export.
+
+        Args:
+            history (List[EventLog], optional): Events for this employee. Defaults
+                to only the most recent event, as full history is kept in the event log.
+        """
+        return Employee(state=EmployeeState(
+            emp_id=self.emp_id,
+            role=self.role,
+            manager_id=self.manager_id,
+            department=self.department,
+            team=self.team,
+            hire_date=self.hire_date,
+            active=self.active,
+            history=history if history is not None else [self.last_event],
+        ))
+
+
+class ColumnarEmployeeStore:
+    """
+    Struct-of-arrays employee registry keyed by integer row index.
+
+    Behaves like the `Dict[str, Employee]` used by the default backend
+    (get / [] / in / values / items), but yields `EmployeeView` handles and
+    stores roles and activity as small ints. Per-employee history is not
+    duplicated: only the latest event is kept, the rest lives in the
+    simulator's event log.
+    """
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self.emp_ids: List[str] = []
+        self.roles = array("b")
+        self.manager_ids: List[Optional[str]] = []
+        self.departments: List[Optional[str]] = []
+        self.teams: List[Optional[str]] = []
+        self.hire_dates: List[datetime] = []
+        self.active = bytearray()
+        self.last_events: List[EventLog] = []
+        self.registry: Any = None
+
+    def bind_registry(self, registry: Any) -> None:
+        self.registry = registry
+
+    def fork(self) -> "ColumnarEmployeeStore":
+        """
+        Independent, unbound copy of every column (events are shared, as they are immutable).
+        """
+        clone = ColumnarEmployeeStore()
+        clone._index = dict(self._index)
+        clone.emp_ids = list(self.emp_ids)
+        clone.roles = array("b", self.roles)
+        clone.manager_ids = list(self.manager_ids)
+        clone.departments = list(self.departments)
+        clone.teams = list(self.teams)
+        clone.hire_dates = list(self.hire_dates)
+        clone.active = bytearray(self.active)
+        clone.last_events = list(self.last_events)
+        return clone
+
+    # ==== Row creation ====
+
+    def create(
+        self,
+        emp_id: str,
+        role: Role,
+        hire_date: datetime,
+        manager_id: Optional[str] = None,
+        department: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> EmployeeView:
+        """
+        Append a new active employee row with its initial EMPLOYED event.
+        """
+        idx = self._append(emp_id, role, hire_date, manager_id, department, team, active=True)
+        self.record(idx, EventType.EMPLOYED, hire_date)
+        return EmployeeView(self, idx)
+
+    def _append(self, emp_id, role, hire_date, manager_id, department, team, active) -> int:
+        idx = len(self.emp_ids)
+        self._index[emp_id] = idx
+        self.emp_ids.append(emp_id)
+        self.roles.append(ROLE_CODES[role])
+        self.manager_ids.append(manager_id)
+        self.departments.append(department)
+        self.teams.append(team)
+        self.hire_dates.append(hire_date)
+        self.active.append(1 if active else 0)
+        self.last_events.append(None)
+        return idx
+
+    def record(self, idx: int, event_type: EventType, date: datetime) -> EventLog:
+        """
+        Build the event for row `idx` from its current columns (unvalidated).
+        """
+        event = EventLog.model_construct(
+            date=date,
+            event_type=event_type,
+            employee_id=self.emp_ids[idx],
+            role=ROLES[self.roles[idx]],
+            manager_id=self.manager_ids[idx],
+            department=self.departments[idx],
+            team=self.teams[idx],
+        )
+        self.last_events[idx] = event
+        return event
+
+    # ==== Mapping protocol ====
+
+    def __setitem__(self, emp_id: str, emp: Employee) -> None:
+        """
+        Ingest a fully-fledged `Employee` (e.g. when loading a snapshot).
+        """
+        if emp_id in self._index:
+            raise KeyError(f"{emp_id} already exists in the columnar store")
+        state = emp.state
+        idx = self._append(
+            emp_id, state.role, state.hire_date, state.manager_id,
+            state.department, state.team, active=state.active,
+        )
+        if state.history:
+            self.last_events[idx] = state.history[-1]
+        else:
+            self.record(idx, EventType.EMPLOYED, state.hire_date)
+
+    def __getitem__(self, emp_id: str) -> EmployeeView:
+        return EmployeeView(self, self._index[emp_id])
+
+    def get(self, emp_id: str, default=None) -> Optional[EmployeeView]:
+        idx = self._index.get(emp_id)
+        return default if idx is None else EmployeeView(self, idx)
+
+    def __contains__(self, emp_id) -> bool:
+        return emp_id in self._index
+
+    def __len__(self) -> int:
+        return len(self.emp_ids)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.emp_ids)
+
+    def keys(self) -> Iterator[str]:
+        return iter(self.emp_ids)
+
+    def values(self) -> Iterator[EmployeeView]:
+        return (EmployeeView(self, idx) for idx in range(len(self.emp_ids)))
+
+    def items(self) -> Iterator[Tuple[str, EmployeeView]]:
+        return ((emp_id, EmployeeView(self, idx)) for idx, emp_id in enumerate(self.emp_ids))
+
+    # ==== Export ====
+
+    def to_employees(self, event_log: EventLogStore) -> List[Employee]:
+        """
+        Materialise every row as an `Employee`, rebuilding histories from the event log.
+
+        Args:
+            event_log (EventLogStore): The simulator's global event log.
+
+        Returns:
+            List[Employee]: One validated employee per row, in creation order.
+        """
+        histories: Dict[str, List[EventLog]] = defaultdict(list)
+        previous = None
+        for record in event_log.to_records():
+            # The simulator may log the same event twice in a row; keep one copy
+            if record != previous:
+                histories[record["employee_id"]].append(EventLog.model_construct(**record))
+            previous = record
+
+        return [
+            EmployeeView(self, idx).to_employee(histories.get(emp_id))
+            for idx, emp_id in enumerate(self.emp_ids)
+        ]
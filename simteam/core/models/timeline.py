@@ -0,0 +1,228 @@
+from bisect import bisect_right
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from simteam.core.models.eventlog import (
+    EPOCH,
+    EVENT_TYPE_CODES,
+    ROLES,
+    SECONDS_PER_DAY,
+    EventLogStore,
+)
+from simteam.core.enums import EventType
+
+# Default days between materialised snapshots
+DEFAULT_SNAPSHOT_INTERVAL_DAYS = 30
+
+LEFT_CODE = EVENT_TYPE_CODES[EventType.LEFT]
+
+# Active employees' string codes and the log rows of their latest events
+ActiveRows = Tuple[np.ndarray, np.ndarray]
+
+_NO_ROWS = np.empty(0, dtype=np.int32)
+
+
+def _day_number(day: Union[date, datetime]) -> int:
+    """Days since 1970-01-01 of the calendar day of `day`."""
+    if isinstance(day, datetime):
+        day = day.date()
+    return (day - EPOCH.date()).days
+
+
+class OrgTimeline:
+    """
+    As-of queries over an `EventLogStore`: what the org looked like on any day.
+
+    Every `interval_days` days (counted from the first event) the timeline
+    materialises a compact snapshot: for each active employee, the log row
+    of their latest event so far (two int32s; leavers are dropped). A query
+    loads the nearest snapshot at or before the requested day and replays
+    only the events after it, so its cost depends on the headcount and
+    `interval_days`, not on the length of the log.
+
+    The log may keep growing: new rows are indexed on the next query. Events
+    appended in date order (as the simulator logs them) extend the existing
+    snapshots; an out-of-order append re-sorts and rebuilds them.
+    """
+
+    def __init__(self, log: EventLogStore, interval_days: int = DEFAULT_SNAPSHOT_INTERVAL_DAYS):
+        """
+        Args:
+            log (EventLogStore): Event log to index (read, never modified).
+            interval_days (int): Days between snapshots.
+
+        Raises:
+            ValueError: If `interval_days` is not positive.
+        """
+        if interval_days < 1:
+            raise ValueError("interval_days must be at least 1")
+        self.log = log
+        self.interval_days = interval_days
+        self._reset()
+
+    def _reset(self) -> None:
+        self._indexed = 0          # log rows covered by the index
+        self._last_time = 0        # timestamp of the last indexed row
+        self._order = None         # rows in time order; None while the log is already in time order
+        self._ordered_days = None  # day of each event in time order, when `_order` is set
+        self._rank = None          # time-order position of each row, when `_order` is set
+        self._first_day: Optional[int] = None
+        # Snapshot k covers every event before day `_boundaries[k]`, i.e. the
+        # first `_positions[k]` events in time order
+        self._boundaries: List[int] = []
+        self._positions: List[int] = []
+        self._snapshots: List[ActiveRows] = []
+
+    # ==== Indexing ====
+
+    def _timestamps(self, start: int, stop: int) -> np.ndarray:
+        days = self.log.days.view()[start:stop].astype(np.int64)
+        return days * SECONDS_PER_DAY + self.log.seconds.view()[start:stop]
+
+    def _days(self) -> np.ndarray:
+        # Day of each indexed event, in time order (a zero-copy view for an in-order log)
+        if self._order is None:
+            return self.log.days.view()[:self._indexed]
+        return self._ordered_days
+
+    def refresh(self) -> None:
+        """
+        Index rows appended to the log since the last call (queries do this implicitly).
+        """
+        size = len(self.log)
+        if size == self._indexed:
+            return
+
+        new_times = self._timestamps(self._indexed, size)
+        in_order = (
+            self._order is None
+            and bool(np.all(np.diff(new_times) >= 0))
+            and (not self._indexed or new_times[0] >= self._last_time)
+        )
+        if in_order:
+            self._last_time = int(new_times[-1])
+        else:
+            times = self._timestamps(0, size)
+            self._reset()
+            self._order = np.argsort(times, kind="stable")
+            self._ordered_days = self.log.days.view()[:size][self._order]
+            self._rank = np.empty(size, dtype=np.int64)
+            self._rank[self._order] = np.arange(size)
+        self._indexed = size
+
+        if self._first_day is None:
+            self._first_day = int(self._days()[0])
+            self._boundaries, self._positions = [self._first_day], [0]
+            self._snapshots = [(_NO_ROWS, _NO_ROWS)]
+        self._extend_snapshots()
+
+    def _extend_snapshots(self) -> None:
+        # A boundary is final once an event on or after it has been logged:
+        # any later in-order event cannot fall before it
+        days = self._days()
+        while self._boundaries[-1] + self.interval_days <= days[-1]:
+            boundary = self._boundaries[-1] + self.interval_days
+            position = int(np.searchsorted(days, boundary, side="left"))
+            self._snapshots.append(self._replay(self._snapshots[-1], self._positions[-1], position))
+            self._boundaries.append(boundary)
+            self._positions.append(position)
+
+    def _rows(self, start: int, stop: int) -> np.ndarray:
+        # Log rows of time-order positions start..stop
+        if self._order is None:
+            return np.arange(start, stop, dtype=np.int32)
+        return self._order[start:stop].astype(np.int32)
+
+    def _replay(self, snapshot: ActiveRows, start: int, stop: int) -> ActiveRows:
+        """
+        `snapshot` updated with the events at time-order positions start..stop.
+        """
+        codes, rows = snapshot
+        if stop > start:
+            tail = self._rows(start, stop)
+            codes = np.concatenate([codes, self.log.employee_id.view()[tail]])
+            rows = np.concatenate([rows, tail])
+            # Last occurrence of each employee: tail events follow the snapshot
+            codes, first_from_end = np.unique(codes[::-1], return_index=True)
+            rows = rows[len(rows) - 1 - first_from_end]
+            active = self.log.event_type.view()[rows] != LEFT_CODE
+            codes, rows = codes[active], rows[active]
+        return codes, rows
+
+    # ==== Queries ====
+
+    def latest_rows(self, day: Union[date, datetime]) -> np.ndarray:
+        """
+        Log rows of the latest event, up to the end of `day`, of every employee
+        active on `day`, latest event first.
+
+        Args:
+            day (date | datetime): Calendar day of the query (inclusive).
+
+        Returns:
+            np.ndarray: int32 row indexes into the event log.
+        """
+        self.refresh()
+        if self._first_day is None:
+            return _NO_ROWS
+
+        cutoff = _day_number(day) + 1
+        k = bisect_right(self._boundaries, cutoff) - 1
+        if k < 0:
+            return _NO_ROWS
+        stop = int(np.searchsorted(self._days(), cutoff, side="left"))
+        _, rows = self._replay(self._snapshots[k], self._positions[k], stop)
+
+        # Latest first, by time then log order (as the database orders them)
+        if self._order is None:
+            return np.sort(rows)[::-1]
+        return rows[np.argsort(self._rank[rows])[::-1]]
+
+    def headcount(self, day: Union[date, datetime]) -> int:
+        """
+        Number of employees active at the end of `day`.
+        """
+        return len(self.latest_rows(day))
+
+    def as_of(self, day: Union[date, datetime]) -> List[Dict]:
+        """
+        The org at the end of `day`: each active employee's role and reporting
+        line from their latest event, latest event first.
+
+        Args:
+            day (date | datetime): Calendar day of the query (inclusive).
+
+        Returns:
+            List[Dict]: `emp_id`, `role`, `manager_id`, `department` and `team` per employee.
+        """
+        rows = self.latest_rows(day)
+        strings = self.log.strings + [None]  # code -1 maps to None
+        cols = self.log.columns()
+        return [
+            {
+                "emp_id": strings[emp],
+                "role": ROLES[role],
+                "manager_id": strings[mgr],
+                "department": strings[dept],
+                "team": strings[team],
+            }
+            for emp, role, mgr, dept, team in zip(
+                cols["employee_id"][rows].tolist(),
+                cols["role"][rows].tolist(),
+                cols["manager_id"][rows].tolist(),
+                cols["department"][rows].tolist(),
+                cols["team"][rows].tolist(),
+            )
+        ]
+
+    @property
+    def snapshot_count(self) -> int:
+        """Snapshots materialised so far (including the empty one before the first event)."""
+        return len(self._snapshots)
+
+    @property
+    def snapshot_nbytes(self) -> int:
+        """Memory held by the snapshots."""
+        return sum(codes.nbytes + rows.nbytes for codes, rows in self._snapshots)
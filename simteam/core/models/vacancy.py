@@ -1,5 +1,8 @@
+import heapq
+from bisect import bisect_left, bisect_right
 from datetime import datetime
-from typing import List, Optional
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -42,4 +45,97 @@ class Vacancy(BaseModel):
         Returns:
             bool: True if the vacancy deadline has passed, False otherwise.
         """
-        return datetime.now() > self.record.deadline
\ No newline at end of file
+        return datetime.now() > self.record.deadline
+
+class VacancyQueue:
+    """
+    Open vacancies, indexed for the daily fill pass.
+
+    - A deadline-ordered heap, so expired vacancies are dropped in O(log n)
+      each without scanning the rest
+    - Per-role buckets, so roles that cannot be filled are skipped as a whole
+
+    Vacancies are numbered in creation order; iteration, `open_in` and
+    `len` see only open ones, in that order. Filled vacancies are removed by
+    number, and their heap entries are discarded lazily when they come due.
+    """
+
+    def __init__(self, vacancies: Iterable[Vacancy] = ()):
+        self._open: Dict[int, Vacancy] = {}
+        self._by_role: Dict[Role, List[int]] = {}  # open numbers per role, ascending
+        self._deadlines: List[Tuple[datetime, int]] = []
+        self._next_seq = 0
+        for vacancy in vacancies:
+            self.append(vacancy)
+
+    def append(self, vacancy: Vacancy) -> int:
+        """
+        Add an open vacancy.
+
+        Returns:
+            int: Its number, used by `remove`.
+        """
+        seq = self._next_seq
+        self._next_seq += 1
+        self._open[seq] = vacancy
+        self._by_role.setdefault(vacancy.record.role, []).append(seq)
+        heapq.heappush(self._deadlines, (vacancy.record.deadline, seq))
+        return seq
+
+    def remove(self, seq: int) -> None:
+        """
+        Close vacancy `seq` (e.g. once filled).
+        """
+        vacancy = self._open.pop(seq)
+        bucket = self._by_role[vacancy.record.role]
+        del bucket[bisect_left(bucket, seq)]
+
+    def expire(self, date: datetime) -> int:
+        """
+        Drop every vacancy whose deadline is before `date`.
+
+        Returns:
+            int: Number of open vacancies dropped.
+        """
+        dropped = 0
+        while self._deadlines and self._deadlines[0][0] < date:
+            _, seq = heapq.heappop(self._deadlines)
+            if seq in self._open:
+                self.remove(seq)
+                dropped += 1
+        return dropped
+
+    def open_in(self, roles: Iterable[Role], after: int = -1) -> Iterator[Tuple[int, Vacancy]]:
+        """
+        Open vacancies for `roles` numbered above `after`, in creation order.
+
+        The pairs are produced lazily, so stopping early costs nothing for the
+        rest. The queue must not be modified while iterating: after a change,
+        call again with the last number seen as `after`.
+
+        Returns:
+            Iterator[Tuple[int, Vacancy]]: (number, vacancy) pairs.
+        """
+        buckets = [self._by_role.get(role, []) for role in roles]
+        seqs = heapq.merge(*(
+            islice(bucket, bisect_right(bucket, after), None)
+            for bucket in buckets if bucket
+        ))
+        return ((seq, self._open[seq]) for seq in seqs)
+
+    def copy(self) -> "VacancyQueue":
+        """
+        Independent queue over the same (immutable) vacancies.
+        """
+        clone = VacancyQueue.__new__(VacancyQueue)
+        clone._open = dict(self._open)
+        clone._by_role = {role: list(bucket) for role, bucket in self._by_role.items()}
+        clone._deadlines = list(self._deadlines)
+        clone._next_seq = self._next_seq
+        return clone
+
+    def __len__(self) -> int:
+        return len(self._open)
+
+    def __iter__(self) -> Iterator[Vacancy]:
+        return iter(list(self._open.values()))
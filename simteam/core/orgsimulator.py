@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
-import random
+from typing import Optional
 
 from simteam.core.config import SimulationConfig, get_default_config
 from simteam.core.enums import Role
+from simteam.core.models.employee import Employee
 from simteam.core.simulator.base import BaseOrgSimulator
 from simteam.core.simulator.dailyeventengine import DailyEventEngine
 from simteam.core.simulator.hiring import HiringLogic
@@ -10,6 +11,7 @@ from simteam.core.simulator.leaving import LeavingLogic
 from simteam.core.simulator.managerchange import ManagerChangeLogic
 from simteam.core.simulator.promotion import PromotionLogic
 from simteam.core.simulator.vacancy import VacancyLogic
+from simteam.core.utils import random_choice
 
 
 class OrgSimulator(
@@ -49,14 +51,26 @@ class OrgSimulator(
         if not ceo_id:
             return
 
+    def fork(self, config: Optional[SimulationConfig] = None) -> "OrgSimulator":
+        clone = BaseOrgSimulator.fork(self, config)
+        clone.fork_event_schedule()
+        return clone
+
+    def apply_config(self, config: SimulationConfig) -> None:
+        BaseOrgSimulator.apply_config(self, config)
+        # Pre-sampled draws were made under the old caps and weights
+        self.reset_event_schedule()
+
     def simulate_one_day(self):
         """
         Run simulation logic for a single day:
         - Fill overdue vacancies
         - Generate and execute daily events
+        - Record the day's event counts and headcount
         - Advance date
         """
         self.generate_daily_events(self.today)
+        self.stats.snapshot_day(self.today, self.employee_count)
         self.today += timedelta(days=1)
 
     def simulate_for_days(self, n: int):
@@ -72,14 +86,11 @@ class OrgSimulator(
         """
         Simulate a random hire event (default to Analyst under any Manager).
         """
-        managers = [
-            e for e in self.employees.values()
-            if e.state.active and e.state.role == Role.MANAGER
-        ]
+        managers = self.registry.ids_by_role(Role.MANAGER)
         if not managers:
             return
 
-        mgr = random.choice(managers)
+        mgr = self.employees[random_choice(managers, self.rng)]
         self.hire(
             role=Role.ANALYST,
             manager_id=mgr.state.emp_id,
@@ -107,39 +118,65 @@ class OrgSimulator(
         """
         Randomly select someone to leave, excluding CEO and VPs.
         """
-        leavers = [
-            e for e in self.employees.values()
-            if e.state.active and e.state.role not in {Role.CEO, Role.VP}
-        ]
-        if not leavers:
+        leaver_roles = [role for role in Role if role not in {Role.CEO, Role.VP}]
+        n_leavers = self.registry.count_in_roles(leaver_roles)
+        if not n_leavers:
             return
-        emp = random.choice(leavers)
-        self.mark_left(emp.state.emp_id, date)
+        emp_id = self.registry.pick(leaver_roles, int(self.rng.integers(n_leavers)))
+        self.mark_left(emp_id, date)
 
     def simulate_manager_change(self, date: datetime):
         """
         Randomly reassign a manager to a different valid higher-level manager.
         """
-        candidates = [
-            e for e in self.employees.values()
-            if e.state.active and e.state.manager_id
-        ]
-        if not candidates:
+        # Everyone below the CEO has a manager
+        candidate_roles = [role for role in Role if role != Role.CEO]
+        n_candidates = self.registry.count_in_roles(candidate_roles)
+        if not n_candidates:
             return
 
-        emp = random.choice(candidates)
+        emp = self.employees[self.registry.pick(candidate_roles, int(self.rng.integers(n_candidates)))]
+        if not emp.state.manager_id:
+            return
 
-        # Find new possible manager
-        potential_mgrs = [
-            m for m in self.employees.values()
-            if m.state.active
-            and m.state.emp_id != emp.state.manager_id
-            and self.is_higher_role(m.state.role, emp.state.role)
-            and not self.is_circular(emp.state.emp_id, m.state.emp_id)
+        new_mgr_id = self.sample_higher_manager(emp)
+        if not new_mgr_id:
+            return
+
+        self.change_manager(emp.state.emp_id, new_mgr_id, date)
+
+    def sample_higher_manager(self, emp: Employee, max_attempts: int = 8) -> Optional[str]:
+        """
+        Uniformly sample an active, more senior employee who is not `emp`'s current
+        manager and would not create a reporting cycle.
+
+        Uses rejection sampling over the senior role buckets, falling back to an
+        exhaustive scan of those buckets only if every attempt is rejected.
+        """
+        senior_roles = [
+            role for role in Role
+            if self.is_higher_role(role, emp.state.role)
         ]
+        n_seniors = self.registry.count_in_roles(senior_roles)
+        if not n_seniors:
+            return None
 
-        if not potential_mgrs:
-            return
+        def is_valid(mgr_id: str) -> bool:
+            return (
+                mgr_id != emp.state.manager_id
+                and not self.is_circular(emp.state.emp_id, mgr_id)
+            )
 
-        new_mgr = random.choice(potential_mgrs)
-        self.change_manager(emp.state.emp_id, new_mgr.state.emp_id, date)
+        for _ in range(max_attempts):
+            mgr_id = self.registry.pick(senior_roles, int(self.rng.integers(n_seniors)))
+            if is_valid(mgr_id):
+                return mgr_id
+
+        potential_mgrs = [
+            mgr_id for role in senior_roles
+            for mgr_id in self.registry.ids_by_role(role)
+            if is_valid(mgr_id)
+        ]
+        if not potential_mgrs:
+            return None
+        return random_choice(potential_mgrs, self.rng)
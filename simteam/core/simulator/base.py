@@ -1,15 +1,53 @@
-from datetime import datetime
-from itertools import pairwise
+from collections import defaultdict
+import copy
+from datetime import date, datetime
 import json
-from typing import Dict, List
+from typing import Dict, List, Optional, Union
+
+import numpy as np
 
 from simteam.core.config import SimulationConfig, get_default_config
+from simteam.core.enums import Role, EventType
 from simteam.core.models.employee import Employee
-from simteam.core.models.vacancy import Vacancy
+from simteam.core.models.eventlog import EPOCH, EVENT_TYPE_CODES, SECONDS_PER_DAY, EventLogStore
+from simteam.core.models.store import ColumnarEmployeeStore
+from simteam.core.models.timeline import OrgTimeline
+from simteam.core.models.vacancy import Vacancy, VacancyQueue
 from simteam.core.models.base import EmployeeState, EventLog, VacancyRecord
+from simteam.core.simulator.checkpoint import read_checkpoint, write_checkpoint
+from simteam.core.simulator.registry import OrgRegistry
+from simteam.core.simulator.snapshot import SnapshotReader, SnapshotWriter
+from simteam.core.simulator.statistics import RunningStatistics
+from simteam.core.utils import make_rng
 
 from statistics import mean, median, stdev
-from collections import defaultdict, Counter
+
+
+# Employee fields stored in snapshots; history is rebuilt from the event log
+EMPLOYEE_FIELDS = [field for field in EmployeeState.model_fields if field != "history"]
+
+
+def _event_from_record(record: dict) -> dict:
+    """Decode a snapshot event record into `EventLog` field values."""
+    return {
+        **record,
+        "date": datetime.fromisoformat(record["date"]),
+        "event_type": EventType(record["event_type"]),
+        "role": Role(record["role"]),
+    }
+
+
+def _state_from_record(record: dict, history: List[EventLog]) -> EmployeeState:
+    """Decode a snapshot employee record without re-validating it."""
+    return EmployeeState.model_construct(
+        **{
+            **record,
+            "role": Role(record["role"]),
+            "hire_date": datetime.fromisoformat(record["hire_date"]),
+            "history": history,
+        }
+    )
+
 
 class BaseOrgSimulator:
     """
@@ -31,34 +69,119 @@ class BaseOrgSimulator:
         self.today = start_date
         self.emp_counter = 0
 
+        # All randomness flows through this generator, so a run is fully
+        # determined by `config.random_seed`
+        self.rng = make_rng(config.random_seed)
+
+        self._init_state()
+
+    def _init_state(self) -> None:
+        """
+        (Re)create empty registries, event log, statistics and index.
+        """
         # Global registries
-        self.employees: Dict[str, Employee] = {}
+        self.employees: Dict[str, Employee] = ColumnarEmployeeStore() if self.config.columnar_employees else {}
         self.temp_employees: Dict[str, Employee] = {}  # TEMP placeholders
-        self.vacancies: List[Vacancy] = []
-        self.event_log: List[EventLog] = []
-        
+        self.vacancies = VacancyQueue()
+        self.event_log = EventLogStore()
+
+        # Summary statistics maintained as events are logged
+        self.stats = RunningStatistics(self.config.max_employees, self.start_date)
+        self.event_log.subscribe(self.stats.observe)
+
+        # Incremental index over active employees (by role, reporting lines)
+        self.registry = OrgRegistry(self.employees)
+
+        # As-of index over the event log, built on first use (see `timeline`)
+        self._timeline: Optional[OrgTimeline] = None
+
+    def new_employee(
+        self,
+        emp_id: str,
+        role: Role,
+        hire_date: datetime,
+        manager_id: Optional[str] = None,
+        department: Optional[str] = None,
+        team: Optional[str] = None,
+    ) -> Employee:
+        """
+        Create, register and index a new employee on the configured backend.
+
+        Returns:
+            Employee: The new employee (an EmployeeView on the columnar backend).
+        """
+        if isinstance(self.employees, ColumnarEmployeeStore):
+            emp = self.employees.create(emp_id, role, hire_date, manager_id, department, team)
+            self.registry.add(emp)
+            return emp
+
+        emp = Employee.create(
+            emp_id=emp_id,
+            role=role,
+            hire_date=hire_date,
+            manager_id=manager_id,
+            department=department,
+            team=team,
+        )
+        self.add_employee(emp)
+        return emp
+
+    def add_employee(self, emp: Employee) -> None:
+        """
+        Add an employee to the global registry and the active-org index.
+        """
+        self.employees[emp.state.emp_id] = emp
+        self.registry.add(emp)
+
     @property
     def active_employees(self) -> list[Employee]:
-        return [e for e in self.employees.values() if e.state.active]
+        return [self.employees[emp_id] for emp_id in self.registry.active_ids()]
 
     @property
     def employee_count(self) -> int:
-        return len(self.active_employees)
+        return self.registry.active_count
     
     def employee_count_by_role(self) -> dict:
         """
         Returns a dictionary mapping each Role to the number of active employees in that role.
         """
-        from collections import Counter
-        counts = Counter(e.state.role for e in self.active_employees)
-        return dict(counts)
+        return self.registry.counts_by_role()
     
     def get_active_employees_by_role(self, role) -> list:
         """
-        Returns a dictionary mapping each Role to a list of active employees in that role.
+        Returns a list of active employees in the given role.
         """
-        return [e for e in self.active_employees if e.state.role==role]
+        return [self.employees[emp_id] for emp_id in self.registry.ids_by_role(role)]
         
+    @property
+    def timeline(self) -> OrgTimeline:
+        """
+        As-of index over this simulator's event log, with a snapshot every
+        `config.asof_snapshot_days` days. Built on first use and extended
+        as the simulation logs more events.
+        """
+        timeline = self._timeline
+        if (
+            timeline is None
+            or timeline.log is not self.event_log
+            or timeline.interval_days != self.config.asof_snapshot_days
+        ):
+            timeline = self._timeline = OrgTimeline(self.event_log, self.config.asof_snapshot_days)
+        return timeline
+
+    def org_as_of(self, day: Union[date, datetime]) -> List[Dict]:
+        """
+        The org at the end of a past (or the current) day, from the event log.
+
+        Args:
+            day (date | datetime): Calendar day to look at.
+
+        Returns:
+            List[Dict]: Active employees' `emp_id`, `role`, `manager_id`,
+            `department` and `team`, latest event first.
+        """
+        return self.timeline.as_of(day)
+
     def generate_emp_id(self, prefix="EMP") -> str:
         """
         Generate the next unique employee ID (e.g. EMP001).
@@ -66,15 +189,24 @@ class BaseOrgSimulator:
         self.emp_counter += 1
         return f"{prefix}{self.emp_counter:03d}"
 
+    def export_employees(self) -> List[Employee]:
+        """
+        Return every employee as a validated `Employee`, materialising them
+        from the columnar store if that backend is in use.
+        """
+        if isinstance(self.employees, ColumnarEmployeeStore):
+            return self.employees.to_employees(self.event_log)
+        return list(self.employees.values())
+
     def export_to_json(self) -> dict:
         """
         Export simulation state as a dictionary (JSON-serialisable).
         """
         return {
-            "employees": [e.state.model_dump() for e in self.employees.values()],
+            "employees": [e.state.model_dump() for e in self.export_employees()],
             "temp_employees": [e.state.model_dump() for e in self.temp_employees.values()],
             "vacancies": [v.record.model_dump() for v in self.vacancies],
-            "event_log": [e.model_dump() for e in self.event_log],
+            "event_log": self.event_log.to_records(),
             "start_date": self.start_date.isoformat(),
             "current_date": self.today.isoformat(),
         }
@@ -127,64 +259,233 @@ class BaseOrgSimulator:
         for edata in data.get("event_log", []):
             sim.event_log.append(EventLog(**edata))
 
+        sim.registry.rebuild()
         return sim
     
-    @staticmethod
-    def _team_size_skew(employees: list[Employee], role: str) -> float:
+    def save_snapshot(self, path: str) -> None:
+        """
+        Stream simulation state to a line-delimited snapshot (see `SnapshotWriter`).
+
+        Unlike `save_to_json`, nothing is assembled in memory and employee
+        histories are not duplicated: they are rebuilt from the event log on
+        load. TEMP placeholders keep their own history, as it is not logged.
+
+        Args:
+            path (str): File path to write to (`.gz` for gzip compression).
+        """
+        with SnapshotWriter(
+            path,
+            start_date=self.start_date,
+            current_date=self.today,
+            emp_counter=self.emp_counter,
+        ) as writer:
+            writer.write_section("events", self.event_log.iter_records())
+            writer.write_section("employees", (
+                {field: getattr(e.state, field) for field in EMPLOYEE_FIELDS}
+                for e in self.employees.values()
+            ))
+            writer.write_section("temp_employees", (
+                e.state.model_dump() for e in self.temp_employees.values()
+            ))
+            writer.write_section("vacancies", (v.record.model_dump() for v in self.vacancies))
+
+    @classmethod
+    def load_snapshot(cls, path: str, config: SimulationConfig = get_default_config()) -> "BaseOrgSimulator":
+        """
+        Restore simulation state from a snapshot written by `save_snapshot`.
+
+        Records are read one line at a time and trusted as written (no
+        re-validation), so load time is linear in the snapshot size.
+
+        Args:
+            path (str): Path to the snapshot.
+            config (SimulationConfig): Config for the restored simulator.
+
+        Returns:
+            BaseOrgSimulator: Restored simulator instance.
+        """
+        with SnapshotReader(path) as reader:
+            header = reader.header
+            sim = cls(start_date=datetime.fromisoformat(header["start_date"]), config=config)
+            # Discard anything the constructor set up (e.g. the bootstrap CEO)
+            sim._init_state()
+            sim.today = datetime.fromisoformat(header["current_date"])
+            sim.emp_counter = header["emp_counter"]
+
+            columnar = isinstance(sim.employees, ColumnarEmployeeStore)
+            histories: Dict[str, List[EventLog]] = defaultdict(list)
+            for section, record in reader:
+                if section == "events":
+                    event = _event_from_record(record)
+                    sim.event_log.record(**event)
+                    history = histories[event["employee_id"]]
+                    # The simulator may log the same event twice in a row; keep one copy
+                    if history and history[-1].__dict__ == event:
+                        continue
+                    if columnar:
+                        # Only the latest event is kept per employee
+                        history[:] = [EventLog.model_construct(**event)]
+                    else:
+                        history.append(EventLog.model_construct(**event))
+                elif section == "employees":
+                    state = _state_from_record(record, histories.pop(record["emp_id"], []))
+                    sim.employees[state.emp_id] = Employee.model_construct(state=state)
+                elif section == "temp_employees":
+                    history = [EventLog.model_construct(**_event_from_record(e)) for e in record["history"]]
+                    state = _state_from_record(record, history)
+                    sim.temp_employees[state.emp_id] = Employee.model_construct(state=state)
+                elif section == "vacancies":
+                    sim.vacancies.append(Vacancy.model_construct(record=VacancyRecord.model_construct(
+                        **{**record, "role": Role(record["role"]), "deadline": datetime.fromisoformat(record["deadline"])}
+                    )))
+
+        sim.registry.rebuild()
+        return sim
+
+    def checkpoint(self, path: str) -> None:
+        """
+        Save the complete simulator state to a binary checkpoint.
+
+        Unlike the JSON formats this captures everything needed to resume
+        exactly: config, RNG state, pre-sampled draws, weekly counters,
+        running statistics and index order. A restored simulator continues
+        along the same trajectory as this one.
+
+        Args:
+            path (str): File path to write to.
+        """
+        write_checkpoint(self, path)
+
+    @classmethod
+    def restore(cls, path: str) -> "BaseOrgSimulator":
+        """
+        Load a simulator saved with `checkpoint` (trusted files only: it is a pickle).
+
+        Args:
+            path (str): Path to the checkpoint.
+
+        Returns:
+            BaseOrgSimulator: The restored simulator.
+
+        Raises:
+            TypeError: If the checkpoint holds a different simulator class.
+        """
+        sim = read_checkpoint(path)
+        if not isinstance(sim, cls):
+            raise TypeError(f"Checkpoint holds a {type(sim).__name__}, not a {cls.__name__}")
+        return sim
+
+    def fork(self, config: Optional[SimulationConfig] = None) -> "BaseOrgSimulator":
+        """
+        Cheap in-memory clone for branching "what-if" scenarios from the current day.
+
+        Mutable state is copied; logged events, vacancies and pre-sampled
+        draws are immutable and shared, and event log columns are shared
+        copy-on-write. Without `config`, the fork continues exactly as this
+        simulator would.
+
+        Args:
+            config (SimulationConfig, optional): Config for the branch (see `apply_config`).
+
+        Returns:
+            BaseOrgSimulator: An independent simulator of the same class.
+        """
+        clone = copy.copy(self)
+        clone.rng = copy.deepcopy(self.rng)
+        if isinstance(self.employees, ColumnarEmployeeStore):
+            clone.employees = self.employees.fork()
+        else:
+            clone.employees = {emp_id: emp.fork() for emp_id, emp in self.employees.items()}
+        clone.temp_employees = {emp_id: emp.fork() for emp_id, emp in self.temp_employees.items()}
+        clone.vacancies = self.vacancies.copy()
+        clone.event_log = self.event_log.fork()
+        clone.stats = self.stats.fork()
+        clone.event_log.subscribe(clone.stats.observe)
+        clone.registry = self.registry.fork(clone.employees)
+        clone._timeline = None  # indexes this simulator's log; rebuilt on demand
+        if config is not None:
+            clone.apply_config(config)
+        return clone
+
+    def apply_config(self, config: SimulationConfig) -> None:
+        """
+        Switch to a new config mid-run, keeping the current org.
+
+        A different `random_seed` reseeds the generator; with the same seed
+        the branch keeps this simulator's random stream, so branches that
+        differ only in other parameters use common random numbers.
+
+        Raises:
+            ValueError: If the config switches the employee backend.
+        """
+        if config.columnar_employees != self.config.columnar_employees:
+            raise ValueError("Cannot switch `columnar_employees` on an existing simulator")
+        if config.random_seed != self.config.random_seed:
+            self.rng = make_rng(config.random_seed)
+        self.config = config
+        self.stats.max_employees = config.max_employees
+
+    def _team_size_skew(self, role: Role) -> float:
         """
         Returns mean/median ratio of direct report counts for active managers at a given role.
         """
-        managers = [e for e in employees if e.state.role == role]
         team_sizes = [
-            len([ee for ee in employees if ee.state.manager_id == m.state.emp_id])
-            for m in managers
+            self.registry.direct_report_count(emp_id)
+            for emp_id in self.registry.ids_by_role(role)
         ]
         if not team_sizes or median(team_sizes) == 0:
             return 0.0
         return round(mean(team_sizes) / median(team_sizes), 3)
-    
+
     @staticmethod
-    def _mean_days_between(event_type: str, log: list[EventLog]) -> float:
-        """Compute mean days between events of the same type."""
-        dates = sorted([e.date for e in log if e.event_type == event_type])
-        if len(dates) < 2:
+    def _mean_days_between(event_type: str, log: EventLogStore) -> float:
+        """Compute mean days between events of the same type (post-hoc, any event order)."""
+        cols = log.columns()
+        mask = cols["event_type"] == EVENT_TYPE_CODES[event_type]
+        timestamps = np.sort(cols["date"][mask].astype(np.int64))
+        if len(timestamps) < 2:
             return 0.0
-        gaps = [(b - a).days for a, b in pairwise(dates)]
-        return round(mean(gaps), 2)
+        gaps = np.diff(timestamps) // SECONDS_PER_DAY
+        return round(float(gaps.mean()), 2)
+
+    def _org_saturation_day(self) -> Optional[int]:
+        """Compute the first day the org reached `max_employees` (post-hoc, any event order)."""
+        cols = self.event_log.columns()
+        is_hire = cols["event_type"] == EVENT_TYPE_CODES["employed"]
+        is_leave = cols["event_type"] == EVENT_TYPE_CODES["left"]
+        days, day_idx = np.unique(cols["days"], return_inverse=True)
+        daily_delta = np.bincount(
+            day_idx, weights=is_hire.astype(np.int64) - is_leave.astype(np.int64), minlength=len(days)
+        )
+        saturated = np.flatnonzero(np.cumsum(daily_delta) >= self.config.max_employees)
+        if not len(saturated):
+            return None
+        return int(days[saturated[0]]) - (self.start_date - EPOCH).days
 
     def compute_hiring_statistics(self) -> dict:
         """
         Collect scalar, non-temporal summary metrics of the simulation outcome.
+
+        Reads the running accumulators in `self.stats`, so this is cheap enough
+        to call at any point mid-run (e.g. once per simulated day).
         """
-        total_num_hired = sum(e.event_type == "employed" for e in self.event_log)
-        total_num_left = sum(e.event_type == "left" for e in self.event_log)
-        total_num_promoted = sum(e.event_type == "promoted" for e in self.event_log)
-
-        # Determine org size over time
-        org_sizes_by_day = defaultdict(int)
-        for e in self.event_log:
-            if e.event_type == "employed":
-                org_sizes_by_day[e.date.date()] += 1
-            elif e.event_type == "left":
-                org_sizes_by_day[e.date.date()] -= 1
-        sorted_days = sorted(org_sizes_by_day.items())
-        running_total = 0
-        org_saturation_day = None
-        for day, delta in sorted_days:
-            running_total += delta
-            if running_total >= self.config.max_employees:
-                org_saturation_day = (day - self.start_date.date()).days
-                break
+        stats = self.stats
+        if stats.ordered:
+            org_saturation_day = stats.org_saturation_day
+            mean_days_between = stats.mean_days_between
+        else:
+            org_saturation_day = self._org_saturation_day()
+            mean_days_between = lambda etype: self._mean_days_between(etype, self.event_log)
 
         return {
-            "total_num_hired": total_num_hired,
-            "total_num_left": total_num_left,
-            "total_num_promoted": total_num_promoted,
+            "total_num_hired": stats.count(EventType.EMPLOYED),
+            "total_num_left": stats.count(EventType.LEFT),
+            "total_num_promoted": stats.count(EventType.PROMOTED),
             "org_saturation_day": org_saturation_day if org_saturation_day is not None else -1,
-            "vp_team_size_skew": self._team_size_skew(self.active_employees, "VP"),
-            "director_team_size_skew":  self._team_size_skew(self.active_employees, "Director"),
-            "manager_team_size_skew":  self._team_size_skew(self.active_employees, "Manager"),
-            "mean_days_between_hires": self._mean_days_between("employed", self.event_log),
-            "mean_days_between_promotions": self._mean_days_between("promoted", self.event_log),
-            "mean_days_between_leavings": self._mean_days_between("left", self.event_log),
-        }
\ No newline at end of file
+            "vp_team_size_skew": self._team_size_skew(Role.VP),
+            "director_team_size_skew":  self._team_size_skew(Role.DIRECTOR),
+            "manager_team_size_skew":  self._team_size_skew(Role.MANAGER),
+            "mean_days_between_hires": mean_days_between(EventType.EMPLOYED),
+            "mean_days_between_promotions": mean_days_between(EventType.PROMOTED),
+            "mean_days_between_leavings": mean_days_between(EventType.LEFT),
+        }
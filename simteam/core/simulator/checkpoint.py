@@ -0,0 +1,39 @@
+import pickle
+from typing import Any
+
+# Leading bytes of every checkpoint file; bump the version when the layout changes
+CHECKPOINT_MAGIC = b"SIMTEAM-CHECKPOINT\n"
+CHECKPOINT_VERSION = 4
+
+
+def write_checkpoint(obj: Any, path: str) -> None:
+    """
+    Write `obj` as a binary checkpoint: magic bytes, then a versioned pickle.
+
+    Args:
+        obj (Any): The object to persist (usually a simulator).
+        path (str): File path to write to.
+    """
+    with open(path, "wb") as f:
+        f.write(CHECKPOINT_MAGIC)
+        pickle.dump((CHECKPOINT_VERSION, obj), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def read_checkpoint(path: str) -> Any:
+    """
+    Read an object written by `write_checkpoint`.
+
+    Checkpoints are pickles: only restore files from a trusted source.
+
+    Raises:
+        ValueError: If the file is not a checkpoint of a supported version.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(CHECKPOINT_MAGIC)) != CHECKPOINT_MAGIC:
+            raise ValueError(f"{path} is not a simulator checkpoint")
+        version, obj = pickle.load(f)
+    if version != CHECKPOINT_VERSION:
+        raise ValueError(
+            f"Checkpoint version {version} is not supported (expected {CHECKPOINT_VERSION})"
+        )
+    return obj
@@ -1,8 +1,17 @@
 from collections import defaultdict
 from datetime import datetime
-import random
+
+import numpy as np
+
 from simteam.core.enums import EventType
-from simteam.core.utils import poisson_event_count
+from simteam.core.utils import poisson_event_count, weighted_sample
+
+# Mean number of events per day (Poisson rate)
+DAILY_EVENT_RATE = 1.5
+
+# Pre-sampled schedule block sizes (draws per NumPy call)
+EVENT_COUNT_BLOCK_DAYS = 365
+EVENT_TYPE_BLOCK_SIZE = 1024
 
 
 class DailyEventEngine:
@@ -13,11 +22,35 @@ class DailyEventEngine:
     - Decide how many events occur per day
     - Choose which types (EMPLOYED, PROMOTED, LEFT, etc.)
     - Enforce daily and weekly constraints
+
+    With `config.presample_events`, daily event counts and candidate event
+    types are drawn in large NumPy blocks and consumed day by day. Blocks are
+    refilled lazily, so results do not depend on how days are batched.
     """
 
     def __init__(self):
         self.week_counter = 0
         self.weekly_event_tracker = defaultdict(int)
+        self.reset_event_schedule()
+
+    def reset_event_schedule(self) -> None:
+        """
+        Discard any pre-sampled draws (e.g. after changing the config).
+        """
+        self._event_counts = np.empty(0, dtype=np.int64)
+        self._event_count_pos = 0
+        self._event_type_codes = np.empty(0, dtype=np.int64)
+        self._event_type_pos = 0
+        self._event_types = list(self.config.event_type_weights)
+
+    def fork_event_schedule(self) -> None:
+        """
+        Detach weekly tracking from the simulator this one was forked from.
+
+        Pre-sampled blocks are replaced rather than modified when refilled,
+        so they can stay shared.
+        """
+        self.weekly_event_tracker = defaultdict(int, self.weekly_event_tracker)
 
     def generate_daily_events(self, date: datetime) -> None:
         """
@@ -38,7 +71,7 @@ class DailyEventEngine:
 
         events_today = defaultdict(int)
         
-        max_daily_events = poisson_event_count(max_events=self.config.max_events_per_day)
+        max_daily_events = self.next_event_count()
 
         # === 1. Fill vacancies first (count as events)
         if self.emp_counter <= self.config.min_employees_for_leaving:
@@ -63,6 +96,26 @@ class DailyEventEngine:
         if is_monday and sum(self.weekly_event_tracker.values()) == 0:
             self.force_fallback_event(date)
 
+    def next_event_count(self) -> int:
+        """
+        Number of events for the day: Poisson(DAILY_EVENT_RATE), capped at `max_events_per_day`.
+        """
+        if not self.config.presample_events:
+            return poisson_event_count(
+                max_events=self.config.max_events_per_day, mu=DAILY_EVENT_RATE, rng=self.rng
+            )
+
+        if self._event_count_pos >= len(self._event_counts):
+            self._event_counts = np.minimum(
+                self.rng.poisson(DAILY_EVENT_RATE, size=EVENT_COUNT_BLOCK_DAYS),
+                self.config.max_events_per_day,
+            )
+            self._event_count_pos = 0
+
+        count = int(self._event_counts[self._event_count_pos])
+        self._event_count_pos += 1
+        return count
+
     def sample_event_type(self, current_day_counts: dict) -> EventType | None:
         """
         Choose an event type based on weights, respecting per-day caps.
@@ -75,10 +128,29 @@ class DailyEventEngine:
                 valid_types.append(etype)
                 weights.append(weight)
 
-        if not valid_types:
+        if not valid_types or not sum(weights):
             return None
 
-        return random.choices(valid_types, weights=weights, k=1)[0]
+        if not self.config.presample_events:
+            return weighted_sample(valid_types, weights, rng=self.rng)
+
+        # Drawing from the full distribution and skipping capped types is
+        # equivalent to drawing from the weights renormalised over valid types.
+        while True:
+            etype = self._event_types[self._next_event_type_code()]
+            if current_day_counts[etype] < self.config.event_type_caps[etype]:
+                return etype
+
+    def _next_event_type_code(self) -> int:
+        if self._event_type_pos >= len(self._event_type_codes):
+            cum_weights = np.cumsum([self.config.event_type_weights[t] for t in self._event_types])
+            draws = self.rng.random(EVENT_TYPE_BLOCK_SIZE) * cum_weights[-1]
+            self._event_type_codes = np.searchsorted(cum_weights, draws, side="right")
+            self._event_type_pos = 0
+
+        code = int(self._event_type_codes[self._event_type_pos])
+        self._event_type_pos += 1
+        return code
 
     def execute_event(self, event_type: EventType, date: datetime):
         """
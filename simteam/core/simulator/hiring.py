@@ -1,11 +1,8 @@
 from datetime import datetime
-import random
 from typing import Optional
 
 from simteam.core.enums import Role
-from simteam.core.utils import generate_emp_id
-from simteam.core.models.employee import Employee
-from simteam.core.models.base import EventLog
+from simteam.core.utils import generate_emp_id, random_choice
 
 
 class HiringLogic:
@@ -34,14 +31,11 @@ class HiringLogic:
         """
         
         # Must not exceed total
-        if len(self.active_employees) >= self.config.max_employees:
+        if self.employee_count >= self.config.max_employees:
             return None
 
         # Must not exceed role quota
-        current_count = sum(
-            1 for e in self.active_employees
-            if e.state.active and e.state.role == role
-        )
+        current_count = self.registry.count_by_role(role)
         if current_count >= self.config.role_quotas[role]:
             return None
 
@@ -62,7 +56,7 @@ class HiringLogic:
         }
 
         emp_id = self.generate_emp_id()
-        new_emp = Employee.create(
+        new_emp = self.new_employee(
             emp_id=emp_id,
             role=role,
             hire_date=date,
@@ -70,8 +64,7 @@ class HiringLogic:
             department=department,
             team=team
         )
-        self.employees[emp_id] = new_emp
-        self.event_log.append(new_emp.state.history[-1])
+        self.event_log.append(new_emp.last_event)
         
         # Create subordinate vacancies if this is a managerial role
         
@@ -81,16 +74,14 @@ class HiringLogic:
                 Role.CEO: Role.VP,
                 Role.VP: Role.DIRECTOR,
                 Role.DIRECTOR: Role.MANAGER,
-                Role.MANAGER: random.choice([Role.SENIOR_ANALYST, Role.ANALYST]),
+                Role.MANAGER: random_choice([Role.SENIOR_ANALYST, Role.ANALYST], self.rng),
             }.get(role)
             
             if subordinate_role:
                 # Count how many already exist in this department/team
                 current = sum(
-                    1 for e in self.active_employees
-                    if e.state.active
-                    and e.state.role == subordinate_role
-                    and e.state.manager_id == emp_id
+                    1 for report_id in self.registry.direct_report_ids(emp_id)
+                    if self.employees[report_id].state.role == subordinate_role
                 )
                 quota = self.config.role_quotas[subordinate_role]
                 n_vacancies = max(0, quota - current)
@@ -19,12 +19,9 @@ class LeavingLogic:
             return
 
         emp.leave(date)
-        self.event_log.append(emp.state.history[-1])
+        self.event_log.append(emp.last_event)
 
-        report_ids = [
-            e.state.emp_id for e in self.employees.values()
-            if e.state.active and e.state.manager_id == emp_id
-        ]
+        report_ids = self.registry.direct_report_ids(emp_id)
 
         # STEP 1 — Create TEMP placeholder
         if report_ids and emp.state.role in {Role.MANAGER, Role.DIRECTOR, Role.VP}:
@@ -45,7 +42,7 @@ class LeavingLogic:
             # Reassign direct reports to the placeholder
             for report_id in report_ids:
                 self.employees[report_id].change_manager(placeholder_id, date)
-                self.event_log.append(self.employees[report_id].state.history[-1])
+                self.event_log.append(self.employees[report_id].last_event)
 
             temp_manager_id = placeholder_id
         else:
@@ -37,7 +37,7 @@ class ManagerChangeLogic:
             return False
 
         emp.change_manager(new_mgr_id, date)
-        self.event_log.append(emp.state.history[-1])
+        self.event_log.append(emp.last_event)
         return True
     
     def is_valid_manager_assignment(self, emp_role: Role, mgr_role: Role) -> bool:
@@ -1,6 +1,5 @@
 from datetime import datetime
 from typing import Optional
-import random
 
 from simteam.core.enums import Role
 from simteam.core.models.employee import Employee
@@ -22,10 +21,8 @@ class PromotionLogic:
         Return active employees in the specified `from_role` who are eligible for promotion.
         """
         return [
-            e for e in self.employees.values()
-            if e.state.active
-            and e.state.role == from_role
-            and self.can_be_promoted(e)
+            e for e in self.get_active_employees_by_role(from_role)
+            if self.can_be_promoted(e)
         ]
 
     def can_be_promoted(self, emp: Employee) -> bool:
@@ -49,10 +46,7 @@ class PromotionLogic:
             return None
 
         # === 1. Check vacancy (quota not exceeded)
-        current_count = sum(
-            1 for e in self.employees.values()
-            if e.state.active and e.state.role == to_role
-        )
+        current_count = self.registry.count_by_role(to_role)
         if current_count >= self.config.role_quotas[to_role]:
             return None
 
@@ -63,17 +57,17 @@ class PromotionLogic:
 
         # === 3. Weighted sampling by tenure
         weights = [(date - e.state.hire_date).days + 1 for e in candidates]
-        selected = weighted_sample(candidates, weights)
+        selected = weighted_sample(candidates, weights, rng=self.rng)
 
         # === 4. Promote
         selected.promote(to_role, date)
-        self.event_log.append(selected.state.history[-1])
+        self.event_log.append(selected.last_event)
 
         # === 5. Reassign manager (if needed)
         new_mgr_id = self.find_valid_manager(selected.state.emp_id, to_role)
         if new_mgr_id:
             self.change_manager(selected.state.emp_id, new_mgr_id, date)
-            self.event_log.append(selected.state.history[-1])
+            self.event_log.append(selected.last_event)
 
         return selected.state.emp_id
 
@@ -84,13 +78,10 @@ class PromotionLogic:
         """
         allowed_roles = self.config.allowed_manager_mapping.get(role, set())
 
-        for e in self.employees.values():
-            if (
-                e.state.active
-                and e.state.emp_id != emp_id
-                and e.state.role in allowed_roles
-            ):
-                return e.state.emp_id
+        # Earliest-hired active employee in an allowed role
+        mgr_id = self.registry.earliest_hired(allowed_roles, exclude=emp_id)
+        if mgr_id:
+            return mgr_id
 
         for tid, temp in self.temp_employees.items():
             if temp.state.role in allowed_roles:
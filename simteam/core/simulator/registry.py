@@ -0,0 +1,231 @@
+import heapq
+from collections import defaultdict
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+from simteam.core.enums import Role
+from simteam.core.models.employee import Employee
+
+T = TypeVar("T", bound=Hashable)
+
+
+class IndexedSet(Generic[T]):
+    """
+    A set with O(1) add, remove, membership and positional access.
+
+    Removal swaps the last item into the freed slot, so iteration order is
+    deterministic (it only depends on the sequence of operations) but is not
+    insertion order.
+    """
+
+    __slots__ = ("_items", "_pos")
+
+    def __init__(self, items: Iterable[T] = ()):
+        self._items: List[T] = []
+        self._pos: Dict[T, int] = {}
+        for item in items:
+            self.add(item)
+
+    def add(self, item: T) -> None:
+        if item in self._pos:
+            return
+        self._pos[item] = len(self._items)
+        self._items.append(item)
+
+    def discard(self, item: T) -> None:
+        idx = self._pos.pop(item, None)
+        if idx is None:
+            return
+        last = self._items.pop()
+        if idx < len(self._items):
+            self._items[idx] = last
+            self._pos[last] = idx
+
+    def copy(self) -> "IndexedSet[T]":
+        """
+        Copy preserving positions, so indexed picks match the original.
+        """
+        clone = IndexedSet()
+        clone._items = list(self._items)
+        clone._pos = dict(self._pos)
+        return clone
+
+    def __contains__(self, item) -> bool:
+        return item in self._pos
+
+    def __getitem__(self, idx: int) -> T:
+        return self._items[idx]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"IndexedSet({self._items!r})"
+
+
+class OrgRegistry:
+    """
+    Incremental index over the active organisation.
+
+    Maintains, for active (non-TEMP) employees only:
+    - active employee IDs by role (with O(1) counts and random access)
+    - per role, a heap of (hire rank, ID) for earliest-hired lookups; the
+      rank is the order employees were first added, i.e. `employees` order
+    - manager -> direct report adjacency
+
+    Employees bound to the registry notify it on promote/change_manager/leave,
+    so simulator queries never need to scan the full `employees` dict.
+    """
+
+    def __init__(self, employees: Dict[str, Employee]):
+        self._employees = employees
+        self._by_role: Dict[Role, IndexedSet[str]] = {role: IndexedSet() for role in Role}
+        self._reports: Dict[str, IndexedSet[str]] = defaultdict(IndexedSet)
+        self._active_count = 0
+        self._rank: Dict[str, int] = {}
+        # Entries whose ID has left the role are dropped lazily by `earliest_hired`
+        self._hire_order: Dict[Role, List[Tuple[int, str]]] = {role: [] for role in Role}
+
+    def _index_role(self, emp_id: str, role: Role) -> None:
+        self._by_role[role].add(emp_id)
+        heapq.heappush(self._hire_order[role], (self._rank[emp_id], emp_id))
+
+    # ==== Mutation hooks ====
+
+    def add(self, emp: Employee) -> None:
+        """
+        Register an employee and bind it so later mutations keep the index in sync.
+        """
+        emp.bind_registry(self)
+        self._rank.setdefault(emp.state.emp_id, len(self._rank))
+        if not emp.state.active:
+            return
+        self._index_role(emp.state.emp_id, emp.state.role)
+        if emp.state.manager_id:
+            self._reports[emp.state.manager_id].add(emp.state.emp_id)
+        self._active_count += 1
+
+    def on_promote(self, emp: Employee, old_role: Role) -> None:
+        if not emp.state.active:
+            return
+        self._by_role[old_role].discard(emp.state.emp_id)
+        self._index_role(emp.state.emp_id, emp.state.role)
+
+    def on_manager_change(self, emp: Employee, old_manager_id: Optional[str]) -> None:
+        if not emp.state.active:
+            return
+        if old_manager_id:
+            self._reports[old_manager_id].discard(emp.state.emp_id)
+        if emp.state.manager_id:
+            self._reports[emp.state.manager_id].add(emp.state.emp_id)
+
+    def on_leave(self, emp: Employee) -> None:
+        emp_id = emp.state.emp_id
+        if emp_id not in self._by_role[emp.state.role]:
+            return
+        self._by_role[emp.state.role].discard(emp_id)
+        if emp.state.manager_id:
+            self._reports[emp.state.manager_id].discard(emp_id)
+        self._active_count -= 1
+
+    def rebuild(self) -> None:
+        """
+        Recompute the whole index from the employee registry (e.g. after loading).
+        """
+        self._by_role = {role: IndexedSet() for role in Role}
+        self._reports = defaultdict(IndexedSet)
+        self._active_count = 0
+        self._rank = {}
+        self._hire_order = {role: [] for role in Role}
+        for emp in self._employees.values():
+            self.add(emp)
+
+    def fork(self, employees: Dict[str, Employee]) -> "OrgRegistry":
+        """
+        Copy this index onto `employees` (a forked copy of the indexed registry) and bind them.
+
+        Unlike `rebuild()`, bucket order is preserved, so a fork draws the
+        same employees for the same random numbers as the original would.
+        """
+        clone = OrgRegistry(employees)
+        clone._by_role = {role: ids.copy() for role, ids in self._by_role.items()}
+        clone._reports = defaultdict(IndexedSet, {mgr: ids.copy() for mgr, ids in self._reports.items()})
+        clone._active_count = self._active_count
+        clone._rank = dict(self._rank)
+        clone._hire_order = {role: list(heap) for role, heap in self._hire_order.items()}
+        if hasattr(employees, "bind_registry"):
+            employees.bind_registry(clone)
+        else:
+            for emp in employees.values():
+                emp.bind_registry(clone)
+        return clone
+
+    # ==== Queries ====
+
+    @property
+    def active_count(self) -> int:
+        return self._active_count
+
+    def count_by_role(self, role: Role) -> int:
+        return len(self._by_role[role])
+
+    def counts_by_role(self) -> Dict[Role, int]:
+        return {role: len(ids) for role, ids in self._by_role.items() if ids}
+
+    def ids_by_role(self, role: Role) -> IndexedSet[str]:
+        """
+        Live view of active employee IDs in `role`. Do not mutate.
+        """
+        return self._by_role[role]
+
+    def active_ids(self) -> Iterator[str]:
+        for role in Role:
+            yield from self._by_role[role]
+
+    def direct_report_ids(self, manager_id: str) -> List[str]:
+        reports = self._reports.get(manager_id)
+        return list(reports) if reports else []
+
+    def direct_report_count(self, manager_id: str) -> int:
+        reports = self._reports.get(manager_id)
+        return len(reports) if reports else 0
+
+    def pick(self, roles: Iterable[Role], idx: int) -> str:
+        """
+        Return the `idx`-th active employee ID across the concatenated `roles` buckets.
+
+        Combined with `count_in_roles` this gives O(#roles) uniform sampling
+        over the union of several role buckets without building a list.
+        """
+        for role in roles:
+            bucket = self._by_role[role]
+            if idx < len(bucket):
+                return bucket[idx]
+            idx -= len(bucket)
+        raise IndexError("registry index out of range")
+
+    def count_in_roles(self, roles: Iterable[Role]) -> int:
+        return sum(len(self._by_role[role]) for role in roles)
+
+    def earliest_hired(self, roles: Iterable[Role], exclude: Optional[str] = None) -> Optional[str]:
+        """
+        Return the earliest-hired active employee ID in any of `roles`, other than `exclude`.
+
+        This is the first match in `employees` order, found in amortised
+        O(#roles * log n) rather than by scanning the registry.
+        """
+        best = None
+        for role in roles:
+            heap, bucket = self._hire_order[role], self._by_role[role]
+            skipped = []
+            while heap and (heap[0][1] not in bucket or heap[0][1] == exclude):
+                entry = heapq.heappop(heap)
+                if entry[1] in bucket:
+                    skipped.append(entry)  # `exclude` is still active: keep it
+            if heap and (best is None or heap[0] < best):
+                best = heap[0]
+            for entry in skipped:
+                heapq.heappush(heap, entry)
+        return best[1] if best else None
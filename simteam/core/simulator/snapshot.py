@@ -0,0 +1,136 @@
+import gzip
+import json
+from datetime import datetime
+from typing import IO, Any, Iterable, Iterator, Optional, Tuple
+
+# Identifies the file type and layout; bump the version when the layout changes
+SNAPSHOT_FORMAT = "simteam-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Key of the marker line that opens each section
+SECTION_KEY = "__section__"
+
+# Written in this order: events first, so a reader can attach each employee's
+# history (or latest event) as soon as the employee itself is read
+SECTIONS = ("events", "employees", "temp_employees", "vacancies")
+
+
+def _open(path: str, mode: str) -> IO[str]:
+    # `.gz` snapshots are compressed transparently
+    if str(path).endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not snapshot-serialisable")
+
+
+_encoder = json.JSONEncoder(separators=(",", ":"), default=_default)
+
+
+class SnapshotWriter:
+    """
+    Incremental writer for line-delimited (NDJSON) simulator snapshots.
+
+    Layout: one header object, then for each section a marker line
+    `{"__section__": name}` followed by one compact JSON object per record.
+    Records are encoded and written one at a time, so memory use does not
+    grow with the size of the snapshot.
+    """
+
+    def __init__(self, path: str, **header: Any):
+        """
+        Args:
+            path (str): Output file; a `.gz` suffix enables gzip compression.
+            **header: Extra header fields (e.g. dates and counters).
+        """
+        self._file = _open(path, "w")
+        self.section: Optional[str] = None
+        self._write({"format": SNAPSHOT_FORMAT, "version": SNAPSHOT_VERSION, **header})
+
+    def _write(self, obj: dict) -> None:
+        self._file.write(_encoder.encode(obj))
+        self._file.write("\n")
+
+    def begin(self, section: str) -> None:
+        """
+        Start a new section; subsequent records belong to it.
+        """
+        self.section = section
+        self._write({SECTION_KEY: section})
+
+    def write(self, record: dict) -> None:
+        if self.section is None:
+            raise ValueError("Call begin(section) before writing records")
+        self._write(record)
+
+    def write_section(self, section: str, records: Iterable[dict]) -> None:
+        """
+        Write a whole section from an iterable, consuming it lazily.
+        """
+        self.begin(section)
+        for record in records:
+            self._write(record)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class SnapshotReader:
+    """
+    Incremental reader for snapshots written by `SnapshotWriter`.
+
+    The header is parsed on open; iterating yields `(section, record)` pairs
+    one line at a time. Records are plain dicts with ISO-format date strings:
+    decoding into models is left to the caller.
+    """
+
+    def __init__(self, path: str):
+        """
+        Raises:
+            ValueError: If the file is not a snapshot of a supported version.
+        """
+        self._file = _open(path, "r")
+        first = self._file.readline()
+        try:
+            self.header = json.loads(first)
+        except json.JSONDecodeError:
+            self.header = None
+        if not isinstance(self.header, dict) or self.header.get("format") != SNAPSHOT_FORMAT:
+            self._file.close()
+            raise ValueError(f"{path} is not a {SNAPSHOT_FORMAT} file")
+        if self.header.get("version") != SNAPSHOT_VERSION:
+            self._file.close()
+            raise ValueError(
+                f"Snapshot version {self.header.get('version')} is not supported "
+                f"(expected {SNAPSHOT_VERSION})"
+            )
+
+    def __iter__(self) -> Iterator[Tuple[str, dict]]:
+        section = None
+        for line in self._file:
+            record = json.loads(line)
+            if SECTION_KEY in record:
+                section = record[SECTION_KEY]
+                continue
+            if section is None:
+                raise ValueError("Snapshot record found before any section marker")
+            yield section, record
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
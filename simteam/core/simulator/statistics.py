@@ -0,0 +1,134 @@
+import copy
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from simteam.core.enums import EventType
+from simteam.core.models.eventlog import EPOCH, EVENT_TYPE_CODES, EVENT_TYPES, SECONDS_PER_DAY
+
+EMPLOYED = EVENT_TYPE_CODES[EventType.EMPLOYED]
+LEFT = EVENT_TYPE_CODES[EventType.LEFT]
+PROMOTED = EVENT_TYPE_CODES[EventType.PROMOTED]
+
+
+class RunningStatistics:
+    """
+    Streaming accumulators for the summary statistics, updated per logged event.
+
+    Tracks, in O(1) per event:
+    - event counts per type
+    - running headcount (hires minus leavers) and the first saturated day
+    - first/last timestamp and the sum of day gaps per event type
+    - a per-day series of hires, promotions, leavers and active headcount,
+      appended by `snapshot_day` at the end of each simulated day
+
+    Statistics are exact as long as events arrive in date order (as they do
+    during a simulation); otherwise `ordered` is cleared and callers should
+    fall back to a post-hoc computation.
+    """
+
+    def __init__(self, max_employees: int, start_date: datetime):
+        self.max_employees = max_employees
+        self.start_day = (start_date - EPOCH).days
+
+        n_types = len(EVENT_TYPES)
+        self.counts: List[int] = [0] * n_types
+        self.last_ts: List[Optional[int]] = [None] * n_types
+        self.gap_days: List[int] = [0] * n_types
+
+        self.headcount = 0
+        self.ordered = True
+        self._saturation_day: Optional[int] = None
+        self._current_day: Optional[int] = None
+        self._latest_ts: Optional[int] = None
+
+        self.daily_series: Dict[str, Dict[str, int]] = {}
+        self._counts_at_snapshot: List[int] = [0] * n_types
+
+    def fork(self) -> "RunningStatistics":
+        """
+        Independent copy of the accumulators (recorded days are shared, they are never modified).
+        """
+        clone = copy.copy(self)
+        clone.counts = list(self.counts)
+        clone.last_ts = list(self.last_ts)
+        clone.gap_days = list(self.gap_days)
+        clone.daily_series = dict(self.daily_series)
+        clone._counts_at_snapshot = list(self._counts_at_snapshot)
+        return clone
+
+    def observe(self, event_code: int, timestamp: int) -> None:
+        """
+        Fold one event into the accumulators.
+
+        Args:
+            event_code (int): Event type code (index into EVENT_TYPES).
+            timestamp (int): Event time in seconds since 1970-01-01.
+        """
+        if self._latest_ts is not None and timestamp < self._latest_ts:
+            self.ordered = False
+        self._latest_ts = timestamp
+
+        # Saturation is judged on end-of-day headcount, so close the previous day first
+        day = timestamp // SECONDS_PER_DAY
+        if day != self._current_day:
+            self._close_day()
+            self._current_day = day
+
+        self.counts[event_code] += 1
+        if event_code == EMPLOYED:
+            self.headcount += 1
+        elif event_code == LEFT:
+            self.headcount -= 1
+
+        last = self.last_ts[event_code]
+        if last is not None:
+            self.gap_days[event_code] += (timestamp - last) // SECONDS_PER_DAY
+        self.last_ts[event_code] = timestamp
+
+    def _close_day(self) -> None:
+        if (
+            self._saturation_day is None
+            and self._current_day is not None
+            and self.headcount >= self.max_employees
+        ):
+            self._saturation_day = self._current_day - self.start_day
+
+    @property
+    def org_saturation_day(self) -> Optional[int]:
+        """
+        Days from the start until end-of-day headcount first reached `max_employees`.
+        """
+        if self._saturation_day is not None:
+            return self._saturation_day
+        if self._current_day is not None and self.headcount >= self.max_employees:
+            return self._current_day - self.start_day
+        return None
+
+    def count(self, event_type: EventType) -> int:
+        return self.counts[EVENT_TYPE_CODES[event_type]]
+
+    def mean_days_between(self, event_type: EventType) -> float:
+        """
+        Mean gap in whole days between consecutive events of `event_type`.
+        """
+        code = EVENT_TYPE_CODES[event_type]
+        if self.counts[code] < 2:
+            return 0.0
+        return round(self.gap_days[code] / (self.counts[code] - 1), 2)
+
+    def snapshot_day(self, date: datetime, total_employees: int) -> None:
+        """
+        Record the day's event counts (since the previous snapshot) and headcount.
+
+        Args:
+            date (datetime): The simulated day being closed.
+            total_employees (int): Active employees at the end of the day.
+        """
+        since = [now - before for now, before in zip(self.counts, self._counts_at_snapshot)]
+        self.daily_series[date.date().isoformat()] = {
+            "hire": since[EMPLOYED],
+            "promote": since[PROMOTED],
+            "leave": since[LEFT],
+            "total_employees": total_employees,
+        }
+        self._counts_at_snapshot = list(self.counts)
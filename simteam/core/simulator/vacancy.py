@@ -1,10 +1,9 @@
-import random
 from datetime import datetime
 from typing import List
 
 from simteam.core.enums import Role
 from simteam.core.models.vacancy import Vacancy
-from simteam.core.utils import advance_date
+from simteam.core.utils import advance_date, weighted_sample
 
 # Moved to top-level constant for reuse and testability
 PROMOTE_HIRE_WEIGHTS = {
@@ -22,6 +21,7 @@ class VacancyLogic:
 
     - Vacancies are triggered by departures with direct reports.
     - Fill logic considers weighted chance of promotion vs hire.
+    - Open vacancies live in a `VacancyQueue` (deadline heap + per-role buckets).
     """
 
     def create_vacancy(
@@ -47,6 +47,19 @@ class VacancyLogic:
         )
         self.vacancies.append(vacancy)
 
+    def can_fill_role(self, role: Role) -> bool:
+        """
+        Whether a vacancy for `role` could be filled right now.
+
+        False when the role quota is full (both promotion and hiring would
+        be refused), or when the org is at `max_employees` and the role is
+        only ever filled by hiring.
+        """
+        if self.registry.count_by_role(role) >= self.config.role_quotas[role]:
+            return False
+        promote_weight, _ = PROMOTE_HIRE_WEIGHTS.get(role, (0, 1))
+        return bool(promote_weight) or self.employee_count < self.config.max_employees
+
     def resolve_vacancies(self, date: datetime, max_fill: int = None) -> int:
         """
         Attempt to resolve open vacancies (by promotion or hiring), up to a maximum number.
@@ -58,24 +71,24 @@ class VacancyLogic:
         Returns:
             int: Number of vacancies successfully filled.
         """
-        still_open = []
+        self.vacancies.expire(date)
         filled_count = 0
 
-        for vacancy in self.vacancies:
-            if self.is_vacancy_expired(vacancy, date):
-                continue
-
-            if max_fill is not None and filled_count >= max_fill:
-                still_open.append(vacancy)
-                continue
-
-            filled = self.try_fill_vacancy(vacancy, date)
-            if filled:
-                filled_count += 1
+        # Visit vacancies once each, in creation order (including any created
+        # by today's fills), skipping roles that cannot be filled. A fill
+        # changes headcounts, so the fillable roles are re-selected after each.
+        last_seen = -1
+        while max_fill is None or filled_count < max_fill:
+            fillable = [role for role in Role if self.can_fill_role(role)]
+            for seq, vacancy in self.vacancies.open_in(fillable, after=last_seen):
+                last_seen = seq
+                if self.try_fill_vacancy(vacancy, date):
+                    self.vacancies.remove(seq)
+                    filled_count += 1
+                    break
             else:
-                still_open.append(vacancy)
+                break
 
-        self.vacancies = still_open
         return filled_count
 
     def try_fill_vacancy(self, vacancy: Vacancy, date: datetime) -> bool:
@@ -98,7 +111,7 @@ class VacancyLogic:
 
         # Step 1: Choose method based on defined promotion/hiring weights
         strategy = PROMOTE_HIRE_WEIGHTS.get(role, (0, 1))  # default: always hire
-        method = random.choices(["promote", "hire"], weights=strategy, k=1)[0]
+        method = weighted_sample(["promote", "hire"], strategy, rng=self.rng)
 
         # Step 2: Attempt promotion or fallback to hire
         emp_id = None
@@ -124,9 +137,6 @@ class VacancyLogic:
 
         return True
 
-    def is_vacancy_expired(self, vacancy: Vacancy, date: datetime) -> bool:
-        return date > vacancy.record.deadline
-
     def get_promotion_source(self, to_role: Role) -> Role:
         """
         Get the typical role that promotes into this target role.
@@ -1,8 +1,9 @@
-import random
+from bisect import bisect
+from itertools import accumulate
 from faker import Faker
-from typing import List
+from typing import List, Optional, Sequence
 from datetime import datetime, timedelta
-from scipy.stats import poisson
+import numpy as np
 
 from simteam.core.enums import MAX_EVENTS_PER_TYPE
 
@@ -20,24 +21,40 @@ def generate_emp_id(counter: int) -> str:
     return f"E{counter:04d}"
 
 
-def poisson_event_count(max_events: int, mu: float = 1.5) -> int:
+def make_rng(seed: Optional[int] = None) -> np.random.Generator:
+    """
+    Create the NumPy generator that owns all randomness of one simulator.
+
+    Args:
+        seed (int, optional): Seed for reproducible runs. None draws fresh entropy.
+
+    Returns:
+        np.random.Generator: A PCG64-backed generator.
+    """
+    return np.random.default_rng(seed)
+
+
+def poisson_event_count(max_events: int, mu: float = 1.5, rng: Optional[np.random.Generator] = None) -> int:
     """
     Sample the number of events for the day using a Poisson distribution.
 
     Args:
         max_events (int): Maximum allowed events.
         mu (float): The lambda parameter (mean rate of events).
+        rng (np.random.Generator, optional): Generator to draw from.
         
     Returns:
         int: Truncated number of events for the day.
     """
-    return min(poisson.rvs(mu=mu), max_events)
+    rng = rng or make_rng()
+    return min(int(rng.poisson(mu)), max_events)
 
 
 def sample_limited(
     population: List,
     k: int,
-    max_per_item: int = MAX_EVENTS_PER_TYPE
+    max_per_item: int = MAX_EVENTS_PER_TYPE,
+    rng: Optional[np.random.Generator] = None,
 ) -> List:
     """
     Sample up to `k` unique items from a list, capped by `max_per_item`.
@@ -46,6 +63,7 @@ def sample_limited(
         population (List): List of items to sample from.
         k (int): Number of samples to return.
         max_per_item (int): Cap on same-item selection frequency.
+        rng (np.random.Generator, optional): Generator to draw from.
 
     Returns:
         List: Sampled items.
@@ -54,17 +72,25 @@ def sample_limited(
         return []
     if len(population) <= k:
         return population
-    return random.sample(population, min(k, max_per_item))
+    rng = rng or make_rng()
+    idx = rng.choice(len(population), size=min(k, max_per_item), replace=False)
+    return [population[i] for i in idx]
 
 
-def random_name() -> str:
+def random_name(rng: Optional[np.random.Generator] = None) -> str:
     """
     Generate a random human-like name for visualisation/demo purposes.
 
+    Args:
+        rng (np.random.Generator, optional): Generator used to seed Faker.
+
     Returns:
         str: A pseudo-random name string.
     """
-    return Faker('en_AU').name()
+    faker = Faker('en_AU')
+    if rng is not None:
+        faker.seed_instance(int(rng.integers(2**32)))
+    return faker.name()
 
 
 def days_between(d1: datetime, d2: datetime) -> int:
@@ -94,5 +120,36 @@ def advance_date(date: datetime, days: int) -> datetime:
     """
     return date + timedelta(days=days)
 
-def weighted_sample(items: list, weights: list, k: int = 1):
-    return random.choices(items, weights=weights, k=k)[0]
\ No newline at end of file
+def random_choice(seq: Sequence, rng: np.random.Generator):
+    """
+    Pick one item uniformly from any indexable sequence.
+
+    Args:
+        seq (Sequence): Non-empty sequence supporting len() and indexing.
+        rng (np.random.Generator): Generator to draw from.
+
+    Returns:
+        Any: The selected item.
+    """
+    return seq[int(rng.integers(len(seq)))]
+
+
+def weighted_sample(items: list, weights: list, k: int = 1, rng: Optional[np.random.Generator] = None):
+    """
+    Pick one item with probability proportional to its weight.
+
+    Uses a cumulative-weight bisect (like `random.choices`), which is much
+    cheaper than `Generator.choice(p=...)` for the short lists used here.
+
+    Args:
+        items (list): Items to sample from.
+        weights (list): Non-negative weights, one per item.
+        k (int): Kept for backwards compatibility; a single item is returned.
+        rng (np.random.Generator, optional): Generator to draw from.
+
+    Returns:
+        Any: The selected item.
+    """
+    rng = rng or make_rng()
+    cum_weights = list(accumulate(weights))
+    return items[bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(items) - 1)]
\ No newline at end of file
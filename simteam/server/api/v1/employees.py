@@ -1,25 +1,92 @@
 # app/api/v1/employees.py
-from fastapi import APIRouter, Depends
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from simteam.server.db.session import get_db
+from simteam.server.db.session import Session as SessionLocal, get_db
 from simteam.server.db.models import EmployeeORM
+from simteam.server.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    OutputFormat,
+    decode_cursor,
+    encode_cursor,
+    json_page,
+    row_dicts,
+    stream_rows,
+)
+from simteam.core.enums import Role
 from simteam.core.models.base import EmployeeState
 
 router = APIRouter(prefix="/employees", tags=["EMPLOYEES"])
 
+# Columns returned per employee, in CSV order
+EMPLOYEE_COLUMNS = ["emp_id", "role", "manager_id", "department", "team", "hire_date", "active"]
+
+
+def _employee_query(role: Optional[List[Role]], active: Optional[bool], manager_id: Optional[str]):
+    """
+    Build the filtered, emp_id-ordered select over plain columns (no ORM objects).
+    """
+    query = select(*(getattr(EmployeeORM, col) for col in EMPLOYEE_COLUMNS))
+    if role:
+        query = query.where(EmployeeORM.role.in_(role))
+    if active is not None:
+        query = query.where(EmployeeORM.active == active)
+    if manager_id is not None:
+        query = query.where(EmployeeORM.manager_id == manager_id)
+    return query.order_by(EmployeeORM.emp_id)
+
+
+def _after(query, key: Optional[list]):
+    """
+    Keyset condition: employees after the emp_id position `key` (primary key order).
+    """
+    if key is None:
+        return query
+    if len(key) != 1 or not isinstance(key[0], str):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return query.where(EmployeeORM.emp_id > key[0])
+
+
+def _sort_key(row: dict) -> tuple:
+    return (row["emp_id"],)
+
+
 @router.get("/", response_model=list[EmployeeState])
-def list_employees(db: Session = Depends(get_db)):
-    employees = db.query(EmployeeORM).all()
-    return [EmployeeState(
-        emp_id=e.emp_id,
-        role=e.role,
-        manager_id=e.manager_id,
-        department=e.department,
-        team=e.team,
-        hire_date=e.hire_date,
-        active=e.active,
-        # history=[],  # Expand this if needed
-    ) for e in employees]
+def list_employees(
+    request: Request,
+    role: Optional[List[Role]] = Query(None, description="Only these roles (repeatable)"),
+    active: Optional[bool] = Query(None, description="Only active (true) or former (false) employees"),
+    manager_id: Optional[str] = Query(None, description="Only direct reports of this manager"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size (JSON only)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value of the previous page"),
+    fmt: OutputFormat = Query(OutputFormat.JSON, alias="format"),
+    db: Session = Depends(get_db),
+):
+    """
+    Filtered employees (including TEMP placeholders), ordered by emp_id.
+
+    Paginated with `limit`/`cursor` (next cursor in the `X-Next-Cursor`
+    header) for `format=json`, or streamed in full as `ndjson`/`csv`
+    (gzip-compressed if the client accepts it).
+    """
+    query = _employee_query(role, active, manager_id)
+    after = decode_cursor(cursor) if cursor else None
+
+    if fmt != OutputFormat.JSON:
+        def fetch(key: Optional[list], n: int) -> List[dict]:
+            with SessionLocal() as session:
+                return row_dicts(session.execute(_after(query, key).limit(n)), EMPLOYEE_COLUMNS)
+
+        _after(query, after)  # validate the cursor before the response starts
+        return stream_rows(request, fetch, _sort_key, fmt, EMPLOYEE_COLUMNS, after)
+
+    # Fetch one extra row to learn whether another page exists
+    rows = row_dicts(db.execute(_after(query, after).limit(limit + 1)), EMPLOYEE_COLUMNS)
+    next_cursor = encode_cursor(*_sort_key(rows[limit - 1])) if len(rows) > limit else None
+    return json_page(rows[:limit], next_cursor)
 
 @router.get("/temp", response_model=list[EmployeeState])
 def list_temp_employees(db: Session = Depends(get_db)):
@@ -34,4 +101,4 @@ def list_temp_employees(db: Session = Depends(get_db)):
             hire_date=e.hire_date,
             active=e.active,
         ) for e in temp_employees
-    ]
\ No newline at end of file
+    ]
@@ -1,19 +1,132 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from simteam.core.models.base import EventLog
 from simteam.server.db.models import EventLogORM
-from simteam.server.db.session import get_db
+from simteam.server.db.session import Session as SessionLocal, get_db
+from simteam.server.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    OutputFormat,
+    decode_cursor,
+    encode_cursor,
+    json_page,
+    make_etag,
+    not_modified,
+    row_dicts,
+    stream_rows,
+)
 from simteam.core.enums import Role, EventType
 
 from datetime import datetime
 
 router = APIRouter(prefix="/eventlog", tags=["EVENT LOG"])
 
+# Columns returned per event, in CSV order; `id` breaks ties between same-date events
+EVENT_COLUMNS = ["id", "date", "event_type", "employee_id", "role", "manager_id", "department", "team"]
+
+
+def _event_query(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    event_type: Optional[List[EventType]],
+    employee_id: Optional[str],
+    role: Optional[List[Role]],
+):
+    """
+    Build the filtered, (date, id)-ordered select over plain columns (no ORM objects).
+    """
+    query = select(*(getattr(EventLogORM, col) for col in EVENT_COLUMNS))
+    if start is not None:
+        query = query.where(EventLogORM.date >= start)
+    if end is not None:
+        query = query.where(EventLogORM.date < end)
+    if event_type:
+        query = query.where(EventLogORM.event_type.in_(event_type))
+    if employee_id is not None:
+        query = query.where(EventLogORM.employee_id == employee_id)
+    if role:
+        query = query.where(EventLogORM.role.in_(role))
+    return query.order_by(EventLogORM.date, EventLogORM.id)
+
+
+def _after(query, key: Optional[list]):
+    """
+    Keyset condition: rows strictly after the (date, id) position `key`.
+    """
+    if key is None:
+        return query
+    try:
+        date, event_id = datetime.fromisoformat(key[0]), int(key[1])
+    except (ValueError, TypeError, IndexError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return query.where(tuple_(EventLogORM.date, EventLogORM.id) > tuple_(date, event_id))
+
+
+def _sort_key(row: dict) -> tuple:
+    return row["date"], row["id"]
+
+
+def _log_etag(db: Session, request: Request) -> str:
+    """
+    Validator for an event log response: changes whenever rows are added,
+    removed or reloaded, and differs per filter/page/format.
+    """
+    version = db.execute(
+        select(func.count(EventLogORM.id), func.max(EventLogORM.id), func.max(EventLogORM.date))
+    ).one()
+    return make_etag(*version, request.url.query)
+
+
 @router.get("/", response_model=List[EventLog])
-def get_all_eventlogs(db: Session = Depends(get_db)):
-    return db.query(EventLogORM).all()
+def get_all_eventlogs(
+    request: Request,
+    start: Optional[datetime] = Query(None, description="Only events on or after this time"),
+    end: Optional[datetime] = Query(None, description="Only events before this time"),
+    event_type: Optional[List[EventType]] = Query(None, description="Only these event types (repeatable)"),
+    employee_id: Optional[str] = Query(None, description="Only this employee's events"),
+    role: Optional[List[Role]] = Query(None, description="Only events at these roles (repeatable)"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size (JSON only)"),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value of the previous page"),
+    fmt: OutputFormat = Query(OutputFormat.JSON, alias="format"),
+    db: Session = Depends(get_db),
+):
+    """
+    Filtered event log, ordered by (date, id).
+
+    - `format=json`: one page of at most `limit` events. While more remain,
+      the `X-Next-Cursor` response header holds the `cursor` for the next page.
+    - `format=ndjson` / `format=csv`: every matching event (from `cursor`, if
+      given), streamed in chunks and gzip-compressed if the client accepts it.
+
+    Date filters and per-employee lookups are served by the
+    `event_log(date, id)` and `event_log(employee_id, date)` indexes.
+
+    Every response carries an `ETag`; sending it back in `If-None-Match`
+    returns 304 without a body while the log is unchanged.
+    """
+    query = _event_query(start, end, event_type, employee_id, role)
+    after = decode_cursor(cursor) if cursor else None
+
+    etag = _log_etag(db, request)
+    unchanged = not_modified(request, etag)
+    if unchanged is not None:
+        return unchanged
+
+    if fmt != OutputFormat.JSON:
+        def fetch(key: Optional[list], n: int) -> List[dict]:
+            with SessionLocal() as session:
+                return row_dicts(session.execute(_after(query, key).limit(n)), EVENT_COLUMNS)
+
+        _after(query, after)  # validate the cursor before the response starts
+        return stream_rows(request, fetch, _sort_key, fmt, EVENT_COLUMNS, after, etag)
+
+    # Fetch one extra row to learn whether another page exists
+    rows = row_dicts(db.execute(_after(query, after).limit(limit + 1)), EVENT_COLUMNS)
+    next_cursor = encode_cursor(*_sort_key(rows[limit - 1])) if len(rows) > limit else None
+    return json_page(rows[:limit], next_cursor, etag)
 
 @router.post("/", response_model=EventLog)
 def create_eventlog(event: EventLog, db: Session = Depends(get_db)):
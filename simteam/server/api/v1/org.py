@@ -0,0 +1,134 @@
+# simteam/server/api/v1/org.py
+
+from datetime import date, datetime, time, timedelta
+from enum import Enum
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from simteam.core.enums import EventType
+from simteam.server.db.models import EmployeeORM, EventLogORM
+from simteam.server.db.session import get_db
+from simteam.server.timeline import org_timeline
+
+router = APIRouter(prefix="/org", tags=["ORG"])
+
+# Avatar shown for TEMP placeholders (vacant positions)
+TEMP_AVATAR_ID = 130
+
+
+class OrgSource(str, Enum):
+    SNAPSHOTS = "snapshots"  # nearest in-memory snapshot plus a replay of the events after it
+    DATABASE = "database"    # latest event per employee, queried from the whole table
+
+
+class OrgNode(BaseModel):
+    """
+    One org chart node, in the shape the org chart component renders.
+    """
+    id: str
+    parentId: Optional[str]
+    name: str
+    positionName: str
+    imageUrl: str
+
+
+class OrgSnapshot(BaseModel):
+    """
+    The org as of the end of a day: active employees plus the TEMP
+    placeholders they report to (vacant positions).
+    """
+    as_of: date
+    employees: List[OrgNode]
+    temps: List[OrgNode]
+
+
+def avatar_url(avatar_id: int) -> str:
+    return f"https://bumbeishvili.github.io/avatars/avatars/portrait{avatar_id}.png"
+
+
+def _latest_events(db: Session, cutoff: datetime):
+    """
+    Latest event per employee strictly before `cutoff`, as a subquery.
+
+    Postgres uses `DISTINCT ON`; other databases a `ROW_NUMBER()` window.
+    Both walk the event_log(employee_id, date, id) index.
+    """
+    columns = (EventLogORM.id, EventLogORM.employee_id, EventLogORM.event_type, EventLogORM.role, EventLogORM.manager_id)
+    newest_first = (EventLogORM.employee_id, EventLogORM.date.desc(), EventLogORM.id.desc())
+
+    if db.get_bind().dialect.name == "postgresql":
+        return (
+            select(*columns)
+            .where(EventLogORM.date < cutoff)
+            .distinct(EventLogORM.employee_id)
+            .order_by(*newest_first)
+            .subquery()
+        )
+
+    rank = func.row_number().over(partition_by=EventLogORM.employee_id, order_by=newest_first[1:])
+    ranked = select(*columns, rank.label("rank")).where(EventLogORM.date < cutoff).subquery()
+    return select(*(ranked.c[col.key] for col in columns)).where(ranked.c.rank == 1).subquery()
+
+
+@router.get("", response_model=OrgSnapshot)
+def get_org_snapshot(
+    as_of: date = Query(..., description="Day to show the org for (YYYY-MM-DD, inclusive)"),
+    source: OrgSource = Query(OrgSource.SNAPSHOTS, description="How to reconstruct the org"),
+    db: Session = Depends(get_db),
+):
+    """
+    The org chart as of the end of `as_of`.
+
+    Each employee's latest event up to and including `as_of` decides whether
+    they are active and where they sit; leavers are dropped. TEMP managers
+    referenced by active employees are returned separately as vacant positions.
+
+    - `source=snapshots`: served by an in-process `OrgTimeline` over the
+      event log, which loads the nearest periodic snapshot and replays only
+      the events after it (every `SIMTEAM_ORG_SNAPSHOT_DAYS` days, default 30).
+    - `source=database`: computed in the database from the whole log.
+    """
+    if source == OrgSource.SNAPSHOTS:
+        active = [
+            (record["emp_id"], record["manager_id"], record["role"])
+            for record in org_timeline.get(db).as_of(as_of)
+        ]
+    else:
+        latest = _latest_events(db, datetime.combine(as_of + timedelta(days=1), time.min))
+        active = db.execute(
+            select(latest.c.employee_id, latest.c.manager_id, latest.c.role)
+            .where(latest.c.event_type != EventType.LEFT)
+            .order_by(latest.c.id.desc())
+        ).all()
+
+    employees = [
+        OrgNode(
+            id=emp_id,
+            parentId=manager_id,
+            name=emp_id,
+            positionName=role.value,
+            imageUrl=avatar_url(int(emp_id.replace("EMP", ""))),
+        )
+        for emp_id, manager_id, role in active
+    ]
+
+    temp_ids = {manager_id for _, manager_id, _ in active if manager_id and manager_id.startswith("TEMP")}
+    temp_managers = db.execute(
+        select(EmployeeORM.emp_id, EmployeeORM.manager_id).where(EmployeeORM.emp_id.in_(temp_ids))
+    ).all() if temp_ids else []
+    temps = [
+        OrgNode(
+            id=temp_id,
+            parentId=manager_id,
+            name="NEED TO FILL",
+            positionName="Empty position",
+            imageUrl=avatar_url(TEMP_AVATAR_ID),
+        )
+        for temp_id, manager_id in sorted(temp_managers)
+    ]
+
+    return OrgSnapshot(as_of=as_of, employees=employees, temps=temps)
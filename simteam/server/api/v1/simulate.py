@@ -1,16 +1,25 @@
 # simteam/server/api/v1/model.py
 
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+import time
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Dict
+from typing import Dict, List, Optional, Sequence
 
 from simteam.core.orgsimulator import OrgSimulator
 from simteam.core.config import SimulationConfig, get_default_config
 from simteam.core.enums import Role, EventType
 
-from automl.surrogate_trainer import SurrogateTrainer
-from automl.config import target_cols
+from automl.config import feature_cols, target_cols
+from simteam.server.cache import canonical_key, simulation_cache
+from simteam.server.jobs import Job, JobStatus, QueueFullError, simulation_jobs
+from simteam.server.surrogate import surrogate_model
 
 from pydantic import BaseModel
 from typing import Dict
@@ -29,11 +38,18 @@ class ModelResponse(BaseModel):
     actual_sim: ActualSim
     predicted_stats: Dict[str, float]
 
+class JobResponse(BaseModel):
+    job_id: str
+    status: JobStatus
+    progress: float
+    result: Optional[ModelResponse] = None
+    error: Optional[str] = None
+
 router = APIRouter(prefix="/simulate", tags=["SIMULATION"])
 
-class SimulationInput(BaseModel):
+class SurrogateInput(BaseModel):
     """
-    Input schema for running a simulation and surrogate model prediction.
+    One parameter vector for the surrogate model (fields in `feature_cols` order).
     """
     seed: int = 42
     weight_employed: int = Field(ge=1, le=5)
@@ -44,28 +60,51 @@ class SimulationInput(BaseModel):
     min_events_per_week: int
     max_events_per_day: int
     max_events_per_type: int
+
+
+class SimulationInput(SurrogateInput):
+    """
+    Input schema for running a simulation and surrogate model prediction.
+    """
     sim_days: int = 365
 
 
-# Load the surrogate model once
-_surrogate = SurrogateTrainer()
-_surrogate.load()
+# Upper bounds for a single /simulate/predict request
+MAX_PREDICT_ROWS = 100_000
+MAX_PREDICT_BATCH = 10_000
 
 
-@router.get("/", response_model=ModelResponse)
-def run_simulation_and_predict(input: SimulationInput = Depends()):
+class BatchPredictionInput(BaseModel):
     """
-    Run the rule-based simulator and predict summary outcomes using the surrogate model.
+    Parameter vectors for a surrogate-only sweep.
 
-    Returns:
-        - Actual simulation results:
-            - A time series of key events (hire, promote, leave, total employees)
-            - Summary statistics (e.g. total hires, promotions, etc.)
-        - Surrogate model prediction of the same summary statistics based on input configuration
+    Requests with more than `batch_size` rows are answered as a stream of batches.
+    """
+    inputs: List[SurrogateInput] = Field(min_length=1, max_length=MAX_PREDICT_ROWS)
+    batch_size: int = Field(default=1000, ge=1, le=MAX_PREDICT_BATCH)
+
+
+class PredictionBatch(BaseModel):
+    """
+    Surrogate predictions for rows `offset .. offset + len(predictions)` of a request.
+    """
+    batch: int
+    offset: int
+    latency_ms: float
+    predictions: List[Dict[str, float]]
+
+
+# Days simulated between progress updates from a worker
+PROGRESS_EVERY_DAYS = 10
+
+
+def build_config(input: SimulationInput) -> SimulationConfig:
+    """
+    Map API input onto a full simulator config.
     """
     base_cfg = get_default_config()
 
-    config = SimulationConfig(
+    return SimulationConfig(
         role_quotas={**base_cfg.role_quotas, Role.MANAGER: 15},
         max_employees=100,
         max_events_per_type=input.max_events_per_type,
@@ -85,63 +124,254 @@ def run_simulation_and_predict(input: SimulationInput = Depends()):
         random_seed=input.seed,
     )
 
-    # Run the actual simulation
-    sim = OrgSimulator(start_date=datetime(2025, 1, 1), config=config)
-    sim.simulate_for_days(input.sim_days)
-    stats = sim.compute_hiring_statistics()
-
-    # Build time series event summary
-    time_series = {}
-    for event in sim.event_log:
-        date = event.date.date().isoformat()
-        if date not in time_series:
-            time_series[date] = {"hire": 0, "promote": 0, "leave": 0}
-        if event.event_type == EventType.EMPLOYED:
-            time_series[date]["hire"] += 1
-        elif event.event_type == EventType.PROMOTED:
-            time_series[date]["promote"] += 1
-        elif event.event_type == EventType.LEFT:
-            time_series[date]["leave"] += 1
-
-    # Add total employees per date
-    for date in time_series:
-        total = sum(
-            1 for e in sim.employees.values()
-            if e.state.active and e.state.hire_date.date().isoformat() <= date
-        )
-        time_series[date]["total_employees"] = total
-
-    # Prepare input vector for surrogate model prediction
-    X_pred = [[
-        input.seed,
-        input.weight_employed,
-        input.weight_promoted,
-        input.weight_change,
-        input.weight_left,
-        input.min_employees_for_leaving,
-        input.min_events_per_week,
-        input.max_events_per_day,
-        input.max_events_per_type
-    ]]
-    y_pred = _surrogate.predict(X_pred)
-
-    # --- Format predictions ---
-    raw_pred = dict(zip(target_cols, y_pred[0]))
-    int_fields = {
-        "total_num_hired",
-        "total_num_left",
-        "total_num_promoted",
-        "org_saturation_day"
-    }
-    predicted_stats = {
-        k: int(v) if k in int_fields else round(float(v), 3)
-        for k, v in raw_pred.items()
+
+def simulate_worker(progress, job_id: str, input: SimulationInput) -> dict:
+    """
+    Run the rule-based simulator (executed in a worker process).
+
+    Returns:
+        dict: `ActualSim` fields (daily time series and summary statistics).
+    """
+    sim = OrgSimulator(start_date=datetime(2025, 1, 1), config=build_config(input))
+
+    days_done = 0
+    while days_done < input.sim_days:
+        step = min(PROGRESS_EVERY_DAYS, input.sim_days - days_done)
+        sim.simulate_for_days(step)
+        days_done += step
+        if progress is not None:
+            progress[job_id] = days_done / input.sim_days
+
+    return {
+        # Per-day event counts and end-of-day headcount, recorded during the run
+        "time_series": sim.stats.daily_series,
+        "stats": sim.compute_hiring_statistics(),
     }
 
-    return ModelResponse(
-        actual_sim=ActualSim(
-            time_series=time_series,
-            stats=stats
-        ),
-        predicted_stats=predicted_stats
-    )
\ No newline at end of file
+
+# Targets reported as whole numbers
+INT_TARGETS = {
+    "total_num_hired",
+    "total_num_left",
+    "total_num_promoted",
+    "org_saturation_day"
+}
+
+
+def _feature_matrix(inputs: Sequence[SurrogateInput]) -> np.ndarray:
+    """
+    Stack parameter vectors into an (n_rows, n_features) matrix in `feature_cols` order.
+    """
+    return np.array(
+        [[getattr(input, col) for col in feature_cols] for input in inputs],
+        dtype=np.float64,
+    )
+
+
+def _format_predictions(y_pred: np.ndarray) -> List[Dict[str, float]]:
+    """
+    Turn an (n_rows, n_targets) prediction matrix into one dict per row.
+
+    Works column by column, so formatting stays cheap for large batches.
+    """
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+    columns = [
+        y_pred[:, j].astype(np.int64).tolist() if col in INT_TARGETS
+        else [round(v, 3) for v in y_pred[:, j].tolist()]
+        for j, col in enumerate(target_cols)
+    ]
+    return [dict(zip(target_cols, row)) for row in zip(*columns)]
+
+
+def predict_batch(inputs: Sequence[SurrogateInput]) -> List[Dict[str, float]]:
+    """
+    Predict the summary statistics for many inputs with one surrogate call.
+    """
+    return _format_predictions(surrogate_model.predict(_feature_matrix(inputs)))
+
+
+def predict_stats(input: SurrogateInput) -> Dict[str, float]:
+    """
+    Predict the summary statistics for `input` with the surrogate model.
+    """
+    return predict_batch([input])[0]
+
+
+async def _predict_timed(batch: int, offset: int, inputs: Sequence[SurrogateInput]) -> PredictionBatch:
+    # Model inference is CPU-bound; keep it off the event loop
+    started = time.perf_counter()
+    predictions = await run_in_threadpool(predict_batch, inputs)
+    return PredictionBatch(
+        batch=batch,
+        offset=offset,
+        latency_ms=round((time.perf_counter() - started) * 1000, 3),
+        predictions=predictions,
+    )
+
+
+async def _surrogate_ready() -> None:
+    try:
+        await surrogate_model.wait_ready()
+    except RuntimeError as exc:
+        raise HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": "30"})
+
+
+def _response_builder(input: SimulationInput, cache_key: str):
+    async def build(actual_sim: dict) -> ModelResponse:
+        # Usually loaded by the time the simulation finishes; inference runs
+        # in the threadpool so neither step blocks the loop
+        await surrogate_model.wait_ready()
+        response = ModelResponse(
+            actual_sim=ActualSim(**actual_sim),
+            predicted_stats=await run_in_threadpool(predict_stats, input),
+        )
+        # Runs are seed-deterministic, so the response can be reused verbatim
+        simulation_cache.set(cache_key, response.model_dump(mode="json"))
+        return response
+    return build
+
+
+def _cached_response(cache_key: str) -> Optional[ModelResponse]:
+    cached = simulation_cache.get(cache_key)
+    return ModelResponse(**cached) if cached is not None else None
+
+
+def _queue_full(exc: QueueFullError) -> HTTPException:
+    return HTTPException(status_code=429, detail=str(exc), headers={"Retry-After": "5"})
+
+
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        progress=round(job.progress, 3),
+        result=job.result,
+        error=job.error,
+    )
+
+
+@router.get("/", response_model=ModelResponse)
+async def run_simulation_and_predict(input: SimulationInput = Depends()):
+    """
+    Run the rule-based simulator and predict summary outcomes using the surrogate model.
+
+    Identical inputs are served from the result cache. Otherwise the
+    simulation runs in the shared process pool, so this request waits
+    without blocking the API worker. Returns 429 when the pool is saturated.
+
+    Returns:
+        - Actual simulation results:
+            - A daily time series of key events (hire, promote, leave) and end-of-day total employees
+            - Summary statistics (e.g. total hires, promotions, etc.)
+        - Surrogate model prediction of the same summary statistics based on input configuration
+    """
+    cache_key = canonical_key(input, namespace="simulate")
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+
+    # Load the surrogate while the simulation runs
+    surrogate_model.warm_up()
+    try:
+        return await simulation_jobs.run(
+            simulate_worker, input, on_result=_response_builder(input, cache_key)
+        )
+    except QueueFullError as exc:
+        raise _queue_full(exc)
+    except RuntimeError as exc:
+        # The job failed (e.g. its worker died) or the pool could not be restarted
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.post("/jobs", response_model=JobResponse, status_code=202)
+async def submit_simulation_job(input: SimulationInput):
+    """
+    Queue a simulation + prediction job and return its id immediately.
+
+    Poll `GET /simulate/jobs/{job_id}` or stream `GET /simulate/jobs/{job_id}/stream`
+    for progress and the final `ModelResponse`. Returns 429 when the queue is full.
+    """
+    cache_key = canonical_key(input, namespace="simulate")
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return _job_response(simulation_jobs.add_completed(cached))
+
+    surrogate_model.warm_up()
+    try:
+        job = simulation_jobs.submit(
+            simulate_worker, input, on_result=_response_builder(input, cache_key)
+        )
+    except QueueFullError as exc:
+        raise _queue_full(exc)
+    except RuntimeError as exc:
+        # The process pool could not be restarted (BrokenProcessPool)
+        raise HTTPException(status_code=500, detail=str(exc))
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_simulation_job(job_id: str):
+    """
+    Poll a simulation job for status, progress (0..1) and, once done, its result.
+    """
+    job = simulation_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return _job_response(job)
+
+
+@router.get("/jobs/{job_id}/stream")
+async def stream_simulation_job(job_id: str, interval: float = 0.5):
+    """
+    Stream job status as NDJSON lines until the job finishes; the last line carries the result.
+    """
+    if simulation_jobs.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+
+    async def lines():
+        while True:
+            job = simulation_jobs.get(job_id)
+            if job is None:
+                return
+            yield json.dumps(_job_response(job).model_dump(mode="json")) + "\n"
+            if job.finished:
+                return
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.post("/predict", response_model=PredictionBatch)
+async def predict_sweep(request: BatchPredictionInput):
+    """
+    Surrogate-only predictions for a sweep of parameter vectors (no simulation is run).
+
+    Up to `batch_size` rows are predicted in one vectorised call and returned
+    as a single `PredictionBatch`. Larger requests are streamed as NDJSON, one
+    `PredictionBatch` per line, so clients can render results as they arrive.
+    Each batch reports its own inference latency. Returns 503 if the
+    surrogate model cannot be loaded.
+    """
+    await _surrogate_ready()
+    inputs = request.inputs
+    size = request.batch_size
+    if len(inputs) <= size:
+        return await _predict_timed(0, 0, inputs)
+
+    async def lines():
+        for batch, offset in enumerate(range(0, len(inputs), size)):
+            result = await _predict_timed(batch, offset, inputs[offset:offset + size])
+            yield json.dumps(result.model_dump(mode="json")) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get("/cache")
+def get_simulation_cache_stats():
+    """
+    Hit/miss counters and size of the /simulate result cache.
+    """
+    return simulation_cache.stats()
@@ -0,0 +1,154 @@
+# simteam/server/cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+from pydantic import BaseModel
+
+# Bump when simulator or response semantics change, to invalidate old entries
+CACHE_VERSION = "2"
+
+
+def canonical_key(payload: BaseModel, namespace: str = "") -> str:
+    """
+    Content hash of a request model: field order and formatting never matter.
+
+    Args:
+        payload (BaseModel): Validated request (defaults already applied).
+        namespace (str): Distinguishes caches for different endpoints.
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    canonical = json.dumps(
+        {"v": CACHE_VERSION, "ns": namespace, "payload": payload.model_dump(mode="json")},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Two-tier, TTL-bounded result cache.
+
+    - Memory tier: LRU of at most `maxsize` entries
+    - Disk tier (optional): one JSON file per key under `disk_dir`, shared by
+      processes and surviving restarts; hits are promoted to memory
+
+    Values must be JSON-serialisable. Hit/miss counters are kept for `stats()`.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 3600.0, disk_dir: Optional[str] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self._entries: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Return the cached value for `key`, or None on a miss or expiry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, value = entry
+                if now - stored_at <= self.ttl:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+        value = self._read_disk(key, now)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+        self._put_memory(key, value, now)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        now = time.time()
+        self._put_memory(key, value, now)
+        self._write_disk(key, value, now)
+
+    def _put_memory(self, key: str, value: Any, stored_at: float) -> None:
+        with self._lock:
+            self._entries[key] = (stored_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _read_disk(self, key: str, now: float) -> Optional[Any]:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except OSError:
+            return None
+        except ValueError:
+            path.unlink(missing_ok=True)  # truncated or not JSON
+            return None
+        try:
+            stored_at, value = entry["stored_at"], entry["value"]
+            expired = now - stored_at > self.ttl
+        except (KeyError, TypeError):
+            path.unlink(missing_ok=True)  # not a cache entry
+            return None
+        if expired:
+            path.unlink(missing_ok=True)
+            return None
+        return value
+
+    def _write_disk(self, key: str, value: Any, stored_at: float) -> None:
+        if self.disk_dir is None:
+            return
+        path = self._disk_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so readers never see a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"stored_at": stored_at, "value": value}, f)
+        os.replace(tmp, path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.disk_hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.disk_hits) / lookups, 3) if lookups else 0.0,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl_seconds": self.ttl,
+            "disk_tier": str(self.disk_dir) if self.disk_dir else None,
+        }
+
+
+# Shared cache for /simulate responses
+simulation_cache = ResultCache(
+    maxsize=int(os.environ.get("SIMTEAM_CACHE_SIZE", 256)),
+    ttl=float(os.environ.get("SIMTEAM_CACHE_TTL", 3600)),
+    disk_dir=os.environ.get("SIMTEAM_CACHE_DIR") or None,
+)
@@ -1,6 +1,6 @@
 # app/db/models.py
 
-from sqlalchemy import Column, String, DateTime, Boolean, Enum, ForeignKey, Integer
+from sqlalchemy import Column, String, DateTime, Boolean, Enum, ForeignKey, Index, Integer
 from sqlalchemy.orm import relationship
 from simteam.server.db.session import Base
 from simteam.core.enums import Role, EventType
@@ -55,8 +55,17 @@ class EventLogORM(Base):
 
     Relationships:
     - employee: Many-to-one link to the EmployeeORM.
+
+    Indexes:
+    - (date, id): date-range filters and keyset pagination in log order
+    - (employee_id, date, id): one employee's history in order, and each
+      employee's latest event as of a date (/v1/org)
     """
     __tablename__ = "event_log"
+    __table_args__ = (
+        Index("ix_event_log_date_id", "date", "id"),
+        Index("ix_event_log_employee_id_date", "employee_id", "date", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True, doc="Primary key")
     date = Column(DateTime, nullable=False, doc="Date the event occurred")
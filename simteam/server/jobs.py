@@ -0,0 +1,233 @@
+# simteam/server/jobs.py
+
+import asyncio
+import inspect
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from enum import Enum
+from multiprocessing import Manager
+from typing import Any, Callable, Dict, Optional
+
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class QueueFullError(Exception):
+    """
+    Raised when a job is submitted while the queue is at capacity.
+    """
+
+
+@dataclass
+class Job:
+    """
+    Book-keeping for one background job.
+    """
+    job_id: str
+    status: JobStatus = JobStatus.QUEUED
+    progress: float = 0.0
+    result: Any = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (JobStatus.DONE, JobStatus.FAILED)
+
+
+class JobQueue:
+    """
+    Runs CPU-bound jobs in a process pool without blocking the event loop.
+
+    - At most `max_workers` jobs run at once; the rest wait in the executor
+    - At most `max_pending` jobs may be queued or running; further submissions
+      raise QueueFullError so the API can shed load with a 429
+    - Workers report progress through a shared dict keyed by job id
+    - Finished jobs are kept for `result_ttl` seconds for polling
+
+    The executor and progress manager are created lazily on first submit, so
+    importing this module costs nothing. A pool broken by a dying worker
+    (e.g. OOM-killed) fails the jobs it held and is replaced on the next submit.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, result_ttl: float = 600.0):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.jobs: Dict[str, Job] = {}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager = None
+        self._progress = None
+
+    @property
+    def pending_count(self) -> int:
+        return sum(1 for job in self.jobs.values() if not job.finished)
+
+    def _ensure_started(self) -> None:
+        if self._manager is None:
+            self._manager = Manager()
+            self._progress = self._manager.dict()
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _discard_executor(self, executor: ProcessPoolExecutor) -> None:
+        # Drop a broken pool so the next submit starts a fresh one
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _evict_expired(self) -> None:
+        cutoff = time.time() - self.result_ttl
+        expired = [
+            job_id for job_id, job in self.jobs.items()
+            if job.finished and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self.jobs[job_id]
+
+    def submit(
+        self,
+        fn: Callable,
+        *args,
+        on_result: Optional[Callable[[Any], Any]] = None,
+    ) -> Job:
+        """
+        Schedule `fn(progress, job_id, *args)` in the process pool.
+
+        Must be called from a running event loop. `fn` must be a picklable,
+        module-level function; it may write a 0..1 fraction to `progress[job_id]`.
+
+        Args:
+            fn (Callable): Worker function.
+            *args: Extra picklable arguments for `fn`.
+            on_result (Callable, optional): Post-processing applied to the worker's
+                return value in the API process (e.g. surrogate prediction); may
+                be a coroutine function.
+
+        Returns:
+            Job: The queued job.
+
+        Raises:
+            QueueFullError: If `max_pending` jobs are already queued or running.
+            BrokenProcessPool: If a fresh pool also fails to accept the job.
+        """
+        self._evict_expired()
+        if self.pending_count >= self.max_pending:
+            raise QueueFullError(f"{self.pending_count} jobs pending (limit {self.max_pending})")
+
+        job_id = uuid.uuid4().hex
+        loop = asyncio.get_running_loop()
+        # The job is registered only once the pool has accepted it. A pool that
+        # broke since the last job is replaced and the submission retried once.
+        for attempt in range(2):
+            self._ensure_started()
+            executor = self._executor
+            try:
+                future = loop.run_in_executor(executor, fn, self._progress, job_id, *args)
+                break
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                if attempt:
+                    raise
+
+        job = Job(job_id=job_id)
+        self.jobs[job_id] = job
+        asyncio.ensure_future(self._track(job, future, executor, on_result))
+        return job
+
+    async def _track(self, job: Job, future, executor: ProcessPoolExecutor, on_result) -> None:
+        try:
+            try:
+                result = await future
+            except BrokenProcessPool:
+                self._discard_executor(executor)
+                raise
+            if on_result is not None:
+                result = on_result(result)
+                if inspect.isawaitable(result):
+                    result = await result
+            job.result = result
+            job.status = JobStatus.DONE
+            job.progress = 1.0
+        except Exception as exc:
+            job.status = JobStatus.FAILED
+            job.error = f"{type(exc).__name__}: {exc}"
+        finally:
+            job.finished_at = time.time()
+            job.done.set()
+            try:
+                if self._progress is not None:
+                    self._progress.pop(job.job_id, None)
+            except (ConnectionError, EOFError):
+                pass  # progress manager already shut down
+
+    async def run(self, fn: Callable, *args, on_result: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Submit a job and wait for it (subject to the same back-pressure).
+
+        Raises:
+            QueueFullError: If the queue is at capacity.
+            RuntimeError: If the job failed.
+        """
+        job = self.submit(fn, *args, on_result=on_result)
+        await job.done.wait()
+        self.jobs.pop(job.job_id, None)
+        if job.status == JobStatus.FAILED:
+            raise RuntimeError(job.error)
+        return job.result
+
+    def add_completed(self, result: Any) -> Job:
+        """
+        Register a job whose result is already known (e.g. served from a cache).
+        """
+        self._evict_expired()
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            status=JobStatus.DONE,
+            progress=1.0,
+            result=result,
+            finished_at=time.time(),
+        )
+        job.done.set()
+        self.jobs[job.job_id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Look up a job, refreshing its progress from the workers.
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+        progress = self._progress.get(job_id) if self._progress is not None else None
+        if progress is not None:
+            job.status = JobStatus.RUNNING
+            job.progress = progress
+        return job
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self._manager is not None:
+            self._manager.shutdown()
+            self._manager = None
+            self._progress = None
+
+
+# Shared queue for simulation jobs; sized for a small Cloud Run instance by default
+simulation_jobs = JobQueue(
+    max_workers=int(os.environ.get("SIMTEAM_SIM_WORKERS", os.cpu_count() or 1)),
+    max_pending=int(os.environ.get("SIMTEAM_MAX_PENDING_JOBS", 4 * (os.cpu_count() or 1))),
+    result_ttl=float(os.environ.get("SIMTEAM_JOB_RESULT_TTL", 600)),
+)
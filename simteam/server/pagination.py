@@ -0,0 +1,171 @@
+# simteam/server/pagination.py
+
+import base64
+import csv
+import hashlib
+import io
+import json
+import zlib
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+from fastapi import HTTPException, Request
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+# Page sizes for JSON responses, and rows fetched per query when streaming
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10_000
+STREAM_CHUNK_SIZE = 5000
+
+# Response header carrying the cursor of the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class OutputFormat(str, Enum):
+    JSON = "json"      # one page, next cursor in the X-Next-Cursor header
+    NDJSON = "ndjson"  # every matching row, one JSON object per line
+    CSV = "csv"        # every matching row, with a header line
+
+
+MEDIA_TYPES = {
+    OutputFormat.NDJSON: "application/x-ndjson",
+    OutputFormat.CSV: "text/csv",
+}
+
+
+def encode_cursor(*key: Any) -> str:
+    """
+    Opaque, URL-safe cursor for a keyset position (e.g. the last row's sort key).
+    """
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(",", ":")).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> list:
+    """
+    Inverse of `encode_cursor` (datetimes come back as ISO strings).
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Weak ETag from values that change whenever the representation does.
+    """
+    digest = hashlib.sha1(":".join(map(str, parts)).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Optional[Response]:
+    """
+    A 304 response if the client's `If-None-Match` already names `etag`, else None.
+    """
+    tags = [tag.strip() for tag in request.headers.get("if-none-match", "").split(",")]
+    if etag in tags or "*" in tags:
+        return Response(status_code=304, headers={"ETag": etag})
+    return None
+
+
+def _plain(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def row_dicts(rows: Iterable[Sequence], columns: List[str]) -> List[dict]:
+    """
+    Convert result rows to JSON-ready dicts (enums by value, datetimes as ISO strings).
+    """
+    return [{col: _plain(value) for col, value in zip(columns, row)} for row in rows]
+
+
+def json_page(items: List[dict], next_cursor: Optional[str], etag: Optional[str] = None) -> JSONResponse:
+    """
+    A page of rows as a JSON list; the next page's cursor goes in a header
+    so the body keeps the shape of the unpaginated endpoint.
+    """
+    headers = {NEXT_CURSOR_HEADER: next_cursor} if next_cursor else {}
+    if etag:
+        headers["ETag"] = etag
+    return JSONResponse(content=items, headers=headers)
+
+
+def _lines(chunks: Iterator[List[dict]], fmt: OutputFormat, columns: List[str]) -> Iterator[bytes]:
+    if fmt == OutputFormat.CSV:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        writer.writerow(columns)
+        for chunk in chunks:
+            writer.writerows([row[col] for col in columns] for row in chunk)
+            yield buf.getvalue().encode()
+            buf.seek(0)
+            buf.truncate()
+        if buf.tell():
+            yield buf.getvalue().encode()
+    else:
+        for chunk in chunks:
+            yield "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in chunk).encode()
+
+
+def _gzip(body: Iterator[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # gzip container
+    for data in body:
+        compressed = compressor.compress(data)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def stream_rows(
+    request: Request,
+    fetch: Callable[[Optional[list], int], List[dict]],
+    sort_key: Callable[[dict], tuple],
+    fmt: OutputFormat,
+    columns: List[str],
+    after: Optional[list] = None,
+    etag: Optional[str] = None,
+) -> StreamingResponse:
+    """
+    Stream every matching row as NDJSON or CSV, one keyset query per chunk.
+
+    Only one chunk of rows is held at a time, and each chunk is a short
+    indexed query, so no transaction stays open for the whole download.
+    The body is gzip-compressed when the client accepts it.
+
+    Args:
+        request (Request): Used to negotiate gzip via Accept-Encoding.
+        fetch (Callable): `fetch(after_key, limit)` returns the next rows as dicts.
+        sort_key (Callable): Keyset position of a row, passed back to `fetch`.
+        fmt (OutputFormat): NDJSON or CSV.
+        columns (List[str]): Column order for CSV output.
+        after (list, optional): Keyset position to resume from.
+        etag (str, optional): Validator sent as the `ETag` header.
+    """
+    def chunks() -> Iterator[List[dict]]:
+        position = after
+        while True:
+            rows = fetch(position, STREAM_CHUNK_SIZE)
+            if rows:
+                yield rows
+            if len(rows) < STREAM_CHUNK_SIZE:
+                return
+            position = list(sort_key(rows[-1]))
+
+    body = _lines(chunks(), fmt, columns)
+    headers = {"ETag": etag} if etag else {}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body = _gzip(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=MEDIA_TYPES[fmt], headers=headers)
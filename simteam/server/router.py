@@ -1,5 +1,7 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse
 from fastapi.openapi.docs import (
     get_swagger_ui_html,
     get_swagger_ui_oauth2_redirect_html,
@@ -8,10 +10,22 @@ from fastapi.openapi.utils import get_openapi
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 
-from simteam.server.api.v1 import employees, eventlog, simulate
+from simteam.server.api.v1 import employees, eventlog, org, simulate
+from simteam.server.jobs import simulation_jobs
+from simteam.server.surrogate import SURROGATE_WARMUP, surrogate_model
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the surrogate in the background so startup (and /docs, /v1/employees, ...) never waits for it
+    if SURROGATE_WARMUP:
+        surrogate_model.warm_up()
+    yield
+    # Stop simulation workers with the app
+    simulation_jobs.shutdown()
 
 # Create FastAPI app with custom docs path
 app = FastAPI(
+    lifespan=lifespan,
     root_path="/api",
     docs_url=None,
     redoc_url=None,
@@ -48,8 +62,15 @@ app.add_middleware(
 # Register versioned API routers
 app.include_router(employees.router, prefix="/v1")
 app.include_router(eventlog.router, prefix="/v1")
+app.include_router(org.router, prefix="/v1")
 app.include_router(simulate.router, prefix="/v1")
 
+# Readiness probe: 200 once the surrogate model is loaded, 503 while loading or after a failure
+@app.get("/ready", include_in_schema=False)
+async def readiness():
+    status = surrogate_model.status()
+    return JSONResponse(status_code=200 if surrogate_model.ready else 503, content=status)
+
 # Custom Swagger UI with CDN + local custom.css
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
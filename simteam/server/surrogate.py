@@ -0,0 +1,132 @@
+# simteam/server/surrogate.py
+
+import asyncio
+import os
+import threading
+import time
+from enum import Enum
+from typing import Any, Optional
+
+from automl.models.compiled import COMPILED_MODEL_PATH
+
+
+class SurrogateState(str, Enum):
+    COLD = "cold"
+    LOADING = "loading"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class LazySurrogate:
+    """
+    Loads the surrogate model on first use instead of at import.
+
+    `automl.surrogate_trainer` pulls in FLAML, XGBoost, sklearn and pandas, and
+    `load()` deserialises the fitted pipeline. Deferring both keeps them off
+    the API's import path, so processes that never predict never pay for them.
+
+    If a compiled artefact exists at `compiled_path` (see
+    `SurrogateTrainer.export_compiled`) it is used instead of the pipeline:
+    it loads without FLAML and predicts all targets in one pass.
+
+    - `get()` loads synchronously (at most once, thread-safe)
+    - `warm_up()` starts the load in a background thread and returns immediately
+    - `status()` reports the state for the readiness probe
+    """
+
+    def __init__(self, model_path: Optional[str] = None, compiled_path: Optional[str] = COMPILED_MODEL_PATH):
+        self.model_path = model_path
+        self.compiled_path = compiled_path
+        self.backend: Optional[str] = None
+        self.state = SurrogateState.COLD
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._trainer: Any = None
+        self._lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return self.state == SurrogateState.READY
+
+    def get(self) -> Any:
+        """
+        Return the loaded model (`CompiledSurrogate` or `SurrogateTrainer`), loading it first if needed.
+
+        Raises:
+            RuntimeError: If loading failed (the error is kept for `status()`).
+        """
+        if self._trainer is not None:
+            return self._trainer
+        with self._lock:
+            if self._trainer is None:
+                self._load()
+        return self._trainer
+
+    def _load(self) -> None:
+        self.state = SurrogateState.LOADING
+        started = time.perf_counter()
+        try:
+            if self.compiled_path and os.path.exists(self.compiled_path):
+                from automl.models.compiled import CompiledSurrogate
+
+                trainer = CompiledSurrogate.load(self.compiled_path)
+                self.backend = "compiled"
+            else:
+                from automl.surrogate_trainer import SurrogateTrainer
+
+                trainer = SurrogateTrainer(model_path=self.model_path) if self.model_path else SurrogateTrainer()
+                trainer.load()
+                self.backend = "pipeline"
+        except Exception as exc:
+            self.state = SurrogateState.FAILED
+            self.error = f"{type(exc).__name__}: {exc}"
+            raise RuntimeError(f"Surrogate model failed to load: {self.error}") from exc
+        self.load_seconds = round(time.perf_counter() - started, 3)
+        self._trainer = trainer
+        self.error = None
+        self.state = SurrogateState.READY
+
+    def predict(self, X):
+        return self.get().predict(X)
+
+    def warm_up(self) -> Optional[threading.Thread]:
+        """
+        Start loading in a daemon thread if the model is still cold.
+
+        Returns:
+            threading.Thread | None: The loader thread, or None if nothing was started.
+        """
+        if self.state != SurrogateState.COLD:
+            return None
+        self.state = SurrogateState.LOADING
+        thread = threading.Thread(target=self._warm_up, name="surrogate-warm-up", daemon=True)
+        thread.start()
+        return thread
+
+    def _warm_up(self) -> None:
+        try:
+            self.get()
+        except RuntimeError:
+            pass  # recorded in `error`; surfaced by the readiness probe
+
+    async def wait_ready(self) -> Any:
+        """
+        Await the model without blocking the event loop.
+        """
+        return await asyncio.to_thread(self.get)
+
+    def status(self) -> dict:
+        return {
+            "state": self.state,
+            "backend": self.backend,
+            "load_seconds": self.load_seconds,
+            "error": self.error,
+        }
+
+
+# Shared surrogate for the API; warmed up at startup unless SIMTEAM_SURROGATE_WARMUP=0
+surrogate_model = LazySurrogate(
+    model_path=os.environ.get("SIMTEAM_SURROGATE_PATH") or None,
+    compiled_path=os.environ.get("SIMTEAM_SURROGATE_COMPILED_PATH", COMPILED_MODEL_PATH),
+)
+SURROGATE_WARMUP = os.environ.get("SIMTEAM_SURROGATE_WARMUP", "1") != "0"
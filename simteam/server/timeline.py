@@ -0,0 +1,83 @@
+# simteam/server/timeline.py
+
+import os
+import threading
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from simteam.core.models.eventlog import EventLogStore
+from simteam.core.models.timeline import DEFAULT_SNAPSHOT_INTERVAL_DAYS, OrgTimeline
+from simteam.server.db.models import EventLogORM
+
+# Rows fetched per round trip while loading the event log
+LOAD_CHUNK_SIZE = 10_000
+
+LOG_COLUMNS = (
+    EventLogORM.date,
+    EventLogORM.event_type,
+    EventLogORM.employee_id,
+    EventLogORM.role,
+    EventLogORM.manager_id,
+    EventLogORM.department,
+    EventLogORM.team,
+)
+
+
+class DatabaseTimeline:
+    """
+    An `OrgTimeline` over the event_log table, held in the API process.
+
+    The table is read once into a columnar `EventLogStore`, in (date, id)
+    order. Later calls check the row count and highest id: when rows were
+    only added, just those rows are fetched and the timeline extends its
+    snapshots; any other change (e.g. deletions) reloads the table.
+    """
+
+    def __init__(self, interval_days: int = DEFAULT_SNAPSHOT_INTERVAL_DAYS):
+        self.interval_days = interval_days
+        self.timeline: Optional[OrgTimeline] = None
+        self._count = 0
+        self._max_id: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def get(self, db: Session) -> OrgTimeline:
+        """
+        The timeline, brought up to date with the table.
+        """
+        count, max_id = db.execute(select(func.count(EventLogORM.id), func.max(EventLogORM.id))).one()
+        with self._lock:
+            if self.timeline is None or count < self._count:
+                self._load(db, after_id=None)
+            elif (count, max_id) != (self._count, self._max_id):
+                added = self._load(db, after_id=self._max_id)
+                if self._count + added != count:
+                    self._load(db, after_id=None)
+            self._count, self._max_id = count, max_id
+            return self.timeline
+
+    def _load(self, db: Session, after_id: Optional[int]) -> int:
+        # Append rows with id > `after_id` to the store, or reload all rows if None
+        if after_id is None:
+            self.timeline = OrgTimeline(EventLogStore(), self.interval_days)
+            self._count = 0
+            query = select(*LOG_COLUMNS)
+        else:
+            query = select(*LOG_COLUMNS).where(EventLogORM.id > after_id)
+
+        store = self.timeline.log
+        added = 0
+        rows = db.execute(
+            query.order_by(EventLogORM.date, EventLogORM.id).execution_options(yield_per=LOAD_CHUNK_SIZE)
+        )
+        for date, event_type, employee_id, role, manager_id, department, team in rows:
+            store.record(date, event_type, employee_id, role, manager_id, department, team)
+            added += 1
+        return added
+
+
+# Shared timeline for /v1/org
+org_timeline = DatabaseTimeline(
+    interval_days=int(os.environ.get("SIMTEAM_ORG_SNAPSHOT_DAYS", DEFAULT_SNAPSHOT_INTERVAL_DAYS)),
+)
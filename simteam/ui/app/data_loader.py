@@ -1,16 +1,26 @@
 # app/data_loader.py
 
 import json
+import os
+import threading
+import time
+from typing import Optional, Tuple
+
 import pandas as pd
 import requests
 import streamlit as st
 from urllib.parse import urlparse, urljoin
 
+from app.org_builder import OrgIndex
+
 API_ENDPOINT = "/api/v1/eventlog/"
 TEMP_API_ENDPOINT = "/api/v1/employees/temp/"
 LOCAL_FILE = "res_output.json"
 LOCAL_TEMP_FILE = "res_temp_output.json"
 
+# Seconds a cached event log / TEMP list is used before revalidating with the API
+EVENT_LOG_TTL = 300
+
 def get_base_url() -> str:
     
     host = urlparse(st.context.url).hostname
@@ -20,21 +30,79 @@ def get_base_url() -> str:
         base_url = "https://simteam-backend-fastapi-299036431019.asia-northeast1.run.app"
     return base_url
 
-def load_event_log() -> pd.DataFrame:
+class EventLogCache:
     """
-    Load event log from API or fallback to local file.
+    Process-wide copy of the API event log, revalidated at most every `ttl` seconds.
+
+    Within the TTL reruns reuse the cached frame without any request. After
+    it, a conditional request (`If-None-Match`) is sent and a 304 keeps the
+    frame, so the log is only downloaded again when it actually changed.
     """
+
+    def __init__(self, ttl: float = EVENT_LOG_TTL):
+        self.ttl = ttl
+        self.frame: Optional[pd.DataFrame] = None
+        self.etag: Optional[str] = None
+        self.checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, api_url: str) -> Tuple[pd.DataFrame, str]:
+        """
+        Returns:
+            (frame, version): The event log and a version string that changes with it.
+        """
+        with self._lock:
+            if self.frame is None or time.monotonic() - self.checked_at >= self.ttl:
+                self._revalidate(api_url)
+            return self.frame, self.etag or str(id(self.frame))
+
+    def _revalidate(self, api_url: str) -> None:
+        headers = {"If-None-Match": self.etag} if self.frame is not None and self.etag else {}
+        # Streamed (gzip) NDJSON returns every event; plain JSON is paginated
+        with requests.get(api_url, params={"format": "ndjson"}, headers=headers, stream=True, timeout=10) as response:
+            if response.status_code != 304:
+                response.raise_for_status()
+                self.frame = _parse_dates(pd.DataFrame([json.loads(line) for line in response.iter_lines() if line]))
+                self.etag = response.headers.get("ETag")
+        self.checked_at = time.monotonic()
+
+
+@st.cache_resource
+def _event_log_cache() -> EventLogCache:
+    return EventLogCache()
+
+
+def _parse_dates(df: pd.DataFrame) -> pd.DataFrame:
+    if "date" in df:
+        df["date"] = pd.to_datetime(df["date"])
+    return df
+
+
+# cache_resource rather than cache_data: hits return the shared frame instead of a copy
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _read_local_event_log(path: str, mtime: float) -> pd.DataFrame:
+    with open(path, "r") as f:
+        return _parse_dates(pd.DataFrame(json.load(f)))
+
+
+def _load_event_log() -> Tuple[pd.DataFrame, str]:
     base_url = get_base_url()
-    api_url = urljoin(base_url, API_ENDPOINT)
-    
     if 'localhost' not in base_url:
-        response = requests.get(api_url, timeout=10)
-        response.raise_for_status()
-        return pd.DataFrame(response.json())
-    else:
-        with open(LOCAL_FILE, "r") as f:
-            return pd.DataFrame(json.load(f))
+        return _event_log_cache().get(urljoin(base_url, API_ENDPOINT))
+    mtime = os.path.getmtime(LOCAL_FILE)
+    return _read_local_event_log(LOCAL_FILE, mtime), f"{LOCAL_FILE}@{mtime}"
+
+
+def load_event_log() -> pd.DataFrame:
+    """
+    Load event log from API or fallback to local file.
 
+    The frame is cached and shared between reruns (treat it as read-only);
+    `date` is already parsed.
+    """
+    return _load_event_log()[0]
+
+@st.cache_data(ttl=EVENT_LOG_TTL, show_spinner=False)
 def load_temps() -> dict:
     """
     Load list of TEMPs from API or fallback to local file.
@@ -49,3 +117,18 @@ def load_temps() -> dict:
     else:
         with open(LOCAL_TEMP_FILE, "r") as f:
             return {i['emp_id']: i['manager_id'] for i in json.load(f)}
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _org_index(version: str, temps_key: tuple, _df: pd.DataFrame, _temp_list: dict) -> OrgIndex:
+    # Keyed on the log version and TEMP list only; the frame itself is not hashed
+    return OrgIndex(_df, _temp_list)
+
+
+def load_org_index() -> OrgIndex:
+    """
+    The per-date org index for the current event log, built once per log version.
+    """
+    df, version = _load_event_log()
+    temp_list = load_temps()
+    return _org_index(version, tuple(sorted(temp_list.items(), key=str)), df, temp_list)
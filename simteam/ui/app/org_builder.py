@@ -1,41 +1,315 @@
+import uuid
+from bisect import bisect_right
+from collections import Counter
+from datetime import date
+
 import pandas as pd
 from typing import List, Dict, Optional, Tuple
 
-def build_org_structure(df: pd.DataFrame, temp_list: Dict, date: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
-       
-    df["date"] = pd.to_datetime(df["date"])
-    if date:
-        df = df[df["date"] <= pd.to_datetime(date)]
+AVATAR_URL_PREFIX = "https://bumbeishvili.github.io/avatars/avatars/portrait"
 
-    latest = df.sort_index(ascending=False).drop_duplicates("employee_id", keep='first')
+# Avatar shown for TEMP placeholders (vacant positions)
+TEMP_AVATAR_ID = 130
+
+NODE_COLUMNS = ["employee_id", "event_type", "role", "manager_id"]
+
+# Org chart moves of up to this many days with events are sent as deltas;
+# longer jumps get a keyframe (every node) instead
+KEYFRAME_INTERVAL = 30
+
+
+def _fake_img(id): return f"{AVATAR_URL_PREFIX}{id}.png"
+
+
+def _active_nodes(latest: pd.DataFrame) -> List[Dict]:
+    """
+    Org chart nodes for the rows of `latest` (one latest event per employee) that are not leavers.
+
+    All fields are built as whole columns and converted to dicts once.
+    """
     active = latest[latest["event_type"] != "left"]
+    ids = active["employee_id"]
+    # TEMP ids fall back to the TEMP avatar
+    avatar_ids = (
+        ids.str.replace("EMP", "", regex=False)
+        .str.replace("TEMP", str(TEMP_AVATAR_ID), regex=False)
+        .astype(int)
+        .astype(str)
+    )
+    nodes = pd.DataFrame({
+        "id": ids,
+        "parentId": active["manager_id"],
+        "name": ids,
+        "positionName": active["role"],
+        "imageUrl": AVATAR_URL_PREFIX + avatar_ids + ".png",
+    })
+    return nodes.to_dict("records")
 
-    def fake_img(id): return f"https://bumbeishvili.github.io/avatars/avatars/portrait{id}.png"
 
-    # Build base list
-    actives = [
-        {
-            "id": row["employee_id"],
-            "parentId": row["manager_id"],
-            "name": row["employee_id"],
-            "positionName": row["role"],
-            "imageUrl": fake_img(int(row["employee_id"].replace("EMP", "").replace("TEMP", "130"))),  # TEMPs as 100 fallback
-        }
-        for _, row in active.iterrows()
-    ]
+def _is_temp(manager_id) -> bool:
+    return isinstance(manager_id, str) and manager_id.startswith("TEMP")
 
-    # Add TEMP managers if any are referenced in parentId
-    temp_ids = { row["manager_id"]
-        for _, row in active.iterrows()
-        if isinstance(row["manager_id"], str) and row["manager_id"].startswith("TEMP")
+
+def _temp_node(temp_id: str, temp_list: Dict) -> Dict:
+    return {
+        "id": temp_id,
+        "parentId": temp_list.get(temp_id),
+        "name": "NEED TO FILL",
+        "positionName": "Empty position",
+        "imageUrl": _fake_img(TEMP_AVATAR_ID),
     }
-    
-    temps = [
-        {"id": temp_id,
-         "parentId": temp_list[temp_id],
-         "name": "NEED TO FILL",
-         "positionName": "Empty position",
-         "imageUrl": fake_img(130),
-         } for temp_id in temp_ids]
+
+
+def _patch(old: Dict, new: Dict) -> Dict:
+    """
+    The fields of `new` that differ from `old` (e.g. `parentId` on a
+    re-parent, `positionName` on a promotion), plus its id.
+    """
+    patch = {key: value for key, value in new.items() if old.get(key) != value}
+    patch["id"] = new["id"]
+    return patch
+
+
+def _compose(diffs: List[Dict[str, list]]) -> Dict[str, list]:
+    """
+    Fold consecutive `OrgState.apply` diffs into one net diff.
+
+    Nodes added and removed within the span cancel out, and successive
+    patches to a node are merged, so the result is no larger than the
+    changes between its first and last state.
+    """
+    added: Dict[str, Dict] = {}
+    updated: Dict[str, Dict] = {}
+    removed: Dict[str, None] = {}
+
+    for diff in diffs:
+        for node_id in diff["removed"]:
+            if node_id in added:
+                del added[node_id]
+            else:
+                updated.pop(node_id, None)
+                removed[node_id] = None
+        for patch in diff["updated"]:
+            node_id = patch["id"]
+            if node_id in added:
+                added[node_id] = {**added[node_id], **patch}
+            else:
+                updated[node_id] = {**updated.get(node_id, {}), **patch}
+        for node in diff["added"]:
+            if node["id"] in removed:
+                # Removed and re-created: replace every field of the old node
+                del removed[node["id"]]
+                updated[node["id"]] = dict(node)
+            else:
+                added[node["id"]] = node
+
+    return {"added": list(added.values()), "updated": list(updated.values()), "removed": list(removed)}
+
+
+def build_org_structure(df: pd.DataFrame, temp_list: Dict, date: Optional[str] = None) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Reconstruct the org chart as of `date` from the full event log.
+
+    Args:
+        df (pd.DataFrame): Event log in log order (not modified).
+        temp_list (Dict): TEMP placeholder id -> its manager id.
+        date (str, optional): Last day to include (defaults to the whole log).
+
+    Returns:
+        (actives, temps): Nodes for active employees, latest event first,
+        and for the TEMP placeholders they report to.
+    """
+    if date:
+        df = df[pd.to_datetime(df["date"]) <= pd.to_datetime(date)]
+
+    latest = df.sort_index(ascending=False).drop_duplicates("employee_id", keep='first')
+    actives = _active_nodes(latest)
+
+    # Add TEMP managers if any are referenced in parentId
+    manager_ids = pd.unique(latest.loc[latest["event_type"] != "left", "manager_id"].dropna())
+    temp_ids = {m for m in manager_ids if _is_temp(m)}
+    temps = [_temp_node(temp_id, temp_list) for temp_id in sorted(temp_ids)]
 
     return (actives, temps)
+
+
+class OrgState:
+    """
+    An org chart that is advanced one day of events at a time.
+
+    `apply` updates only the employees in that day's events and returns the
+    diff, so stepping forward costs O(events today) rather than a rebuild
+    from the whole log. `nodes()` gives the same lists as `build_org_structure`.
+    """
+
+    def __init__(self, temp_list: Dict):
+        self.temp_list = temp_list
+        # Active nodes by id, kept in log order of each employee's latest event
+        self.actives: Dict[str, Dict] = {}
+        self.temps: Dict[str, Dict] = {}
+        self._temp_refs: Counter = Counter()
+
+    def apply(self, events: pd.DataFrame) -> Dict[str, list]:
+        """
+        Advance the org by one day's events (in log order).
+
+        Returns:
+            Dict[str, list]: `added` nodes, `updated` patches (the changed
+            fields of a node, with its id) and `removed` node ids, TEMP
+            placeholders included, relative to the previous state.
+        """
+        diff = {"added": [], "updated": [], "removed": []}
+        if events.empty:
+            return diff
+
+        latest = events.drop_duplicates("employee_id", keep="last")
+        nodes = {node["id"]: node for node in _active_nodes(latest)}
+
+        for emp_id in latest["employee_id"].tolist():
+            old = self.actives.pop(emp_id, None)
+            new = nodes.get(emp_id)
+            if old is not None:
+                self._unref(old["parentId"], diff)
+            if new is not None:
+                self.actives[emp_id] = new  # re-inserted: now the most recent
+                self._ref(new["parentId"], diff)
+            if old is None and new is not None:
+                diff["added"].append(new)
+            elif old is not None and new is None:
+                diff["removed"].append(emp_id)
+            elif new is not None and new != old:
+                diff["updated"].append(_patch(old, new))
+
+        # A placeholder dropped and re-referenced on the same day is unchanged
+        readded = set(diff["removed"]) & {node["id"] for node in diff["added"]}
+        if readded:
+            diff["removed"] = [i for i in diff["removed"] if i not in readded]
+            diff["added"] = [n for n in diff["added"] if n["id"] not in readded]
+        return diff
+
+    def _ref(self, manager_id: Optional[str], diff: Dict[str, list]) -> None:
+        if not _is_temp(manager_id):
+            return
+        self._temp_refs[manager_id] += 1
+        if manager_id not in self.temps:
+            self.temps[manager_id] = _temp_node(manager_id, self.temp_list)
+            diff["added"].append(self.temps[manager_id])
+
+    def _unref(self, manager_id: Optional[str], diff: Dict[str, list]) -> None:
+        if not _is_temp(manager_id):
+            return
+        self._temp_refs[manager_id] -= 1
+        if not self._temp_refs[manager_id]:
+            del self._temp_refs[manager_id]
+            del self.temps[manager_id]
+            diff["removed"].append(manager_id)
+
+    def nodes(self) -> Tuple[List[Dict], List[Dict]]:
+        """
+        The current `(actives, temps)`, ordered as `build_org_structure` orders them.
+        """
+        return list(reversed(self.actives.values())), [self.temps[t] for t in sorted(self.temps)]
+
+
+class OrgIndex:
+    """
+    Org chart states and events per day, precomputed in one pass over the event log.
+
+    Each day with events stores its end-of-day `(actives, temps)` nodes (as
+    `build_org_structure` would return them), its events and its diff from
+    the previous day, so changing the selected date is a lookup: no
+    filtering, sorting or rebuilding.
+
+    `frame` turns these into the org chart component's update protocol: a
+    keyframe with every node, or a delta from the day the chart already shows.
+    """
+
+    def __init__(self, df: pd.DataFrame, temp_list: Dict):
+        df = df.assign(date=pd.to_datetime(df["date"]))
+        days = df["date"].dt.date
+
+        self.min_date = days.min() if len(df) else None
+        self.max_date = days.max() if len(df) else None
+        self._empty_day = df.iloc[:0]
+        self._events = {day: frame for day, frame in df.groupby(days, sort=True)}
+        self.dates = list(self._events)
+        self._orgs = []
+        self._diffs = []
+        # Distinguishes this index's frame versions from those of an older log
+        self._token = uuid.uuid4().hex[:12]
+
+        state = OrgState(temp_list)
+        for day in self.dates:
+            self._diffs.append(state.apply(self._events[day][NODE_COLUMNS]))
+            self._orgs.append(state.nodes())
+
+    def _position(self, day: date) -> int:
+        # Index of the last day with events on or before `day` (-1 if none)
+        return bisect_right(self.dates, day) - 1
+
+    def org_at(self, day: date) -> Tuple[List[Dict], List[Dict]]:
+        """
+        The `(actives, temps)` nodes at the end of `day`.
+        """
+        pos = self._position(day)
+        return self._orgs[pos] if pos >= 0 else ([], [])
+
+    def events_on(self, day: date) -> pd.DataFrame:
+        """
+        The events logged on `day` (an empty frame if none).
+        """
+        return self._events.get(day, self._empty_day)
+
+    def _version(self, pos: int) -> str:
+        return f"{self._token}:{pos}"
+
+    def _base_position(self, base: Optional[str]) -> Optional[int]:
+        # Position of a version produced by this index, else None
+        token, _, pos = (base or "").partition(":")
+        if token != self._token or not pos.lstrip("-").isdigit():
+            return None
+        return int(pos)
+
+    def frame(self, day: date, base: Optional[str] = None) -> Dict:
+        """
+        The org chart update that takes a chart showing version `base` to `day`.
+
+        A delta carries the nodes added, the changed fields of existing nodes
+        (re-parented, re-titled) and the ids removed, folded over the days in
+        between; stepping back uses the inverse of the same diffs. A keyframe
+        carrying every node is sent instead when there is no usable base or
+        `day` is more than `KEYFRAME_INTERVAL` event days away from it.
+
+        Args:
+            day (date): Day to show.
+            base (str, optional): `version` of the frame the chart last applied.
+
+        Returns:
+            Dict: `{"type": "keyframe", "version", "nodes"}` or
+            `{"type": "delta", "base", "version", "added", "updated", "removed"}`.
+        """
+        pos = self._position(day)
+        start = self._base_position(base)
+
+        if start is None or abs(pos - start) > KEYFRAME_INTERVAL:
+            actives, temps = self.org_at(day)
+            return {"type": "keyframe", "version": self._version(pos), "nodes": actives + temps}
+
+        if start <= pos:
+            delta = _compose(self._diffs[start + 1:pos + 1])
+        else:
+            delta = self._invert(_compose(self._diffs[pos + 1:start + 1]), day)
+        return {"type": "delta", "base": base, "version": self._version(pos), **delta}
+
+    def _invert(self, diff: Dict[str, list], day: date) -> Dict[str, list]:
+        # Undo a net diff that ends after `day`, restoring nodes as of `day`
+        actives, temps = self.org_at(day)
+        nodes = {node["id"]: node for node in actives + temps}
+        return {
+            "added": [nodes[node_id] for node_id in diff["removed"]],
+            "updated": [
+                {key: nodes[patch["id"]][key] for key in patch}
+                for patch in diff["updated"]
+            ],
+            "removed": [node["id"] for node in diff["added"]],
+        }
@@ -1,3 +1,3 @@
-/*! For license information please see main.d3830726.js.LICENSE.txt */
-(()=>{"use strict";var e={43:(e,t,n)=>{e.exports=n(202)},82:(e,t)=>{var n="function"===typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,a=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,f=n?Symbol.for("react.concurrent_mode"):60111,d=n?Symbol.for("react.forward_ref"):60112,h=n?Symbol.for("react.suspense"):60113,p=n?Symbol.for("react.suspense_list"):60120,y=n?Symbol.for("react.memo"):60115,m=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,v=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,w=n?Symbol.for("react.scope"):60119;function x(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case f:case o:case l:case a:case h:return e;default:switch(e=e&&e.$$typeof){case u:case d:case m:case y:case s:return e;default:return t}}case i:return t}}}function S(e){return x(e)===f}t.AsyncMode=c,t.ConcurrentMode=f,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=d,t.Fragment=o,t.Lazy=m,t.Memo=y,t.Portal=i,t.Profiler=l,t.StrictMode=a,t.Suspense=h,t.isAsyncMode=function(e){return S(e)||x(e)===c},t.isConcurrentMode=S,t.isContextConsumer=function(e){return x(e)===u},t.isContextProvider=function(e){return x(e)===s},t.isElement=function(e){return"object"===typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return x(e)===d},t.isFragment=function(e){return x(e)===o},t.isLazy=function(e){return x(e)===m},t.isMemo=function(e){return x(e)===y},t.isPortal=function(e){return x(e)===i},t.isProfiler=function(e){return x(e)===l},t.isStrictMode=function(e){return x(e)===a},t.isSuspense=function(e){return x(e)===h},t.isValidElementType=function(e){return"string"===typeof e||"function"===typeof e||e===o||e===f||e===l||e===a||e===h||e===p||"object"===typeof e&&null!==e&&(e.$$typeof===m||e.$$typeof===y||e.$$typeof===s||e.$$typeof===u||e.$$typeof===d||e.$$typeof===v||e.$$typeof===b||e.$$typeof===w||e.$$typeof===g)},t.typeOf=x},86:(e,t,n)=>{e.exports=n(82)},123:e=>{var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map(function(e){return t[e]}).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach(function(e){r[e]=e}),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(i){return!1}}()?Object.assign:function(e,i){for(var o,a,l=function(e){if(null===e||void 0===e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}(e),s=1;s<arguments.length;s++){for(var u in o=Object(arguments[s]))n.call(o,u)&&(l[u]=o[u]);if(t){a=t(o);for(var c=0;c<a.length;c++)r.call(o,a[c])&&(l[a[c]]=o[a[c]])}}return l}},153:(e,t,n)=>{var r=n(43),i=Symbol.for("react.element"),o=Symbol.for("react.fragment"),a=Object.prototype.hasOwnProperty,l=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,s={key:!0,ref:!0,__self:!0,__source:!0};function u(e,t,n){var r,o={},u=null,c=null;for(r in void 0!==n&&(u=""+n),void 0!==t.key&&(u=""+t.key),void 0!==t.ref&&(c=t.ref),t)a.call(t,r)&&!s.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps)void 0===o[r]&&(o[r]=t[r]);return{$$typeof:i,type:e,key:u,ref:c,props:o,_owner:l.current}}t.jsx=u},202:(e,t)=>{var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),l=Symbol.for("react.provider"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),h=Symbol.iterator;var p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},y=Object.assign,m={};function g(e,t,n){this.props=e,this.context=t,this.refs=m,this.updater=n||p}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=m,this.updater=n||p}g.prototype.isReactComponent={},g.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},g.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=g.prototype;var w=b.prototype=new v;w.constructor=b,y(w,g.prototype),w.isPureReactComponent=!0;var x=Array.isArray,S=Object.prototype.hasOwnProperty,_={current:null},k={key:!0,ref:!0,__self:!0,__source:!0};function T(e,t,r){var i,o={},a=null,l=null;if(null!=t)for(i in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)S.call(t,i)&&!k.hasOwnProperty(i)&&(o[i]=t[i]);var s=arguments.length-2;if(1===s)o.children=r;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];o.children=u}if(e&&e.defaultProps)for(i in s=e.defaultProps)void 0===o[i]&&(o[i]=s[i]);return{$$typeof:n,type:e,key:a,ref:l,props:o,_owner:_.current}}function E(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var C=/\/+/g;function I(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function M(e,t,i,o,a){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case n:case r:s=!0}}if(s)return a=a(s=e),e=""===o?"."+I(s,0):o,x(a)?(i="",null!=e&&(i=e.replace(C,"$&/")+"/"),M(a,t,i,"",function(e){return e})):null!=a&&(E(a)&&(a=function(e,t){return{$$typeof:n,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(a,i+(!a.key||s&&s.key===a.key?"":(""+a.key).replace(C,"$&/")+"/")+e)),t.push(a)),1;if(s=0,o=""===o?".":o+":",x(e))for(var u=0;u<e.length;u++){var c=o+I(l=e[u],u);s+=M(l,t,i,c,a)}else if(c=function(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=h&&e[h]||e["@@iterator"])?e:null}(e),"function"===typeof c)for(e=c.call(e),u=0;!(l=e.next()).done;)s+=M(l=l.value,t,i,c=o+I(l,u++),a);else if("object"===l)throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return s}function N(e,t,n){if(null==e)return e;var r=[],i=0;return M(e,r,"","",function(e){return t.call(n,e,i++)}),r}function A(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var O={current:null},z={transition:null},D={ReactCurrentDispatcher:O,ReactCurrentBatchConfig:z,ReactCurrentOwner:_};function $(){throw Error("act(...) is not supported in production builds of React.")}t.Children={map:N,forEach:function(e,t,n){N(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return N(e,function(){t++}),t},toArray:function(e){return N(e,function(e){return e})||[]},only:function(e){if(!E(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=g,t.Fragment=i,t.Profiler=a,t.PureComponent=b,t.StrictMode=o,t.Suspense=c,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=D,t.act=$,t.cloneElement=function(e,t,r){if(null===e||void 0===e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var i=y({},e.props),o=e.key,a=e.ref,l=e._owner;if(null!=t){if(void 0!==t.ref&&(a=t.ref,l=_.current),void 0!==t.key&&(o=""+t.key),e.type&&e.type.defaultProps)var s=e.type.defaultProps;for(u in t)S.call(t,u)&&!k.hasOwnProperty(u)&&(i[u]=void 0===t[u]&&void 0!==s?s[u]:t[u])}var u=arguments.length-2;if(1===u)i.children=r;else if(1<u){s=Array(u);for(var c=0;c<u;c++)s[c]=arguments[c+2];i.children=s}return{$$typeof:n,type:e.type,key:o,ref:a,props:i,_owner:l}},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:l,_context:e},e.Consumer=e},t.createElement=T,t.createFactory=function(e){var t=T.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=E,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:A}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=z.transition;z.transition={};try{e()}finally{z.transition=t}},t.unstable_act=$,t.useCallback=function(e,t){return O.current.useCallback(e,t)},t.useContext=function(e){return O.current.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e){return O.current.useDeferredValue(e)},t.useEffect=function(e,t){return O.current.useEffect(e,t)},t.useId=function(){return O.current.useId()},t.useImperativeHandle=function(e,t,n){return O.current.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return O.current.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return O.current.useLayoutEffect(e,t)},t.useMemo=function(e,t){return O.current.useMemo(e,t)},t.useReducer=function(e,t,n){return O.current.useReducer(e,t,n)},t.useRef=function(e){return O.current.useRef(e)},t.useState=function(e){return O.current.useState(e)},t.useSyncExternalStore=function(e,t,n){return O.current.useSyncExternalStore(e,t,n)},t.useTransition=function(){return O.current.useTransition()},t.version="18.3.1"},219:(e,t,n)=>{var r=n(86),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?a:l[e.$$typeof]||i}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=a;var u=Object.defineProperty,c=Object.getOwnPropertyNames,f=Object.getOwnPropertySymbols,d=Object.getOwnPropertyDescriptor,h=Object.getPrototypeOf,p=Object.prototype;e.exports=function e(t,n,r){if("string"!==typeof n){if(p){var i=h(n);i&&i!==p&&e(t,i,r)}var a=c(n);f&&(a=a.concat(f(n)));for(var l=s(t),y=s(n),m=0;m<a.length;++m){var g=a[m];if(!o[g]&&(!r||!r[g])&&(!y||!y[g])&&(!l||!l[g])){var v=d(n,g);try{u(t,g,v)}catch(b){}}}}return t}},234:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,i=e[r];if(!(0<o(i,t)))break e;e[r]=t,e[n]=i,n=r}}function r(e){return 0===e.length?null:e[0]}function i(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length,a=i>>>1;r<a;){var l=2*(r+1)-1,s=e[l],u=l+1,c=e[u];if(0>o(s,n))u<i&&0>o(c,s)?(e[r]=c,e[u]=n,r=u):(e[r]=s,e[l]=n,r=l);else{if(!(u<i&&0>o(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function o(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if("object"===typeof performance&&"function"===typeof performance.now){var a=performance;t.unstable_now=function(){return a.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}var u=[],c=[],f=1,d=null,h=3,p=!1,y=!1,m=!1,g="function"===typeof setTimeout?setTimeout:null,v="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(c);null!==t;){if(null===t.callback)i(c);else{if(!(t.startTime<=e))break;i(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function x(e){if(m=!1,w(e),!y)if(null!==r(u))y=!0,z(S);else{var t=r(c);null!==t&&D(x,t.startTime-e)}}function S(e,n){y=!1,m&&(m=!1,v(E),E=-1),p=!0;var o=h;try{for(w(n),d=r(u);null!==d&&(!(d.expirationTime>n)||e&&!M());){var a=d.callback;if("function"===typeof a){d.callback=null,h=d.priorityLevel;var l=a(d.expirationTime<=n);n=t.unstable_now(),"function"===typeof l?d.callback=l:d===r(u)&&i(u),w(n)}else i(u);d=r(u)}if(null!==d)var s=!0;else{var f=r(c);null!==f&&D(x,f.startTime-n),s=!1}return s}finally{d=null,h=o,p=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var _,k=!1,T=null,E=-1,C=5,I=-1;function M(){return!(t.unstable_now()-I<C)}function N(){if(null!==T){var e=t.unstable_now();I=e;var n=!0;try{n=T(!0,e)}finally{n?_():(k=!1,T=null)}}else k=!1}if("function"===typeof b)_=function(){b(N)};else if("undefined"!==typeof MessageChannel){var A=new MessageChannel,O=A.port2;A.port1.onmessage=N,_=function(){O.postMessage(null)}}else _=function(){g(N,0)};function z(e){T=e,k||(k=!0,_())}function D(e,n){E=g(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){y||p||(y=!0,z(S))},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return h},t.unstable_getFirstCallbackNode=function(){return r(u)},t.unstable_next=function(e){switch(h){case 1:case 2:case 3:var t=3;break;default:t=h}var n=h;h=t;try{return e()}finally{h=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=h;h=e;try{return t()}finally{h=n}},t.unstable_scheduleCallback=function(e,i,o){var a=t.unstable_now();switch("object"===typeof o&&null!==o?o="number"===typeof(o=o.delay)&&0<o?a+o:a:o=a,e){case 1:var l=-1;break;case 2:l=250;break;case 5:l=1073741823;break;case 4:l=1e4;break;default:l=5e3}return e={id:f++,callback:i,priorityLevel:e,startTime:o,expirationTime:l=o+l,sortIndex:-1},o>a?(e.sortIndex=o,n(c,e),null===r(u)&&e===r(c)&&(m?(v(E),E=-1):m=!0,D(x,o-a))):(e.sortIndex=l,n(u,e),y||p||(y=!0,z(S))),e},t.unstable_shouldYield=M,t.unstable_wrapCallback=function(e){var t=h;return function(){var n=h;h=t;try{return e.apply(this,arguments)}finally{h=n}}}},391:(e,t,n)=>{var r=n(950);t.createRoot=r.createRoot,t.hydrateRoot=r.hydrateRoot},579:(e,t,n)=>{e.exports=n(153)},730:(e,t,n)=>{var r=n(43),i=n(853);function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var a=new Set,l={};function s(e,t){u(e,t),u(e+"Capture",t)}function u(e,t){for(l[e]=t,e=0;e<t.length;e++)a.add(t[e])}var c=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,h={},p={};function y(e,t,n,r,i,o,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=a}var m={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){m[e]=new y(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];m[t]=new y(t,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){m[e]=new y(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){m[e]=new y(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){m[e]=new y(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){m[e]=new y(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){m[e]=new y(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){m[e]=new y(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){m[e]=new y(e,5,!1,e.toLowerCase(),null,!1,!1)});var g=/[\-:]([a-z])/g;function v(e){return e[1].toUpperCase()}function b(e,t,n,r){var i=m.hasOwnProperty(t)?m[t]:null;(null!==i?0!==i.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null===t||"undefined"===typeof t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,i,r)&&(n=null),r||null===i?function(e){return!!f.call(p,e)||!f.call(h,e)&&(d.test(e)?p[e]=!0:(h[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):i.mustUseProperty?e[i.propertyName]=null===n?3!==i.type&&"":n:(t=i.attributeName,r=i.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(g,v);m[t]=new y(t,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(g,v);m[t]=new y(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(g,v);m[t]=new y(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){m[e]=new y(e,1,!1,e.toLowerCase(),null,!1,!1)}),m.xlinkHref=new y("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){m[e]=new y(e,1,!1,e.toLowerCase(),null,!0,!0)});var w=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,x=Symbol.for("react.element"),S=Symbol.for("react.portal"),_=Symbol.for("react.fragment"),k=Symbol.for("react.strict_mode"),T=Symbol.for("react.profiler"),E=Symbol.for("react.provider"),C=Symbol.for("react.context"),I=Symbol.for("react.forward_ref"),M=Symbol.for("react.suspense"),N=Symbol.for("react.suspense_list"),A=Symbol.for("react.memo"),O=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var z=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var D=Symbol.iterator;function $(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=D&&e[D]||e["@@iterator"])?e:null}var P,L=Object.assign;function B(e){if(void 0===P)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);P=t&&t[1]||""}return"\n"+P+e}var F=!1;function R(e,t){if(!e||F)return"";F=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&"string"===typeof u.stack){for(var i=u.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,l=o.length-1;1<=a&&0<=l&&i[a]!==o[l];)l--;for(;1<=a&&0<=l;a--,l--)if(i[a]!==o[l]){if(1!==a||1!==l)do{if(a--,0>--l||i[a]!==o[l]){var s="\n"+i[a].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}}while(1<=a&&0<=l);break}}}finally{F=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?B(e):""}function U(e){switch(e.tag){case 5:return B(e.type);case 16:return B("Lazy");case 13:return B("Suspense");case 19:return B("SuspenseList");case 0:case 2:case 15:return e=R(e.type,!1);case 11:return e=R(e.type.render,!1);case 1:return e=R(e.type,!0);default:return""}}function j(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case _:return"Fragment";case S:return"Portal";case T:return"Profiler";case k:return"StrictMode";case M:return"Suspense";case N:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case C:return(e.displayName||"Context")+".Consumer";case E:return(e._context.displayName||"Context")+".Provider";case I:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case A:return null!==(t=e.displayName||null)?t:j(e.type)||"Memo";case O:t=e._payload,e=e._init;try{return j(e(t))}catch(n){}}return null}function V(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return j(t);case 8:return t===k?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof t)return t.displayName||t.name||null;if("string"===typeof t)return t}return null}function H(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function Y(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function W(e){e._valueTracker||(e._valueTracker=function(e){var t=Y(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function X(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Y(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function q(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Q(e,t){var n=t.checked;return L({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function G(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=H(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function J(e,t){null!=(t=t.checked)&&b(e,"checked",t,!1)}function K(e,t){J(e,t);var n=H(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ee(e,t.type,n):t.hasOwnProperty("defaultValue")&&ee(e,t.type,H(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Z(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ee(e,t,n){"number"===t&&q(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var te=Array.isArray;function ne(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+H(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function re(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(o(91));return L({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ie(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(o(92));if(te(n)){if(1<n.length)throw Error(o(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:H(n)}}function oe(e,t){var n=H(t.value),r=H(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ae(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function le(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function se(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?le(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var ue,ce,fe=(ce=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((ue=ue||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=ue.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction(function(){return ce(e,t)})}:ce);function de(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var he={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},pe=["Webkit","ms","Moz","O"];function ye(e,t,n){return null==t||"boolean"===typeof t||""===t?"":n||"number"!==typeof t||0===t||he.hasOwnProperty(e)&&he[e]?(""+t).trim():t+"px"}function me(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=ye(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}Object.keys(he).forEach(function(e){pe.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),he[t]=he[e]})});var ge=L({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ve(e,t){if(t){if(ge[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(o(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(o(60));if("object"!==typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=t.style&&"object"!==typeof t.style)throw Error(o(62))}}function be(e,t){if(-1===e.indexOf("-"))return"string"===typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var we=null;function xe(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Se=null,_e=null,ke=null;function Te(e){if(e=bi(e)){if("function"!==typeof Se)throw Error(o(280));var t=e.stateNode;t&&(t=xi(t),Se(e.stateNode,e.type,t))}}function Ee(e){_e?ke?ke.push(e):ke=[e]:_e=e}function Ce(){if(_e){var e=_e,t=ke;if(ke=_e=null,Te(e),t)for(e=0;e<t.length;e++)Te(t[e])}}function Ie(e,t){return e(t)}function Me(){}var Ne=!1;function Ae(e,t,n){if(Ne)return e(t,n);Ne=!0;try{return Ie(e,t,n)}finally{Ne=!1,(null!==_e||null!==ke)&&(Me(),Ce())}}function Oe(e,t){var n=e.stateNode;if(null===n)return null;var r=xi(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var ze=!1;if(c)try{var De={};Object.defineProperty(De,"passive",{get:function(){ze=!0}}),window.addEventListener("test",De,De),window.removeEventListener("test",De,De)}catch(ce){ze=!1}function $e(e,t,n,r,i,o,a,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(c){this.onError(c)}}var Pe=!1,Le=null,Be=!1,Fe=null,Re={onError:function(e){Pe=!0,Le=e}};function Ue(e,t,n,r,i,o,a,l,s){Pe=!1,Le=null,$e.apply(Re,arguments)}function je(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ve(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function He(e){if(je(e)!==e)throw Error(o(188))}function Ye(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=je(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var a=i.alternate;if(null===a){if(null!==(r=i.return)){n=r;continue}break}if(i.child===a.child){for(a=i.child;a;){if(a===n)return He(i),e;if(a===r)return He(i),t;a=a.sibling}throw Error(o(188))}if(n.return!==r.return)n=i,r=a;else{for(var l=!1,s=i.child;s;){if(s===n){l=!0,n=i,r=a;break}if(s===r){l=!0,r=i,n=a;break}s=s.sibling}if(!l){for(s=a.child;s;){if(s===n){l=!0,n=a,r=i;break}if(s===r){l=!0,r=a,n=i;break}s=s.sibling}if(!l)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(e))?We(e):null}function We(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=We(e);if(null!==t)return t;e=e.sibling}return null}var Xe=i.unstable_scheduleCallback,qe=i.unstable_cancelCallback,Qe=i.unstable_shouldYield,Ge=i.unstable_requestPaint,Je=i.unstable_now,Ke=i.unstable_getCurrentPriorityLevel,Ze=i.unstable_ImmediatePriority,et=i.unstable_UserBlockingPriority,tt=i.unstable_NormalPriority,nt=i.unstable_LowPriority,rt=i.unstable_IdlePriority,it=null,ot=null;var at=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(lt(e)/st|0)|0},lt=Math.log,st=Math.LN2;var ut=64,ct=4194304;function ft(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function dt(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,i=e.suspendedLanes,o=e.pingedLanes,a=268435455&n;if(0!==a){var l=a&~i;0!==l?r=ft(l):0!==(o&=a)&&(r=ft(o))}else 0!==(a=n&~i)?r=ft(a):0!==o&&(r=ft(o));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&i)&&((i=r&-r)>=(o=t&-t)||16===i&&0!==(4194240&o)))return t;if(0!==(4&r)&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)i=1<<(n=31-at(t)),r|=e[n],t&=~i;return r}function ht(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function pt(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function yt(){var e=ut;return 0===(4194240&(ut<<=1))&&(ut=64),e}function mt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function gt(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-at(t)]=n}function vt(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-at(n),i=1<<r;i&t|e[r]&t&&(e[r]|=t),n&=~i}}var bt=0;function wt(e){return 1<(e&=-e)?4<e?0!==(268435455&e)?16:536870912:4:1}var xt,St,_t,kt,Tt,Et=!1,Ct=[],It=null,Mt=null,Nt=null,At=new Map,Ot=new Map,zt=[],Dt="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function $t(e,t){switch(e){case"focusin":case"focusout":It=null;break;case"dragenter":case"dragleave":Mt=null;break;case"mouseover":case"mouseout":Nt=null;break;case"pointerover":case"pointerout":At.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Ot.delete(t.pointerId)}}function Pt(e,t,n,r,i,o){return null===e||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},null!==t&&(null!==(t=bi(t))&&St(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function Lt(e){var t=vi(e.target);if(null!==t){var n=je(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ve(n)))return e.blockedOn=t,void Tt(e.priority,function(){_t(n)})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Bt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Qt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=bi(n))&&St(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);we=r,n.target.dispatchEvent(r),we=null,t.shift()}return!0}function Ft(e,t,n){Bt(e)&&n.delete(t)}function Rt(){Et=!1,null!==It&&Bt(It)&&(It=null),null!==Mt&&Bt(Mt)&&(Mt=null),null!==Nt&&Bt(Nt)&&(Nt=null),At.forEach(Ft),Ot.forEach(Ft)}function Ut(e,t){e.blockedOn===t&&(e.blockedOn=null,Et||(Et=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,Rt)))}function jt(e){function t(t){return Ut(t,e)}if(0<Ct.length){Ut(Ct[0],e);for(var n=1;n<Ct.length;n++){var r=Ct[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==It&&Ut(It,e),null!==Mt&&Ut(Mt,e),null!==Nt&&Ut(Nt,e),At.forEach(t),Ot.forEach(t),n=0;n<zt.length;n++)(r=zt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<zt.length&&null===(n=zt[0]).blockedOn;)Lt(n),null===n.blockedOn&&zt.shift()}var Vt=w.ReactCurrentBatchConfig,Ht=!0;function Yt(e,t,n,r){var i=bt,o=Vt.transition;Vt.transition=null;try{bt=1,Xt(e,t,n,r)}finally{bt=i,Vt.transition=o}}function Wt(e,t,n,r){var i=bt,o=Vt.transition;Vt.transition=null;try{bt=4,Xt(e,t,n,r)}finally{bt=i,Vt.transition=o}}function Xt(e,t,n,r){if(Ht){var i=Qt(e,t,n,r);if(null===i)Hr(e,t,r,qt,n),$t(e,r);else if(function(e,t,n,r,i){switch(t){case"focusin":return It=Pt(It,e,t,n,r,i),!0;case"dragenter":return Mt=Pt(Mt,e,t,n,r,i),!0;case"mouseover":return Nt=Pt(Nt,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return At.set(o,Pt(At.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,Ot.set(o,Pt(Ot.get(o)||null,e,t,n,r,i)),!0}return!1}(i,e,t,n,r))r.stopPropagation();else if($t(e,r),4&t&&-1<Dt.indexOf(e)){for(;null!==i;){var o=bi(i);if(null!==o&&xt(o),null===(o=Qt(e,t,n,r))&&Hr(e,t,r,qt,n),o===i)break;i=o}null!==i&&r.stopPropagation()}else Hr(e,t,r,null,n)}}var qt=null;function Qt(e,t,n,r){if(qt=null,null!==(e=vi(e=xe(r))))if(null===(t=je(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=Ve(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qt=e,null}function Gt(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Ke()){case Ze:return 1;case et:return 4;case tt:case nt:return 16;case rt:return 536870912;default:return 16}default:return 16}}var Jt=null,Kt=null,Zt=null;function en(){if(Zt)return Zt;var e,t,n=Kt,r=n.length,i="value"in Jt?Jt.value:Jt.textContent,o=i.length;for(e=0;e<r&&n[e]===i[e];e++);var a=r-e;for(t=1;t<=a&&n[r-t]===i[o-t];t++);return Zt=i.slice(e,1<t?1-t:void 0)}function tn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function nn(){return!0}function rn(){return!1}function on(e){function t(t,n,r,i,o){for(var a in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(a)&&(t=e[a],this[a]=t?t(i):i[a]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return L(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),t}var an,ln,sn,un={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},cn=on(un),fn=L({},un,{view:0,detail:0}),dn=on(fn),hn=L({},fn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Tn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==sn&&(sn&&"mousemove"===e.type?(an=e.screenX-sn.screenX,ln=e.screenY-sn.screenY):ln=an=0,sn=e),an)},movementY:function(e){return"movementY"in e?e.movementY:ln}}),pn=on(hn),yn=on(L({},hn,{dataTransfer:0})),mn=on(L({},fn,{relatedTarget:0})),gn=on(L({},un,{animationName:0,elapsedTime:0,pseudoElement:0})),vn=L({},un,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bn=on(vn),wn=on(L({},un,{data:0})),xn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Sn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},_n={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function kn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=_n[e])&&!!t[e]}function Tn(){return kn}var En=L({},fn,{key:function(e){if(e.key){var t=xn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=tn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Sn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Tn,charCode:function(e){return"keypress"===e.type?tn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Cn=on(En),In=on(L({},hn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Mn=on(L({},fn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Tn})),Nn=on(L({},un,{propertyName:0,elapsedTime:0,pseudoElement:0})),An=L({},hn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),On=on(An),zn=[9,13,27,32],Dn=c&&"CompositionEvent"in window,$n=null;c&&"documentMode"in document&&($n=document.documentMode);var Pn=c&&"TextEvent"in window&&!$n,Ln=c&&(!Dn||$n&&8<$n&&11>=$n),Bn=String.fromCharCode(32),Fn=!1;function Rn(e,t){switch(e){case"keyup":return-1!==zn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var jn=!1;var Vn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Hn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Vn[e.type]:"textarea"===t}function Yn(e,t,n,r){Ee(r),0<(t=Wr(t,"onChange")).length&&(n=new cn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Wn=null,Xn=null;function qn(e){Br(e,0)}function Qn(e){if(X(wi(e)))return e}function Gn(e,t){if("change"===e)return t}var Jn=!1;if(c){var Kn;if(c){var Zn="oninput"in document;if(!Zn){var er=document.createElement("div");er.setAttribute("oninput","return;"),Zn="function"===typeof er.oninput}Kn=Zn}else Kn=!1;Jn=Kn&&(!document.documentMode||9<document.documentMode)}function tr(){Wn&&(Wn.detachEvent("onpropertychange",nr),Xn=Wn=null)}function nr(e){if("value"===e.propertyName&&Qn(Xn)){var t=[];Yn(t,Xn,e,xe(e)),Ae(qn,t)}}function rr(e,t,n){"focusin"===e?(tr(),Xn=n,(Wn=t).attachEvent("onpropertychange",nr)):"focusout"===e&&tr()}function ir(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Qn(Xn)}function or(e,t){if("click"===e)return Qn(t)}function ar(e,t){if("input"===e||"change"===e)return Qn(t)}var lr="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function sr(e,t){if(lr(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!f.call(t,i)||!lr(e[i],t[i]))return!1}return!0}function ur(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,t){var n,r=ur(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=ur(r)}}function fr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?fr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function dr(){for(var e=window,t=q();t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=q((e=t.contentWindow).document)}return t}function hr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function pr(e){var t=dr(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&fr(n.ownerDocument.documentElement,n)){if(null!==r&&hr(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var i=n.textContent.length,o=Math.min(r.start,i);r=void 0===r.end?o:Math.min(r.end,i),!e.extend&&o>r&&(i=r,r=o,o=i),i=cr(n,o);var a=cr(n,r);i&&a&&(1!==e.rangeCount||e.anchorNode!==i.node||e.anchorOffset!==i.offset||e.focusNode!==a.node||e.focusOffset!==a.offset)&&((t=t.createRange()).setStart(i.node,i.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(a.node,a.offset)):(t.setEnd(a.node,a.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"===typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var yr=c&&"documentMode"in document&&11>=document.documentMode,mr=null,gr=null,vr=null,br=!1;function wr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;br||null==mr||mr!==q(r)||("selectionStart"in(r=mr)&&hr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},vr&&sr(vr,r)||(vr=r,0<(r=Wr(gr,"onSelect")).length&&(t=new cn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=mr)))}function xr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Sr={animationend:xr("Animation","AnimationEnd"),animationiteration:xr("Animation","AnimationIteration"),animationstart:xr("Animation","AnimationStart"),transitionend:xr("Transition","TransitionEnd")},_r={},kr={};function Tr(e){if(_r[e])return _r[e];if(!Sr[e])return e;var t,n=Sr[e];for(t in n)if(n.hasOwnProperty(t)&&t in kr)return _r[e]=n[t];return e}c&&(kr=document.createElement("div").style,"AnimationEvent"in window||(delete Sr.animationend.animation,delete Sr.animationiteration.animation,delete Sr.animationstart.animation),"TransitionEvent"in window||delete Sr.transitionend.transition);var Er=Tr("animationend"),Cr=Tr("animationiteration"),Ir=Tr("animationstart"),Mr=Tr("transitionend"),Nr=new Map,Ar="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Or(e,t){Nr.set(e,t),s(t,[e])}for(var zr=0;zr<Ar.length;zr++){var Dr=Ar[zr];Or(Dr.toLowerCase(),"on"+(Dr[0].toUpperCase()+Dr.slice(1)))}Or(Er,"onAnimationEnd"),Or(Cr,"onAnimationIteration"),Or(Ir,"onAnimationStart"),Or("dblclick","onDoubleClick"),Or("focusin","onFocus"),Or("focusout","onBlur"),Or(Mr,"onTransitionEnd"),u("onMouseEnter",["mouseout","mouseover"]),u("onMouseLeave",["mouseout","mouseover"]),u("onPointerEnter",["pointerout","pointerover"]),u("onPointerLeave",["pointerout","pointerover"]),s("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),s("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),s("onBeforeInput",["compositionend","keypress","textInput","paste"]),s("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),s("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),s("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var $r="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Pr=new Set("cancel close invalid load scroll toggle".split(" ").concat($r));function Lr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,i,a,l,s,u){if(Ue.apply(this,arguments),Pe){if(!Pe)throw Error(o(198));var c=Le;Pe=!1,Le=null,Be||(Be=!0,Fe=c)}}(r,t,void 0,e),e.currentTarget=null}function Br(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var a=r.length-1;0<=a;a--){var l=r[a],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==o&&i.isPropagationStopped())break e;Lr(i,l,u),o=s}else for(a=0;a<r.length;a++){if(s=(l=r[a]).instance,u=l.currentTarget,l=l.listener,s!==o&&i.isPropagationStopped())break e;Lr(i,l,u),o=s}}}if(Be)throw e=Fe,Be=!1,Fe=null,e}function Fr(e,t){var n=t[yi];void 0===n&&(n=t[yi]=new Set);var r=e+"__bubble";n.has(r)||(Vr(t,e,2,!1),n.add(r))}function Rr(e,t,n){var r=0;t&&(r|=4),Vr(n,e,r,t)}var Ur="_reactListening"+Math.random().toString(36).slice(2);function jr(e){if(!e[Ur]){e[Ur]=!0,a.forEach(function(t){"selectionchange"!==t&&(Pr.has(t)||Rr(t,!1,e),Rr(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Ur]||(t[Ur]=!0,Rr("selectionchange",!1,t))}}function Vr(e,t,n,r){switch(Gt(t)){case 1:var i=Yt;break;case 4:i=Wt;break;default:i=Xt}n=i.bind(null,t,n,e),i=void 0,!ze||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Hr(e,t,n,r,i){var o=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var l=r.stateNode.containerInfo;if(l===i||8===l.nodeType&&l.parentNode===i)break;if(4===a)for(a=r.return;null!==a;){var s=a.tag;if((3===s||4===s)&&((s=a.stateNode.containerInfo)===i||8===s.nodeType&&s.parentNode===i))return;a=a.return}for(;null!==l;){if(null===(a=vi(l)))return;if(5===(s=a.tag)||6===s){r=o=a;continue e}l=l.parentNode}}r=r.return}Ae(function(){var r=o,i=xe(n),a=[];e:{var l=Nr.get(e);if(void 0!==l){var s=cn,u=e;switch(e){case"keypress":if(0===tn(n))break e;case"keydown":case"keyup":s=Cn;break;case"focusin":u="focus",s=mn;break;case"focusout":u="blur",s=mn;break;case"beforeblur":case"afterblur":s=mn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=pn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=yn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=Mn;break;case Er:case Cr:case Ir:s=gn;break;case Mr:s=Nn;break;case"scroll":s=dn;break;case"wheel":s=On;break;case"copy":case"cut":case"paste":s=bn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=In}var c=0!==(4&t),f=!c&&"scroll"===e,d=c?null!==l?l+"Capture":null:l;c=[];for(var h,p=r;null!==p;){var y=(h=p).stateNode;if(5===h.tag&&null!==y&&(h=y,null!==d&&(null!=(y=Oe(p,d))&&c.push(Yr(p,y,h)))),f)break;p=p.return}0<c.length&&(l=new s(l,u,null,n,i),a.push({event:l,listeners:c}))}}if(0===(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||n===we||!(u=n.relatedTarget||n.fromElement)||!vi(u)&&!u[pi])&&(s||l)&&(l=i.window===i?i:(l=i.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?vi(u):null)&&(u!==(f=je(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=pn,y="onMouseLeave",d="onMouseEnter",p="mouse","pointerout"!==e&&"pointerover"!==e||(c=In,y="onPointerLeave",d="onPointerEnter",p="pointer"),f=null==s?l:wi(s),h=null==u?l:wi(u),(l=new c(y,p+"leave",s,n,i)).target=f,l.relatedTarget=h,y=null,vi(i)===r&&((c=new c(d,p+"enter",u,n,i)).target=h,c.relatedTarget=f,y=c),f=y,s&&u)e:{for(d=u,p=0,h=c=s;h;h=Xr(h))p++;for(h=0,y=d;y;y=Xr(y))h++;for(;0<p-h;)c=Xr(c),p--;for(;0<h-p;)d=Xr(d),h--;for(;p--;){if(c===d||null!==d&&c===d.alternate)break e;c=Xr(c),d=Xr(d)}c=null}else c=null;null!==s&&qr(a,l,s,c,!1),null!==u&&null!==f&&qr(a,f,u,c,!0)}if("select"===(s=(l=r?wi(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var m=Gn;else if(Hn(l))if(Jn)m=ar;else{m=ir;var g=rr}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(m=or);switch(m&&(m=m(e,r))?Yn(a,m,n,i):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&ee(l,"number",l.value)),g=r?wi(r):window,e){case"focusin":(Hn(g)||"true"===g.contentEditable)&&(mr=g,gr=r,vr=null);break;case"focusout":vr=gr=mr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,wr(a,n,i);break;case"selectionchange":if(yr)break;case"keydown":case"keyup":wr(a,n,i)}var v;if(Dn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else jn?Rn(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(Ln&&"ko"!==n.locale&&(jn||"onCompositionStart"!==b?"onCompositionEnd"===b&&jn&&(v=en()):(Kt="value"in(Jt=i)?Jt.value:Jt.textContent,jn=!0)),0<(g=Wr(r,b)).length&&(b=new wn(b,e,null,n,i),a.push({event:b,listeners:g}),v?b.data=v:null!==(v=Un(n))&&(b.data=v))),(v=Pn?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Fn=!0,Bn);case"textInput":return(e=t.data)===Bn&&Fn?null:e;default:return null}}(e,n):function(e,t){if(jn)return"compositionend"===e||!Dn&&Rn(e,t)?(e=en(),Zt=Kt=Jt=null,jn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ln&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(r=Wr(r,"onBeforeInput")).length&&(i=new wn("onBeforeInput","beforeinput",null,n,i),a.push({event:i,listeners:r}),i.data=v))}Br(a,t)})}function Yr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wr(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,o=i.stateNode;5===i.tag&&null!==o&&(i=o,null!=(o=Oe(e,n))&&r.unshift(Yr(e,o,i)),null!=(o=Oe(e,t))&&r.push(Yr(e,o,i))),e=e.return}return r}function Xr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function qr(e,t,n,r,i){for(var o=t._reactName,a=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,i?null!=(s=Oe(n,o))&&a.unshift(Yr(n,s,l)):i||null!=(s=Oe(n,o))&&a.push(Yr(n,s,l))),n=n.return}0!==a.length&&e.push({event:t,listeners:a})}var Qr=/\r\n?/g,Gr=/\u0000|\uFFFD/g;function Jr(e){return("string"===typeof e?e:""+e).replace(Qr,"\n").replace(Gr,"")}function Kr(e,t,n){if(t=Jr(t),Jr(e)!==t&&n)throw Error(o(425))}function Zr(){}var ei=null,ti=null;function ni(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ri="function"===typeof setTimeout?setTimeout:void 0,ii="function"===typeof clearTimeout?clearTimeout:void 0,oi="function"===typeof Promise?Promise:void 0,ai="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof oi?function(e){return oi.resolve(null).then(e).catch(li)}:ri;function li(e){setTimeout(function(){throw e})}function si(e,t){var n=t,r=0;do{var i=n.nextSibling;if(e.removeChild(n),i&&8===i.nodeType)if("/$"===(n=i.data)){if(0===r)return e.removeChild(i),void jt(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=i}while(n);jt(t)}function ui(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function ci(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var fi=Math.random().toString(36).slice(2),di="__reactFiber$"+fi,hi="__reactProps$"+fi,pi="__reactContainer$"+fi,yi="__reactEvents$"+fi,mi="__reactListeners$"+fi,gi="__reactHandles$"+fi;function vi(e){var t=e[di];if(t)return t;for(var n=e.parentNode;n;){if(t=n[pi]||n[di]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=ci(e);null!==e;){if(n=e[di])return n;e=ci(e)}return t}n=(e=n).parentNode}return null}function bi(e){return!(e=e[di]||e[pi])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function wi(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(o(33))}function xi(e){return e[hi]||null}var Si=[],_i=-1;function ki(e){return{current:e}}function Ti(e){0>_i||(e.current=Si[_i],Si[_i]=null,_i--)}function Ei(e,t){_i++,Si[_i]=e.current,e.current=t}var Ci={},Ii=ki(Ci),Mi=ki(!1),Ni=Ci;function Ai(e,t){var n=e.type.contextTypes;if(!n)return Ci;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=t[i];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function Oi(e){return null!==(e=e.childContextTypes)&&void 0!==e}function zi(){Ti(Mi),Ti(Ii)}function Di(e,t,n){if(Ii.current!==Ci)throw Error(o(168));Ei(Ii,t),Ei(Mi,n)}function $i(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in t))throw Error(o(108,V(e)||"Unknown",i));return L({},n,r)}function Pi(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ci,Ni=Ii.current,Ei(Ii,e),Ei(Mi,Mi.current),!0}function Li(e,t,n){var r=e.stateNode;if(!r)throw Error(o(169));n?(e=$i(e,t,Ni),r.__reactInternalMemoizedMergedChildContext=e,Ti(Mi),Ti(Ii),Ei(Ii,e)):Ti(Mi),Ei(Mi,n)}var Bi=null,Fi=!1,Ri=!1;function Ui(e){null===Bi?Bi=[e]:Bi.push(e)}function ji(){if(!Ri&&null!==Bi){Ri=!0;var e=0,t=bt;try{var n=Bi;for(bt=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Bi=null,Fi=!1}catch(i){throw null!==Bi&&(Bi=Bi.slice(e+1)),Xe(Ze,ji),i}finally{bt=t,Ri=!1}}return null}var Vi=[],Hi=0,Yi=null,Wi=0,Xi=[],qi=0,Qi=null,Gi=1,Ji="";function Ki(e,t){Vi[Hi++]=Wi,Vi[Hi++]=Yi,Yi=e,Wi=t}function Zi(e,t,n){Xi[qi++]=Gi,Xi[qi++]=Ji,Xi[qi++]=Qi,Qi=e;var r=Gi;e=Ji;var i=32-at(r)-1;r&=~(1<<i),n+=1;var o=32-at(t)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,Gi=1<<32-at(t)+i|n<<i|r,Ji=o+e}else Gi=1<<o|n<<i|r,Ji=e}function eo(e){null!==e.return&&(Ki(e,1),Zi(e,1,0))}function to(e){for(;e===Yi;)Yi=Vi[--Hi],Vi[Hi]=null,Wi=Vi[--Hi],Vi[Hi]=null;for(;e===Qi;)Qi=Xi[--qi],Xi[qi]=null,Ji=Xi[--qi],Xi[qi]=null,Gi=Xi[--qi],Xi[qi]=null}var no=null,ro=null,io=!1,oo=null;function ao(e,t){var n=Au(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function lo(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,no=e,ro=ui(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,no=e,ro=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Qi?{id:Gi,overflow:Ji}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=Au(18,null,null,0)).stateNode=t,n.return=e,e.child=n,no=e,ro=null,!0);default:return!1}}function so(e){return 0!==(1&e.mode)&&0===(128&e.flags)}function uo(e){if(io){var t=ro;if(t){var n=t;if(!lo(e,t)){if(so(e))throw Error(o(418));t=ui(n.nextSibling);var r=no;t&&lo(e,t)?ao(r,n):(e.flags=-4097&e.flags|2,io=!1,no=e)}}else{if(so(e))throw Error(o(418));e.flags=-4097&e.flags|2,io=!1,no=e}}}function co(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;no=e}function fo(e){if(e!==no)return!1;if(!io)return co(e),io=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!ni(e.type,e.memoizedProps)),t&&(t=ro)){if(so(e))throw ho(),Error(o(418));for(;t;)ao(e,t),t=ui(t.nextSibling)}if(co(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){ro=ui(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}ro=null}}else ro=no?ui(e.stateNode.nextSibling):null;return!0}function ho(){for(var e=ro;e;)e=ui(e.nextSibling)}function po(){ro=no=null,io=!1}function yo(e){null===oo?oo=[e]:oo.push(e)}var mo=w.ReactCurrentBatchConfig;function go(e,t,n){if(null!==(e=n.ref)&&"function"!==typeof e&&"object"!==typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,e));var i=r,a=""+e;return null!==t&&null!==t.ref&&"function"===typeof t.ref&&t.ref._stringRef===a?t.ref:(t=function(e){var t=i.refs;null===e?delete t[a]:t[a]=e},t._stringRef=a,t)}if("string"!==typeof e)throw Error(o(284));if(!n._owner)throw Error(o(290,e))}return e}function vo(e,t){throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function bo(e){return(0,e._init)(e._payload)}function wo(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function i(e,t){return(e=zu(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function l(t){return e&&null===t.alternate&&(t.flags|=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Lu(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function u(e,t,n,r){var o=n.type;return o===_?f(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===o||"object"===typeof o&&null!==o&&o.$$typeof===O&&bo(o)===t.type)?((r=i(t,n.props)).ref=go(e,t,n),r.return=e,r):((r=Du(n.type,n.key,n.props,null,e.mode,r)).ref=go(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Bu(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function f(e,t,n,r,o){return null===t||7!==t.tag?((t=$u(n,e.mode,r,o)).return=e,t):((t=i(t,n)).return=e,t)}function d(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t)return(t=Lu(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case x:return(n=Du(t.type,t.key,t.props,null,e.mode,n)).ref=go(e,null,t),n.return=e,n;case S:return(t=Bu(t,e.mode,n)).return=e,t;case O:return d(e,(0,t._init)(t._payload),n)}if(te(t)||$(t))return(t=$u(t,e.mode,n,null)).return=e,t;vo(e,t)}return null}function h(e,t,n,r){var i=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n)return null!==i?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case x:return n.key===i?u(e,t,n,r):null;case S:return n.key===i?c(e,t,n,r):null;case O:return h(e,t,(i=n._init)(n._payload),r)}if(te(n)||$(n))return null!==i?null:f(e,t,n,r,null);vo(e,n)}return null}function p(e,t,n,r,i){if("string"===typeof r&&""!==r||"number"===typeof r)return s(t,e=e.get(n)||null,""+r,i);if("object"===typeof r&&null!==r){switch(r.$$typeof){case x:return u(t,e=e.get(null===r.key?n:r.key)||null,r,i);case S:return c(t,e=e.get(null===r.key?n:r.key)||null,r,i);case O:return p(e,t,n,(0,r._init)(r._payload),i)}if(te(r)||$(r))return f(t,e=e.get(n)||null,r,i,null);vo(t,r)}return null}function y(i,o,l,s){for(var u=null,c=null,f=o,y=o=0,m=null;null!==f&&y<l.length;y++){f.index>y?(m=f,f=null):m=f.sibling;var g=h(i,f,l[y],s);if(null===g){null===f&&(f=m);break}e&&f&&null===g.alternate&&t(i,f),o=a(g,o,y),null===c?u=g:c.sibling=g,c=g,f=m}if(y===l.length)return n(i,f),io&&Ki(i,y),u;if(null===f){for(;y<l.length;y++)null!==(f=d(i,l[y],s))&&(o=a(f,o,y),null===c?u=f:c.sibling=f,c=f);return io&&Ki(i,y),u}for(f=r(i,f);y<l.length;y++)null!==(m=p(f,i,y,l[y],s))&&(e&&null!==m.alternate&&f.delete(null===m.key?y:m.key),o=a(m,o,y),null===c?u=m:c.sibling=m,c=m);return e&&f.forEach(function(e){return t(i,e)}),io&&Ki(i,y),u}function m(i,l,s,u){var c=$(s);if("function"!==typeof c)throw Error(o(150));if(null==(s=c.call(s)))throw Error(o(151));for(var f=c=null,y=l,m=l=0,g=null,v=s.next();null!==y&&!v.done;m++,v=s.next()){y.index>m?(g=y,y=null):g=y.sibling;var b=h(i,y,v.value,u);if(null===b){null===y&&(y=g);break}e&&y&&null===b.alternate&&t(i,y),l=a(b,l,m),null===f?c=b:f.sibling=b,f=b,y=g}if(v.done)return n(i,y),io&&Ki(i,m),c;if(null===y){for(;!v.done;m++,v=s.next())null!==(v=d(i,v.value,u))&&(l=a(v,l,m),null===f?c=v:f.sibling=v,f=v);return io&&Ki(i,m),c}for(y=r(i,y);!v.done;m++,v=s.next())null!==(v=p(y,i,m,v.value,u))&&(e&&null!==v.alternate&&y.delete(null===v.key?m:v.key),l=a(v,l,m),null===f?c=v:f.sibling=v,f=v);return e&&y.forEach(function(e){return t(i,e)}),io&&Ki(i,m),c}return function e(r,o,a,s){if("object"===typeof a&&null!==a&&a.type===_&&null===a.key&&(a=a.props.children),"object"===typeof a&&null!==a){switch(a.$$typeof){case x:e:{for(var u=a.key,c=o;null!==c;){if(c.key===u){if((u=a.type)===_){if(7===c.tag){n(r,c.sibling),(o=i(c,a.props.children)).return=r,r=o;break e}}else if(c.elementType===u||"object"===typeof u&&null!==u&&u.$$typeof===O&&bo(u)===c.type){n(r,c.sibling),(o=i(c,a.props)).ref=go(r,c,a),o.return=r,r=o;break e}n(r,c);break}t(r,c),c=c.sibling}a.type===_?((o=$u(a.props.children,r.mode,s,a.key)).return=r,r=o):((s=Du(a.type,a.key,a.props,null,r.mode,s)).ref=go(r,o,a),s.return=r,r=s)}return l(r);case S:e:{for(c=a.key;null!==o;){if(o.key===c){if(4===o.tag&&o.stateNode.containerInfo===a.containerInfo&&o.stateNode.implementation===a.implementation){n(r,o.sibling),(o=i(o,a.children||[])).return=r,r=o;break e}n(r,o);break}t(r,o),o=o.sibling}(o=Bu(a,r.mode,s)).return=r,r=o}return l(r);case O:return e(r,o,(c=a._init)(a._payload),s)}if(te(a))return y(r,o,a,s);if($(a))return m(r,o,a,s);vo(r,a)}return"string"===typeof a&&""!==a||"number"===typeof a?(a=""+a,null!==o&&6===o.tag?(n(r,o.sibling),(o=i(o,a)).return=r,r=o):(n(r,o),(o=Lu(a,r.mode,s)).return=r,r=o),l(r)):n(r,o)}}var xo=wo(!0),So=wo(!1),_o=ki(null),ko=null,To=null,Eo=null;function Co(){Eo=To=ko=null}function Io(e){var t=_o.current;Ti(_o),e._currentValue=t}function Mo(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function No(e,t){ko=e,Eo=To=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(bl=!0),e.firstContext=null)}function Ao(e){var t=e._currentValue;if(Eo!==e)if(e={context:e,memoizedValue:t,next:null},null===To){if(null===ko)throw Error(o(308));To=e,ko.dependencies={lanes:0,firstContext:e}}else To=To.next=e;return t}var Oo=null;function zo(e){null===Oo?Oo=[e]:Oo.push(e)}function Do(e,t,n,r){var i=t.interleaved;return null===i?(n.next=n,zo(t)):(n.next=i.next,i.next=n),t.interleaved=n,$o(e,r)}function $o(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var Po=!1;function Lo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Bo(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Fo(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Ro(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&Is)){var i=r.pending;return null===i?t.next=t:(t.next=i.next,i.next=t),r.pending=t,$o(e,n)}return null===(i=r.interleaved)?(t.next=t,zo(r)):(t.next=i.next,i.next=t),r.interleaved=t,$o(e,n)}function Uo(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194240&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,vt(e,n)}}function jo(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=t:o=o.next=t}else i=o=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Vo(e,t,n,r){var i=e.updateQueue;Po=!1;var o=i.firstBaseUpdate,a=i.lastBaseUpdate,l=i.shared.pending;if(null!==l){i.shared.pending=null;var s=l,u=s.next;s.next=null,null===a?o=u:a.next=u,a=s;var c=e.alternate;null!==c&&((l=(c=c.updateQueue).lastBaseUpdate)!==a&&(null===l?c.firstBaseUpdate=u:l.next=u,c.lastBaseUpdate=s))}if(null!==o){var f=i.baseState;for(a=0,c=u=s=null,l=o;;){var d=l.lane,h=l.eventTime;if((r&d)===d){null!==c&&(c=c.next={eventTime:h,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var p=e,y=l;switch(d=t,h=n,y.tag){case 1:if("function"===typeof(p=y.payload)){f=p.call(h,f,d);break e}f=p;break e;case 3:p.flags=-65537&p.flags|128;case 0:if(null===(d="function"===typeof(p=y.payload)?p.call(h,f,d):p)||void 0===d)break e;f=L({},f,d);break e;case 2:Po=!0}}null!==l.callback&&0!==l.lane&&(e.flags|=64,null===(d=i.effects)?i.effects=[l]:d.push(l))}else h={eventTime:h,lane:d,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===c?(u=c=h,s=f):c=c.next=h,a|=d;if(null===(l=l.next)){if(null===(l=i.shared.pending))break;l=(d=l).next,d.next=null,i.lastBaseUpdate=d,i.shared.pending=null}}if(null===c&&(s=f),i.baseState=s,i.firstBaseUpdate=u,i.lastBaseUpdate=c,null!==(t=i.shared.interleaved)){i=t;do{a|=i.lane,i=i.next}while(i!==t)}else null===o&&(i.shared.lanes=0);Ps|=a,e.lanes=a,e.memoizedState=f}}function Ho(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!==typeof i)throw Error(o(191,i));i.call(r)}}}var Yo={},Wo=ki(Yo),Xo=ki(Yo),qo=ki(Yo);function Qo(e){if(e===Yo)throw Error(o(174));return e}function Go(e,t){switch(Ei(qo,t),Ei(Xo,e),Ei(Wo,Yo),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:se(null,"");break;default:t=se(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Ti(Wo),Ei(Wo,t)}function Jo(){Ti(Wo),Ti(Xo),Ti(qo)}function Ko(e){Qo(qo.current);var t=Qo(Wo.current),n=se(t,e.type);t!==n&&(Ei(Xo,e),Ei(Wo,n))}function Zo(e){Xo.current===e&&(Ti(Wo),Ti(Xo))}var ea=ki(0);function ta(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var na=[];function ra(){for(var e=0;e<na.length;e++)na[e]._workInProgressVersionPrimary=null;na.length=0}var ia=w.ReactCurrentDispatcher,oa=w.ReactCurrentBatchConfig,aa=0,la=null,sa=null,ua=null,ca=!1,fa=!1,da=0,ha=0;function pa(){throw Error(o(321))}function ya(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!lr(e[n],t[n]))return!1;return!0}function ma(e,t,n,r,i,a){if(aa=a,la=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,ia.current=null===e||null===e.memoizedState?Za:el,e=n(r,i),fa){a=0;do{if(fa=!1,da=0,25<=a)throw Error(o(301));a+=1,ua=sa=null,t.updateQueue=null,ia.current=tl,e=n(r,i)}while(fa)}if(ia.current=Ka,t=null!==sa&&null!==sa.next,aa=0,ua=sa=la=null,ca=!1,t)throw Error(o(300));return e}function ga(){var e=0!==da;return da=0,e}function va(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ua?la.memoizedState=ua=e:ua=ua.next=e,ua}function ba(){if(null===sa){var e=la.alternate;e=null!==e?e.memoizedState:null}else e=sa.next;var t=null===ua?la.memoizedState:ua.next;if(null!==t)ua=t,sa=e;else{if(null===e)throw Error(o(310));e={memoizedState:(sa=e).memoizedState,baseState:sa.baseState,baseQueue:sa.baseQueue,queue:sa.queue,next:null},null===ua?la.memoizedState=ua=e:ua=ua.next=e}return ua}function wa(e,t){return"function"===typeof t?t(e):t}function xa(e){var t=ba(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=sa,i=r.baseQueue,a=n.pending;if(null!==a){if(null!==i){var l=i.next;i.next=a.next,a.next=l}r.baseQueue=i=a,n.pending=null}if(null!==i){a=i.next,r=r.baseState;var s=l=null,u=null,c=a;do{var f=c.lane;if((aa&f)===f)null!==u&&(u=u.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var d={lane:f,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===u?(s=u=d,l=r):u=u.next=d,la.lanes|=f,Ps|=f}c=c.next}while(null!==c&&c!==a);null===u?l=r:u.next=s,lr(r,t.memoizedState)||(bl=!0),t.memoizedState=r,t.baseState=l,t.baseQueue=u,n.lastRenderedState=r}if(null!==(e=n.interleaved)){i=e;do{a=i.lane,la.lanes|=a,Ps|=a,i=i.next}while(i!==e)}else null===i&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Sa(e){var t=ba(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,a=t.memoizedState;if(null!==i){n.pending=null;var l=i=i.next;do{a=e(a,l.action),l=l.next}while(l!==i);lr(a,t.memoizedState)||(bl=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function _a(){}function ka(e,t){var n=la,r=ba(),i=t(),a=!lr(r.memoizedState,i);if(a&&(r.memoizedState=i,bl=!0),r=r.queue,Pa(Ca.bind(null,n,r,e),[e]),r.getSnapshot!==t||a||null!==ua&&1&ua.memoizedState.tag){if(n.flags|=2048,Aa(9,Ea.bind(null,n,r,i,t),void 0,null),null===Ms)throw Error(o(349));0!==(30&aa)||Ta(n,t,i)}return i}function Ta(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=la.updateQueue)?(t={lastEffect:null,stores:null},la.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Ea(e,t,n,r){t.value=n,t.getSnapshot=r,Ia(t)&&Ma(e)}function Ca(e,t,n){return n(function(){Ia(t)&&Ma(e)})}function Ia(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!lr(e,n)}catch(r){return!0}}function Ma(e){var t=$o(e,1);null!==t&&nu(t,e,1,-1)}function Na(e){var t=va();return"function"===typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:wa,lastRenderedState:e},t.queue=e,e=e.dispatch=qa.bind(null,la,e),[t.memoizedState,e]}function Aa(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=la.updateQueue)?(t={lastEffect:null,stores:null},la.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Oa(){return ba().memoizedState}function za(e,t,n,r){var i=va();la.flags|=e,i.memoizedState=Aa(1|t,n,void 0,void 0===r?null:r)}function Da(e,t,n,r){var i=ba();r=void 0===r?null:r;var o=void 0;if(null!==sa){var a=sa.memoizedState;if(o=a.destroy,null!==r&&ya(r,a.deps))return void(i.memoizedState=Aa(t,n,o,r))}la.flags|=e,i.memoizedState=Aa(1|t,n,o,r)}function $a(e,t){return za(8390656,8,e,t)}function Pa(e,t){return Da(2048,8,e,t)}function La(e,t){return Da(4,2,e,t)}function Ba(e,t){return Da(4,4,e,t)}function Fa(e,t){return"function"===typeof t?(e=e(),t(e),function(){t(null)}):null!==t&&void 0!==t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Ra(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,Da(4,4,Fa.bind(null,t,e),n)}function Ua(){}function ja(e,t){var n=ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ya(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Va(e,t){var n=ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ya(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ha(e,t,n){return 0===(21&aa)?(e.baseState&&(e.baseState=!1,bl=!0),e.memoizedState=n):(lr(n,t)||(n=yt(),la.lanes|=n,Ps|=n,e.baseState=!0),t)}function Ya(e,t){var n=bt;bt=0!==n&&4>n?n:4,e(!0);var r=oa.transition;oa.transition={};try{e(!1),t()}finally{bt=n,oa.transition=r}}function Wa(){return ba().memoizedState}function Xa(e,t,n){var r=tu(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Qa(e))Ga(t,n);else if(null!==(n=Do(e,t,n,r))){nu(n,e,r,eu()),Ja(n,t,r)}}function qa(e,t,n){var r=tu(e),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Qa(e))Ga(t,i);else{var o=e.alternate;if(0===e.lanes&&(null===o||0===o.lanes)&&null!==(o=t.lastRenderedReducer))try{var a=t.lastRenderedState,l=o(a,n);if(i.hasEagerState=!0,i.eagerState=l,lr(l,a)){var s=t.interleaved;return null===s?(i.next=i,zo(t)):(i.next=s.next,s.next=i),void(t.interleaved=i)}}catch(u){}null!==(n=Do(e,t,i,r))&&(nu(n,e,r,i=eu()),Ja(n,t,r))}}function Qa(e){var t=e.alternate;return e===la||null!==t&&t===la}function Ga(e,t){fa=ca=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ja(e,t,n){if(0!==(4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,vt(e,n)}}var Ka={readContext:Ao,useCallback:pa,useContext:pa,useEffect:pa,useImperativeHandle:pa,useInsertionEffect:pa,useLayoutEffect:pa,useMemo:pa,useReducer:pa,useRef:pa,useState:pa,useDebugValue:pa,useDeferredValue:pa,useTransition:pa,useMutableSource:pa,useSyncExternalStore:pa,useId:pa,unstable_isNewReconciler:!1},Za={readContext:Ao,useCallback:function(e,t){return va().memoizedState=[e,void 0===t?null:t],e},useContext:Ao,useEffect:$a,useImperativeHandle:function(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,za(4194308,4,Fa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return za(4194308,4,e,t)},useInsertionEffect:function(e,t){return za(4,2,e,t)},useMemo:function(e,t){var n=va();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=va();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Xa.bind(null,la,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},va().memoizedState=e},useState:Na,useDebugValue:Ua,useDeferredValue:function(e){return va().memoizedState=e},useTransition:function(){var e=Na(!1),t=e[0];return e=Ya.bind(null,e[1]),va().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=la,i=va();if(io){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===Ms)throw Error(o(349));0!==(30&aa)||Ta(r,t,n)}i.memoizedState=n;var a={value:n,getSnapshot:t};return i.queue=a,$a(Ca.bind(null,r,a,e),[e]),r.flags|=2048,Aa(9,Ea.bind(null,r,a,n,t),void 0,null),n},useId:function(){var e=va(),t=Ms.identifierPrefix;if(io){var n=Ji;t=":"+t+"R"+(n=(Gi&~(1<<32-at(Gi)-1)).toString(32)+n),0<(n=da++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=ha++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},el={readContext:Ao,useCallback:ja,useContext:Ao,useEffect:Pa,useImperativeHandle:Ra,useInsertionEffect:La,useLayoutEffect:Ba,useMemo:Va,useReducer:xa,useRef:Oa,useState:function(){return xa(wa)},useDebugValue:Ua,useDeferredValue:function(e){return Ha(ba(),sa.memoizedState,e)},useTransition:function(){return[xa(wa)[0],ba().memoizedState]},useMutableSource:_a,useSyncExternalStore:ka,useId:Wa,unstable_isNewReconciler:!1},tl={readContext:Ao,useCallback:ja,useContext:Ao,useEffect:Pa,useImperativeHandle:Ra,useInsertionEffect:La,useLayoutEffect:Ba,useMemo:Va,useReducer:Sa,useRef:Oa,useState:function(){return Sa(wa)},useDebugValue:Ua,useDeferredValue:function(e){var t=ba();return null===sa?t.memoizedState=e:Ha(t,sa.memoizedState,e)},useTransition:function(){return[Sa(wa)[0],ba().memoizedState]},useMutableSource:_a,useSyncExternalStore:ka,useId:Wa,unstable_isNewReconciler:!1};function nl(e,t){if(e&&e.defaultProps){for(var n in t=L({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function rl(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:L({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var il={isMounted:function(e){return!!(e=e._reactInternals)&&je(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=eu(),i=tu(e),o=Fo(r,i);o.payload=t,void 0!==n&&null!==n&&(o.callback=n),null!==(t=Ro(e,o,i))&&(nu(t,e,i,r),Uo(t,e,i))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=eu(),i=tu(e),o=Fo(r,i);o.tag=1,o.payload=t,void 0!==n&&null!==n&&(o.callback=n),null!==(t=Ro(e,o,i))&&(nu(t,e,i,r),Uo(t,e,i))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=eu(),r=tu(e),i=Fo(n,r);i.tag=2,void 0!==t&&null!==t&&(i.callback=t),null!==(t=Ro(e,i,r))&&(nu(t,e,r,n),Uo(t,e,r))}};function ol(e,t,n,r,i,o,a){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,a):!t.prototype||!t.prototype.isPureReactComponent||(!sr(n,r)||!sr(i,o))}function al(e,t,n){var r=!1,i=Ci,o=t.contextType;return"object"===typeof o&&null!==o?o=Ao(o):(i=Oi(t)?Ni:Ii.current,o=(r=null!==(r=t.contextTypes)&&void 0!==r)?Ai(e,i):Ci),t=new t(n,o),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=il,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=o),t}function ll(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&il.enqueueReplaceState(t,t.state,null)}function sl(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs={},Lo(e);var o=t.contextType;"object"===typeof o&&null!==o?i.context=Ao(o):(o=Oi(t)?Ni:Ii.current,i.context=Ai(e,o)),i.state=e.memoizedState,"function"===typeof(o=t.getDerivedStateFromProps)&&(rl(e,t,o,n),i.state=e.memoizedState),"function"===typeof t.getDerivedStateFromProps||"function"===typeof i.getSnapshotBeforeUpdate||"function"!==typeof i.UNSAFE_componentWillMount&&"function"!==typeof i.componentWillMount||(t=i.state,"function"===typeof i.componentWillMount&&i.componentWillMount(),"function"===typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),t!==i.state&&il.enqueueReplaceState(i,i.state,null),Vo(e,n,i,r),i.state=e.memoizedState),"function"===typeof i.componentDidMount&&(e.flags|=4194308)}function ul(e,t){try{var n="",r=t;do{n+=U(r),r=r.return}while(r);var i=n}catch(o){i="\nError generating stack: "+o.message+"\n"+o.stack}return{value:e,source:t,stack:i,digest:null}}function cl(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function fl(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var dl="function"===typeof WeakMap?WeakMap:Map;function hl(e,t,n){(n=Fo(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Hs||(Hs=!0,Ys=r),fl(0,t)},n}function pl(e,t,n){(n=Fo(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var i=t.value;n.payload=function(){return r(i)},n.callback=function(){fl(0,t)}}var o=e.stateNode;return null!==o&&"function"===typeof o.componentDidCatch&&(n.callback=function(){fl(0,t),"function"!==typeof r&&(null===Ws?Ws=new Set([this]):Ws.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function yl(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new dl;var i=new Set;r.set(t,i)}else void 0===(i=r.get(t))&&(i=new Set,r.set(t,i));i.has(n)||(i.add(n),e=Tu.bind(null,e,t,n),t.then(e,e))}function ml(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function gl(e,t,n,r,i){return 0===(1&e.mode)?(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Fo(-1,1)).tag=2,Ro(n,t,1))),n.lanes|=1),e):(e.flags|=65536,e.lanes=i,e)}var vl=w.ReactCurrentOwner,bl=!1;function wl(e,t,n,r){t.child=null===e?So(t,null,n,r):xo(t,e.child,n,r)}function xl(e,t,n,r,i){n=n.render;var o=t.ref;return No(t,i),r=ma(e,t,n,r,o,i),n=ga(),null===e||bl?(io&&n&&eo(t),t.flags|=1,wl(e,t,r,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,Hl(e,t,i))}function Sl(e,t,n,r,i){if(null===e){var o=n.type;return"function"!==typeof o||Ou(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Du(n.type,null,r,t,t.mode,i)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,_l(e,t,o,r,i))}if(o=e.child,0===(e.lanes&i)){var a=o.memoizedProps;if((n=null!==(n=n.compare)?n:sr)(a,r)&&e.ref===t.ref)return Hl(e,t,i)}return t.flags|=1,(e=zu(o,r)).ref=t.ref,e.return=t,t.child=e}function _l(e,t,n,r,i){if(null!==e){var o=e.memoizedProps;if(sr(o,r)&&e.ref===t.ref){if(bl=!1,t.pendingProps=r=o,0===(e.lanes&i))return t.lanes=e.lanes,Hl(e,t,i);0!==(131072&e.flags)&&(bl=!0)}}return El(e,t,n,r,i)}function kl(e,t,n){var r=t.pendingProps,i=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0===(1&t.mode))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Ei(zs,Os),Os|=n;else{if(0===(1073741824&n))return e=null!==o?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,Ei(zs,Os),Os|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,Ei(zs,Os),Os|=r}else null!==o?(r=o.baseLanes|n,t.memoizedState=null):r=n,Ei(zs,Os),Os|=r;return wl(e,t,i,n),t.child}function Tl(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function El(e,t,n,r,i){var o=Oi(n)?Ni:Ii.current;return o=Ai(t,o),No(t,i),n=ma(e,t,n,r,o,i),r=ga(),null===e||bl?(io&&r&&eo(t),t.flags|=1,wl(e,t,n,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,Hl(e,t,i))}function Cl(e,t,n,r,i){if(Oi(n)){var o=!0;Pi(t)}else o=!1;if(No(t,i),null===t.stateNode)Vl(e,t),al(t,n,r),sl(t,n,r,i),r=!0;else if(null===e){var a=t.stateNode,l=t.memoizedProps;a.props=l;var s=a.context,u=n.contextType;"object"===typeof u&&null!==u?u=Ao(u):u=Ai(t,u=Oi(n)?Ni:Ii.current);var c=n.getDerivedStateFromProps,f="function"===typeof c||"function"===typeof a.getSnapshotBeforeUpdate;f||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l!==r||s!==u)&&ll(t,a,r,u),Po=!1;var d=t.memoizedState;a.state=d,Vo(t,r,a,i),s=t.memoizedState,l!==r||d!==s||Mi.current||Po?("function"===typeof c&&(rl(t,n,c,r),s=t.memoizedState),(l=Po||ol(t,n,l,r,d,s,u))?(f||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||("function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"===typeof a.componentDidMount&&(t.flags|=4194308)):("function"===typeof a.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),a.props=r,a.state=s,a.context=u,r=l):("function"===typeof a.componentDidMount&&(t.flags|=4194308),r=!1)}else{a=t.stateNode,Bo(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:nl(t.type,l),a.props=u,f=t.pendingProps,d=a.context,"object"===typeof(s=n.contextType)&&null!==s?s=Ao(s):s=Ai(t,s=Oi(n)?Ni:Ii.current);var h=n.getDerivedStateFromProps;(c="function"===typeof h||"function"===typeof a.getSnapshotBeforeUpdate)||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l!==f||d!==s)&&ll(t,a,r,s),Po=!1,d=t.memoizedState,a.state=d,Vo(t,r,a,i);var p=t.memoizedState;l!==f||d!==p||Mi.current||Po?("function"===typeof h&&(rl(t,n,h,r),p=t.memoizedState),(u=Po||ol(t,n,u,r,d,p,s)||!1)?(c||"function"!==typeof a.UNSAFE_componentWillUpdate&&"function"!==typeof a.componentWillUpdate||("function"===typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,s),"function"===typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,s)),"function"===typeof a.componentDidUpdate&&(t.flags|=4),"function"===typeof a.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof a.componentDidUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),a.props=r,a.state=p,a.context=s,r=u):("function"!==typeof a.componentDidUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return Il(e,t,n,r,o,i)}function Il(e,t,n,r,i,o){Tl(e,t);var a=0!==(128&t.flags);if(!r&&!a)return i&&Li(t,n,!1),Hl(e,t,o);r=t.stateNode,vl.current=t;var l=a&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&a?(t.child=xo(t,e.child,null,o),t.child=xo(t,null,l,o)):wl(e,t,l,o),t.memoizedState=r.state,i&&Li(t,n,!0),t.child}function Ml(e){var t=e.stateNode;t.pendingContext?Di(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Di(0,t.context,!1),Go(e,t.containerInfo)}function Nl(e,t,n,r,i){return po(),yo(i),t.flags|=256,wl(e,t,n,r),t.child}var Al,Ol,zl,Dl,$l={dehydrated:null,treeContext:null,retryLane:0};function Pl(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ll(e,t,n){var r,i=t.pendingProps,a=ea.current,l=!1,s=0!==(128&t.flags);if((r=s)||(r=(null===e||null!==e.memoizedState)&&0!==(2&a)),r?(l=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(a|=1),Ei(ea,1&a),null===e)return uo(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(0===(1&t.mode)?t.lanes=1:"$!"===e.data?t.lanes=8:t.lanes=1073741824,null):(s=i.children,e=i.fallback,l?(i=t.mode,l=t.child,s={mode:"hidden",children:s},0===(1&i)&&null!==l?(l.childLanes=0,l.pendingProps=s):l=Pu(s,i,0,null),e=$u(e,i,n,null),l.return=t,e.return=t,l.sibling=e,t.child=l,t.child.memoizedState=Pl(n),t.memoizedState=$l,e):Bl(t,s));if(null!==(a=e.memoizedState)&&null!==(r=a.dehydrated))return function(e,t,n,r,i,a,l){if(n)return 256&t.flags?(t.flags&=-257,Fl(e,t,l,r=cl(Error(o(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(a=r.fallback,i=t.mode,r=Pu({mode:"visible",children:r.children},i,0,null),(a=$u(a,i,l,null)).flags|=2,r.return=t,a.return=t,r.sibling=a,t.child=r,0!==(1&t.mode)&&xo(t,e.child,null,l),t.child.memoizedState=Pl(l),t.memoizedState=$l,a);if(0===(1&t.mode))return Fl(e,t,l,null);if("$!"===i.data){if(r=i.nextSibling&&i.nextSibling.dataset)var s=r.dgst;return r=s,Fl(e,t,l,r=cl(a=Error(o(419)),r,void 0))}if(s=0!==(l&e.childLanes),bl||s){if(null!==(r=Ms)){switch(l&-l){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=0!==(i&(r.suspendedLanes|l))?0:i)&&i!==a.retryLane&&(a.retryLane=i,$o(e,i),nu(r,e,i,-1))}return yu(),Fl(e,t,l,r=cl(Error(o(421))))}return"$?"===i.data?(t.flags|=128,t.child=e.child,t=Cu.bind(null,e),i._reactRetry=t,null):(e=a.treeContext,ro=ui(i.nextSibling),no=t,io=!0,oo=null,null!==e&&(Xi[qi++]=Gi,Xi[qi++]=Ji,Xi[qi++]=Qi,Gi=e.id,Ji=e.overflow,Qi=t),t=Bl(t,r.children),t.flags|=4096,t)}(e,t,s,i,r,a,n);if(l){l=i.fallback,s=t.mode,r=(a=e.child).sibling;var u={mode:"hidden",children:i.children};return 0===(1&s)&&t.child!==a?((i=t.child).childLanes=0,i.pendingProps=u,t.deletions=null):(i=zu(a,u)).subtreeFlags=14680064&a.subtreeFlags,null!==r?l=zu(r,l):(l=$u(l,s,n,null)).flags|=2,l.return=t,i.return=t,i.sibling=l,t.child=i,i=l,l=t.child,s=null===(s=e.child.memoizedState)?Pl(n):{baseLanes:s.baseLanes|n,cachePool:null,transitions:s.transitions},l.memoizedState=s,l.childLanes=e.childLanes&~n,t.memoizedState=$l,i}return e=(l=e.child).sibling,i=zu(l,{mode:"visible",children:i.children}),0===(1&t.mode)&&(i.lanes=n),i.return=t,i.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=i,t.memoizedState=null,i}function Bl(e,t){return(t=Pu({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Fl(e,t,n,r){return null!==r&&yo(r),xo(t,e.child,null,n),(e=Bl(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Rl(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),Mo(e.return,t,n)}function Ul(e,t,n,r,i){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function jl(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(wl(e,t,r.children,n),0!==(2&(r=ea.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Rl(e,n,t);else if(19===e.tag)Rl(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Ei(ea,r),0===(1&t.mode))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===ta(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),Ul(t,!1,i,n,o);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===ta(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}Ul(t,!0,n,null,o);break;case"together":Ul(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Vl(e,t){0===(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Hl(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Ps|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=zu(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=zu(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Yl(e,t){if(!io)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Wl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=e,i=i.sibling;else for(i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Xl(e,t,n){var r=t.pendingProps;switch(to(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Wl(t),null;case 1:case 17:return Oi(t.type)&&zi(),Wl(t),null;case 3:return r=t.stateNode,Jo(),Ti(Mi),Ti(Ii),ra(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(fo(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,null!==oo&&(au(oo),oo=null))),Ol(e,t),Wl(t),null;case 5:Zo(t);var i=Qo(qo.current);if(n=t.type,null!==e&&null!=t.stateNode)zl(e,t,n,r,i),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Wl(t),null}if(e=Qo(Wo.current),fo(t)){r=t.stateNode,n=t.type;var a=t.memoizedProps;switch(r[di]=t,r[hi]=a,e=0!==(1&t.mode),n){case"dialog":Fr("cancel",r),Fr("close",r);break;case"iframe":case"object":case"embed":Fr("load",r);break;case"video":case"audio":for(i=0;i<$r.length;i++)Fr($r[i],r);break;case"source":Fr("error",r);break;case"img":case"image":case"link":Fr("error",r),Fr("load",r);break;case"details":Fr("toggle",r);break;case"input":G(r,a),Fr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!a.multiple},Fr("invalid",r);break;case"textarea":ie(r,a),Fr("invalid",r)}for(var s in ve(n,a),i=null,a)if(a.hasOwnProperty(s)){var u=a[s];"children"===s?"string"===typeof u?r.textContent!==u&&(!0!==a.suppressHydrationWarning&&Kr(r.textContent,u,e),i=["children",u]):"number"===typeof u&&r.textContent!==""+u&&(!0!==a.suppressHydrationWarning&&Kr(r.textContent,u,e),i=["children",""+u]):l.hasOwnProperty(s)&&null!=u&&"onScroll"===s&&Fr("scroll",r)}switch(n){case"input":W(r),Z(r,a,!0);break;case"textarea":W(r),ae(r);break;case"select":case"option":break;default:"function"===typeof a.onClick&&(r.onclick=Zr)}r=i,t.updateQueue=r,null!==r&&(t.flags|=4)}else{s=9===i.nodeType?i:i.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=le(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=s.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=s.createElement(n,{is:r.is}):(e=s.createElement(n),"select"===n&&(s=e,r.multiple?s.multiple=!0:r.size&&(s.size=r.size))):e=s.createElementNS(e,n),e[di]=t,e[hi]=r,Al(e,t,!1,!1),t.stateNode=e;e:{switch(s=be(n,r),n){case"dialog":Fr("cancel",e),Fr("close",e),i=r;break;case"iframe":case"object":case"embed":Fr("load",e),i=r;break;case"video":case"audio":for(i=0;i<$r.length;i++)Fr($r[i],e);i=r;break;case"source":Fr("error",e),i=r;break;case"img":case"image":case"link":Fr("error",e),Fr("load",e),i=r;break;case"details":Fr("toggle",e),i=r;break;case"input":G(e,r),i=Q(e,r),Fr("invalid",e);break;case"option":default:i=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},i=L({},r,{value:void 0}),Fr("invalid",e);break;case"textarea":ie(e,r),i=re(e,r),Fr("invalid",e)}for(a in ve(n,i),u=i)if(u.hasOwnProperty(a)){var c=u[a];"style"===a?me(e,c):"dangerouslySetInnerHTML"===a?null!=(c=c?c.__html:void 0)&&fe(e,c):"children"===a?"string"===typeof c?("textarea"!==n||""!==c)&&de(e,c):"number"===typeof c&&de(e,""+c):"suppressContentEditableWarning"!==a&&"suppressHydrationWarning"!==a&&"autoFocus"!==a&&(l.hasOwnProperty(a)?null!=c&&"onScroll"===a&&Fr("scroll",e):null!=c&&b(e,a,c,s))}switch(n){case"input":W(e),Z(e,r,!1);break;case"textarea":W(e),ae(e);break;case"option":null!=r.value&&e.setAttribute("value",""+H(r.value));break;case"select":e.multiple=!!r.multiple,null!=(a=r.value)?ne(e,!!r.multiple,a,!1):null!=r.defaultValue&&ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof i.onClick&&(e.onclick=Zr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Wl(t),null;case 6:if(e&&null!=t.stateNode)Dl(e,t,e.memoizedProps,r);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(n=Qo(qo.current),Qo(Wo.current),fo(t)){if(r=t.stateNode,n=t.memoizedProps,r[di]=t,(a=r.nodeValue!==n)&&null!==(e=no))switch(e.tag){case 3:Kr(r.nodeValue,n,0!==(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Kr(r.nodeValue,n,0!==(1&e.mode))}a&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[di]=t,t.stateNode=r}return Wl(t),null;case 13:if(Ti(ea),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(io&&null!==ro&&0!==(1&t.mode)&&0===(128&t.flags))ho(),po(),t.flags|=98560,a=!1;else if(a=fo(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[di]=t}else po(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Wl(t),a=!1}else null!==oo&&(au(oo),oo=null),a=!0;if(!a)return 65536&t.flags?t:null}return 0!==(128&t.flags)?(t.lanes=n,t):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,0!==(1&t.mode)&&(null===e||0!==(1&ea.current)?0===Ds&&(Ds=3):yu())),null!==t.updateQueue&&(t.flags|=4),Wl(t),null);case 4:return Jo(),Ol(e,t),null===e&&jr(t.stateNode.containerInfo),Wl(t),null;case 10:return Io(t.type._context),Wl(t),null;case 19:if(Ti(ea),null===(a=t.memoizedState))return Wl(t),null;if(r=0!==(128&t.flags),null===(s=a.rendering))if(r)Yl(a,!1);else{if(0!==Ds||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(s=ta(e))){for(t.flags|=128,Yl(a,!1),null!==(r=s.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(a=n).flags&=14680066,null===(s=a.alternate)?(a.childLanes=0,a.lanes=e,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=s.childLanes,a.lanes=s.lanes,a.child=s.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=s.memoizedProps,a.memoizedState=s.memoizedState,a.updateQueue=s.updateQueue,a.type=s.type,e=s.dependencies,a.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return Ei(ea,1&ea.current|2),t.child}e=e.sibling}null!==a.tail&&Je()>js&&(t.flags|=128,r=!0,Yl(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=ta(s))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),Yl(a,!0),null===a.tail&&"hidden"===a.tailMode&&!s.alternate&&!io)return Wl(t),null}else 2*Je()-a.renderingStartTime>js&&1073741824!==n&&(t.flags|=128,r=!0,Yl(a,!1),t.lanes=4194304);a.isBackwards?(s.sibling=t.child,t.child=s):(null!==(n=a.last)?n.sibling=s:t.child=s,a.last=s)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=Je(),t.sibling=null,n=ea.current,Ei(ea,r?1&n|2:1&n),t):(Wl(t),null);case 22:case 23:return fu(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&0!==(1&t.mode)?0!==(1073741824&Os)&&(Wl(t),6&t.subtreeFlags&&(t.flags|=8192)):Wl(t),null;case 24:case 25:return null}throw Error(o(156,t.tag))}function ql(e,t){switch(to(t),t.tag){case 1:return Oi(t.type)&&zi(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return Jo(),Ti(Mi),Ti(Ii),ra(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Zo(t),null;case 13:if(Ti(ea),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));po()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Ti(ea),null;case 4:return Jo(),null;case 10:return Io(t.type._context),null;case 22:case 23:return fu(),null;default:return null}}Al=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Ol=function(){},zl=function(e,t,n,r){var i=e.memoizedProps;if(i!==r){e=t.stateNode,Qo(Wo.current);var o,a=null;switch(n){case"input":i=Q(e,i),r=Q(e,r),a=[];break;case"select":i=L({},i,{value:void 0}),r=L({},r,{value:void 0}),a=[];break;case"textarea":i=re(e,i),r=re(e,r),a=[];break;default:"function"!==typeof i.onClick&&"function"===typeof r.onClick&&(e.onclick=Zr)}for(c in ve(n,r),n=null,i)if(!r.hasOwnProperty(c)&&i.hasOwnProperty(c)&&null!=i[c])if("style"===c){var s=i[c];for(o in s)s.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(l.hasOwnProperty(c)?a||(a=[]):(a=a||[]).push(c,null));for(c in r){var u=r[c];if(s=null!=i?i[c]:void 0,r.hasOwnProperty(c)&&u!==s&&(null!=u||null!=s))if("style"===c)if(s){for(o in s)!s.hasOwnProperty(o)||u&&u.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in u)u.hasOwnProperty(o)&&s[o]!==u[o]&&(n||(n={}),n[o]=u[o])}else n||(a||(a=[]),a.push(c,n)),n=u;else"dangerouslySetInnerHTML"===c?(u=u?u.__html:void 0,s=s?s.__html:void 0,null!=u&&s!==u&&(a=a||[]).push(c,u)):"children"===c?"string"!==typeof u&&"number"!==typeof u||(a=a||[]).push(c,""+u):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(l.hasOwnProperty(c)?(null!=u&&"onScroll"===c&&Fr("scroll",e),a||s===u||(a=[])):(a=a||[]).push(c,u))}n&&(a=a||[]).push("style",n);var c=a;(t.updateQueue=c)&&(t.flags|=4)}},Dl=function(e,t,n,r){n!==r&&(t.flags|=4)};var Ql=!1,Gl=!1,Jl="function"===typeof WeakSet?WeakSet:Set,Kl=null;function Zl(e,t){var n=e.ref;if(null!==n)if("function"===typeof n)try{n(null)}catch(r){ku(e,t,r)}else n.current=null}function es(e,t,n){try{n()}catch(r){ku(e,t,r)}}var ts=!1;function ns(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&e)===e){var o=i.destroy;i.destroy=void 0,void 0!==o&&es(t,n,o)}i=i.next}while(i!==r)}}function rs(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function is(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"===typeof t?t(e):t.current=e}}function os(e){var t=e.alternate;null!==t&&(e.alternate=null,os(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&(delete t[di],delete t[hi],delete t[yi],delete t[mi],delete t[gi])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function as(e){return 5===e.tag||3===e.tag||4===e.tag}function ls(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||as(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function ss(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Zr));else if(4!==r&&null!==(e=e.child))for(ss(e,t,n),e=e.sibling;null!==e;)ss(e,t,n),e=e.sibling}function us(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(us(e,t,n),e=e.sibling;null!==e;)us(e,t,n),e=e.sibling}var cs=null,fs=!1;function ds(e,t,n){for(n=n.child;null!==n;)hs(e,t,n),n=n.sibling}function hs(e,t,n){if(ot&&"function"===typeof ot.onCommitFiberUnmount)try{ot.onCommitFiberUnmount(it,n)}catch(l){}switch(n.tag){case 5:Gl||Zl(n,t);case 6:var r=cs,i=fs;cs=null,ds(e,t,n),fs=i,null!==(cs=r)&&(fs?(e=cs,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):cs.removeChild(n.stateNode));break;case 18:null!==cs&&(fs?(e=cs,n=n.stateNode,8===e.nodeType?si(e.parentNode,n):1===e.nodeType&&si(e,n),jt(e)):si(cs,n.stateNode));break;case 4:r=cs,i=fs,cs=n.stateNode.containerInfo,fs=!0,ds(e,t,n),cs=r,fs=i;break;case 0:case 11:case 14:case 15:if(!Gl&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,void 0!==a&&(0!==(2&o)||0!==(4&o))&&es(n,t,a),i=i.next}while(i!==r)}ds(e,t,n);break;case 1:if(!Gl&&(Zl(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(l){ku(n,t,l)}ds(e,t,n);break;case 21:ds(e,t,n);break;case 22:1&n.mode?(Gl=(r=Gl)||null!==n.memoizedState,ds(e,t,n),Gl=r):ds(e,t,n);break;default:ds(e,t,n)}}function ps(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Jl),t.forEach(function(t){var r=Iu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}}function ys(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var a=e,l=t,s=l;e:for(;null!==s;){switch(s.tag){case 5:cs=s.stateNode,fs=!1;break e;case 3:case 4:cs=s.stateNode.containerInfo,fs=!0;break e}s=s.return}if(null===cs)throw Error(o(160));hs(a,l,i),cs=null,fs=!1;var u=i.alternate;null!==u&&(u.return=null),i.return=null}catch(c){ku(i,t,c)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)ms(t,e),t=t.sibling}function ms(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(ys(t,e),gs(e),4&r){try{ns(3,e,e.return),rs(3,e)}catch(m){ku(e,e.return,m)}try{ns(5,e,e.return)}catch(m){ku(e,e.return,m)}}break;case 1:ys(t,e),gs(e),512&r&&null!==n&&Zl(n,n.return);break;case 5:if(ys(t,e),gs(e),512&r&&null!==n&&Zl(n,n.return),32&e.flags){var i=e.stateNode;try{de(i,"")}catch(m){ku(e,e.return,m)}}if(4&r&&null!=(i=e.stateNode)){var a=e.memoizedProps,l=null!==n?n.memoizedProps:a,s=e.type,u=e.updateQueue;if(e.updateQueue=null,null!==u)try{"input"===s&&"radio"===a.type&&null!=a.name&&J(i,a),be(s,l);var c=be(s,a);for(l=0;l<u.length;l+=2){var f=u[l],d=u[l+1];"style"===f?me(i,d):"dangerouslySetInnerHTML"===f?fe(i,d):"children"===f?de(i,d):b(i,f,d,c)}switch(s){case"input":K(i,a);break;case"textarea":oe(i,a);break;case"select":var h=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!a.multiple;var p=a.value;null!=p?ne(i,!!a.multiple,p,!1):h!==!!a.multiple&&(null!=a.defaultValue?ne(i,!!a.multiple,a.defaultValue,!0):ne(i,!!a.multiple,a.multiple?[]:"",!1))}i[hi]=a}catch(m){ku(e,e.return,m)}}break;case 6:if(ys(t,e),gs(e),4&r){if(null===e.stateNode)throw Error(o(162));i=e.stateNode,a=e.memoizedProps;try{i.nodeValue=a}catch(m){ku(e,e.return,m)}}break;case 3:if(ys(t,e),gs(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{jt(t.containerInfo)}catch(m){ku(e,e.return,m)}break;case 4:default:ys(t,e),gs(e);break;case 13:ys(t,e),gs(e),8192&(i=e.child).flags&&(a=null!==i.memoizedState,i.stateNode.isHidden=a,!a||null!==i.alternate&&null!==i.alternate.memoizedState||(Us=Je())),4&r&&ps(e);break;case 22:if(f=null!==n&&null!==n.memoizedState,1&e.mode?(Gl=(c=Gl)||f,ys(t,e),Gl=c):ys(t,e),gs(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!f&&0!==(1&e.mode))for(Kl=e,f=e.child;null!==f;){for(d=Kl=f;null!==Kl;){switch(p=(h=Kl).child,h.tag){case 0:case 11:case 14:case 15:ns(4,h,h.return);break;case 1:Zl(h,h.return);var y=h.stateNode;if("function"===typeof y.componentWillUnmount){r=h,n=h.return;try{t=r,y.props=t.memoizedProps,y.state=t.memoizedState,y.componentWillUnmount()}catch(m){ku(r,n,m)}}break;case 5:Zl(h,h.return);break;case 22:if(null!==h.memoizedState){xs(d);continue}}null!==p?(p.return=h,Kl=p):xs(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{i=d.stateNode,c?"function"===typeof(a=i.style).setProperty?a.setProperty("display","none","important"):a.display="none":(s=d.stateNode,l=void 0!==(u=d.memoizedProps.style)&&null!==u&&u.hasOwnProperty("display")?u.display:null,s.style.display=ye("display",l))}catch(m){ku(e,e.return,m)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=c?"":d.memoizedProps}catch(m){ku(e,e.return,m)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:ys(t,e),gs(e),4&r&&ps(e);case 21:}}function gs(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(as(n)){var r=n;break e}n=n.return}throw Error(o(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(de(i,""),r.flags&=-33),us(e,ls(e),i);break;case 3:case 4:var a=r.stateNode.containerInfo;ss(e,ls(e),a);break;default:throw Error(o(161))}}catch(l){ku(e,e.return,l)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function vs(e,t,n){Kl=e,bs(e,t,n)}function bs(e,t,n){for(var r=0!==(1&e.mode);null!==Kl;){var i=Kl,o=i.child;if(22===i.tag&&r){var a=null!==i.memoizedState||Ql;if(!a){var l=i.alternate,s=null!==l&&null!==l.memoizedState||Gl;l=Ql;var u=Gl;if(Ql=a,(Gl=s)&&!u)for(Kl=i;null!==Kl;)s=(a=Kl).child,22===a.tag&&null!==a.memoizedState?Ss(i):null!==s?(s.return=a,Kl=s):Ss(i);for(;null!==o;)Kl=o,bs(o,t,n),o=o.sibling;Kl=i,Ql=l,Gl=u}ws(e)}else 0!==(8772&i.subtreeFlags)&&null!==o?(o.return=i,Kl=o):ws(e)}}function ws(e){for(;null!==Kl;){var t=Kl;if(0!==(8772&t.flags)){var n=t.alternate;try{if(0!==(8772&t.flags))switch(t.tag){case 0:case 11:case 15:Gl||rs(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Gl)if(null===n)r.componentDidMount();else{var i=t.elementType===t.type?n.memoizedProps:nl(t.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var a=t.updateQueue;null!==a&&Ho(t,a,r);break;case 3:var l=t.updateQueue;if(null!==l){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}Ho(t,l,n)}break;case 5:var s=t.stateNode;if(null===n&&4&t.flags){n=s;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&n.focus();break;case"img":u.src&&(n.src=u.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var c=t.alternate;if(null!==c){var f=c.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&jt(d)}}}break;default:throw Error(o(163))}Gl||512&t.flags&&is(t)}catch(h){ku(t,t.return,h)}}if(t===e){Kl=null;break}if(null!==(n=t.sibling)){n.return=t.return,Kl=n;break}Kl=t.return}}function xs(e){for(;null!==Kl;){var t=Kl;if(t===e){Kl=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Kl=n;break}Kl=t.return}}function Ss(e){for(;null!==Kl;){var t=Kl;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{rs(4,t)}catch(s){ku(t,n,s)}break;case 1:var r=t.stateNode;if("function"===typeof r.componentDidMount){var i=t.return;try{r.componentDidMount()}catch(s){ku(t,i,s)}}var o=t.return;try{is(t)}catch(s){ku(t,o,s)}break;case 5:var a=t.return;try{is(t)}catch(s){ku(t,a,s)}}}catch(s){ku(t,t.return,s)}if(t===e){Kl=null;break}var l=t.sibling;if(null!==l){l.return=t.return,Kl=l;break}Kl=t.return}}var _s,ks=Math.ceil,Ts=w.ReactCurrentDispatcher,Es=w.ReactCurrentOwner,Cs=w.ReactCurrentBatchConfig,Is=0,Ms=null,Ns=null,As=0,Os=0,zs=ki(0),Ds=0,$s=null,Ps=0,Ls=0,Bs=0,Fs=null,Rs=null,Us=0,js=1/0,Vs=null,Hs=!1,Ys=null,Ws=null,Xs=!1,qs=null,Qs=0,Gs=0,Js=null,Ks=-1,Zs=0;function eu(){return 0!==(6&Is)?Je():-1!==Ks?Ks:Ks=Je()}function tu(e){return 0===(1&e.mode)?1:0!==(2&Is)&&0!==As?As&-As:null!==mo.transition?(0===Zs&&(Zs=yt()),Zs):0!==(e=bt)?e:e=void 0===(e=window.event)?16:Gt(e.type)}function nu(e,t,n,r){if(50<Gs)throw Gs=0,Js=null,Error(o(185));gt(e,n,r),0!==(2&Is)&&e===Ms||(e===Ms&&(0===(2&Is)&&(Ls|=n),4===Ds&&lu(e,As)),ru(e,r),1===n&&0===Is&&0===(1&t.mode)&&(js=Je()+500,Fi&&ji()))}function ru(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,i=e.expirationTimes,o=e.pendingLanes;0<o;){var a=31-at(o),l=1<<a,s=i[a];-1===s?0!==(l&n)&&0===(l&r)||(i[a]=ht(l,t)):s<=t&&(e.expiredLanes|=l),o&=~l}}(e,t);var r=dt(e,e===Ms?As:0);if(0===r)null!==n&&qe(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&qe(n),1===t)0===e.tag?function(e){Fi=!0,Ui(e)}(su.bind(null,e)):Ui(su.bind(null,e)),ai(function(){0===(6&Is)&&ji()}),n=null;else{switch(wt(r)){case 1:n=Ze;break;case 4:n=et;break;case 16:default:n=tt;break;case 536870912:n=rt}n=Mu(n,iu.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function iu(e,t){if(Ks=-1,Zs=0,0!==(6&Is))throw Error(o(327));var n=e.callbackNode;if(Su()&&e.callbackNode!==n)return null;var r=dt(e,e===Ms?As:0);if(0===r)return null;if(0!==(30&r)||0!==(r&e.expiredLanes)||t)t=mu(e,r);else{t=r;var i=Is;Is|=2;var a=pu();for(Ms===e&&As===t||(Vs=null,js=Je()+500,du(e,t));;)try{vu();break}catch(s){hu(e,s)}Co(),Ts.current=a,Is=i,null!==Ns?t=0:(Ms=null,As=0,t=Ds)}if(0!==t){if(2===t&&(0!==(i=pt(e))&&(r=i,t=ou(e,i))),1===t)throw n=$s,du(e,0),lu(e,r),ru(e,Je()),n;if(6===t)lu(e,r);else{if(i=e.current.alternate,0===(30&r)&&!function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!lr(o(),i))return!1}catch(l){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(i)&&(2===(t=mu(e,r))&&(0!==(a=pt(e))&&(r=a,t=ou(e,a))),1===t))throw n=$s,du(e,0),lu(e,r),ru(e,Je()),n;switch(e.finishedWork=i,e.finishedLanes=r,t){case 0:case 1:throw Error(o(345));case 2:case 5:xu(e,Rs,Vs);break;case 3:if(lu(e,r),(130023424&r)===r&&10<(t=Us+500-Je())){if(0!==dt(e,0))break;if(((i=e.suspendedLanes)&r)!==r){eu(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=ri(xu.bind(null,e,Rs,Vs),t);break}xu(e,Rs,Vs);break;case 4:if(lu(e,r),(4194240&r)===r)break;for(t=e.eventTimes,i=-1;0<r;){var l=31-at(r);a=1<<l,(l=t[l])>i&&(i=l),r&=~a}if(r=i,10<(r=(120>(r=Je()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*ks(r/1960))-r)){e.timeoutHandle=ri(xu.bind(null,e,Rs,Vs),r);break}xu(e,Rs,Vs);break;default:throw Error(o(329))}}}return ru(e,Je()),e.callbackNode===n?iu.bind(null,e):null}function ou(e,t){var n=Fs;return e.current.memoizedState.isDehydrated&&(du(e,t).flags|=256),2!==(e=mu(e,t))&&(t=Rs,Rs=n,null!==t&&au(t)),e}function au(e){null===Rs?Rs=e:Rs.push.apply(Rs,e)}function lu(e,t){for(t&=~Bs,t&=~Ls,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-at(t),r=1<<n;e[n]=-1,t&=~r}}function su(e){if(0!==(6&Is))throw Error(o(327));Su();var t=dt(e,0);if(0===(1&t))return ru(e,Je()),null;var n=mu(e,t);if(0!==e.tag&&2===n){var r=pt(e);0!==r&&(t=r,n=ou(e,r))}if(1===n)throw n=$s,du(e,0),lu(e,t),ru(e,Je()),n;if(6===n)throw Error(o(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,xu(e,Rs,Vs),ru(e,Je()),null}function uu(e,t){var n=Is;Is|=1;try{return e(t)}finally{0===(Is=n)&&(js=Je()+500,Fi&&ji())}}function cu(e){null!==qs&&0===qs.tag&&0===(6&Is)&&Su();var t=Is;Is|=1;var n=Cs.transition,r=bt;try{if(Cs.transition=null,bt=1,e)return e()}finally{bt=r,Cs.transition=n,0===(6&(Is=t))&&ji()}}function fu(){Os=zs.current,Ti(zs)}function du(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,ii(n)),null!==Ns)for(n=Ns.return;null!==n;){var r=n;switch(to(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&zi();break;case 3:Jo(),Ti(Mi),Ti(Ii),ra();break;case 5:Zo(r);break;case 4:Jo();break;case 13:case 19:Ti(ea);break;case 10:Io(r.type._context);break;case 22:case 23:fu()}n=n.return}if(Ms=e,Ns=e=zu(e.current,null),As=Os=t,Ds=0,$s=null,Bs=Ls=Ps=0,Rs=Fs=null,null!==Oo){for(t=0;t<Oo.length;t++)if(null!==(r=(n=Oo[t]).interleaved)){n.interleaved=null;var i=r.next,o=n.pending;if(null!==o){var a=o.next;o.next=i,r.next=a}n.pending=r}Oo=null}return e}function hu(e,t){for(;;){var n=Ns;try{if(Co(),ia.current=Ka,ca){for(var r=la.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}ca=!1}if(aa=0,ua=sa=la=null,fa=!1,da=0,Es.current=null,null===n||null===n.return){Ds=1,$s=t,Ns=null;break}e:{var a=e,l=n.return,s=n,u=t;if(t=As,s.flags|=32768,null!==u&&"object"===typeof u&&"function"===typeof u.then){var c=u,f=s,d=f.tag;if(0===(1&f.mode)&&(0===d||11===d||15===d)){var h=f.alternate;h?(f.updateQueue=h.updateQueue,f.memoizedState=h.memoizedState,f.lanes=h.lanes):(f.updateQueue=null,f.memoizedState=null)}var p=ml(l);if(null!==p){p.flags&=-257,gl(p,l,s,0,t),1&p.mode&&yl(a,c,t),u=c;var y=(t=p).updateQueue;if(null===y){var m=new Set;m.add(u),t.updateQueue=m}else y.add(u);break e}if(0===(1&t)){yl(a,c,t),yu();break e}u=Error(o(426))}else if(io&&1&s.mode){var g=ml(l);if(null!==g){0===(65536&g.flags)&&(g.flags|=256),gl(g,l,s,0,t),yo(ul(u,s));break e}}a=u=ul(u,s),4!==Ds&&(Ds=2),null===Fs?Fs=[a]:Fs.push(a),a=l;do{switch(a.tag){case 3:a.flags|=65536,t&=-t,a.lanes|=t,jo(a,hl(0,u,t));break e;case 1:s=u;var v=a.type,b=a.stateNode;if(0===(128&a.flags)&&("function"===typeof v.getDerivedStateFromError||null!==b&&"function"===typeof b.componentDidCatch&&(null===Ws||!Ws.has(b)))){a.flags|=65536,t&=-t,a.lanes|=t,jo(a,pl(a,s,t));break e}}a=a.return}while(null!==a)}wu(n)}catch(w){t=w,Ns===n&&null!==n&&(Ns=n=n.return);continue}break}}function pu(){var e=Ts.current;return Ts.current=Ka,null===e?Ka:e}function yu(){0!==Ds&&3!==Ds&&2!==Ds||(Ds=4),null===Ms||0===(268435455&Ps)&&0===(268435455&Ls)||lu(Ms,As)}function mu(e,t){var n=Is;Is|=2;var r=pu();for(Ms===e&&As===t||(Vs=null,du(e,t));;)try{gu();break}catch(i){hu(e,i)}if(Co(),Is=n,Ts.current=r,null!==Ns)throw Error(o(261));return Ms=null,As=0,Ds}function gu(){for(;null!==Ns;)bu(Ns)}function vu(){for(;null!==Ns&&!Qe();)bu(Ns)}function bu(e){var t=_s(e.alternate,e,Os);e.memoizedProps=e.pendingProps,null===t?wu(e):Ns=t,Es.current=null}function wu(e){var t=e;do{var n=t.alternate;if(e=t.return,0===(32768&t.flags)){if(null!==(n=Xl(n,t,Os)))return void(Ns=n)}else{if(null!==(n=ql(n,t)))return n.flags&=32767,void(Ns=n);if(null===e)return Ds=6,void(Ns=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(t=t.sibling))return void(Ns=t);Ns=t=e}while(null!==t);0===Ds&&(Ds=5)}function xu(e,t,n){var r=bt,i=Cs.transition;try{Cs.transition=null,bt=1,function(e,t,n,r){do{Su()}while(null!==qs);if(0!==(6&Is))throw Error(o(327));n=e.finishedWork;var i=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(o(177));e.callbackNode=null,e.callbackPriority=0;var a=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var i=31-at(n),o=1<<i;t[i]=0,r[i]=-1,e[i]=-1,n&=~o}}(e,a),e===Ms&&(Ns=Ms=null,As=0),0===(2064&n.subtreeFlags)&&0===(2064&n.flags)||Xs||(Xs=!0,Mu(tt,function(){return Su(),null})),a=0!==(15990&n.flags),0!==(15990&n.subtreeFlags)||a){a=Cs.transition,Cs.transition=null;var l=bt;bt=1;var s=Is;Is|=4,Es.current=null,function(e,t){if(ei=Ht,hr(e=dr())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,a=r.focusNode;r=r.focusOffset;try{n.nodeType,a.nodeType}catch(x){n=null;break e}var l=0,s=-1,u=-1,c=0,f=0,d=e,h=null;t:for(;;){for(var p;d!==n||0!==i&&3!==d.nodeType||(s=l+i),d!==a||0!==r&&3!==d.nodeType||(u=l+r),3===d.nodeType&&(l+=d.nodeValue.length),null!==(p=d.firstChild);)h=d,d=p;for(;;){if(d===e)break t;if(h===n&&++c===i&&(s=l),h===a&&++f===r&&(u=l),null!==(p=d.nextSibling))break;h=(d=h).parentNode}d=p}n=-1===s||-1===u?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(ti={focusedElem:e,selectionRange:n},Ht=!1,Kl=t;null!==Kl;)if(e=(t=Kl).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,Kl=e;else for(;null!==Kl;){t=Kl;try{var y=t.alternate;if(0!==(1024&t.flags))switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==y){var m=y.memoizedProps,g=y.memoizedState,v=t.stateNode,b=v.getSnapshotBeforeUpdate(t.elementType===t.type?m:nl(t.type,m),g);v.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var w=t.stateNode.containerInfo;1===w.nodeType?w.textContent="":9===w.nodeType&&w.documentElement&&w.removeChild(w.documentElement);break;default:throw Error(o(163))}}catch(x){ku(t,t.return,x)}if(null!==(e=t.sibling)){e.return=t.return,Kl=e;break}Kl=t.return}y=ts,ts=!1}(e,n),ms(n,e),pr(ti),Ht=!!ei,ti=ei=null,e.current=n,vs(n,e,i),Ge(),Is=s,bt=l,Cs.transition=a}else e.current=n;if(Xs&&(Xs=!1,qs=e,Qs=i),a=e.pendingLanes,0===a&&(Ws=null),function(e){if(ot&&"function"===typeof ot.onCommitFiberRoot)try{ot.onCommitFiberRoot(it,e,void 0,128===(128&e.current.flags))}catch(t){}}(n.stateNode),ru(e,Je()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)i=t[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(Hs)throw Hs=!1,e=Ys,Ys=null,e;0!==(1&Qs)&&0!==e.tag&&Su(),a=e.pendingLanes,0!==(1&a)?e===Js?Gs++:(Gs=0,Js=e):Gs=0,ji()}(e,t,n,r)}finally{Cs.transition=i,bt=r}return null}function Su(){if(null!==qs){var e=wt(Qs),t=Cs.transition,n=bt;try{if(Cs.transition=null,bt=16>e?16:e,null===qs)var r=!1;else{if(e=qs,qs=null,Qs=0,0!==(6&Is))throw Error(o(331));var i=Is;for(Is|=4,Kl=e.current;null!==Kl;){var a=Kl,l=a.child;if(0!==(16&Kl.flags)){var s=a.deletions;if(null!==s){for(var u=0;u<s.length;u++){var c=s[u];for(Kl=c;null!==Kl;){var f=Kl;switch(f.tag){case 0:case 11:case 15:ns(8,f,a)}var d=f.child;if(null!==d)d.return=f,Kl=d;else for(;null!==Kl;){var h=(f=Kl).sibling,p=f.return;if(os(f),f===c){Kl=null;break}if(null!==h){h.return=p,Kl=h;break}Kl=p}}}var y=a.alternate;if(null!==y){var m=y.child;if(null!==m){y.child=null;do{var g=m.sibling;m.sibling=null,m=g}while(null!==m)}}Kl=a}}if(0!==(2064&a.subtreeFlags)&&null!==l)l.return=a,Kl=l;else e:for(;null!==Kl;){if(0!==(2048&(a=Kl).flags))switch(a.tag){case 0:case 11:case 15:ns(9,a,a.return)}var v=a.sibling;if(null!==v){v.return=a.return,Kl=v;break e}Kl=a.return}}var b=e.current;for(Kl=b;null!==Kl;){var w=(l=Kl).child;if(0!==(2064&l.subtreeFlags)&&null!==w)w.return=l,Kl=w;else e:for(l=b;null!==Kl;){if(0!==(2048&(s=Kl).flags))try{switch(s.tag){case 0:case 11:case 15:rs(9,s)}}catch(S){ku(s,s.return,S)}if(s===l){Kl=null;break e}var x=s.sibling;if(null!==x){x.return=s.return,Kl=x;break e}Kl=s.return}}if(Is=i,ji(),ot&&"function"===typeof ot.onPostCommitFiberRoot)try{ot.onPostCommitFiberRoot(it,e)}catch(S){}r=!0}return r}finally{bt=n,Cs.transition=t}}return!1}function _u(e,t,n){e=Ro(e,t=hl(0,t=ul(n,t),1),1),t=eu(),null!==e&&(gt(e,1,t),ru(e,t))}function ku(e,t,n){if(3===e.tag)_u(e,e,n);else for(;null!==t;){if(3===t.tag){_u(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Ws||!Ws.has(r))){t=Ro(t,e=pl(t,e=ul(n,e),1),1),e=eu(),null!==t&&(gt(t,1,e),ru(t,e));break}}t=t.return}}function Tu(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=eu(),e.pingedLanes|=e.suspendedLanes&n,Ms===e&&(As&n)===n&&(4===Ds||3===Ds&&(130023424&As)===As&&500>Je()-Us?du(e,0):Bs|=n),ru(e,t)}function Eu(e,t){0===t&&(0===(1&e.mode)?t=1:(t=ct,0===(130023424&(ct<<=1))&&(ct=4194304)));var n=eu();null!==(e=$o(e,t))&&(gt(e,t,n),ru(e,n))}function Cu(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),Eu(e,n)}function Iu(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,i=e.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(o(314))}null!==r&&r.delete(t),Eu(e,n)}function Mu(e,t){return Xe(e,t)}function Nu(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Au(e,t,n,r){return new Nu(e,t,n,r)}function Ou(e){return!(!(e=e.prototype)||!e.isReactComponent)}function zu(e,t){var n=e.alternate;return null===n?((n=Au(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Du(e,t,n,r,i,a){var l=2;if(r=e,"function"===typeof e)Ou(e)&&(l=1);else if("string"===typeof e)l=5;else e:switch(e){case _:return $u(n.children,i,a,t);case k:l=8,i|=8;break;case T:return(e=Au(12,n,t,2|i)).elementType=T,e.lanes=a,e;case M:return(e=Au(13,n,t,i)).elementType=M,e.lanes=a,e;case N:return(e=Au(19,n,t,i)).elementType=N,e.lanes=a,e;case z:return Pu(n,i,a,t);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case E:l=10;break e;case C:l=9;break e;case I:l=11;break e;case A:l=14;break e;case O:l=16,r=null;break e}throw Error(o(130,null==e?e:typeof e,""))}return(t=Au(l,n,t,i)).elementType=e,t.type=r,t.lanes=a,t}function $u(e,t,n,r){return(e=Au(7,e,r,t)).lanes=n,e}function Pu(e,t,n,r){return(e=Au(22,e,r,t)).elementType=z,e.lanes=n,e.stateNode={isHidden:!1},e}function Lu(e,t,n){return(e=Au(6,e,null,t)).lanes=n,e}function Bu(e,t,n){return(t=Au(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Fu(e,t,n,r,i){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=mt(0),this.expirationTimes=mt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=mt(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function Ru(e,t,n,r,i,o,a,l,s){return e=new Fu(e,t,n,l,s),1===t?(t=1,!0===o&&(t|=8)):t=0,o=Au(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Lo(o),e}function Uu(e){if(!e)return Ci;e:{if(je(e=e._reactInternals)!==e||1!==e.tag)throw Error(o(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Oi(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(o(171))}if(1===e.tag){var n=e.type;if(Oi(n))return $i(e,n,t)}return t}function ju(e,t,n,r,i,o,a,l,s){return(e=Ru(n,r,!0,e,0,o,0,l,s)).context=Uu(null),n=e.current,(o=Fo(r=eu(),i=tu(n))).callback=void 0!==t&&null!==t?t:null,Ro(n,o,i),e.current.lanes=i,gt(e,i,r),ru(e,r),e}function Vu(e,t,n,r){var i=t.current,o=eu(),a=tu(i);return n=Uu(n),null===t.context?t.context=n:t.pendingContext=n,(t=Fo(o,a)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Ro(i,t,a))&&(nu(e,i,a,o),Uo(e,i,a)),a}function Hu(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Yu(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Wu(e,t){Yu(e,t),(e=e.alternate)&&Yu(e,t)}_s=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||Mi.current)bl=!0;else{if(0===(e.lanes&n)&&0===(128&t.flags))return bl=!1,function(e,t,n){switch(t.tag){case 3:Ml(t),po();break;case 5:Ko(t);break;case 1:Oi(t.type)&&Pi(t);break;case 4:Go(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,i=t.memoizedProps.value;Ei(_o,r._currentValue),r._currentValue=i;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(Ei(ea,1&ea.current),t.flags|=128,null):0!==(n&t.child.childLanes)?Ll(e,t,n):(Ei(ea,1&ea.current),null!==(e=Hl(e,t,n))?e.sibling:null);Ei(ea,1&ea.current);break;case 19:if(r=0!==(n&t.childLanes),0!==(128&e.flags)){if(r)return jl(e,t,n);t.flags|=128}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),Ei(ea,ea.current),r)break;return null;case 22:case 23:return t.lanes=0,kl(e,t,n)}return Hl(e,t,n)}(e,t,n);bl=0!==(131072&e.flags)}else bl=!1,io&&0!==(1048576&t.flags)&&Zi(t,Wi,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vl(e,t),e=t.pendingProps;var i=Ai(t,Ii.current);No(t,n),i=ma(null,t,r,e,i,n);var a=ga();return t.flags|=1,"object"===typeof i&&null!==i&&"function"===typeof i.render&&void 0===i.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Oi(r)?(a=!0,Pi(t)):a=!1,t.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,Lo(t),i.updater=il,t.stateNode=i,i._reactInternals=t,sl(t,r,e,n),t=Il(null,t,r,!0,a,n)):(t.tag=0,io&&a&&eo(t),wl(null,t,i,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vl(e,t),e=t.pendingProps,r=(i=r._init)(r._payload),t.type=r,i=t.tag=function(e){if("function"===typeof e)return Ou(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===I)return 11;if(e===A)return 14}return 2}(r),e=nl(r,e),i){case 0:t=El(null,t,r,e,n);break e;case 1:t=Cl(null,t,r,e,n);break e;case 11:t=xl(null,t,r,e,n);break e;case 14:t=Sl(null,t,r,nl(r.type,e),n);break e}throw Error(o(306,r,""))}return t;case 0:return r=t.type,i=t.pendingProps,El(e,t,r,i=t.elementType===r?i:nl(r,i),n);case 1:return r=t.type,i=t.pendingProps,Cl(e,t,r,i=t.elementType===r?i:nl(r,i),n);case 3:e:{if(Ml(t),null===e)throw Error(o(387));r=t.pendingProps,i=(a=t.memoizedState).element,Bo(e,t),Vo(t,r,null,n);var l=t.memoizedState;if(r=l.element,a.isDehydrated){if(a={element:r,isDehydrated:!1,cache:l.cache,pendingSuspenseBoundaries:l.pendingSuspenseBoundaries,transitions:l.transitions},t.updateQueue.baseState=a,t.memoizedState=a,256&t.flags){t=Nl(e,t,r,n,i=ul(Error(o(423)),t));break e}if(r!==i){t=Nl(e,t,r,n,i=ul(Error(o(424)),t));break e}for(ro=ui(t.stateNode.containerInfo.firstChild),no=t,io=!0,oo=null,n=So(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(po(),r===i){t=Hl(e,t,n);break e}wl(e,t,r,n)}t=t.child}return t;case 5:return Ko(t),null===e&&uo(t),r=t.type,i=t.pendingProps,a=null!==e?e.memoizedProps:null,l=i.children,ni(r,i)?l=null:null!==a&&ni(r,a)&&(t.flags|=32),Tl(e,t),wl(e,t,l,n),t.child;case 6:return null===e&&uo(t),null;case 13:return Ll(e,t,n);case 4:return Go(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=xo(t,null,r,n):wl(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,xl(e,t,r,i=t.elementType===r?i:nl(r,i),n);case 7:return wl(e,t,t.pendingProps,n),t.child;case 8:case 12:return wl(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,i=t.pendingProps,a=t.memoizedProps,l=i.value,Ei(_o,r._currentValue),r._currentValue=l,null!==a)if(lr(a.value,l)){if(a.children===i.children&&!Mi.current){t=Hl(e,t,n);break e}}else for(null!==(a=t.child)&&(a.return=t);null!==a;){var s=a.dependencies;if(null!==s){l=a.child;for(var u=s.firstContext;null!==u;){if(u.context===r){if(1===a.tag){(u=Fo(-1,n&-n)).tag=2;var c=a.updateQueue;if(null!==c){var f=(c=c.shared).pending;null===f?u.next=u:(u.next=f.next,f.next=u),c.pending=u}}a.lanes|=n,null!==(u=a.alternate)&&(u.lanes|=n),Mo(a.return,n,t),s.lanes|=n;break}u=u.next}}else if(10===a.tag)l=a.type===t.type?null:a.child;else if(18===a.tag){if(null===(l=a.return))throw Error(o(341));l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),Mo(l,n,t),l=a.sibling}else l=a.child;if(null!==l)l.return=a;else for(l=a;null!==l;){if(l===t){l=null;break}if(null!==(a=l.sibling)){a.return=l.return,l=a;break}l=l.return}a=l}wl(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=t.pendingProps.children,No(t,n),r=r(i=Ao(i)),t.flags|=1,wl(e,t,r,n),t.child;case 14:return i=nl(r=t.type,t.pendingProps),Sl(e,t,r,i=nl(r.type,i),n);case 15:return _l(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:nl(r,i),Vl(e,t),t.tag=1,Oi(r)?(e=!0,Pi(t)):e=!1,No(t,n),al(t,r,i),sl(t,r,i,n),Il(null,t,r,!0,e,n);case 19:return jl(e,t,n);case 22:return kl(e,t,n)}throw Error(o(156,t.tag))};var Xu="function"===typeof reportError?reportError:function(e){console.error(e)};function qu(e){this._internalRoot=e}function Qu(e){this._internalRoot=e}function Gu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Ju(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Ku(){}function Zu(e,t,n,r,i){var o=n._reactRootContainer;if(o){var a=o;if("function"===typeof i){var l=i;i=function(){var e=Hu(a);l.call(e)}}Vu(t,a,e,i)}else a=function(e,t,n,r,i){if(i){if("function"===typeof r){var o=r;r=function(){var e=Hu(a);o.call(e)}}var a=ju(t,r,e,0,null,!1,0,"",Ku);return e._reactRootContainer=a,e[pi]=a.current,jr(8===e.nodeType?e.parentNode:e),cu(),a}for(;i=e.lastChild;)e.removeChild(i);if("function"===typeof r){var l=r;r=function(){var e=Hu(s);l.call(e)}}var s=Ru(e,0,!1,null,0,!1,0,"",Ku);return e._reactRootContainer=s,e[pi]=s.current,jr(8===e.nodeType?e.parentNode:e),cu(function(){Vu(t,s,n,r)}),s}(n,t,e,i,r);return Hu(a)}Qu.prototype.render=qu.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Vu(e,t,null,null)},Qu.prototype.unmount=qu.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;cu(function(){Vu(null,e,null,null)}),t[pi]=null}},Qu.prototype.unstable_scheduleHydration=function(e){if(e){var t=kt();e={blockedOn:null,target:e,priority:t};for(var n=0;n<zt.length&&0!==t&&t<zt[n].priority;n++);zt.splice(n,0,e),0===n&&Lt(e)}},xt=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=ft(t.pendingLanes);0!==n&&(vt(t,1|n),ru(t,Je()),0===(6&Is)&&(js=Je()+500,ji()))}break;case 13:cu(function(){var t=$o(e,1);if(null!==t){var n=eu();nu(t,e,1,n)}}),Wu(e,1)}},St=function(e){if(13===e.tag){var t=$o(e,134217728);if(null!==t)nu(t,e,134217728,eu());Wu(e,134217728)}},_t=function(e){if(13===e.tag){var t=tu(e),n=$o(e,t);if(null!==n)nu(n,e,t,eu());Wu(e,t)}},kt=function(){return bt},Tt=function(e,t){var n=bt;try{return bt=e,t()}finally{bt=n}},Se=function(e,t,n){switch(t){case"input":if(K(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=xi(r);if(!i)throw Error(o(90));X(r),K(r,i)}}}break;case"textarea":oe(e,n);break;case"select":null!=(t=n.value)&&ne(e,!!n.multiple,t,!1)}},Ie=uu,Me=cu;var ec={usingClientEntryPoint:!1,Events:[bi,wi,xi,Ee,Ce,uu]},tc={findFiberByHostInstance:vi,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nc={bundleType:tc.bundleType,version:tc.version,rendererPackageName:tc.rendererPackageName,rendererConfig:tc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:w.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Ye(e))?null:e.stateNode},findFiberByHostInstance:tc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var rc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!rc.isDisabled&&rc.supportsFiber)try{it=rc.inject(nc),ot=rc}catch(ce){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=ec,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Gu(t))throw Error(o(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:S,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.createRoot=function(e,t){if(!Gu(e))throw Error(o(299));var n=!1,r="",i=Xu;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),t=Ru(e,1,!1,null,0,n,0,r,i),e[pi]=t.current,jr(8===e.nodeType?e.parentNode:e),new qu(t)},t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=null===(e=Ye(t))?null:e.stateNode},t.flushSync=function(e){return cu(e)},t.hydrate=function(e,t,n){if(!Ju(t))throw Error(o(200));return Zu(null,e,t,!0,n)},t.hydrateRoot=function(e,t,n){if(!Gu(e))throw Error(o(405));var r=null!=n&&n.hydratedSources||null,i=!1,a="",l=Xu;if(null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(i=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),t=ju(t,null,e,1,null!=n?n:null,i,0,a,l),e[pi]=t.current,jr(e),r)for(e=0;e<r.length;e++)i=(i=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,i]:t.mutableSourceEagerHydrationData.push(n,i);return new Qu(t)},t.render=function(e,t,n){if(!Ju(t))throw Error(o(200));return Zu(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Ju(e))throw Error(o(40));return!!e._reactRootContainer&&(cu(function(){Zu(null,null,e,!1,function(){e._reactRootContainer=null,e[pi]=null})}),!0)},t.unstable_batchedUpdates=uu,t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Ju(n))throw Error(o(200));if(null==e||void 0===e._reactInternals)throw Error(o(38));return Zu(e,t,n,!1,r)},t.version="18.3.1-next-f1338f8080-20240426"},739:(e,t,n)=>{var r=n(123),i="function"===typeof Symbol&&Symbol.for,o=i?Symbol.for("react.element"):60103,a=i?Symbol.for("react.portal"):60106,l=i?Symbol.for("react.fragment"):60107,s=i?Symbol.for("react.strict_mode"):60108,u=i?Symbol.for("react.profiler"):60114,c=i?Symbol.for("react.provider"):60109,f=i?Symbol.for("react.context"):60110,d=i?Symbol.for("react.forward_ref"):60112,h=i?Symbol.for("react.suspense"):60113,p=i?Symbol.for("react.memo"):60115,y=i?Symbol.for("react.lazy"):60116,m="function"===typeof Symbol&&Symbol.iterator;function g(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var v={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},b={};function w(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||v}function x(){}function S(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||v}w.prototype.isReactComponent={},w.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error(g(85));this.updater.enqueueSetState(this,e,t,"setState")},w.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},x.prototype=w.prototype;var _=S.prototype=new x;_.constructor=S,r(_,w.prototype),_.isPureReactComponent=!0;var k={current:null},T=Object.prototype.hasOwnProperty,E={key:!0,ref:!0,__self:!0,__source:!0};function C(e,t,n){var r,i={},a=null,l=null;if(null!=t)for(r in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)T.call(t,r)&&!E.hasOwnProperty(r)&&(i[r]=t[r]);var s=arguments.length-2;if(1===s)i.children=n;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];i.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===i[r]&&(i[r]=s[r]);return{$$typeof:o,type:e,key:a,ref:l,props:i,_owner:k.current}}function I(e){return"object"===typeof e&&null!==e&&e.$$typeof===o}var M=/\/+/g,N=[];function A(e,t,n,r){if(N.length){var i=N.pop();return i.result=e,i.keyPrefix=t,i.func=n,i.context=r,i.count=0,i}return{result:e,keyPrefix:t,func:n,context:r,count:0}}function O(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>N.length&&N.push(e)}function z(e,t,n,r){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var l=!1;if(null===e)l=!0;else switch(i){case"string":case"number":l=!0;break;case"object":switch(e.$$typeof){case o:case a:l=!0}}if(l)return n(r,e,""===t?"."+$(e,0):t),1;if(l=0,t=""===t?".":t+":",Array.isArray(e))for(var s=0;s<e.length;s++){var u=t+$(i=e[s],s);l+=z(i,u,n,r)}else if(null===e||"object"!==typeof e?u=null:u="function"===typeof(u=m&&e[m]||e["@@iterator"])?u:null,"function"===typeof u)for(e=u.call(e),s=0;!(i=e.next()).done;)l+=z(i=i.value,u=t+$(i,s++),n,r);else if("object"===i)throw n=""+e,Error(g(31,"[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n,""));return l}function D(e,t,n){return null==e?0:z(e,"",t,n)}function $(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,function(e){return t[e]})}(e.key):t.toString(36)}function P(e,t){e.func.call(e.context,t,e.count++)}function L(e,t,n){var r=e.result,i=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?B(e,r,n,function(e){return e}):null!=e&&(I(e)&&(e=function(e,t){return{$$typeof:o,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(e,i+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(M,"$&/")+"/")+n)),r.push(e))}function B(e,t,n,r,i){var o="";null!=n&&(o=(""+n).replace(M,"$&/")+"/"),D(e,L,t=A(t,o,r,i)),O(t)}var F={current:null};function R(){var e=F.current;if(null===e)throw Error(g(321));return e}var U={ReactCurrentDispatcher:F,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:k,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:function(e,t,n){if(null==e)return e;var r=[];return B(e,r,null,t,n),r},forEach:function(e,t,n){if(null==e)return e;D(e,P,t=A(null,null,t,n)),O(t)},count:function(e){return D(e,function(){return null},null)},toArray:function(e){var t=[];return B(e,t,null,function(e){return e}),t},only:function(e){if(!I(e))throw Error(g(143));return e}},t.Component=w,t.Fragment=l,t.Profiler=u,t.PureComponent=S,t.StrictMode=s,t.Suspense=h,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=U,t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error(g(267,e));var i=r({},e.props),a=e.key,l=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,s=k.current),void 0!==t.key&&(a=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)T.call(t,c)&&!E.hasOwnProperty(c)&&(i[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)i.children=n;else if(1<c){u=Array(c);for(var f=0;f<c;f++)u[f]=arguments[f+2];i.children=u}return{$$typeof:o,type:e.type,key:a,ref:l,props:i,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:f,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:c,_context:e},e.Consumer=e},t.createElement=C,t.createFactory=function(e){var t=C.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:d,render:e}},t.isValidElement=I,t.lazy=function(e){return{$$typeof:y,_ctor:e,_status:-1,_result:null}},t.memo=function(e,t){return{$$typeof:p,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return R().useCallback(e,t)},t.useContext=function(e,t){return R().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return R().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return R().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return R().useLayoutEffect(e,t)},t.useMemo=function(e,t){return R().useMemo(e,t)},t.useReducer=function(e,t,n){return R().useReducer(e,t,n)},t.useRef=function(e){return R().useRef(e)},t.useState=function(e){return R().useState(e)},t.version="16.14.0"},853:(e,t,n)=>{e.exports=n(234)},904:(e,t,n)=>{e.exports=n(739)},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(730)}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={exports:{}};return e[r](o,o.exports,n),o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t);var r=n(43),i=n(391),o=n(219),a=n.n(o),l=n(904);const s=new WeakMap,u=new WeakMap;function c(e){const t=s.get(e);return console.assert(null!=t,"'this' is expected an Event object, but got",e),t}function f(e){null==e.passiveListener?e.event.cancelable&&(e.canceled=!0,"function"===typeof e.event.preventDefault&&e.event.preventDefault()):"undefined"!==typeof console&&"function"===typeof console.error&&console.error("Unable to preventDefault inside passive event listener invocation.",e.passiveListener)}function d(e,t){s.set(this,{eventTarget:e,event:t,eventPhase:2,currentTarget:e,canceled:!1,stopped:!1,immediateStopped:!1,passiveListener:null,timeStamp:t.timeStamp||Date.now()}),Object.defineProperty(this,"isTrusted",{value:!1,enumerable:!0});const n=Object.keys(t);for(let r=0;r<n.length;++r){const e=n[r];e in this||Object.defineProperty(this,e,h(e))}}function h(e){return{get(){return c(this).event[e]},set(t){c(this).event[e]=t},configurable:!0,enumerable:!0}}function p(e){return{value(){const t=c(this).event;return t[e].apply(t,arguments)},configurable:!0,enumerable:!0}}function y(e){if(null==e||e===Object.prototype)return d;let t=u.get(e);return null==t&&(t=function(e,t){const n=Object.keys(t);if(0===n.length)return e;function r(t,n){e.call(this,t,n)}r.prototype=Object.create(e.prototype,{constructor:{value:r,configurable:!0,writable:!0}});for(let i=0;i<n.length;++i){const o=n[i];if(!(o in e.prototype)){const e="function"===typeof Object.getOwnPropertyDescriptor(t,o).value;Object.defineProperty(r.prototype,o,e?p(o):h(o))}}return r}(y(Object.getPrototypeOf(e)),e),u.set(e,t)),t}function m(e){return c(e).immediateStopped}function g(e,t){c(e).passiveListener=t}d.prototype={get type(){return c(this).event.type},get target(){return c(this).eventTarget},get currentTarget(){return c(this).currentTarget},composedPath(){const e=c(this).currentTarget;return null==e?[]:[e]},get NONE(){return 0},get CAPTURING_PHASE(){return 1},get AT_TARGET(){return 2},get BUBBLING_PHASE(){return 3},get eventPhase(){return c(this).eventPhase},stopPropagation(){const e=c(this);e.stopped=!0,"function"===typeof e.event.stopPropagation&&e.event.stopPropagation()},stopImmediatePropagation(){const e=c(this);e.stopped=!0,e.immediateStopped=!0,"function"===typeof e.event.stopImmediatePropagation&&e.event.stopImmediatePropagation()},get bubbles(){return Boolean(c(this).event.bubbles)},get cancelable(){return Boolean(c(this).event.cancelable)},preventDefault(){f(c(this))},get defaultPrevented(){return c(this).canceled},get composed(){return Boolean(c(this).event.composed)},get timeStamp(){return c(this).timeStamp},get srcElement(){return c(this).eventTarget},get cancelBubble(){return c(this).stopped},set cancelBubble(e){if(!e)return;const t=c(this);t.stopped=!0,"boolean"===typeof t.event.cancelBubble&&(t.event.cancelBubble=!0)},get returnValue(){return!c(this).canceled},set returnValue(e){e||f(c(this))},initEvent(){}},Object.defineProperty(d.prototype,"constructor",{value:d,configurable:!0,writable:!0}),"undefined"!==typeof window&&"undefined"!==typeof window.Event&&(Object.setPrototypeOf(d.prototype,window.Event.prototype),u.set(window.Event.prototype,d));const v=new WeakMap;function b(e){return null!==e&&"object"===typeof e}function w(e){const t=v.get(e);if(null==t)throw new TypeError("'this' is expected an EventTarget object, but got another value.");return t}function x(e,t){Object.defineProperty(e,`on${t}`,function(e){return{get(){let t=w(this).get(e);for(;null!=t;){if(3===t.listenerType)return t.listener;t=t.next}return null},set(t){"function"===typeof t||b(t)||(t=null);const n=w(this);let r=null,i=n.get(e);for(;null!=i;)3===i.listenerType?null!==r?r.next=i.next:null!==i.next?n.set(e,i.next):n.delete(e):r=i,i=i.next;if(null!==t){const i={listener:t,listenerType:3,passive:!1,once:!1,next:null};null===r?n.set(e,i):r.next=i}},configurable:!0,enumerable:!0}}(t))}function S(e){function t(){_.call(this)}t.prototype=Object.create(_.prototype,{constructor:{value:t,configurable:!0,writable:!0}});for(let n=0;n<e.length;++n)x(t.prototype,e[n]);return t}function _(){if(!(this instanceof _)){if(1===arguments.length&&Array.isArray(arguments[0]))return S(arguments[0]);if(arguments.length>0){const e=new Array(arguments.length);for(let t=0;t<arguments.length;++t)e[t]=arguments[t];return S(e)}throw new TypeError("Cannot call a class as a function")}v.set(this,new Map)}_.prototype={addEventListener(e,t,n){if(null==t)return;if("function"!==typeof t&&!b(t))throw new TypeError("'listener' should be a function or an object.");const r=w(this),i=b(n),o=(i?Boolean(n.capture):Boolean(n))?1:2,a={listener:t,listenerType:o,passive:i&&Boolean(n.passive),once:i&&Boolean(n.once),next:null};let l=r.get(e);if(void 0===l)return void r.set(e,a);let s=null;for(;null!=l;){if(l.listener===t&&l.listenerType===o)return;s=l,l=l.next}s.next=a},removeEventListener(e,t,n){if(null==t)return;const r=w(this),i=(b(n)?Boolean(n.capture):Boolean(n))?1:2;let o=null,a=r.get(e);for(;null!=a;){if(a.listener===t&&a.listenerType===i)return void(null!==o?o.next=a.next:null!==a.next?r.set(e,a.next):r.delete(e));o=a,a=a.next}},dispatchEvent(e){if(null==e||"string"!==typeof e.type)throw new TypeError('"event.type" should be a string.');const t=w(this),n=e.type;let r=t.get(n);if(null==r)return!0;const i=function(e,t){return new(y(Object.getPrototypeOf(t)))(e,t)}(this,e);let o=null;for(;null!=r;){if(r.once?null!==o?o.next=r.next:null!==r.next?t.set(n,r.next):t.delete(n):o=r,g(i,r.passive?r.listener:null),"function"===typeof r.listener)try{r.listener.call(this,i)}catch(a){"undefined"!==typeof console&&"function"===typeof console.error&&console.error(a)}else 3!==r.listenerType&&"function"===typeof r.listener.handleEvent&&r.listener.handleEvent(i);if(m(i))break;r=r.next}return g(i,null),function(e,t){c(e).eventPhase=t}(i,0),function(e,t){c(e).currentTarget=t}(i,null),!i.defaultPrevented}},Object.defineProperty(_.prototype,"constructor",{value:_,configurable:!0,writable:!0}),"undefined"!==typeof window&&"undefined"!==typeof window.EventTarget&&Object.setPrototypeOf(_.prototype,window.EventTarget.prototype);var k,T,E,C,I,M,N,A,O;!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(k||(k={})),function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(T||(T={})),function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(E||(E={})),function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(C||(C={})),function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(I||(I={})),function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(M||(M={})),function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(N||(N={})),function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.Float=3]="Float",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct=13]="Struct",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Dictionary=-1]="Dictionary",e[e.Int8=-2]="Int8",e[e.Int16=-3]="Int16",e[e.Int32=-4]="Int32",e[e.Int64=-5]="Int64",e[e.Uint8=-6]="Uint8",e[e.Uint16=-7]="Uint16",e[e.Uint32=-8]="Uint32",e[e.Uint64=-9]="Uint64",e[e.Float16=-10]="Float16",e[e.Float32=-11]="Float32",e[e.Float64=-12]="Float64",e[e.DateDay=-13]="DateDay",e[e.DateMillisecond=-14]="DateMillisecond",e[e.TimestampSecond=-15]="TimestampSecond",e[e.TimestampMillisecond=-16]="TimestampMillisecond",e[e.TimestampMicrosecond=-17]="TimestampMicrosecond",e[e.TimestampNanosecond=-18]="TimestampNanosecond",e[e.TimeSecond=-19]="TimeSecond",e[e.TimeMillisecond=-20]="TimeMillisecond",e[e.TimeMicrosecond=-21]="TimeMicrosecond",e[e.TimeNanosecond=-22]="TimeNanosecond",e[e.DenseUnion=-23]="DenseUnion",e[e.SparseUnion=-24]="SparseUnion",e[e.IntervalDayTime=-25]="IntervalDayTime",e[e.IntervalYearMonth=-26]="IntervalYearMonth"}(A||(A={})),function(e){e[e.OFFSET=0]="OFFSET",e[e.DATA=1]="DATA",e[e.VALIDITY=2]="VALIDITY",e[e.TYPE=3]="TYPE"}(O||(O={}));function z(e){if(null===e)return"null";if(undefined===e)return"undefined";switch(typeof e){case"number":case"bigint":return`${e}`;case"string":return`"${e}"`}return"function"===typeof e[Symbol.toPrimitive]?e[Symbol.toPrimitive]("string"):ArrayBuffer.isView(e)?e instanceof BigInt64Array||e instanceof BigUint64Array?`[${[...e].map(e=>z(e))}]`:`[${e}]`:ArrayBuffer.isView(e)?`[${e}]`:JSON.stringify(e,(e,t)=>"bigint"===typeof t?`${t}`:t)}const D=new TextDecoder("utf-8"),$=new TextEncoder,P=e=>$.encode(e),[L,B]=(()=>{const e=()=>{throw new Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=()=>{throw e()},t.asUintN=()=>{throw e()},"undefined"!==typeof BigInt?[BigInt,!0]:[t,!1]})(),[F,R]=(()=>{const e=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!==typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),[U,j]=(()=>{const e=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!==typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),V=e=>"function"===typeof e,H=e=>null!=e&&Object(e)===e,Y="undefined"!==typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function W(e,t){let n=H(r=t)&&"done"in r&&"value"in r?t.value:t;var r;return n instanceof e?e===Uint8Array?new e(n.buffer,n.byteOffset,n.byteLength):n:n?("string"===typeof n&&(n=P(n)),n instanceof ArrayBuffer||n instanceof Y?new e(n):(e=>H(e)&&V(e.clear)&&V(e.bytes)&&V(e.position)&&V(e.setPosition)&&V(e.capacity)&&V(e.getBufferIdentifier)&&V(e.createLong))(n)?W(e,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new e(0):new e(n.buffer,n.byteOffset,n.byteLength/e.BYTES_PER_ELEMENT):e.from(n)):new e(0)}const X=e=>W(Int32Array,e),q=e=>W(Uint8Array,e);const Q=Symbol.for("isArrowBigNum");function G(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return 0===n.length?Object.setPrototypeOf(W(this.TypedArray,e),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(e,...n),this.constructor.prototype)}function J(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return G.apply(this,t)}function K(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return G.apply(this,t)}function Z(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return G.apply(this,t)}function ee(e){const{buffer:t,byteOffset:n,length:r,signed:i}=e,o=new U(t,n,r),a=i&&o[o.length-1]&BigInt(1)<<BigInt(63);let l=a?BigInt(1):BigInt(0),s=BigInt(0);if(a){for(const e of o)l+=~e*(BigInt(1)<<BigInt(32)*s++);l*=BigInt(-1)}else for(const u of o)l+=u*(BigInt(1)<<BigInt(32)*s++);return l}let te,ne;function re(e){let t="";const n=new Uint32Array(2);let r=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let o=-1;const a=r.length-1;do{for(n[0]=r[o=0];o<a;)r[o++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[o];r[o]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],t=`${n[0]}${t}`}while(i[0]||i[1]||i[2]||i[3]);return t||"0"}G.prototype[Q]=!0,G.prototype.toJSON=function(){return`"${te(this)}"`},G.prototype.valueOf=function(){return ee(this)},G.prototype.toString=function(){return te(this)},G.prototype[Symbol.toPrimitive]=function(){switch(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"default"){case"number":return ee(this);case"string":return te(this);case"default":return ne(this)}return te(this)},Object.setPrototypeOf(J.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(K.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(Z.prototype,Object.create(Uint32Array.prototype)),Object.assign(J.prototype,G.prototype,{constructor:J,signed:!0,TypedArray:Int32Array,BigIntArray:F}),Object.assign(K.prototype,G.prototype,{constructor:K,signed:!1,TypedArray:Uint32Array,BigIntArray:U}),Object.assign(Z.prototype,G.prototype,{constructor:Z,signed:!0,TypedArray:Uint32Array,BigIntArray:U}),B?(ne=e=>8===e.byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:re(e),te=e=>8===e.byteLength?`${new e.BigIntArray(e.buffer,e.byteOffset,1)[0]}`:re(e)):(te=re,ne=te);class ie{static new(e,t){switch(t){case!0:return new J(e);case!1:return new K(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case F:return new J(e)}return 16===e.byteLength?new Z(e):new K(e)}static signed(e){return new J(e)}static unsigned(e){return new K(e)}static decimal(e){return new Z(e)}constructor(e,t){return ie.new(e,t)}}var oe,ae,le,se,ue,ce,fe,de,he,pe,ye;class me{static isNull(e){return(null===e||void 0===e?void 0:e.typeId)===A.Null}static isInt(e){return(null===e||void 0===e?void 0:e.typeId)===A.Int}static isFloat(e){return(null===e||void 0===e?void 0:e.typeId)===A.Float}static isBinary(e){return(null===e||void 0===e?void 0:e.typeId)===A.Binary}static isUtf8(e){return(null===e||void 0===e?void 0:e.typeId)===A.Utf8}static isBool(e){return(null===e||void 0===e?void 0:e.typeId)===A.Bool}static isDecimal(e){return(null===e||void 0===e?void 0:e.typeId)===A.Decimal}static isDate(e){return(null===e||void 0===e?void 0:e.typeId)===A.Date}static isTime(e){return(null===e||void 0===e?void 0:e.typeId)===A.Time}static isTimestamp(e){return(null===e||void 0===e?void 0:e.typeId)===A.Timestamp}static isInterval(e){return(null===e||void 0===e?void 0:e.typeId)===A.Interval}static isList(e){return(null===e||void 0===e?void 0:e.typeId)===A.List}static isStruct(e){return(null===e||void 0===e?void 0:e.typeId)===A.Struct}static isUnion(e){return(null===e||void 0===e?void 0:e.typeId)===A.Union}static isFixedSizeBinary(e){return(null===e||void 0===e?void 0:e.typeId)===A.FixedSizeBinary}static isFixedSizeList(e){return(null===e||void 0===e?void 0:e.typeId)===A.FixedSizeList}static isMap(e){return(null===e||void 0===e?void 0:e.typeId)===A.Map}static isDictionary(e){return(null===e||void 0===e?void 0:e.typeId)===A.Dictionary}static isDenseUnion(e){return me.isUnion(e)&&e.mode===T.Dense}static isSparseUnion(e){return me.isUnion(e)&&e.mode===T.Sparse}get typeId(){return A.NONE}}oe=Symbol.toStringTag,me[oe]=((ye=me.prototype).children=null,ye.ArrayType=Array,ye[Symbol.toStringTag]="DataType");class ge extends me{toString(){return"Null"}get typeId(){return A.Null}}ae=Symbol.toStringTag,ge[ae]=(e=>e[Symbol.toStringTag]="Null")(ge.prototype);class ve extends me{constructor(e,t){super(),this.isSigned=e,this.bitWidth=t}get typeId(){return A.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?BigInt64Array:BigUint64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}le=Symbol.toStringTag,ve[le]=(e=>(e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"))(ve.prototype);Object.defineProperty(class extends ve{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends ve{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(class extends ve{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends ve{constructor(){super(!0,64)}get ArrayType(){return BigInt64Array}}.prototype,"ArrayType",{value:BigInt64Array}),Object.defineProperty(class extends ve{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends ve{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends ve{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends ve{constructor(){super(!1,64)}get ArrayType(){return BigUint64Array}}.prototype,"ArrayType",{value:BigUint64Array});class be extends me{constructor(e){super(),this.precision=e}get typeId(){return A.Float}get ArrayType(){switch(this.precision){case E.HALF:return Uint16Array;case E.SINGLE:return Float32Array;case E.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}se=Symbol.toStringTag,be[se]=(e=>(e.precision=null,e[Symbol.toStringTag]="Float"))(be.prototype);Object.defineProperty(class extends be{constructor(){super(E.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends be{constructor(){super(E.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends be{constructor(){super(E.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class we extends me{constructor(){super()}get typeId(){return A.Binary}toString(){return"Binary"}}we[Symbol.toStringTag]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"))(we.prototype);class xe extends me{constructor(){super()}get typeId(){return A.Utf8}toString(){return"Utf8"}}xe[Symbol.toStringTag]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"))(xe.prototype);class Se extends me{constructor(){super()}get typeId(){return A.Bool}toString(){return"Bool"}}Se[Symbol.toStringTag]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"))(Se.prototype);class _e extends me{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:128;super(),this.scale=e,this.precision=t,this.bitWidth=n}get typeId(){return A.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}_e[Symbol.toStringTag]=(e=>(e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"))(_e.prototype);class ke extends me{constructor(e){super(),this.unit=e}get typeId(){return A.Date}toString(){return`Date${32*(this.unit+1)}<${C[this.unit]}>`}}ue=Symbol.toStringTag,ke[ue]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"))(ke.prototype);class Te extends me{constructor(e,t){super(),this.unit=e,this.bitWidth=t}get typeId(){return A.Time}toString(){return`Time${this.bitWidth}<${I[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return BigInt64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}ce=Symbol.toStringTag,Te[ce]=(e=>(e.unit=null,e.bitWidth=null,e[Symbol.toStringTag]="Time"))(Te.prototype);class Ee extends me{constructor(e,t){super(),this.unit=e,this.timezone=t}get typeId(){return A.Timestamp}toString(){return`Timestamp<${I[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}fe=Symbol.toStringTag,Ee[fe]=(e=>(e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"))(Ee.prototype);class Ce extends me{constructor(e){super(),this.unit=e}get typeId(){return A.Interval}toString(){return`Interval<${M[this.unit]}>`}}de=Symbol.toStringTag,Ce[de]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"))(Ce.prototype);class Ie extends me{constructor(e){super(),this.children=[e]}get typeId(){return A.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}Ie[Symbol.toStringTag]=(e=>(e.children=null,e[Symbol.toStringTag]="List"))(Ie.prototype);class Me extends me{constructor(e){super(),this.children=e}get typeId(){return A.Struct}toString(){return`Struct<{${this.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}}he=Symbol.toStringTag,Me[he]=(e=>(e.children=null,e[Symbol.toStringTag]="Struct"))(Me.prototype);class Ne extends me{constructor(e,t,n){super(),this.mode=e,this.children=n,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce((e,t,n)=>(e[t]=n)&&e||e,Object.create(null))}get typeId(){return A.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map(e=>`${e.type}`).join(" | ")}>`}}pe=Symbol.toStringTag,Ne[pe]=(e=>(e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"))(Ne.prototype);class Ae extends me{constructor(e){super(),this.byteWidth=e}get typeId(){return A.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}Ae[Symbol.toStringTag]=(e=>(e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"))(Ae.prototype);class Oe extends me{constructor(e,t){super(),this.listSize=e,this.children=[t]}get typeId(){return A.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}Oe[Symbol.toStringTag]=(e=>(e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"))(Oe.prototype);class ze extends me{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];super(),this.children=[e],this.keysSorted=t}get typeId(){return A.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}}ze[Symbol.toStringTag]=(e=>(e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"))(ze.prototype);const De=($e=-1,()=>++$e);var $e;class Pe extends me{constructor(e,t,n,r){super(),this.indices=t,this.dictionary=e,this.isOrdered=r||!1,this.id=null==n?De():"number"===typeof n?n:n.low}get typeId(){return A.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function Le(e){const t=e;switch(e.typeId){case A.Decimal:return e.bitWidth/32;case A.Timestamp:return 2;case A.Date:case A.Interval:return 1+t.unit;case A.FixedSizeList:return t.listSize;case A.FixedSizeBinary:return t.byteWidth;default:return 1}}Pe[Symbol.toStringTag]=(e=>(e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"))(Pe.prototype);class Be{visitMany(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.map((e,t)=>this.visit(e,...n.map(e=>e[t])))}visit(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.getVisitFn(t[0],!1).apply(this,t)}getVisitFn(e){return function(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if("number"===typeof t)return Fe(e,t,n);if("string"===typeof t&&t in A)return Fe(e,A[t],n);if(t&&t instanceof me)return Fe(e,Re(t),n);if((null===t||void 0===t?void 0:t.type)&&t.type instanceof me)return Fe(e,Re(t.type),n);return Fe(e,A.NONE,n)}(this,e,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}getVisitFnByTypeId(e){return Fe(this,e,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}visitNull(e){return null}visitBool(e){return null}visitInt(e){return null}visitFloat(e){return null}visitUtf8(e){return null}visitBinary(e){return null}visitFixedSizeBinary(e){return null}visitDate(e){return null}visitTimestamp(e){return null}visitTime(e){return null}visitDecimal(e){return null}visitList(e){return null}visitStruct(e){return null}visitUnion(e){return null}visitDictionary(e){return null}visitInterval(e){return null}visitFixedSizeList(e){return null}visitMap(e){return null}}function Fe(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],r=null;switch(t){case A.Null:r=e.visitNull;break;case A.Bool:r=e.visitBool;break;case A.Int:r=e.visitInt;break;case A.Int8:r=e.visitInt8||e.visitInt;break;case A.Int16:r=e.visitInt16||e.visitInt;break;case A.Int32:r=e.visitInt32||e.visitInt;break;case A.Int64:r=e.visitInt64||e.visitInt;break;case A.Uint8:r=e.visitUint8||e.visitInt;break;case A.Uint16:r=e.visitUint16||e.visitInt;break;case A.Uint32:r=e.visitUint32||e.visitInt;break;case A.Uint64:r=e.visitUint64||e.visitInt;break;case A.Float:r=e.visitFloat;break;case A.Float16:r=e.visitFloat16||e.visitFloat;break;case A.Float32:r=e.visitFloat32||e.visitFloat;break;case A.Float64:r=e.visitFloat64||e.visitFloat;break;case A.Utf8:r=e.visitUtf8;break;case A.Binary:r=e.visitBinary;break;case A.FixedSizeBinary:r=e.visitFixedSizeBinary;break;case A.Date:r=e.visitDate;break;case A.DateDay:r=e.visitDateDay||e.visitDate;break;case A.DateMillisecond:r=e.visitDateMillisecond||e.visitDate;break;case A.Timestamp:r=e.visitTimestamp;break;case A.TimestampSecond:r=e.visitTimestampSecond||e.visitTimestamp;break;case A.TimestampMillisecond:r=e.visitTimestampMillisecond||e.visitTimestamp;break;case A.TimestampMicrosecond:r=e.visitTimestampMicrosecond||e.visitTimestamp;break;case A.TimestampNanosecond:r=e.visitTimestampNanosecond||e.visitTimestamp;break;case A.Time:r=e.visitTime;break;case A.TimeSecond:r=e.visitTimeSecond||e.visitTime;break;case A.TimeMillisecond:r=e.visitTimeMillisecond||e.visitTime;break;case A.TimeMicrosecond:r=e.visitTimeMicrosecond||e.visitTime;break;case A.TimeNanosecond:r=e.visitTimeNanosecond||e.visitTime;break;case A.Decimal:r=e.visitDecimal;break;case A.List:r=e.visitList;break;case A.Struct:r=e.visitStruct;break;case A.Union:r=e.visitUnion;break;case A.DenseUnion:r=e.visitDenseUnion||e.visitUnion;break;case A.SparseUnion:r=e.visitSparseUnion||e.visitUnion;break;case A.Dictionary:r=e.visitDictionary;break;case A.Interval:r=e.visitInterval;break;case A.IntervalDayTime:r=e.visitIntervalDayTime||e.visitInterval;break;case A.IntervalYearMonth:r=e.visitIntervalYearMonth||e.visitInterval;break;case A.FixedSizeList:r=e.visitFixedSizeList;break;case A.Map:r=e.visitMap}if("function"===typeof r)return r;if(!n)return()=>null;throw new Error(`Unrecognized type '${A[t]}'`)}function Re(e){switch(e.typeId){case A.Null:return A.Null;case A.Int:{const{bitWidth:t,isSigned:n}=e;switch(t){case 8:return n?A.Int8:A.Uint8;case 16:return n?A.Int16:A.Uint16;case 32:return n?A.Int32:A.Uint32;case 64:return n?A.Int64:A.Uint64}return A.Int}case A.Float:switch(e.precision){case E.HALF:return A.Float16;case E.SINGLE:return A.Float32;case E.DOUBLE:return A.Float64}return A.Float;case A.Binary:return A.Binary;case A.Utf8:return A.Utf8;case A.Bool:return A.Bool;case A.Decimal:return A.Decimal;case A.Time:switch(e.unit){case I.SECOND:return A.TimeSecond;case I.MILLISECOND:return A.TimeMillisecond;case I.MICROSECOND:return A.TimeMicrosecond;case I.NANOSECOND:return A.TimeNanosecond}return A.Time;case A.Timestamp:switch(e.unit){case I.SECOND:return A.TimestampSecond;case I.MILLISECOND:return A.TimestampMillisecond;case I.MICROSECOND:return A.TimestampMicrosecond;case I.NANOSECOND:return A.TimestampNanosecond}return A.Timestamp;case A.Date:switch(e.unit){case C.DAY:return A.DateDay;case C.MILLISECOND:return A.DateMillisecond}return A.Date;case A.Interval:switch(e.unit){case M.DAY_TIME:return A.IntervalDayTime;case M.YEAR_MONTH:return A.IntervalYearMonth}return A.Interval;case A.Map:return A.Map;case A.List:return A.List;case A.Struct:return A.Struct;case A.Union:switch(e.mode){case T.Dense:return A.DenseUnion;case T.Sparse:return A.SparseUnion}return A.Union;case A.FixedSizeBinary:return A.FixedSizeBinary;case A.FixedSizeList:return A.FixedSizeList;case A.Dictionary:return A.Dictionary}throw new Error(`Unrecognized type '${A[e.typeId]}'`)}Be.prototype.visitInt8=null,Be.prototype.visitInt16=null,Be.prototype.visitInt32=null,Be.prototype.visitInt64=null,Be.prototype.visitUint8=null,Be.prototype.visitUint16=null,Be.prototype.visitUint32=null,Be.prototype.visitUint64=null,Be.prototype.visitFloat16=null,Be.prototype.visitFloat32=null,Be.prototype.visitFloat64=null,Be.prototype.visitDateDay=null,Be.prototype.visitDateMillisecond=null,Be.prototype.visitTimestampSecond=null,Be.prototype.visitTimestampMillisecond=null,Be.prototype.visitTimestampMicrosecond=null,Be.prototype.visitTimestampNanosecond=null,Be.prototype.visitTimeSecond=null,Be.prototype.visitTimeMillisecond=null,Be.prototype.visitTimeMicrosecond=null,Be.prototype.visitTimeNanosecond=null,Be.prototype.visitDenseUnion=null,Be.prototype.visitSparseUnion=null,Be.prototype.visitIntervalDayTime=null,Be.prototype.visitIntervalYearMonth=null;const Ue=new Float64Array(1),je=new Uint32Array(Ue.buffer);function Ve(e){const t=(31744&e)>>10,n=(1023&e)/1024,r=Math.pow(-1,(32768&e)>>15);switch(t){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,t-15)*(1+n)}class He extends Be{}function Ye(e){return(t,n,r)=>{if(t.setValid(n,null!=r))return e(t,n,r)}}const We=(e,t,n)=>{e[t]=Math.trunc(n%4294967296),e[t+1]=Math.trunc(n/4294967296)},Xe=(e,t,n,r)=>{if(n+1<t.length){const{[n]:i,[n+1]:o}=t;e.set(r.subarray(0,o-i),i)}},qe=(e,t,n)=>{let{values:r}=e;r[t]=n},Qe=(e,t,n)=>{let{values:r}=e;r[t]=n},Ge=(e,t,n)=>{let{values:r}=e;r[t]=function(e){if(e!==e)return 32256;Ue[0]=e;const t=(2147483648&je[1])>>16&65535;let n=2146435072&je[1],r=0;return n>=1089470464?je[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&je[1])>>10):n<=1056964608?(r=1048576+(1048575&je[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&je[1])>>10),t|n|65535&r}(n)},Je=(e,t,n)=>{let{values:r}=e;((e,t,n)=>{e[t]=Math.trunc(n/864e5)})(r,t,n.valueOf())},Ke=(e,t,n)=>{let{values:r}=e;We(r,2*t,n.valueOf())},Ze=(e,t,n)=>{let{values:r}=e;return We(r,2*t,n/1e3)},et=(e,t,n)=>{let{values:r}=e;return We(r,2*t,n)},tt=(e,t,n)=>{let{values:r}=e;return((e,t,n)=>{e[t]=Math.trunc(1e3*n%4294967296),e[t+1]=Math.trunc(1e3*n/4294967296)})(r,2*t,n)},nt=(e,t,n)=>{let{values:r}=e;return((e,t,n)=>{e[t]=Math.trunc(1e6*n%4294967296),e[t+1]=Math.trunc(1e6*n/4294967296)})(r,2*t,n)},rt=(e,t,n)=>{let{values:r}=e;r[t]=n},it=(e,t,n)=>{let{values:r}=e;r[t]=n},ot=(e,t,n)=>{let{values:r}=e;r[t]=n},at=(e,t,n)=>{let{values:r}=e;r[t]=n},lt=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];ft.visit(i,e.valueOffsets[t],n)},st=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];ft.visit(i,t,n)},ut=(e,t,n)=>{let{values:r}=e;r.set(n.subarray(0,2),2*t)},ct=(e,t,n)=>{let{values:r}=e;r[t]=12*n[0]+n[1]%12};He.prototype.visitBool=Ye((e,t,n)=>{let{offset:r,values:i}=e;const o=r+t;n?i[o>>3]|=1<<o%8:i[o>>3]&=~(1<<o%8)}),He.prototype.visitInt=Ye(qe),He.prototype.visitInt8=Ye(qe),He.prototype.visitInt16=Ye(qe),He.prototype.visitInt32=Ye(qe),He.prototype.visitInt64=Ye(qe),He.prototype.visitUint8=Ye(qe),He.prototype.visitUint16=Ye(qe),He.prototype.visitUint32=Ye(qe),He.prototype.visitUint64=Ye(qe),He.prototype.visitFloat=Ye((e,t,n)=>{switch(e.type.precision){case E.HALF:return Ge(e,t,n);case E.SINGLE:case E.DOUBLE:return Qe(e,t,n)}}),He.prototype.visitFloat16=Ye(Ge),He.prototype.visitFloat32=Ye(Qe),He.prototype.visitFloat64=Ye(Qe),He.prototype.visitUtf8=Ye((e,t,n)=>{let{values:r,valueOffsets:i}=e;Xe(r,i,t,P(n))}),He.prototype.visitBinary=Ye((e,t,n)=>{let{values:r,valueOffsets:i}=e;return Xe(r,i,t,n)}),He.prototype.visitFixedSizeBinary=Ye((e,t,n)=>{let{stride:r,values:i}=e;i.set(n.subarray(0,r),r*t)}),He.prototype.visitDate=Ye((e,t,n)=>{e.type.unit===C.DAY?Je(e,t,n):Ke(e,t,n)}),He.prototype.visitDateDay=Ye(Je),He.prototype.visitDateMillisecond=Ye(Ke),He.prototype.visitTimestamp=Ye((e,t,n)=>{switch(e.type.unit){case I.SECOND:return Ze(e,t,n);case I.MILLISECOND:return et(e,t,n);case I.MICROSECOND:return tt(e,t,n);case I.NANOSECOND:return nt(e,t,n)}}),He.prototype.visitTimestampSecond=Ye(Ze),He.prototype.visitTimestampMillisecond=Ye(et),He.prototype.visitTimestampMicrosecond=Ye(tt),He.prototype.visitTimestampNanosecond=Ye(nt),He.prototype.visitTime=Ye((e,t,n)=>{switch(e.type.unit){case I.SECOND:return rt(e,t,n);case I.MILLISECOND:return it(e,t,n);case I.MICROSECOND:return ot(e,t,n);case I.NANOSECOND:return at(e,t,n)}}),He.prototype.visitTimeSecond=Ye(rt),He.prototype.visitTimeMillisecond=Ye(it),He.prototype.visitTimeMicrosecond=Ye(ot),He.prototype.visitTimeNanosecond=Ye(at),He.prototype.visitDecimal=Ye((e,t,n)=>{let{values:r,stride:i}=e;r.set(n.subarray(0,i),i*t)}),He.prototype.visitList=Ye((e,t,n)=>{const r=e.children[0],i=e.valueOffsets,o=ft.getVisitFn(r);if(Array.isArray(n))for(let a=-1,l=i[t],s=i[t+1];l<s;)o(r,l++,n[++a]);else for(let a=-1,l=i[t],s=i[t+1];l<s;)o(r,l++,n.get(++a))}),He.prototype.visitStruct=Ye((e,t,n)=>{const r=e.type.children.map(e=>ft.getVisitFn(e.type)),i=n instanceof Map?(o=t,a=n,(e,t,n,r)=>t&&e(t,o,a.get(n.name))):n instanceof In?((e,t)=>(n,r,i,o)=>r&&n(r,e,t.get(o)))(t,n):Array.isArray(n)?((e,t)=>(n,r,i,o)=>r&&n(r,e,t[o]))(t,n):((e,t)=>(n,r,i,o)=>r&&n(r,e,t[i.name]))(t,n);var o,a;e.type.children.forEach((t,n)=>i(r[n],e.children[n],t,n))}),He.prototype.visitUnion=Ye((e,t,n)=>{e.type.mode===T.Dense?lt(e,t,n):st(e,t,n)}),He.prototype.visitDenseUnion=Ye(lt),He.prototype.visitSparseUnion=Ye(st),He.prototype.visitDictionary=Ye((e,t,n)=>{var r;null===(r=e.dictionary)||void 0===r||r.set(e.values[t],n)}),He.prototype.visitInterval=Ye((e,t,n)=>{e.type.unit===M.DAY_TIME?ut(e,t,n):ct(e,t,n)}),He.prototype.visitIntervalDayTime=Ye(ut),He.prototype.visitIntervalYearMonth=Ye(ct),He.prototype.visitFixedSizeList=Ye((e,t,n)=>{const{stride:r}=e,i=e.children[0],o=ft.getVisitFn(i);if(Array.isArray(n))for(let a=-1,l=t*r;++a<r;)o(i,l+a,n[a]);else for(let a=-1,l=t*r;++a<r;)o(i,l+a,n.get(a))}),He.prototype.visitMap=Ye((e,t,n)=>{const r=e.children[0],{valueOffsets:i}=e,o=ft.getVisitFn(r);let{[t]:a,[t+1]:l}=i;const s=n instanceof Map?n.entries():Object.entries(n);for(const u of s)if(o(r,a,u),++a>=l)break});const ft=new He,dt=Symbol.for("parent"),ht=Symbol.for("rowIndex");class pt{constructor(e,t){return this[dt]=e,this[ht]=t,new Proxy(this,new mt)}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[ht],t=this[dt],n=t.type.children,r={};for(let i=-1,o=n.length;++i<o;)r[n[i].name]=Bt.visit(t.children[i],e);return r}toString(){return`{${[...this].map(e=>{let[t,n]=e;return`${z(t)}: ${z(n)}`}).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new yt(this[dt],this[ht])}}class yt{constructor(e,t){this.childIndex=0,this.children=e.children,this.rowIndex=t,this.childFields=e.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const e=this.childIndex;return e<this.numChildren?(this.childIndex=e+1,{done:!1,value:[this.childFields[e].name,Bt.visit(this.children[e],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(pt.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[dt]:{writable:!0,enumerable:!1,configurable:!1,value:null},[ht]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class mt{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[dt].type.children.map(e=>e.name)}has(e,t){return-1!==e[dt].type.children.findIndex(e=>e.name===t)}getOwnPropertyDescriptor(e,t){if(-1!==e[dt].type.children.findIndex(e=>e.name===t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[dt].type.children.findIndex(e=>e.name===t);if(-1!==n){const r=Bt.visit(e[dt].children[n],e[ht]);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[dt].type.children.findIndex(e=>e.name===t);return-1!==r?(ft.visit(e[dt].children[r],e[ht],n),Reflect.set(e,t,n)):!(!Reflect.has(e,t)&&"symbol"!==typeof t)&&Reflect.set(e,t,n)}}class gt extends Be{}function vt(e){return(t,n)=>t.getValid(n)?e(t,n):null}const bt=(e,t)=>4294967296*e[t+1]+(e[t]>>>0),wt=e=>new Date(e),xt=(e,t,n)=>{if(n+1>=t.length)return null;const r=t[n],i=t[n+1];return e.subarray(r,i)},St=(e,t)=>{let{values:n}=e;return((e,t)=>wt(((e,t)=>864e5*e[t])(e,t)))(n,t)},_t=(e,t)=>{let{values:n}=e;return((e,t)=>wt(bt(e,t)))(n,2*t)},kt=(e,t)=>{let{stride:n,values:r}=e;return r[n*t]},Tt=(e,t)=>{let{values:n}=e;return n[t]},Et=(e,t)=>{let{values:n}=e;return 1e3*bt(n,2*t)},Ct=(e,t)=>{let{values:n}=e;return bt(n,2*t)},It=(e,t)=>{let{values:n}=e;return((e,t)=>e[t+1]/1e3*4294967296+(e[t]>>>0)/1e3)(n,2*t)},Mt=(e,t)=>{let{values:n}=e;return((e,t)=>e[t+1]/1e6*4294967296+(e[t]>>>0)/1e6)(n,2*t)},Nt=(e,t)=>{let{values:n}=e;return n[t]},At=(e,t)=>{let{values:n}=e;return n[t]},Ot=(e,t)=>{let{values:n}=e;return n[t]},zt=(e,t)=>{let{values:n}=e;return n[t]},Dt=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return Bt.visit(r,e.valueOffsets[t])},$t=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return Bt.visit(r,t)},Pt=(e,t)=>{let{values:n}=e;return n.subarray(2*t,2*(t+1))},Lt=(e,t)=>{let{values:n}=e;const r=n[t],i=new Int32Array(2);return i[0]=Math.trunc(r/12),i[1]=Math.trunc(r%12),i};gt.prototype.visitNull=vt((e,t)=>null),gt.prototype.visitBool=vt((e,t)=>{let{offset:n,values:r}=e;const i=n+t;return 0!==(r[i>>3]&1<<i%8)}),gt.prototype.visitInt=vt((e,t)=>{let{values:n}=e;return n[t]}),gt.prototype.visitInt8=vt(kt),gt.prototype.visitInt16=vt(kt),gt.prototype.visitInt32=vt(kt),gt.prototype.visitInt64=vt(Tt),gt.prototype.visitUint8=vt(kt),gt.prototype.visitUint16=vt(kt),gt.prototype.visitUint32=vt(kt),gt.prototype.visitUint64=vt(Tt),gt.prototype.visitFloat=vt((e,t)=>{let{type:n,values:r}=e;return n.precision!==E.HALF?r[t]:Ve(r[t])}),gt.prototype.visitFloat16=vt((e,t)=>{let{stride:n,values:r}=e;return Ve(r[n*t])}),gt.prototype.visitFloat32=vt(kt),gt.prototype.visitFloat64=vt(kt),gt.prototype.visitUtf8=vt((e,t)=>{let{values:n,valueOffsets:r}=e;const i=xt(n,r,t);return null!==i?(o=i,D.decode(o)):null;var o}),gt.prototype.visitBinary=vt((e,t)=>{let{values:n,valueOffsets:r}=e;return xt(n,r,t)}),gt.prototype.visitFixedSizeBinary=vt((e,t)=>{let{stride:n,values:r}=e;return r.subarray(n*t,n*(t+1))}),gt.prototype.visitDate=vt((e,t)=>e.type.unit===C.DAY?St(e,t):_t(e,t)),gt.prototype.visitDateDay=vt(St),gt.prototype.visitDateMillisecond=vt(_t),gt.prototype.visitTimestamp=vt((e,t)=>{switch(e.type.unit){case I.SECOND:return Et(e,t);case I.MILLISECOND:return Ct(e,t);case I.MICROSECOND:return It(e,t);case I.NANOSECOND:return Mt(e,t)}}),gt.prototype.visitTimestampSecond=vt(Et),gt.prototype.visitTimestampMillisecond=vt(Ct),gt.prototype.visitTimestampMicrosecond=vt(It),gt.prototype.visitTimestampNanosecond=vt(Mt),gt.prototype.visitTime=vt((e,t)=>{switch(e.type.unit){case I.SECOND:return Nt(e,t);case I.MILLISECOND:return At(e,t);case I.MICROSECOND:return Ot(e,t);case I.NANOSECOND:return zt(e,t)}}),gt.prototype.visitTimeSecond=vt(Nt),gt.prototype.visitTimeMillisecond=vt(At),gt.prototype.visitTimeMicrosecond=vt(Ot),gt.prototype.visitTimeNanosecond=vt(zt),gt.prototype.visitDecimal=vt((e,t)=>{let{values:n,stride:r}=e;return ie.decimal(n.subarray(r*t,r*(t+1)))}),gt.prototype.visitList=vt((e,t)=>{const{valueOffsets:n,stride:r,children:i}=e,{[t*r]:o,[t*r+1]:a}=n,l=i[0].slice(o,a-o);return new In([l])}),gt.prototype.visitStruct=vt((e,t)=>new pt(e,t)),gt.prototype.visitUnion=vt((e,t)=>e.type.mode===T.Dense?Dt(e,t):$t(e,t)),gt.prototype.visitDenseUnion=vt(Dt),gt.prototype.visitSparseUnion=vt($t),gt.prototype.visitDictionary=vt((e,t)=>{var n;return null===(n=e.dictionary)||void 0===n?void 0:n.get(e.values[t])}),gt.prototype.visitInterval=vt((e,t)=>e.type.unit===M.DAY_TIME?Pt(e,t):Lt(e,t)),gt.prototype.visitIntervalDayTime=vt(Pt),gt.prototype.visitIntervalYearMonth=vt(Lt),gt.prototype.visitFixedSizeList=vt((e,t)=>{const{stride:n,children:r}=e,i=r[0].slice(t*n,n);return new In([i])}),gt.prototype.visitMap=vt((e,t)=>{const{valueOffsets:n,children:r}=e,{[t]:i,[t+1]:o}=n,a=r[0];return new Ut(a.slice(i,o-i))});const Bt=new gt,Ft=Symbol.for("keys"),Rt=Symbol.for("vals");class Ut{constructor(e){return this[Ft]=new In([e.children[0]]).memoize(),this[Rt]=e.children[1],new Proxy(this,new Vt)}[Symbol.iterator](){return new jt(this[Ft],this[Rt])}get size(){return this[Ft].length}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[Ft],t=this[Rt],n={};for(let r=-1,i=e.length;++r<i;)n[e.get(r)]=Bt.visit(t,r);return n}toString(){return`{${[...this].map(e=>{let[t,n]=e;return`${z(t)}: ${z(n)}`}).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class jt{constructor(e,t){this.keys=e,this.vals=t,this.keyIndex=0,this.numKeys=e.length}[Symbol.iterator](){return this}next(){const e=this.keyIndex;return e===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(e),Bt.visit(this.vals,e)]})}}class Vt{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Ft].toArray().map(String)}has(e,t){return e[Ft].includes(t)}getOwnPropertyDescriptor(e,t){if(-1!==e[Ft].indexOf(t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[Ft].indexOf(t);if(-1!==n){const r=Bt.visit(Reflect.get(e,Rt),n);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[Ft].indexOf(t);return-1!==r?(ft.visit(Reflect.get(e,Rt),r,n),Reflect.set(e,t,n)):!!Reflect.has(e,t)&&Reflect.set(e,t,n)}}let Ht;function Yt(e,t,n,r){const{length:i=0}=e;let o="number"!==typeof t?0:t,a="number"!==typeof n?i:n;return o<0&&(o=(o%i+i)%i),a<0&&(a=(a%i+i)%i),a<o&&(Ht=o,o=a,a=Ht),a>i&&(a=i),r?r(e,o,a):[o,a]}Object.defineProperties(Ut.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Ft]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Rt]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const Wt=e=>e!==e;function Xt(e){if("object"!==typeof e||null===e)return Wt(e)?Wt:t=>t===e;if(e instanceof Date){const t=e.valueOf();return e=>e instanceof Date&&e.valueOf()===t}return ArrayBuffer.isView(e)?t=>!!t&&function(e,t){let n=0;const r=e.length;if(r!==t.length)return!1;if(r>0)do{if(e[n]!==t[n])return!1}while(++n<r);return!0}(e,t):e instanceof Map?function(e){let t=-1;const n=[];for(const r of e.values())n[++t]=Xt(r);return qt(n)}(e):Array.isArray(e)?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=Xt(e[n]);return qt(t)}(e):e instanceof In?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=Xt(e.get(n));return qt(t)}(e):function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const n=Object.keys(e);if(!t&&0===n.length)return()=>!1;const r=[];for(let i=-1,o=n.length;++i<o;)r[i]=Xt(e[n[i]]);return qt(r,n)}(e,!0)}function qt(e,t){return n=>{if(!n||"object"!==typeof n)return!1;switch(n.constructor){case Array:return function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t[r]))return!1;return!0}(e,n);case Map:return Qt(e,n,n.keys());case Ut:case pt:case Object:case void 0:return Qt(e,n,t||Object.keys(n))}return n instanceof In&&function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t.get(r)))return!1;return!0}(e,n)}}function Qt(e,t,n){const r=n[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),o=t instanceof Map?t.values():Object.values(t)[Symbol.iterator]();let a=0;const l=e.length;let s=o.next(),u=r.next(),c=i.next();for(;a<l&&!u.done&&!c.done&&!s.done&&(u.value===c.value&&e[a](s.value));++a,u=r.next(),c=i.next(),s=o.next());return!!(a===l&&u.done&&c.done&&s.done)||(r.return&&r.return(),i.return&&i.return(),o.return&&o.return(),!1)}class Gt{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,t=arguments.length>1?arguments[1]:void 0;this.numChunks=e,this.getChunkIterator=t,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const e=this.chunkIterator.next();if(!e.done)return e;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function Jt(e){return e.reduce((e,t)=>e+t.nullCount,0)}function Kt(e){return e.reduce((e,t,n)=>(e[n+1]=e[n]+t.length,e),new Uint32Array(e.length+1))}function Zt(e,t,n,r){const i=[];for(let o=-1,a=e.length;++o<a;){const a=e[o],l=t[o],{length:s}=a;if(l>=r)break;if(n>=l+s)continue;if(l>=n&&l+s<=r){i.push(a);continue}const u=Math.max(0,n-l),c=Math.min(r-l,s);i.push(a.slice(u,c-u))}return 0===i.length&&i.push(e[0].slice(0,0)),i}function en(e,t,n,r){let i=0,o=0,a=t.length-1;do{if(i>=a-1)return n<t[a]?r(e,i,n-t[i]):null;o=i+Math.trunc(.5*(a-i)),n<t[o]?a=o:i=o}while(i<a)}function tn(e,t){return e.getValid(t)}function nn(e){function t(t,n,r){return e(t[n],r)}return function(e){return en(this.data,this._offsets,e,t)}}function rn(e){let t;function n(n,r,i){return e(n[r],i,t)}return function(e,r){const i=this.data;t=r;const o=en(i,this._offsets,e,n);return t=void 0,o}}function on(e){let t;function n(n,r,i){let o=i,a=0,l=0;for(let s=r-1,u=n.length;++s<u;){const r=n[s];if(~(a=e(r,t,o)))return l+a;o=0,l+=r.length}return-1}return function(e,r){t=e;const i=this.data,o="number"!==typeof r?n(i,0,0):en(i,this._offsets,r,n);return t=void 0,o}}function an(e,t,n,r){return 0!==(n&1<<r)}function ln(e,t,n,r){return(n&1<<r)>>r}function sn(e,t,n){const r=n.byteLength+7&-8;if(e>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(e%8===0?n.subarray(e>>3):function(e){const t=[];let n=0,r=0,i=0;for(const a of e)a&&(i|=1<<r),8===++r&&(t[n++]=i,i=r=0);(0===n||r>0)&&(t[n++]=i);const o=new Uint8Array(t.length+7&-8);return o.set(t),o}(new un(n,e,t,null,an)).subarray(0,r)),i}return n}class un{constructor(e,t,n,r,i){this.bytes=e,this.length=n,this.context=r,this.get=i,this.bit=t%8,this.byteIndex=t>>3,this.byte=e[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function cn(e,t,n){if(n-t<=0)return 0;if(n-t<8){let r=0;for(const i of new un(e,t,n-t,e,ln))r+=i;return r}const r=n>>3<<3,i=t+(t%8===0?0:8-t%8);return cn(e,t,i)+cn(e,r,n)+function(e,t,n){let r=0,i=Math.trunc(t);const o=new DataView(e.buffer,e.byteOffset,e.byteLength),a=void 0===n?e.byteLength:i+n;for(;a-i>=4;)r+=fn(o.getUint32(i)),i+=4;for(;a-i>=2;)r+=fn(o.getUint16(i)),i+=2;for(;a-i>=1;)r+=fn(o.getUint8(i)),i+=1;return r}(e,i>>3,r-i>>3)}function fn(e){let t=Math.trunc(e);return t-=t>>>1&1431655765,t=(858993459&t)+(t>>>2&858993459),16843009*(t+(t>>>4)&252645135)>>>24}class dn extends Be{}function hn(e,t,n){if(void 0===t)return-1;if(null===t)return function(e,t){const{nullBitmap:n}=e;if(!n||e.nullCount<=0)return-1;let r=0;for(const i of new un(n,e.offset+(t||0),e.length,n,an)){if(!i)return r;++r}return-1}(e,n);const r=Bt.getVisitFn(e),i=Xt(t);for(let o=(n||0)-1,a=e.length;++o<a;)if(i(r(e,o)))return o;return-1}function pn(e,t,n){const r=Bt.getVisitFn(e),i=Xt(t);for(let o=(n||0)-1,a=e.length;++o<a;)if(i(r(e,o)))return o;return-1}dn.prototype.visitNull=function(e,t){return null===t&&e.length>0?0:-1},dn.prototype.visitBool=hn,dn.prototype.visitInt=hn,dn.prototype.visitInt8=hn,dn.prototype.visitInt16=hn,dn.prototype.visitInt32=hn,dn.prototype.visitInt64=hn,dn.prototype.visitUint8=hn,dn.prototype.visitUint16=hn,dn.prototype.visitUint32=hn,dn.prototype.visitUint64=hn,dn.prototype.visitFloat=hn,dn.prototype.visitFloat16=hn,dn.prototype.visitFloat32=hn,dn.prototype.visitFloat64=hn,dn.prototype.visitUtf8=hn,dn.prototype.visitBinary=hn,dn.prototype.visitFixedSizeBinary=hn,dn.prototype.visitDate=hn,dn.prototype.visitDateDay=hn,dn.prototype.visitDateMillisecond=hn,dn.prototype.visitTimestamp=hn,dn.prototype.visitTimestampSecond=hn,dn.prototype.visitTimestampMillisecond=hn,dn.prototype.visitTimestampMicrosecond=hn,dn.prototype.visitTimestampNanosecond=hn,dn.prototype.visitTime=hn,dn.prototype.visitTimeSecond=hn,dn.prototype.visitTimeMillisecond=hn,dn.prototype.visitTimeMicrosecond=hn,dn.prototype.visitTimeNanosecond=hn,dn.prototype.visitDecimal=hn,dn.prototype.visitList=hn,dn.prototype.visitStruct=hn,dn.prototype.visitUnion=hn,dn.prototype.visitDenseUnion=pn,dn.prototype.visitSparseUnion=pn,dn.prototype.visitDictionary=hn,dn.prototype.visitInterval=hn,dn.prototype.visitIntervalDayTime=hn,dn.prototype.visitIntervalYearMonth=hn,dn.prototype.visitFixedSizeList=hn,dn.prototype.visitMap=hn;const yn=new dn;class mn extends Be{}function gn(e){const{type:t}=e;if(0===e.nullCount&&1===e.stride&&(t.typeId===A.Timestamp||t instanceof ve&&64!==t.bitWidth||t instanceof Te&&64!==t.bitWidth||t instanceof be&&t.precision!==E.HALF))return new Gt(e.data.length,t=>{const n=e.data[t];return n.values.subarray(0,n.length)[Symbol.iterator]()});let n=0;return new Gt(e.data.length,t=>{const r=e.data[t].length,i=e.slice(n,n+r);return n+=r,new vn(i)})}class vn{constructor(e){this.vector=e,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}mn.prototype.visitNull=gn,mn.prototype.visitBool=gn,mn.prototype.visitInt=gn,mn.prototype.visitInt8=gn,mn.prototype.visitInt16=gn,mn.prototype.visitInt32=gn,mn.prototype.visitInt64=gn,mn.prototype.visitUint8=gn,mn.prototype.visitUint16=gn,mn.prototype.visitUint32=gn,mn.prototype.visitUint64=gn,mn.prototype.visitFloat=gn,mn.prototype.visitFloat16=gn,mn.prototype.visitFloat32=gn,mn.prototype.visitFloat64=gn,mn.prototype.visitUtf8=gn,mn.prototype.visitBinary=gn,mn.prototype.visitFixedSizeBinary=gn,mn.prototype.visitDate=gn,mn.prototype.visitDateDay=gn,mn.prototype.visitDateMillisecond=gn,mn.prototype.visitTimestamp=gn,mn.prototype.visitTimestampSecond=gn,mn.prototype.visitTimestampMillisecond=gn,mn.prototype.visitTimestampMicrosecond=gn,mn.prototype.visitTimestampNanosecond=gn,mn.prototype.visitTime=gn,mn.prototype.visitTimeSecond=gn,mn.prototype.visitTimeMillisecond=gn,mn.prototype.visitTimeMicrosecond=gn,mn.prototype.visitTimeNanosecond=gn,mn.prototype.visitDecimal=gn,mn.prototype.visitList=gn,mn.prototype.visitStruct=gn,mn.prototype.visitUnion=gn,mn.prototype.visitDenseUnion=gn,mn.prototype.visitSparseUnion=gn,mn.prototype.visitDictionary=gn,mn.prototype.visitInterval=gn,mn.prototype.visitIntervalDayTime=gn,mn.prototype.visitIntervalYearMonth=gn,mn.prototype.visitFixedSizeList=gn,mn.prototype.visitMap=gn;const bn=new mn,wn=(e,t)=>e+t;class xn extends Be{visitNull(e,t){return 0}visitInt(e,t){return e.type.bitWidth/8}visitFloat(e,t){return e.type.ArrayType.BYTES_PER_ELEMENT}visitBool(e,t){return 1/8}visitDecimal(e,t){return e.type.bitWidth/8}visitDate(e,t){return 4*(e.type.unit+1)}visitTime(e,t){return e.type.bitWidth/8}visitTimestamp(e,t){return e.type.unit===I.SECOND?4:8}visitInterval(e,t){return 4*(e.type.unit+1)}visitStruct(e,t){return e.children.reduce((e,n)=>e+kn.visit(n,t),0)}visitFixedSizeBinary(e,t){return e.type.byteWidth}visitMap(e,t){return 8+e.children.reduce((e,n)=>e+kn.visit(n,t),0)}visitDictionary(e,t){var n;return e.type.indices.bitWidth/8+((null===(n=e.dictionary)||void 0===n?void 0:n.getByteLength(e.values[t]))||0)}}const Sn=(e,t)=>{let{type:n,children:r,typeIds:i,valueOffsets:o}=e;const a=n.typeIdToChildIndex[i[t]];return 8+kn.visit(r[a],o[t])},_n=(e,t)=>{let{children:n}=e;return 4+kn.visitMany(n,n.map(()=>t)).reduce(wn,0)};xn.prototype.visitUtf8=(e,t)=>{let{valueOffsets:n}=e;return n[t+1]-n[t]+8},xn.prototype.visitBinary=(e,t)=>{let{valueOffsets:n}=e;return n[t+1]-n[t]+8},xn.prototype.visitList=(e,t)=>{let{valueOffsets:n,stride:r,children:i}=e;const o=i[0],{[t*r]:a}=n,{[t*r+1]:l}=n,s=kn.getVisitFn(o.type),u=o.slice(a,l-a);let c=8;for(let f=-1,d=l-a;++f<d;)c+=s(u,f);return c},xn.prototype.visitFixedSizeList=(e,t)=>{let{stride:n,children:r}=e;const i=r[0],o=i.slice(t*n,n),a=kn.getVisitFn(i.type);let l=0;for(let s=-1,u=o.length;++s<u;)l+=a(o,s);return l},xn.prototype.visitUnion=(e,t)=>e.type.mode===T.Dense?Sn(e,t):_n(e,t),xn.prototype.visitDenseUnion=Sn,xn.prototype.visitSparseUnion=_n;const kn=new xn;var Tn;const En={},Cn={};class In{constructor(e){var t,n,r;const i=e[0]instanceof In?e.flatMap(e=>e.data):e;if(0===i.length||i.some(e=>!(e instanceof Nn)))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=null===(t=i[0])||void 0===t?void 0:t.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:e,set:t,indexOf:n,byteLength:r}=En[o.typeId],a=i[0];this.isValid=e=>tn(a,e),this.get=t=>e(a,t),this.set=(e,n)=>t(a,e,n),this.indexOf=e=>n(a,e),this.getByteLength=e=>r(a,e),this._offsets=[0,a.length];break}default:Object.setPrototypeOf(this,Cn[o.typeId]),this._offsets=Kt(i)}this.data=i,this.type=o,this.stride=Le(o),this.numChildren=null!==(r=null===(n=o.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce((e,t)=>e+t.byteLength,0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=Jt(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${A[this.type.typeId]}Vector`}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}includes(e,t){return this.indexOf(e,t)>0}getByteLength(e){return 0}[Symbol.iterator](){return bn.visit(this)}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return new In(this.data.concat(t.flatMap(e=>e.data).flat(Number.POSITIVE_INFINITY)))}slice(e,t){return new In(Yt(this,e,t,(e,t,n)=>{let{data:r,_offsets:i}=e;return Zt(r,i,t,n)}))}toJSON(){return[...this]}toArray(){const{type:e,data:t,length:n,stride:r,ArrayType:i}=this;switch(e.typeId){case A.Int:case A.Float:case A.Decimal:case A.Time:case A.Timestamp:switch(t.length){case 0:return new i;case 1:return t[0].values.subarray(0,n*r);default:return t.reduce((e,t)=>{let{values:n}=t;return e.array.set(n,e.offset),e.offset+=n.length,e},{array:new i(n*r),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(e){var t;return this.getChildAt(null===(t=this.type.children)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.numChildren?new In(this.data.map(t=>{let{children:n}=t;return n[e]})):null}get isMemoized(){return!!me.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(me.isDictionary(this.type)){const e=new Mn(this.data[0].dictionary),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new In(t)}return new Mn(this)}unmemoize(){if(me.isDictionary(this.type)&&this.isMemoized){const e=this.data[0].dictionary.unmemoize(),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new In(t)}return this}}Tn=Symbol.toStringTag,In[Tn]=(e=>{e.type=me.prototype,e.data=[],e.length=0,e.stride=1,e.numChildren=0,e._nullCount=-1,e._byteLength=-1,e._offsets=new Uint32Array([0]),e[Symbol.isConcatSpreadable]=!0;const t=Object.keys(A).map(e=>A[e]).filter(e=>"number"===typeof e&&e!==A.NONE);for(const n of t){const t=Bt.getVisitFnByTypeId(n),r=ft.getVisitFnByTypeId(n),i=yn.getVisitFnByTypeId(n),o=kn.getVisitFnByTypeId(n);En[n]={get:t,set:r,indexOf:i,byteLength:o},Cn[n]=Object.create(e,{isValid:{value:nn(tn)},get:{value:nn(Bt.getVisitFnByTypeId(n))},set:{value:rn(ft.getVisitFnByTypeId(n))},indexOf:{value:on(yn.getVisitFnByTypeId(n))},getByteLength:{value:nn(kn.getVisitFnByTypeId(n))}})}return"Vector"})(In.prototype);class Mn extends In{constructor(e){super(e.data);const t=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(e){const n=i[e];if(void 0!==n)return n;const r=t.call(this,e);return i[e]=r,r}}),Object.defineProperty(this,"set",{value(e,t){n.call(this,e,t),i[e]=t}}),Object.defineProperty(this,"slice",{value:(e,t)=>new Mn(r.call(this,e,t))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new In(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Nn{constructor(e,t,n,r,i){let o,a=arguments.length>5&&void 0!==arguments[5]?arguments[5]:[],l=arguments.length>6?arguments[6]:void 0;this.type=e,this.children=a,this.dictionary=l,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof Nn?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=Le(e),i&&((o=i[0])&&(this.valueOffsets=o),(o=i[1])&&(this.values=o),(o=i[2])&&(this.nullBitmap=o),(o=i[3])&&(this.typeIds=o))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0;const{valueOffsets:t,values:n,nullBitmap:r,typeIds:i}=this;return t&&(e+=t.byteLength),n&&(e+=n.byteLength),r&&(e+=r.byteLength),i&&(e+=i.byteLength),this.children.reduce((e,t)=>e+t.byteLength,e)}get nullCount(){let e,t=this._nullCount;return t<=-1&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-cn(e,this.offset,this.offset+this.length)),t}getValid(e){if(this.nullable&&this.nullCount>0){const t=this.offset+e;return 0!==(this.nullBitmap[t>>3]&1<<t%8)}return!0}setValid(e,t){if(!this.nullable)return t;if(!this.nullBitmap||this.nullBitmap.byteLength<=e>>3){const{nullBitmap:e}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:e,_nullCount:0})}const{nullBitmap:n,offset:r}=this,i=r+e>>3,o=(r+e)%8,a=n[i]>>o&1;return t?0===a&&(n[i]|=1<<o,this._nullCount=this.nullCount+1):1===a&&(n[i]&=~(1<<o),this._nullCount=this.nullCount-1),t}clone(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.type,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.offset,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.length,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:this._nullCount,i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:this,o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:this.children;return new Nn(e,t,n,r,i,o,this.dictionary)}slice(e,t){const{stride:n,typeId:r,children:i}=this,o=+(0===this._nullCount)-1,a=16===r?n:1,l=this._sliceBuffers(e,t,n,r);return this.clone(this.type,this.offset+e,t,o,l,0===i.length||this.valueOffsets?i:this._sliceChildren(i,a*e,a*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===A.Null)return this.clone(this.type,0,e,0);const{length:t,nullCount:n}=this,r=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);r[t>>3]=(1<<t-(-8&t))-1,n>0&&r.set(sn(this.offset,t,this.nullBitmap),0);const i=this.buffers;return i[O.VALIDITY]=r,this.clone(this.type,0,e,n+(e-t),i)}_sliceBuffers(e,t,n,r){let i;const{buffers:o}=this;return(i=o[O.TYPE])&&(o[O.TYPE]=i.subarray(e,e+t)),(i=o[O.OFFSET])&&(o[O.OFFSET]=i.subarray(e,e+t+1))||(i=o[O.DATA])&&(o[O.DATA]=6===r?i:i.subarray(n*e,n*(e+t))),o}_sliceChildren(e,t,n){return e.map(e=>e.slice(t,n))}}Nn.prototype.children=Object.freeze([]);class An extends Be{visit(e){return this.getVisitFn(e.type).call(this,e)}visitNull(e){const{type:t,offset:n=0,length:r=0}=e;return new Nn(t,n,r,0)}visitBool(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length>>3,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitInt(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitFloat(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitUtf8(e){const{type:t,offset:n=0}=e,r=q(e.data),i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,r,i])}visitBinary(e){const{type:t,offset:n=0}=e,r=q(e.data),i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,r,i])}visitFixedSizeBinary(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitDate(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitTimestamp(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitTime(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitDecimal(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitList(e){const{type:t,offset:n=0,child:r}=e,i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,void 0,i],[r])}visitStruct(e){const{type:t,offset:n=0,children:r=[]}=e,i=q(e.nullBitmap),{length:o=r.reduce((e,t)=>{let{length:n}=t;return Math.max(e,n)},0),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,void 0,i],r)}visitUnion(e){const{type:t,offset:n=0,children:r=[]}=e,i=q(e.nullBitmap),o=W(t.ArrayType,e.typeIds),{length:a=o.length,nullCount:l=(e.nullBitmap?-1:0)}=e;if(me.isSparseUnion(t))return new Nn(t,n,a,l,[void 0,void 0,i,o],r);const s=X(e.valueOffsets);return new Nn(t,n,a,l,[s,void 0,i,o],r)}visitDictionary(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.indices.ArrayType,e.data),{dictionary:o=new In([(new An).visit({type:t.dictionary})])}=e,{length:a=i.length,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[void 0,i,r],[],o)}visitInterval(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitFixedSizeList(e){const{type:t,offset:n=0,child:r=(new An).visit({type:t.valueType})}=e,i=q(e.nullBitmap),{length:o=r.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,void 0,i],[r])}visitMap(e){const{type:t,offset:n=0,child:r=(new An).visit({type:t.childType})}=e,i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,void 0,i],[r])}}function On(e){return(new An).visit(e)}class zn{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],t=arguments.length>1?arguments[1]:void 0,n=arguments.length>2?arguments[2]:void 0;this.fields=e||[],this.metadata=t||new Map,n||(n=Pn(e)),this.dictionaries=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(e=>e.name)}toString(){return`Schema<{ ${this.fields.map((e,t)=>`${t}: ${e}`).join(", ")} }>`}select(e){const t=new Set(e),n=this.fields.filter(e=>t.has(e.name));return new zn(n,this.metadata)}selectAt(e){const t=e.map(e=>this.fields[e]).filter(Boolean);return new zn(t,this.metadata)}assign(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t[0]instanceof zn?t[0]:Array.isArray(t[0])?new zn(t[0]):new zn(t),i=[...this.fields],o=$n($n(new Map,this.metadata),r.metadata),a=r.fields.filter(e=>{const t=i.findIndex(t=>t.name===e.name);return!~t||(i[t]=e.clone({metadata:$n($n(new Map,i[t].metadata),e.metadata)}))&&!1}),l=Pn(a,new Map);return new zn([...i,...a],o,new Map([...this.dictionaries,...l]))}}zn.prototype.fields=null,zn.prototype.metadata=null,zn.prototype.dictionaries=null;class Dn{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=arguments.length>3?arguments[3]:void 0;this.name=e,this.type=t,this.nullable=n,this.metadata=r||new Map}static new(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];let[r,i,o,a]=t;return t[0]&&"object"===typeof t[0]&&(({name:r}=t[0]),void 0===i&&(i=t[0].type),void 0===o&&(o=t[0].nullable),void 0===a&&(a=t[0].metadata)),new Dn(`${r}`,i,o,a)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];let[r,i,o,a]=t;return t[0]&&"object"===typeof t[0]?({name:r=this.name,type:i=this.type,nullable:o=this.nullable,metadata:a=this.metadata}=t[0]):[r=this.name,i=this.type,o=this.nullable,a=this.metadata]=t,Dn.new(r,i,o,a)}}function $n(e,t){return new Map([...e||new Map,...t||new Map])}function Pn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;for(let n=-1,r=e.length;++n<r;){const r=e[n].type;if(me.isDictionary(r))if(t.has(r.id)){if(t.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else t.set(r.id,r.dictionary);r.children&&r.children.length>0&&Pn(r.children,t)}return t}Dn.prototype.type=null,Dn.prototype.name=null,Dn.prototype.nullable=null,Dn.prototype.metadata=null;class Ln extends Be{compareSchemas(e,t){return e===t||t instanceof e.constructor&&this.compareManyFields(e.fields,t.fields)}compareManyFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((e,n)=>this.compareFields(e,t[n]))}compareFields(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&this.visit(e.type,t.type)}}function Bn(e,t){return t instanceof e.constructor}function Fn(e,t){return e===t||Bn(e,t)}function Rn(e,t){return e===t||Bn(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function Un(e,t){return e===t||Bn(e,t)&&e.precision===t.precision}function jn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit}function Vn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function Hn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function Yn(e,t){return e===t||Bn(e,t)&&e.mode===t.mode&&e.typeIds.every((e,n)=>e===t.typeIds[n])&&Xn.compareManyFields(e.children,t.children)}function Wn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit}Ln.prototype.visitNull=Fn,Ln.prototype.visitBool=Fn,Ln.prototype.visitInt=Rn,Ln.prototype.visitInt8=Rn,Ln.prototype.visitInt16=Rn,Ln.prototype.visitInt32=Rn,Ln.prototype.visitInt64=Rn,Ln.prototype.visitUint8=Rn,Ln.prototype.visitUint16=Rn,Ln.prototype.visitUint32=Rn,Ln.prototype.visitUint64=Rn,Ln.prototype.visitFloat=Un,Ln.prototype.visitFloat16=Un,Ln.prototype.visitFloat32=Un,Ln.prototype.visitFloat64=Un,Ln.prototype.visitUtf8=Fn,Ln.prototype.visitBinary=Fn,Ln.prototype.visitFixedSizeBinary=function(e,t){return e===t||Bn(e,t)&&e.byteWidth===t.byteWidth},Ln.prototype.visitDate=jn,Ln.prototype.visitDateDay=jn,Ln.prototype.visitDateMillisecond=jn,Ln.prototype.visitTimestamp=Vn,Ln.prototype.visitTimestampSecond=Vn,Ln.prototype.visitTimestampMillisecond=Vn,Ln.prototype.visitTimestampMicrosecond=Vn,Ln.prototype.visitTimestampNanosecond=Vn,Ln.prototype.visitTime=Hn,Ln.prototype.visitTimeSecond=Hn,Ln.prototype.visitTimeMillisecond=Hn,Ln.prototype.visitTimeMicrosecond=Hn,Ln.prototype.visitTimeNanosecond=Hn,Ln.prototype.visitDecimal=Fn,Ln.prototype.visitList=function(e,t){return e===t||Bn(e,t)&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)},Ln.prototype.visitStruct=function(e,t){return e===t||Bn(e,t)&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)},Ln.prototype.visitUnion=Yn,Ln.prototype.visitDenseUnion=Yn,Ln.prototype.visitSparseUnion=Yn,Ln.prototype.visitDictionary=function(e,t){return e===t||Bn(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&Xn.visit(e.indices,t.indices)&&Xn.visit(e.dictionary,t.dictionary)},Ln.prototype.visitInterval=Wn,Ln.prototype.visitIntervalDayTime=Wn,Ln.prototype.visitIntervalYearMonth=Wn,Ln.prototype.visitFixedSizeList=function(e,t){return e===t||Bn(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)},Ln.prototype.visitMap=function(e,t){return e===t||Bn(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)};const Xn=new Ln;function qn(e,t){return Xn.compareSchemas(e,t)}var Qn,Gn;class Jn{constructor(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];switch(t.length){case 2:if([this.schema]=t,!(this.schema instanceof zn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=On({nullCount:0,type:new Me(this.schema.fields),children:this.schema.fields.map(e=>On({type:e.type,nullCount:0}))})]=t,!(this.data instanceof Nn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=Kn(this.schema,this.data.children);break;case 1:{const[e]=t,{fields:n,children:r,length:i}=Object.keys(e).reduce((t,n,r)=>(t.children[r]=e[n],t.length=Math.max(t.length,e[n].length),t.fields[r]=Dn.new({name:n,type:e[n].type,nullable:!0}),t),{length:0,fields:new Array,children:new Array}),o=new zn(n),a=On({type:new Me(n),length:i,children:r,nullCount:0});[this.schema,this.data]=Kn(o,a.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=Zn(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(e){return this.data.getValid(e)}get(e){return Bt.visit(this.data,e)}set(e,t){return ft.visit(this.data,e,t)}indexOf(e,t){return yn.visit(this.data,e,t)}getByteLength(e){return kn.visit(this.data,e)}[Symbol.iterator](){return bn.visit(new In([this.data]))}toArray(){return[...this]}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return new nr(this.schema,[this,...t])}slice(e,t){const[n]=new In([this.data]).slice(e,t).data;return new Jn(this.schema,n)}getChild(e){var t;return this.getChildAt(null===(t=this.schema.fields)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.schema.fields.length?new In([this.data.children[e]]):null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=this.data;if(e>-1&&e<this.numCols){t||(t=new In([On({type:new ge,length:this.numRows})]));const i=n.fields.slice(),o=r.children.slice(),a=i[e].clone({type:t.type});[i[e],o[e]]=[a,t.data[0]],n=new zn(i,new Map(this.schema.metadata)),r=On({type:new Me(i),children:o})}return new Jn(n,r)}select(e){const t=this.schema.select(e),n=new Me(t.fields),r=[];for(const i of e){const e=this.schema.fields.findIndex(e=>e.name===i);~e&&(r[e]=this.data.children[e])}return new Jn(t,On({type:n,length:this.numRows,children:r}))}selectAt(e){const t=this.schema.selectAt(e),n=e.map(e=>this.data.children[e]).filter(Boolean),r=On({type:new Me(t.fields),length:this.numRows,children:n});return new Jn(t,r)}}function Kn(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t.reduce((e,t)=>Math.max(e,t.length),0);var r;const i=[...e.fields],o=[...t],a=(n+63&-64)>>3;for(const[l,s]of e.fields.entries()){const e=t[l];e&&e.length===n||(i[l]=s.clone({nullable:!0}),o[l]=null!==(r=null===e||void 0===e?void 0:e._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:On({type:s.type,length:n,nullCount:n,nullBitmap:new Uint8Array(a)}))}return[e.assign(i),On({type:new Me(i),length:n,children:o})]}function Zn(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:new Map;for(let r=-1,i=e.length;++r<i;){const i=e[r].type,o=t[r];if(me.isDictionary(i))if(n.has(i.id)){if(n.get(i.id)!==o.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else o.dictionary&&n.set(i.id,o.dictionary);i.children&&i.children.length>0&&Zn(i.children,o.children,n)}return n}Qn=Symbol.toStringTag,Jn[Qn]=(e=>(e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(Jn.prototype);function er(e,t){return function(e,t){const n=[...e.fields],r=[],i={numBatches:t.reduce((e,t)=>Math.max(e,t.length),0)};let o=0,a=0,l=-1;const s=t.length;let u,c=[];for(;i.numBatches-- >0;){for(a=Number.POSITIVE_INFINITY,l=-1;++l<s;)c[l]=u=t[l].shift(),a=Math.min(a,u?u.length:a);Number.isFinite(a)&&(c=tr(n,a,c,t,i),a>0&&(r[o++]=On({type:new Me(n),length:a,nullCount:0,children:c.slice()})))}return[e=e.assign(n),r.map(t=>new Jn(e,t))]}(e,t.map(e=>e.data.concat()))}function tr(e,t,n,r,i){var o;const a=(t+63&-64)>>3;for(let l=-1,s=r.length;++l<s;){const s=n[l],u=null===s||void 0===s?void 0:s.length;if(u>=t)u===t?n[l]=s:(n[l]=s.slice(0,t),i.numBatches=Math.max(i.numBatches,r[l].unshift(s.slice(t,u-t))));else{const r=e[l];e[l]=r.clone({nullable:!0}),n[l]=null!==(o=null===s||void 0===s?void 0:s._changeLengthAndBackfillNullBitmap(t))&&void 0!==o?o:On({type:r.type,length:t,nullCount:t,nullBitmap:new Uint8Array(a)})}}return n}class nr{constructor(){for(var e,t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];if(0===r.length)return this.batches=[],this.schema=new zn([]),this._offsets=[0],this;let o,a;r[0]instanceof zn&&(o=r.shift()),r[r.length-1]instanceof Uint32Array&&(a=r.pop());const l=e=>{if(e){if(e instanceof Jn)return[e];if(e instanceof nr)return e.batches;if(e instanceof Nn){if(e.type instanceof Me)return[new Jn(new zn(e.type.children),e)]}else{if(Array.isArray(e))return e.flatMap(e=>l(e));if("function"===typeof e[Symbol.iterator])return[...e].flatMap(e=>l(e));if("object"===typeof e){const t=Object.keys(e),n=t.map(t=>new In([e[t]])),r=new zn(t.map((e,t)=>new Dn(String(e),n[t].type))),[,i]=er(r,n);return 0===i.length?[new Jn(e)]:i}}}return[]},s=r.flatMap(e=>l(e));if(o=null!==(t=null!==o&&void 0!==o?o:null===(e=s[0])||void 0===e?void 0:e.schema)&&void 0!==t?t:new zn([]),!(o instanceof zn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const u of s){if(!(u instanceof Jn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!qn(o,u.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=o,this.batches=s,this._offsets=null!==a&&void 0!==a?a:Kt(this.data)}get data(){return this.batches.map(e=>{let{data:t}=e;return t})}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((e,t)=>e+t.length,0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=Jt(this.data)),this._nullCount}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}getByteLength(e){return 0}[Symbol.iterator](){return this.batches.length>0?bn.visit(new In(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(){const e=this.schema;for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];const i=this.data.concat(n.flatMap(e=>{let{data:t}=e;return t}));return new nr(e,i.map(t=>new Jn(e,t)))}slice(e,t){const n=this.schema;[e,t]=Yt({length:this.numRows},e,t);const r=Zt(this.data,this._offsets,e,t);return new nr(n,r.map(e=>new Jn(n,e)))}getChild(e){return this.getChildAt(this.schema.fields.findIndex(t=>t.name===e))}getChildAt(e){if(e>-1&&e<this.schema.fields.length){const t=this.data.map(t=>t.children[e]);if(0===t.length){const{type:n}=this.schema.fields[e],r=On({type:n,length:0,nullCount:0});t.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new In(t)}return null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=[...this.batches];if(e>-1&&e<this.numCols){t||(t=new In([On({type:new ge,length:this.numRows})]));const i=n.fields.slice(),o=i[e].clone({type:t.type}),a=this.schema.fields.map((e,t)=>this.getChildAt(t));[i[e],a[e]]=[o,t],[n,r]=er(n,a)}return new nr(n,r)}select(e){const t=this.schema.fields.reduce((e,t,n)=>e.set(t.name,n),new Map);return this.selectAt(e.map(e=>t.get(e)).filter(e=>e>-1))}selectAt(e){const t=this.schema.selectAt(e),n=this.batches.map(t=>t.selectAt(e));return new nr(t,n)}assign(e){const t=this.schema.fields,[n,r]=e.schema.fields.reduce((e,n,r)=>{const[i,o]=e,a=t.findIndex(e=>e.name===n.name);return~a?o[a]=r:i.push(r),e},[[],[]]),i=this.schema.assign(e.schema),o=[...t.map((e,t)=>[t,r[t]]).map(t=>{let[n,r]=t;return void 0===r?this.getChildAt(n):e.getChildAt(r)}),...n.map(t=>e.getChildAt(t))].filter(Boolean);return new nr(...er(i,o))}}Gn=Symbol.toStringTag,nr[Gn]=(e=>(e.schema=null,e.batches=[],e._offsets=new Uint32Array([0]),e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,e.isValid=nn(tn),e.get=nn(Bt.getVisitFn(A.Struct)),e.set=rn(ft.getVisitFn(A.Struct)),e.indexOf=on(yn.getVisitFn(A.Struct)),e.getByteLength=nn(kn.getVisitFn(A.Struct)),"Table"))(nr.prototype);var rr,ir=function(){function e(e,t,n,r){var i=this;this.getCell=function(e,t){var n=e<i.headerRows&&t<i.headerColumns,r=e>=i.headerRows&&t<i.headerColumns,o=e<i.headerRows&&t>=i.headerColumns;if(n){var a=["blank"];return t>0&&a.push("level"+e),{type:"blank",classNames:a.join(" "),content:""}}if(o)return{type:"columns",classNames:(a=["col_heading","level"+e,"col"+(s=t-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,s,e)};if(r){a=["row_heading","level"+t,"row"+(l=e-i.headerRows)];return{type:"index",id:"T_"+i.uuid+"level"+t+"_row"+l,classNames:a.join(" "),content:i.getContent(i.indexTable,l,t)}}a=["data","row"+(l=e-i.headerRows),"col"+(s=t-i.headerColumns)];var l,s,u=i.styler?i.getContent(i.styler.displayValuesTable,l,s):i.getContent(i.dataTable,l,s);return{type:"data",id:"T_"+i.uuid+"row"+l+"_col"+s,classNames:a.join(" "),content:u}},this.getContent=function(e,t,n){var r=e.getColumnAt(n);return null===r?"":i.getColumnTypeId(e,n)===A.Timestamp?i.nanosToDate(r.get(t)):r.get(t)},this.dataTable=nr.from(e),this.indexTable=nr.from(t),this.columnsTable=nr.from(n),this.styler=r?{caption:r.caption,displayValuesTable:nr.from(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.length+this.columnsTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!0,configurable:!0}),e.prototype.serialize=function(){return{data:this.dataTable.serialize(),index:this.indexTable.serialize(),columns:this.columnsTable.serialize()}},e.prototype.getColumnTypeId=function(e,t){return e.schema.fields[t].type.typeId},e.prototype.nanosToDate=function(e){return new Date(e/1e6)},e}(),or=function(){return or=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var i in t=arguments[n])Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i]);return e},or.apply(this,arguments)};!function(e){e.COMPONENT_READY="streamlit:componentReady",e.SET_COMPONENT_VALUE="streamlit:setComponentValue",e.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(rr||(rr={}));var ar=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new _,e.registeredMessageListener=!1,e.setComponentReady=function(){e.registeredMessageListener||(window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0),e.sendBackMsg(rr.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){void 0===t&&(t=document.body.scrollHeight),t!==e.lastFrameHeight&&(e.lastFrameHeight=t,e.sendBackMsg(rr.SET_FRAME_HEIGHT,{height:t}))},e.setComponentValue=function(t){var n;t instanceof ir?(n="dataframe",t=t.serialize()):!function(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(n){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}(t)?t instanceof ArrayBuffer?(n="bytes",t=new Uint8Array(t)):n="json":(n="bytes",t=new Uint8Array(t.buffer)),e.sendBackMsg(rr.SET_COMPONENT_VALUE,{value:t,dataType:n})},e.onMessageEvent=function(t){if(t.data.type===e.RENDER_EVENT)e.onRenderMessage(t.data)},e.onRenderMessage=function(t){var n=t.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};n=or(or({},n),r);var i=Boolean(t.disabled),o=t.theme;o&&lr(o);var a={disabled:i,args:n,theme:o},l=new CustomEvent(e.RENDER_EVENT,{detail:a});e.events.dispatchEvent(l)},e.argsDataframeToObject=function(t){var n=t.map(function(t){var n=t.key,r=t.value;return[n,e.toArrowTable(r)]});return Object.fromEntries(n)},e.toArrowTable=function(e){var t=e.data,n=t.data,r=t.index,i=t.columns,o=t.styler;return new ir(n,r,i,o)},e.sendBackMsg=function(e,t){window.parent.postMessage(or({isStreamlitMessage:!0,type:e},t),"*")},e}(),lr=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML="\n    :root {\n      --primary-color: "+e.primaryColor+";\n      --background-color: "+e.backgroundColor+";\n      --secondary-background-color: "+e.secondaryBackgroundColor+";\n      --text-color: "+e.textColor+";\n      --font: "+e.font+";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  "};var sr=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n])},e(t,n)};return function(t,n){function r(){this.constructor=t}e(t,n),t.prototype=null===n?Object.create(n):(r.prototype=n.prototype,new r)}}();!function(e){function t(){return null!==e&&e.apply(this,arguments)||this}sr(t,e),t.prototype.componentDidMount=function(){ar.setFrameHeight()},t.prototype.componentDidUpdate=function(){ar.setFrameHeight()}}(l.PureComponent);function ur(){}function cr(e){return null==e?ur:function(){return this.querySelector(e)}}function fr(){return[]}function dr(e){return null==e?fr:function(){return this.querySelectorAll(e)}}function hr(e){return function(){return null==(t=e.apply(this,arguments))?[]:Array.isArray(t)?t:Array.from(t);var t}}function pr(e){return function(){return this.matches(e)}}function yr(e){return function(t){return t.matches(e)}}var mr=Array.prototype.find;function gr(){return this.firstElementChild}var vr=Array.prototype.filter;function br(){return Array.from(this.children)}function wr(e){return new Array(e.length)}function xr(e,t){this.ownerDocument=e.ownerDocument,this.namespaceURI=e.namespaceURI,this._next=null,this._parent=e,this.__data__=t}function Sr(e,t,n,r,i,o){for(var a,l=0,s=t.length,u=o.length;l<u;++l)(a=t[l])?(a.__data__=o[l],r[l]=a):n[l]=new xr(e,o[l]);for(;l<s;++l)(a=t[l])&&(i[l]=a)}function _r(e,t,n,r,i,o,a){var l,s,u,c=new Map,f=t.length,d=o.length,h=new Array(f);for(l=0;l<f;++l)(s=t[l])&&(h[l]=u=a.call(s,s.__data__,l,t)+"",c.has(u)?i[l]=s:c.set(u,s));for(l=0;l<d;++l)u=a.call(e,o[l],l,o)+"",(s=c.get(u))?(r[l]=s,s.__data__=o[l],c.delete(u)):n[l]=new xr(e,o[l]);for(l=0;l<f;++l)(s=t[l])&&c.get(h[l])===s&&(i[l]=s)}function kr(e){return e.__data__}function Tr(e){return"object"===typeof e&&"length"in e?e:Array.from(e)}function Er(e,t){return e<t?-1:e>t?1:e>=t?0:NaN}xr.prototype={constructor:xr,appendChild:function(e){return this._parent.insertBefore(e,this._next)},insertBefore:function(e,t){return this._parent.insertBefore(e,t)},querySelector:function(e){return this._parent.querySelector(e)},querySelectorAll:function(e){return this._parent.querySelectorAll(e)}};var Cr="http://www.w3.org/1999/xhtml";const Ir={svg:"http://www.w3.org/2000/svg",xhtml:Cr,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function Mr(e){var t=e+="",n=t.indexOf(":");return n>=0&&"xmlns"!==(t=e.slice(0,n))&&(e=e.slice(n+1)),Ir.hasOwnProperty(t)?{space:Ir[t],local:e}:e}function Nr(e){return function(){this.removeAttribute(e)}}function Ar(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Or(e,t){return function(){this.setAttribute(e,t)}}function zr(e,t){return function(){this.setAttributeNS(e.space,e.local,t)}}function Dr(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttribute(e):this.setAttribute(e,n)}}function $r(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttributeNS(e.space,e.local):this.setAttributeNS(e.space,e.local,n)}}function Pr(e){return e.ownerDocument&&e.ownerDocument.defaultView||e.document&&e||e.defaultView}function Lr(e){return function(){this.style.removeProperty(e)}}function Br(e,t,n){return function(){this.style.setProperty(e,t,n)}}function Fr(e,t,n){return function(){var r=t.apply(this,arguments);null==r?this.style.removeProperty(e):this.style.setProperty(e,r,n)}}function Rr(e,t){return e.style.getPropertyValue(t)||Pr(e).getComputedStyle(e,null).getPropertyValue(t)}function Ur(e){return function(){delete this[e]}}function jr(e,t){return function(){this[e]=t}}function Vr(e,t){return function(){var n=t.apply(this,arguments);null==n?delete this[e]:this[e]=n}}function Hr(e){return e.trim().split(/^|\s+/)}function Yr(e){return e.classList||new Wr(e)}function Wr(e){this._node=e,this._names=Hr(e.getAttribute("class")||"")}function Xr(e,t){for(var n=Yr(e),r=-1,i=t.length;++r<i;)n.add(t[r])}function qr(e,t){for(var n=Yr(e),r=-1,i=t.length;++r<i;)n.remove(t[r])}function Qr(e){return function(){Xr(this,e)}}function Gr(e){return function(){qr(this,e)}}function Jr(e,t){return function(){(t.apply(this,arguments)?Xr:qr)(this,e)}}function Kr(){this.textContent=""}function Zr(e){return function(){this.textContent=e}}function ei(e){return function(){var t=e.apply(this,arguments);this.textContent=null==t?"":t}}function ti(){this.innerHTML=""}function ni(e){return function(){this.innerHTML=e}}function ri(e){return function(){var t=e.apply(this,arguments);this.innerHTML=null==t?"":t}}function ii(){this.nextSibling&&this.parentNode.appendChild(this)}function oi(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function ai(e){return function(){var t=this.ownerDocument,n=this.namespaceURI;return n===Cr&&t.documentElement.namespaceURI===Cr?t.createElement(e):t.createElementNS(n,e)}}function li(e){return function(){return this.ownerDocument.createElementNS(e.space,e.local)}}function si(e){var t=Mr(e);return(t.local?li:ai)(t)}function ui(){return null}function ci(){var e=this.parentNode;e&&e.removeChild(this)}function fi(){var e=this.cloneNode(!1),t=this.parentNode;return t?t.insertBefore(e,this.nextSibling):e}function di(){var e=this.cloneNode(!0),t=this.parentNode;return t?t.insertBefore(e,this.nextSibling):e}function hi(e){return function(){var t=this.__on;if(t){for(var n,r=0,i=-1,o=t.length;r<o;++r)n=t[r],e.type&&n.type!==e.type||n.name!==e.name?t[++i]=n:this.removeEventListener(n.type,n.listener,n.options);++i?t.length=i:delete this.__on}}}function pi(e,t,n){return function(){var r,i=this.__on,o=function(e){return function(t){e.call(this,t,this.__data__)}}(t);if(i)for(var a=0,l=i.length;a<l;++a)if((r=i[a]).type===e.type&&r.name===e.name)return this.removeEventListener(r.type,r.listener,r.options),this.addEventListener(r.type,r.listener=o,r.options=n),void(r.value=t);this.addEventListener(e.type,o,n),r={type:e.type,name:e.name,value:t,listener:o,options:n},i?i.push(r):this.__on=[r]}}function yi(e,t,n){var r=Pr(e),i=r.CustomEvent;"function"===typeof i?i=new i(t,n):(i=r.document.createEvent("Event"),n?(i.initEvent(t,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(t,!1,!1)),e.dispatchEvent(i)}function mi(e,t){return function(){return yi(this,e,t)}}function gi(e,t){return function(){return yi(this,e,t.apply(this,arguments))}}Wr.prototype={add:function(e){this._names.indexOf(e)<0&&(this._names.push(e),this._node.setAttribute("class",this._names.join(" ")))},remove:function(e){var t=this._names.indexOf(e);t>=0&&(this._names.splice(t,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(e){return this._names.indexOf(e)>=0}};var vi=[null];function bi(e,t){this._groups=e,this._parents=t}function wi(){return new bi([[document.documentElement]],vi)}bi.prototype=wi.prototype={constructor:bi,select:function(e){"function"!==typeof e&&(e=cr(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a,l=t[i],s=l.length,u=r[i]=new Array(s),c=0;c<s;++c)(o=l[c])&&(a=e.call(o,o.__data__,c,l))&&("__data__"in o&&(a.__data__=o.__data__),u[c]=a);return new bi(r,this._parents)},selectAll:function(e){e="function"===typeof e?hr(e):dr(e);for(var t=this._groups,n=t.length,r=[],i=[],o=0;o<n;++o)for(var a,l=t[o],s=l.length,u=0;u<s;++u)(a=l[u])&&(r.push(e.call(a,a.__data__,u,l)),i.push(a));return new bi(r,i)},selectChild:function(e){return this.select(null==e?gr:function(e){return function(){return mr.call(this.children,e)}}("function"===typeof e?e:yr(e)))},selectChildren:function(e){return this.selectAll(null==e?br:function(e){return function(){return vr.call(this.children,e)}}("function"===typeof e?e:yr(e)))},filter:function(e){"function"!==typeof e&&(e=pr(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],l=a.length,s=r[i]=[],u=0;u<l;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&s.push(o);return new bi(r,this._parents)},data:function(e,t){if(!arguments.length)return Array.from(this,kr);var n,r=t?_r:Sr,i=this._parents,o=this._groups;"function"!==typeof e&&(n=e,e=function(){return n});for(var a=o.length,l=new Array(a),s=new Array(a),u=new Array(a),c=0;c<a;++c){var f=i[c],d=o[c],h=d.length,p=Tr(e.call(f,f&&f.__data__,c,i)),y=p.length,m=s[c]=new Array(y),g=l[c]=new Array(y);r(f,d,m,g,u[c]=new Array(h),p,t);for(var v,b,w=0,x=0;w<y;++w)if(v=m[w]){for(w>=x&&(x=w+1);!(b=g[x])&&++x<y;);v._next=b||null}}return(l=new bi(l,i))._enter=s,l._exit=u,l},enter:function(){return new bi(this._enter||this._groups.map(wr),this._parents)},exit:function(){return new bi(this._exit||this._groups.map(wr),this._parents)},join:function(e,t,n){var r=this.enter(),i=this,o=this.exit();return"function"===typeof e?(r=e(r))&&(r=r.selection()):r=r.append(e+""),null!=t&&(i=t(i))&&(i=i.selection()),null==n?o.remove():n(o),r&&i?r.merge(i).order():i},merge:function(e){for(var t=e.selection?e.selection():e,n=this._groups,r=t._groups,i=n.length,o=r.length,a=Math.min(i,o),l=new Array(i),s=0;s<a;++s)for(var u,c=n[s],f=r[s],d=c.length,h=l[s]=new Array(d),p=0;p<d;++p)(u=c[p]||f[p])&&(h[p]=u);for(;s<i;++s)l[s]=n[s];return new bi(l,this._parents)},selection:function(){return this},order:function(){for(var e=this._groups,t=-1,n=e.length;++t<n;)for(var r,i=e[t],o=i.length-1,a=i[o];--o>=0;)(r=i[o])&&(a&&4^r.compareDocumentPosition(a)&&a.parentNode.insertBefore(r,a),a=r);return this},sort:function(e){function t(t,n){return t&&n?e(t.__data__,n.__data__):!t-!n}e||(e=Er);for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var a,l=n[o],s=l.length,u=i[o]=new Array(s),c=0;c<s;++c)(a=l[c])&&(u[c]=a);u.sort(t)}return new bi(i,this._parents).order()},call:function(){var e=arguments[0];return arguments[0]=this,e.apply(null,arguments),this},nodes:function(){return Array.from(this)},node:function(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r=e[t],i=0,o=r.length;i<o;++i){var a=r[i];if(a)return a}return null},size:function(){let e=0;for(const t of this)++e;return e},empty:function(){return!this.node()},each:function(e){for(var t=this._groups,n=0,r=t.length;n<r;++n)for(var i,o=t[n],a=0,l=o.length;a<l;++a)(i=o[a])&&e.call(i,i.__data__,a,o);return this},attr:function(e,t){var n=Mr(e);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==t?n.local?Ar:Nr:"function"===typeof t?n.local?$r:Dr:n.local?zr:Or)(n,t))},style:function(e,t,n){return arguments.length>1?this.each((null==t?Lr:"function"===typeof t?Fr:Br)(e,t,null==n?"":n)):Rr(this.node(),e)},property:function(e,t){return arguments.length>1?this.each((null==t?Ur:"function"===typeof t?Vr:jr)(e,t)):this.node()[e]},classed:function(e,t){var n=Hr(e+"");if(arguments.length<2){for(var r=Yr(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each(("function"===typeof t?Jr:t?Qr:Gr)(n,t))},text:function(e){return arguments.length?this.each(null==e?Kr:("function"===typeof e?ei:Zr)(e)):this.node().textContent},html:function(e){return arguments.length?this.each(null==e?ti:("function"===typeof e?ri:ni)(e)):this.node().innerHTML},raise:function(){return this.each(ii)},lower:function(){return this.each(oi)},append:function(e){var t="function"===typeof e?e:si(e);return this.select(function(){return this.appendChild(t.apply(this,arguments))})},insert:function(e,t){var n="function"===typeof e?e:si(e),r=null==t?ui:"function"===typeof t?t:cr(t);return this.select(function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)})},remove:function(){return this.each(ci)},clone:function(e){return this.select(e?di:fi)},datum:function(e){return arguments.length?this.property("__data__",e):this.node().__data__},on:function(e,t,n){var r,i,o=function(e){return e.trim().split(/^|\s+/).map(function(e){var t="",n=e.indexOf(".");return n>=0&&(t=e.slice(n+1),e=e.slice(0,n)),{type:e,name:t}})}(e+""),a=o.length;if(!(arguments.length<2)){for(l=t?pi:hi,r=0;r<a;++r)this.each(l(o[r],t,n));return this}var l=this.node().__on;if(l)for(var s,u=0,c=l.length;u<c;++u)for(r=0,s=l[u];r<a;++r)if((i=o[r]).type===s.type&&i.name===s.name)return s.value},dispatch:function(e,t){return this.each(("function"===typeof t?gi:mi)(e,t))},[Symbol.iterator]:function*(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r,i=e[t],o=0,a=i.length;o<a;++o)(r=i[o])&&(yield r)}};const xi=wi;function Si(e){return"string"===typeof e?new bi([[document.querySelector(e)]],[document.documentElement]):new bi([[e]],vi)}function _i(e){var t=0,n=e.children,r=n&&n.length;if(r)for(;--r>=0;)t+=n[r].value;else t=1;e.value=t}function ki(e,t){e instanceof Map?(e=[void 0,e],void 0===t&&(t=Ei)):void 0===t&&(t=Ti);for(var n,r,i,o,a,l=new Mi(e),s=[l];n=s.pop();)if((i=t(n.data))&&(a=(i=Array.from(i)).length))for(n.children=i,o=a-1;o>=0;--o)s.push(r=i[o]=new Mi(i[o])),r.parent=n,r.depth=n.depth+1;return l.eachBefore(Ii)}function Ti(e){return e.children}function Ei(e){return Array.isArray(e)?e[1]:null}function Ci(e){void 0!==e.data.value&&(e.value=e.data.value),e.data=e.data.data}function Ii(e){var t=0;do{e.height=t}while((e=e.parent)&&e.height<++t)}function Mi(e){this.data=e,this.depth=this.height=0,this.parent=null}function Ni(e,t){return e.parent===t.parent?1:2}function Ai(e){var t=e.children;return t?t[0]:e.t}function Oi(e){var t=e.children;return t?t[t.length-1]:e.t}function zi(e,t,n){var r=n/(t.i-e.i);t.c-=r,t.s+=n,e.c+=r,t.z+=n,t.m+=n}function Di(e,t,n){return e.a.parent===t.parent?e.a:n}function $i(e,t){this._=e,this.parent=null,this.children=null,this.A=null,this.a=this,this.z=0,this.m=0,this.c=0,this.s=0,this.t=null,this.i=t}function Pi(e){return null==e?null:function(e){if("function"!==typeof e)throw new Error;return e}(e)}Mi.prototype=ki.prototype={constructor:Mi,count:function(){return this.eachAfter(_i)},each:function(e,t){let n=-1;for(const r of this)e.call(t,r,++n,this);return this},eachAfter:function(e,t){for(var n,r,i,o=this,a=[o],l=[],s=-1;o=a.pop();)if(l.push(o),n=o.children)for(r=0,i=n.length;r<i;++r)a.push(n[r]);for(;o=l.pop();)e.call(t,o,++s,this);return this},eachBefore:function(e,t){for(var n,r,i=this,o=[i],a=-1;i=o.pop();)if(e.call(t,i,++a,this),n=i.children)for(r=n.length-1;r>=0;--r)o.push(n[r]);return this},find:function(e,t){let n=-1;for(const r of this)if(e.call(t,r,++n,this))return r},sum:function(e){return this.eachAfter(function(t){for(var n=+e(t.data)||0,r=t.children,i=r&&r.length;--i>=0;)n+=r[i].value;t.value=n})},sort:function(e){return this.eachBefore(function(t){t.children&&t.children.sort(e)})},path:function(e){for(var t=this,n=function(e,t){if(e===t)return e;var n=e.ancestors(),r=t.ancestors(),i=null;e=n.pop(),t=r.pop();for(;e===t;)i=e,e=n.pop(),t=r.pop();return i}(t,e),r=[t];t!==n;)t=t.parent,r.push(t);for(var i=r.length;e!==n;)r.splice(i,0,e),e=e.parent;return r},ancestors:function(){for(var e=this,t=[e];e=e.parent;)t.push(e);return t},descendants:function(){return Array.from(this)},leaves:function(){var e=[];return this.eachBefore(function(t){t.children||e.push(t)}),e},links:function(){var e=this,t=[];return e.each(function(n){n!==e&&t.push({source:n.parent,target:n})}),t},copy:function(){return ki(this).eachBefore(Ci)},[Symbol.iterator]:function*(){var e,t,n,r,i=this,o=[i];do{for(e=o.reverse(),o=[];i=e.pop();)if(yield i,t=i.children)for(n=0,r=t.length;n<r;++n)o.push(t[n])}while(o.length)}},$i.prototype=Object.create(Mi.prototype);var Li={depth:-1},Bi={},Fi={};function Ri(e){return e.id}function Ui(e){return e.parentId}function ji(e){let t=e.length;if(t<2)return"";for(;--t>1&&!Vi(e,t););return e.slice(0,t)}function Vi(e,t){if("/"===e[t]){let n=0;for(;t>0&&"\\"===e[--t];)++n;if(0===(1&n))return!0}return!1}var Hi={value:()=>{}};function Yi(){for(var e,t=0,n=arguments.length,r={};t<n;++t){if(!(e=arguments[t]+"")||e in r||/[\s.]/.test(e))throw new Error("illegal type: "+e);r[e]=[]}return new Wi(r)}function Wi(e){this._=e}function Xi(e,t){for(var n,r=0,i=e.length;r<i;++r)if((n=e[r]).name===t)return n.value}function qi(e,t,n){for(var r=0,i=e.length;r<i;++r)if(e[r].name===t){e[r]=Hi,e=e.slice(0,r).concat(e.slice(r+1));break}return null!=n&&e.push({name:t,value:n}),e}Wi.prototype=Yi.prototype={constructor:Wi,on:function(e,t){var n,r,i=this._,o=(r=i,(e+"").trim().split(/^|\s+/).map(function(e){var t="",n=e.indexOf(".");if(n>=0&&(t=e.slice(n+1),e=e.slice(0,n)),e&&!r.hasOwnProperty(e))throw new Error("unknown type: "+e);return{type:e,name:t}})),a=-1,l=o.length;if(!(arguments.length<2)){if(null!=t&&"function"!==typeof t)throw new Error("invalid callback: "+t);for(;++a<l;)if(n=(e=o[a]).type)i[n]=qi(i[n],e.name,t);else if(null==t)for(n in i)i[n]=qi(i[n],e.name,null);return this}for(;++a<l;)if((n=(e=o[a]).type)&&(n=Xi(i[n],e.name)))return n},copy:function(){var e={},t=this._;for(var n in t)e[n]=t[n].slice();return new Wi(e)},call:function(e,t){if((n=arguments.length-2)>0)for(var n,r,i=new Array(n),o=0;o<n;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(o=0,n=(r=this._[e]).length;o<n;++o)r[o].value.apply(t,i)},apply:function(e,t,n){if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(var r=this._[e],i=0,o=r.length;i<o;++i)r[i].value.apply(t,n)}};const Qi=Yi,Gi={capture:!0,passive:!1};function Ji(e){e.preventDefault(),e.stopImmediatePropagation()}function Ki(e){return((e=Math.exp(e))+1/e)/2}const Zi=function e(t,n,r){function i(e,i){var o,a,l=e[0],s=e[1],u=e[2],c=i[0],f=i[1],d=i[2],h=c-l,p=f-s,y=h*h+p*p;if(y<1e-12)a=Math.log(d/u)/t,o=function(e){return[l+e*h,s+e*p,u*Math.exp(t*e*a)]};else{var m=Math.sqrt(y),g=(d*d-u*u+r*y)/(2*u*n*m),v=(d*d-u*u-r*y)/(2*d*n*m),b=Math.log(Math.sqrt(g*g+1)-g),w=Math.log(Math.sqrt(v*v+1)-v);a=(w-b)/t,o=function(e){var r,i=e*a,o=Ki(b),c=u/(n*m)*(o*(r=t*i+b,((r=Math.exp(2*r))-1)/(r+1))-function(e){return((e=Math.exp(e))-1/e)/2}(b));return[l+c*h,s+c*p,u*o/Ki(t*i+b)]}}return o.duration=1e3*a*t/Math.SQRT2,o}return i.rho=function(t){var n=Math.max(.001,+t),r=n*n;return e(n,r,r*r)},i}(Math.SQRT2,2,4);function eo(e,t){if(e=function(e){let t;for(;t=e.sourceEvent;)e=t;return e}(e),void 0===t&&(t=e.currentTarget),t){var n=t.ownerSVGElement||t;if(n.createSVGPoint){var r=n.createSVGPoint();return r.x=e.clientX,r.y=e.clientY,[(r=r.matrixTransform(t.getScreenCTM().inverse())).x,r.y]}if(t.getBoundingClientRect){var i=t.getBoundingClientRect();return[e.clientX-i.left-t.clientLeft,e.clientY-i.top-t.clientTop]}}return[e.pageX,e.pageY]}var to,no,ro=0,io=0,oo=0,ao=0,lo=0,so=0,uo="object"===typeof performance&&performance.now?performance:Date,co="object"===typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(e){setTimeout(e,17)};function fo(){return lo||(co(ho),lo=uo.now()+so)}function ho(){lo=0}function po(){this._call=this._time=this._next=null}function yo(e,t,n){var r=new po;return r.restart(e,t,n),r}function mo(){lo=(ao=uo.now())+so,ro=io=0;try{!function(){fo(),++ro;for(var e,t=to;t;)(e=lo-t._time)>=0&&t._call.call(void 0,e),t=t._next;--ro}()}finally{ro=0,function(){var e,t,n=to,r=1/0;for(;n;)n._call?(r>n._time&&(r=n._time),e=n,n=n._next):(t=n._next,n._next=null,n=e?e._next=t:to=t);no=e,vo(r)}(),lo=0}}function go(){var e=uo.now(),t=e-ao;t>1e3&&(so-=t,ao=e)}function vo(e){ro||(io&&(io=clearTimeout(io)),e-lo>24?(e<1/0&&(io=setTimeout(mo,e-uo.now()-so)),oo&&(oo=clearInterval(oo))):(oo||(ao=uo.now(),oo=setInterval(go,1e3)),ro=1,co(mo)))}function bo(e,t,n){var r=new po;return t=null==t?0:+t,r.restart(n=>{r.stop(),e(n+t)},t,n),r}po.prototype=yo.prototype={constructor:po,restart:function(e,t,n){if("function"!==typeof e)throw new TypeError("callback is not a function");n=(null==n?fo():+n)+(null==t?0:+t),this._next||no===this||(no?no._next=this:to=this,no=this),this._call=e,this._time=n,vo()},stop:function(){this._call&&(this._call=null,this._time=1/0,vo())}};var wo=Qi("start","end","cancel","interrupt"),xo=[];function So(e,t,n,r,i,o){var a=e.__transition;if(a){if(n in a)return}else e.__transition={};!function(e,t,n){var r,i=e.__transition;function o(e){n.state=1,n.timer.restart(a,n.delay,n.time),n.delay<=e&&a(e-n.delay)}function a(o){var u,c,f,d;if(1!==n.state)return s();for(u in i)if((d=i[u]).name===n.name){if(3===d.state)return bo(a);4===d.state?(d.state=6,d.timer.stop(),d.on.call("interrupt",e,e.__data__,d.index,d.group),delete i[u]):+u<t&&(d.state=6,d.timer.stop(),d.on.call("cancel",e,e.__data__,d.index,d.group),delete i[u])}if(bo(function(){3===n.state&&(n.state=4,n.timer.restart(l,n.delay,n.time),l(o))}),n.state=2,n.on.call("start",e,e.__data__,n.index,n.group),2===n.state){for(n.state=3,r=new Array(f=n.tween.length),u=0,c=-1;u<f;++u)(d=n.tween[u].value.call(e,e.__data__,n.index,n.group))&&(r[++c]=d);r.length=c+1}}function l(t){for(var i=t<n.duration?n.ease.call(null,t/n.duration):(n.timer.restart(s),n.state=5,1),o=-1,a=r.length;++o<a;)r[o].call(e,i);5===n.state&&(n.on.call("end",e,e.__data__,n.index,n.group),s())}function s(){for(var r in n.state=6,n.timer.stop(),delete i[t],i)return;delete e.__transition}i[t]=n,n.timer=yo(o,0,n.time)}(e,n,{name:t,index:r,group:i,on:wo,tween:xo,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:0})}function _o(e,t){var n=To(e,t);if(n.state>0)throw new Error("too late; already scheduled");return n}function ko(e,t){var n=To(e,t);if(n.state>3)throw new Error("too late; already running");return n}function To(e,t){var n=e.__transition;if(!n||!(n=n[t]))throw new Error("transition not found");return n}function Eo(e,t){var n,r,i,o=e.__transition,a=!0;if(o){for(i in t=null==t?null:t+"",o)(n=o[i]).name===t?(r=n.state>2&&n.state<5,n.state=6,n.timer.stop(),n.on.call(r?"interrupt":"cancel",e,e.__data__,n.index,n.group),delete o[i]):a=!1;a&&delete e.__transition}}function Co(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}var Io,Mo=180/Math.PI,No={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Ao(e,t,n,r,i,o){var a,l,s;return(a=Math.sqrt(e*e+t*t))&&(e/=a,t/=a),(s=e*n+t*r)&&(n-=e*s,r-=t*s),(l=Math.sqrt(n*n+r*r))&&(n/=l,r/=l,s/=l),e*r<t*n&&(e=-e,t=-t,s=-s,a=-a),{translateX:i,translateY:o,rotate:Math.atan2(t,e)*Mo,skewX:Math.atan(s)*Mo,scaleX:a,scaleY:l}}function Oo(e,t,n,r){function i(e){return e.length?e.pop()+" ":""}return function(o,a){var l=[],s=[];return o=e(o),a=e(a),function(e,r,i,o,a,l){if(e!==i||r!==o){var s=a.push("translate(",null,t,null,n);l.push({i:s-4,x:Co(e,i)},{i:s-2,x:Co(r,o)})}else(i||o)&&a.push("translate("+i+t+o+n)}(o.translateX,o.translateY,a.translateX,a.translateY,l,s),function(e,t,n,o){e!==t?(e-t>180?t+=360:t-e>180&&(e+=360),o.push({i:n.push(i(n)+"rotate(",null,r)-2,x:Co(e,t)})):t&&n.push(i(n)+"rotate("+t+r)}(o.rotate,a.rotate,l,s),function(e,t,n,o){e!==t?o.push({i:n.push(i(n)+"skewX(",null,r)-2,x:Co(e,t)}):t&&n.push(i(n)+"skewX("+t+r)}(o.skewX,a.skewX,l,s),function(e,t,n,r,o,a){if(e!==n||t!==r){var l=o.push(i(o)+"scale(",null,",",null,")");a.push({i:l-4,x:Co(e,n)},{i:l-2,x:Co(t,r)})}else 1===n&&1===r||o.push(i(o)+"scale("+n+","+r+")")}(o.scaleX,o.scaleY,a.scaleX,a.scaleY,l,s),o=a=null,function(e){for(var t,n=-1,r=s.length;++n<r;)l[(t=s[n]).i]=t.x(e);return l.join("")}}}var zo=Oo(function(e){const t=new("function"===typeof DOMMatrix?DOMMatrix:WebKitCSSMatrix)(e+"");return t.isIdentity?No:Ao(t.a,t.b,t.c,t.d,t.e,t.f)},"px, ","px)","deg)"),Do=Oo(function(e){return null==e?No:(Io||(Io=document.createElementNS("http://www.w3.org/2000/svg","g")),Io.setAttribute("transform",e),(e=Io.transform.baseVal.consolidate())?Ao((e=e.matrix).a,e.b,e.c,e.d,e.e,e.f):No)},", ",")",")");function $o(e,t){var n,r;return function(){var i=ko(this,e),o=i.tween;if(o!==n)for(var a=0,l=(r=n=o).length;a<l;++a)if(r[a].name===t){(r=r.slice()).splice(a,1);break}i.tween=r}}function Po(e,t,n){var r,i;if("function"!==typeof n)throw new Error;return function(){var o=ko(this,e),a=o.tween;if(a!==r){i=(r=a).slice();for(var l={name:t,value:n},s=0,u=i.length;s<u;++s)if(i[s].name===t){i[s]=l;break}s===u&&i.push(l)}o.tween=i}}function Lo(e,t,n){var r=e._id;return e.each(function(){var e=ko(this,r);(e.value||(e.value={}))[t]=n.apply(this,arguments)}),function(e){return To(e,r).value[t]}}function Bo(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function Fo(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Ro(){}var Uo=.7,jo=1/Uo,Vo="\\s*([+-]?\\d+)\\s*",Ho="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",Yo="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Wo=/^#([0-9a-f]{3,8})$/,Xo=new RegExp(`^rgb\\(${Vo},${Vo},${Vo}\\)$`),qo=new RegExp(`^rgb\\(${Yo},${Yo},${Yo}\\)$`),Qo=new RegExp(`^rgba\\(${Vo},${Vo},${Vo},${Ho}\\)$`),Go=new RegExp(`^rgba\\(${Yo},${Yo},${Yo},${Ho}\\)$`),Jo=new RegExp(`^hsl\\(${Ho},${Yo},${Yo}\\)$`),Ko=new RegExp(`^hsla\\(${Ho},${Yo},${Yo},${Ho}\\)$`),Zo={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function ea(){return this.rgb().formatHex()}function ta(){return this.rgb().formatRgb()}function na(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=Wo.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?ra(t):3===n?new aa(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?ia(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?ia(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=Xo.exec(e))?new aa(t[1],t[2],t[3],1):(t=qo.exec(e))?new aa(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=Qo.exec(e))?ia(t[1],t[2],t[3],t[4]):(t=Go.exec(e))?ia(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=Jo.exec(e))?da(t[1],t[2]/100,t[3]/100,1):(t=Ko.exec(e))?da(t[1],t[2]/100,t[3]/100,t[4]):Zo.hasOwnProperty(e)?ra(Zo[e]):"transparent"===e?new aa(NaN,NaN,NaN,0):null}function ra(e){return new aa(e>>16&255,e>>8&255,255&e,1)}function ia(e,t,n,r){return r<=0&&(e=t=n=NaN),new aa(e,t,n,r)}function oa(e,t,n,r){return 1===arguments.length?((i=e)instanceof Ro||(i=na(i)),i?new aa((i=i.rgb()).r,i.g,i.b,i.opacity):new aa):new aa(e,t,n,null==r?1:r);var i}function aa(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function la(){return`#${fa(this.r)}${fa(this.g)}${fa(this.b)}`}function sa(){const e=ua(this.opacity);return`${1===e?"rgb(":"rgba("}${ca(this.r)}, ${ca(this.g)}, ${ca(this.b)}${1===e?")":`, ${e})`}`}function ua(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function ca(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function fa(e){return((e=ca(e))<16?"0":"")+e.toString(16)}function da(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new pa(e,t,n,r)}function ha(e){if(e instanceof pa)return new pa(e.h,e.s,e.l,e.opacity);if(e instanceof Ro||(e=na(e)),!e)return new pa;if(e instanceof pa)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),o=Math.max(t,n,r),a=NaN,l=o-i,s=(o+i)/2;return l?(a=t===o?(n-r)/l+6*(n<r):n===o?(r-t)/l+2:(t-n)/l+4,l/=s<.5?o+i:2-o-i,a*=60):l=s>0&&s<1?0:a,new pa(a,l,s,e.opacity)}function pa(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function ya(e){return(e=(e||0)%360)<0?e+360:e}function ma(e){return Math.max(0,Math.min(1,e||0))}function ga(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function va(e,t,n,r,i){var o=e*e,a=o*e;return((1-3*e+3*o-a)*t+(4-6*o+3*a)*n+(1+3*e+3*o-3*a)*r+a*i)/6}Bo(Ro,na,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:ea,formatHex:ea,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return ha(this).formatHsl()},formatRgb:ta,toString:ta}),Bo(aa,oa,Fo(Ro,{brighter(e){return e=null==e?jo:Math.pow(jo,e),new aa(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=null==e?Uo:Math.pow(Uo,e),new aa(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new aa(ca(this.r),ca(this.g),ca(this.b),ua(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:la,formatHex:la,formatHex8:function(){return`#${fa(this.r)}${fa(this.g)}${fa(this.b)}${fa(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:sa,toString:sa})),Bo(pa,function(e,t,n,r){return 1===arguments.length?ha(e):new pa(e,t,n,null==r?1:r)},Fo(Ro,{brighter(e){return e=null==e?jo:Math.pow(jo,e),new pa(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=null==e?Uo:Math.pow(Uo,e),new pa(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new aa(ga(e>=240?e-240:e+120,i,r),ga(e,i,r),ga(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new pa(ya(this.h),ma(this.s),ma(this.l),ua(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=ua(this.opacity);return`${1===e?"hsl(":"hsla("}${ya(this.h)}, ${100*ma(this.s)}%, ${100*ma(this.l)}%${1===e?")":`, ${e})`}`}}));const ba=e=>()=>e;function wa(e,t){return function(n){return e+n*t}}function xa(e){return 1===(e=+e)?Sa:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):ba(isNaN(t)?n:t)}}function Sa(e,t){var n=t-e;return n?wa(e,n):ba(isNaN(e)?t:e)}const _a=function e(t){var n=xa(t);function r(e,t){var r=n((e=oa(e)).r,(t=oa(t)).r),i=n(e.g,t.g),o=n(e.b,t.b),a=Sa(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=i(t),e.b=o(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function ka(e){return function(t){var n,r,i=t.length,o=new Array(i),a=new Array(i),l=new Array(i);for(n=0;n<i;++n)r=oa(t[n]),o[n]=r.r||0,a[n]=r.g||0,l[n]=r.b||0;return o=e(o),a=e(a),l=e(l),r.opacity=1,function(e){return r.r=o(e),r.g=a(e),r.b=l(e),r+""}}}ka(function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),i=e[r],o=e[r+1],a=r>0?e[r-1]:2*i-o,l=r<t-1?e[r+2]:2*o-i;return va((n-r/t)*t,a,i,o,l)}}),ka(function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),i=e[(r+t-1)%t],o=e[r%t],a=e[(r+1)%t],l=e[(r+2)%t];return va((n-r/t)*t,i,o,a,l)}});var Ta=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ea=new RegExp(Ta.source,"g");function Ca(e,t){var n,r,i,o=Ta.lastIndex=Ea.lastIndex=0,a=-1,l=[],s=[];for(e+="",t+="";(n=Ta.exec(e))&&(r=Ea.exec(t));)(i=r.index)>o&&(i=t.slice(o,i),l[a]?l[a]+=i:l[++a]=i),(n=n[0])===(r=r[0])?l[a]?l[a]+=r:l[++a]=r:(l[++a]=null,s.push({i:a,x:Co(n,r)})),o=Ea.lastIndex;return o<t.length&&(i=t.slice(o),l[a]?l[a]+=i:l[++a]=i),l.length<2?s[0]?function(e){return function(t){return e(t)+""}}(s[0].x):function(e){return function(){return e}}(t):(t=s.length,function(e){for(var n,r=0;r<t;++r)l[(n=s[r]).i]=n.x(e);return l.join("")})}function Ia(e,t){var n;return("number"===typeof t?Co:t instanceof na?_a:(n=na(t))?(t=n,_a):Ca)(e,t)}function Ma(e){return function(){this.removeAttribute(e)}}function Na(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Aa(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttribute(e);return a===o?null:a===r?i:i=t(r=a,n)}}function Oa(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttributeNS(e.space,e.local);return a===o?null:a===r?i:i=t(r=a,n)}}function za(e,t,n){var r,i,o;return function(){var a,l,s=n(this);if(null!=s)return(a=this.getAttribute(e))===(l=s+"")?null:a===r&&l===i?o:(i=l,o=t(r=a,s));this.removeAttribute(e)}}function Da(e,t,n){var r,i,o;return function(){var a,l,s=n(this);if(null!=s)return(a=this.getAttributeNS(e.space,e.local))===(l=s+"")?null:a===r&&l===i?o:(i=l,o=t(r=a,s));this.removeAttributeNS(e.space,e.local)}}function $a(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttributeNS(e.space,e.local,t.call(this,n))}}(e,i)),n}return i._value=t,i}function Pa(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttribute(e,t.call(this,n))}}(e,i)),n}return i._value=t,i}function La(e,t){return function(){_o(this,e).delay=+t.apply(this,arguments)}}function Ba(e,t){return t=+t,function(){_o(this,e).delay=t}}function Fa(e,t){return function(){ko(this,e).duration=+t.apply(this,arguments)}}function Ra(e,t){return t=+t,function(){ko(this,e).duration=t}}var Ua=xi.prototype.constructor;function ja(e){return function(){this.style.removeProperty(e)}}var Va=0;function Ha(e,t,n,r){this._groups=e,this._parents=t,this._name=n,this._id=r}function Ya(){return++Va}var Wa=xi.prototype;Ha.prototype=function(e){return xi().transition(e)}.prototype={constructor:Ha,select:function(e){var t=this._name,n=this._id;"function"!==typeof e&&(e=cr(e));for(var r=this._groups,i=r.length,o=new Array(i),a=0;a<i;++a)for(var l,s,u=r[a],c=u.length,f=o[a]=new Array(c),d=0;d<c;++d)(l=u[d])&&(s=e.call(l,l.__data__,d,u))&&("__data__"in l&&(s.__data__=l.__data__),f[d]=s,So(f[d],t,n,d,f,To(l,n)));return new Ha(o,this._parents,t,n)},selectAll:function(e){var t=this._name,n=this._id;"function"!==typeof e&&(e=dr(e));for(var r=this._groups,i=r.length,o=[],a=[],l=0;l<i;++l)for(var s,u=r[l],c=u.length,f=0;f<c;++f)if(s=u[f]){for(var d,h=e.call(s,s.__data__,f,u),p=To(s,n),y=0,m=h.length;y<m;++y)(d=h[y])&&So(d,t,n,y,h,p);o.push(h),a.push(s)}return new Ha(o,a,t,n)},selectChild:Wa.selectChild,selectChildren:Wa.selectChildren,filter:function(e){"function"!==typeof e&&(e=pr(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],l=a.length,s=r[i]=[],u=0;u<l;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&s.push(o);return new Ha(r,this._parents,this._name,this._id)},merge:function(e){if(e._id!==this._id)throw new Error;for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),l=0;l<o;++l)for(var s,u=t[l],c=n[l],f=u.length,d=a[l]=new Array(f),h=0;h<f;++h)(s=u[h]||c[h])&&(d[h]=s);for(;l<r;++l)a[l]=t[l];return new Ha(a,this._parents,this._name,this._id)},selection:function(){return new Ua(this._groups,this._parents)},transition:function(){for(var e=this._name,t=this._id,n=Ya(),r=this._groups,i=r.length,o=0;o<i;++o)for(var a,l=r[o],s=l.length,u=0;u<s;++u)if(a=l[u]){var c=To(a,t);So(a,e,n,u,l,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new Ha(r,this._parents,e,n)},call:Wa.call,nodes:Wa.nodes,node:Wa.node,size:Wa.size,empty:Wa.empty,each:Wa.each,on:function(e,t){var n=this._id;return arguments.length<2?To(this.node(),n).on.on(e):this.each(function(e,t,n){var r,i,o=function(e){return(e+"").trim().split(/^|\s+/).every(function(e){var t=e.indexOf(".");return t>=0&&(e=e.slice(0,t)),!e||"start"===e})}(t)?_o:ko;return function(){var a=o(this,e),l=a.on;l!==r&&(i=(r=l).copy()).on(t,n),a.on=i}}(n,e,t))},attr:function(e,t){var n=Mr(e),r="transform"===n?Do:Ia;return this.attrTween(e,"function"===typeof t?(n.local?Da:za)(n,r,Lo(this,"attr."+e,t)):null==t?(n.local?Na:Ma)(n):(n.local?Oa:Aa)(n,r,t))},attrTween:function(e,t){var n="attr."+e;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==t)return this.tween(n,null);if("function"!==typeof t)throw new Error;var r=Mr(e);return this.tween(n,(r.local?$a:Pa)(r,t))},style:function(e,t,n){var r="transform"===(e+="")?zo:Ia;return null==t?this.styleTween(e,function(e,t){var n,r,i;return function(){var o=Rr(this,e),a=(this.style.removeProperty(e),Rr(this,e));return o===a?null:o===n&&a===r?i:i=t(n=o,r=a)}}(e,r)).on("end.style."+e,ja(e)):"function"===typeof t?this.styleTween(e,function(e,t,n){var r,i,o;return function(){var a=Rr(this,e),l=n(this),s=l+"";return null==l&&(this.style.removeProperty(e),s=l=Rr(this,e)),a===s?null:a===r&&s===i?o:(i=s,o=t(r=a,l))}}(e,r,Lo(this,"style."+e,t))).each(function(e,t){var n,r,i,o,a="style."+t,l="end."+a;return function(){var s=ko(this,e),u=s.on,c=null==s.value[a]?o||(o=ja(t)):void 0;u===n&&i===c||(r=(n=u).copy()).on(l,i=c),s.on=r}}(this._id,e)):this.styleTween(e,function(e,t,n){var r,i,o=n+"";return function(){var a=Rr(this,e);return a===o?null:a===r?i:i=t(r=a,n)}}(e,r,t),n).on("end.style."+e,null)},styleTween:function(e,t,n){var r="style."+(e+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==t)return this.tween(r,null);if("function"!==typeof t)throw new Error;return this.tween(r,function(e,t,n){var r,i;function o(){var o=t.apply(this,arguments);return o!==i&&(r=(i=o)&&function(e,t,n){return function(r){this.style.setProperty(e,t.call(this,r),n)}}(e,o,n)),r}return o._value=t,o}(e,t,null==n?"":n))},text:function(e){return this.tween("text","function"===typeof e?function(e){return function(){var t=e(this);this.textContent=null==t?"":t}}(Lo(this,"text",e)):function(e){return function(){this.textContent=e}}(null==e?"":e+""))},textTween:function(e){var t="text";if(arguments.length<1)return(t=this.tween(t))&&t._value;if(null==e)return this.tween(t,null);if("function"!==typeof e)throw new Error;return this.tween(t,function(e){var t,n;function r(){var r=e.apply(this,arguments);return r!==n&&(t=(n=r)&&function(e){return function(t){this.textContent=e.call(this,t)}}(r)),t}return r._value=e,r}(e))},remove:function(){return this.on("end.remove",function(e){return function(){var t=this.parentNode;for(var n in this.__transition)if(+n!==e)return;t&&t.removeChild(this)}}(this._id))},tween:function(e,t){var n=this._id;if(e+="",arguments.length<2){for(var r,i=To(this.node(),n).tween,o=0,a=i.length;o<a;++o)if((r=i[o]).name===e)return r.value;return null}return this.each((null==t?$o:Po)(n,e,t))},delay:function(e){var t=this._id;return arguments.length?this.each(("function"===typeof e?La:Ba)(t,e)):To(this.node(),t).delay},duration:function(e){var t=this._id;return arguments.length?this.each(("function"===typeof e?Fa:Ra)(t,e)):To(this.node(),t).duration},ease:function(e){var t=this._id;return arguments.length?this.each(function(e,t){if("function"!==typeof t)throw new Error;return function(){ko(this,e).ease=t}}(t,e)):To(this.node(),t).ease},easeVarying:function(e){if("function"!==typeof e)throw new Error;return this.each(function(e,t){return function(){var n=t.apply(this,arguments);if("function"!==typeof n)throw new Error;ko(this,e).ease=n}}(this._id,e))},end:function(){var e,t,n=this,r=n._id,i=n.size();return new Promise(function(o,a){var l={value:a},s={value:function(){0===--i&&o()}};n.each(function(){var n=ko(this,r),i=n.on;i!==e&&((t=(e=i).copy())._.cancel.push(l),t._.interrupt.push(l),t._.end.push(s)),n.on=t}),0===i&&o()})},[Symbol.iterator]:Wa[Symbol.iterator]};var Xa={time:null,delay:0,duration:250,ease:function(e){return((e*=2)<=1?e*e*e:(e-=2)*e*e+2)/2}};function qa(e,t){for(var n;!(n=e.__transition)||!(n=n[t]);)if(!(e=e.parentNode))throw new Error(`transition ${t} not found`);return n}xi.prototype.interrupt=function(e){return this.each(function(){Eo(this,e)})},xi.prototype.transition=function(e){var t,n;e instanceof Ha?(t=e._id,e=e._name):(t=Ya(),(n=Xa).time=fo(),e=null==e?null:e+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var a,l=r[o],s=l.length,u=0;u<s;++u)(a=l[u])&&So(a,e,t,u,l,n||qa(a,t));return new Ha(r,this._parents,e,t)};const Qa=e=>()=>e;function Ga(e,t){let{sourceEvent:n,target:r,transform:i,dispatch:o}=t;Object.defineProperties(this,{type:{value:e,enumerable:!0,configurable:!0},sourceEvent:{value:n,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},transform:{value:i,enumerable:!0,configurable:!0},_:{value:o}})}function Ja(e,t,n){this.k=e,this.x=t,this.y=n}Ja.prototype={constructor:Ja,scale:function(e){return 1===e?this:new Ja(this.k*e,this.x,this.y)},translate:function(e,t){return 0===e&0===t?this:new Ja(this.k,this.x+this.k*e,this.y+this.k*t)},apply:function(e){return[e[0]*this.k+this.x,e[1]*this.k+this.y]},applyX:function(e){return e*this.k+this.x},applyY:function(e){return e*this.k+this.y},invert:function(e){return[(e[0]-this.x)/this.k,(e[1]-this.y)/this.k]},invertX:function(e){return(e-this.x)/this.k},invertY:function(e){return(e-this.y)/this.k},rescaleX:function(e){return e.copy().domain(e.range().map(this.invertX,this).map(e.invert,e))},rescaleY:function(e){return e.copy().domain(e.range().map(this.invertY,this).map(e.invert,e))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var Ka=new Ja(1,0,0);function Za(e){e.stopImmediatePropagation()}function el(e){e.preventDefault(),e.stopImmediatePropagation()}function tl(e){return(!e.ctrlKey||"wheel"===e.type)&&!e.button}function nl(){var e=this;return e instanceof SVGElement?(e=e.ownerSVGElement||e).hasAttribute("viewBox")?[[(e=e.viewBox.baseVal).x,e.y],[e.x+e.width,e.y+e.height]]:[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]:[[0,0],[e.clientWidth,e.clientHeight]]}function rl(){return this.__zoom||Ka}function il(e){return-e.deltaY*(1===e.deltaMode?.05:e.deltaMode?1:.002)*(e.ctrlKey?10:1)}function ol(){return navigator.maxTouchPoints||"ontouchstart"in this}function al(e,t,n){var r=e.invertX(t[0][0])-n[0][0],i=e.invertX(t[1][0])-n[1][0],o=e.invertY(t[0][1])-n[0][1],a=e.invertY(t[1][1])-n[1][1];return e.translate(i>r?(r+i)/2:Math.min(0,r)||Math.max(0,i),a>o?(o+a)/2:Math.min(0,o)||Math.max(0,a))}function ll(e){var t=0,n=e.children,r=n&&n.length;if(r)for(;--r>=0;)t+=n[r].value;else t=1;e.value=t}function sl(e,t){var n,r,i,o,a,l=new dl(e),s=+e.value&&(l.value=e.value),u=[l];for(null==t&&(t=ul);n=u.pop();)if(s&&(n.value=+n.data.value),(i=t(n.data))&&(a=i.length))for(n.children=new Array(a),o=a-1;o>=0;--o)u.push(r=n.children[o]=new dl(i[o])),r.parent=n,r.depth=n.depth+1;return l.eachBefore(fl)}function ul(e){return e.children}function cl(e){e.data=e.data.data}function fl(e){var t=0;do{e.height=t}while((e=e.parent)&&e.height<++t)}function dl(e){this.data=e,this.depth=this.height=0,this.parent=null}Ja.prototype,dl.prototype=sl.prototype={constructor:dl,count:function(){return this.eachAfter(ll)},each:function(e){var t,n,r,i,o=this,a=[o];do{for(t=a.reverse(),a=[];o=t.pop();)if(e(o),n=o.children)for(r=0,i=n.length;r<i;++r)a.push(n[r])}while(a.length);return this},eachAfter:function(e){for(var t,n,r,i=this,o=[i],a=[];i=o.pop();)if(a.push(i),t=i.children)for(n=0,r=t.length;n<r;++n)o.push(t[n]);for(;i=a.pop();)e(i);return this},eachBefore:function(e){for(var t,n,r=this,i=[r];r=i.pop();)if(e(r),t=r.children)for(n=t.length-1;n>=0;--n)i.push(t[n]);return this},sum:function(e){return this.eachAfter(function(t){for(var n=+e(t.data)||0,r=t.children,i=r&&r.length;--i>=0;)n+=r[i].value;t.value=n})},sort:function(e){return this.eachBefore(function(t){t.children&&t.children.sort(e)})},path:function(e){for(var t=this,n=function(e,t){if(e===t)return e;var n=e.ancestors(),r=t.ancestors(),i=null;e=n.pop(),t=r.pop();for(;e===t;)i=e,e=n.pop(),t=r.pop();return i}(t,e),r=[t];t!==n;)t=t.parent,r.push(t);for(var i=r.length;e!==n;)r.splice(i,0,e),e=e.parent;return r},ancestors:function(){for(var e=this,t=[e];e=e.parent;)t.push(e);return t},descendants:function(){var e=[];return this.each(function(t){e.push(t)}),e},leaves:function(){var e=[];return this.eachBefore(function(t){t.children||e.push(t)}),e},links:function(){var e=this,t=[];return e.each(function(n){n!==e&&t.push({source:n.parent,target:n})}),t},copy:function(){return sl(this).eachBefore(cl)}};const{rE:hl}={rE:"2.1.2"},pl=Object.freeze({children:e=>e.children,nodeSize:e=>e.data.size,spacing:0});function yl(e){const t=Object.assign({},pl,e);function n(e){const n=t[e];return"function"===typeof n?n:()=>n}function r(e){const t=o(function(){const e=i(),t=n("nodeSize"),r=n("spacing");return class extends e{constructor(e){super(e),Object.assign(this,{x:0,y:0,relX:0,prelim:0,shift:0,change:0,lExt:this,lExtRelX:0,lThr:null,rExt:this,rExtRelX:0,rThr:null})}get size(){return t(this.data)}spacing(e){return r(this.data,e.data)}get x(){return this.data.x}set x(e){this.data.x=e}get y(){return this.data.y}set y(e){this.data.y=e}update(){return ml(this),gl(this),this}}}(),e,e=>e.children);return t.update(),t.data}function i(){const e=n("nodeSize"),t=n("spacing");return class n extends sl.prototype.constructor{constructor(e){super(e)}copy(){const e=o(this.constructor,this,e=>e.children);return e.each(e=>e.data=e.data.data),e}get size(){return e(this)}spacing(e){return t(this,e)}get nodes(){return this.descendants()}get xSize(){return this.size[0]}get ySize(){return this.size[1]}get top(){return this.y}get bottom(){return this.y+this.ySize}get left(){return this.x-this.xSize/2}get right(){return this.x+this.xSize/2}get root(){const e=this.ancestors();return e[e.length-1]}get numChildren(){return this.hasChildren?this.children.length:0}get hasChildren(){return!this.noChildren}get noChildren(){return null===this.children}get firstChild(){return this.hasChildren?this.children[0]:null}get lastChild(){return this.hasChildren?this.children[this.numChildren-1]:null}get extents(){return(this.children||[]).reduce((e,t)=>n.maxExtents(e,t.extents),this.nodeExtents)}get nodeExtents(){return{top:this.top,bottom:this.bottom,left:this.left,right:this.right}}static maxExtents(e,t){return{top:Math.min(e.top,t.top),bottom:Math.max(e.bottom,t.bottom),left:Math.min(e.left,t.left),right:Math.max(e.right,t.right)}}}}function o(e,t,n){const r=(t,i)=>{const o=new e(t);Object.assign(o,{parent:i,depth:null===i?0:i.depth+1,height:0,length:1});const a=n(t)||[];return o.children=0===a.length?null:a.map(e=>r(e,o)),o.children&&Object.assign(o,o.children.reduce((e,t)=>({height:Math.max(e.height,t.height+1),length:e.length+t.length}),o)),o};return r(t,null)}return Object.assign(r,{nodeSize(e){return arguments.length?(t.nodeSize=e,r):t.nodeSize},spacing(e){return arguments.length?(t.spacing=e,r):t.spacing},children(e){return arguments.length?(t.children=e,r):t.children},hierarchy(e,n){const r="undefined"===typeof n?t.children:n;return o(i(),e,r)},dump(e){const t=n("nodeSize"),r=e=>n=>{const i=e+"  ",o=e+"    ",{x:a,y:l}=n,s=t(n),u=n.children||[],c=0===u.length?" ":`,${i}children: [${o}${u.map(r(o)).join(o)}${i}],${e}`;return`{ size: [${s.join(", ")}],${i}x: ${a}, y: ${l}${c}},`};return r("\n")(e)}}),r}yl.version=hl;const ml=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return e.y=t,(e.children||[]).reduce((t,n)=>{const[r,i]=t;ml(n,e.y+e.ySize);const o=(0===r?n.lExt:n.rExt).bottom;0!==r&&bl(e,r,i);return[r+1,Cl(o,r,i)]},[0,null]),vl(e),El(e),e},gl=(e,t,n)=>{"undefined"===typeof t&&(t=-e.relX-e.prelim,n=0);const r=t+e.relX;return e.relX=r+e.prelim-n,e.prelim=0,e.x=n+e.relX,(e.children||[]).forEach(t=>gl(t,r,e.x)),e},vl=e=>{(e.children||[]).reduce((e,t)=>{const[n,r]=e,i=n+t.shift,o=r+i+t.change;return t.relX+=o,[i,o]},[0,0])},bl=(e,t,n)=>{const r=e.children[t-1],i=e.children[t];let o=r,a=r.relX,l=i,s=i.relX,u=!0;for(;o&&l;){o.bottom>n.lowY&&(n=n.next);const r=a+o.prelim-(s+l.prelim)+o.xSize/2+l.xSize/2+o.spacing(l);(r>0||r<0&&u)&&(s+=r,wl(i,r),xl(e,t,n.index,r)),u=!1;const c=o.bottom,f=l.bottom;c<=f&&(o=_l(o),o&&(a+=o.relX)),c>=f&&(l=Sl(l),l&&(s+=l.relX))}!o&&l?kl(e,t,l,s):o&&!l&&Tl(e,t,o,a)},wl=(e,t)=>{e.relX+=t,e.lExtRelX+=t,e.rExtRelX+=t},xl=(e,t,n,r)=>{const i=e.children[t],o=t-n;if(o>1){const t=r/o;e.children[n+1].shift+=t,i.shift-=t,i.change-=r-t}},Sl=e=>e.hasChildren?e.firstChild:e.lThr,_l=e=>e.hasChildren?e.lastChild:e.rThr,kl=(e,t,n,r)=>{const i=e.firstChild,o=i.lExt,a=e.children[t];o.lThr=n;const l=r-n.relX-i.lExtRelX;o.relX+=l,o.prelim-=l,i.lExt=a.lExt,i.lExtRelX=a.lExtRelX},Tl=(e,t,n,r)=>{const i=e.children[t],o=i.rExt,a=e.children[t-1];o.rThr=n;const l=r-n.relX-i.rExtRelX;o.relX+=l,o.prelim-=l,i.rExt=a.rExt,i.rExtRelX=a.rExtRelX},El=e=>{if(e.hasChildren){const t=e.firstChild,n=e.lastChild,r=(t.prelim+t.relX-t.xSize/2+n.relX+n.prelim+n.xSize/2)/2;Object.assign(e,{prelim:r,lExt:t.lExt,lExtRelX:t.lExtRelX,rExt:n.rExt,rExtRelX:n.rExtRelX})}},Cl=(e,t,n)=>{for(;null!==n&&e>=n.lowY;)n=n.next;return{lowY:e,index:t,next:n}};var Il=Array.prototype.slice;function Ml(e){return function(){return e}}class Nl{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t)}this._x0=e,this._y0=t}}function Al(e){return new Nl(e,!0)}const Ol=Math.PI,zl=2*Ol,Dl=1e-6,$l=zl-Dl;function Pl(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}class Ll{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==e?Pl:function(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return Pl;const n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}(e)}moveTo(e,t){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(e,t){this._append`L${this._x1=+e},${this._y1=+t}`}quadraticCurveTo(e,t,n,r){this._append`Q${+e},${+t},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(e,t,n,r,i,o){this._append`C${+e},${+t},${+n},${+r},${this._x1=+i},${this._y1=+o}`}arcTo(e,t,n,r,i){if(e=+e,t=+t,n=+n,r=+r,(i=+i)<0)throw new Error(`negative radius: ${i}`);let o=this._x1,a=this._y1,l=n-e,s=r-t,u=o-e,c=a-t,f=u*u+c*c;if(null===this._x1)this._append`M${this._x1=e},${this._y1=t}`;else if(f>Dl)if(Math.abs(c*l-s*u)>Dl&&i){let d=n-o,h=r-a,p=l*l+s*s,y=d*d+h*h,m=Math.sqrt(p),g=Math.sqrt(f),v=i*Math.tan((Ol-Math.acos((p+f-y)/(2*m*g)))/2),b=v/g,w=v/m;Math.abs(b-1)>Dl&&this._append`L${e+b*u},${t+b*c}`,this._append`A${i},${i},0,0,${+(c*d>u*h)},${this._x1=e+w*l},${this._y1=t+w*s}`}else this._append`L${this._x1=e},${this._y1=t}`;else;}arc(e,t,n,r,i,o){if(e=+e,t=+t,o=!!o,(n=+n)<0)throw new Error(`negative radius: ${n}`);let a=n*Math.cos(r),l=n*Math.sin(r),s=e+a,u=t+l,c=1^o,f=o?r-i:i-r;null===this._x1?this._append`M${s},${u}`:(Math.abs(this._x1-s)>Dl||Math.abs(this._y1-u)>Dl)&&this._append`L${s},${u}`,n&&(f<0&&(f=f%zl+zl),f>$l?this._append`A${n},${n},0,1,${c},${e-a},${t-l}A${n},${n},0,1,${c},${this._x1=s},${this._y1=u}`:f>Dl&&this._append`A${n},${n},0,${+(f>=Ol)},${c},${this._x1=e+n*Math.cos(i)},${this._y1=t+n*Math.sin(i)}`)}rect(e,t,n,r){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}}function Bl(e){return e[0]}function Fl(e){return e[1]}function Rl(e){return e.source}function Ul(e){return e.target}function jl(e){let t=Rl,n=Ul,r=Bl,i=Fl,o=null,a=null,l=function(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(null==n)t=null;else{const e=Math.floor(n);if(!(e>=0))throw new RangeError(`invalid digits: ${n}`);t=e}return e},()=>new Ll(t)}(s);function s(){let s;const u=Il.call(arguments),c=t.apply(this,u),f=n.apply(this,u);if(null==o&&(a=e(s=l())),a.lineStart(),u[0]=c,a.point(+r.apply(this,u),+i.apply(this,u)),u[0]=f,a.point(+r.apply(this,u),+i.apply(this,u)),a.lineEnd(),s)return a=null,s+""||null}return s.source=function(e){return arguments.length?(t=e,s):t},s.target=function(e){return arguments.length?(n=e,s):n},s.x=function(e){return arguments.length?(r="function"===typeof e?e:Ml(+e),s):r},s.y=function(e){return arguments.length?(i="function"===typeof e?e:Ml(+e),s):i},s.context=function(t){return arguments.length?(null==t?o=a=null:a=e(o=t),s):o},s}const Vl={selection:xi,select:Si,max:function(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n<r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let i of e)null!=(i=t(i,++r,e))&&(n<i||void 0===n&&i>=i)&&(n=i)}return n},min:function(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n>r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let i of e)null!=(i=t(i,++r,e))&&(n>i||void 0===n&&i>=i)&&(n=i)}return n},sum:function(e,t){let n=0;if(void 0===t)for(let r of e)(r=+r)&&(n+=r);else{let r=-1;for(let i of e)(i=+t(i,++r,e))&&(n+=i)}return n},cumsum:function(e,t){var n=0,r=0;return Float64Array.from(e,void 0===t?e=>n+=+e||0:i=>n+=+t(i,r++,e)||0)},tree:function(){var e=Ni,t=1,n=1,r=null;function i(i){var s=function(e){for(var t,n,r,i,o,a=new $i(e,0),l=[a];t=l.pop();)if(r=t._.children)for(t.children=new Array(o=r.length),i=o-1;i>=0;--i)l.push(n=t.children[i]=new $i(r[i],i)),n.parent=t;return(a.parent=new $i(null,0)).children=[a],a}(i);if(s.eachAfter(o),s.parent.m=-s.z,s.eachBefore(a),r)i.eachBefore(l);else{var u=i,c=i,f=i;i.eachBefore(function(e){e.x<u.x&&(u=e),e.x>c.x&&(c=e),e.depth>f.depth&&(f=e)});var d=u===c?1:e(u,c)/2,h=d-u.x,p=t/(c.x+d+h),y=n/(f.depth||1);i.eachBefore(function(e){e.x=(e.x+h)*p,e.y=e.depth*y})}return i}function o(t){var n=t.children,r=t.parent.children,i=t.i?r[t.i-1]:null;if(n){!function(e){for(var t,n=0,r=0,i=e.children,o=i.length;--o>=0;)(t=i[o]).z+=n,t.m+=n,n+=t.s+(r+=t.c)}(t);var o=(n[0].z+n[n.length-1].z)/2;i?(t.z=i.z+e(t._,i._),t.m=t.z-o):t.z=o}else i&&(t.z=i.z+e(t._,i._));t.parent.A=function(t,n,r){if(n){for(var i,o=t,a=t,l=n,s=o.parent.children[0],u=o.m,c=a.m,f=l.m,d=s.m;l=Oi(l),o=Ai(o),l&&o;)s=Ai(s),(a=Oi(a)).a=t,(i=l.z+f-o.z-u+e(l._,o._))>0&&(zi(Di(l,t,r),t,i),u+=i,c+=i),f+=l.m,u+=o.m,d+=s.m,c+=a.m;l&&!Oi(a)&&(a.t=l,a.m+=f-c),o&&!Ai(s)&&(s.t=o,s.m+=u-d,r=t)}return r}(t,i,t.parent.A||r[0])}function a(e){e._.x=e.z+e.parent.m,e.m+=e.parent.m}function l(e){e.x*=t,e.y=e.depth*n}return i.separation=function(t){return arguments.length?(e=t,i):e},i.size=function(e){return arguments.length?(r=!1,t=+e[0],n=+e[1],i):r?null:[t,n]},i.nodeSize=function(e){return arguments.length?(r=!0,t=+e[0],n=+e[1],i):r?[t,n]:null},i},stratify:function(){var e,t=Ri,n=Ui;function r(r){var i,o,a,l,s,u,c,f,d=Array.from(r),h=t,p=n,y=new Map;if(null!=e){const t=d.map((t,n)=>function(e){e=`${e}`;let t=e.length;Vi(e,t-1)&&!Vi(e,t-2)&&(e=e.slice(0,-1));return"/"===e[0]?e:`/${e}`}(e(t,n,r))),n=t.map(ji),i=new Set(t).add("");for(const e of n)i.has(e)||(i.add(e),t.push(e),n.push(ji(e)),d.push(Fi));h=(e,n)=>t[n],p=(e,t)=>n[t]}for(a=0,i=d.length;a<i;++a)o=d[a],u=d[a]=new Mi(o),null!=(c=h(o,a,r))&&(c+="")&&(f=u.id=c,y.set(f,y.has(f)?Bi:u)),null!=(c=p(o,a,r))&&(c+="")&&(u.parent=c);for(a=0;a<i;++a)if(c=(u=d[a]).parent){if(!(s=y.get(c)))throw new Error("missing: "+c);if(s===Bi)throw new Error("ambiguous: "+c);s.children?s.children.push(u):s.children=[u],u.parent=s}else{if(l)throw new Error("multiple roots");l=u}if(!l)throw new Error("no root");if(null!=e){for(;l.data===Fi&&1===l.children.length;)l=l.children[0],--i;for(let e=d.length-1;e>=0&&(u=d[e]).data===Fi;--e)u.data=null}if(l.parent=Li,l.eachBefore(function(e){e.depth=e.parent.depth+1,--i}).eachBefore(Ii),l.parent=null,i>0)throw new Error("cycle");return l}return r.id=function(e){return arguments.length?(t=Pi(e),r):t},r.parentId=function(e){return arguments.length?(n=Pi(e),r):n},r.path=function(t){return arguments.length?(e=Pi(t),r):e},r},zoom:function(){var e,t,n,r=tl,i=nl,o=al,a=il,l=ol,s=[0,1/0],u=[[-1/0,-1/0],[1/0,1/0]],c=250,f=Zi,d=Qi("start","zoom","end"),h=0,p=10;function y(e){e.property("__zoom",rl).on("wheel.zoom",S,{passive:!1}).on("mousedown.zoom",_).on("dblclick.zoom",k).filter(l).on("touchstart.zoom",T).on("touchmove.zoom",E).on("touchend.zoom touchcancel.zoom",C).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function m(e,t){return(t=Math.max(s[0],Math.min(s[1],t)))===e.k?e:new Ja(t,e.x,e.y)}function g(e,t,n){var r=t[0]-n[0]*e.k,i=t[1]-n[1]*e.k;return r===e.x&&i===e.y?e:new Ja(e.k,r,i)}function v(e){return[(+e[0][0]+ +e[1][0])/2,(+e[0][1]+ +e[1][1])/2]}function b(e,t,n,r){e.on("start.zoom",function(){w(this,arguments).event(r).start()}).on("interrupt.zoom end.zoom",function(){w(this,arguments).event(r).end()}).tween("zoom",function(){var e=this,o=arguments,a=w(e,o).event(r),l=i.apply(e,o),s=null==n?v(l):"function"===typeof n?n.apply(e,o):n,u=Math.max(l[1][0]-l[0][0],l[1][1]-l[0][1]),c=e.__zoom,d="function"===typeof t?t.apply(e,o):t,h=f(c.invert(s).concat(u/c.k),d.invert(s).concat(u/d.k));return function(e){if(1===e)e=d;else{var t=h(e),n=u/t[2];e=new Ja(n,s[0]-t[0]*n,s[1]-t[1]*n)}a.zoom(null,e)}})}function w(e,t,n){return!n&&e.__zooming||new x(e,t)}function x(e,t){this.that=e,this.args=t,this.active=0,this.sourceEvent=null,this.extent=i.apply(e,t),this.taps=0}function S(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),i=1;i<t;i++)n[i-1]=arguments[i];if(r.apply(this,arguments)){var l=w(this,n).event(e),c=this.__zoom,f=Math.max(s[0],Math.min(s[1],c.k*Math.pow(2,a.apply(this,arguments)))),d=eo(e);if(l.wheel)l.mouse[0][0]===d[0]&&l.mouse[0][1]===d[1]||(l.mouse[1]=c.invert(l.mouse[0]=d)),clearTimeout(l.wheel);else{if(c.k===f)return;l.mouse=[d,c.invert(d)],Eo(this),l.start()}el(e),l.wheel=setTimeout(function(){l.wheel=null,l.end()},150),l.zoom("mouse",o(g(m(c,f),l.mouse[0],l.mouse[1]),l.extent,u))}}function _(e){for(var t=arguments.length,i=new Array(t>1?t-1:0),a=1;a<t;a++)i[a-1]=arguments[a];if(!n&&r.apply(this,arguments)){var l=e.currentTarget,s=w(this,i,!0).event(e),c=Si(e.view).on("mousemove.zoom",function(e){if(el(e),!s.moved){var t=e.clientX-d,n=e.clientY-p;s.moved=t*t+n*n>h}s.event(e).zoom("mouse",o(g(s.that.__zoom,s.mouse[0]=eo(e,l),s.mouse[1]),s.extent,u))},!0).on("mouseup.zoom",function(e){c.on("mousemove.zoom mouseup.zoom",null),function(e,t){var n=e.document.documentElement,r=Si(e).on("dragstart.drag",null);t&&(r.on("click.drag",Ji,Gi),setTimeout(function(){r.on("click.drag",null)},0)),"onselectstart"in n?r.on("selectstart.drag",null):(n.style.MozUserSelect=n.__noselect,delete n.__noselect)}(e.view,s.moved),el(e),s.event(e).end()},!0),f=eo(e,l),d=e.clientX,p=e.clientY;!function(e){var t=e.document.documentElement,n=Si(e).on("dragstart.drag",Ji,Gi);"onselectstart"in t?n.on("selectstart.drag",Ji,Gi):(t.__noselect=t.style.MozUserSelect,t.style.MozUserSelect="none")}(e.view),Za(e),s.mouse=[f,this.__zoom.invert(f)],Eo(this),s.start()}}function k(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),a=1;a<t;a++)n[a-1]=arguments[a];if(r.apply(this,arguments)){var l=this.__zoom,s=eo(e.changedTouches?e.changedTouches[0]:e,this),f=l.invert(s),d=l.k*(e.shiftKey?.5:2),h=o(g(m(l,d),s,f),i.apply(this,n),u);el(e),c>0?Si(this).transition().duration(c).call(b,h,s,e):Si(this).call(y.transform,h,s,e)}}function T(n){for(var i=arguments.length,o=new Array(i>1?i-1:0),a=1;a<i;a++)o[a-1]=arguments[a];if(r.apply(this,arguments)){var l,s,u,c,f=n.touches,d=f.length,h=w(this,o,n.changedTouches.length===d).event(n);for(Za(n),s=0;s<d;++s)c=[c=eo(u=f[s],this),this.__zoom.invert(c),u.identifier],h.touch0?h.touch1||h.touch0[2]===c[2]||(h.touch1=c,h.taps=0):(h.touch0=c,l=!0,h.taps=1+!!e);e&&(e=clearTimeout(e)),l&&(h.taps<2&&(t=c[0],e=setTimeout(function(){e=null},500)),Eo(this),h.start())}}function E(e){if(this.__zooming){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];var i,a,l,s,c=w(this,n).event(e),f=e.changedTouches,d=f.length;for(el(e),i=0;i<d;++i)l=eo(a=f[i],this),c.touch0&&c.touch0[2]===a.identifier?c.touch0[0]=l:c.touch1&&c.touch1[2]===a.identifier&&(c.touch1[0]=l);if(a=c.that.__zoom,c.touch1){var h=c.touch0[0],p=c.touch0[1],y=c.touch1[0],v=c.touch1[1],b=(b=y[0]-h[0])*b+(b=y[1]-h[1])*b,x=(x=v[0]-p[0])*x+(x=v[1]-p[1])*x;a=m(a,Math.sqrt(b/x)),l=[(h[0]+y[0])/2,(h[1]+y[1])/2],s=[(p[0]+v[0])/2,(p[1]+v[1])/2]}else{if(!c.touch0)return;l=c.touch0[0],s=c.touch0[1]}c.zoom("touch",o(g(a,l,s),c.extent,u))}}function C(e){for(var r=arguments.length,i=new Array(r>1?r-1:0),o=1;o<r;o++)i[o-1]=arguments[o];if(this.__zooming){var a,l,s=w(this,i).event(e),u=e.changedTouches,c=u.length;for(Za(e),n&&clearTimeout(n),n=setTimeout(function(){n=null},500),a=0;a<c;++a)l=u[a],s.touch0&&s.touch0[2]===l.identifier?delete s.touch0:s.touch1&&s.touch1[2]===l.identifier&&delete s.touch1;if(s.touch1&&!s.touch0&&(s.touch0=s.touch1,delete s.touch1),s.touch0)s.touch0[1]=this.__zoom.invert(s.touch0[0]);else if(s.end(),2===s.taps&&(l=eo(l,this),Math.hypot(t[0]-l[0],t[1]-l[1])<p)){var f=Si(this).on("dblclick.zoom");f&&f.apply(this,arguments)}}}return y.transform=function(e,t,n,r){var i=e.selection?e.selection():e;i.property("__zoom",rl),e!==i?b(e,t,n,r):i.interrupt().each(function(){w(this,arguments).event(r).start().zoom(null,"function"===typeof t?t.apply(this,arguments):t).end()})},y.scaleBy=function(e,t,n,r){y.scaleTo(e,function(){return this.__zoom.k*("function"===typeof t?t.apply(this,arguments):t)},n,r)},y.scaleTo=function(e,t,n,r){y.transform(e,function(){var e=i.apply(this,arguments),r=this.__zoom,a=null==n?v(e):"function"===typeof n?n.apply(this,arguments):n,l=r.invert(a),s="function"===typeof t?t.apply(this,arguments):t;return o(g(m(r,s),a,l),e,u)},n,r)},y.translateBy=function(e,t,n,r){y.transform(e,function(){return o(this.__zoom.translate("function"===typeof t?t.apply(this,arguments):t,"function"===typeof n?n.apply(this,arguments):n),i.apply(this,arguments),u)},null,r)},y.translateTo=function(e,t,n,r,a){y.transform(e,function(){var e=i.apply(this,arguments),a=this.__zoom,l=null==r?v(e):"function"===typeof r?r.apply(this,arguments):r;return o(Ka.translate(l[0],l[1]).scale(a.k).translate("function"===typeof t?-t.apply(this,arguments):-t,"function"===typeof n?-n.apply(this,arguments):-n),e,u)},r,a)},x.prototype={event:function(e){return e&&(this.sourceEvent=e),this},start:function(){return 1===++this.active&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(e,t){return this.mouse&&"mouse"!==e&&(this.mouse[1]=t.invert(this.mouse[0])),this.touch0&&"touch"!==e&&(this.touch0[1]=t.invert(this.touch0[0])),this.touch1&&"touch"!==e&&(this.touch1[1]=t.invert(this.touch1[0])),this.that.__zoom=t,this.emit("zoom"),this},end:function(){return 0===--this.active&&(delete this.that.__zooming,this.emit("end")),this},emit:function(e){var t=Si(this.that).datum();d.call(e,this.that,new Ga(e,{sourceEvent:this.sourceEvent,target:y,type:e,transform:this.that.__zoom,dispatch:d}),t)}},y.wheelDelta=function(e){return arguments.length?(a="function"===typeof e?e:Qa(+e),y):a},y.filter=function(e){return arguments.length?(r="function"===typeof e?e:Qa(!!e),y):r},y.touchable=function(e){return arguments.length?(l="function"===typeof e?e:Qa(!!e),y):l},y.extent=function(e){return arguments.length?(i="function"===typeof e?e:Qa([[+e[0][0],+e[0][1]],[+e[1][0],+e[1][1]]]),y):i},y.scaleExtent=function(e){return arguments.length?(s[0]=+e[0],s[1]=+e[1],y):[s[0],s[1]]},y.translateExtent=function(e){return arguments.length?(u[0][0]=+e[0][0],u[1][0]=+e[1][0],u[0][1]=+e[0][1],u[1][1]=+e[1][1],y):[[u[0][0],u[0][1]],[u[1][0],u[1][1]]]},y.constrain=function(e){return arguments.length?(o=e,y):o},y.duration=function(e){return arguments.length?(c=+e,y):c},y.interpolate=function(e){return arguments.length?(f=e,y):f},y.on=function(){var e=d.on.apply(d,arguments);return e===d?y:e},y.clickDistance=function(e){return arguments.length?(h=(e=+e)*e,y):Math.sqrt(h)},y.tapDistance=function(e){return arguments.length?(p=+e,y):p},y},zoomIdentity:Ka,linkHorizontal:function(){return jl(Al)}};class Hl{constructor(){const e={id:`ID${Math.floor(1e6*Math.random())}`,firstDraw:!0,svgWidth:800,svgHeight:window.innerHeight-100,scaleExtent:[.001,20],container:"body",defaultTextFill:"#2C3E50",defaultFont:"Helvetica",ctx:document.createElement("canvas").getContext("2d"),data:null,duration:400,setActiveNodeCentered:!0,expandLevel:1,compact:!0,rootMargin:40,nodeDefaultBackground:"none",connections:[],lastTransform:{x:0,y:0,k:1},nodeId:e=>e.nodeId||e.id,parentNodeId:e=>e.parentNodeId||e.parentId,backgroundColor:"none",zoomBehavior:null,defs:function(e,t){return`<defs>\n                    ${t.map(t=>{const n=this.getTextWidth(t.label,{ctx:e.ctx,fontSize:2,defaultFont:e.defaultFont});return`\n                       <marker id="${t.from+"_"+t.to}" refX="${t._source.x<t._target.x?-7:7}" refY="5" markerWidth="500"  markerHeight="500"  orient="${t._source.x<t._target.x?"auto":"auto-start-reverse"}" >\n                       <rect rx=0.5 width=${t.label?n+3:0} height=3 y=1  fill="#152785"></rect>\n                       <text font-size="2px" x=1 fill="white" y=3>${t.label||""}</text>\n                       </marker>\n\n                       <marker id="arrow-${t.from+"_"+t.to}"  markerWidth="500"  markerHeight="500"  refY="2"  refX="1" orient="${t._source.x<t._target.x?"auto":"auto-start-reverse"}" >\n                       <path transform="translate(0)" d='M0,0 V4 L2,2 Z' fill='#152785' />\n                       </marker>\n                    `}).join("")}\n                    </defs>\n                    `},connectionsUpdate:function(e,t,n){Vl.select(this).attr("stroke",e=>"#152785").attr("stroke-linecap","round").attr("stroke-width",e=>"5").attr("pointer-events","none").attr("marker-start",e=>`url(#${e.from+"_"+e.to})`).attr("marker-end",e=>`url(#arrow-${e.from+"_"+e.to})`)},linkUpdate:function(e,t,n){Vl.select(this).attr("stroke",e=>e.data._upToTheRootHighlighted?"#152785":"lightgray").attr("stroke-width",e=>e.data._upToTheRootHighlighted?5:2),e.data._upToTheRootHighlighted&&Vl.select(this).raise()},nodeUpdate:function(e,t,n){Vl.select(this).select(".node-rect").attr("stroke",e=>e.data._highlighted||e.data._upToTheRootHighlighted?"#152785":"none").attr("stroke-width",e.data._highlighted||e.data._upToTheRootHighlighted?10:1)},nodeWidth:e=>250,nodeHeight:e=>150,siblingsMargin:e=>20,childrenMargin:e=>60,neightbourMargin:(e,t)=>80,compactMarginPair:e=>100,compactMarginBetween:e=>20,onNodeClick:e=>e,linkGroupArc:Vl.linkHorizontal().x(e=>e.x).y(e=>e.y),nodeContent:e=>`<div style="padding:5px;font-size:10px;">Sample Node(id=${e.id}), override using <br/> <br/> \n            <code>chart<br/>\n            &nbsp;.nodeContent({data}=>{ <br/>\n             &nbsp;&nbsp;&nbsp;&nbsp;return '' // Custom HTML <br/>\n             &nbsp;})</code>\n             <br/> <br/>\n             Or check different <a href="https://github.com/bumbeishvili/org-chart#jump-to-examples" target="_blank">layout examples</a>\n             \n             </div>`,layout:"top",buttonContent:e=>{let{node:t,state:n}=e;return`<div style="border-radius:3px;padding:3px;font-size:10px;margin:auto auto;background-color:lightgray"> ${{left:e=>e?'<div style="margin-top:-10px;line-height:1.2;font-size:25px;height:22px">\u2039</div>':'<div style="margin-top:-10px;font-size:25px;height:23px">\u203a</div>',bottom:e=>e?'<div style="margin-top:-20px;font-size:25px">\u02ec</div>':'<div style="margin-top:0px;line-height:1.2;height:11px;font-size:25px">\u02c6</div>',right:e=>e?'<div style="margin-top:-10px;font-size:25px;height:23px">\u203a</div>':'<div style="margin-top:-10px;line-height:1.2;font-size:25px;height:22px">\u2039</div>',top:e=>e?'<div style="margin-top:0px;line-height:1.2;height:11px;font-size:25px">\u02c6</div>':'<div style="margin-top:-20px;font-size:25px">\u02ec</div>'}[n.layout](t.children)}  </div>`},layoutBindings:{left:{nodeLeftX:e=>0,nodeRightX:e=>e.width,nodeTopY:e=>-e.height/2,nodeBottomY:e=>e.height/2,nodeJoinX:e=>e.x+e.width,nodeJoinY:e=>e.y-e.height/2,linkJoinX:e=>e.x+e.width,linkJoinY:e=>e.y,linkX:e=>e.x,linkY:e=>e.y,linkCompactXStart:e=>e.x+e.width/2,linkCompactYStart:e=>e.y+(e.compactEven?e.height/2:-e.height/2),compactLinkMidX:(e,t)=>e.firstCompactNode.x,compactLinkMidY:(e,t)=>e.firstCompactNode.y+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,linkParentX:e=>e.parent.x+e.parent.width,linkParentY:e=>e.parent.y,buttonX:e=>e.width,buttonY:e=>e.height/2,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o}=e;return`translate(${n},${r}) scale(${i})`},compactDimension:{sizeColumn:e=>e.height,sizeRow:e=>e.width,reverse:e=>e.slice().reverse()},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[t+r,n+i]},zoomTransform:e=>{let{centerY:t,scale:n}=e;return`translate(0,${t}) scale(${n})`},diagonal:this.hdiagonal.bind(this),swap:e=>{const t=e.x;e.x=e.y,e.y=t},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t},${n-i/2})`}},top:{nodeLeftX:e=>-e.width/2,nodeRightX:e=>e.width/2,nodeTopY:e=>0,nodeBottomY:e=>e.height,nodeJoinX:e=>e.x-e.width/2,nodeJoinY:e=>e.y+e.height,linkJoinX:e=>e.x,linkJoinY:e=>e.y+e.height,linkCompactXStart:e=>e.x+(e.compactEven?e.width/2:-e.width/2),linkCompactYStart:e=>e.y+e.height/2,compactLinkMidX:(e,t)=>e.firstCompactNode.x+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,compactLinkMidY:e=>e.firstCompactNode.y,compactDimension:{sizeColumn:e=>e.width,sizeRow:e=>e.height,reverse:e=>e},linkX:e=>e.x,linkY:e=>e.y,linkParentX:e=>e.parent.x,linkParentY:e=>e.parent.y+e.parent.height,buttonX:e=>e.width/2,buttonY:e=>e.height,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o}=e;return`translate(${o},${n}) scale(${i})`},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a,compactViewIndex:l}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[n+r,t+i]},zoomTransform:e=>{let{centerX:t,scale:n}=e;return`translate(${t},0}) scale(${n})`},diagonal:this.diagonal.bind(this),swap:e=>{},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t-r/2},${n})`}},bottom:{nodeLeftX:e=>-e.width/2,nodeRightX:e=>e.width/2,nodeTopY:e=>-e.height,nodeBottomY:e=>0,nodeJoinX:e=>e.x-e.width/2,nodeJoinY:e=>e.y-e.height-e.height,linkJoinX:e=>e.x,linkJoinY:e=>e.y-e.height,linkCompactXStart:e=>e.x+(e.compactEven?e.width/2:-e.width/2),linkCompactYStart:e=>e.y-e.height/2,compactLinkMidX:(e,t)=>e.firstCompactNode.x+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,compactLinkMidY:e=>e.firstCompactNode.y,linkX:e=>e.x,linkY:e=>e.y,compactDimension:{sizeColumn:e=>e.width,sizeRow:e=>e.height,reverse:e=>e},linkParentX:e=>e.parent.x,linkParentY:e=>e.parent.y-e.parent.height,buttonX:e=>e.width/2,buttonY:e=>0,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o,chartHeight:a}=e;return`translate(${o},${a-n}) scale(${i})`},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[n+r,t+i]},zoomTransform:e=>{let{centerX:t,scale:n}=e;return`translate(${t},0}) scale(${n})`},diagonal:this.diagonal.bind(this),swap:e=>{e.y=-e.y},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t-r/2},${n-i})`}},right:{nodeLeftX:e=>-e.width,nodeRightX:e=>0,nodeTopY:e=>-e.height/2,nodeBottomY:e=>e.height/2,nodeJoinX:e=>e.x-e.width-e.width,nodeJoinY:e=>e.y-e.height/2,linkJoinX:e=>e.x-e.width,linkJoinY:e=>e.y,linkX:e=>e.x,linkY:e=>e.y,linkParentX:e=>e.parent.x-e.parent.width,linkParentY:e=>e.parent.y,buttonX:e=>0,buttonY:e=>e.height/2,linkCompactXStart:e=>e.x-e.width/2,linkCompactYStart:e=>e.y+(e.compactEven?e.height/2:-e.height/2),compactLinkMidX:(e,t)=>e.firstCompactNode.x,compactLinkMidY:(e,t)=>e.firstCompactNode.y+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o,chartWidth:a}=e;return`translate(${a-n},${r}) scale(${i})`},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[t+r,n+i]},compactDimension:{sizeColumn:e=>e.height,sizeRow:e=>e.width,reverse:e=>e.slice().reverse()},zoomTransform:e=>{let{centerY:t,scale:n}=e;return`translate(0,${t}) scale(${n})`},diagonal:this.hdiagonal.bind(this),swap:e=>{const t=e.x;e.x=-e.y,e.y=t},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t-r},${n-i/2})`}}}};this.getChartState=()=>e,Object.keys(e).forEach(t=>{this[t]=function(n){return arguments.length?(e[t]=n,this):e[t]}}),this.initializeEnterExitUpdatePattern()}initializeEnterExitUpdatePattern(){Vl.selection.prototype.patternify=function(e){var t=e.selector,n=e.tag,r=e.data||[t],i=this.selectAll("."+t).data(r,(e,t)=>"object"===typeof e&&e.id?e.id:t);return i.exit().remove(),(i=i.enter().append(n).merge(i)).attr("class",t),i}}getNodeChildren(e,t){let{data:n,children:r,_children:i}=e;return t.push(n),r&&r.forEach(e=>{this.getNodeChildren(e,t)}),i&&i.forEach(e=>{this.getNodeChildren(e,t)}),t}initialZoom(e){return this.getChartState().lastTransform.k=e,this}render(){const e=this.getChartState();if(!e.data||0==e.data.length)return console.log("ORG CHART - Data is empty"),this;const t=Vl.select(e.container),n=t.node().getBoundingClientRect();n.width>0&&(e.svgWidth=n.width);const r={id:`ID${Math.floor(1e6*Math.random())}`,chartWidth:e.svgWidth,chartHeight:e.svgHeight};if(e.calc=r,r.centerX=r.chartWidth/2,r.centerY=r.chartHeight/2,e.firstDraw){const t={zoom:null};t.zoom=Vl.zoom().on("zoom",(e,t)=>this.zoomed(e,t)).scaleExtent(e.scaleExtent),e.zoomBehavior=t.zoom}e.flexTreeLayout=yl({nodeSize:t=>{const n=e.nodeWidth(t),r=e.nodeHeight(t),i=e.siblingsMargin(t),o=e.childrenMargin(t);return e.layoutBindings[e.layout].nodeFlexSize({state:e,node:t,width:n,height:r,siblingsMargin:i,childrenMargin:o})}}).spacing((t,n)=>t.parent==n.parent?0:e.neightbourMargin(t,n)),this.setLayouts({expandNodesFirst:!1});const i=t.patternify({tag:"svg",selector:"svg-chart-container"}).style("background-color",e.backgroundColor).attr("width",e.svgWidth).attr("height",e.svgHeight).attr("font-family",e.defaultFont);e.firstDraw&&i.call(e.zoomBehavior).on("dblclick.zoom",null).attr("cursor","move"),e.svg=i;const o=i.patternify({tag:"g",selector:"chart"});return e.centerG=o.patternify({tag:"g",selector:"center-group"}),e.linksWrapper=e.centerG.patternify({tag:"g",selector:"links-wrapper"}),e.nodesWrapper=e.centerG.patternify({tag:"g",selector:"nodes-wrapper"}),e.connectionsWrapper=e.centerG.patternify({tag:"g",selector:"connections-wrapper"}),e.defsWrapper=i.patternify({tag:"g",selector:"defs-wrapper"}),e.firstDraw&&e.centerG.attr("transform",()=>e.layoutBindings[e.layout].centerTransform({centerX:r.centerX,centerY:r.centerY,scale:e.lastTransform.k,rootMargin:e.rootMargin,root:e.root,chartHeight:r.chartHeight,chartWidth:r.chartWidth})),e.chart=o,this.update(e.root),Vl.select(window).on(`resize.${e.id}`,()=>{const t=Vl.select(e.container).node().getBoundingClientRect();e.svg.attr("width",t.width)}),e.firstDraw&&(e.firstDraw=!1),this}addNode(e){const t=this.getChartState(),n=t.allNodes.filter(n=>{let{data:r}=n;return t.nodeId(r)===t.nodeId(e)})[0],r=t.allNodes.filter(n=>{let{data:r}=n;return t.nodeId(r)===t.parentNodeId(e)})[0];return n?(console.log(`ORG CHART - ADD - Node with id "${t.nodeId(e)}" already exists in tree`),this):r?(e._centered&&!e._expanded&&(e._expanded=!0),t.data.push(e),this.updateNodesState(),this):(console.log(`ORG CHART - ADD - Parent node with id "${t.parentNodeId(e)}" not found in the tree`),this)}removeNode(e){const t=this.getChartState(),n=t.allNodes.filter(n=>{let{data:r}=n;return t.nodeId(r)==e})[0];if(!n)return console.log(`ORG CHART - REMOVE - Node with id "${e}" not found in the tree`),this;n.descendants().forEach(e=>e.data._filteredOut=!0);this.getNodeChildren(n,[],t.nodeId).forEach(e=>e._filtered=!0),t.data=t.data.filter(e=>!e._filtered);return this.updateNodesState.bind(this)(),this}groupBy(e,t,n){const r={};return e.forEach(e=>{const n=t(e);r[n]||(r[n]=[]),r[n].push(e)}),Object.keys(r).forEach(e=>{r[e]=n(r[e])}),Object.entries(r)}calculateCompactFlexDimensions(e){const t=this.getChartState();e.eachBefore(e=>{e.firstCompact=null,e.compactEven=null,e.flexCompactDim=null,e.firstCompactNode=null}),e.eachBefore(e=>{if(e.children&&e.children.length>1){const n=e.children.filter(e=>!e.children);if(n.length<2)return;n.forEach((e,t)=>{t||(e.firstCompact=!0),e.compactEven=!(t%2),e.row=Math.floor(t/2)});const r=Vl.max(n.filter(e=>e.compactEven),t.layoutBindings[t.layout].compactDimension.sizeColumn),i=Vl.max(n.filter(e=>!e.compactEven),t.layoutBindings[t.layout].compactDimension.sizeColumn),o=2*Math.max(r,i),a=this.groupBy(n,e=>e.row,e=>Vl.max(e,e=>t.layoutBindings[t.layout].compactDimension.sizeRow(e)+t.compactMarginBetween(e))),l=Vl.sum(a.map(e=>e[1]));n.forEach(e=>{e.firstCompactNode=n[0],e.firstCompact?e.flexCompactDim=[o+t.compactMarginPair(e),l-t.compactMarginBetween(e)]:e.flexCompactDim=[0,0]}),e.flexCompactDim=null}})}calculateCompactFlexPositions(e){const t=this.getChartState();e.eachBefore(e=>{if(e.children){const n=e.children.filter(e=>e.flexCompactDim),r=n[0];if(!r)return;n.forEach((e,n,i)=>{0==n&&(r.x-=r.flexCompactDim[0]/2),n&n%2-1?e.x=r.x+.25*r.flexCompactDim[0]-t.compactMarginPair(e)/4:n&&(e.x=r.x+.75*r.flexCompactDim[0]+t.compactMarginPair(e)/4)});const i=r.x+.5*r.flexCompactDim[0];r.x=r.x+.25*r.flexCompactDim[0]-t.compactMarginPair(r)/4;const o=e.x-i;Math.abs(o)<10&&n.forEach(e=>e.x+=o);const a=this.groupBy(n,e=>e.row,e=>Vl.max(e,e=>t.layoutBindings[t.layout].compactDimension.sizeRow(e))),l=Vl.cumsum(a.map(e=>e[1]+t.compactMarginBetween(e)));n.forEach((e,t)=>{e.row?e.y=r.y+l[e.row-1]:e.y=r.y})}})}update(e){let{x0:t,y0:n,x:r=0,y:i=0,width:o,height:a}=e;const l=this.getChartState();l.calc;l.compact&&this.calculateCompactFlexDimensions(l.root);const s=l.flexTreeLayout(l.root);l.compact&&this.calculateCompactFlexPositions(l.root);const u=s.descendants(),c=s.descendants().slice(1);u.forEach(l.layoutBindings[l.layout].swap);const f=l.connections,d={};l.allNodes.forEach(e=>d[l.nodeId(e.data)]=e);const h={};u.forEach(e=>h[l.nodeId(e.data)]=e),f.forEach(e=>{const t=d[e.from],n=d[e.to];e._source=t,e._target=n});const p=f.filter(e=>h[e.from]&&h[e.to]),y=l.defs.bind(this)(l,p);y!==l.defsWrapper.html()&&l.defsWrapper.html(y);const m=l.linksWrapper.selectAll("path.link").data(c,e=>l.nodeId(e.data)),g=m.enter().insert("path","g").attr("class","link").attr("d",e=>{const r={x:l.layoutBindings[l.layout].linkJoinX({x:t,y:n,width:o,height:a}),y:l.layoutBindings[l.layout].linkJoinY({x:t,y:n,width:o,height:a})};return l.layoutBindings[l.layout].diagonal(r,r,r)}).merge(m);g.attr("fill","none"),g.each(l.linkUpdate),g.transition().duration(l.duration).attr("d",e=>{const t=l.compact&&e.flexCompactDim?{x:l.layoutBindings[l.layout].compactLinkMidX(e,l),y:l.layoutBindings[l.layout].compactLinkMidY(e,l)}:{x:l.layoutBindings[l.layout].linkX(e),y:l.layoutBindings[l.layout].linkY(e)},n={x:l.layoutBindings[l.layout].linkParentX(e),y:l.layoutBindings[l.layout].linkParentY(e)},r=l.compact&&e.flexCompactDim?{x:l.layoutBindings[l.layout].linkCompactXStart(e),y:l.layoutBindings[l.layout].linkCompactYStart(e)}:t;return l.layoutBindings[l.layout].diagonal(t,n,r)});m.exit().transition().duration(l.duration).attr("d",e=>{const t={x:l.layoutBindings[l.layout].linkJoinX({x:r,y:i,width:o,height:a}),y:l.layoutBindings[l.layout].linkJoinY({x:r,y:i,width:o,height:a})};return l.layoutBindings[l.layout].diagonal(t,t)}).remove();const v=l.connectionsWrapper.selectAll("path.connection").data(p),b=v.enter().insert("path","g").attr("class","connection").attr("d",e=>{const r={x:l.layoutBindings[l.layout].linkJoinX({x:t,y:n,width:o,height:a}),y:l.layoutBindings[l.layout].linkJoinY({x:t,y:n,width:o,height:a})};return l.layoutBindings[l.layout].diagonal(r,r)}).merge(v);b.attr("fill","none"),b.transition().duration(l.duration).attr("d",e=>{const t=l.layoutBindings[l.layout].linkX({x:e._source.x,y:e._source.y,width:e._source.width,height:e._source.height}),n=l.layoutBindings[l.layout].linkY({x:e._source.x,y:e._source.y,width:e._source.width,height:e._source.height}),r=l.layoutBindings[l.layout].linkJoinX({x:e._target.x,y:e._target.y,width:e._target.width,height:e._target.height}),i=l.layoutBindings[l.layout].linkJoinY({x:e._target.x,y:e._target.y,width:e._target.width,height:e._target.height});return l.linkGroupArc({source:{x:t,y:n},target:{x:r,y:i}})}),b.each(l.connectionsUpdate);v.exit().transition().duration(l.duration).attr("opacity",0).remove();const w=l.nodesWrapper.selectAll("g.node").data(u,e=>{let{data:t}=e;return l.nodeId(t)}),x=w.enter().append("g").attr("class","node").attr("transform",e=>{if(e==l.root)return`translate(${t},${n})`;return`translate(${l.layoutBindings[l.layout].nodeJoinX({x:t,y:n,width:o,height:a})},${l.layoutBindings[l.layout].nodeJoinY({x:t,y:n,width:o,height:a})})`}).attr("cursor","pointer").on("click",(e,t)=>{let{data:n}=t;[...e.srcElement.classList].includes("node-button-foreign-object")||l.onNodeClick(l.nodeId(n))});x.patternify({tag:"rect",selector:"node-rect",data:e=>[e]});const S=x.merge(w).style("font","12px sans-serif");S.patternify({tag:"foreignObject",selector:"node-foreign-object",data:e=>[e]}).style("overflow","visible").patternify({tag:"xhtml:div",selector:"node-foreign-object-div",data:e=>[e]}),this.restyleForeignObjectElements();const _=x.patternify({tag:"g",selector:"node-button-g",data:e=>[e]}).on("click",(e,t)=>this.onButtonClick(e,t)).on("keydown",(e,t)=>{"Enter"!==e.key&&" "!==e.key&&"Spacebar"!==e.key||this.onButtonClick(e,t)});_.patternify({tag:"rect",selector:"node-button-rect",data:e=>[e]}).attr("opacity",0).attr("pointer-events","all").attr("width",40).attr("height",40).attr("x",-20).attr("y",-20);_.patternify({tag:"foreignObject",selector:"node-button-foreign-object",data:e=>[e]}).attr("width",40).attr("height",40).attr("x",-20).attr("y",-20).style("overflow","visible").patternify({tag:"xhtml:div",selector:"node-button-div",data:e=>[e]}).style("pointer-events","none").style("display","flex").style("width","100%").style("height","100%");S.transition().attr("opacity",0).duration(l.duration).attr("transform",e=>{let{x:t,y:n,width:r,height:i}=e;return l.layoutBindings[l.layout].nodeUpdateTransform({x:t,y:n,width:r,height:i})}).attr("opacity",1),S.select(".node-rect").attr("width",e=>{let{width:t}=e;return t}).attr("height",e=>{let{height:t}=e;return t}).attr("x",e=>{let{width:t}=e;return 0}).attr("y",e=>{let{height:t}=e;return 0}).attr("cursor","pointer").attr("rx",3).attr("fill",l.nodeDefaultBackground),S.select(".node-button-g").attr("transform",e=>{let{data:t,width:n,height:r}=e;return`translate(${l.layoutBindings[l.layout].buttonX({width:n,height:r})},${l.layoutBindings[l.layout].buttonY({width:n,height:r})})`}).attr("display",e=>{let{data:t}=e;return t._directSubordinates>0?null:"none"}).attr("opacity",e=>{let{children:t,_children:n}=e;return t||n?1:0}),S.select(".node-button-foreign-object .node-button-div").html(e=>l.buttonContent({node:e,state:l})),S.select(".node-button-text").attr("text-anchor","middle").attr("alignment-baseline","middle").attr("fill",l.defaultTextFill).attr("font-size",e=>{let{children:t}=e;return t?40:26}).text(e=>{let{children:t}=e;return t?"-":"+"}).attr("y",this.isEdge()?10:0),S.each(l.nodeUpdate);w.exit().attr("opacity",1).transition().duration(l.duration).attr("transform",e=>`translate(${l.layoutBindings[l.layout].nodeJoinX({x:r,y:i,width:o,height:a})},${l.layoutBindings[l.layout].nodeJoinY({x:r,y:i,width:o,height:a})})`).on("end",function(){Vl.select(this).remove()}).attr("opacity",0);u.forEach(e=>{e.x0=e.x,e.y0=e.y});const k=l.allNodes.filter(e=>e.data._centered)[0];if(k){const e=k.data._centeredWithDescendants?k.descendants().filter((e,t)=>t<7):[k];k.data._centeredWithDescendants=null,k.data._centered=null,this.fit({animate:!0,scale:!1,nodes:e})}}isEdge(){return window.navigator.userAgent.includes("Edge")}hdiagonal(e,t,n){const r=e.x,i=e.y,o=t.x,a=t.y;let l=n&&n.x||r,s=n&&n.y||i,u=o-r<0?-1:1,c=a-i<0?-1:1,f=Math.abs(o-r)/2<35?Math.abs(o-r)/2:35;f=Math.abs(a-i)/2<f?Math.abs(a-i)/2:f;Math.abs(a-i);let d=Math.abs(o-r)/2-f;return`\n                  M ${l} ${s}\n                  L ${l} ${i}\n                  L ${r} ${i}\n                  L ${r+d*u} ${i}\n                  C ${r+d*u+f*u} ${i} \n                    ${r+d*u+f*u} ${i} \n                    ${r+d*u+f*u} ${i+f*c}\n                  L ${r+d*u+f*u} ${a-f*c} \n                  C ${r+d*u+f*u}  ${a} \n                    ${r+d*u+f*u}  ${a} \n                    ${o-d*u}  ${a}\n                  L ${o} ${a}\n       `}diagonal(e,t,n){const r=e.x,i=e.y,o=t.x,a=t.y;let l=n&&n.x||r,s=n&&n.y||i,u=o-r<0?-1:1,c=a-i<0?-1:1,f=Math.abs(o-r)/2<35?Math.abs(o-r)/2:35;f=Math.abs(a-i)/2<f?Math.abs(a-i)/2:f;let d=Math.abs(a-i)/2-f;return`\n                  M ${l} ${s}\n                  L ${r} ${s}\n                  L ${r} ${i}\n                  L ${r} ${i+d*c}\n                  C  ${r} ${i+d*c+f*c} ${r} ${i+d*c+f*c} ${r+f*u} ${i+d*c+f*c}\n                  L ${r+(Math.abs(o-r)-2*f)*u+f*u} ${i+d*c+f*c}\n                  C  ${o}  ${i+d*c+f*c} ${o}  ${i+d*c+f*c} ${o} ${a-d*c}\n                  L ${o} ${a}\n       `}restyleForeignObjectElements(){const e=this.getChartState();e.svg.selectAll(".node-foreign-object").attr("width",e=>{let{width:t}=e;return t}).attr("height",e=>{let{height:t}=e;return t}).attr("x",e=>{let{width:t}=e;return 0}).attr("y",e=>{let{height:t}=e;return 0}),e.svg.selectAll(".node-foreign-object-div").style("width",e=>{let{width:t}=e;return`${t}px`}).style("height",e=>{let{height:t}=e;return`${t}px`}).html(function(t,n,r){return e.nodeContent.bind(this)(t,n,r,e)})}onButtonClick(e,t){this.getChartState().setActiveNodeCentered&&(t.data._centered=!0,t.data._centeredWithDescendants=!0),t.children?(t._children=t.children,t.children=null,this.setExpansionFlagToChildren(t,!1)):(t.children=t._children,t._children=null,t.children&&t.children.forEach(e=>{let{data:t}=e;return t._expanded=!0})),this.update(t)}setExpansionFlagToChildren(e,t){let{data:n,children:r,_children:i}=e;n._expanded=t,r&&r.forEach(e=>{this.setExpansionFlagToChildren(e,t)}),i&&i.forEach(e=>{this.setExpansionFlagToChildren(e,t)})}expandSomeNodes(e){if(e.data._expanded){let t=e.parent;for(;t;)t._children&&(t.children=t._children),t=t.parent}e._children&&e._children.forEach(e=>this.expandSomeNodes(e)),e.children&&e.children.forEach(e=>this.expandSomeNodes(e))}updateNodesState(){const e=this.getChartState();this.setLayouts({expandNodesFirst:!0}),this.update(e.root)}setLayouts(e){let{expandNodesFirst:t=!0}=e;const n=this.getChartState();n.root=Vl.stratify().id(e=>n.nodeId(e)).parentId(e=>n.parentNodeId(e))(n.data),n.root.each((e,t,r)=>{let i=n.nodeWidth(e),o=n.nodeHeight(e);Object.assign(e,{width:i,height:o})}),n.root.x0=0,n.root.y0=0,n.allNodes=n.root.descendants(),n.allNodes.forEach(e=>{Object.assign(e.data,{_directSubordinates:e.children?e.children.length:0,_totalSubordinates:e.descendants().length-1})}),n.root.children&&(t&&n.root.children.forEach(this.expand),n.root.children.forEach(e=>this.collapse(e)),0==n.expandLevel&&(n.root._children=n.root.children,n.root.children=null),[n.root].forEach(e=>this.expandSomeNodes(e)))}collapse(e){e.children&&(e._children=e.children,e._children.forEach(e=>this.collapse(e)),e.children=null)}expand(e){e._children&&(e.children=e._children,e.children.forEach(e=>this.expand(e)),e._children=null)}zoomed(e,t){const n=this.getChartState(),r=n.chart,i=e.transform;n.lastTransform=i,r.attr("transform",i),this.isEdge()&&this.restyleForeignObjectElements()}zoomTreeBounds(e){let{x0:t,x1:n,y0:r,y1:i,params:o={animate:!0,scale:!0}}=e;const{centerG:a,svgWidth:l,svgHeight:s,svg:u,zoomBehavior:c,duration:f,lastTransform:d}=this.getChartState();let h=Math.min(8,.9/Math.max((n-t)/l,(i-r)/s)),p=Vl.zoomIdentity.translate(l/2,s/2);p=p.scale(o.scale?h:d.k),p=p.translate(-(t+n)/2,-(r+i)/2),u.transition().duration(o.animate?f:0).call(c.transform,p),a.transition().duration(o.animate?f:0).attr("transform","translate(0,0)")}fit(){let{animate:e=!0,nodes:t,scale:n=!0}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const r=this.getChartState(),{root:i}=r;let o=t||i.descendants();const a=Vl.min(o,e=>e.x+r.layoutBindings[r.layout].nodeLeftX(e)),l=Vl.max(o,e=>e.x+r.layoutBindings[r.layout].nodeRightX(e)),s=Vl.min(o,e=>e.y+r.layoutBindings[r.layout].nodeTopY(e)),u=Vl.max(o,e=>e.y+r.layoutBindings[r.layout].nodeBottomY(e));return this.zoomTreeBounds({params:{animate:e,scale:n},x0:a-50,x1:l+50,y0:s-50,y1:u+50}),this}setExpanded(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const n=this.getChartState(),r=n.allNodes.filter(t=>{let{data:r}=t;return n.nodeId(r)==e})[0];return r?(r.data._expanded=t,this):(console.log(`ORG CHART - ${t?"EXPAND":"COLLAPSE"} - Node with id (${e})  not found in the tree`),this)}setCentered(e){const t=this.getChartState(),n=t.allNodes.filter(n=>t.nodeId(n.data)===e)[0];return n?(n.data._centered=!0,n.data._expanded=!0,this):(console.log(`ORG CHART - CENTER - Node with id (${e}) not found in the tree`),this)}setHighlighted(e){const t=this.getChartState(),n=t.allNodes.filter(n=>t.nodeId(n.data)===e)[0];return n?(n.data._highlighted=!0,n.data._expanded=!0,n.data._centered=!0,this):(console.log(`ORG CHART - HIGHLIGHT - Node with id (${e})  not found in the tree`),this)}setUpToTheRootHighlighted(e){const t=this.getChartState(),n=t.allNodes.filter(n=>t.nodeId(n.data)===e)[0];return n?(n.data._upToTheRootHighlighted=!0,n.data._expanded=!0,n.ancestors().forEach(e=>e.data._upToTheRootHighlighted=!0),this):(console.log(`ORG CHART - HIGHLIGHTROOT - Node with id (${e}) not found in the tree`),this)}clearHighlighting(){const e=this.getChartState();e.allNodes.forEach(e=>{e.data._highlighted=!1,e.data._upToTheRootHighlighted=!1}),this.update(e.root)}fullscreen(e){const t=this.getChartState(),n=Vl.select(e||t.container).node();Vl.select(document).on("fullscreenchange."+t.id,function(e){(document.fullscreenElement||document.mozFullscreenElement||document.webkitFullscreenElement)==n?setTimeout(e=>{t.svg.attr("height",window.innerHeight-40)},500):t.svg.attr("height",t.svgHeight)}),n.requestFullscreen?n.requestFullscreen():n.mozRequestFullScreen?n.mozRequestFullScreen():n.webkitRequestFullscreen?n.webkitRequestFullscreen():n.msRequestFullscreen&&n.msRequestFullscreen()}zoomIn(){const{svg:e,zoomBehavior:t}=this.getChartState();e.transition().call(t.scaleBy,1.3)}zoomOut(){const{svg:e,zoomBehavior:t}=this.getChartState();e.transition().call(t.scaleBy,.78)}toDataURL(e,t){var n=new XMLHttpRequest;n.onload=function(){var e=new FileReader;e.onloadend=function(){t(e.result)},e.readAsDataURL(n.response)},n.open("GET",e),n.responseType="blob",n.send()}exportImg(){let{full:e=!1,scale:t=3,onLoad:n=e=>e,save:r=!0}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const i=this,o=this.getChartState(),{svg:a,root:l}=o;let s=0;const u=a.selectAll("img");let c=u.size();const f=()=>{JSON.parse(JSON.stringify(i.lastTransform()));const o=i.duration();e&&i.fit();const{svg:a}=i.getChartState();setTimeout(e=>{i.downloadImage({node:a.node(),scale:t,isSvg:!1,onAlreadySerialized:e=>{i.update(l)},onLoad:n,save:r})},e?o+10:0)};c>0?u.each(function(){i.toDataURL(this.src,e=>{this.src=e,++s==c&&f()})}):f()}exportSvg(){const{svg:e}=this.getChartState();return this.downloadImage({node:e.node(),scale:3,isSvg:!0}),this}expandAll(){const{allNodes:e,root:t}=this.getChartState();return e.forEach(e=>e.data._expanded=!0),this.render(),this}collapseAll(){const{allNodes:e,root:t}=this.getChartState();return e.forEach(e=>e.data._expanded=!1),this.expandLevel(0),this.render(),this}downloadImage(e){let{node:t,scale:n=2,isSvg:r=!1,save:i=!0,onAlreadySerialized:o=e=>{},onLoad:a=e=>{}}=e;const l=t;if(r){let e=d(l);return e='<?xml version="1.0" standalone="no"?>\r\n'+e,f(c="data:image/svg+xml;charset=utf-8,"+encodeURIComponent(e),"graph.svg"),void o()}const s=n,u=document.createElement("img");u.onload=function(){const e=document.createElement("canvas"),t=l.getBoundingClientRect();e.width=t.width*s,e.height=t.height*s;const n=e.getContext("2d");n.fillStyle="#FAFAFA",n.fillRect(0,0,t.width*s,t.height*s),n.drawImage(u,0,0,t.width*s,t.height*s);let r=e.toDataURL("image/png");a&&a(r),i&&f(r,"graph.png")};var c="data:image/svg+xml; charset=utf8, "+encodeURIComponent(d(l));function f(e,t){var n=document.createElement("a");"string"===typeof n.download?(document.body.appendChild(n),n.download=t,n.href=e,n.click(),document.body.removeChild(n)):location.replace(e)}function d(e){const t="http://www.w3.org/2000/xmlns/";e=e.cloneNode(!0);const n=window.location.href+"#",r=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,null,!1);for(;r.nextNode();)for(const e of r.currentNode.attributes)e.value.includes(n)&&(e.value=e.value.replace(n,"#"));e.setAttributeNS(t,"xmlns","http://www.w3.org/2000/svg"),e.setAttributeNS(t,"xmlns:xlink","http://www.w3.org/1999/xlink");return(new XMLSerializer).serializeToString(e)}o(),u.src=c}getTextWidth(e){let{fontSize:t=14,fontWeight:n=400,defaultFont:r="Helvetice",ctx:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};i.font=`${n||""} ${t}px ${r} `;return i.measureText(e).width}}var Yl=n(579);const Wl=function(e){var t=function(t){function n(n){var r=t.call(this,n)||this;return r.componentDidMount=function(){ar.events.addEventListener(ar.RENDER_EVENT,r.onRenderEvent),ar.setComponentReady()},r.componentDidUpdate=function(){null!=r.state.componentError&&ar.setFrameHeight()},r.componentWillUnmount=function(){ar.events.removeEventListener(ar.RENDER_EVENT,r.onRenderEvent)},r.onRenderEvent=function(e){var t=e;r.setState({renderData:t.detail})},r.render=function(){return null!=r.state.componentError?l.createElement("div",null,l.createElement("h1",null,"Component Error"),l.createElement("span",null,r.state.componentError.message)):null==r.state.renderData?null:l.createElement(e,{width:window.innerWidth,disabled:r.state.renderData.disabled,args:r.state.renderData.args,theme:r.state.renderData.theme})},r.state={renderData:void 0,componentError:void 0},r}return sr(n,t),n.getDerivedStateFromError=function(e){return{componentError:e}},n}(l.PureComponent);return a()(t,e)}(e=>{var t,n;const i=(0,r.useRef)(null),{args:o}=e,a=null!==(t=o.data)&&void 0!==t?t:[{id:"100",parentId:"",name:"Steven",lastName:"King",position:"COO"},{id:"101",parentId:"100",name:"Neena",lastName:"Kochhar",position:"Admin VP"}],l=null!==(n=o.height)&&void 0!==n?n:600;return(0,r.useEffect)(()=>{const e=i.current;if(!e)return;const t=document.createElement("link");t.href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&display=swap",t.rel="stylesheet",document.head.appendChild(t);const n=document.createElement("link");n.href="https://fonts.googleapis.com/css2?family=Quantico:wght@400;700&display=swap",n.rel="stylesheet",document.head.appendChild(n),e.innerHTML="";const r=e.getBoundingClientRect().width;(new Hl).container(e).data(a).rootMargin(100).nodeWidth(e=>330).nodeHeight(e=>170).childrenMargin(e=>90).compactMarginBetween(e=>65).compactMarginPair(e=>100).neightbourMargin(()=>50).siblingsMargin(()=>100).compact(!1).linkUpdate(function(){this.setAttribute("stroke","#00F0FF"),this.setAttribute("stroke-opacity","0.8"),this.setAttribute("stroke-width","2")}).buttonContent(e=>{let{node:t}=e;return`<div style="color:#00F0FF;border-radius:5px;padding:3px;font-family:'Orbitron';font-size:10px;margin:auto auto;background-color:#0B0F1A;border: 1px solid #00F0FF"> \n          <span style="font-family:'Orbitron'; font-size:9px">${t.children?"\u25b2":"\u25bc"}</span> ${t.data._directSubordinates} </div>`}).nodeContent(e=>{const t="#00F0FF",n="#D8F3FF",r=`0 0 10px ${t}, 0 0 20px ${t}`,i=`<svg width=150 height=75 style="opacity:0.8"><path d="M 0,15 L15,0 L135,0 L150,15 L150,60 L135,75 L15,75 L0,60" fill="${t}" stroke="${t}"/></svg>`,o=Array.from({length:5},()=>Math.floor(25*Math.random()+5));return`\n          <div class="left-top" style="position:absolute;left:-10px;top:-10px">${i}</div>\n          <div class="right-top" style="position:absolute;right:-10px;top:-10px">${i}</div>\n          <div class="right-bottom" style="position:absolute;right:-10px;bottom:-14px">${i}</div>\n          <div class="left-bottom" style="position:absolute;left:-10px;bottom:-14px">${i}</div>\n\n          <div style="font-family:'Quantico', sans-serif; background-color:#0B0F1A; color:${n}; position:absolute; width:${e.width}px; height:${e.height}px; border:2px solid ${t}; border-radius:8px;">\n            \n            \x3c!-- Info Text --\x3e\n            <div style="position:absolute; top:10px; right:20px; text-align:right; font-family:'Orbitron', sans-serif;">\n              <div style="font-size:14px; color:${n}; font-weight:bold;">${e.data.name}</div>\n              <div style="font-size:12px;">${e.data.positionName||""}</div>\n              <div style="font-size:11px;">${e.data.id||""}</div>\n            </div>\n\n            \x3c!-- Avatar --\x3e\n            <div style="position:absolute; top:35px; left:${(e.width-80)/2}px;">\n              <img src="${e.data.imageUrl}" style="width:80px; height:80px; border-radius:50%; border:2px solid ${t}; box-shadow:${r};" />\n            </div>\n\n            \x3c!-- Simulated Pie / Progress Bars --\x3e\n            <div style="position:absolute; top:105px; left:20px;">\n              <div style="font-size:10px; margin-bottom:4px; color:${n}; font-family:'Orbitron', sans-serif;">Workload</div>\n              <svg width="130" height="30">\n                ${o.map((e,t)=>`<rect width="10" x="${20*t}" height="${e}" y="${30-e}" fill="#00F0FF" rx="2" />`).join("")}\n              </svg>\n            </div>\n          </div>\n        `}).svgWidth(r).svgHeight(l).render().fit()},[o.data,o.height]),(0,Yl.jsx)("div",{ref:i,style:{width:"100%",height:`${l}px`}})});i.createRoot(document.getElementById("root")).render((0,Yl.jsx)(Wl,{}))})();
-//# sourceMappingURL=main.d3830726.js.map
\ No newline at end of file
+/*! For license information please see main.9f0b232e.js.LICENSE.txt */
+(()=>{"use strict";var e={43:(e,t,n)=>{e.exports=n(202)},82:(e,t)=>{var n="function"===typeof Symbol&&Symbol.for,r=n?Symbol.for("react.element"):60103,i=n?Symbol.for("react.portal"):60106,o=n?Symbol.for("react.fragment"):60107,a=n?Symbol.for("react.strict_mode"):60108,l=n?Symbol.for("react.profiler"):60114,s=n?Symbol.for("react.provider"):60109,u=n?Symbol.for("react.context"):60110,c=n?Symbol.for("react.async_mode"):60111,f=n?Symbol.for("react.concurrent_mode"):60111,d=n?Symbol.for("react.forward_ref"):60112,h=n?Symbol.for("react.suspense"):60113,p=n?Symbol.for("react.suspense_list"):60120,y=n?Symbol.for("react.memo"):60115,m=n?Symbol.for("react.lazy"):60116,g=n?Symbol.for("react.block"):60121,v=n?Symbol.for("react.fundamental"):60117,b=n?Symbol.for("react.responder"):60118,w=n?Symbol.for("react.scope"):60119;function x(e){if("object"===typeof e&&null!==e){var t=e.$$typeof;switch(t){case r:switch(e=e.type){case c:case f:case o:case l:case a:case h:return e;default:switch(e=e&&e.$$typeof){case u:case d:case m:case y:case s:return e;default:return t}}case i:return t}}}function S(e){return x(e)===f}t.AsyncMode=c,t.ConcurrentMode=f,t.ContextConsumer=u,t.ContextProvider=s,t.Element=r,t.ForwardRef=d,t.Fragment=o,t.Lazy=m,t.Memo=y,t.Portal=i,t.Profiler=l,t.StrictMode=a,t.Suspense=h,t.isAsyncMode=function(e){return S(e)||x(e)===c},t.isConcurrentMode=S,t.isContextConsumer=function(e){return x(e)===u},t.isContextProvider=function(e){return x(e)===s},t.isElement=function(e){return"object"===typeof e&&null!==e&&e.$$typeof===r},t.isForwardRef=function(e){return x(e)===d},t.isFragment=function(e){return x(e)===o},t.isLazy=function(e){return x(e)===m},t.isMemo=function(e){return x(e)===y},t.isPortal=function(e){return x(e)===i},t.isProfiler=function(e){return x(e)===l},t.isStrictMode=function(e){return x(e)===a},t.isSuspense=function(e){return x(e)===h},t.isValidElementType=function(e){return"string"===typeof e||"function"===typeof e||e===o||e===f||e===l||e===a||e===h||e===p||"object"===typeof e&&null!==e&&(e.$$typeof===m||e.$$typeof===y||e.$$typeof===s||e.$$typeof===u||e.$$typeof===d||e.$$typeof===v||e.$$typeof===b||e.$$typeof===w||e.$$typeof===g)},t.typeOf=x},86:(e,t,n)=>{e.exports=n(82)},123:e=>{var t=Object.getOwnPropertySymbols,n=Object.prototype.hasOwnProperty,r=Object.prototype.propertyIsEnumerable;e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map(function(e){return t[e]}).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach(function(e){r[e]=e}),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(i){return!1}}()?Object.assign:function(e,i){for(var o,a,l=function(e){if(null===e||void 0===e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}(e),s=1;s<arguments.length;s++){for(var u in o=Object(arguments[s]))n.call(o,u)&&(l[u]=o[u]);if(t){a=t(o);for(var c=0;c<a.length;c++)r.call(o,a[c])&&(l[a[c]]=o[a[c]])}}return l}},153:(e,t,n)=>{var r=n(43),i=Symbol.for("react.element"),o=Symbol.for("react.fragment"),a=Object.prototype.hasOwnProperty,l=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED.ReactCurrentOwner,s={key:!0,ref:!0,__self:!0,__source:!0};function u(e,t,n){var r,o={},u=null,c=null;for(r in void 0!==n&&(u=""+n),void 0!==t.key&&(u=""+t.key),void 0!==t.ref&&(c=t.ref),t)a.call(t,r)&&!s.hasOwnProperty(r)&&(o[r]=t[r]);if(e&&e.defaultProps)for(r in t=e.defaultProps)void 0===o[r]&&(o[r]=t[r]);return{$$typeof:i,type:e,key:u,ref:c,props:o,_owner:l.current}}t.jsx=u},202:(e,t)=>{var n=Symbol.for("react.element"),r=Symbol.for("react.portal"),i=Symbol.for("react.fragment"),o=Symbol.for("react.strict_mode"),a=Symbol.for("react.profiler"),l=Symbol.for("react.provider"),s=Symbol.for("react.context"),u=Symbol.for("react.forward_ref"),c=Symbol.for("react.suspense"),f=Symbol.for("react.memo"),d=Symbol.for("react.lazy"),h=Symbol.iterator;var p={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},y=Object.assign,m={};function g(e,t,n){this.props=e,this.context=t,this.refs=m,this.updater=n||p}function v(){}function b(e,t,n){this.props=e,this.context=t,this.refs=m,this.updater=n||p}g.prototype.isReactComponent={},g.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error("setState(...): takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,e,t,"setState")},g.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},v.prototype=g.prototype;var w=b.prototype=new v;w.constructor=b,y(w,g.prototype),w.isPureReactComponent=!0;var x=Array.isArray,S=Object.prototype.hasOwnProperty,_={current:null},k={key:!0,ref:!0,__self:!0,__source:!0};function T(e,t,r){var i,o={},a=null,l=null;if(null!=t)for(i in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)S.call(t,i)&&!k.hasOwnProperty(i)&&(o[i]=t[i]);var s=arguments.length-2;if(1===s)o.children=r;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];o.children=u}if(e&&e.defaultProps)for(i in s=e.defaultProps)void 0===o[i]&&(o[i]=s[i]);return{$$typeof:n,type:e,key:a,ref:l,props:o,_owner:_.current}}function E(e){return"object"===typeof e&&null!==e&&e.$$typeof===n}var C=/\/+/g;function I(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+e.replace(/[=:]/g,function(e){return t[e]})}(""+e.key):t.toString(36)}function M(e,t,i,o,a){var l=typeof e;"undefined"!==l&&"boolean"!==l||(e=null);var s=!1;if(null===e)s=!0;else switch(l){case"string":case"number":s=!0;break;case"object":switch(e.$$typeof){case n:case r:s=!0}}if(s)return a=a(s=e),e=""===o?"."+I(s,0):o,x(a)?(i="",null!=e&&(i=e.replace(C,"$&/")+"/"),M(a,t,i,"",function(e){return e})):null!=a&&(E(a)&&(a=function(e,t){return{$$typeof:n,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(a,i+(!a.key||s&&s.key===a.key?"":(""+a.key).replace(C,"$&/")+"/")+e)),t.push(a)),1;if(s=0,o=""===o?".":o+":",x(e))for(var u=0;u<e.length;u++){var c=o+I(l=e[u],u);s+=M(l,t,i,c,a)}else if(c=function(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=h&&e[h]||e["@@iterator"])?e:null}(e),"function"===typeof c)for(e=c.call(e),u=0;!(l=e.next()).done;)s+=M(l=l.value,t,i,c=o+I(l,u++),a);else if("object"===l)throw t=String(e),Error("Objects are not valid as a React child (found: "+("[object Object]"===t?"object with keys {"+Object.keys(e).join(", ")+"}":t)+"). If you meant to render a collection of children, use an array instead.");return s}function N(e,t,n){if(null==e)return e;var r=[],i=0;return M(e,r,"","",function(e){return t.call(n,e,i++)}),r}function A(e){if(-1===e._status){var t=e._result;(t=t()).then(function(t){0!==e._status&&-1!==e._status||(e._status=1,e._result=t)},function(t){0!==e._status&&-1!==e._status||(e._status=2,e._result=t)}),-1===e._status&&(e._status=0,e._result=t)}if(1===e._status)return e._result.default;throw e._result}var O={current:null},z={transition:null},D={ReactCurrentDispatcher:O,ReactCurrentBatchConfig:z,ReactCurrentOwner:_};function $(){throw Error("act(...) is not supported in production builds of React.")}t.Children={map:N,forEach:function(e,t,n){N(e,function(){t.apply(this,arguments)},n)},count:function(e){var t=0;return N(e,function(){t++}),t},toArray:function(e){return N(e,function(e){return e})||[]},only:function(e){if(!E(e))throw Error("React.Children.only expected to receive a single React element child.");return e}},t.Component=g,t.Fragment=i,t.Profiler=a,t.PureComponent=b,t.StrictMode=o,t.Suspense=c,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=D,t.act=$,t.cloneElement=function(e,t,r){if(null===e||void 0===e)throw Error("React.cloneElement(...): The argument must be a React element, but you passed "+e+".");var i=y({},e.props),o=e.key,a=e.ref,l=e._owner;if(null!=t){if(void 0!==t.ref&&(a=t.ref,l=_.current),void 0!==t.key&&(o=""+t.key),e.type&&e.type.defaultProps)var s=e.type.defaultProps;for(u in t)S.call(t,u)&&!k.hasOwnProperty(u)&&(i[u]=void 0===t[u]&&void 0!==s?s[u]:t[u])}var u=arguments.length-2;if(1===u)i.children=r;else if(1<u){s=Array(u);for(var c=0;c<u;c++)s[c]=arguments[c+2];i.children=s}return{$$typeof:n,type:e.type,key:o,ref:a,props:i,_owner:l}},t.createContext=function(e){return(e={$$typeof:s,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null,_defaultValue:null,_globalName:null}).Provider={$$typeof:l,_context:e},e.Consumer=e},t.createElement=T,t.createFactory=function(e){var t=T.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:u,render:e}},t.isValidElement=E,t.lazy=function(e){return{$$typeof:d,_payload:{_status:-1,_result:e},_init:A}},t.memo=function(e,t){return{$$typeof:f,type:e,compare:void 0===t?null:t}},t.startTransition=function(e){var t=z.transition;z.transition={};try{e()}finally{z.transition=t}},t.unstable_act=$,t.useCallback=function(e,t){return O.current.useCallback(e,t)},t.useContext=function(e){return O.current.useContext(e)},t.useDebugValue=function(){},t.useDeferredValue=function(e){return O.current.useDeferredValue(e)},t.useEffect=function(e,t){return O.current.useEffect(e,t)},t.useId=function(){return O.current.useId()},t.useImperativeHandle=function(e,t,n){return O.current.useImperativeHandle(e,t,n)},t.useInsertionEffect=function(e,t){return O.current.useInsertionEffect(e,t)},t.useLayoutEffect=function(e,t){return O.current.useLayoutEffect(e,t)},t.useMemo=function(e,t){return O.current.useMemo(e,t)},t.useReducer=function(e,t,n){return O.current.useReducer(e,t,n)},t.useRef=function(e){return O.current.useRef(e)},t.useState=function(e){return O.current.useState(e)},t.useSyncExternalStore=function(e,t,n){return O.current.useSyncExternalStore(e,t,n)},t.useTransition=function(){return O.current.useTransition()},t.version="18.3.1"},219:(e,t,n)=>{var r=n(86),i={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},o={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},l={};function s(e){return r.isMemo(e)?a:l[e.$$typeof]||i}l[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},l[r.Memo]=a;var u=Object.defineProperty,c=Object.getOwnPropertyNames,f=Object.getOwnPropertySymbols,d=Object.getOwnPropertyDescriptor,h=Object.getPrototypeOf,p=Object.prototype;e.exports=function e(t,n,r){if("string"!==typeof n){if(p){var i=h(n);i&&i!==p&&e(t,i,r)}var a=c(n);f&&(a=a.concat(f(n)));for(var l=s(t),y=s(n),m=0;m<a.length;++m){var g=a[m];if(!o[g]&&(!r||!r[g])&&(!y||!y[g])&&(!l||!l[g])){var v=d(n,g);try{u(t,g,v)}catch(b){}}}}return t}},234:(e,t)=>{function n(e,t){var n=e.length;e.push(t);e:for(;0<n;){var r=n-1>>>1,i=e[r];if(!(0<o(i,t)))break e;e[r]=t,e[n]=i,n=r}}function r(e){return 0===e.length?null:e[0]}function i(e){if(0===e.length)return null;var t=e[0],n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,i=e.length,a=i>>>1;r<a;){var l=2*(r+1)-1,s=e[l],u=l+1,c=e[u];if(0>o(s,n))u<i&&0>o(c,s)?(e[r]=c,e[u]=n,r=u):(e[r]=s,e[l]=n,r=l);else{if(!(u<i&&0>o(c,n)))break e;e[r]=c,e[u]=n,r=u}}}return t}function o(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}if("object"===typeof performance&&"function"===typeof performance.now){var a=performance;t.unstable_now=function(){return a.now()}}else{var l=Date,s=l.now();t.unstable_now=function(){return l.now()-s}}var u=[],c=[],f=1,d=null,h=3,p=!1,y=!1,m=!1,g="function"===typeof setTimeout?setTimeout:null,v="function"===typeof clearTimeout?clearTimeout:null,b="undefined"!==typeof setImmediate?setImmediate:null;function w(e){for(var t=r(c);null!==t;){if(null===t.callback)i(c);else{if(!(t.startTime<=e))break;i(c),t.sortIndex=t.expirationTime,n(u,t)}t=r(c)}}function x(e){if(m=!1,w(e),!y)if(null!==r(u))y=!0,z(S);else{var t=r(c);null!==t&&D(x,t.startTime-e)}}function S(e,n){y=!1,m&&(m=!1,v(E),E=-1),p=!0;var o=h;try{for(w(n),d=r(u);null!==d&&(!(d.expirationTime>n)||e&&!M());){var a=d.callback;if("function"===typeof a){d.callback=null,h=d.priorityLevel;var l=a(d.expirationTime<=n);n=t.unstable_now(),"function"===typeof l?d.callback=l:d===r(u)&&i(u),w(n)}else i(u);d=r(u)}if(null!==d)var s=!0;else{var f=r(c);null!==f&&D(x,f.startTime-n),s=!1}return s}finally{d=null,h=o,p=!1}}"undefined"!==typeof navigator&&void 0!==navigator.scheduling&&void 0!==navigator.scheduling.isInputPending&&navigator.scheduling.isInputPending.bind(navigator.scheduling);var _,k=!1,T=null,E=-1,C=5,I=-1;function M(){return!(t.unstable_now()-I<C)}function N(){if(null!==T){var e=t.unstable_now();I=e;var n=!0;try{n=T(!0,e)}finally{n?_():(k=!1,T=null)}}else k=!1}if("function"===typeof b)_=function(){b(N)};else if("undefined"!==typeof MessageChannel){var A=new MessageChannel,O=A.port2;A.port1.onmessage=N,_=function(){O.postMessage(null)}}else _=function(){g(N,0)};function z(e){T=e,k||(k=!0,_())}function D(e,n){E=g(function(){e(t.unstable_now())},n)}t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){y||p||(y=!0,z(S))},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):C=0<e?Math.floor(1e3/e):5},t.unstable_getCurrentPriorityLevel=function(){return h},t.unstable_getFirstCallbackNode=function(){return r(u)},t.unstable_next=function(e){switch(h){case 1:case 2:case 3:var t=3;break;default:t=h}var n=h;h=t;try{return e()}finally{h=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=function(){},t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=h;h=e;try{return t()}finally{h=n}},t.unstable_scheduleCallback=function(e,i,o){var a=t.unstable_now();switch("object"===typeof o&&null!==o?o="number"===typeof(o=o.delay)&&0<o?a+o:a:o=a,e){case 1:var l=-1;break;case 2:l=250;break;case 5:l=1073741823;break;case 4:l=1e4;break;default:l=5e3}return e={id:f++,callback:i,priorityLevel:e,startTime:o,expirationTime:l=o+l,sortIndex:-1},o>a?(e.sortIndex=o,n(c,e),null===r(u)&&e===r(c)&&(m?(v(E),E=-1):m=!0,D(x,o-a))):(e.sortIndex=l,n(u,e),y||p||(y=!0,z(S))),e},t.unstable_shouldYield=M,t.unstable_wrapCallback=function(e){var t=h;return function(){var n=h;h=t;try{return e.apply(this,arguments)}finally{h=n}}}},391:(e,t,n)=>{var r=n(950);t.createRoot=r.createRoot,t.hydrateRoot=r.hydrateRoot},579:(e,t,n)=>{e.exports=n(153)},730:(e,t,n)=>{var r=n(43),i=n(853);function o(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var a=new Set,l={};function s(e,t){u(e,t),u(e+"Capture",t)}function u(e,t){for(l[e]=t,e=0;e<t.length;e++)a.add(t[e])}var c=!("undefined"===typeof window||"undefined"===typeof window.document||"undefined"===typeof window.document.createElement),f=Object.prototype.hasOwnProperty,d=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,h={},p={};function y(e,t,n,r,i,o,a){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=i,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=o,this.removeEmptyString=a}var m={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach(function(e){m[e]=new y(e,0,!1,e,null,!1,!1)}),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach(function(e){var t=e[0];m[t]=new y(t,1,!1,e[1],null,!1,!1)}),["contentEditable","draggable","spellCheck","value"].forEach(function(e){m[e]=new y(e,2,!1,e.toLowerCase(),null,!1,!1)}),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach(function(e){m[e]=new y(e,2,!1,e,null,!1,!1)}),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture disableRemotePlayback formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach(function(e){m[e]=new y(e,3,!1,e.toLowerCase(),null,!1,!1)}),["checked","multiple","muted","selected"].forEach(function(e){m[e]=new y(e,3,!0,e,null,!1,!1)}),["capture","download"].forEach(function(e){m[e]=new y(e,4,!1,e,null,!1,!1)}),["cols","rows","size","span"].forEach(function(e){m[e]=new y(e,6,!1,e,null,!1,!1)}),["rowSpan","start"].forEach(function(e){m[e]=new y(e,5,!1,e.toLowerCase(),null,!1,!1)});var g=/[\-:]([a-z])/g;function v(e){return e[1].toUpperCase()}function b(e,t,n,r){var i=m.hasOwnProperty(t)?m[t]:null;(null!==i?0!==i.type:r||!(2<t.length)||"o"!==t[0]&&"O"!==t[0]||"n"!==t[1]&&"N"!==t[1])&&(function(e,t,n,r){if(null===t||"undefined"===typeof t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,i,r)&&(n=null),r||null===i?function(e){return!!f.call(p,e)||!f.call(h,e)&&(d.test(e)?p[e]=!0:(h[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):i.mustUseProperty?e[i.propertyName]=null===n?3!==i.type&&"":n:(t=i.attributeName,r=i.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(i=i.type)||4===i&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach(function(e){var t=e.replace(g,v);m[t]=new y(t,1,!1,e,null,!1,!1)}),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach(function(e){var t=e.replace(g,v);m[t]=new y(t,1,!1,e,"http://www.w3.org/1999/xlink",!1,!1)}),["xml:base","xml:lang","xml:space"].forEach(function(e){var t=e.replace(g,v);m[t]=new y(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1,!1)}),["tabIndex","crossOrigin"].forEach(function(e){m[e]=new y(e,1,!1,e.toLowerCase(),null,!1,!1)}),m.xlinkHref=new y("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0,!1),["src","href","action","formAction"].forEach(function(e){m[e]=new y(e,1,!1,e.toLowerCase(),null,!0,!0)});var w=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED,x=Symbol.for("react.element"),S=Symbol.for("react.portal"),_=Symbol.for("react.fragment"),k=Symbol.for("react.strict_mode"),T=Symbol.for("react.profiler"),E=Symbol.for("react.provider"),C=Symbol.for("react.context"),I=Symbol.for("react.forward_ref"),M=Symbol.for("react.suspense"),N=Symbol.for("react.suspense_list"),A=Symbol.for("react.memo"),O=Symbol.for("react.lazy");Symbol.for("react.scope"),Symbol.for("react.debug_trace_mode");var z=Symbol.for("react.offscreen");Symbol.for("react.legacy_hidden"),Symbol.for("react.cache"),Symbol.for("react.tracing_marker");var D=Symbol.iterator;function $(e){return null===e||"object"!==typeof e?null:"function"===typeof(e=D&&e[D]||e["@@iterator"])?e:null}var P,L=Object.assign;function B(e){if(void 0===P)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);P=t&&t[1]||""}return"\n"+P+e}var F=!1;function R(e,t){if(!e||F)return"";F=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{if(t)if(t=function(){throw Error()},Object.defineProperty(t.prototype,"props",{set:function(){throw Error()}}),"object"===typeof Reflect&&Reflect.construct){try{Reflect.construct(t,[])}catch(u){var r=u}Reflect.construct(e,[],t)}else{try{t.call()}catch(u){r=u}e.call(t.prototype)}else{try{throw Error()}catch(u){r=u}e()}}catch(u){if(u&&r&&"string"===typeof u.stack){for(var i=u.stack.split("\n"),o=r.stack.split("\n"),a=i.length-1,l=o.length-1;1<=a&&0<=l&&i[a]!==o[l];)l--;for(;1<=a&&0<=l;a--,l--)if(i[a]!==o[l]){if(1!==a||1!==l)do{if(a--,0>--l||i[a]!==o[l]){var s="\n"+i[a].replace(" at new "," at ");return e.displayName&&s.includes("<anonymous>")&&(s=s.replace("<anonymous>",e.displayName)),s}}while(1<=a&&0<=l);break}}}finally{F=!1,Error.prepareStackTrace=n}return(e=e?e.displayName||e.name:"")?B(e):""}function U(e){switch(e.tag){case 5:return B(e.type);case 16:return B("Lazy");case 13:return B("Suspense");case 19:return B("SuspenseList");case 0:case 2:case 15:return e=R(e.type,!1);case 11:return e=R(e.type.render,!1);case 1:return e=R(e.type,!0);default:return""}}function j(e){if(null==e)return null;if("function"===typeof e)return e.displayName||e.name||null;if("string"===typeof e)return e;switch(e){case _:return"Fragment";case S:return"Portal";case T:return"Profiler";case k:return"StrictMode";case M:return"Suspense";case N:return"SuspenseList"}if("object"===typeof e)switch(e.$$typeof){case C:return(e.displayName||"Context")+".Consumer";case E:return(e._context.displayName||"Context")+".Provider";case I:var t=e.render;return(e=e.displayName)||(e=""!==(e=t.displayName||t.name||"")?"ForwardRef("+e+")":"ForwardRef"),e;case A:return null!==(t=e.displayName||null)?t:j(e.type)||"Memo";case O:t=e._payload,e=e._init;try{return j(e(t))}catch(n){}}return null}function V(e){var t=e.type;switch(e.tag){case 24:return"Cache";case 9:return(t.displayName||"Context")+".Consumer";case 10:return(t._context.displayName||"Context")+".Provider";case 18:return"DehydratedFragment";case 11:return e=(e=t.render).displayName||e.name||"",t.displayName||(""!==e?"ForwardRef("+e+")":"ForwardRef");case 7:return"Fragment";case 5:return t;case 4:return"Portal";case 3:return"Root";case 6:return"Text";case 16:return j(t);case 8:return t===k?"StrictMode":"Mode";case 22:return"Offscreen";case 12:return"Profiler";case 21:return"Scope";case 13:return"Suspense";case 19:return"SuspenseList";case 25:return"TracingMarker";case 1:case 0:case 17:case 2:case 14:case 15:if("function"===typeof t)return t.displayName||t.name||null;if("string"===typeof t)return t}return null}function H(e){switch(typeof e){case"boolean":case"number":case"string":case"undefined":case"object":return e;default:return""}}function Y(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function W(e){e._valueTracker||(e._valueTracker=function(e){var t=Y(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&"undefined"!==typeof n&&"function"===typeof n.get&&"function"===typeof n.set){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(e){r=""+e,o.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function X(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=Y(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function q(e){if("undefined"===typeof(e=e||("undefined"!==typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function Q(e,t){var n=t.checked;return L({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function G(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=H(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function J(e,t){null!=(t=t.checked)&&b(e,"checked",t,!1)}function K(e,t){J(e,t);var n=H(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?ee(e,t.type,n):t.hasOwnProperty("defaultValue")&&ee(e,t.type,H(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Z(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function ee(e,t,n){"number"===t&&q(e.ownerDocument)===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}var te=Array.isArray;function ne(e,t,n,r){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&r&&(e[n].defaultSelected=!0)}else{for(n=""+H(n),t=null,i=0;i<e.length;i++){if(e[i].value===n)return e[i].selected=!0,void(r&&(e[i].defaultSelected=!0));null!==t||e[i].disabled||(t=e[i])}null!==t&&(t.selected=!0)}}function re(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(o(91));return L({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function ie(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(o(92));if(te(n)){if(1<n.length)throw Error(o(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:H(n)}}function oe(e,t){var n=H(t.value),r=H(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function ae(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}function le(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function se(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?le(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var ue,ce,fe=(ce=function(e,t){if("http://www.w3.org/2000/svg"!==e.namespaceURI||"innerHTML"in e)e.innerHTML=t;else{for((ue=ue||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=ue.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}},"undefined"!==typeof MSApp&&MSApp.execUnsafeLocalFunction?function(e,t,n,r){MSApp.execUnsafeLocalFunction(function(){return ce(e,t)})}:ce);function de(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}var he={animationIterationCount:!0,aspectRatio:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},pe=["Webkit","ms","Moz","O"];function ye(e,t,n){return null==t||"boolean"===typeof t||""===t?"":n||"number"!==typeof t||0===t||he.hasOwnProperty(e)&&he[e]?(""+t).trim():t+"px"}function me(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),i=ye(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,i):e[n]=i}}Object.keys(he).forEach(function(e){pe.forEach(function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),he[t]=he[e]})});var ge=L({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function ve(e,t){if(t){if(ge[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(o(137,e));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(o(60));if("object"!==typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(o(61))}if(null!=t.style&&"object"!==typeof t.style)throw Error(o(62))}}function be(e,t){if(-1===e.indexOf("-"))return"string"===typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var we=null;function xe(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}var Se=null,_e=null,ke=null;function Te(e){if(e=bi(e)){if("function"!==typeof Se)throw Error(o(280));var t=e.stateNode;t&&(t=xi(t),Se(e.stateNode,e.type,t))}}function Ee(e){_e?ke?ke.push(e):ke=[e]:_e=e}function Ce(){if(_e){var e=_e,t=ke;if(ke=_e=null,Te(e),t)for(e=0;e<t.length;e++)Te(t[e])}}function Ie(e,t){return e(t)}function Me(){}var Ne=!1;function Ae(e,t,n){if(Ne)return e(t,n);Ne=!0;try{return Ie(e,t,n)}finally{Ne=!1,(null!==_e||null!==ke)&&(Me(),Ce())}}function Oe(e,t){var n=e.stateNode;if(null===n)return null;var r=xi(n);if(null===r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!==typeof n)throw Error(o(231,t,typeof n));return n}var ze=!1;if(c)try{var De={};Object.defineProperty(De,"passive",{get:function(){ze=!0}}),window.addEventListener("test",De,De),window.removeEventListener("test",De,De)}catch(ce){ze=!1}function $e(e,t,n,r,i,o,a,l,s){var u=Array.prototype.slice.call(arguments,3);try{t.apply(n,u)}catch(c){this.onError(c)}}var Pe=!1,Le=null,Be=!1,Fe=null,Re={onError:function(e){Pe=!0,Le=e}};function Ue(e,t,n,r,i,o,a,l,s){Pe=!1,Le=null,$e.apply(Re,arguments)}function je(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!==(4098&(t=e).flags)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function Ve(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function He(e){if(je(e)!==e)throw Error(o(188))}function Ye(e){return null!==(e=function(e){var t=e.alternate;if(!t){if(null===(t=je(e)))throw Error(o(188));return t!==e?null:e}for(var n=e,r=t;;){var i=n.return;if(null===i)break;var a=i.alternate;if(null===a){if(null!==(r=i.return)){n=r;continue}break}if(i.child===a.child){for(a=i.child;a;){if(a===n)return He(i),e;if(a===r)return He(i),t;a=a.sibling}throw Error(o(188))}if(n.return!==r.return)n=i,r=a;else{for(var l=!1,s=i.child;s;){if(s===n){l=!0,n=i,r=a;break}if(s===r){l=!0,r=i,n=a;break}s=s.sibling}if(!l){for(s=a.child;s;){if(s===n){l=!0,n=a,r=i;break}if(s===r){l=!0,r=a,n=i;break}s=s.sibling}if(!l)throw Error(o(189))}}if(n.alternate!==r)throw Error(o(190))}if(3!==n.tag)throw Error(o(188));return n.stateNode.current===n?e:t}(e))?We(e):null}function We(e){if(5===e.tag||6===e.tag)return e;for(e=e.child;null!==e;){var t=We(e);if(null!==t)return t;e=e.sibling}return null}var Xe=i.unstable_scheduleCallback,qe=i.unstable_cancelCallback,Qe=i.unstable_shouldYield,Ge=i.unstable_requestPaint,Je=i.unstable_now,Ke=i.unstable_getCurrentPriorityLevel,Ze=i.unstable_ImmediatePriority,et=i.unstable_UserBlockingPriority,tt=i.unstable_NormalPriority,nt=i.unstable_LowPriority,rt=i.unstable_IdlePriority,it=null,ot=null;var at=Math.clz32?Math.clz32:function(e){return e>>>=0,0===e?32:31-(lt(e)/st|0)|0},lt=Math.log,st=Math.LN2;var ut=64,ct=4194304;function ft(e){switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return 4194240&e;case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:return 130023424&e;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 1073741824;default:return e}}function dt(e,t){var n=e.pendingLanes;if(0===n)return 0;var r=0,i=e.suspendedLanes,o=e.pingedLanes,a=268435455&n;if(0!==a){var l=a&~i;0!==l?r=ft(l):0!==(o&=a)&&(r=ft(o))}else 0!==(a=n&~i)?r=ft(a):0!==o&&(r=ft(o));if(0===r)return 0;if(0!==t&&t!==r&&0===(t&i)&&((i=r&-r)>=(o=t&-t)||16===i&&0!==(4194240&o)))return t;if(0!==(4&r)&&(r|=16&n),0!==(t=e.entangledLanes))for(e=e.entanglements,t&=r;0<t;)i=1<<(n=31-at(t)),r|=e[n],t&=~i;return r}function ht(e,t){switch(e){case 1:case 2:case 4:return t+250;case 8:case 16:case 32:case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;default:return-1}}function pt(e){return 0!==(e=-1073741825&e.pendingLanes)?e:1073741824&e?1073741824:0}function yt(){var e=ut;return 0===(4194240&(ut<<=1))&&(ut=64),e}function mt(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function gt(e,t,n){e.pendingLanes|=t,536870912!==t&&(e.suspendedLanes=0,e.pingedLanes=0),(e=e.eventTimes)[t=31-at(t)]=n}function vt(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var r=31-at(n),i=1<<r;i&t|e[r]&t&&(e[r]|=t),n&=~i}}var bt=0;function wt(e){return 1<(e&=-e)?4<e?0!==(268435455&e)?16:536870912:4:1}var xt,St,_t,kt,Tt,Et=!1,Ct=[],It=null,Mt=null,Nt=null,At=new Map,Ot=new Map,zt=[],Dt="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset submit".split(" ");function $t(e,t){switch(e){case"focusin":case"focusout":It=null;break;case"dragenter":case"dragleave":Mt=null;break;case"mouseover":case"mouseout":Nt=null;break;case"pointerover":case"pointerout":At.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Ot.delete(t.pointerId)}}function Pt(e,t,n,r,i,o){return null===e||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:r,nativeEvent:o,targetContainers:[i]},null!==t&&(null!==(t=bi(t))&&St(t)),e):(e.eventSystemFlags|=r,t=e.targetContainers,null!==i&&-1===t.indexOf(i)&&t.push(i),e)}function Lt(e){var t=vi(e.target);if(null!==t){var n=je(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=Ve(n)))return e.blockedOn=t,void Tt(e.priority,function(){_t(n)})}else if(3===t&&n.stateNode.current.memoizedState.isDehydrated)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Bt(e){if(null!==e.blockedOn)return!1;for(var t=e.targetContainers;0<t.length;){var n=Qt(e.domEventName,e.eventSystemFlags,t[0],e.nativeEvent);if(null!==n)return null!==(t=bi(n))&&St(t),e.blockedOn=n,!1;var r=new(n=e.nativeEvent).constructor(n.type,n);we=r,n.target.dispatchEvent(r),we=null,t.shift()}return!0}function Ft(e,t,n){Bt(e)&&n.delete(t)}function Rt(){Et=!1,null!==It&&Bt(It)&&(It=null),null!==Mt&&Bt(Mt)&&(Mt=null),null!==Nt&&Bt(Nt)&&(Nt=null),At.forEach(Ft),Ot.forEach(Ft)}function Ut(e,t){e.blockedOn===t&&(e.blockedOn=null,Et||(Et=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,Rt)))}function jt(e){function t(t){return Ut(t,e)}if(0<Ct.length){Ut(Ct[0],e);for(var n=1;n<Ct.length;n++){var r=Ct[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==It&&Ut(It,e),null!==Mt&&Ut(Mt,e),null!==Nt&&Ut(Nt,e),At.forEach(t),Ot.forEach(t),n=0;n<zt.length;n++)(r=zt[n]).blockedOn===e&&(r.blockedOn=null);for(;0<zt.length&&null===(n=zt[0]).blockedOn;)Lt(n),null===n.blockedOn&&zt.shift()}var Vt=w.ReactCurrentBatchConfig,Ht=!0;function Yt(e,t,n,r){var i=bt,o=Vt.transition;Vt.transition=null;try{bt=1,Xt(e,t,n,r)}finally{bt=i,Vt.transition=o}}function Wt(e,t,n,r){var i=bt,o=Vt.transition;Vt.transition=null;try{bt=4,Xt(e,t,n,r)}finally{bt=i,Vt.transition=o}}function Xt(e,t,n,r){if(Ht){var i=Qt(e,t,n,r);if(null===i)Hr(e,t,r,qt,n),$t(e,r);else if(function(e,t,n,r,i){switch(t){case"focusin":return It=Pt(It,e,t,n,r,i),!0;case"dragenter":return Mt=Pt(Mt,e,t,n,r,i),!0;case"mouseover":return Nt=Pt(Nt,e,t,n,r,i),!0;case"pointerover":var o=i.pointerId;return At.set(o,Pt(At.get(o)||null,e,t,n,r,i)),!0;case"gotpointercapture":return o=i.pointerId,Ot.set(o,Pt(Ot.get(o)||null,e,t,n,r,i)),!0}return!1}(i,e,t,n,r))r.stopPropagation();else if($t(e,r),4&t&&-1<Dt.indexOf(e)){for(;null!==i;){var o=bi(i);if(null!==o&&xt(o),null===(o=Qt(e,t,n,r))&&Hr(e,t,r,qt,n),o===i)break;i=o}null!==i&&r.stopPropagation()}else Hr(e,t,r,null,n)}}var qt=null;function Qt(e,t,n,r){if(qt=null,null!==(e=vi(e=xe(r))))if(null===(t=je(e)))e=null;else if(13===(n=t.tag)){if(null!==(e=Ve(t)))return e;e=null}else if(3===n){if(t.stateNode.current.memoizedState.isDehydrated)return 3===t.tag?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null);return qt=e,null}function Gt(e){switch(e){case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 1;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"toggle":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 4;case"message":switch(Ke()){case Ze:return 1;case et:return 4;case tt:case nt:return 16;case rt:return 536870912;default:return 16}default:return 16}}var Jt=null,Kt=null,Zt=null;function en(){if(Zt)return Zt;var e,t,n=Kt,r=n.length,i="value"in Jt?Jt.value:Jt.textContent,o=i.length;for(e=0;e<r&&n[e]===i[e];e++);var a=r-e;for(t=1;t<=a&&n[r-t]===i[o-t];t++);return Zt=i.slice(e,1<t?1-t:void 0)}function tn(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}function nn(){return!0}function rn(){return!1}function on(e){function t(t,n,r,i,o){for(var a in this._reactName=t,this._targetInst=r,this.type=n,this.nativeEvent=i,this.target=o,this.currentTarget=null,e)e.hasOwnProperty(a)&&(t=e[a],this[a]=t?t(i):i[a]);return this.isDefaultPrevented=(null!=i.defaultPrevented?i.defaultPrevented:!1===i.returnValue)?nn:rn,this.isPropagationStopped=rn,this}return L(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!==typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=nn)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!==typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=nn)},persist:function(){},isPersistent:nn}),t}var an,ln,sn,un={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},cn=on(un),fn=L({},un,{view:0,detail:0}),dn=on(fn),hn=L({},fn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:Tn,button:0,buttons:0,relatedTarget:function(e){return void 0===e.relatedTarget?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==sn&&(sn&&"mousemove"===e.type?(an=e.screenX-sn.screenX,ln=e.screenY-sn.screenY):ln=an=0,sn=e),an)},movementY:function(e){return"movementY"in e?e.movementY:ln}}),pn=on(hn),yn=on(L({},hn,{dataTransfer:0})),mn=on(L({},fn,{relatedTarget:0})),gn=on(L({},un,{animationName:0,elapsedTime:0,pseudoElement:0})),vn=L({},un,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),bn=on(vn),wn=on(L({},un,{data:0})),xn={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Sn={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},_n={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function kn(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=_n[e])&&!!t[e]}function Tn(){return kn}var En=L({},fn,{key:function(e){if(e.key){var t=xn[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=tn(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Sn[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:Tn,charCode:function(e){return"keypress"===e.type?tn(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?tn(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),Cn=on(En),In=on(L({},hn,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0})),Mn=on(L({},fn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:Tn})),Nn=on(L({},un,{propertyName:0,elapsedTime:0,pseudoElement:0})),An=L({},hn,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),On=on(An),zn=[9,13,27,32],Dn=c&&"CompositionEvent"in window,$n=null;c&&"documentMode"in document&&($n=document.documentMode);var Pn=c&&"TextEvent"in window&&!$n,Ln=c&&(!Dn||$n&&8<$n&&11>=$n),Bn=String.fromCharCode(32),Fn=!1;function Rn(e,t){switch(e){case"keyup":return-1!==zn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Un(e){return"object"===typeof(e=e.detail)&&"data"in e?e.data:null}var jn=!1;var Vn={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Hn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!Vn[e.type]:"textarea"===t}function Yn(e,t,n,r){Ee(r),0<(t=Wr(t,"onChange")).length&&(n=new cn("onChange","change",null,n,r),e.push({event:n,listeners:t}))}var Wn=null,Xn=null;function qn(e){Br(e,0)}function Qn(e){if(X(wi(e)))return e}function Gn(e,t){if("change"===e)return t}var Jn=!1;if(c){var Kn;if(c){var Zn="oninput"in document;if(!Zn){var er=document.createElement("div");er.setAttribute("oninput","return;"),Zn="function"===typeof er.oninput}Kn=Zn}else Kn=!1;Jn=Kn&&(!document.documentMode||9<document.documentMode)}function tr(){Wn&&(Wn.detachEvent("onpropertychange",nr),Xn=Wn=null)}function nr(e){if("value"===e.propertyName&&Qn(Xn)){var t=[];Yn(t,Xn,e,xe(e)),Ae(qn,t)}}function rr(e,t,n){"focusin"===e?(tr(),Xn=n,(Wn=t).attachEvent("onpropertychange",nr)):"focusout"===e&&tr()}function ir(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return Qn(Xn)}function or(e,t){if("click"===e)return Qn(t)}function ar(e,t){if("input"===e||"change"===e)return Qn(t)}var lr="function"===typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e===1/t)||e!==e&&t!==t};function sr(e,t){if(lr(e,t))return!0;if("object"!==typeof e||null===e||"object"!==typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++){var i=n[r];if(!f.call(t,i)||!lr(e[i],t[i]))return!1}return!0}function ur(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function cr(e,t){var n,r=ur(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=ur(r)}}function fr(e,t){return!(!e||!t)&&(e===t||(!e||3!==e.nodeType)&&(t&&3===t.nodeType?fr(e,t.parentNode):"contains"in e?e.contains(t):!!e.compareDocumentPosition&&!!(16&e.compareDocumentPosition(t))))}function dr(){for(var e=window,t=q();t instanceof e.HTMLIFrameElement;){try{var n="string"===typeof t.contentWindow.location.href}catch(r){n=!1}if(!n)break;t=q((e=t.contentWindow).document)}return t}function hr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}function pr(e){var t=dr(),n=e.focusedElem,r=e.selectionRange;if(t!==n&&n&&n.ownerDocument&&fr(n.ownerDocument.documentElement,n)){if(null!==r&&hr(n))if(t=r.start,void 0===(e=r.end)&&(e=t),"selectionStart"in n)n.selectionStart=t,n.selectionEnd=Math.min(e,n.value.length);else if((e=(t=n.ownerDocument||document)&&t.defaultView||window).getSelection){e=e.getSelection();var i=n.textContent.length,o=Math.min(r.start,i);r=void 0===r.end?o:Math.min(r.end,i),!e.extend&&o>r&&(i=r,r=o,o=i),i=cr(n,o);var a=cr(n,r);i&&a&&(1!==e.rangeCount||e.anchorNode!==i.node||e.anchorOffset!==i.offset||e.focusNode!==a.node||e.focusOffset!==a.offset)&&((t=t.createRange()).setStart(i.node,i.offset),e.removeAllRanges(),o>r?(e.addRange(t),e.extend(a.node,a.offset)):(t.setEnd(a.node,a.offset),e.addRange(t)))}for(t=[],e=n;e=e.parentNode;)1===e.nodeType&&t.push({element:e,left:e.scrollLeft,top:e.scrollTop});for("function"===typeof n.focus&&n.focus(),n=0;n<t.length;n++)(e=t[n]).element.scrollLeft=e.left,e.element.scrollTop=e.top}}var yr=c&&"documentMode"in document&&11>=document.documentMode,mr=null,gr=null,vr=null,br=!1;function wr(e,t,n){var r=n.window===n?n.document:9===n.nodeType?n:n.ownerDocument;br||null==mr||mr!==q(r)||("selectionStart"in(r=mr)&&hr(r)?r={start:r.selectionStart,end:r.selectionEnd}:r={anchorNode:(r=(r.ownerDocument&&r.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:r.anchorOffset,focusNode:r.focusNode,focusOffset:r.focusOffset},vr&&sr(vr,r)||(vr=r,0<(r=Wr(gr,"onSelect")).length&&(t=new cn("onSelect","select",null,t,n),e.push({event:t,listeners:r}),t.target=mr)))}function xr(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var Sr={animationend:xr("Animation","AnimationEnd"),animationiteration:xr("Animation","AnimationIteration"),animationstart:xr("Animation","AnimationStart"),transitionend:xr("Transition","TransitionEnd")},_r={},kr={};function Tr(e){if(_r[e])return _r[e];if(!Sr[e])return e;var t,n=Sr[e];for(t in n)if(n.hasOwnProperty(t)&&t in kr)return _r[e]=n[t];return e}c&&(kr=document.createElement("div").style,"AnimationEvent"in window||(delete Sr.animationend.animation,delete Sr.animationiteration.animation,delete Sr.animationstart.animation),"TransitionEvent"in window||delete Sr.transitionend.transition);var Er=Tr("animationend"),Cr=Tr("animationiteration"),Ir=Tr("animationstart"),Mr=Tr("transitionend"),Nr=new Map,Ar="abort auxClick cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");function Or(e,t){Nr.set(e,t),s(t,[e])}for(var zr=0;zr<Ar.length;zr++){var Dr=Ar[zr];Or(Dr.toLowerCase(),"on"+(Dr[0].toUpperCase()+Dr.slice(1)))}Or(Er,"onAnimationEnd"),Or(Cr,"onAnimationIteration"),Or(Ir,"onAnimationStart"),Or("dblclick","onDoubleClick"),Or("focusin","onFocus"),Or("focusout","onBlur"),Or(Mr,"onTransitionEnd"),u("onMouseEnter",["mouseout","mouseover"]),u("onMouseLeave",["mouseout","mouseover"]),u("onPointerEnter",["pointerout","pointerover"]),u("onPointerLeave",["pointerout","pointerover"]),s("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),s("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),s("onBeforeInput",["compositionend","keypress","textInput","paste"]),s("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),s("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),s("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var $r="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Pr=new Set("cancel close invalid load scroll toggle".split(" ").concat($r));function Lr(e,t,n){var r=e.type||"unknown-event";e.currentTarget=n,function(e,t,n,r,i,a,l,s,u){if(Ue.apply(this,arguments),Pe){if(!Pe)throw Error(o(198));var c=Le;Pe=!1,Le=null,Be||(Be=!0,Fe=c)}}(r,t,void 0,e),e.currentTarget=null}function Br(e,t){t=0!==(4&t);for(var n=0;n<e.length;n++){var r=e[n],i=r.event;r=r.listeners;e:{var o=void 0;if(t)for(var a=r.length-1;0<=a;a--){var l=r[a],s=l.instance,u=l.currentTarget;if(l=l.listener,s!==o&&i.isPropagationStopped())break e;Lr(i,l,u),o=s}else for(a=0;a<r.length;a++){if(s=(l=r[a]).instance,u=l.currentTarget,l=l.listener,s!==o&&i.isPropagationStopped())break e;Lr(i,l,u),o=s}}}if(Be)throw e=Fe,Be=!1,Fe=null,e}function Fr(e,t){var n=t[yi];void 0===n&&(n=t[yi]=new Set);var r=e+"__bubble";n.has(r)||(Vr(t,e,2,!1),n.add(r))}function Rr(e,t,n){var r=0;t&&(r|=4),Vr(n,e,r,t)}var Ur="_reactListening"+Math.random().toString(36).slice(2);function jr(e){if(!e[Ur]){e[Ur]=!0,a.forEach(function(t){"selectionchange"!==t&&(Pr.has(t)||Rr(t,!1,e),Rr(t,!0,e))});var t=9===e.nodeType?e:e.ownerDocument;null===t||t[Ur]||(t[Ur]=!0,Rr("selectionchange",!1,t))}}function Vr(e,t,n,r){switch(Gt(t)){case 1:var i=Yt;break;case 4:i=Wt;break;default:i=Xt}n=i.bind(null,t,n,e),i=void 0,!ze||"touchstart"!==t&&"touchmove"!==t&&"wheel"!==t||(i=!0),r?void 0!==i?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):void 0!==i?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Hr(e,t,n,r,i){var o=r;if(0===(1&t)&&0===(2&t)&&null!==r)e:for(;;){if(null===r)return;var a=r.tag;if(3===a||4===a){var l=r.stateNode.containerInfo;if(l===i||8===l.nodeType&&l.parentNode===i)break;if(4===a)for(a=r.return;null!==a;){var s=a.tag;if((3===s||4===s)&&((s=a.stateNode.containerInfo)===i||8===s.nodeType&&s.parentNode===i))return;a=a.return}for(;null!==l;){if(null===(a=vi(l)))return;if(5===(s=a.tag)||6===s){r=o=a;continue e}l=l.parentNode}}r=r.return}Ae(function(){var r=o,i=xe(n),a=[];e:{var l=Nr.get(e);if(void 0!==l){var s=cn,u=e;switch(e){case"keypress":if(0===tn(n))break e;case"keydown":case"keyup":s=Cn;break;case"focusin":u="focus",s=mn;break;case"focusout":u="blur",s=mn;break;case"beforeblur":case"afterblur":s=mn;break;case"click":if(2===n.button)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":s=pn;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":s=yn;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":s=Mn;break;case Er:case Cr:case Ir:s=gn;break;case Mr:s=Nn;break;case"scroll":s=dn;break;case"wheel":s=On;break;case"copy":case"cut":case"paste":s=bn;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":s=In}var c=0!==(4&t),f=!c&&"scroll"===e,d=c?null!==l?l+"Capture":null:l;c=[];for(var h,p=r;null!==p;){var y=(h=p).stateNode;if(5===h.tag&&null!==y&&(h=y,null!==d&&(null!=(y=Oe(p,d))&&c.push(Yr(p,y,h)))),f)break;p=p.return}0<c.length&&(l=new s(l,u,null,n,i),a.push({event:l,listeners:c}))}}if(0===(7&t)){if(s="mouseout"===e||"pointerout"===e,(!(l="mouseover"===e||"pointerover"===e)||n===we||!(u=n.relatedTarget||n.fromElement)||!vi(u)&&!u[pi])&&(s||l)&&(l=i.window===i?i:(l=i.ownerDocument)?l.defaultView||l.parentWindow:window,s?(s=r,null!==(u=(u=n.relatedTarget||n.toElement)?vi(u):null)&&(u!==(f=je(u))||5!==u.tag&&6!==u.tag)&&(u=null)):(s=null,u=r),s!==u)){if(c=pn,y="onMouseLeave",d="onMouseEnter",p="mouse","pointerout"!==e&&"pointerover"!==e||(c=In,y="onPointerLeave",d="onPointerEnter",p="pointer"),f=null==s?l:wi(s),h=null==u?l:wi(u),(l=new c(y,p+"leave",s,n,i)).target=f,l.relatedTarget=h,y=null,vi(i)===r&&((c=new c(d,p+"enter",u,n,i)).target=h,c.relatedTarget=f,y=c),f=y,s&&u)e:{for(d=u,p=0,h=c=s;h;h=Xr(h))p++;for(h=0,y=d;y;y=Xr(y))h++;for(;0<p-h;)c=Xr(c),p--;for(;0<h-p;)d=Xr(d),h--;for(;p--;){if(c===d||null!==d&&c===d.alternate)break e;c=Xr(c),d=Xr(d)}c=null}else c=null;null!==s&&qr(a,l,s,c,!1),null!==u&&null!==f&&qr(a,f,u,c,!0)}if("select"===(s=(l=r?wi(r):window).nodeName&&l.nodeName.toLowerCase())||"input"===s&&"file"===l.type)var m=Gn;else if(Hn(l))if(Jn)m=ar;else{m=ir;var g=rr}else(s=l.nodeName)&&"input"===s.toLowerCase()&&("checkbox"===l.type||"radio"===l.type)&&(m=or);switch(m&&(m=m(e,r))?Yn(a,m,n,i):(g&&g(e,l,r),"focusout"===e&&(g=l._wrapperState)&&g.controlled&&"number"===l.type&&ee(l,"number",l.value)),g=r?wi(r):window,e){case"focusin":(Hn(g)||"true"===g.contentEditable)&&(mr=g,gr=r,vr=null);break;case"focusout":vr=gr=mr=null;break;case"mousedown":br=!0;break;case"contextmenu":case"mouseup":case"dragend":br=!1,wr(a,n,i);break;case"selectionchange":if(yr)break;case"keydown":case"keyup":wr(a,n,i)}var v;if(Dn)e:{switch(e){case"compositionstart":var b="onCompositionStart";break e;case"compositionend":b="onCompositionEnd";break e;case"compositionupdate":b="onCompositionUpdate";break e}b=void 0}else jn?Rn(e,n)&&(b="onCompositionEnd"):"keydown"===e&&229===n.keyCode&&(b="onCompositionStart");b&&(Ln&&"ko"!==n.locale&&(jn||"onCompositionStart"!==b?"onCompositionEnd"===b&&jn&&(v=en()):(Kt="value"in(Jt=i)?Jt.value:Jt.textContent,jn=!0)),0<(g=Wr(r,b)).length&&(b=new wn(b,e,null,n,i),a.push({event:b,listeners:g}),v?b.data=v:null!==(v=Un(n))&&(b.data=v))),(v=Pn?function(e,t){switch(e){case"compositionend":return Un(t);case"keypress":return 32!==t.which?null:(Fn=!0,Bn);case"textInput":return(e=t.data)===Bn&&Fn?null:e;default:return null}}(e,n):function(e,t){if(jn)return"compositionend"===e||!Dn&&Rn(e,t)?(e=en(),Zt=Kt=Jt=null,jn=!1,e):null;switch(e){case"paste":default:return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Ln&&"ko"!==t.locale?null:t.data}}(e,n))&&(0<(r=Wr(r,"onBeforeInput")).length&&(i=new wn("onBeforeInput","beforeinput",null,n,i),a.push({event:i,listeners:r}),i.data=v))}Br(a,t)})}function Yr(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Wr(e,t){for(var n=t+"Capture",r=[];null!==e;){var i=e,o=i.stateNode;5===i.tag&&null!==o&&(i=o,null!=(o=Oe(e,n))&&r.unshift(Yr(e,o,i)),null!=(o=Oe(e,t))&&r.push(Yr(e,o,i))),e=e.return}return r}function Xr(e){if(null===e)return null;do{e=e.return}while(e&&5!==e.tag);return e||null}function qr(e,t,n,r,i){for(var o=t._reactName,a=[];null!==n&&n!==r;){var l=n,s=l.alternate,u=l.stateNode;if(null!==s&&s===r)break;5===l.tag&&null!==u&&(l=u,i?null!=(s=Oe(n,o))&&a.unshift(Yr(n,s,l)):i||null!=(s=Oe(n,o))&&a.push(Yr(n,s,l))),n=n.return}0!==a.length&&e.push({event:t,listeners:a})}var Qr=/\r\n?/g,Gr=/\u0000|\uFFFD/g;function Jr(e){return("string"===typeof e?e:""+e).replace(Qr,"\n").replace(Gr,"")}function Kr(e,t,n){if(t=Jr(t),Jr(e)!==t&&n)throw Error(o(425))}function Zr(){}var ei=null,ti=null;function ni(e,t){return"textarea"===e||"noscript"===e||"string"===typeof t.children||"number"===typeof t.children||"object"===typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var ri="function"===typeof setTimeout?setTimeout:void 0,ii="function"===typeof clearTimeout?clearTimeout:void 0,oi="function"===typeof Promise?Promise:void 0,ai="function"===typeof queueMicrotask?queueMicrotask:"undefined"!==typeof oi?function(e){return oi.resolve(null).then(e).catch(li)}:ri;function li(e){setTimeout(function(){throw e})}function si(e,t){var n=t,r=0;do{var i=n.nextSibling;if(e.removeChild(n),i&&8===i.nodeType)if("/$"===(n=i.data)){if(0===r)return e.removeChild(i),void jt(t);r--}else"$"!==n&&"$?"!==n&&"$!"!==n||r++;n=i}while(n);jt(t)}function ui(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break;if(8===t){if("$"===(t=e.data)||"$!"===t||"$?"===t)break;if("/$"===t)return null}}return e}function ci(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var fi=Math.random().toString(36).slice(2),di="__reactFiber$"+fi,hi="__reactProps$"+fi,pi="__reactContainer$"+fi,yi="__reactEvents$"+fi,mi="__reactListeners$"+fi,gi="__reactHandles$"+fi;function vi(e){var t=e[di];if(t)return t;for(var n=e.parentNode;n;){if(t=n[pi]||n[di]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=ci(e);null!==e;){if(n=e[di])return n;e=ci(e)}return t}n=(e=n).parentNode}return null}function bi(e){return!(e=e[di]||e[pi])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function wi(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(o(33))}function xi(e){return e[hi]||null}var Si=[],_i=-1;function ki(e){return{current:e}}function Ti(e){0>_i||(e.current=Si[_i],Si[_i]=null,_i--)}function Ei(e,t){_i++,Si[_i]=e.current,e.current=t}var Ci={},Ii=ki(Ci),Mi=ki(!1),Ni=Ci;function Ai(e,t){var n=e.type.contextTypes;if(!n)return Ci;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var i,o={};for(i in n)o[i]=t[i];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=o),o}function Oi(e){return null!==(e=e.childContextTypes)&&void 0!==e}function zi(){Ti(Mi),Ti(Ii)}function Di(e,t,n){if(Ii.current!==Ci)throw Error(o(168));Ei(Ii,t),Ei(Mi,n)}function $i(e,t,n){var r=e.stateNode;if(t=t.childContextTypes,"function"!==typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in t))throw Error(o(108,V(e)||"Unknown",i));return L({},n,r)}function Pi(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||Ci,Ni=Ii.current,Ei(Ii,e),Ei(Mi,Mi.current),!0}function Li(e,t,n){var r=e.stateNode;if(!r)throw Error(o(169));n?(e=$i(e,t,Ni),r.__reactInternalMemoizedMergedChildContext=e,Ti(Mi),Ti(Ii),Ei(Ii,e)):Ti(Mi),Ei(Mi,n)}var Bi=null,Fi=!1,Ri=!1;function Ui(e){null===Bi?Bi=[e]:Bi.push(e)}function ji(){if(!Ri&&null!==Bi){Ri=!0;var e=0,t=bt;try{var n=Bi;for(bt=1;e<n.length;e++){var r=n[e];do{r=r(!0)}while(null!==r)}Bi=null,Fi=!1}catch(i){throw null!==Bi&&(Bi=Bi.slice(e+1)),Xe(Ze,ji),i}finally{bt=t,Ri=!1}}return null}var Vi=[],Hi=0,Yi=null,Wi=0,Xi=[],qi=0,Qi=null,Gi=1,Ji="";function Ki(e,t){Vi[Hi++]=Wi,Vi[Hi++]=Yi,Yi=e,Wi=t}function Zi(e,t,n){Xi[qi++]=Gi,Xi[qi++]=Ji,Xi[qi++]=Qi,Qi=e;var r=Gi;e=Ji;var i=32-at(r)-1;r&=~(1<<i),n+=1;var o=32-at(t)+i;if(30<o){var a=i-i%5;o=(r&(1<<a)-1).toString(32),r>>=a,i-=a,Gi=1<<32-at(t)+i|n<<i|r,Ji=o+e}else Gi=1<<o|n<<i|r,Ji=e}function eo(e){null!==e.return&&(Ki(e,1),Zi(e,1,0))}function to(e){for(;e===Yi;)Yi=Vi[--Hi],Vi[Hi]=null,Wi=Vi[--Hi],Vi[Hi]=null;for(;e===Qi;)Qi=Xi[--qi],Xi[qi]=null,Ji=Xi[--qi],Xi[qi]=null,Gi=Xi[--qi],Xi[qi]=null}var no=null,ro=null,io=!1,oo=null;function ao(e,t){var n=Au(5,null,null,0);n.elementType="DELETED",n.stateNode=t,n.return=e,null===(t=e.deletions)?(e.deletions=[n],e.flags|=16):t.push(n)}function lo(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,no=e,ro=ui(t.firstChild),!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,no=e,ro=null,!0);case 13:return null!==(t=8!==t.nodeType?null:t)&&(n=null!==Qi?{id:Gi,overflow:Ji}:null,e.memoizedState={dehydrated:t,treeContext:n,retryLane:1073741824},(n=Au(18,null,null,0)).stateNode=t,n.return=e,e.child=n,no=e,ro=null,!0);default:return!1}}function so(e){return 0!==(1&e.mode)&&0===(128&e.flags)}function uo(e){if(io){var t=ro;if(t){var n=t;if(!lo(e,t)){if(so(e))throw Error(o(418));t=ui(n.nextSibling);var r=no;t&&lo(e,t)?ao(r,n):(e.flags=-4097&e.flags|2,io=!1,no=e)}}else{if(so(e))throw Error(o(418));e.flags=-4097&e.flags|2,io=!1,no=e}}}function co(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;no=e}function fo(e){if(e!==no)return!1;if(!io)return co(e),io=!0,!1;var t;if((t=3!==e.tag)&&!(t=5!==e.tag)&&(t="head"!==(t=e.type)&&"body"!==t&&!ni(e.type,e.memoizedProps)),t&&(t=ro)){if(so(e))throw ho(),Error(o(418));for(;t;)ao(e,t),t=ui(t.nextSibling)}if(co(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(o(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){ro=ui(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}ro=null}}else ro=no?ui(e.stateNode.nextSibling):null;return!0}function ho(){for(var e=ro;e;)e=ui(e.nextSibling)}function po(){ro=no=null,io=!1}function yo(e){null===oo?oo=[e]:oo.push(e)}var mo=w.ReactCurrentBatchConfig;function go(e,t,n){if(null!==(e=n.ref)&&"function"!==typeof e&&"object"!==typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(o(309));var r=n.stateNode}if(!r)throw Error(o(147,e));var i=r,a=""+e;return null!==t&&null!==t.ref&&"function"===typeof t.ref&&t.ref._stringRef===a?t.ref:(t=function(e){var t=i.refs;null===e?delete t[a]:t[a]=e},t._stringRef=a,t)}if("string"!==typeof e)throw Error(o(284));if(!n._owner)throw Error(o(290,e))}return e}function vo(e,t){throw e=Object.prototype.toString.call(t),Error(o(31,"[object Object]"===e?"object with keys {"+Object.keys(t).join(", ")+"}":e))}function bo(e){return(0,e._init)(e._payload)}function wo(e){function t(t,n){if(e){var r=t.deletions;null===r?(t.deletions=[n],t.flags|=16):r.push(n)}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function i(e,t){return(e=zu(e,t)).index=0,e.sibling=null,e}function a(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.flags|=2,n):r:(t.flags|=2,n):(t.flags|=1048576,n)}function l(t){return e&&null===t.alternate&&(t.flags|=2),t}function s(e,t,n,r){return null===t||6!==t.tag?((t=Lu(n,e.mode,r)).return=e,t):((t=i(t,n)).return=e,t)}function u(e,t,n,r){var o=n.type;return o===_?f(e,t,n.props.children,r,n.key):null!==t&&(t.elementType===o||"object"===typeof o&&null!==o&&o.$$typeof===O&&bo(o)===t.type)?((r=i(t,n.props)).ref=go(e,t,n),r.return=e,r):((r=Du(n.type,n.key,n.props,null,e.mode,r)).ref=go(e,t,n),r.return=e,r)}function c(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Bu(n,e.mode,r)).return=e,t):((t=i(t,n.children||[])).return=e,t)}function f(e,t,n,r,o){return null===t||7!==t.tag?((t=$u(n,e.mode,r,o)).return=e,t):((t=i(t,n)).return=e,t)}function d(e,t,n){if("string"===typeof t&&""!==t||"number"===typeof t)return(t=Lu(""+t,e.mode,n)).return=e,t;if("object"===typeof t&&null!==t){switch(t.$$typeof){case x:return(n=Du(t.type,t.key,t.props,null,e.mode,n)).ref=go(e,null,t),n.return=e,n;case S:return(t=Bu(t,e.mode,n)).return=e,t;case O:return d(e,(0,t._init)(t._payload),n)}if(te(t)||$(t))return(t=$u(t,e.mode,n,null)).return=e,t;vo(e,t)}return null}function h(e,t,n,r){var i=null!==t?t.key:null;if("string"===typeof n&&""!==n||"number"===typeof n)return null!==i?null:s(e,t,""+n,r);if("object"===typeof n&&null!==n){switch(n.$$typeof){case x:return n.key===i?u(e,t,n,r):null;case S:return n.key===i?c(e,t,n,r):null;case O:return h(e,t,(i=n._init)(n._payload),r)}if(te(n)||$(n))return null!==i?null:f(e,t,n,r,null);vo(e,n)}return null}function p(e,t,n,r,i){if("string"===typeof r&&""!==r||"number"===typeof r)return s(t,e=e.get(n)||null,""+r,i);if("object"===typeof r&&null!==r){switch(r.$$typeof){case x:return u(t,e=e.get(null===r.key?n:r.key)||null,r,i);case S:return c(t,e=e.get(null===r.key?n:r.key)||null,r,i);case O:return p(e,t,n,(0,r._init)(r._payload),i)}if(te(r)||$(r))return f(t,e=e.get(n)||null,r,i,null);vo(t,r)}return null}function y(i,o,l,s){for(var u=null,c=null,f=o,y=o=0,m=null;null!==f&&y<l.length;y++){f.index>y?(m=f,f=null):m=f.sibling;var g=h(i,f,l[y],s);if(null===g){null===f&&(f=m);break}e&&f&&null===g.alternate&&t(i,f),o=a(g,o,y),null===c?u=g:c.sibling=g,c=g,f=m}if(y===l.length)return n(i,f),io&&Ki(i,y),u;if(null===f){for(;y<l.length;y++)null!==(f=d(i,l[y],s))&&(o=a(f,o,y),null===c?u=f:c.sibling=f,c=f);return io&&Ki(i,y),u}for(f=r(i,f);y<l.length;y++)null!==(m=p(f,i,y,l[y],s))&&(e&&null!==m.alternate&&f.delete(null===m.key?y:m.key),o=a(m,o,y),null===c?u=m:c.sibling=m,c=m);return e&&f.forEach(function(e){return t(i,e)}),io&&Ki(i,y),u}function m(i,l,s,u){var c=$(s);if("function"!==typeof c)throw Error(o(150));if(null==(s=c.call(s)))throw Error(o(151));for(var f=c=null,y=l,m=l=0,g=null,v=s.next();null!==y&&!v.done;m++,v=s.next()){y.index>m?(g=y,y=null):g=y.sibling;var b=h(i,y,v.value,u);if(null===b){null===y&&(y=g);break}e&&y&&null===b.alternate&&t(i,y),l=a(b,l,m),null===f?c=b:f.sibling=b,f=b,y=g}if(v.done)return n(i,y),io&&Ki(i,m),c;if(null===y){for(;!v.done;m++,v=s.next())null!==(v=d(i,v.value,u))&&(l=a(v,l,m),null===f?c=v:f.sibling=v,f=v);return io&&Ki(i,m),c}for(y=r(i,y);!v.done;m++,v=s.next())null!==(v=p(y,i,m,v.value,u))&&(e&&null!==v.alternate&&y.delete(null===v.key?m:v.key),l=a(v,l,m),null===f?c=v:f.sibling=v,f=v);return e&&y.forEach(function(e){return t(i,e)}),io&&Ki(i,m),c}return function e(r,o,a,s){if("object"===typeof a&&null!==a&&a.type===_&&null===a.key&&(a=a.props.children),"object"===typeof a&&null!==a){switch(a.$$typeof){case x:e:{for(var u=a.key,c=o;null!==c;){if(c.key===u){if((u=a.type)===_){if(7===c.tag){n(r,c.sibling),(o=i(c,a.props.children)).return=r,r=o;break e}}else if(c.elementType===u||"object"===typeof u&&null!==u&&u.$$typeof===O&&bo(u)===c.type){n(r,c.sibling),(o=i(c,a.props)).ref=go(r,c,a),o.return=r,r=o;break e}n(r,c);break}t(r,c),c=c.sibling}a.type===_?((o=$u(a.props.children,r.mode,s,a.key)).return=r,r=o):((s=Du(a.type,a.key,a.props,null,r.mode,s)).ref=go(r,o,a),s.return=r,r=s)}return l(r);case S:e:{for(c=a.key;null!==o;){if(o.key===c){if(4===o.tag&&o.stateNode.containerInfo===a.containerInfo&&o.stateNode.implementation===a.implementation){n(r,o.sibling),(o=i(o,a.children||[])).return=r,r=o;break e}n(r,o);break}t(r,o),o=o.sibling}(o=Bu(a,r.mode,s)).return=r,r=o}return l(r);case O:return e(r,o,(c=a._init)(a._payload),s)}if(te(a))return y(r,o,a,s);if($(a))return m(r,o,a,s);vo(r,a)}return"string"===typeof a&&""!==a||"number"===typeof a?(a=""+a,null!==o&&6===o.tag?(n(r,o.sibling),(o=i(o,a)).return=r,r=o):(n(r,o),(o=Lu(a,r.mode,s)).return=r,r=o),l(r)):n(r,o)}}var xo=wo(!0),So=wo(!1),_o=ki(null),ko=null,To=null,Eo=null;function Co(){Eo=To=ko=null}function Io(e){var t=_o.current;Ti(_o),e._currentValue=t}function Mo(e,t,n){for(;null!==e;){var r=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,null!==r&&(r.childLanes|=t)):null!==r&&(r.childLanes&t)!==t&&(r.childLanes|=t),e===n)break;e=e.return}}function No(e,t){ko=e,Eo=To=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(0!==(e.lanes&t)&&(bl=!0),e.firstContext=null)}function Ao(e){var t=e._currentValue;if(Eo!==e)if(e={context:e,memoizedValue:t,next:null},null===To){if(null===ko)throw Error(o(308));To=e,ko.dependencies={lanes:0,firstContext:e}}else To=To.next=e;return t}var Oo=null;function zo(e){null===Oo?Oo=[e]:Oo.push(e)}function Do(e,t,n,r){var i=t.interleaved;return null===i?(n.next=n,zo(t)):(n.next=i.next,i.next=n),t.interleaved=n,$o(e,r)}function $o(e,t){e.lanes|=t;var n=e.alternate;for(null!==n&&(n.lanes|=t),n=e,e=e.return;null!==e;)e.childLanes|=t,null!==(n=e.alternate)&&(n.childLanes|=t),n=e,e=e.return;return 3===n.tag?n.stateNode:null}var Po=!1;function Lo(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,interleaved:null,lanes:0},effects:null}}function Bo(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,effects:e.effects})}function Fo(e,t){return{eventTime:e,lane:t,tag:0,payload:null,callback:null,next:null}}function Ro(e,t,n){var r=e.updateQueue;if(null===r)return null;if(r=r.shared,0!==(2&Is)){var i=r.pending;return null===i?t.next=t:(t.next=i.next,i.next=t),r.pending=t,$o(e,n)}return null===(i=r.interleaved)?(t.next=t,zo(r)):(t.next=i.next,i.next=t),r.interleaved=t,$o(e,n)}function Uo(e,t,n){if(null!==(t=t.updateQueue)&&(t=t.shared,0!==(4194240&n))){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,vt(e,n)}}function jo(e,t){var n=e.updateQueue,r=e.alternate;if(null!==r&&n===(r=r.updateQueue)){var i=null,o=null;if(null!==(n=n.firstBaseUpdate)){do{var a={eventTime:n.eventTime,lane:n.lane,tag:n.tag,payload:n.payload,callback:n.callback,next:null};null===o?i=o=a:o=o.next=a,n=n.next}while(null!==n);null===o?i=o=t:o=o.next=t}else i=o=t;return n={baseState:r.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:r.shared,effects:r.effects},void(e.updateQueue=n)}null===(e=n.lastBaseUpdate)?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}function Vo(e,t,n,r){var i=e.updateQueue;Po=!1;var o=i.firstBaseUpdate,a=i.lastBaseUpdate,l=i.shared.pending;if(null!==l){i.shared.pending=null;var s=l,u=s.next;s.next=null,null===a?o=u:a.next=u,a=s;var c=e.alternate;null!==c&&((l=(c=c.updateQueue).lastBaseUpdate)!==a&&(null===l?c.firstBaseUpdate=u:l.next=u,c.lastBaseUpdate=s))}if(null!==o){var f=i.baseState;for(a=0,c=u=s=null,l=o;;){var d=l.lane,h=l.eventTime;if((r&d)===d){null!==c&&(c=c.next={eventTime:h,lane:0,tag:l.tag,payload:l.payload,callback:l.callback,next:null});e:{var p=e,y=l;switch(d=t,h=n,y.tag){case 1:if("function"===typeof(p=y.payload)){f=p.call(h,f,d);break e}f=p;break e;case 3:p.flags=-65537&p.flags|128;case 0:if(null===(d="function"===typeof(p=y.payload)?p.call(h,f,d):p)||void 0===d)break e;f=L({},f,d);break e;case 2:Po=!0}}null!==l.callback&&0!==l.lane&&(e.flags|=64,null===(d=i.effects)?i.effects=[l]:d.push(l))}else h={eventTime:h,lane:d,tag:l.tag,payload:l.payload,callback:l.callback,next:null},null===c?(u=c=h,s=f):c=c.next=h,a|=d;if(null===(l=l.next)){if(null===(l=i.shared.pending))break;l=(d=l).next,d.next=null,i.lastBaseUpdate=d,i.shared.pending=null}}if(null===c&&(s=f),i.baseState=s,i.firstBaseUpdate=u,i.lastBaseUpdate=c,null!==(t=i.shared.interleaved)){i=t;do{a|=i.lane,i=i.next}while(i!==t)}else null===o&&(i.shared.lanes=0);Ps|=a,e.lanes=a,e.memoizedState=f}}function Ho(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],i=r.callback;if(null!==i){if(r.callback=null,r=n,"function"!==typeof i)throw Error(o(191,i));i.call(r)}}}var Yo={},Wo=ki(Yo),Xo=ki(Yo),qo=ki(Yo);function Qo(e){if(e===Yo)throw Error(o(174));return e}function Go(e,t){switch(Ei(qo,t),Ei(Xo,e),Ei(Wo,Yo),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:se(null,"");break;default:t=se(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}Ti(Wo),Ei(Wo,t)}function Jo(){Ti(Wo),Ti(Xo),Ti(qo)}function Ko(e){Qo(qo.current);var t=Qo(Wo.current),n=se(t,e.type);t!==n&&(Ei(Xo,e),Ei(Wo,n))}function Zo(e){Xo.current===e&&(Ti(Wo),Ti(Xo))}var ea=ki(0);function ta(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!==(128&t.flags))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}var na=[];function ra(){for(var e=0;e<na.length;e++)na[e]._workInProgressVersionPrimary=null;na.length=0}var ia=w.ReactCurrentDispatcher,oa=w.ReactCurrentBatchConfig,aa=0,la=null,sa=null,ua=null,ca=!1,fa=!1,da=0,ha=0;function pa(){throw Error(o(321))}function ya(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!lr(e[n],t[n]))return!1;return!0}function ma(e,t,n,r,i,a){if(aa=a,la=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,ia.current=null===e||null===e.memoizedState?Za:el,e=n(r,i),fa){a=0;do{if(fa=!1,da=0,25<=a)throw Error(o(301));a+=1,ua=sa=null,t.updateQueue=null,ia.current=tl,e=n(r,i)}while(fa)}if(ia.current=Ka,t=null!==sa&&null!==sa.next,aa=0,ua=sa=la=null,ca=!1,t)throw Error(o(300));return e}function ga(){var e=0!==da;return da=0,e}function va(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===ua?la.memoizedState=ua=e:ua=ua.next=e,ua}function ba(){if(null===sa){var e=la.alternate;e=null!==e?e.memoizedState:null}else e=sa.next;var t=null===ua?la.memoizedState:ua.next;if(null!==t)ua=t,sa=e;else{if(null===e)throw Error(o(310));e={memoizedState:(sa=e).memoizedState,baseState:sa.baseState,baseQueue:sa.baseQueue,queue:sa.queue,next:null},null===ua?la.memoizedState=ua=e:ua=ua.next=e}return ua}function wa(e,t){return"function"===typeof t?t(e):t}function xa(e){var t=ba(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=sa,i=r.baseQueue,a=n.pending;if(null!==a){if(null!==i){var l=i.next;i.next=a.next,a.next=l}r.baseQueue=i=a,n.pending=null}if(null!==i){a=i.next,r=r.baseState;var s=l=null,u=null,c=a;do{var f=c.lane;if((aa&f)===f)null!==u&&(u=u.next={lane:0,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null}),r=c.hasEagerState?c.eagerState:e(r,c.action);else{var d={lane:f,action:c.action,hasEagerState:c.hasEagerState,eagerState:c.eagerState,next:null};null===u?(s=u=d,l=r):u=u.next=d,la.lanes|=f,Ps|=f}c=c.next}while(null!==c&&c!==a);null===u?l=r:u.next=s,lr(r,t.memoizedState)||(bl=!0),t.memoizedState=r,t.baseState=l,t.baseQueue=u,n.lastRenderedState=r}if(null!==(e=n.interleaved)){i=e;do{a=i.lane,la.lanes|=a,Ps|=a,i=i.next}while(i!==e)}else null===i&&(n.lanes=0);return[t.memoizedState,n.dispatch]}function Sa(e){var t=ba(),n=t.queue;if(null===n)throw Error(o(311));n.lastRenderedReducer=e;var r=n.dispatch,i=n.pending,a=t.memoizedState;if(null!==i){n.pending=null;var l=i=i.next;do{a=e(a,l.action),l=l.next}while(l!==i);lr(a,t.memoizedState)||(bl=!0),t.memoizedState=a,null===t.baseQueue&&(t.baseState=a),n.lastRenderedState=a}return[a,r]}function _a(){}function ka(e,t){var n=la,r=ba(),i=t(),a=!lr(r.memoizedState,i);if(a&&(r.memoizedState=i,bl=!0),r=r.queue,Pa(Ca.bind(null,n,r,e),[e]),r.getSnapshot!==t||a||null!==ua&&1&ua.memoizedState.tag){if(n.flags|=2048,Aa(9,Ea.bind(null,n,r,i,t),void 0,null),null===Ms)throw Error(o(349));0!==(30&aa)||Ta(n,t,i)}return i}function Ta(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},null===(t=la.updateQueue)?(t={lastEffect:null,stores:null},la.updateQueue=t,t.stores=[e]):null===(n=t.stores)?t.stores=[e]:n.push(e)}function Ea(e,t,n,r){t.value=n,t.getSnapshot=r,Ia(t)&&Ma(e)}function Ca(e,t,n){return n(function(){Ia(t)&&Ma(e)})}function Ia(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!lr(e,n)}catch(r){return!0}}function Ma(e){var t=$o(e,1);null!==t&&nu(t,e,1,-1)}function Na(e){var t=va();return"function"===typeof e&&(e=e()),t.memoizedState=t.baseState=e,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:wa,lastRenderedState:e},t.queue=e,e=e.dispatch=qa.bind(null,la,e),[t.memoizedState,e]}function Aa(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=la.updateQueue)?(t={lastEffect:null,stores:null},la.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function Oa(){return ba().memoizedState}function za(e,t,n,r){var i=va();la.flags|=e,i.memoizedState=Aa(1|t,n,void 0,void 0===r?null:r)}function Da(e,t,n,r){var i=ba();r=void 0===r?null:r;var o=void 0;if(null!==sa){var a=sa.memoizedState;if(o=a.destroy,null!==r&&ya(r,a.deps))return void(i.memoizedState=Aa(t,n,o,r))}la.flags|=e,i.memoizedState=Aa(1|t,n,o,r)}function $a(e,t){return za(8390656,8,e,t)}function Pa(e,t){return Da(2048,8,e,t)}function La(e,t){return Da(4,2,e,t)}function Ba(e,t){return Da(4,4,e,t)}function Fa(e,t){return"function"===typeof t?(e=e(),t(e),function(){t(null)}):null!==t&&void 0!==t?(e=e(),t.current=e,function(){t.current=null}):void 0}function Ra(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,Da(4,4,Fa.bind(null,t,e),n)}function Ua(){}function ja(e,t){var n=ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ya(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function Va(e,t){var n=ba();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&ya(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function Ha(e,t,n){return 0===(21&aa)?(e.baseState&&(e.baseState=!1,bl=!0),e.memoizedState=n):(lr(n,t)||(n=yt(),la.lanes|=n,Ps|=n,e.baseState=!0),t)}function Ya(e,t){var n=bt;bt=0!==n&&4>n?n:4,e(!0);var r=oa.transition;oa.transition={};try{e(!1),t()}finally{bt=n,oa.transition=r}}function Wa(){return ba().memoizedState}function Xa(e,t,n){var r=tu(e);if(n={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null},Qa(e))Ga(t,n);else if(null!==(n=Do(e,t,n,r))){nu(n,e,r,eu()),Ja(n,t,r)}}function qa(e,t,n){var r=tu(e),i={lane:r,action:n,hasEagerState:!1,eagerState:null,next:null};if(Qa(e))Ga(t,i);else{var o=e.alternate;if(0===e.lanes&&(null===o||0===o.lanes)&&null!==(o=t.lastRenderedReducer))try{var a=t.lastRenderedState,l=o(a,n);if(i.hasEagerState=!0,i.eagerState=l,lr(l,a)){var s=t.interleaved;return null===s?(i.next=i,zo(t)):(i.next=s.next,s.next=i),void(t.interleaved=i)}}catch(u){}null!==(n=Do(e,t,i,r))&&(nu(n,e,r,i=eu()),Ja(n,t,r))}}function Qa(e){var t=e.alternate;return e===la||null!==t&&t===la}function Ga(e,t){fa=ca=!0;var n=e.pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Ja(e,t,n){if(0!==(4194240&n)){var r=t.lanes;n|=r&=e.pendingLanes,t.lanes=n,vt(e,n)}}var Ka={readContext:Ao,useCallback:pa,useContext:pa,useEffect:pa,useImperativeHandle:pa,useInsertionEffect:pa,useLayoutEffect:pa,useMemo:pa,useReducer:pa,useRef:pa,useState:pa,useDebugValue:pa,useDeferredValue:pa,useTransition:pa,useMutableSource:pa,useSyncExternalStore:pa,useId:pa,unstable_isNewReconciler:!1},Za={readContext:Ao,useCallback:function(e,t){return va().memoizedState=[e,void 0===t?null:t],e},useContext:Ao,useEffect:$a,useImperativeHandle:function(e,t,n){return n=null!==n&&void 0!==n?n.concat([e]):null,za(4194308,4,Fa.bind(null,t,e),n)},useLayoutEffect:function(e,t){return za(4194308,4,e,t)},useInsertionEffect:function(e,t){return za(4,2,e,t)},useMemo:function(e,t){var n=va();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=va();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e={pending:null,interleaved:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:t},r.queue=e,e=e.dispatch=Xa.bind(null,la,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},va().memoizedState=e},useState:Na,useDebugValue:Ua,useDeferredValue:function(e){return va().memoizedState=e},useTransition:function(){var e=Na(!1),t=e[0];return e=Ya.bind(null,e[1]),va().memoizedState=e,[t,e]},useMutableSource:function(){},useSyncExternalStore:function(e,t,n){var r=la,i=va();if(io){if(void 0===n)throw Error(o(407));n=n()}else{if(n=t(),null===Ms)throw Error(o(349));0!==(30&aa)||Ta(r,t,n)}i.memoizedState=n;var a={value:n,getSnapshot:t};return i.queue=a,$a(Ca.bind(null,r,a,e),[e]),r.flags|=2048,Aa(9,Ea.bind(null,r,a,n,t),void 0,null),n},useId:function(){var e=va(),t=Ms.identifierPrefix;if(io){var n=Ji;t=":"+t+"R"+(n=(Gi&~(1<<32-at(Gi)-1)).toString(32)+n),0<(n=da++)&&(t+="H"+n.toString(32)),t+=":"}else t=":"+t+"r"+(n=ha++).toString(32)+":";return e.memoizedState=t},unstable_isNewReconciler:!1},el={readContext:Ao,useCallback:ja,useContext:Ao,useEffect:Pa,useImperativeHandle:Ra,useInsertionEffect:La,useLayoutEffect:Ba,useMemo:Va,useReducer:xa,useRef:Oa,useState:function(){return xa(wa)},useDebugValue:Ua,useDeferredValue:function(e){return Ha(ba(),sa.memoizedState,e)},useTransition:function(){return[xa(wa)[0],ba().memoizedState]},useMutableSource:_a,useSyncExternalStore:ka,useId:Wa,unstable_isNewReconciler:!1},tl={readContext:Ao,useCallback:ja,useContext:Ao,useEffect:Pa,useImperativeHandle:Ra,useInsertionEffect:La,useLayoutEffect:Ba,useMemo:Va,useReducer:Sa,useRef:Oa,useState:function(){return Sa(wa)},useDebugValue:Ua,useDeferredValue:function(e){var t=ba();return null===sa?t.memoizedState=e:Ha(t,sa.memoizedState,e)},useTransition:function(){return[Sa(wa)[0],ba().memoizedState]},useMutableSource:_a,useSyncExternalStore:ka,useId:Wa,unstable_isNewReconciler:!1};function nl(e,t){if(e&&e.defaultProps){for(var n in t=L({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}return t}function rl(e,t,n,r){n=null===(n=n(r,t=e.memoizedState))||void 0===n?t:L({},t,n),e.memoizedState=n,0===e.lanes&&(e.updateQueue.baseState=n)}var il={isMounted:function(e){return!!(e=e._reactInternals)&&je(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternals;var r=eu(),i=tu(e),o=Fo(r,i);o.payload=t,void 0!==n&&null!==n&&(o.callback=n),null!==(t=Ro(e,o,i))&&(nu(t,e,i,r),Uo(t,e,i))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var r=eu(),i=tu(e),o=Fo(r,i);o.tag=1,o.payload=t,void 0!==n&&null!==n&&(o.callback=n),null!==(t=Ro(e,o,i))&&(nu(t,e,i,r),Uo(t,e,i))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=eu(),r=tu(e),i=Fo(n,r);i.tag=2,void 0!==t&&null!==t&&(i.callback=t),null!==(t=Ro(e,i,r))&&(nu(t,e,r,n),Uo(t,e,r))}};function ol(e,t,n,r,i,o,a){return"function"===typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,o,a):!t.prototype||!t.prototype.isPureReactComponent||(!sr(n,r)||!sr(i,o))}function al(e,t,n){var r=!1,i=Ci,o=t.contextType;return"object"===typeof o&&null!==o?o=Ao(o):(i=Oi(t)?Ni:Ii.current,o=(r=null!==(r=t.contextTypes)&&void 0!==r)?Ai(e,i):Ci),t=new t(n,o),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=il,e.stateNode=t,t._reactInternals=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=i,e.__reactInternalMemoizedMaskedChildContext=o),t}function ll(e,t,n,r){e=t.state,"function"===typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"===typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&il.enqueueReplaceState(t,t.state,null)}function sl(e,t,n,r){var i=e.stateNode;i.props=n,i.state=e.memoizedState,i.refs={},Lo(e);var o=t.contextType;"object"===typeof o&&null!==o?i.context=Ao(o):(o=Oi(t)?Ni:Ii.current,i.context=Ai(e,o)),i.state=e.memoizedState,"function"===typeof(o=t.getDerivedStateFromProps)&&(rl(e,t,o,n),i.state=e.memoizedState),"function"===typeof t.getDerivedStateFromProps||"function"===typeof i.getSnapshotBeforeUpdate||"function"!==typeof i.UNSAFE_componentWillMount&&"function"!==typeof i.componentWillMount||(t=i.state,"function"===typeof i.componentWillMount&&i.componentWillMount(),"function"===typeof i.UNSAFE_componentWillMount&&i.UNSAFE_componentWillMount(),t!==i.state&&il.enqueueReplaceState(i,i.state,null),Vo(e,n,i,r),i.state=e.memoizedState),"function"===typeof i.componentDidMount&&(e.flags|=4194308)}function ul(e,t){try{var n="",r=t;do{n+=U(r),r=r.return}while(r);var i=n}catch(o){i="\nError generating stack: "+o.message+"\n"+o.stack}return{value:e,source:t,stack:i,digest:null}}function cl(e,t,n){return{value:e,source:null,stack:null!=n?n:null,digest:null!=t?t:null}}function fl(e,t){try{console.error(t.value)}catch(n){setTimeout(function(){throw n})}}var dl="function"===typeof WeakMap?WeakMap:Map;function hl(e,t,n){(n=Fo(-1,n)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Hs||(Hs=!0,Ys=r),fl(0,t)},n}function pl(e,t,n){(n=Fo(-1,n)).tag=3;var r=e.type.getDerivedStateFromError;if("function"===typeof r){var i=t.value;n.payload=function(){return r(i)},n.callback=function(){fl(0,t)}}var o=e.stateNode;return null!==o&&"function"===typeof o.componentDidCatch&&(n.callback=function(){fl(0,t),"function"!==typeof r&&(null===Ws?Ws=new Set([this]):Ws.add(this));var e=t.stack;this.componentDidCatch(t.value,{componentStack:null!==e?e:""})}),n}function yl(e,t,n){var r=e.pingCache;if(null===r){r=e.pingCache=new dl;var i=new Set;r.set(t,i)}else void 0===(i=r.get(t))&&(i=new Set,r.set(t,i));i.has(n)||(i.add(n),e=Tu.bind(null,e,t,n),t.then(e,e))}function ml(e){do{var t;if((t=13===e.tag)&&(t=null===(t=e.memoizedState)||null!==t.dehydrated),t)return e;e=e.return}while(null!==e);return null}function gl(e,t,n,r,i){return 0===(1&e.mode)?(e===t?e.flags|=65536:(e.flags|=128,n.flags|=131072,n.flags&=-52805,1===n.tag&&(null===n.alternate?n.tag=17:((t=Fo(-1,1)).tag=2,Ro(n,t,1))),n.lanes|=1),e):(e.flags|=65536,e.lanes=i,e)}var vl=w.ReactCurrentOwner,bl=!1;function wl(e,t,n,r){t.child=null===e?So(t,null,n,r):xo(t,e.child,n,r)}function xl(e,t,n,r,i){n=n.render;var o=t.ref;return No(t,i),r=ma(e,t,n,r,o,i),n=ga(),null===e||bl?(io&&n&&eo(t),t.flags|=1,wl(e,t,r,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,Hl(e,t,i))}function Sl(e,t,n,r,i){if(null===e){var o=n.type;return"function"!==typeof o||Ou(o)||void 0!==o.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Du(n.type,null,r,t,t.mode,i)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=o,_l(e,t,o,r,i))}if(o=e.child,0===(e.lanes&i)){var a=o.memoizedProps;if((n=null!==(n=n.compare)?n:sr)(a,r)&&e.ref===t.ref)return Hl(e,t,i)}return t.flags|=1,(e=zu(o,r)).ref=t.ref,e.return=t,t.child=e}function _l(e,t,n,r,i){if(null!==e){var o=e.memoizedProps;if(sr(o,r)&&e.ref===t.ref){if(bl=!1,t.pendingProps=r=o,0===(e.lanes&i))return t.lanes=e.lanes,Hl(e,t,i);0!==(131072&e.flags)&&(bl=!0)}}return El(e,t,n,r,i)}function kl(e,t,n){var r=t.pendingProps,i=r.children,o=null!==e?e.memoizedState:null;if("hidden"===r.mode)if(0===(1&t.mode))t.memoizedState={baseLanes:0,cachePool:null,transitions:null},Ei(zs,Os),Os|=n;else{if(0===(1073741824&n))return e=null!==o?o.baseLanes|n:n,t.lanes=t.childLanes=1073741824,t.memoizedState={baseLanes:e,cachePool:null,transitions:null},t.updateQueue=null,Ei(zs,Os),Os|=e,null;t.memoizedState={baseLanes:0,cachePool:null,transitions:null},r=null!==o?o.baseLanes:n,Ei(zs,Os),Os|=r}else null!==o?(r=o.baseLanes|n,t.memoizedState=null):r=n,Ei(zs,Os),Os|=r;return wl(e,t,i,n),t.child}function Tl(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.flags|=512,t.flags|=2097152)}function El(e,t,n,r,i){var o=Oi(n)?Ni:Ii.current;return o=Ai(t,o),No(t,i),n=ma(e,t,n,r,o,i),r=ga(),null===e||bl?(io&&r&&eo(t),t.flags|=1,wl(e,t,n,i),t.child):(t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~i,Hl(e,t,i))}function Cl(e,t,n,r,i){if(Oi(n)){var o=!0;Pi(t)}else o=!1;if(No(t,i),null===t.stateNode)Vl(e,t),al(t,n,r),sl(t,n,r,i),r=!0;else if(null===e){var a=t.stateNode,l=t.memoizedProps;a.props=l;var s=a.context,u=n.contextType;"object"===typeof u&&null!==u?u=Ao(u):u=Ai(t,u=Oi(n)?Ni:Ii.current);var c=n.getDerivedStateFromProps,f="function"===typeof c||"function"===typeof a.getSnapshotBeforeUpdate;f||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l!==r||s!==u)&&ll(t,a,r,u),Po=!1;var d=t.memoizedState;a.state=d,Vo(t,r,a,i),s=t.memoizedState,l!==r||d!==s||Mi.current||Po?("function"===typeof c&&(rl(t,n,c,r),s=t.memoizedState),(l=Po||ol(t,n,l,r,d,s,u))?(f||"function"!==typeof a.UNSAFE_componentWillMount&&"function"!==typeof a.componentWillMount||("function"===typeof a.componentWillMount&&a.componentWillMount(),"function"===typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"===typeof a.componentDidMount&&(t.flags|=4194308)):("function"===typeof a.componentDidMount&&(t.flags|=4194308),t.memoizedProps=r,t.memoizedState=s),a.props=r,a.state=s,a.context=u,r=l):("function"===typeof a.componentDidMount&&(t.flags|=4194308),r=!1)}else{a=t.stateNode,Bo(e,t),l=t.memoizedProps,u=t.type===t.elementType?l:nl(t.type,l),a.props=u,f=t.pendingProps,d=a.context,"object"===typeof(s=n.contextType)&&null!==s?s=Ao(s):s=Ai(t,s=Oi(n)?Ni:Ii.current);var h=n.getDerivedStateFromProps;(c="function"===typeof h||"function"===typeof a.getSnapshotBeforeUpdate)||"function"!==typeof a.UNSAFE_componentWillReceiveProps&&"function"!==typeof a.componentWillReceiveProps||(l!==f||d!==s)&&ll(t,a,r,s),Po=!1,d=t.memoizedState,a.state=d,Vo(t,r,a,i);var p=t.memoizedState;l!==f||d!==p||Mi.current||Po?("function"===typeof h&&(rl(t,n,h,r),p=t.memoizedState),(u=Po||ol(t,n,u,r,d,p,s)||!1)?(c||"function"!==typeof a.UNSAFE_componentWillUpdate&&"function"!==typeof a.componentWillUpdate||("function"===typeof a.componentWillUpdate&&a.componentWillUpdate(r,p,s),"function"===typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,p,s)),"function"===typeof a.componentDidUpdate&&(t.flags|=4),"function"===typeof a.getSnapshotBeforeUpdate&&(t.flags|=1024)):("function"!==typeof a.componentDidUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),t.memoizedProps=r,t.memoizedState=p),a.props=r,a.state=p,a.context=s,r=u):("function"!==typeof a.componentDidUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=4),"function"!==typeof a.getSnapshotBeforeUpdate||l===e.memoizedProps&&d===e.memoizedState||(t.flags|=1024),r=!1)}return Il(e,t,n,r,o,i)}function Il(e,t,n,r,i,o){Tl(e,t);var a=0!==(128&t.flags);if(!r&&!a)return i&&Li(t,n,!1),Hl(e,t,o);r=t.stateNode,vl.current=t;var l=a&&"function"!==typeof n.getDerivedStateFromError?null:r.render();return t.flags|=1,null!==e&&a?(t.child=xo(t,e.child,null,o),t.child=xo(t,null,l,o)):wl(e,t,l,o),t.memoizedState=r.state,i&&Li(t,n,!0),t.child}function Ml(e){var t=e.stateNode;t.pendingContext?Di(0,t.pendingContext,t.pendingContext!==t.context):t.context&&Di(0,t.context,!1),Go(e,t.containerInfo)}function Nl(e,t,n,r,i){return po(),yo(i),t.flags|=256,wl(e,t,n,r),t.child}var Al,Ol,zl,Dl,$l={dehydrated:null,treeContext:null,retryLane:0};function Pl(e){return{baseLanes:e,cachePool:null,transitions:null}}function Ll(e,t,n){var r,i=t.pendingProps,a=ea.current,l=!1,s=0!==(128&t.flags);if((r=s)||(r=(null===e||null!==e.memoizedState)&&0!==(2&a)),r?(l=!0,t.flags&=-129):null!==e&&null===e.memoizedState||(a|=1),Ei(ea,1&a),null===e)return uo(t),null!==(e=t.memoizedState)&&null!==(e=e.dehydrated)?(0===(1&t.mode)?t.lanes=1:"$!"===e.data?t.lanes=8:t.lanes=1073741824,null):(s=i.children,e=i.fallback,l?(i=t.mode,l=t.child,s={mode:"hidden",children:s},0===(1&i)&&null!==l?(l.childLanes=0,l.pendingProps=s):l=Pu(s,i,0,null),e=$u(e,i,n,null),l.return=t,e.return=t,l.sibling=e,t.child=l,t.child.memoizedState=Pl(n),t.memoizedState=$l,e):Bl(t,s));if(null!==(a=e.memoizedState)&&null!==(r=a.dehydrated))return function(e,t,n,r,i,a,l){if(n)return 256&t.flags?(t.flags&=-257,Fl(e,t,l,r=cl(Error(o(422))))):null!==t.memoizedState?(t.child=e.child,t.flags|=128,null):(a=r.fallback,i=t.mode,r=Pu({mode:"visible",children:r.children},i,0,null),(a=$u(a,i,l,null)).flags|=2,r.return=t,a.return=t,r.sibling=a,t.child=r,0!==(1&t.mode)&&xo(t,e.child,null,l),t.child.memoizedState=Pl(l),t.memoizedState=$l,a);if(0===(1&t.mode))return Fl(e,t,l,null);if("$!"===i.data){if(r=i.nextSibling&&i.nextSibling.dataset)var s=r.dgst;return r=s,Fl(e,t,l,r=cl(a=Error(o(419)),r,void 0))}if(s=0!==(l&e.childLanes),bl||s){if(null!==(r=Ms)){switch(l&-l){case 4:i=2;break;case 16:i=8;break;case 64:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:case 67108864:i=32;break;case 536870912:i=268435456;break;default:i=0}0!==(i=0!==(i&(r.suspendedLanes|l))?0:i)&&i!==a.retryLane&&(a.retryLane=i,$o(e,i),nu(r,e,i,-1))}return yu(),Fl(e,t,l,r=cl(Error(o(421))))}return"$?"===i.data?(t.flags|=128,t.child=e.child,t=Cu.bind(null,e),i._reactRetry=t,null):(e=a.treeContext,ro=ui(i.nextSibling),no=t,io=!0,oo=null,null!==e&&(Xi[qi++]=Gi,Xi[qi++]=Ji,Xi[qi++]=Qi,Gi=e.id,Ji=e.overflow,Qi=t),t=Bl(t,r.children),t.flags|=4096,t)}(e,t,s,i,r,a,n);if(l){l=i.fallback,s=t.mode,r=(a=e.child).sibling;var u={mode:"hidden",children:i.children};return 0===(1&s)&&t.child!==a?((i=t.child).childLanes=0,i.pendingProps=u,t.deletions=null):(i=zu(a,u)).subtreeFlags=14680064&a.subtreeFlags,null!==r?l=zu(r,l):(l=$u(l,s,n,null)).flags|=2,l.return=t,i.return=t,i.sibling=l,t.child=i,i=l,l=t.child,s=null===(s=e.child.memoizedState)?Pl(n):{baseLanes:s.baseLanes|n,cachePool:null,transitions:s.transitions},l.memoizedState=s,l.childLanes=e.childLanes&~n,t.memoizedState=$l,i}return e=(l=e.child).sibling,i=zu(l,{mode:"visible",children:i.children}),0===(1&t.mode)&&(i.lanes=n),i.return=t,i.sibling=null,null!==e&&(null===(n=t.deletions)?(t.deletions=[e],t.flags|=16):n.push(e)),t.child=i,t.memoizedState=null,i}function Bl(e,t){return(t=Pu({mode:"visible",children:t},e.mode,0,null)).return=e,e.child=t}function Fl(e,t,n,r){return null!==r&&yo(r),xo(t,e.child,null,n),(e=Bl(t,t.pendingProps.children)).flags|=2,t.memoizedState=null,e}function Rl(e,t,n){e.lanes|=t;var r=e.alternate;null!==r&&(r.lanes|=t),Mo(e.return,t,n)}function Ul(e,t,n,r,i){var o=e.memoizedState;null===o?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailMode:i}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=r,o.tail=n,o.tailMode=i)}function jl(e,t,n){var r=t.pendingProps,i=r.revealOrder,o=r.tail;if(wl(e,t,r.children,n),0!==(2&(r=ea.current)))r=1&r|2,t.flags|=128;else{if(null!==e&&0!==(128&e.flags))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Rl(e,n,t);else if(19===e.tag)Rl(e,n,t);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(Ei(ea,r),0===(1&t.mode))t.memoizedState=null;else switch(i){case"forwards":for(n=t.child,i=null;null!==n;)null!==(e=n.alternate)&&null===ta(e)&&(i=n),n=n.sibling;null===(n=i)?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),Ul(t,!1,i,n,o);break;case"backwards":for(n=null,i=t.child,t.child=null;null!==i;){if(null!==(e=i.alternate)&&null===ta(e)){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}Ul(t,!0,n,null,o);break;case"together":Ul(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function Vl(e,t){0===(1&t.mode)&&null!==e&&(e.alternate=null,t.alternate=null,t.flags|=2)}function Hl(e,t,n){if(null!==e&&(t.dependencies=e.dependencies),Ps|=t.lanes,0===(n&t.childLanes))return null;if(null!==e&&t.child!==e.child)throw Error(o(153));if(null!==t.child){for(n=zu(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=zu(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Yl(e,t){if(!io)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Wl(e){var t=null!==e.alternate&&e.alternate.child===e.child,n=0,r=0;if(t)for(var i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=14680064&i.subtreeFlags,r|=14680064&i.flags,i.return=e,i=i.sibling;else for(i=e.child;null!==i;)n|=i.lanes|i.childLanes,r|=i.subtreeFlags,r|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=r,e.childLanes=n,t}function Xl(e,t,n){var r=t.pendingProps;switch(to(t),t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Wl(t),null;case 1:case 17:return Oi(t.type)&&zi(),Wl(t),null;case 3:return r=t.stateNode,Jo(),Ti(Mi),Ti(Ii),ra(),r.pendingContext&&(r.context=r.pendingContext,r.pendingContext=null),null!==e&&null!==e.child||(fo(t)?t.flags|=4:null===e||e.memoizedState.isDehydrated&&0===(256&t.flags)||(t.flags|=1024,null!==oo&&(au(oo),oo=null))),Ol(e,t),Wl(t),null;case 5:Zo(t);var i=Qo(qo.current);if(n=t.type,null!==e&&null!=t.stateNode)zl(e,t,n,r,i),e.ref!==t.ref&&(t.flags|=512,t.flags|=2097152);else{if(!r){if(null===t.stateNode)throw Error(o(166));return Wl(t),null}if(e=Qo(Wo.current),fo(t)){r=t.stateNode,n=t.type;var a=t.memoizedProps;switch(r[di]=t,r[hi]=a,e=0!==(1&t.mode),n){case"dialog":Fr("cancel",r),Fr("close",r);break;case"iframe":case"object":case"embed":Fr("load",r);break;case"video":case"audio":for(i=0;i<$r.length;i++)Fr($r[i],r);break;case"source":Fr("error",r);break;case"img":case"image":case"link":Fr("error",r),Fr("load",r);break;case"details":Fr("toggle",r);break;case"input":G(r,a),Fr("invalid",r);break;case"select":r._wrapperState={wasMultiple:!!a.multiple},Fr("invalid",r);break;case"textarea":ie(r,a),Fr("invalid",r)}for(var s in ve(n,a),i=null,a)if(a.hasOwnProperty(s)){var u=a[s];"children"===s?"string"===typeof u?r.textContent!==u&&(!0!==a.suppressHydrationWarning&&Kr(r.textContent,u,e),i=["children",u]):"number"===typeof u&&r.textContent!==""+u&&(!0!==a.suppressHydrationWarning&&Kr(r.textContent,u,e),i=["children",""+u]):l.hasOwnProperty(s)&&null!=u&&"onScroll"===s&&Fr("scroll",r)}switch(n){case"input":W(r),Z(r,a,!0);break;case"textarea":W(r),ae(r);break;case"select":case"option":break;default:"function"===typeof a.onClick&&(r.onclick=Zr)}r=i,t.updateQueue=r,null!==r&&(t.flags|=4)}else{s=9===i.nodeType?i:i.ownerDocument,"http://www.w3.org/1999/xhtml"===e&&(e=le(n)),"http://www.w3.org/1999/xhtml"===e?"script"===n?((e=s.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"===typeof r.is?e=s.createElement(n,{is:r.is}):(e=s.createElement(n),"select"===n&&(s=e,r.multiple?s.multiple=!0:r.size&&(s.size=r.size))):e=s.createElementNS(e,n),e[di]=t,e[hi]=r,Al(e,t,!1,!1),t.stateNode=e;e:{switch(s=be(n,r),n){case"dialog":Fr("cancel",e),Fr("close",e),i=r;break;case"iframe":case"object":case"embed":Fr("load",e),i=r;break;case"video":case"audio":for(i=0;i<$r.length;i++)Fr($r[i],e);i=r;break;case"source":Fr("error",e),i=r;break;case"img":case"image":case"link":Fr("error",e),Fr("load",e),i=r;break;case"details":Fr("toggle",e),i=r;break;case"input":G(e,r),i=Q(e,r),Fr("invalid",e);break;case"option":default:i=r;break;case"select":e._wrapperState={wasMultiple:!!r.multiple},i=L({},r,{value:void 0}),Fr("invalid",e);break;case"textarea":ie(e,r),i=re(e,r),Fr("invalid",e)}for(a in ve(n,i),u=i)if(u.hasOwnProperty(a)){var c=u[a];"style"===a?me(e,c):"dangerouslySetInnerHTML"===a?null!=(c=c?c.__html:void 0)&&fe(e,c):"children"===a?"string"===typeof c?("textarea"!==n||""!==c)&&de(e,c):"number"===typeof c&&de(e,""+c):"suppressContentEditableWarning"!==a&&"suppressHydrationWarning"!==a&&"autoFocus"!==a&&(l.hasOwnProperty(a)?null!=c&&"onScroll"===a&&Fr("scroll",e):null!=c&&b(e,a,c,s))}switch(n){case"input":W(e),Z(e,r,!1);break;case"textarea":W(e),ae(e);break;case"option":null!=r.value&&e.setAttribute("value",""+H(r.value));break;case"select":e.multiple=!!r.multiple,null!=(a=r.value)?ne(e,!!r.multiple,a,!1):null!=r.defaultValue&&ne(e,!!r.multiple,r.defaultValue,!0);break;default:"function"===typeof i.onClick&&(e.onclick=Zr)}switch(n){case"button":case"input":case"select":case"textarea":r=!!r.autoFocus;break e;case"img":r=!0;break e;default:r=!1}}r&&(t.flags|=4)}null!==t.ref&&(t.flags|=512,t.flags|=2097152)}return Wl(t),null;case 6:if(e&&null!=t.stateNode)Dl(e,t,e.memoizedProps,r);else{if("string"!==typeof r&&null===t.stateNode)throw Error(o(166));if(n=Qo(qo.current),Qo(Wo.current),fo(t)){if(r=t.stateNode,n=t.memoizedProps,r[di]=t,(a=r.nodeValue!==n)&&null!==(e=no))switch(e.tag){case 3:Kr(r.nodeValue,n,0!==(1&e.mode));break;case 5:!0!==e.memoizedProps.suppressHydrationWarning&&Kr(r.nodeValue,n,0!==(1&e.mode))}a&&(t.flags|=4)}else(r=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[di]=t,t.stateNode=r}return Wl(t),null;case 13:if(Ti(ea),r=t.memoizedState,null===e||null!==e.memoizedState&&null!==e.memoizedState.dehydrated){if(io&&null!==ro&&0!==(1&t.mode)&&0===(128&t.flags))ho(),po(),t.flags|=98560,a=!1;else if(a=fo(t),null!==r&&null!==r.dehydrated){if(null===e){if(!a)throw Error(o(318));if(!(a=null!==(a=t.memoizedState)?a.dehydrated:null))throw Error(o(317));a[di]=t}else po(),0===(128&t.flags)&&(t.memoizedState=null),t.flags|=4;Wl(t),a=!1}else null!==oo&&(au(oo),oo=null),a=!0;if(!a)return 65536&t.flags?t:null}return 0!==(128&t.flags)?(t.lanes=n,t):((r=null!==r)!==(null!==e&&null!==e.memoizedState)&&r&&(t.child.flags|=8192,0!==(1&t.mode)&&(null===e||0!==(1&ea.current)?0===Ds&&(Ds=3):yu())),null!==t.updateQueue&&(t.flags|=4),Wl(t),null);case 4:return Jo(),Ol(e,t),null===e&&jr(t.stateNode.containerInfo),Wl(t),null;case 10:return Io(t.type._context),Wl(t),null;case 19:if(Ti(ea),null===(a=t.memoizedState))return Wl(t),null;if(r=0!==(128&t.flags),null===(s=a.rendering))if(r)Yl(a,!1);else{if(0!==Ds||null!==e&&0!==(128&e.flags))for(e=t.child;null!==e;){if(null!==(s=ta(e))){for(t.flags|=128,Yl(a,!1),null!==(r=s.updateQueue)&&(t.updateQueue=r,t.flags|=4),t.subtreeFlags=0,r=n,n=t.child;null!==n;)e=r,(a=n).flags&=14680066,null===(s=a.alternate)?(a.childLanes=0,a.lanes=e,a.child=null,a.subtreeFlags=0,a.memoizedProps=null,a.memoizedState=null,a.updateQueue=null,a.dependencies=null,a.stateNode=null):(a.childLanes=s.childLanes,a.lanes=s.lanes,a.child=s.child,a.subtreeFlags=0,a.deletions=null,a.memoizedProps=s.memoizedProps,a.memoizedState=s.memoizedState,a.updateQueue=s.updateQueue,a.type=s.type,e=s.dependencies,a.dependencies=null===e?null:{lanes:e.lanes,firstContext:e.firstContext}),n=n.sibling;return Ei(ea,1&ea.current|2),t.child}e=e.sibling}null!==a.tail&&Je()>js&&(t.flags|=128,r=!0,Yl(a,!1),t.lanes=4194304)}else{if(!r)if(null!==(e=ta(s))){if(t.flags|=128,r=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.flags|=4),Yl(a,!0),null===a.tail&&"hidden"===a.tailMode&&!s.alternate&&!io)return Wl(t),null}else 2*Je()-a.renderingStartTime>js&&1073741824!==n&&(t.flags|=128,r=!0,Yl(a,!1),t.lanes=4194304);a.isBackwards?(s.sibling=t.child,t.child=s):(null!==(n=a.last)?n.sibling=s:t.child=s,a.last=s)}return null!==a.tail?(t=a.tail,a.rendering=t,a.tail=t.sibling,a.renderingStartTime=Je(),t.sibling=null,n=ea.current,Ei(ea,r?1&n|2:1&n),t):(Wl(t),null);case 22:case 23:return fu(),r=null!==t.memoizedState,null!==e&&null!==e.memoizedState!==r&&(t.flags|=8192),r&&0!==(1&t.mode)?0!==(1073741824&Os)&&(Wl(t),6&t.subtreeFlags&&(t.flags|=8192)):Wl(t),null;case 24:case 25:return null}throw Error(o(156,t.tag))}function ql(e,t){switch(to(t),t.tag){case 1:return Oi(t.type)&&zi(),65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 3:return Jo(),Ti(Mi),Ti(Ii),ra(),0!==(65536&(e=t.flags))&&0===(128&e)?(t.flags=-65537&e|128,t):null;case 5:return Zo(t),null;case 13:if(Ti(ea),null!==(e=t.memoizedState)&&null!==e.dehydrated){if(null===t.alternate)throw Error(o(340));po()}return 65536&(e=t.flags)?(t.flags=-65537&e|128,t):null;case 19:return Ti(ea),null;case 4:return Jo(),null;case 10:return Io(t.type._context),null;case 22:case 23:return fu(),null;default:return null}}Al=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Ol=function(){},zl=function(e,t,n,r){var i=e.memoizedProps;if(i!==r){e=t.stateNode,Qo(Wo.current);var o,a=null;switch(n){case"input":i=Q(e,i),r=Q(e,r),a=[];break;case"select":i=L({},i,{value:void 0}),r=L({},r,{value:void 0}),a=[];break;case"textarea":i=re(e,i),r=re(e,r),a=[];break;default:"function"!==typeof i.onClick&&"function"===typeof r.onClick&&(e.onclick=Zr)}for(c in ve(n,r),n=null,i)if(!r.hasOwnProperty(c)&&i.hasOwnProperty(c)&&null!=i[c])if("style"===c){var s=i[c];for(o in s)s.hasOwnProperty(o)&&(n||(n={}),n[o]="")}else"dangerouslySetInnerHTML"!==c&&"children"!==c&&"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&"autoFocus"!==c&&(l.hasOwnProperty(c)?a||(a=[]):(a=a||[]).push(c,null));for(c in r){var u=r[c];if(s=null!=i?i[c]:void 0,r.hasOwnProperty(c)&&u!==s&&(null!=u||null!=s))if("style"===c)if(s){for(o in s)!s.hasOwnProperty(o)||u&&u.hasOwnProperty(o)||(n||(n={}),n[o]="");for(o in u)u.hasOwnProperty(o)&&s[o]!==u[o]&&(n||(n={}),n[o]=u[o])}else n||(a||(a=[]),a.push(c,n)),n=u;else"dangerouslySetInnerHTML"===c?(u=u?u.__html:void 0,s=s?s.__html:void 0,null!=u&&s!==u&&(a=a||[]).push(c,u)):"children"===c?"string"!==typeof u&&"number"!==typeof u||(a=a||[]).push(c,""+u):"suppressContentEditableWarning"!==c&&"suppressHydrationWarning"!==c&&(l.hasOwnProperty(c)?(null!=u&&"onScroll"===c&&Fr("scroll",e),a||s===u||(a=[])):(a=a||[]).push(c,u))}n&&(a=a||[]).push("style",n);var c=a;(t.updateQueue=c)&&(t.flags|=4)}},Dl=function(e,t,n,r){n!==r&&(t.flags|=4)};var Ql=!1,Gl=!1,Jl="function"===typeof WeakSet?WeakSet:Set,Kl=null;function Zl(e,t){var n=e.ref;if(null!==n)if("function"===typeof n)try{n(null)}catch(r){ku(e,t,r)}else n.current=null}function es(e,t,n){try{n()}catch(r){ku(e,t,r)}}var ts=!1;function ns(e,t,n){var r=t.updateQueue;if(null!==(r=null!==r?r.lastEffect:null)){var i=r=r.next;do{if((i.tag&e)===e){var o=i.destroy;i.destroy=void 0,void 0!==o&&es(t,n,o)}i=i.next}while(i!==r)}}function rs(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function is(e){var t=e.ref;if(null!==t){var n=e.stateNode;e.tag,e=n,"function"===typeof t?t(e):t.current=e}}function os(e){var t=e.alternate;null!==t&&(e.alternate=null,os(t)),e.child=null,e.deletions=null,e.sibling=null,5===e.tag&&(null!==(t=e.stateNode)&&(delete t[di],delete t[hi],delete t[yi],delete t[mi],delete t[gi])),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}function as(e){return 5===e.tag||3===e.tag||4===e.tag}function ls(e){e:for(;;){for(;null===e.sibling;){if(null===e.return||as(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;5!==e.tag&&6!==e.tag&&18!==e.tag;){if(2&e.flags)continue e;if(null===e.child||4===e.tag)continue e;e.child.return=e,e=e.child}if(!(2&e.flags))return e.stateNode}}function ss(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?8===n.nodeType?n.parentNode.insertBefore(e,t):n.insertBefore(e,t):(8===n.nodeType?(t=n.parentNode).insertBefore(e,n):(t=n).appendChild(e),null!==(n=n._reactRootContainer)&&void 0!==n||null!==t.onclick||(t.onclick=Zr));else if(4!==r&&null!==(e=e.child))for(ss(e,t,n),e=e.sibling;null!==e;)ss(e,t,n),e=e.sibling}function us(e,t,n){var r=e.tag;if(5===r||6===r)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(4!==r&&null!==(e=e.child))for(us(e,t,n),e=e.sibling;null!==e;)us(e,t,n),e=e.sibling}var cs=null,fs=!1;function ds(e,t,n){for(n=n.child;null!==n;)hs(e,t,n),n=n.sibling}function hs(e,t,n){if(ot&&"function"===typeof ot.onCommitFiberUnmount)try{ot.onCommitFiberUnmount(it,n)}catch(l){}switch(n.tag){case 5:Gl||Zl(n,t);case 6:var r=cs,i=fs;cs=null,ds(e,t,n),fs=i,null!==(cs=r)&&(fs?(e=cs,n=n.stateNode,8===e.nodeType?e.parentNode.removeChild(n):e.removeChild(n)):cs.removeChild(n.stateNode));break;case 18:null!==cs&&(fs?(e=cs,n=n.stateNode,8===e.nodeType?si(e.parentNode,n):1===e.nodeType&&si(e,n),jt(e)):si(cs,n.stateNode));break;case 4:r=cs,i=fs,cs=n.stateNode.containerInfo,fs=!0,ds(e,t,n),cs=r,fs=i;break;case 0:case 11:case 14:case 15:if(!Gl&&(null!==(r=n.updateQueue)&&null!==(r=r.lastEffect))){i=r=r.next;do{var o=i,a=o.destroy;o=o.tag,void 0!==a&&(0!==(2&o)||0!==(4&o))&&es(n,t,a),i=i.next}while(i!==r)}ds(e,t,n);break;case 1:if(!Gl&&(Zl(n,t),"function"===typeof(r=n.stateNode).componentWillUnmount))try{r.props=n.memoizedProps,r.state=n.memoizedState,r.componentWillUnmount()}catch(l){ku(n,t,l)}ds(e,t,n);break;case 21:ds(e,t,n);break;case 22:1&n.mode?(Gl=(r=Gl)||null!==n.memoizedState,ds(e,t,n),Gl=r):ds(e,t,n);break;default:ds(e,t,n)}}function ps(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Jl),t.forEach(function(t){var r=Iu.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))})}}function ys(e,t){var n=t.deletions;if(null!==n)for(var r=0;r<n.length;r++){var i=n[r];try{var a=e,l=t,s=l;e:for(;null!==s;){switch(s.tag){case 5:cs=s.stateNode,fs=!1;break e;case 3:case 4:cs=s.stateNode.containerInfo,fs=!0;break e}s=s.return}if(null===cs)throw Error(o(160));hs(a,l,i),cs=null,fs=!1;var u=i.alternate;null!==u&&(u.return=null),i.return=null}catch(c){ku(i,t,c)}}if(12854&t.subtreeFlags)for(t=t.child;null!==t;)ms(t,e),t=t.sibling}function ms(e,t){var n=e.alternate,r=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:if(ys(t,e),gs(e),4&r){try{ns(3,e,e.return),rs(3,e)}catch(m){ku(e,e.return,m)}try{ns(5,e,e.return)}catch(m){ku(e,e.return,m)}}break;case 1:ys(t,e),gs(e),512&r&&null!==n&&Zl(n,n.return);break;case 5:if(ys(t,e),gs(e),512&r&&null!==n&&Zl(n,n.return),32&e.flags){var i=e.stateNode;try{de(i,"")}catch(m){ku(e,e.return,m)}}if(4&r&&null!=(i=e.stateNode)){var a=e.memoizedProps,l=null!==n?n.memoizedProps:a,s=e.type,u=e.updateQueue;if(e.updateQueue=null,null!==u)try{"input"===s&&"radio"===a.type&&null!=a.name&&J(i,a),be(s,l);var c=be(s,a);for(l=0;l<u.length;l+=2){var f=u[l],d=u[l+1];"style"===f?me(i,d):"dangerouslySetInnerHTML"===f?fe(i,d):"children"===f?de(i,d):b(i,f,d,c)}switch(s){case"input":K(i,a);break;case"textarea":oe(i,a);break;case"select":var h=i._wrapperState.wasMultiple;i._wrapperState.wasMultiple=!!a.multiple;var p=a.value;null!=p?ne(i,!!a.multiple,p,!1):h!==!!a.multiple&&(null!=a.defaultValue?ne(i,!!a.multiple,a.defaultValue,!0):ne(i,!!a.multiple,a.multiple?[]:"",!1))}i[hi]=a}catch(m){ku(e,e.return,m)}}break;case 6:if(ys(t,e),gs(e),4&r){if(null===e.stateNode)throw Error(o(162));i=e.stateNode,a=e.memoizedProps;try{i.nodeValue=a}catch(m){ku(e,e.return,m)}}break;case 3:if(ys(t,e),gs(e),4&r&&null!==n&&n.memoizedState.isDehydrated)try{jt(t.containerInfo)}catch(m){ku(e,e.return,m)}break;case 4:default:ys(t,e),gs(e);break;case 13:ys(t,e),gs(e),8192&(i=e.child).flags&&(a=null!==i.memoizedState,i.stateNode.isHidden=a,!a||null!==i.alternate&&null!==i.alternate.memoizedState||(Us=Je())),4&r&&ps(e);break;case 22:if(f=null!==n&&null!==n.memoizedState,1&e.mode?(Gl=(c=Gl)||f,ys(t,e),Gl=c):ys(t,e),gs(e),8192&r){if(c=null!==e.memoizedState,(e.stateNode.isHidden=c)&&!f&&0!==(1&e.mode))for(Kl=e,f=e.child;null!==f;){for(d=Kl=f;null!==Kl;){switch(p=(h=Kl).child,h.tag){case 0:case 11:case 14:case 15:ns(4,h,h.return);break;case 1:Zl(h,h.return);var y=h.stateNode;if("function"===typeof y.componentWillUnmount){r=h,n=h.return;try{t=r,y.props=t.memoizedProps,y.state=t.memoizedState,y.componentWillUnmount()}catch(m){ku(r,n,m)}}break;case 5:Zl(h,h.return);break;case 22:if(null!==h.memoizedState){xs(d);continue}}null!==p?(p.return=h,Kl=p):xs(d)}f=f.sibling}e:for(f=null,d=e;;){if(5===d.tag){if(null===f){f=d;try{i=d.stateNode,c?"function"===typeof(a=i.style).setProperty?a.setProperty("display","none","important"):a.display="none":(s=d.stateNode,l=void 0!==(u=d.memoizedProps.style)&&null!==u&&u.hasOwnProperty("display")?u.display:null,s.style.display=ye("display",l))}catch(m){ku(e,e.return,m)}}}else if(6===d.tag){if(null===f)try{d.stateNode.nodeValue=c?"":d.memoizedProps}catch(m){ku(e,e.return,m)}}else if((22!==d.tag&&23!==d.tag||null===d.memoizedState||d===e)&&null!==d.child){d.child.return=d,d=d.child;continue}if(d===e)break e;for(;null===d.sibling;){if(null===d.return||d.return===e)break e;f===d&&(f=null),d=d.return}f===d&&(f=null),d.sibling.return=d.return,d=d.sibling}}break;case 19:ys(t,e),gs(e),4&r&&ps(e);case 21:}}function gs(e){var t=e.flags;if(2&t){try{e:{for(var n=e.return;null!==n;){if(as(n)){var r=n;break e}n=n.return}throw Error(o(160))}switch(r.tag){case 5:var i=r.stateNode;32&r.flags&&(de(i,""),r.flags&=-33),us(e,ls(e),i);break;case 3:case 4:var a=r.stateNode.containerInfo;ss(e,ls(e),a);break;default:throw Error(o(161))}}catch(l){ku(e,e.return,l)}e.flags&=-3}4096&t&&(e.flags&=-4097)}function vs(e,t,n){Kl=e,bs(e,t,n)}function bs(e,t,n){for(var r=0!==(1&e.mode);null!==Kl;){var i=Kl,o=i.child;if(22===i.tag&&r){var a=null!==i.memoizedState||Ql;if(!a){var l=i.alternate,s=null!==l&&null!==l.memoizedState||Gl;l=Ql;var u=Gl;if(Ql=a,(Gl=s)&&!u)for(Kl=i;null!==Kl;)s=(a=Kl).child,22===a.tag&&null!==a.memoizedState?Ss(i):null!==s?(s.return=a,Kl=s):Ss(i);for(;null!==o;)Kl=o,bs(o,t,n),o=o.sibling;Kl=i,Ql=l,Gl=u}ws(e)}else 0!==(8772&i.subtreeFlags)&&null!==o?(o.return=i,Kl=o):ws(e)}}function ws(e){for(;null!==Kl;){var t=Kl;if(0!==(8772&t.flags)){var n=t.alternate;try{if(0!==(8772&t.flags))switch(t.tag){case 0:case 11:case 15:Gl||rs(5,t);break;case 1:var r=t.stateNode;if(4&t.flags&&!Gl)if(null===n)r.componentDidMount();else{var i=t.elementType===t.type?n.memoizedProps:nl(t.type,n.memoizedProps);r.componentDidUpdate(i,n.memoizedState,r.__reactInternalSnapshotBeforeUpdate)}var a=t.updateQueue;null!==a&&Ho(t,a,r);break;case 3:var l=t.updateQueue;if(null!==l){if(n=null,null!==t.child)switch(t.child.tag){case 5:case 1:n=t.child.stateNode}Ho(t,l,n)}break;case 5:var s=t.stateNode;if(null===n&&4&t.flags){n=s;var u=t.memoizedProps;switch(t.type){case"button":case"input":case"select":case"textarea":u.autoFocus&&n.focus();break;case"img":u.src&&(n.src=u.src)}}break;case 6:case 4:case 12:case 19:case 17:case 21:case 22:case 23:case 25:break;case 13:if(null===t.memoizedState){var c=t.alternate;if(null!==c){var f=c.memoizedState;if(null!==f){var d=f.dehydrated;null!==d&&jt(d)}}}break;default:throw Error(o(163))}Gl||512&t.flags&&is(t)}catch(h){ku(t,t.return,h)}}if(t===e){Kl=null;break}if(null!==(n=t.sibling)){n.return=t.return,Kl=n;break}Kl=t.return}}function xs(e){for(;null!==Kl;){var t=Kl;if(t===e){Kl=null;break}var n=t.sibling;if(null!==n){n.return=t.return,Kl=n;break}Kl=t.return}}function Ss(e){for(;null!==Kl;){var t=Kl;try{switch(t.tag){case 0:case 11:case 15:var n=t.return;try{rs(4,t)}catch(s){ku(t,n,s)}break;case 1:var r=t.stateNode;if("function"===typeof r.componentDidMount){var i=t.return;try{r.componentDidMount()}catch(s){ku(t,i,s)}}var o=t.return;try{is(t)}catch(s){ku(t,o,s)}break;case 5:var a=t.return;try{is(t)}catch(s){ku(t,a,s)}}}catch(s){ku(t,t.return,s)}if(t===e){Kl=null;break}var l=t.sibling;if(null!==l){l.return=t.return,Kl=l;break}Kl=t.return}}var _s,ks=Math.ceil,Ts=w.ReactCurrentDispatcher,Es=w.ReactCurrentOwner,Cs=w.ReactCurrentBatchConfig,Is=0,Ms=null,Ns=null,As=0,Os=0,zs=ki(0),Ds=0,$s=null,Ps=0,Ls=0,Bs=0,Fs=null,Rs=null,Us=0,js=1/0,Vs=null,Hs=!1,Ys=null,Ws=null,Xs=!1,qs=null,Qs=0,Gs=0,Js=null,Ks=-1,Zs=0;function eu(){return 0!==(6&Is)?Je():-1!==Ks?Ks:Ks=Je()}function tu(e){return 0===(1&e.mode)?1:0!==(2&Is)&&0!==As?As&-As:null!==mo.transition?(0===Zs&&(Zs=yt()),Zs):0!==(e=bt)?e:e=void 0===(e=window.event)?16:Gt(e.type)}function nu(e,t,n,r){if(50<Gs)throw Gs=0,Js=null,Error(o(185));gt(e,n,r),0!==(2&Is)&&e===Ms||(e===Ms&&(0===(2&Is)&&(Ls|=n),4===Ds&&lu(e,As)),ru(e,r),1===n&&0===Is&&0===(1&t.mode)&&(js=Je()+500,Fi&&ji()))}function ru(e,t){var n=e.callbackNode;!function(e,t){for(var n=e.suspendedLanes,r=e.pingedLanes,i=e.expirationTimes,o=e.pendingLanes;0<o;){var a=31-at(o),l=1<<a,s=i[a];-1===s?0!==(l&n)&&0===(l&r)||(i[a]=ht(l,t)):s<=t&&(e.expiredLanes|=l),o&=~l}}(e,t);var r=dt(e,e===Ms?As:0);if(0===r)null!==n&&qe(n),e.callbackNode=null,e.callbackPriority=0;else if(t=r&-r,e.callbackPriority!==t){if(null!=n&&qe(n),1===t)0===e.tag?function(e){Fi=!0,Ui(e)}(su.bind(null,e)):Ui(su.bind(null,e)),ai(function(){0===(6&Is)&&ji()}),n=null;else{switch(wt(r)){case 1:n=Ze;break;case 4:n=et;break;case 16:default:n=tt;break;case 536870912:n=rt}n=Mu(n,iu.bind(null,e))}e.callbackPriority=t,e.callbackNode=n}}function iu(e,t){if(Ks=-1,Zs=0,0!==(6&Is))throw Error(o(327));var n=e.callbackNode;if(Su()&&e.callbackNode!==n)return null;var r=dt(e,e===Ms?As:0);if(0===r)return null;if(0!==(30&r)||0!==(r&e.expiredLanes)||t)t=mu(e,r);else{t=r;var i=Is;Is|=2;var a=pu();for(Ms===e&&As===t||(Vs=null,js=Je()+500,du(e,t));;)try{vu();break}catch(s){hu(e,s)}Co(),Ts.current=a,Is=i,null!==Ns?t=0:(Ms=null,As=0,t=Ds)}if(0!==t){if(2===t&&(0!==(i=pt(e))&&(r=i,t=ou(e,i))),1===t)throw n=$s,du(e,0),lu(e,r),ru(e,Je()),n;if(6===t)lu(e,r);else{if(i=e.current.alternate,0===(30&r)&&!function(e){for(var t=e;;){if(16384&t.flags){var n=t.updateQueue;if(null!==n&&null!==(n=n.stores))for(var r=0;r<n.length;r++){var i=n[r],o=i.getSnapshot;i=i.value;try{if(!lr(o(),i))return!1}catch(l){return!1}}}if(n=t.child,16384&t.subtreeFlags&&null!==n)n.return=t,t=n;else{if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}(i)&&(2===(t=mu(e,r))&&(0!==(a=pt(e))&&(r=a,t=ou(e,a))),1===t))throw n=$s,du(e,0),lu(e,r),ru(e,Je()),n;switch(e.finishedWork=i,e.finishedLanes=r,t){case 0:case 1:throw Error(o(345));case 2:case 5:xu(e,Rs,Vs);break;case 3:if(lu(e,r),(130023424&r)===r&&10<(t=Us+500-Je())){if(0!==dt(e,0))break;if(((i=e.suspendedLanes)&r)!==r){eu(),e.pingedLanes|=e.suspendedLanes&i;break}e.timeoutHandle=ri(xu.bind(null,e,Rs,Vs),t);break}xu(e,Rs,Vs);break;case 4:if(lu(e,r),(4194240&r)===r)break;for(t=e.eventTimes,i=-1;0<r;){var l=31-at(r);a=1<<l,(l=t[l])>i&&(i=l),r&=~a}if(r=i,10<(r=(120>(r=Je()-r)?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*ks(r/1960))-r)){e.timeoutHandle=ri(xu.bind(null,e,Rs,Vs),r);break}xu(e,Rs,Vs);break;default:throw Error(o(329))}}}return ru(e,Je()),e.callbackNode===n?iu.bind(null,e):null}function ou(e,t){var n=Fs;return e.current.memoizedState.isDehydrated&&(du(e,t).flags|=256),2!==(e=mu(e,t))&&(t=Rs,Rs=n,null!==t&&au(t)),e}function au(e){null===Rs?Rs=e:Rs.push.apply(Rs,e)}function lu(e,t){for(t&=~Bs,t&=~Ls,e.suspendedLanes|=t,e.pingedLanes&=~t,e=e.expirationTimes;0<t;){var n=31-at(t),r=1<<n;e[n]=-1,t&=~r}}function su(e){if(0!==(6&Is))throw Error(o(327));Su();var t=dt(e,0);if(0===(1&t))return ru(e,Je()),null;var n=mu(e,t);if(0!==e.tag&&2===n){var r=pt(e);0!==r&&(t=r,n=ou(e,r))}if(1===n)throw n=$s,du(e,0),lu(e,t),ru(e,Je()),n;if(6===n)throw Error(o(345));return e.finishedWork=e.current.alternate,e.finishedLanes=t,xu(e,Rs,Vs),ru(e,Je()),null}function uu(e,t){var n=Is;Is|=1;try{return e(t)}finally{0===(Is=n)&&(js=Je()+500,Fi&&ji())}}function cu(e){null!==qs&&0===qs.tag&&0===(6&Is)&&Su();var t=Is;Is|=1;var n=Cs.transition,r=bt;try{if(Cs.transition=null,bt=1,e)return e()}finally{bt=r,Cs.transition=n,0===(6&(Is=t))&&ji()}}function fu(){Os=zs.current,Ti(zs)}function du(e,t){e.finishedWork=null,e.finishedLanes=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,ii(n)),null!==Ns)for(n=Ns.return;null!==n;){var r=n;switch(to(r),r.tag){case 1:null!==(r=r.type.childContextTypes)&&void 0!==r&&zi();break;case 3:Jo(),Ti(Mi),Ti(Ii),ra();break;case 5:Zo(r);break;case 4:Jo();break;case 13:case 19:Ti(ea);break;case 10:Io(r.type._context);break;case 22:case 23:fu()}n=n.return}if(Ms=e,Ns=e=zu(e.current,null),As=Os=t,Ds=0,$s=null,Bs=Ls=Ps=0,Rs=Fs=null,null!==Oo){for(t=0;t<Oo.length;t++)if(null!==(r=(n=Oo[t]).interleaved)){n.interleaved=null;var i=r.next,o=n.pending;if(null!==o){var a=o.next;o.next=i,r.next=a}n.pending=r}Oo=null}return e}function hu(e,t){for(;;){var n=Ns;try{if(Co(),ia.current=Ka,ca){for(var r=la.memoizedState;null!==r;){var i=r.queue;null!==i&&(i.pending=null),r=r.next}ca=!1}if(aa=0,ua=sa=la=null,fa=!1,da=0,Es.current=null,null===n||null===n.return){Ds=1,$s=t,Ns=null;break}e:{var a=e,l=n.return,s=n,u=t;if(t=As,s.flags|=32768,null!==u&&"object"===typeof u&&"function"===typeof u.then){var c=u,f=s,d=f.tag;if(0===(1&f.mode)&&(0===d||11===d||15===d)){var h=f.alternate;h?(f.updateQueue=h.updateQueue,f.memoizedState=h.memoizedState,f.lanes=h.lanes):(f.updateQueue=null,f.memoizedState=null)}var p=ml(l);if(null!==p){p.flags&=-257,gl(p,l,s,0,t),1&p.mode&&yl(a,c,t),u=c;var y=(t=p).updateQueue;if(null===y){var m=new Set;m.add(u),t.updateQueue=m}else y.add(u);break e}if(0===(1&t)){yl(a,c,t),yu();break e}u=Error(o(426))}else if(io&&1&s.mode){var g=ml(l);if(null!==g){0===(65536&g.flags)&&(g.flags|=256),gl(g,l,s,0,t),yo(ul(u,s));break e}}a=u=ul(u,s),4!==Ds&&(Ds=2),null===Fs?Fs=[a]:Fs.push(a),a=l;do{switch(a.tag){case 3:a.flags|=65536,t&=-t,a.lanes|=t,jo(a,hl(0,u,t));break e;case 1:s=u;var v=a.type,b=a.stateNode;if(0===(128&a.flags)&&("function"===typeof v.getDerivedStateFromError||null!==b&&"function"===typeof b.componentDidCatch&&(null===Ws||!Ws.has(b)))){a.flags|=65536,t&=-t,a.lanes|=t,jo(a,pl(a,s,t));break e}}a=a.return}while(null!==a)}wu(n)}catch(w){t=w,Ns===n&&null!==n&&(Ns=n=n.return);continue}break}}function pu(){var e=Ts.current;return Ts.current=Ka,null===e?Ka:e}function yu(){0!==Ds&&3!==Ds&&2!==Ds||(Ds=4),null===Ms||0===(268435455&Ps)&&0===(268435455&Ls)||lu(Ms,As)}function mu(e,t){var n=Is;Is|=2;var r=pu();for(Ms===e&&As===t||(Vs=null,du(e,t));;)try{gu();break}catch(i){hu(e,i)}if(Co(),Is=n,Ts.current=r,null!==Ns)throw Error(o(261));return Ms=null,As=0,Ds}function gu(){for(;null!==Ns;)bu(Ns)}function vu(){for(;null!==Ns&&!Qe();)bu(Ns)}function bu(e){var t=_s(e.alternate,e,Os);e.memoizedProps=e.pendingProps,null===t?wu(e):Ns=t,Es.current=null}function wu(e){var t=e;do{var n=t.alternate;if(e=t.return,0===(32768&t.flags)){if(null!==(n=Xl(n,t,Os)))return void(Ns=n)}else{if(null!==(n=ql(n,t)))return n.flags&=32767,void(Ns=n);if(null===e)return Ds=6,void(Ns=null);e.flags|=32768,e.subtreeFlags=0,e.deletions=null}if(null!==(t=t.sibling))return void(Ns=t);Ns=t=e}while(null!==t);0===Ds&&(Ds=5)}function xu(e,t,n){var r=bt,i=Cs.transition;try{Cs.transition=null,bt=1,function(e,t,n,r){do{Su()}while(null!==qs);if(0!==(6&Is))throw Error(o(327));n=e.finishedWork;var i=e.finishedLanes;if(null===n)return null;if(e.finishedWork=null,e.finishedLanes=0,n===e.current)throw Error(o(177));e.callbackNode=null,e.callbackPriority=0;var a=n.lanes|n.childLanes;if(function(e,t){var n=e.pendingLanes&~t;e.pendingLanes=t,e.suspendedLanes=0,e.pingedLanes=0,e.expiredLanes&=t,e.mutableReadLanes&=t,e.entangledLanes&=t,t=e.entanglements;var r=e.eventTimes;for(e=e.expirationTimes;0<n;){var i=31-at(n),o=1<<i;t[i]=0,r[i]=-1,e[i]=-1,n&=~o}}(e,a),e===Ms&&(Ns=Ms=null,As=0),0===(2064&n.subtreeFlags)&&0===(2064&n.flags)||Xs||(Xs=!0,Mu(tt,function(){return Su(),null})),a=0!==(15990&n.flags),0!==(15990&n.subtreeFlags)||a){a=Cs.transition,Cs.transition=null;var l=bt;bt=1;var s=Is;Is|=4,Es.current=null,function(e,t){if(ei=Ht,hr(e=dr())){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{var r=(n=(n=e.ownerDocument)&&n.defaultView||window).getSelection&&n.getSelection();if(r&&0!==r.rangeCount){n=r.anchorNode;var i=r.anchorOffset,a=r.focusNode;r=r.focusOffset;try{n.nodeType,a.nodeType}catch(x){n=null;break e}var l=0,s=-1,u=-1,c=0,f=0,d=e,h=null;t:for(;;){for(var p;d!==n||0!==i&&3!==d.nodeType||(s=l+i),d!==a||0!==r&&3!==d.nodeType||(u=l+r),3===d.nodeType&&(l+=d.nodeValue.length),null!==(p=d.firstChild);)h=d,d=p;for(;;){if(d===e)break t;if(h===n&&++c===i&&(s=l),h===a&&++f===r&&(u=l),null!==(p=d.nextSibling))break;h=(d=h).parentNode}d=p}n=-1===s||-1===u?null:{start:s,end:u}}else n=null}n=n||{start:0,end:0}}else n=null;for(ti={focusedElem:e,selectionRange:n},Ht=!1,Kl=t;null!==Kl;)if(e=(t=Kl).child,0!==(1028&t.subtreeFlags)&&null!==e)e.return=t,Kl=e;else for(;null!==Kl;){t=Kl;try{var y=t.alternate;if(0!==(1024&t.flags))switch(t.tag){case 0:case 11:case 15:case 5:case 6:case 4:case 17:break;case 1:if(null!==y){var m=y.memoizedProps,g=y.memoizedState,v=t.stateNode,b=v.getSnapshotBeforeUpdate(t.elementType===t.type?m:nl(t.type,m),g);v.__reactInternalSnapshotBeforeUpdate=b}break;case 3:var w=t.stateNode.containerInfo;1===w.nodeType?w.textContent="":9===w.nodeType&&w.documentElement&&w.removeChild(w.documentElement);break;default:throw Error(o(163))}}catch(x){ku(t,t.return,x)}if(null!==(e=t.sibling)){e.return=t.return,Kl=e;break}Kl=t.return}y=ts,ts=!1}(e,n),ms(n,e),pr(ti),Ht=!!ei,ti=ei=null,e.current=n,vs(n,e,i),Ge(),Is=s,bt=l,Cs.transition=a}else e.current=n;if(Xs&&(Xs=!1,qs=e,Qs=i),a=e.pendingLanes,0===a&&(Ws=null),function(e){if(ot&&"function"===typeof ot.onCommitFiberRoot)try{ot.onCommitFiberRoot(it,e,void 0,128===(128&e.current.flags))}catch(t){}}(n.stateNode),ru(e,Je()),null!==t)for(r=e.onRecoverableError,n=0;n<t.length;n++)i=t[n],r(i.value,{componentStack:i.stack,digest:i.digest});if(Hs)throw Hs=!1,e=Ys,Ys=null,e;0!==(1&Qs)&&0!==e.tag&&Su(),a=e.pendingLanes,0!==(1&a)?e===Js?Gs++:(Gs=0,Js=e):Gs=0,ji()}(e,t,n,r)}finally{Cs.transition=i,bt=r}return null}function Su(){if(null!==qs){var e=wt(Qs),t=Cs.transition,n=bt;try{if(Cs.transition=null,bt=16>e?16:e,null===qs)var r=!1;else{if(e=qs,qs=null,Qs=0,0!==(6&Is))throw Error(o(331));var i=Is;for(Is|=4,Kl=e.current;null!==Kl;){var a=Kl,l=a.child;if(0!==(16&Kl.flags)){var s=a.deletions;if(null!==s){for(var u=0;u<s.length;u++){var c=s[u];for(Kl=c;null!==Kl;){var f=Kl;switch(f.tag){case 0:case 11:case 15:ns(8,f,a)}var d=f.child;if(null!==d)d.return=f,Kl=d;else for(;null!==Kl;){var h=(f=Kl).sibling,p=f.return;if(os(f),f===c){Kl=null;break}if(null!==h){h.return=p,Kl=h;break}Kl=p}}}var y=a.alternate;if(null!==y){var m=y.child;if(null!==m){y.child=null;do{var g=m.sibling;m.sibling=null,m=g}while(null!==m)}}Kl=a}}if(0!==(2064&a.subtreeFlags)&&null!==l)l.return=a,Kl=l;else e:for(;null!==Kl;){if(0!==(2048&(a=Kl).flags))switch(a.tag){case 0:case 11:case 15:ns(9,a,a.return)}var v=a.sibling;if(null!==v){v.return=a.return,Kl=v;break e}Kl=a.return}}var b=e.current;for(Kl=b;null!==Kl;){var w=(l=Kl).child;if(0!==(2064&l.subtreeFlags)&&null!==w)w.return=l,Kl=w;else e:for(l=b;null!==Kl;){if(0!==(2048&(s=Kl).flags))try{switch(s.tag){case 0:case 11:case 15:rs(9,s)}}catch(S){ku(s,s.return,S)}if(s===l){Kl=null;break e}var x=s.sibling;if(null!==x){x.return=s.return,Kl=x;break e}Kl=s.return}}if(Is=i,ji(),ot&&"function"===typeof ot.onPostCommitFiberRoot)try{ot.onPostCommitFiberRoot(it,e)}catch(S){}r=!0}return r}finally{bt=n,Cs.transition=t}}return!1}function _u(e,t,n){e=Ro(e,t=hl(0,t=ul(n,t),1),1),t=eu(),null!==e&&(gt(e,1,t),ru(e,t))}function ku(e,t,n){if(3===e.tag)_u(e,e,n);else for(;null!==t;){if(3===t.tag){_u(t,e,n);break}if(1===t.tag){var r=t.stateNode;if("function"===typeof t.type.getDerivedStateFromError||"function"===typeof r.componentDidCatch&&(null===Ws||!Ws.has(r))){t=Ro(t,e=pl(t,e=ul(n,e),1),1),e=eu(),null!==t&&(gt(t,1,e),ru(t,e));break}}t=t.return}}function Tu(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),t=eu(),e.pingedLanes|=e.suspendedLanes&n,Ms===e&&(As&n)===n&&(4===Ds||3===Ds&&(130023424&As)===As&&500>Je()-Us?du(e,0):Bs|=n),ru(e,t)}function Eu(e,t){0===t&&(0===(1&e.mode)?t=1:(t=ct,0===(130023424&(ct<<=1))&&(ct=4194304)));var n=eu();null!==(e=$o(e,t))&&(gt(e,t,n),ru(e,n))}function Cu(e){var t=e.memoizedState,n=0;null!==t&&(n=t.retryLane),Eu(e,n)}function Iu(e,t){var n=0;switch(e.tag){case 13:var r=e.stateNode,i=e.memoizedState;null!==i&&(n=i.retryLane);break;case 19:r=e.stateNode;break;default:throw Error(o(314))}null!==r&&r.delete(t),Eu(e,n)}function Mu(e,t){return Xe(e,t)}function Nu(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Au(e,t,n,r){return new Nu(e,t,n,r)}function Ou(e){return!(!(e=e.prototype)||!e.isReactComponent)}function zu(e,t){var n=e.alternate;return null===n?((n=Au(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=14680064&e.flags,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Du(e,t,n,r,i,a){var l=2;if(r=e,"function"===typeof e)Ou(e)&&(l=1);else if("string"===typeof e)l=5;else e:switch(e){case _:return $u(n.children,i,a,t);case k:l=8,i|=8;break;case T:return(e=Au(12,n,t,2|i)).elementType=T,e.lanes=a,e;case M:return(e=Au(13,n,t,i)).elementType=M,e.lanes=a,e;case N:return(e=Au(19,n,t,i)).elementType=N,e.lanes=a,e;case z:return Pu(n,i,a,t);default:if("object"===typeof e&&null!==e)switch(e.$$typeof){case E:l=10;break e;case C:l=9;break e;case I:l=11;break e;case A:l=14;break e;case O:l=16,r=null;break e}throw Error(o(130,null==e?e:typeof e,""))}return(t=Au(l,n,t,i)).elementType=e,t.type=r,t.lanes=a,t}function $u(e,t,n,r){return(e=Au(7,e,r,t)).lanes=n,e}function Pu(e,t,n,r){return(e=Au(22,e,r,t)).elementType=z,e.lanes=n,e.stateNode={isHidden:!1},e}function Lu(e,t,n){return(e=Au(6,e,null,t)).lanes=n,e}function Bu(e,t,n){return(t=Au(4,null!==e.children?e.children:[],e.key,t)).lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Fu(e,t,n,r,i){this.tag=t,this.containerInfo=e,this.finishedWork=this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.pendingContext=this.context=null,this.callbackPriority=0,this.eventTimes=mt(0),this.expirationTimes=mt(-1),this.entangledLanes=this.finishedLanes=this.mutableReadLanes=this.expiredLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=mt(0),this.identifierPrefix=r,this.onRecoverableError=i,this.mutableSourceEagerHydrationData=null}function Ru(e,t,n,r,i,o,a,l,s){return e=new Fu(e,t,n,l,s),1===t?(t=1,!0===o&&(t|=8)):t=0,o=Au(3,null,null,t),e.current=o,o.stateNode=e,o.memoizedState={element:r,isDehydrated:n,cache:null,transitions:null,pendingSuspenseBoundaries:null},Lo(o),e}function Uu(e){if(!e)return Ci;e:{if(je(e=e._reactInternals)!==e||1!==e.tag)throw Error(o(170));var t=e;do{switch(t.tag){case 3:t=t.stateNode.context;break e;case 1:if(Oi(t.type)){t=t.stateNode.__reactInternalMemoizedMergedChildContext;break e}}t=t.return}while(null!==t);throw Error(o(171))}if(1===e.tag){var n=e.type;if(Oi(n))return $i(e,n,t)}return t}function ju(e,t,n,r,i,o,a,l,s){return(e=Ru(n,r,!0,e,0,o,0,l,s)).context=Uu(null),n=e.current,(o=Fo(r=eu(),i=tu(n))).callback=void 0!==t&&null!==t?t:null,Ro(n,o,i),e.current.lanes=i,gt(e,i,r),ru(e,r),e}function Vu(e,t,n,r){var i=t.current,o=eu(),a=tu(i);return n=Uu(n),null===t.context?t.context=n:t.pendingContext=n,(t=Fo(o,a)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),null!==(e=Ro(i,t,a))&&(nu(e,i,a,o),Uo(e,i,a)),a}function Hu(e){return(e=e.current).child?(e.child.tag,e.child.stateNode):null}function Yu(e,t){if(null!==(e=e.memoizedState)&&null!==e.dehydrated){var n=e.retryLane;e.retryLane=0!==n&&n<t?n:t}}function Wu(e,t){Yu(e,t),(e=e.alternate)&&Yu(e,t)}_s=function(e,t,n){if(null!==e)if(e.memoizedProps!==t.pendingProps||Mi.current)bl=!0;else{if(0===(e.lanes&n)&&0===(128&t.flags))return bl=!1,function(e,t,n){switch(t.tag){case 3:Ml(t),po();break;case 5:Ko(t);break;case 1:Oi(t.type)&&Pi(t);break;case 4:Go(t,t.stateNode.containerInfo);break;case 10:var r=t.type._context,i=t.memoizedProps.value;Ei(_o,r._currentValue),r._currentValue=i;break;case 13:if(null!==(r=t.memoizedState))return null!==r.dehydrated?(Ei(ea,1&ea.current),t.flags|=128,null):0!==(n&t.child.childLanes)?Ll(e,t,n):(Ei(ea,1&ea.current),null!==(e=Hl(e,t,n))?e.sibling:null);Ei(ea,1&ea.current);break;case 19:if(r=0!==(n&t.childLanes),0!==(128&e.flags)){if(r)return jl(e,t,n);t.flags|=128}if(null!==(i=t.memoizedState)&&(i.rendering=null,i.tail=null,i.lastEffect=null),Ei(ea,ea.current),r)break;return null;case 22:case 23:return t.lanes=0,kl(e,t,n)}return Hl(e,t,n)}(e,t,n);bl=0!==(131072&e.flags)}else bl=!1,io&&0!==(1048576&t.flags)&&Zi(t,Wi,t.index);switch(t.lanes=0,t.tag){case 2:var r=t.type;Vl(e,t),e=t.pendingProps;var i=Ai(t,Ii.current);No(t,n),i=ma(null,t,r,e,i,n);var a=ga();return t.flags|=1,"object"===typeof i&&null!==i&&"function"===typeof i.render&&void 0===i.$$typeof?(t.tag=1,t.memoizedState=null,t.updateQueue=null,Oi(r)?(a=!0,Pi(t)):a=!1,t.memoizedState=null!==i.state&&void 0!==i.state?i.state:null,Lo(t),i.updater=il,t.stateNode=i,i._reactInternals=t,sl(t,r,e,n),t=Il(null,t,r,!0,a,n)):(t.tag=0,io&&a&&eo(t),wl(null,t,i,n),t=t.child),t;case 16:r=t.elementType;e:{switch(Vl(e,t),e=t.pendingProps,r=(i=r._init)(r._payload),t.type=r,i=t.tag=function(e){if("function"===typeof e)return Ou(e)?1:0;if(void 0!==e&&null!==e){if((e=e.$$typeof)===I)return 11;if(e===A)return 14}return 2}(r),e=nl(r,e),i){case 0:t=El(null,t,r,e,n);break e;case 1:t=Cl(null,t,r,e,n);break e;case 11:t=xl(null,t,r,e,n);break e;case 14:t=Sl(null,t,r,nl(r.type,e),n);break e}throw Error(o(306,r,""))}return t;case 0:return r=t.type,i=t.pendingProps,El(e,t,r,i=t.elementType===r?i:nl(r,i),n);case 1:return r=t.type,i=t.pendingProps,Cl(e,t,r,i=t.elementType===r?i:nl(r,i),n);case 3:e:{if(Ml(t),null===e)throw Error(o(387));r=t.pendingProps,i=(a=t.memoizedState).element,Bo(e,t),Vo(t,r,null,n);var l=t.memoizedState;if(r=l.element,a.isDehydrated){if(a={element:r,isDehydrated:!1,cache:l.cache,pendingSuspenseBoundaries:l.pendingSuspenseBoundaries,transitions:l.transitions},t.updateQueue.baseState=a,t.memoizedState=a,256&t.flags){t=Nl(e,t,r,n,i=ul(Error(o(423)),t));break e}if(r!==i){t=Nl(e,t,r,n,i=ul(Error(o(424)),t));break e}for(ro=ui(t.stateNode.containerInfo.firstChild),no=t,io=!0,oo=null,n=So(t,null,r,n),t.child=n;n;)n.flags=-3&n.flags|4096,n=n.sibling}else{if(po(),r===i){t=Hl(e,t,n);break e}wl(e,t,r,n)}t=t.child}return t;case 5:return Ko(t),null===e&&uo(t),r=t.type,i=t.pendingProps,a=null!==e?e.memoizedProps:null,l=i.children,ni(r,i)?l=null:null!==a&&ni(r,a)&&(t.flags|=32),Tl(e,t),wl(e,t,l,n),t.child;case 6:return null===e&&uo(t),null;case 13:return Ll(e,t,n);case 4:return Go(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=xo(t,null,r,n):wl(e,t,r,n),t.child;case 11:return r=t.type,i=t.pendingProps,xl(e,t,r,i=t.elementType===r?i:nl(r,i),n);case 7:return wl(e,t,t.pendingProps,n),t.child;case 8:case 12:return wl(e,t,t.pendingProps.children,n),t.child;case 10:e:{if(r=t.type._context,i=t.pendingProps,a=t.memoizedProps,l=i.value,Ei(_o,r._currentValue),r._currentValue=l,null!==a)if(lr(a.value,l)){if(a.children===i.children&&!Mi.current){t=Hl(e,t,n);break e}}else for(null!==(a=t.child)&&(a.return=t);null!==a;){var s=a.dependencies;if(null!==s){l=a.child;for(var u=s.firstContext;null!==u;){if(u.context===r){if(1===a.tag){(u=Fo(-1,n&-n)).tag=2;var c=a.updateQueue;if(null!==c){var f=(c=c.shared).pending;null===f?u.next=u:(u.next=f.next,f.next=u),c.pending=u}}a.lanes|=n,null!==(u=a.alternate)&&(u.lanes|=n),Mo(a.return,n,t),s.lanes|=n;break}u=u.next}}else if(10===a.tag)l=a.type===t.type?null:a.child;else if(18===a.tag){if(null===(l=a.return))throw Error(o(341));l.lanes|=n,null!==(s=l.alternate)&&(s.lanes|=n),Mo(l,n,t),l=a.sibling}else l=a.child;if(null!==l)l.return=a;else for(l=a;null!==l;){if(l===t){l=null;break}if(null!==(a=l.sibling)){a.return=l.return,l=a;break}l=l.return}a=l}wl(e,t,i.children,n),t=t.child}return t;case 9:return i=t.type,r=t.pendingProps.children,No(t,n),r=r(i=Ao(i)),t.flags|=1,wl(e,t,r,n),t.child;case 14:return i=nl(r=t.type,t.pendingProps),Sl(e,t,r,i=nl(r.type,i),n);case 15:return _l(e,t,t.type,t.pendingProps,n);case 17:return r=t.type,i=t.pendingProps,i=t.elementType===r?i:nl(r,i),Vl(e,t),t.tag=1,Oi(r)?(e=!0,Pi(t)):e=!1,No(t,n),al(t,r,i),sl(t,r,i,n),Il(null,t,r,!0,e,n);case 19:return jl(e,t,n);case 22:return kl(e,t,n)}throw Error(o(156,t.tag))};var Xu="function"===typeof reportError?reportError:function(e){console.error(e)};function qu(e){this._internalRoot=e}function Qu(e){this._internalRoot=e}function Gu(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType)}function Ju(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function Ku(){}function Zu(e,t,n,r,i){var o=n._reactRootContainer;if(o){var a=o;if("function"===typeof i){var l=i;i=function(){var e=Hu(a);l.call(e)}}Vu(t,a,e,i)}else a=function(e,t,n,r,i){if(i){if("function"===typeof r){var o=r;r=function(){var e=Hu(a);o.call(e)}}var a=ju(t,r,e,0,null,!1,0,"",Ku);return e._reactRootContainer=a,e[pi]=a.current,jr(8===e.nodeType?e.parentNode:e),cu(),a}for(;i=e.lastChild;)e.removeChild(i);if("function"===typeof r){var l=r;r=function(){var e=Hu(s);l.call(e)}}var s=Ru(e,0,!1,null,0,!1,0,"",Ku);return e._reactRootContainer=s,e[pi]=s.current,jr(8===e.nodeType?e.parentNode:e),cu(function(){Vu(t,s,n,r)}),s}(n,t,e,i,r);return Hu(a)}Qu.prototype.render=qu.prototype.render=function(e){var t=this._internalRoot;if(null===t)throw Error(o(409));Vu(e,t,null,null)},Qu.prototype.unmount=qu.prototype.unmount=function(){var e=this._internalRoot;if(null!==e){this._internalRoot=null;var t=e.containerInfo;cu(function(){Vu(null,e,null,null)}),t[pi]=null}},Qu.prototype.unstable_scheduleHydration=function(e){if(e){var t=kt();e={blockedOn:null,target:e,priority:t};for(var n=0;n<zt.length&&0!==t&&t<zt[n].priority;n++);zt.splice(n,0,e),0===n&&Lt(e)}},xt=function(e){switch(e.tag){case 3:var t=e.stateNode;if(t.current.memoizedState.isDehydrated){var n=ft(t.pendingLanes);0!==n&&(vt(t,1|n),ru(t,Je()),0===(6&Is)&&(js=Je()+500,ji()))}break;case 13:cu(function(){var t=$o(e,1);if(null!==t){var n=eu();nu(t,e,1,n)}}),Wu(e,1)}},St=function(e){if(13===e.tag){var t=$o(e,134217728);if(null!==t)nu(t,e,134217728,eu());Wu(e,134217728)}},_t=function(e){if(13===e.tag){var t=tu(e),n=$o(e,t);if(null!==n)nu(n,e,t,eu());Wu(e,t)}},kt=function(){return bt},Tt=function(e,t){var n=bt;try{return bt=e,t()}finally{bt=n}},Se=function(e,t,n){switch(t){case"input":if(K(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var i=xi(r);if(!i)throw Error(o(90));X(r),K(r,i)}}}break;case"textarea":oe(e,n);break;case"select":null!=(t=n.value)&&ne(e,!!n.multiple,t,!1)}},Ie=uu,Me=cu;var ec={usingClientEntryPoint:!1,Events:[bi,wi,xi,Ee,Ce,uu]},tc={findFiberByHostInstance:vi,bundleType:0,version:"18.3.1",rendererPackageName:"react-dom"},nc={bundleType:tc.bundleType,version:tc.version,rendererPackageName:tc.rendererPackageName,rendererConfig:tc.rendererConfig,overrideHookState:null,overrideHookStateDeletePath:null,overrideHookStateRenamePath:null,overrideProps:null,overridePropsDeletePath:null,overridePropsRenamePath:null,setErrorHandler:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:w.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=Ye(e))?null:e.stateNode},findFiberByHostInstance:tc.findFiberByHostInstance||function(){return null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null,reconcilerVersion:"18.3.1-next-f1338f8080-20240426"};if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__){var rc=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!rc.isDisabled&&rc.supportsFiber)try{it=rc.inject(nc),ot=rc}catch(ce){}}t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=ec,t.createPortal=function(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Gu(t))throw Error(o(200));return function(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:S,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}(e,t,null,n)},t.createRoot=function(e,t){if(!Gu(e))throw Error(o(299));var n=!1,r="",i=Xu;return null!==t&&void 0!==t&&(!0===t.unstable_strictMode&&(n=!0),void 0!==t.identifierPrefix&&(r=t.identifierPrefix),void 0!==t.onRecoverableError&&(i=t.onRecoverableError)),t=Ru(e,1,!1,null,0,n,0,r,i),e[pi]=t.current,jr(8===e.nodeType?e.parentNode:e),new qu(t)},t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternals;if(void 0===t){if("function"===typeof e.render)throw Error(o(188));throw e=Object.keys(e).join(","),Error(o(268,e))}return e=null===(e=Ye(t))?null:e.stateNode},t.flushSync=function(e){return cu(e)},t.hydrate=function(e,t,n){if(!Ju(t))throw Error(o(200));return Zu(null,e,t,!0,n)},t.hydrateRoot=function(e,t,n){if(!Gu(e))throw Error(o(405));var r=null!=n&&n.hydratedSources||null,i=!1,a="",l=Xu;if(null!==n&&void 0!==n&&(!0===n.unstable_strictMode&&(i=!0),void 0!==n.identifierPrefix&&(a=n.identifierPrefix),void 0!==n.onRecoverableError&&(l=n.onRecoverableError)),t=ju(t,null,e,1,null!=n?n:null,i,0,a,l),e[pi]=t.current,jr(e),r)for(e=0;e<r.length;e++)i=(i=(n=r[e])._getVersion)(n._source),null==t.mutableSourceEagerHydrationData?t.mutableSourceEagerHydrationData=[n,i]:t.mutableSourceEagerHydrationData.push(n,i);return new Qu(t)},t.render=function(e,t,n){if(!Ju(t))throw Error(o(200));return Zu(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Ju(e))throw Error(o(40));return!!e._reactRootContainer&&(cu(function(){Zu(null,null,e,!1,function(){e._reactRootContainer=null,e[pi]=null})}),!0)},t.unstable_batchedUpdates=uu,t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Ju(n))throw Error(o(200));if(null==e||void 0===e._reactInternals)throw Error(o(38));return Zu(e,t,n,!1,r)},t.version="18.3.1-next-f1338f8080-20240426"},739:(e,t,n)=>{var r=n(123),i="function"===typeof Symbol&&Symbol.for,o=i?Symbol.for("react.element"):60103,a=i?Symbol.for("react.portal"):60106,l=i?Symbol.for("react.fragment"):60107,s=i?Symbol.for("react.strict_mode"):60108,u=i?Symbol.for("react.profiler"):60114,c=i?Symbol.for("react.provider"):60109,f=i?Symbol.for("react.context"):60110,d=i?Symbol.for("react.forward_ref"):60112,h=i?Symbol.for("react.suspense"):60113,p=i?Symbol.for("react.memo"):60115,y=i?Symbol.for("react.lazy"):60116,m="function"===typeof Symbol&&Symbol.iterator;function g(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var v={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},b={};function w(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||v}function x(){}function S(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||v}w.prototype.isReactComponent={},w.prototype.setState=function(e,t){if("object"!==typeof e&&"function"!==typeof e&&null!=e)throw Error(g(85));this.updater.enqueueSetState(this,e,t,"setState")},w.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},x.prototype=w.prototype;var _=S.prototype=new x;_.constructor=S,r(_,w.prototype),_.isPureReactComponent=!0;var k={current:null},T=Object.prototype.hasOwnProperty,E={key:!0,ref:!0,__self:!0,__source:!0};function C(e,t,n){var r,i={},a=null,l=null;if(null!=t)for(r in void 0!==t.ref&&(l=t.ref),void 0!==t.key&&(a=""+t.key),t)T.call(t,r)&&!E.hasOwnProperty(r)&&(i[r]=t[r]);var s=arguments.length-2;if(1===s)i.children=n;else if(1<s){for(var u=Array(s),c=0;c<s;c++)u[c]=arguments[c+2];i.children=u}if(e&&e.defaultProps)for(r in s=e.defaultProps)void 0===i[r]&&(i[r]=s[r]);return{$$typeof:o,type:e,key:a,ref:l,props:i,_owner:k.current}}function I(e){return"object"===typeof e&&null!==e&&e.$$typeof===o}var M=/\/+/g,N=[];function A(e,t,n,r){if(N.length){var i=N.pop();return i.result=e,i.keyPrefix=t,i.func=n,i.context=r,i.count=0,i}return{result:e,keyPrefix:t,func:n,context:r,count:0}}function O(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>N.length&&N.push(e)}function z(e,t,n,r){var i=typeof e;"undefined"!==i&&"boolean"!==i||(e=null);var l=!1;if(null===e)l=!0;else switch(i){case"string":case"number":l=!0;break;case"object":switch(e.$$typeof){case o:case a:l=!0}}if(l)return n(r,e,""===t?"."+$(e,0):t),1;if(l=0,t=""===t?".":t+":",Array.isArray(e))for(var s=0;s<e.length;s++){var u=t+$(i=e[s],s);l+=z(i,u,n,r)}else if(null===e||"object"!==typeof e?u=null:u="function"===typeof(u=m&&e[m]||e["@@iterator"])?u:null,"function"===typeof u)for(e=u.call(e),s=0;!(i=e.next()).done;)l+=z(i=i.value,u=t+$(i,s++),n,r);else if("object"===i)throw n=""+e,Error(g(31,"[object Object]"===n?"object with keys {"+Object.keys(e).join(", ")+"}":n,""));return l}function D(e,t,n){return null==e?0:z(e,"",t,n)}function $(e,t){return"object"===typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,function(e){return t[e]})}(e.key):t.toString(36)}function P(e,t){e.func.call(e.context,t,e.count++)}function L(e,t,n){var r=e.result,i=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?B(e,r,n,function(e){return e}):null!=e&&(I(e)&&(e=function(e,t){return{$$typeof:o,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(e,i+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(M,"$&/")+"/")+n)),r.push(e))}function B(e,t,n,r,i){var o="";null!=n&&(o=(""+n).replace(M,"$&/")+"/"),D(e,L,t=A(t,o,r,i)),O(t)}var F={current:null};function R(){var e=F.current;if(null===e)throw Error(g(321));return e}var U={ReactCurrentDispatcher:F,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:k,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:function(e,t,n){if(null==e)return e;var r=[];return B(e,r,null,t,n),r},forEach:function(e,t,n){if(null==e)return e;D(e,P,t=A(null,null,t,n)),O(t)},count:function(e){return D(e,function(){return null},null)},toArray:function(e){var t=[];return B(e,t,null,function(e){return e}),t},only:function(e){if(!I(e))throw Error(g(143));return e}},t.Component=w,t.Fragment=l,t.Profiler=u,t.PureComponent=S,t.StrictMode=s,t.Suspense=h,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=U,t.cloneElement=function(e,t,n){if(null===e||void 0===e)throw Error(g(267,e));var i=r({},e.props),a=e.key,l=e.ref,s=e._owner;if(null!=t){if(void 0!==t.ref&&(l=t.ref,s=k.current),void 0!==t.key&&(a=""+t.key),e.type&&e.type.defaultProps)var u=e.type.defaultProps;for(c in t)T.call(t,c)&&!E.hasOwnProperty(c)&&(i[c]=void 0===t[c]&&void 0!==u?u[c]:t[c])}var c=arguments.length-2;if(1===c)i.children=n;else if(1<c){u=Array(c);for(var f=0;f<c;f++)u[f]=arguments[f+2];i.children=u}return{$$typeof:o,type:e.type,key:a,ref:l,props:i,_owner:s}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:f,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:c,_context:e},e.Consumer=e},t.createElement=C,t.createFactory=function(e){var t=C.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:d,render:e}},t.isValidElement=I,t.lazy=function(e){return{$$typeof:y,_ctor:e,_status:-1,_result:null}},t.memo=function(e,t){return{$$typeof:p,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return R().useCallback(e,t)},t.useContext=function(e,t){return R().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return R().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return R().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return R().useLayoutEffect(e,t)},t.useMemo=function(e,t){return R().useMemo(e,t)},t.useReducer=function(e,t,n){return R().useReducer(e,t,n)},t.useRef=function(e){return R().useRef(e)},t.useState=function(e){return R().useState(e)},t.version="16.14.0"},853:(e,t,n)=>{e.exports=n(234)},904:(e,t,n)=>{e.exports=n(739)},950:(e,t,n)=>{!function e(){if("undefined"!==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"===typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE)try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(t){console.error(t)}}(),e.exports=n(730)}},t={};function n(r){var i=t[r];if(void 0!==i)return i.exports;var o=t[r]={exports:{}};return e[r](o,o.exports,n),o.exports}n.n=e=>{var t=e&&e.__esModule?()=>e.default:()=>e;return n.d(t,{a:t}),t},n.d=(e,t)=>{for(var r in t)n.o(t,r)&&!n.o(e,r)&&Object.defineProperty(e,r,{enumerable:!0,get:t[r]})},n.o=(e,t)=>Object.prototype.hasOwnProperty.call(e,t);var r=n(43),i=n(391),o=n(219),a=n.n(o),l=n(904);const s=new WeakMap,u=new WeakMap;function c(e){const t=s.get(e);return console.assert(null!=t,"'this' is expected an Event object, but got",e),t}function f(e){null==e.passiveListener?e.event.cancelable&&(e.canceled=!0,"function"===typeof e.event.preventDefault&&e.event.preventDefault()):"undefined"!==typeof console&&"function"===typeof console.error&&console.error("Unable to preventDefault inside passive event listener invocation.",e.passiveListener)}function d(e,t){s.set(this,{eventTarget:e,event:t,eventPhase:2,currentTarget:e,canceled:!1,stopped:!1,immediateStopped:!1,passiveListener:null,timeStamp:t.timeStamp||Date.now()}),Object.defineProperty(this,"isTrusted",{value:!1,enumerable:!0});const n=Object.keys(t);for(let r=0;r<n.length;++r){const e=n[r];e in this||Object.defineProperty(this,e,h(e))}}function h(e){return{get(){return c(this).event[e]},set(t){c(this).event[e]=t},configurable:!0,enumerable:!0}}function p(e){return{value(){const t=c(this).event;return t[e].apply(t,arguments)},configurable:!0,enumerable:!0}}function y(e){if(null==e||e===Object.prototype)return d;let t=u.get(e);return null==t&&(t=function(e,t){const n=Object.keys(t);if(0===n.length)return e;function r(t,n){e.call(this,t,n)}r.prototype=Object.create(e.prototype,{constructor:{value:r,configurable:!0,writable:!0}});for(let i=0;i<n.length;++i){const o=n[i];if(!(o in e.prototype)){const e="function"===typeof Object.getOwnPropertyDescriptor(t,o).value;Object.defineProperty(r.prototype,o,e?p(o):h(o))}}return r}(y(Object.getPrototypeOf(e)),e),u.set(e,t)),t}function m(e){return c(e).immediateStopped}function g(e,t){c(e).passiveListener=t}d.prototype={get type(){return c(this).event.type},get target(){return c(this).eventTarget},get currentTarget(){return c(this).currentTarget},composedPath(){const e=c(this).currentTarget;return null==e?[]:[e]},get NONE(){return 0},get CAPTURING_PHASE(){return 1},get AT_TARGET(){return 2},get BUBBLING_PHASE(){return 3},get eventPhase(){return c(this).eventPhase},stopPropagation(){const e=c(this);e.stopped=!0,"function"===typeof e.event.stopPropagation&&e.event.stopPropagation()},stopImmediatePropagation(){const e=c(this);e.stopped=!0,e.immediateStopped=!0,"function"===typeof e.event.stopImmediatePropagation&&e.event.stopImmediatePropagation()},get bubbles(){return Boolean(c(this).event.bubbles)},get cancelable(){return Boolean(c(this).event.cancelable)},preventDefault(){f(c(this))},get defaultPrevented(){return c(this).canceled},get composed(){return Boolean(c(this).event.composed)},get timeStamp(){return c(this).timeStamp},get srcElement(){return c(this).eventTarget},get cancelBubble(){return c(this).stopped},set cancelBubble(e){if(!e)return;const t=c(this);t.stopped=!0,"boolean"===typeof t.event.cancelBubble&&(t.event.cancelBubble=!0)},get returnValue(){return!c(this).canceled},set returnValue(e){e||f(c(this))},initEvent(){}},Object.defineProperty(d.prototype,"constructor",{value:d,configurable:!0,writable:!0}),"undefined"!==typeof window&&"undefined"!==typeof window.Event&&(Object.setPrototypeOf(d.prototype,window.Event.prototype),u.set(window.Event.prototype,d));const v=new WeakMap;function b(e){return null!==e&&"object"===typeof e}function w(e){const t=v.get(e);if(null==t)throw new TypeError("'this' is expected an EventTarget object, but got another value.");return t}function x(e,t){Object.defineProperty(e,`on${t}`,function(e){return{get(){let t=w(this).get(e);for(;null!=t;){if(3===t.listenerType)return t.listener;t=t.next}return null},set(t){"function"===typeof t||b(t)||(t=null);const n=w(this);let r=null,i=n.get(e);for(;null!=i;)3===i.listenerType?null!==r?r.next=i.next:null!==i.next?n.set(e,i.next):n.delete(e):r=i,i=i.next;if(null!==t){const i={listener:t,listenerType:3,passive:!1,once:!1,next:null};null===r?n.set(e,i):r.next=i}},configurable:!0,enumerable:!0}}(t))}function S(e){function t(){_.call(this)}t.prototype=Object.create(_.prototype,{constructor:{value:t,configurable:!0,writable:!0}});for(let n=0;n<e.length;++n)x(t.prototype,e[n]);return t}function _(){if(!(this instanceof _)){if(1===arguments.length&&Array.isArray(arguments[0]))return S(arguments[0]);if(arguments.length>0){const e=new Array(arguments.length);for(let t=0;t<arguments.length;++t)e[t]=arguments[t];return S(e)}throw new TypeError("Cannot call a class as a function")}v.set(this,new Map)}_.prototype={addEventListener(e,t,n){if(null==t)return;if("function"!==typeof t&&!b(t))throw new TypeError("'listener' should be a function or an object.");const r=w(this),i=b(n),o=(i?Boolean(n.capture):Boolean(n))?1:2,a={listener:t,listenerType:o,passive:i&&Boolean(n.passive),once:i&&Boolean(n.once),next:null};let l=r.get(e);if(void 0===l)return void r.set(e,a);let s=null;for(;null!=l;){if(l.listener===t&&l.listenerType===o)return;s=l,l=l.next}s.next=a},removeEventListener(e,t,n){if(null==t)return;const r=w(this),i=(b(n)?Boolean(n.capture):Boolean(n))?1:2;let o=null,a=r.get(e);for(;null!=a;){if(a.listener===t&&a.listenerType===i)return void(null!==o?o.next=a.next:null!==a.next?r.set(e,a.next):r.delete(e));o=a,a=a.next}},dispatchEvent(e){if(null==e||"string"!==typeof e.type)throw new TypeError('"event.type" should be a string.');const t=w(this),n=e.type;let r=t.get(n);if(null==r)return!0;const i=function(e,t){return new(y(Object.getPrototypeOf(t)))(e,t)}(this,e);let o=null;for(;null!=r;){if(r.once?null!==o?o.next=r.next:null!==r.next?t.set(n,r.next):t.delete(n):o=r,g(i,r.passive?r.listener:null),"function"===typeof r.listener)try{r.listener.call(this,i)}catch(a){"undefined"!==typeof console&&"function"===typeof console.error&&console.error(a)}else 3!==r.listenerType&&"function"===typeof r.listener.handleEvent&&r.listener.handleEvent(i);if(m(i))break;r=r.next}return g(i,null),function(e,t){c(e).eventPhase=t}(i,0),function(e,t){c(e).currentTarget=t}(i,null),!i.defaultPrevented}},Object.defineProperty(_.prototype,"constructor",{value:_,configurable:!0,writable:!0}),"undefined"!==typeof window&&"undefined"!==typeof window.EventTarget&&Object.setPrototypeOf(_.prototype,window.EventTarget.prototype);var k,T,E,C,I,M,N,A,O;!function(e){e[e.V1=0]="V1",e[e.V2=1]="V2",e[e.V3=2]="V3",e[e.V4=3]="V4",e[e.V5=4]="V5"}(k||(k={})),function(e){e[e.Sparse=0]="Sparse",e[e.Dense=1]="Dense"}(T||(T={})),function(e){e[e.HALF=0]="HALF",e[e.SINGLE=1]="SINGLE",e[e.DOUBLE=2]="DOUBLE"}(E||(E={})),function(e){e[e.DAY=0]="DAY",e[e.MILLISECOND=1]="MILLISECOND"}(C||(C={})),function(e){e[e.SECOND=0]="SECOND",e[e.MILLISECOND=1]="MILLISECOND",e[e.MICROSECOND=2]="MICROSECOND",e[e.NANOSECOND=3]="NANOSECOND"}(I||(I={})),function(e){e[e.YEAR_MONTH=0]="YEAR_MONTH",e[e.DAY_TIME=1]="DAY_TIME",e[e.MONTH_DAY_NANO=2]="MONTH_DAY_NANO"}(M||(M={})),function(e){e[e.NONE=0]="NONE",e[e.Schema=1]="Schema",e[e.DictionaryBatch=2]="DictionaryBatch",e[e.RecordBatch=3]="RecordBatch",e[e.Tensor=4]="Tensor",e[e.SparseTensor=5]="SparseTensor"}(N||(N={})),function(e){e[e.NONE=0]="NONE",e[e.Null=1]="Null",e[e.Int=2]="Int",e[e.Float=3]="Float",e[e.Binary=4]="Binary",e[e.Utf8=5]="Utf8",e[e.Bool=6]="Bool",e[e.Decimal=7]="Decimal",e[e.Date=8]="Date",e[e.Time=9]="Time",e[e.Timestamp=10]="Timestamp",e[e.Interval=11]="Interval",e[e.List=12]="List",e[e.Struct=13]="Struct",e[e.Union=14]="Union",e[e.FixedSizeBinary=15]="FixedSizeBinary",e[e.FixedSizeList=16]="FixedSizeList",e[e.Map=17]="Map",e[e.Dictionary=-1]="Dictionary",e[e.Int8=-2]="Int8",e[e.Int16=-3]="Int16",e[e.Int32=-4]="Int32",e[e.Int64=-5]="Int64",e[e.Uint8=-6]="Uint8",e[e.Uint16=-7]="Uint16",e[e.Uint32=-8]="Uint32",e[e.Uint64=-9]="Uint64",e[e.Float16=-10]="Float16",e[e.Float32=-11]="Float32",e[e.Float64=-12]="Float64",e[e.DateDay=-13]="DateDay",e[e.DateMillisecond=-14]="DateMillisecond",e[e.TimestampSecond=-15]="TimestampSecond",e[e.TimestampMillisecond=-16]="TimestampMillisecond",e[e.TimestampMicrosecond=-17]="TimestampMicrosecond",e[e.TimestampNanosecond=-18]="TimestampNanosecond",e[e.TimeSecond=-19]="TimeSecond",e[e.TimeMillisecond=-20]="TimeMillisecond",e[e.TimeMicrosecond=-21]="TimeMicrosecond",e[e.TimeNanosecond=-22]="TimeNanosecond",e[e.DenseUnion=-23]="DenseUnion",e[e.SparseUnion=-24]="SparseUnion",e[e.IntervalDayTime=-25]="IntervalDayTime",e[e.IntervalYearMonth=-26]="IntervalYearMonth"}(A||(A={})),function(e){e[e.OFFSET=0]="OFFSET",e[e.DATA=1]="DATA",e[e.VALIDITY=2]="VALIDITY",e[e.TYPE=3]="TYPE"}(O||(O={}));function z(e){if(null===e)return"null";if(undefined===e)return"undefined";switch(typeof e){case"number":case"bigint":return`${e}`;case"string":return`"${e}"`}return"function"===typeof e[Symbol.toPrimitive]?e[Symbol.toPrimitive]("string"):ArrayBuffer.isView(e)?e instanceof BigInt64Array||e instanceof BigUint64Array?`[${[...e].map(e=>z(e))}]`:`[${e}]`:ArrayBuffer.isView(e)?`[${e}]`:JSON.stringify(e,(e,t)=>"bigint"===typeof t?`${t}`:t)}const D=new TextDecoder("utf-8"),$=new TextEncoder,P=e=>$.encode(e),[L,B]=(()=>{const e=()=>{throw new Error("BigInt is not available in this environment")};function t(){throw e()}return t.asIntN=()=>{throw e()},t.asUintN=()=>{throw e()},"undefined"!==typeof BigInt?[BigInt,!0]:[t,!1]})(),[F,R]=(()=>{const e=()=>{throw new Error("BigInt64Array is not available in this environment")};return"undefined"!==typeof BigInt64Array?[BigInt64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),[U,j]=(()=>{const e=()=>{throw new Error("BigUint64Array is not available in this environment")};return"undefined"!==typeof BigUint64Array?[BigUint64Array,!0]:[class{static get BYTES_PER_ELEMENT(){return 8}static of(){throw e()}static from(){throw e()}constructor(){throw e()}},!1]})(),V=e=>"function"===typeof e,H=e=>null!=e&&Object(e)===e,Y="undefined"!==typeof SharedArrayBuffer?SharedArrayBuffer:ArrayBuffer;function W(e,t){let n=H(r=t)&&"done"in r&&"value"in r?t.value:t;var r;return n instanceof e?e===Uint8Array?new e(n.buffer,n.byteOffset,n.byteLength):n:n?("string"===typeof n&&(n=P(n)),n instanceof ArrayBuffer||n instanceof Y?new e(n):(e=>H(e)&&V(e.clear)&&V(e.bytes)&&V(e.position)&&V(e.setPosition)&&V(e.capacity)&&V(e.getBufferIdentifier)&&V(e.createLong))(n)?W(e,n.bytes()):ArrayBuffer.isView(n)?n.byteLength<=0?new e(0):new e(n.buffer,n.byteOffset,n.byteLength/e.BYTES_PER_ELEMENT):e.from(n)):new e(0)}const X=e=>W(Int32Array,e),q=e=>W(Uint8Array,e);const Q=Symbol.for("isArrowBigNum");function G(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return 0===n.length?Object.setPrototypeOf(W(this.TypedArray,e),this.constructor.prototype):Object.setPrototypeOf(new this.TypedArray(e,...n),this.constructor.prototype)}function J(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return G.apply(this,t)}function K(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return G.apply(this,t)}function Z(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return G.apply(this,t)}function ee(e){const{buffer:t,byteOffset:n,length:r,signed:i}=e,o=new U(t,n,r),a=i&&o[o.length-1]&BigInt(1)<<BigInt(63);let l=a?BigInt(1):BigInt(0),s=BigInt(0);if(a){for(const e of o)l+=~e*(BigInt(1)<<BigInt(32)*s++);l*=BigInt(-1)}else for(const u of o)l+=u*(BigInt(1)<<BigInt(32)*s++);return l}let te,ne;function re(e){let t="";const n=new Uint32Array(2);let r=new Uint16Array(e.buffer,e.byteOffset,e.byteLength/2);const i=new Uint32Array((r=new Uint16Array(r).reverse()).buffer);let o=-1;const a=r.length-1;do{for(n[0]=r[o=0];o<a;)r[o++]=n[1]=n[0]/10,n[0]=(n[0]-10*n[1]<<16)+r[o];r[o]=n[1]=n[0]/10,n[0]=n[0]-10*n[1],t=`${n[0]}${t}`}while(i[0]||i[1]||i[2]||i[3]);return t||"0"}G.prototype[Q]=!0,G.prototype.toJSON=function(){return`"${te(this)}"`},G.prototype.valueOf=function(){return ee(this)},G.prototype.toString=function(){return te(this)},G.prototype[Symbol.toPrimitive]=function(){switch(arguments.length>0&&void 0!==arguments[0]?arguments[0]:"default"){case"number":return ee(this);case"string":return te(this);case"default":return ne(this)}return te(this)},Object.setPrototypeOf(J.prototype,Object.create(Int32Array.prototype)),Object.setPrototypeOf(K.prototype,Object.create(Uint32Array.prototype)),Object.setPrototypeOf(Z.prototype,Object.create(Uint32Array.prototype)),Object.assign(J.prototype,G.prototype,{constructor:J,signed:!0,TypedArray:Int32Array,BigIntArray:F}),Object.assign(K.prototype,G.prototype,{constructor:K,signed:!1,TypedArray:Uint32Array,BigIntArray:U}),Object.assign(Z.prototype,G.prototype,{constructor:Z,signed:!0,TypedArray:Uint32Array,BigIntArray:U}),B?(ne=e=>8===e.byteLength?new e.BigIntArray(e.buffer,e.byteOffset,1)[0]:re(e),te=e=>8===e.byteLength?`${new e.BigIntArray(e.buffer,e.byteOffset,1)[0]}`:re(e)):(te=re,ne=te);class ie{static new(e,t){switch(t){case!0:return new J(e);case!1:return new K(e)}switch(e.constructor){case Int8Array:case Int16Array:case Int32Array:case F:return new J(e)}return 16===e.byteLength?new Z(e):new K(e)}static signed(e){return new J(e)}static unsigned(e){return new K(e)}static decimal(e){return new Z(e)}constructor(e,t){return ie.new(e,t)}}var oe,ae,le,se,ue,ce,fe,de,he,pe,ye;class me{static isNull(e){return(null===e||void 0===e?void 0:e.typeId)===A.Null}static isInt(e){return(null===e||void 0===e?void 0:e.typeId)===A.Int}static isFloat(e){return(null===e||void 0===e?void 0:e.typeId)===A.Float}static isBinary(e){return(null===e||void 0===e?void 0:e.typeId)===A.Binary}static isUtf8(e){return(null===e||void 0===e?void 0:e.typeId)===A.Utf8}static isBool(e){return(null===e||void 0===e?void 0:e.typeId)===A.Bool}static isDecimal(e){return(null===e||void 0===e?void 0:e.typeId)===A.Decimal}static isDate(e){return(null===e||void 0===e?void 0:e.typeId)===A.Date}static isTime(e){return(null===e||void 0===e?void 0:e.typeId)===A.Time}static isTimestamp(e){return(null===e||void 0===e?void 0:e.typeId)===A.Timestamp}static isInterval(e){return(null===e||void 0===e?void 0:e.typeId)===A.Interval}static isList(e){return(null===e||void 0===e?void 0:e.typeId)===A.List}static isStruct(e){return(null===e||void 0===e?void 0:e.typeId)===A.Struct}static isUnion(e){return(null===e||void 0===e?void 0:e.typeId)===A.Union}static isFixedSizeBinary(e){return(null===e||void 0===e?void 0:e.typeId)===A.FixedSizeBinary}static isFixedSizeList(e){return(null===e||void 0===e?void 0:e.typeId)===A.FixedSizeList}static isMap(e){return(null===e||void 0===e?void 0:e.typeId)===A.Map}static isDictionary(e){return(null===e||void 0===e?void 0:e.typeId)===A.Dictionary}static isDenseUnion(e){return me.isUnion(e)&&e.mode===T.Dense}static isSparseUnion(e){return me.isUnion(e)&&e.mode===T.Sparse}get typeId(){return A.NONE}}oe=Symbol.toStringTag,me[oe]=((ye=me.prototype).children=null,ye.ArrayType=Array,ye[Symbol.toStringTag]="DataType");class ge extends me{toString(){return"Null"}get typeId(){return A.Null}}ae=Symbol.toStringTag,ge[ae]=(e=>e[Symbol.toStringTag]="Null")(ge.prototype);class ve extends me{constructor(e,t){super(),this.isSigned=e,this.bitWidth=t}get typeId(){return A.Int}get ArrayType(){switch(this.bitWidth){case 8:return this.isSigned?Int8Array:Uint8Array;case 16:return this.isSigned?Int16Array:Uint16Array;case 32:return this.isSigned?Int32Array:Uint32Array;case 64:return this.isSigned?BigInt64Array:BigUint64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`${this.isSigned?"I":"Ui"}nt${this.bitWidth}`}}le=Symbol.toStringTag,ve[le]=(e=>(e.isSigned=null,e.bitWidth=null,e[Symbol.toStringTag]="Int"))(ve.prototype);Object.defineProperty(class extends ve{constructor(){super(!0,8)}get ArrayType(){return Int8Array}}.prototype,"ArrayType",{value:Int8Array}),Object.defineProperty(class extends ve{constructor(){super(!0,16)}get ArrayType(){return Int16Array}}.prototype,"ArrayType",{value:Int16Array}),Object.defineProperty(class extends ve{constructor(){super(!0,32)}get ArrayType(){return Int32Array}}.prototype,"ArrayType",{value:Int32Array}),Object.defineProperty(class extends ve{constructor(){super(!0,64)}get ArrayType(){return BigInt64Array}}.prototype,"ArrayType",{value:BigInt64Array}),Object.defineProperty(class extends ve{constructor(){super(!1,8)}get ArrayType(){return Uint8Array}}.prototype,"ArrayType",{value:Uint8Array}),Object.defineProperty(class extends ve{constructor(){super(!1,16)}get ArrayType(){return Uint16Array}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends ve{constructor(){super(!1,32)}get ArrayType(){return Uint32Array}}.prototype,"ArrayType",{value:Uint32Array}),Object.defineProperty(class extends ve{constructor(){super(!1,64)}get ArrayType(){return BigUint64Array}}.prototype,"ArrayType",{value:BigUint64Array});class be extends me{constructor(e){super(),this.precision=e}get typeId(){return A.Float}get ArrayType(){switch(this.precision){case E.HALF:return Uint16Array;case E.SINGLE:return Float32Array;case E.DOUBLE:return Float64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}toString(){return`Float${this.precision<<5||16}`}}se=Symbol.toStringTag,be[se]=(e=>(e.precision=null,e[Symbol.toStringTag]="Float"))(be.prototype);Object.defineProperty(class extends be{constructor(){super(E.HALF)}}.prototype,"ArrayType",{value:Uint16Array}),Object.defineProperty(class extends be{constructor(){super(E.SINGLE)}}.prototype,"ArrayType",{value:Float32Array}),Object.defineProperty(class extends be{constructor(){super(E.DOUBLE)}}.prototype,"ArrayType",{value:Float64Array});class we extends me{constructor(){super()}get typeId(){return A.Binary}toString(){return"Binary"}}we[Symbol.toStringTag]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Binary"))(we.prototype);class xe extends me{constructor(){super()}get typeId(){return A.Utf8}toString(){return"Utf8"}}xe[Symbol.toStringTag]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Utf8"))(xe.prototype);class Se extends me{constructor(){super()}get typeId(){return A.Bool}toString(){return"Bool"}}Se[Symbol.toStringTag]=(e=>(e.ArrayType=Uint8Array,e[Symbol.toStringTag]="Bool"))(Se.prototype);class _e extends me{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:128;super(),this.scale=e,this.precision=t,this.bitWidth=n}get typeId(){return A.Decimal}toString(){return`Decimal[${this.precision}e${this.scale>0?"+":""}${this.scale}]`}}_e[Symbol.toStringTag]=(e=>(e.scale=null,e.precision=null,e.ArrayType=Uint32Array,e[Symbol.toStringTag]="Decimal"))(_e.prototype);class ke extends me{constructor(e){super(),this.unit=e}get typeId(){return A.Date}toString(){return`Date${32*(this.unit+1)}<${C[this.unit]}>`}}ue=Symbol.toStringTag,ke[ue]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Date"))(ke.prototype);class Te extends me{constructor(e,t){super(),this.unit=e,this.bitWidth=t}get typeId(){return A.Time}toString(){return`Time${this.bitWidth}<${I[this.unit]}>`}get ArrayType(){switch(this.bitWidth){case 32:return Int32Array;case 64:return BigInt64Array}throw new Error(`Unrecognized ${this[Symbol.toStringTag]} type`)}}ce=Symbol.toStringTag,Te[ce]=(e=>(e.unit=null,e.bitWidth=null,e[Symbol.toStringTag]="Time"))(Te.prototype);class Ee extends me{constructor(e,t){super(),this.unit=e,this.timezone=t}get typeId(){return A.Timestamp}toString(){return`Timestamp<${I[this.unit]}${this.timezone?`, ${this.timezone}`:""}>`}}fe=Symbol.toStringTag,Ee[fe]=(e=>(e.unit=null,e.timezone=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Timestamp"))(Ee.prototype);class Ce extends me{constructor(e){super(),this.unit=e}get typeId(){return A.Interval}toString(){return`Interval<${M[this.unit]}>`}}de=Symbol.toStringTag,Ce[de]=(e=>(e.unit=null,e.ArrayType=Int32Array,e[Symbol.toStringTag]="Interval"))(Ce.prototype);class Ie extends me{constructor(e){super(),this.children=[e]}get typeId(){return A.List}toString(){return`List<${this.valueType}>`}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}}Ie[Symbol.toStringTag]=(e=>(e.children=null,e[Symbol.toStringTag]="List"))(Ie.prototype);class Me extends me{constructor(e){super(),this.children=e}get typeId(){return A.Struct}toString(){return`Struct<{${this.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}}he=Symbol.toStringTag,Me[he]=(e=>(e.children=null,e[Symbol.toStringTag]="Struct"))(Me.prototype);class Ne extends me{constructor(e,t,n){super(),this.mode=e,this.children=n,this.typeIds=t=Int32Array.from(t),this.typeIdToChildIndex=t.reduce((e,t,n)=>(e[t]=n)&&e||e,Object.create(null))}get typeId(){return A.Union}toString(){return`${this[Symbol.toStringTag]}<${this.children.map(e=>`${e.type}`).join(" | ")}>`}}pe=Symbol.toStringTag,Ne[pe]=(e=>(e.mode=null,e.typeIds=null,e.children=null,e.typeIdToChildIndex=null,e.ArrayType=Int8Array,e[Symbol.toStringTag]="Union"))(Ne.prototype);class Ae extends me{constructor(e){super(),this.byteWidth=e}get typeId(){return A.FixedSizeBinary}toString(){return`FixedSizeBinary[${this.byteWidth}]`}}Ae[Symbol.toStringTag]=(e=>(e.byteWidth=null,e.ArrayType=Uint8Array,e[Symbol.toStringTag]="FixedSizeBinary"))(Ae.prototype);class Oe extends me{constructor(e,t){super(),this.listSize=e,this.children=[t]}get typeId(){return A.FixedSizeList}get valueType(){return this.children[0].type}get valueField(){return this.children[0]}get ArrayType(){return this.valueType.ArrayType}toString(){return`FixedSizeList[${this.listSize}]<${this.valueType}>`}}Oe[Symbol.toStringTag]=(e=>(e.children=null,e.listSize=null,e[Symbol.toStringTag]="FixedSizeList"))(Oe.prototype);class ze extends me{constructor(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];super(),this.children=[e],this.keysSorted=t}get typeId(){return A.Map}get keyType(){return this.children[0].type.children[0].type}get valueType(){return this.children[0].type.children[1].type}get childType(){return this.children[0].type}toString(){return`Map<{${this.children[0].type.children.map(e=>`${e.name}:${e.type}`).join(", ")}}>`}}ze[Symbol.toStringTag]=(e=>(e.children=null,e.keysSorted=null,e[Symbol.toStringTag]="Map_"))(ze.prototype);const De=($e=-1,()=>++$e);var $e;class Pe extends me{constructor(e,t,n,r){super(),this.indices=t,this.dictionary=e,this.isOrdered=r||!1,this.id=null==n?De():"number"===typeof n?n:n.low}get typeId(){return A.Dictionary}get children(){return this.dictionary.children}get valueType(){return this.dictionary}get ArrayType(){return this.dictionary.ArrayType}toString(){return`Dictionary<${this.indices}, ${this.dictionary}>`}}function Le(e){const t=e;switch(e.typeId){case A.Decimal:return e.bitWidth/32;case A.Timestamp:return 2;case A.Date:case A.Interval:return 1+t.unit;case A.FixedSizeList:return t.listSize;case A.FixedSizeBinary:return t.byteWidth;default:return 1}}Pe[Symbol.toStringTag]=(e=>(e.id=null,e.indices=null,e.isOrdered=null,e.dictionary=null,e[Symbol.toStringTag]="Dictionary"))(Pe.prototype);class Be{visitMany(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return e.map((e,t)=>this.visit(e,...n.map(e=>e[t])))}visit(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return this.getVisitFn(t[0],!1).apply(this,t)}getVisitFn(e){return function(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2];if("number"===typeof t)return Fe(e,t,n);if("string"===typeof t&&t in A)return Fe(e,A[t],n);if(t&&t instanceof me)return Fe(e,Re(t),n);if((null===t||void 0===t?void 0:t.type)&&t.type instanceof me)return Fe(e,Re(t.type),n);return Fe(e,A.NONE,n)}(this,e,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}getVisitFnByTypeId(e){return Fe(this,e,!(arguments.length>1&&void 0!==arguments[1])||arguments[1])}visitNull(e){return null}visitBool(e){return null}visitInt(e){return null}visitFloat(e){return null}visitUtf8(e){return null}visitBinary(e){return null}visitFixedSizeBinary(e){return null}visitDate(e){return null}visitTimestamp(e){return null}visitTime(e){return null}visitDecimal(e){return null}visitList(e){return null}visitStruct(e){return null}visitUnion(e){return null}visitDictionary(e){return null}visitInterval(e){return null}visitFixedSizeList(e){return null}visitMap(e){return null}}function Fe(e,t){let n=!(arguments.length>2&&void 0!==arguments[2])||arguments[2],r=null;switch(t){case A.Null:r=e.visitNull;break;case A.Bool:r=e.visitBool;break;case A.Int:r=e.visitInt;break;case A.Int8:r=e.visitInt8||e.visitInt;break;case A.Int16:r=e.visitInt16||e.visitInt;break;case A.Int32:r=e.visitInt32||e.visitInt;break;case A.Int64:r=e.visitInt64||e.visitInt;break;case A.Uint8:r=e.visitUint8||e.visitInt;break;case A.Uint16:r=e.visitUint16||e.visitInt;break;case A.Uint32:r=e.visitUint32||e.visitInt;break;case A.Uint64:r=e.visitUint64||e.visitInt;break;case A.Float:r=e.visitFloat;break;case A.Float16:r=e.visitFloat16||e.visitFloat;break;case A.Float32:r=e.visitFloat32||e.visitFloat;break;case A.Float64:r=e.visitFloat64||e.visitFloat;break;case A.Utf8:r=e.visitUtf8;break;case A.Binary:r=e.visitBinary;break;case A.FixedSizeBinary:r=e.visitFixedSizeBinary;break;case A.Date:r=e.visitDate;break;case A.DateDay:r=e.visitDateDay||e.visitDate;break;case A.DateMillisecond:r=e.visitDateMillisecond||e.visitDate;break;case A.Timestamp:r=e.visitTimestamp;break;case A.TimestampSecond:r=e.visitTimestampSecond||e.visitTimestamp;break;case A.TimestampMillisecond:r=e.visitTimestampMillisecond||e.visitTimestamp;break;case A.TimestampMicrosecond:r=e.visitTimestampMicrosecond||e.visitTimestamp;break;case A.TimestampNanosecond:r=e.visitTimestampNanosecond||e.visitTimestamp;break;case A.Time:r=e.visitTime;break;case A.TimeSecond:r=e.visitTimeSecond||e.visitTime;break;case A.TimeMillisecond:r=e.visitTimeMillisecond||e.visitTime;break;case A.TimeMicrosecond:r=e.visitTimeMicrosecond||e.visitTime;break;case A.TimeNanosecond:r=e.visitTimeNanosecond||e.visitTime;break;case A.Decimal:r=e.visitDecimal;break;case A.List:r=e.visitList;break;case A.Struct:r=e.visitStruct;break;case A.Union:r=e.visitUnion;break;case A.DenseUnion:r=e.visitDenseUnion||e.visitUnion;break;case A.SparseUnion:r=e.visitSparseUnion||e.visitUnion;break;case A.Dictionary:r=e.visitDictionary;break;case A.Interval:r=e.visitInterval;break;case A.IntervalDayTime:r=e.visitIntervalDayTime||e.visitInterval;break;case A.IntervalYearMonth:r=e.visitIntervalYearMonth||e.visitInterval;break;case A.FixedSizeList:r=e.visitFixedSizeList;break;case A.Map:r=e.visitMap}if("function"===typeof r)return r;if(!n)return()=>null;throw new Error(`Unrecognized type '${A[t]}'`)}function Re(e){switch(e.typeId){case A.Null:return A.Null;case A.Int:{const{bitWidth:t,isSigned:n}=e;switch(t){case 8:return n?A.Int8:A.Uint8;case 16:return n?A.Int16:A.Uint16;case 32:return n?A.Int32:A.Uint32;case 64:return n?A.Int64:A.Uint64}return A.Int}case A.Float:switch(e.precision){case E.HALF:return A.Float16;case E.SINGLE:return A.Float32;case E.DOUBLE:return A.Float64}return A.Float;case A.Binary:return A.Binary;case A.Utf8:return A.Utf8;case A.Bool:return A.Bool;case A.Decimal:return A.Decimal;case A.Time:switch(e.unit){case I.SECOND:return A.TimeSecond;case I.MILLISECOND:return A.TimeMillisecond;case I.MICROSECOND:return A.TimeMicrosecond;case I.NANOSECOND:return A.TimeNanosecond}return A.Time;case A.Timestamp:switch(e.unit){case I.SECOND:return A.TimestampSecond;case I.MILLISECOND:return A.TimestampMillisecond;case I.MICROSECOND:return A.TimestampMicrosecond;case I.NANOSECOND:return A.TimestampNanosecond}return A.Timestamp;case A.Date:switch(e.unit){case C.DAY:return A.DateDay;case C.MILLISECOND:return A.DateMillisecond}return A.Date;case A.Interval:switch(e.unit){case M.DAY_TIME:return A.IntervalDayTime;case M.YEAR_MONTH:return A.IntervalYearMonth}return A.Interval;case A.Map:return A.Map;case A.List:return A.List;case A.Struct:return A.Struct;case A.Union:switch(e.mode){case T.Dense:return A.DenseUnion;case T.Sparse:return A.SparseUnion}return A.Union;case A.FixedSizeBinary:return A.FixedSizeBinary;case A.FixedSizeList:return A.FixedSizeList;case A.Dictionary:return A.Dictionary}throw new Error(`Unrecognized type '${A[e.typeId]}'`)}Be.prototype.visitInt8=null,Be.prototype.visitInt16=null,Be.prototype.visitInt32=null,Be.prototype.visitInt64=null,Be.prototype.visitUint8=null,Be.prototype.visitUint16=null,Be.prototype.visitUint32=null,Be.prototype.visitUint64=null,Be.prototype.visitFloat16=null,Be.prototype.visitFloat32=null,Be.prototype.visitFloat64=null,Be.prototype.visitDateDay=null,Be.prototype.visitDateMillisecond=null,Be.prototype.visitTimestampSecond=null,Be.prototype.visitTimestampMillisecond=null,Be.prototype.visitTimestampMicrosecond=null,Be.prototype.visitTimestampNanosecond=null,Be.prototype.visitTimeSecond=null,Be.prototype.visitTimeMillisecond=null,Be.prototype.visitTimeMicrosecond=null,Be.prototype.visitTimeNanosecond=null,Be.prototype.visitDenseUnion=null,Be.prototype.visitSparseUnion=null,Be.prototype.visitIntervalDayTime=null,Be.prototype.visitIntervalYearMonth=null;const Ue=new Float64Array(1),je=new Uint32Array(Ue.buffer);function Ve(e){const t=(31744&e)>>10,n=(1023&e)/1024,r=Math.pow(-1,(32768&e)>>15);switch(t){case 31:return r*(n?Number.NaN:1/0);case 0:return r*(n?6103515625e-14*n:0)}return r*Math.pow(2,t-15)*(1+n)}class He extends Be{}function Ye(e){return(t,n,r)=>{if(t.setValid(n,null!=r))return e(t,n,r)}}const We=(e,t,n)=>{e[t]=Math.trunc(n%4294967296),e[t+1]=Math.trunc(n/4294967296)},Xe=(e,t,n,r)=>{if(n+1<t.length){const{[n]:i,[n+1]:o}=t;e.set(r.subarray(0,o-i),i)}},qe=(e,t,n)=>{let{values:r}=e;r[t]=n},Qe=(e,t,n)=>{let{values:r}=e;r[t]=n},Ge=(e,t,n)=>{let{values:r}=e;r[t]=function(e){if(e!==e)return 32256;Ue[0]=e;const t=(2147483648&je[1])>>16&65535;let n=2146435072&je[1],r=0;return n>=1089470464?je[0]>0?n=31744:(n=(2080374784&n)>>16,r=(1048575&je[1])>>10):n<=1056964608?(r=1048576+(1048575&je[1]),r=1048576+(r<<(n>>20)-998)>>21,n=0):(n=n-1056964608>>10,r=512+(1048575&je[1])>>10),t|n|65535&r}(n)},Je=(e,t,n)=>{let{values:r}=e;((e,t,n)=>{e[t]=Math.trunc(n/864e5)})(r,t,n.valueOf())},Ke=(e,t,n)=>{let{values:r}=e;We(r,2*t,n.valueOf())},Ze=(e,t,n)=>{let{values:r}=e;return We(r,2*t,n/1e3)},et=(e,t,n)=>{let{values:r}=e;return We(r,2*t,n)},tt=(e,t,n)=>{let{values:r}=e;return((e,t,n)=>{e[t]=Math.trunc(1e3*n%4294967296),e[t+1]=Math.trunc(1e3*n/4294967296)})(r,2*t,n)},nt=(e,t,n)=>{let{values:r}=e;return((e,t,n)=>{e[t]=Math.trunc(1e6*n%4294967296),e[t+1]=Math.trunc(1e6*n/4294967296)})(r,2*t,n)},rt=(e,t,n)=>{let{values:r}=e;r[t]=n},it=(e,t,n)=>{let{values:r}=e;r[t]=n},ot=(e,t,n)=>{let{values:r}=e;r[t]=n},at=(e,t,n)=>{let{values:r}=e;r[t]=n},lt=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];ft.visit(i,e.valueOffsets[t],n)},st=(e,t,n)=>{const r=e.type.typeIdToChildIndex[e.typeIds[t]],i=e.children[r];ft.visit(i,t,n)},ut=(e,t,n)=>{let{values:r}=e;r.set(n.subarray(0,2),2*t)},ct=(e,t,n)=>{let{values:r}=e;r[t]=12*n[0]+n[1]%12};He.prototype.visitBool=Ye((e,t,n)=>{let{offset:r,values:i}=e;const o=r+t;n?i[o>>3]|=1<<o%8:i[o>>3]&=~(1<<o%8)}),He.prototype.visitInt=Ye(qe),He.prototype.visitInt8=Ye(qe),He.prototype.visitInt16=Ye(qe),He.prototype.visitInt32=Ye(qe),He.prototype.visitInt64=Ye(qe),He.prototype.visitUint8=Ye(qe),He.prototype.visitUint16=Ye(qe),He.prototype.visitUint32=Ye(qe),He.prototype.visitUint64=Ye(qe),He.prototype.visitFloat=Ye((e,t,n)=>{switch(e.type.precision){case E.HALF:return Ge(e,t,n);case E.SINGLE:case E.DOUBLE:return Qe(e,t,n)}}),He.prototype.visitFloat16=Ye(Ge),He.prototype.visitFloat32=Ye(Qe),He.prototype.visitFloat64=Ye(Qe),He.prototype.visitUtf8=Ye((e,t,n)=>{let{values:r,valueOffsets:i}=e;Xe(r,i,t,P(n))}),He.prototype.visitBinary=Ye((e,t,n)=>{let{values:r,valueOffsets:i}=e;return Xe(r,i,t,n)}),He.prototype.visitFixedSizeBinary=Ye((e,t,n)=>{let{stride:r,values:i}=e;i.set(n.subarray(0,r),r*t)}),He.prototype.visitDate=Ye((e,t,n)=>{e.type.unit===C.DAY?Je(e,t,n):Ke(e,t,n)}),He.prototype.visitDateDay=Ye(Je),He.prototype.visitDateMillisecond=Ye(Ke),He.prototype.visitTimestamp=Ye((e,t,n)=>{switch(e.type.unit){case I.SECOND:return Ze(e,t,n);case I.MILLISECOND:return et(e,t,n);case I.MICROSECOND:return tt(e,t,n);case I.NANOSECOND:return nt(e,t,n)}}),He.prototype.visitTimestampSecond=Ye(Ze),He.prototype.visitTimestampMillisecond=Ye(et),He.prototype.visitTimestampMicrosecond=Ye(tt),He.prototype.visitTimestampNanosecond=Ye(nt),He.prototype.visitTime=Ye((e,t,n)=>{switch(e.type.unit){case I.SECOND:return rt(e,t,n);case I.MILLISECOND:return it(e,t,n);case I.MICROSECOND:return ot(e,t,n);case I.NANOSECOND:return at(e,t,n)}}),He.prototype.visitTimeSecond=Ye(rt),He.prototype.visitTimeMillisecond=Ye(it),He.prototype.visitTimeMicrosecond=Ye(ot),He.prototype.visitTimeNanosecond=Ye(at),He.prototype.visitDecimal=Ye((e,t,n)=>{let{values:r,stride:i}=e;r.set(n.subarray(0,i),i*t)}),He.prototype.visitList=Ye((e,t,n)=>{const r=e.children[0],i=e.valueOffsets,o=ft.getVisitFn(r);if(Array.isArray(n))for(let a=-1,l=i[t],s=i[t+1];l<s;)o(r,l++,n[++a]);else for(let a=-1,l=i[t],s=i[t+1];l<s;)o(r,l++,n.get(++a))}),He.prototype.visitStruct=Ye((e,t,n)=>{const r=e.type.children.map(e=>ft.getVisitFn(e.type)),i=n instanceof Map?(o=t,a=n,(e,t,n,r)=>t&&e(t,o,a.get(n.name))):n instanceof In?((e,t)=>(n,r,i,o)=>r&&n(r,e,t.get(o)))(t,n):Array.isArray(n)?((e,t)=>(n,r,i,o)=>r&&n(r,e,t[o]))(t,n):((e,t)=>(n,r,i,o)=>r&&n(r,e,t[i.name]))(t,n);var o,a;e.type.children.forEach((t,n)=>i(r[n],e.children[n],t,n))}),He.prototype.visitUnion=Ye((e,t,n)=>{e.type.mode===T.Dense?lt(e,t,n):st(e,t,n)}),He.prototype.visitDenseUnion=Ye(lt),He.prototype.visitSparseUnion=Ye(st),He.prototype.visitDictionary=Ye((e,t,n)=>{var r;null===(r=e.dictionary)||void 0===r||r.set(e.values[t],n)}),He.prototype.visitInterval=Ye((e,t,n)=>{e.type.unit===M.DAY_TIME?ut(e,t,n):ct(e,t,n)}),He.prototype.visitIntervalDayTime=Ye(ut),He.prototype.visitIntervalYearMonth=Ye(ct),He.prototype.visitFixedSizeList=Ye((e,t,n)=>{const{stride:r}=e,i=e.children[0],o=ft.getVisitFn(i);if(Array.isArray(n))for(let a=-1,l=t*r;++a<r;)o(i,l+a,n[a]);else for(let a=-1,l=t*r;++a<r;)o(i,l+a,n.get(a))}),He.prototype.visitMap=Ye((e,t,n)=>{const r=e.children[0],{valueOffsets:i}=e,o=ft.getVisitFn(r);let{[t]:a,[t+1]:l}=i;const s=n instanceof Map?n.entries():Object.entries(n);for(const u of s)if(o(r,a,u),++a>=l)break});const ft=new He,dt=Symbol.for("parent"),ht=Symbol.for("rowIndex");class pt{constructor(e,t){return this[dt]=e,this[ht]=t,new Proxy(this,new mt)}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[ht],t=this[dt],n=t.type.children,r={};for(let i=-1,o=n.length;++i<o;)r[n[i].name]=Bt.visit(t.children[i],e);return r}toString(){return`{${[...this].map(e=>{let[t,n]=e;return`${z(t)}: ${z(n)}`}).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}[Symbol.iterator](){return new yt(this[dt],this[ht])}}class yt{constructor(e,t){this.childIndex=0,this.children=e.children,this.rowIndex=t,this.childFields=e.type.children,this.numChildren=this.childFields.length}[Symbol.iterator](){return this}next(){const e=this.childIndex;return e<this.numChildren?(this.childIndex=e+1,{done:!1,value:[this.childFields[e].name,Bt.visit(this.children[e],this.rowIndex)]}):{done:!0,value:null}}}Object.defineProperties(pt.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[dt]:{writable:!0,enumerable:!1,configurable:!1,value:null},[ht]:{writable:!0,enumerable:!1,configurable:!1,value:-1}});class mt{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[dt].type.children.map(e=>e.name)}has(e,t){return-1!==e[dt].type.children.findIndex(e=>e.name===t)}getOwnPropertyDescriptor(e,t){if(-1!==e[dt].type.children.findIndex(e=>e.name===t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[dt].type.children.findIndex(e=>e.name===t);if(-1!==n){const r=Bt.visit(e[dt].children[n],e[ht]);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[dt].type.children.findIndex(e=>e.name===t);return-1!==r?(ft.visit(e[dt].children[r],e[ht],n),Reflect.set(e,t,n)):!(!Reflect.has(e,t)&&"symbol"!==typeof t)&&Reflect.set(e,t,n)}}class gt extends Be{}function vt(e){return(t,n)=>t.getValid(n)?e(t,n):null}const bt=(e,t)=>4294967296*e[t+1]+(e[t]>>>0),wt=e=>new Date(e),xt=(e,t,n)=>{if(n+1>=t.length)return null;const r=t[n],i=t[n+1];return e.subarray(r,i)},St=(e,t)=>{let{values:n}=e;return((e,t)=>wt(((e,t)=>864e5*e[t])(e,t)))(n,t)},_t=(e,t)=>{let{values:n}=e;return((e,t)=>wt(bt(e,t)))(n,2*t)},kt=(e,t)=>{let{stride:n,values:r}=e;return r[n*t]},Tt=(e,t)=>{let{values:n}=e;return n[t]},Et=(e,t)=>{let{values:n}=e;return 1e3*bt(n,2*t)},Ct=(e,t)=>{let{values:n}=e;return bt(n,2*t)},It=(e,t)=>{let{values:n}=e;return((e,t)=>e[t+1]/1e3*4294967296+(e[t]>>>0)/1e3)(n,2*t)},Mt=(e,t)=>{let{values:n}=e;return((e,t)=>e[t+1]/1e6*4294967296+(e[t]>>>0)/1e6)(n,2*t)},Nt=(e,t)=>{let{values:n}=e;return n[t]},At=(e,t)=>{let{values:n}=e;return n[t]},Ot=(e,t)=>{let{values:n}=e;return n[t]},zt=(e,t)=>{let{values:n}=e;return n[t]},Dt=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return Bt.visit(r,e.valueOffsets[t])},$t=(e,t)=>{const n=e.type.typeIdToChildIndex[e.typeIds[t]],r=e.children[n];return Bt.visit(r,t)},Pt=(e,t)=>{let{values:n}=e;return n.subarray(2*t,2*(t+1))},Lt=(e,t)=>{let{values:n}=e;const r=n[t],i=new Int32Array(2);return i[0]=Math.trunc(r/12),i[1]=Math.trunc(r%12),i};gt.prototype.visitNull=vt((e,t)=>null),gt.prototype.visitBool=vt((e,t)=>{let{offset:n,values:r}=e;const i=n+t;return 0!==(r[i>>3]&1<<i%8)}),gt.prototype.visitInt=vt((e,t)=>{let{values:n}=e;return n[t]}),gt.prototype.visitInt8=vt(kt),gt.prototype.visitInt16=vt(kt),gt.prototype.visitInt32=vt(kt),gt.prototype.visitInt64=vt(Tt),gt.prototype.visitUint8=vt(kt),gt.prototype.visitUint16=vt(kt),gt.prototype.visitUint32=vt(kt),gt.prototype.visitUint64=vt(Tt),gt.prototype.visitFloat=vt((e,t)=>{let{type:n,values:r}=e;return n.precision!==E.HALF?r[t]:Ve(r[t])}),gt.prototype.visitFloat16=vt((e,t)=>{let{stride:n,values:r}=e;return Ve(r[n*t])}),gt.prototype.visitFloat32=vt(kt),gt.prototype.visitFloat64=vt(kt),gt.prototype.visitUtf8=vt((e,t)=>{let{values:n,valueOffsets:r}=e;const i=xt(n,r,t);return null!==i?(o=i,D.decode(o)):null;var o}),gt.prototype.visitBinary=vt((e,t)=>{let{values:n,valueOffsets:r}=e;return xt(n,r,t)}),gt.prototype.visitFixedSizeBinary=vt((e,t)=>{let{stride:n,values:r}=e;return r.subarray(n*t,n*(t+1))}),gt.prototype.visitDate=vt((e,t)=>e.type.unit===C.DAY?St(e,t):_t(e,t)),gt.prototype.visitDateDay=vt(St),gt.prototype.visitDateMillisecond=vt(_t),gt.prototype.visitTimestamp=vt((e,t)=>{switch(e.type.unit){case I.SECOND:return Et(e,t);case I.MILLISECOND:return Ct(e,t);case I.MICROSECOND:return It(e,t);case I.NANOSECOND:return Mt(e,t)}}),gt.prototype.visitTimestampSecond=vt(Et),gt.prototype.visitTimestampMillisecond=vt(Ct),gt.prototype.visitTimestampMicrosecond=vt(It),gt.prototype.visitTimestampNanosecond=vt(Mt),gt.prototype.visitTime=vt((e,t)=>{switch(e.type.unit){case I.SECOND:return Nt(e,t);case I.MILLISECOND:return At(e,t);case I.MICROSECOND:return Ot(e,t);case I.NANOSECOND:return zt(e,t)}}),gt.prototype.visitTimeSecond=vt(Nt),gt.prototype.visitTimeMillisecond=vt(At),gt.prototype.visitTimeMicrosecond=vt(Ot),gt.prototype.visitTimeNanosecond=vt(zt),gt.prototype.visitDecimal=vt((e,t)=>{let{values:n,stride:r}=e;return ie.decimal(n.subarray(r*t,r*(t+1)))}),gt.prototype.visitList=vt((e,t)=>{const{valueOffsets:n,stride:r,children:i}=e,{[t*r]:o,[t*r+1]:a}=n,l=i[0].slice(o,a-o);return new In([l])}),gt.prototype.visitStruct=vt((e,t)=>new pt(e,t)),gt.prototype.visitUnion=vt((e,t)=>e.type.mode===T.Dense?Dt(e,t):$t(e,t)),gt.prototype.visitDenseUnion=vt(Dt),gt.prototype.visitSparseUnion=vt($t),gt.prototype.visitDictionary=vt((e,t)=>{var n;return null===(n=e.dictionary)||void 0===n?void 0:n.get(e.values[t])}),gt.prototype.visitInterval=vt((e,t)=>e.type.unit===M.DAY_TIME?Pt(e,t):Lt(e,t)),gt.prototype.visitIntervalDayTime=vt(Pt),gt.prototype.visitIntervalYearMonth=vt(Lt),gt.prototype.visitFixedSizeList=vt((e,t)=>{const{stride:n,children:r}=e,i=r[0].slice(t*n,n);return new In([i])}),gt.prototype.visitMap=vt((e,t)=>{const{valueOffsets:n,children:r}=e,{[t]:i,[t+1]:o}=n,a=r[0];return new Ut(a.slice(i,o-i))});const Bt=new gt,Ft=Symbol.for("keys"),Rt=Symbol.for("vals");class Ut{constructor(e){return this[Ft]=new In([e.children[0]]).memoize(),this[Rt]=e.children[1],new Proxy(this,new Vt)}[Symbol.iterator](){return new jt(this[Ft],this[Rt])}get size(){return this[Ft].length}toArray(){return Object.values(this.toJSON())}toJSON(){const e=this[Ft],t=this[Rt],n={};for(let r=-1,i=e.length;++r<i;)n[e.get(r)]=Bt.visit(t,r);return n}toString(){return`{${[...this].map(e=>{let[t,n]=e;return`${z(t)}: ${z(n)}`}).join(", ")}}`}[Symbol.for("nodejs.util.inspect.custom")](){return this.toString()}}class jt{constructor(e,t){this.keys=e,this.vals=t,this.keyIndex=0,this.numKeys=e.length}[Symbol.iterator](){return this}next(){const e=this.keyIndex;return e===this.numKeys?{done:!0,value:null}:(this.keyIndex++,{done:!1,value:[this.keys.get(e),Bt.visit(this.vals,e)]})}}class Vt{isExtensible(){return!1}deleteProperty(){return!1}preventExtensions(){return!0}ownKeys(e){return e[Ft].toArray().map(String)}has(e,t){return e[Ft].includes(t)}getOwnPropertyDescriptor(e,t){if(-1!==e[Ft].indexOf(t))return{writable:!0,enumerable:!0,configurable:!0}}get(e,t){if(Reflect.has(e,t))return e[t];const n=e[Ft].indexOf(t);if(-1!==n){const r=Bt.visit(Reflect.get(e,Rt),n);return Reflect.set(e,t,r),r}}set(e,t,n){const r=e[Ft].indexOf(t);return-1!==r?(ft.visit(Reflect.get(e,Rt),r,n),Reflect.set(e,t,n)):!!Reflect.has(e,t)&&Reflect.set(e,t,n)}}let Ht;function Yt(e,t,n,r){const{length:i=0}=e;let o="number"!==typeof t?0:t,a="number"!==typeof n?i:n;return o<0&&(o=(o%i+i)%i),a<0&&(a=(a%i+i)%i),a<o&&(Ht=o,o=a,a=Ht),a>i&&(a=i),r?r(e,o,a):[o,a]}Object.defineProperties(Ut.prototype,{[Symbol.toStringTag]:{enumerable:!1,configurable:!1,value:"Row"},[Ft]:{writable:!0,enumerable:!1,configurable:!1,value:null},[Rt]:{writable:!0,enumerable:!1,configurable:!1,value:null}});const Wt=e=>e!==e;function Xt(e){if("object"!==typeof e||null===e)return Wt(e)?Wt:t=>t===e;if(e instanceof Date){const t=e.valueOf();return e=>e instanceof Date&&e.valueOf()===t}return ArrayBuffer.isView(e)?t=>!!t&&function(e,t){let n=0;const r=e.length;if(r!==t.length)return!1;if(r>0)do{if(e[n]!==t[n])return!1}while(++n<r);return!0}(e,t):e instanceof Map?function(e){let t=-1;const n=[];for(const r of e.values())n[++t]=Xt(r);return qt(n)}(e):Array.isArray(e)?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=Xt(e[n]);return qt(t)}(e):e instanceof In?function(e){const t=[];for(let n=-1,r=e.length;++n<r;)t[n]=Xt(e.get(n));return qt(t)}(e):function(e){let t=arguments.length>1&&void 0!==arguments[1]&&arguments[1];const n=Object.keys(e);if(!t&&0===n.length)return()=>!1;const r=[];for(let i=-1,o=n.length;++i<o;)r[i]=Xt(e[n[i]]);return qt(r,n)}(e,!0)}function qt(e,t){return n=>{if(!n||"object"!==typeof n)return!1;switch(n.constructor){case Array:return function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t[r]))return!1;return!0}(e,n);case Map:return Qt(e,n,n.keys());case Ut:case pt:case Object:case void 0:return Qt(e,n,t||Object.keys(n))}return n instanceof In&&function(e,t){const n=e.length;if(t.length!==n)return!1;for(let r=-1;++r<n;)if(!e[r](t.get(r)))return!1;return!0}(e,n)}}function Qt(e,t,n){const r=n[Symbol.iterator](),i=t instanceof Map?t.keys():Object.keys(t)[Symbol.iterator](),o=t instanceof Map?t.values():Object.values(t)[Symbol.iterator]();let a=0;const l=e.length;let s=o.next(),u=r.next(),c=i.next();for(;a<l&&!u.done&&!c.done&&!s.done&&(u.value===c.value&&e[a](s.value));++a,u=r.next(),c=i.next(),s=o.next());return!!(a===l&&u.done&&c.done&&s.done)||(r.return&&r.return(),i.return&&i.return(),o.return&&o.return(),!1)}class Gt{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:0,t=arguments.length>1?arguments[1]:void 0;this.numChunks=e,this.getChunkIterator=t,this.chunkIndex=0,this.chunkIterator=this.getChunkIterator(0)}next(){for(;this.chunkIndex<this.numChunks;){const e=this.chunkIterator.next();if(!e.done)return e;++this.chunkIndex<this.numChunks&&(this.chunkIterator=this.getChunkIterator(this.chunkIndex))}return{done:!0,value:null}}[Symbol.iterator](){return this}}function Jt(e){return e.reduce((e,t)=>e+t.nullCount,0)}function Kt(e){return e.reduce((e,t,n)=>(e[n+1]=e[n]+t.length,e),new Uint32Array(e.length+1))}function Zt(e,t,n,r){const i=[];for(let o=-1,a=e.length;++o<a;){const a=e[o],l=t[o],{length:s}=a;if(l>=r)break;if(n>=l+s)continue;if(l>=n&&l+s<=r){i.push(a);continue}const u=Math.max(0,n-l),c=Math.min(r-l,s);i.push(a.slice(u,c-u))}return 0===i.length&&i.push(e[0].slice(0,0)),i}function en(e,t,n,r){let i=0,o=0,a=t.length-1;do{if(i>=a-1)return n<t[a]?r(e,i,n-t[i]):null;o=i+Math.trunc(.5*(a-i)),n<t[o]?a=o:i=o}while(i<a)}function tn(e,t){return e.getValid(t)}function nn(e){function t(t,n,r){return e(t[n],r)}return function(e){return en(this.data,this._offsets,e,t)}}function rn(e){let t;function n(n,r,i){return e(n[r],i,t)}return function(e,r){const i=this.data;t=r;const o=en(i,this._offsets,e,n);return t=void 0,o}}function on(e){let t;function n(n,r,i){let o=i,a=0,l=0;for(let s=r-1,u=n.length;++s<u;){const r=n[s];if(~(a=e(r,t,o)))return l+a;o=0,l+=r.length}return-1}return function(e,r){t=e;const i=this.data,o="number"!==typeof r?n(i,0,0):en(i,this._offsets,r,n);return t=void 0,o}}function an(e,t,n,r){return 0!==(n&1<<r)}function ln(e,t,n,r){return(n&1<<r)>>r}function sn(e,t,n){const r=n.byteLength+7&-8;if(e>0||n.byteLength<r){const i=new Uint8Array(r);return i.set(e%8===0?n.subarray(e>>3):function(e){const t=[];let n=0,r=0,i=0;for(const a of e)a&&(i|=1<<r),8===++r&&(t[n++]=i,i=r=0);(0===n||r>0)&&(t[n++]=i);const o=new Uint8Array(t.length+7&-8);return o.set(t),o}(new un(n,e,t,null,an)).subarray(0,r)),i}return n}class un{constructor(e,t,n,r,i){this.bytes=e,this.length=n,this.context=r,this.get=i,this.bit=t%8,this.byteIndex=t>>3,this.byte=e[this.byteIndex++],this.index=0}next(){return this.index<this.length?(8===this.bit&&(this.bit=0,this.byte=this.bytes[this.byteIndex++]),{value:this.get(this.context,this.index++,this.byte,this.bit++)}):{done:!0,value:null}}[Symbol.iterator](){return this}}function cn(e,t,n){if(n-t<=0)return 0;if(n-t<8){let r=0;for(const i of new un(e,t,n-t,e,ln))r+=i;return r}const r=n>>3<<3,i=t+(t%8===0?0:8-t%8);return cn(e,t,i)+cn(e,r,n)+function(e,t,n){let r=0,i=Math.trunc(t);const o=new DataView(e.buffer,e.byteOffset,e.byteLength),a=void 0===n?e.byteLength:i+n;for(;a-i>=4;)r+=fn(o.getUint32(i)),i+=4;for(;a-i>=2;)r+=fn(o.getUint16(i)),i+=2;for(;a-i>=1;)r+=fn(o.getUint8(i)),i+=1;return r}(e,i>>3,r-i>>3)}function fn(e){let t=Math.trunc(e);return t-=t>>>1&1431655765,t=(858993459&t)+(t>>>2&858993459),16843009*(t+(t>>>4)&252645135)>>>24}class dn extends Be{}function hn(e,t,n){if(void 0===t)return-1;if(null===t)return function(e,t){const{nullBitmap:n}=e;if(!n||e.nullCount<=0)return-1;let r=0;for(const i of new un(n,e.offset+(t||0),e.length,n,an)){if(!i)return r;++r}return-1}(e,n);const r=Bt.getVisitFn(e),i=Xt(t);for(let o=(n||0)-1,a=e.length;++o<a;)if(i(r(e,o)))return o;return-1}function pn(e,t,n){const r=Bt.getVisitFn(e),i=Xt(t);for(let o=(n||0)-1,a=e.length;++o<a;)if(i(r(e,o)))return o;return-1}dn.prototype.visitNull=function(e,t){return null===t&&e.length>0?0:-1},dn.prototype.visitBool=hn,dn.prototype.visitInt=hn,dn.prototype.visitInt8=hn,dn.prototype.visitInt16=hn,dn.prototype.visitInt32=hn,dn.prototype.visitInt64=hn,dn.prototype.visitUint8=hn,dn.prototype.visitUint16=hn,dn.prototype.visitUint32=hn,dn.prototype.visitUint64=hn,dn.prototype.visitFloat=hn,dn.prototype.visitFloat16=hn,dn.prototype.visitFloat32=hn,dn.prototype.visitFloat64=hn,dn.prototype.visitUtf8=hn,dn.prototype.visitBinary=hn,dn.prototype.visitFixedSizeBinary=hn,dn.prototype.visitDate=hn,dn.prototype.visitDateDay=hn,dn.prototype.visitDateMillisecond=hn,dn.prototype.visitTimestamp=hn,dn.prototype.visitTimestampSecond=hn,dn.prototype.visitTimestampMillisecond=hn,dn.prototype.visitTimestampMicrosecond=hn,dn.prototype.visitTimestampNanosecond=hn,dn.prototype.visitTime=hn,dn.prototype.visitTimeSecond=hn,dn.prototype.visitTimeMillisecond=hn,dn.prototype.visitTimeMicrosecond=hn,dn.prototype.visitTimeNanosecond=hn,dn.prototype.visitDecimal=hn,dn.prototype.visitList=hn,dn.prototype.visitStruct=hn,dn.prototype.visitUnion=hn,dn.prototype.visitDenseUnion=pn,dn.prototype.visitSparseUnion=pn,dn.prototype.visitDictionary=hn,dn.prototype.visitInterval=hn,dn.prototype.visitIntervalDayTime=hn,dn.prototype.visitIntervalYearMonth=hn,dn.prototype.visitFixedSizeList=hn,dn.prototype.visitMap=hn;const yn=new dn;class mn extends Be{}function gn(e){const{type:t}=e;if(0===e.nullCount&&1===e.stride&&(t.typeId===A.Timestamp||t instanceof ve&&64!==t.bitWidth||t instanceof Te&&64!==t.bitWidth||t instanceof be&&t.precision!==E.HALF))return new Gt(e.data.length,t=>{const n=e.data[t];return n.values.subarray(0,n.length)[Symbol.iterator]()});let n=0;return new Gt(e.data.length,t=>{const r=e.data[t].length,i=e.slice(n,n+r);return n+=r,new vn(i)})}class vn{constructor(e){this.vector=e,this.index=0}next(){return this.index<this.vector.length?{value:this.vector.get(this.index++)}:{done:!0,value:null}}[Symbol.iterator](){return this}}mn.prototype.visitNull=gn,mn.prototype.visitBool=gn,mn.prototype.visitInt=gn,mn.prototype.visitInt8=gn,mn.prototype.visitInt16=gn,mn.prototype.visitInt32=gn,mn.prototype.visitInt64=gn,mn.prototype.visitUint8=gn,mn.prototype.visitUint16=gn,mn.prototype.visitUint32=gn,mn.prototype.visitUint64=gn,mn.prototype.visitFloat=gn,mn.prototype.visitFloat16=gn,mn.prototype.visitFloat32=gn,mn.prototype.visitFloat64=gn,mn.prototype.visitUtf8=gn,mn.prototype.visitBinary=gn,mn.prototype.visitFixedSizeBinary=gn,mn.prototype.visitDate=gn,mn.prototype.visitDateDay=gn,mn.prototype.visitDateMillisecond=gn,mn.prototype.visitTimestamp=gn,mn.prototype.visitTimestampSecond=gn,mn.prototype.visitTimestampMillisecond=gn,mn.prototype.visitTimestampMicrosecond=gn,mn.prototype.visitTimestampNanosecond=gn,mn.prototype.visitTime=gn,mn.prototype.visitTimeSecond=gn,mn.prototype.visitTimeMillisecond=gn,mn.prototype.visitTimeMicrosecond=gn,mn.prototype.visitTimeNanosecond=gn,mn.prototype.visitDecimal=gn,mn.prototype.visitList=gn,mn.prototype.visitStruct=gn,mn.prototype.visitUnion=gn,mn.prototype.visitDenseUnion=gn,mn.prototype.visitSparseUnion=gn,mn.prototype.visitDictionary=gn,mn.prototype.visitInterval=gn,mn.prototype.visitIntervalDayTime=gn,mn.prototype.visitIntervalYearMonth=gn,mn.prototype.visitFixedSizeList=gn,mn.prototype.visitMap=gn;const bn=new mn,wn=(e,t)=>e+t;class xn extends Be{visitNull(e,t){return 0}visitInt(e,t){return e.type.bitWidth/8}visitFloat(e,t){return e.type.ArrayType.BYTES_PER_ELEMENT}visitBool(e,t){return 1/8}visitDecimal(e,t){return e.type.bitWidth/8}visitDate(e,t){return 4*(e.type.unit+1)}visitTime(e,t){return e.type.bitWidth/8}visitTimestamp(e,t){return e.type.unit===I.SECOND?4:8}visitInterval(e,t){return 4*(e.type.unit+1)}visitStruct(e,t){return e.children.reduce((e,n)=>e+kn.visit(n,t),0)}visitFixedSizeBinary(e,t){return e.type.byteWidth}visitMap(e,t){return 8+e.children.reduce((e,n)=>e+kn.visit(n,t),0)}visitDictionary(e,t){var n;return e.type.indices.bitWidth/8+((null===(n=e.dictionary)||void 0===n?void 0:n.getByteLength(e.values[t]))||0)}}const Sn=(e,t)=>{let{type:n,children:r,typeIds:i,valueOffsets:o}=e;const a=n.typeIdToChildIndex[i[t]];return 8+kn.visit(r[a],o[t])},_n=(e,t)=>{let{children:n}=e;return 4+kn.visitMany(n,n.map(()=>t)).reduce(wn,0)};xn.prototype.visitUtf8=(e,t)=>{let{valueOffsets:n}=e;return n[t+1]-n[t]+8},xn.prototype.visitBinary=(e,t)=>{let{valueOffsets:n}=e;return n[t+1]-n[t]+8},xn.prototype.visitList=(e,t)=>{let{valueOffsets:n,stride:r,children:i}=e;const o=i[0],{[t*r]:a}=n,{[t*r+1]:l}=n,s=kn.getVisitFn(o.type),u=o.slice(a,l-a);let c=8;for(let f=-1,d=l-a;++f<d;)c+=s(u,f);return c},xn.prototype.visitFixedSizeList=(e,t)=>{let{stride:n,children:r}=e;const i=r[0],o=i.slice(t*n,n),a=kn.getVisitFn(i.type);let l=0;for(let s=-1,u=o.length;++s<u;)l+=a(o,s);return l},xn.prototype.visitUnion=(e,t)=>e.type.mode===T.Dense?Sn(e,t):_n(e,t),xn.prototype.visitDenseUnion=Sn,xn.prototype.visitSparseUnion=_n;const kn=new xn;var Tn;const En={},Cn={};class In{constructor(e){var t,n,r;const i=e[0]instanceof In?e.flatMap(e=>e.data):e;if(0===i.length||i.some(e=>!(e instanceof Nn)))throw new TypeError("Vector constructor expects an Array of Data instances.");const o=null===(t=i[0])||void 0===t?void 0:t.type;switch(i.length){case 0:this._offsets=[0];break;case 1:{const{get:e,set:t,indexOf:n,byteLength:r}=En[o.typeId],a=i[0];this.isValid=e=>tn(a,e),this.get=t=>e(a,t),this.set=(e,n)=>t(a,e,n),this.indexOf=e=>n(a,e),this.getByteLength=e=>r(a,e),this._offsets=[0,a.length];break}default:Object.setPrototypeOf(this,Cn[o.typeId]),this._offsets=Kt(i)}this.data=i,this.type=o,this.stride=Le(o),this.numChildren=null!==(r=null===(n=o.children)||void 0===n?void 0:n.length)&&void 0!==r?r:0,this.length=this._offsets[this._offsets.length-1]}get byteLength(){return-1===this._byteLength&&(this._byteLength=this.data.reduce((e,t)=>e+t.byteLength,0)),this._byteLength}get nullCount(){return-1===this._nullCount&&(this._nullCount=Jt(this.data)),this._nullCount}get ArrayType(){return this.type.ArrayType}get[Symbol.toStringTag](){return`${this.VectorName}<${this.type[Symbol.toStringTag]}>`}get VectorName(){return`${A[this.type.typeId]}Vector`}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}includes(e,t){return this.indexOf(e,t)>0}getByteLength(e){return 0}[Symbol.iterator](){return bn.visit(this)}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return new In(this.data.concat(t.flatMap(e=>e.data).flat(Number.POSITIVE_INFINITY)))}slice(e,t){return new In(Yt(this,e,t,(e,t,n)=>{let{data:r,_offsets:i}=e;return Zt(r,i,t,n)}))}toJSON(){return[...this]}toArray(){const{type:e,data:t,length:n,stride:r,ArrayType:i}=this;switch(e.typeId){case A.Int:case A.Float:case A.Decimal:case A.Time:case A.Timestamp:switch(t.length){case 0:return new i;case 1:return t[0].values.subarray(0,n*r);default:return t.reduce((e,t)=>{let{values:n}=t;return e.array.set(n,e.offset),e.offset+=n.length,e},{array:new i(n*r),offset:0}).array}}return[...this]}toString(){return`[${[...this].join(",")}]`}getChild(e){var t;return this.getChildAt(null===(t=this.type.children)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.numChildren?new In(this.data.map(t=>{let{children:n}=t;return n[e]})):null}get isMemoized(){return!!me.isDictionary(this.type)&&this.data[0].dictionary.isMemoized}memoize(){if(me.isDictionary(this.type)){const e=new Mn(this.data[0].dictionary),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new In(t)}return new Mn(this)}unmemoize(){if(me.isDictionary(this.type)&&this.isMemoized){const e=this.data[0].dictionary.unmemoize(),t=this.data.map(t=>{const n=t.clone();return n.dictionary=e,n});return new In(t)}return this}}Tn=Symbol.toStringTag,In[Tn]=(e=>{e.type=me.prototype,e.data=[],e.length=0,e.stride=1,e.numChildren=0,e._nullCount=-1,e._byteLength=-1,e._offsets=new Uint32Array([0]),e[Symbol.isConcatSpreadable]=!0;const t=Object.keys(A).map(e=>A[e]).filter(e=>"number"===typeof e&&e!==A.NONE);for(const n of t){const t=Bt.getVisitFnByTypeId(n),r=ft.getVisitFnByTypeId(n),i=yn.getVisitFnByTypeId(n),o=kn.getVisitFnByTypeId(n);En[n]={get:t,set:r,indexOf:i,byteLength:o},Cn[n]=Object.create(e,{isValid:{value:nn(tn)},get:{value:nn(Bt.getVisitFnByTypeId(n))},set:{value:rn(ft.getVisitFnByTypeId(n))},indexOf:{value:on(yn.getVisitFnByTypeId(n))},getByteLength:{value:nn(kn.getVisitFnByTypeId(n))}})}return"Vector"})(In.prototype);class Mn extends In{constructor(e){super(e.data);const t=this.get,n=this.set,r=this.slice,i=new Array(this.length);Object.defineProperty(this,"get",{value(e){const n=i[e];if(void 0!==n)return n;const r=t.call(this,e);return i[e]=r,r}}),Object.defineProperty(this,"set",{value(e,t){n.call(this,e,t),i[e]=t}}),Object.defineProperty(this,"slice",{value:(e,t)=>new Mn(r.call(this,e,t))}),Object.defineProperty(this,"isMemoized",{value:!0}),Object.defineProperty(this,"unmemoize",{value:()=>new In(this.data)}),Object.defineProperty(this,"memoize",{value:()=>this})}}class Nn{constructor(e,t,n,r,i){let o,a=arguments.length>5&&void 0!==arguments[5]?arguments[5]:[],l=arguments.length>6?arguments[6]:void 0;this.type=e,this.children=a,this.dictionary=l,this.offset=Math.floor(Math.max(t||0,0)),this.length=Math.floor(Math.max(n||0,0)),this._nullCount=Math.floor(Math.max(r||0,-1)),i instanceof Nn?(this.stride=i.stride,this.values=i.values,this.typeIds=i.typeIds,this.nullBitmap=i.nullBitmap,this.valueOffsets=i.valueOffsets):(this.stride=Le(e),i&&((o=i[0])&&(this.valueOffsets=o),(o=i[1])&&(this.values=o),(o=i[2])&&(this.nullBitmap=o),(o=i[3])&&(this.typeIds=o))),this.nullable=0!==this._nullCount&&this.nullBitmap&&this.nullBitmap.byteLength>0}get typeId(){return this.type.typeId}get ArrayType(){return this.type.ArrayType}get buffers(){return[this.valueOffsets,this.values,this.nullBitmap,this.typeIds]}get byteLength(){let e=0;const{valueOffsets:t,values:n,nullBitmap:r,typeIds:i}=this;return t&&(e+=t.byteLength),n&&(e+=n.byteLength),r&&(e+=r.byteLength),i&&(e+=i.byteLength),this.children.reduce((e,t)=>e+t.byteLength,e)}get nullCount(){let e,t=this._nullCount;return t<=-1&&(e=this.nullBitmap)&&(this._nullCount=t=this.length-cn(e,this.offset,this.offset+this.length)),t}getValid(e){if(this.nullable&&this.nullCount>0){const t=this.offset+e;return 0!==(this.nullBitmap[t>>3]&1<<t%8)}return!0}setValid(e,t){if(!this.nullable)return t;if(!this.nullBitmap||this.nullBitmap.byteLength<=e>>3){const{nullBitmap:e}=this._changeLengthAndBackfillNullBitmap(this.length);Object.assign(this,{nullBitmap:e,_nullCount:0})}const{nullBitmap:n,offset:r}=this,i=r+e>>3,o=(r+e)%8,a=n[i]>>o&1;return t?0===a&&(n[i]|=1<<o,this._nullCount=this.nullCount+1):1===a&&(n[i]&=~(1<<o),this._nullCount=this.nullCount-1),t}clone(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:this.type,t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:this.offset,n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:this.length,r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:this._nullCount,i=arguments.length>4&&void 0!==arguments[4]?arguments[4]:this,o=arguments.length>5&&void 0!==arguments[5]?arguments[5]:this.children;return new Nn(e,t,n,r,i,o,this.dictionary)}slice(e,t){const{stride:n,typeId:r,children:i}=this,o=+(0===this._nullCount)-1,a=16===r?n:1,l=this._sliceBuffers(e,t,n,r);return this.clone(this.type,this.offset+e,t,o,l,0===i.length||this.valueOffsets?i:this._sliceChildren(i,a*e,a*t))}_changeLengthAndBackfillNullBitmap(e){if(this.typeId===A.Null)return this.clone(this.type,0,e,0);const{length:t,nullCount:n}=this,r=new Uint8Array((e+63&-64)>>3).fill(255,0,t>>3);r[t>>3]=(1<<t-(-8&t))-1,n>0&&r.set(sn(this.offset,t,this.nullBitmap),0);const i=this.buffers;return i[O.VALIDITY]=r,this.clone(this.type,0,e,n+(e-t),i)}_sliceBuffers(e,t,n,r){let i;const{buffers:o}=this;return(i=o[O.TYPE])&&(o[O.TYPE]=i.subarray(e,e+t)),(i=o[O.OFFSET])&&(o[O.OFFSET]=i.subarray(e,e+t+1))||(i=o[O.DATA])&&(o[O.DATA]=6===r?i:i.subarray(n*e,n*(e+t))),o}_sliceChildren(e,t,n){return e.map(e=>e.slice(t,n))}}Nn.prototype.children=Object.freeze([]);class An extends Be{visit(e){return this.getVisitFn(e.type).call(this,e)}visitNull(e){const{type:t,offset:n=0,length:r=0}=e;return new Nn(t,n,r,0)}visitBool(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length>>3,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitInt(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitFloat(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length,nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitUtf8(e){const{type:t,offset:n=0}=e,r=q(e.data),i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,r,i])}visitBinary(e){const{type:t,offset:n=0}=e,r=q(e.data),i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,r,i])}visitFixedSizeBinary(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitDate(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitTimestamp(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitTime(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitDecimal(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitList(e){const{type:t,offset:n=0,child:r}=e,i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,void 0,i],[r])}visitStruct(e){const{type:t,offset:n=0,children:r=[]}=e,i=q(e.nullBitmap),{length:o=r.reduce((e,t)=>{let{length:n}=t;return Math.max(e,n)},0),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,void 0,i],r)}visitUnion(e){const{type:t,offset:n=0,children:r=[]}=e,i=q(e.nullBitmap),o=W(t.ArrayType,e.typeIds),{length:a=o.length,nullCount:l=(e.nullBitmap?-1:0)}=e;if(me.isSparseUnion(t))return new Nn(t,n,a,l,[void 0,void 0,i,o],r);const s=X(e.valueOffsets);return new Nn(t,n,a,l,[s,void 0,i,o],r)}visitDictionary(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.indices.ArrayType,e.data),{dictionary:o=new In([(new An).visit({type:t.dictionary})])}=e,{length:a=i.length,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[void 0,i,r],[],o)}visitInterval(e){const{type:t,offset:n=0}=e,r=q(e.nullBitmap),i=W(t.ArrayType,e.data),{length:o=i.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,i,r])}visitFixedSizeList(e){const{type:t,offset:n=0,child:r=(new An).visit({type:t.valueType})}=e,i=q(e.nullBitmap),{length:o=r.length/Le(t),nullCount:a=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,o,a,[void 0,void 0,i],[r])}visitMap(e){const{type:t,offset:n=0,child:r=(new An).visit({type:t.childType})}=e,i=q(e.nullBitmap),o=X(e.valueOffsets),{length:a=o.length-1,nullCount:l=(e.nullBitmap?-1:0)}=e;return new Nn(t,n,a,l,[o,void 0,i],[r])}}function On(e){return(new An).visit(e)}class zn{constructor(){let e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:[],t=arguments.length>1?arguments[1]:void 0,n=arguments.length>2?arguments[2]:void 0;this.fields=e||[],this.metadata=t||new Map,n||(n=Pn(e)),this.dictionaries=n}get[Symbol.toStringTag](){return"Schema"}get names(){return this.fields.map(e=>e.name)}toString(){return`Schema<{ ${this.fields.map((e,t)=>`${t}: ${e}`).join(", ")} }>`}select(e){const t=new Set(e),n=this.fields.filter(e=>t.has(e.name));return new zn(n,this.metadata)}selectAt(e){const t=e.map(e=>this.fields[e]).filter(Boolean);return new zn(t,this.metadata)}assign(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];const r=t[0]instanceof zn?t[0]:Array.isArray(t[0])?new zn(t[0]):new zn(t),i=[...this.fields],o=$n($n(new Map,this.metadata),r.metadata),a=r.fields.filter(e=>{const t=i.findIndex(t=>t.name===e.name);return!~t||(i[t]=e.clone({metadata:$n($n(new Map,i[t].metadata),e.metadata)}))&&!1}),l=Pn(a,new Map);return new zn([...i,...a],o,new Map([...this.dictionaries,...l]))}}zn.prototype.fields=null,zn.prototype.metadata=null,zn.prototype.dictionaries=null;class Dn{constructor(e,t){let n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=arguments.length>3?arguments[3]:void 0;this.name=e,this.type=t,this.nullable=n,this.metadata=r||new Map}static new(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];let[r,i,o,a]=t;return t[0]&&"object"===typeof t[0]&&(({name:r}=t[0]),void 0===i&&(i=t[0].type),void 0===o&&(o=t[0].nullable),void 0===a&&(a=t[0].metadata)),new Dn(`${r}`,i,o,a)}get typeId(){return this.type.typeId}get[Symbol.toStringTag](){return"Field"}toString(){return`${this.name}: ${this.type}`}clone(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];let[r,i,o,a]=t;return t[0]&&"object"===typeof t[0]?({name:r=this.name,type:i=this.type,nullable:o=this.nullable,metadata:a=this.metadata}=t[0]):[r=this.name,i=this.type,o=this.nullable,a=this.metadata]=t,Dn.new(r,i,o,a)}}function $n(e,t){return new Map([...e||new Map,...t||new Map])}function Pn(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:new Map;for(let n=-1,r=e.length;++n<r;){const r=e[n].type;if(me.isDictionary(r))if(t.has(r.id)){if(t.get(r.id)!==r.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else t.set(r.id,r.dictionary);r.children&&r.children.length>0&&Pn(r.children,t)}return t}Dn.prototype.type=null,Dn.prototype.name=null,Dn.prototype.nullable=null,Dn.prototype.metadata=null;class Ln extends Be{compareSchemas(e,t){return e===t||t instanceof e.constructor&&this.compareManyFields(e.fields,t.fields)}compareManyFields(e,t){return e===t||Array.isArray(e)&&Array.isArray(t)&&e.length===t.length&&e.every((e,n)=>this.compareFields(e,t[n]))}compareFields(e,t){return e===t||t instanceof e.constructor&&e.name===t.name&&e.nullable===t.nullable&&this.visit(e.type,t.type)}}function Bn(e,t){return t instanceof e.constructor}function Fn(e,t){return e===t||Bn(e,t)}function Rn(e,t){return e===t||Bn(e,t)&&e.bitWidth===t.bitWidth&&e.isSigned===t.isSigned}function Un(e,t){return e===t||Bn(e,t)&&e.precision===t.precision}function jn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit}function Vn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit&&e.timezone===t.timezone}function Hn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit&&e.bitWidth===t.bitWidth}function Yn(e,t){return e===t||Bn(e,t)&&e.mode===t.mode&&e.typeIds.every((e,n)=>e===t.typeIds[n])&&Xn.compareManyFields(e.children,t.children)}function Wn(e,t){return e===t||Bn(e,t)&&e.unit===t.unit}Ln.prototype.visitNull=Fn,Ln.prototype.visitBool=Fn,Ln.prototype.visitInt=Rn,Ln.prototype.visitInt8=Rn,Ln.prototype.visitInt16=Rn,Ln.prototype.visitInt32=Rn,Ln.prototype.visitInt64=Rn,Ln.prototype.visitUint8=Rn,Ln.prototype.visitUint16=Rn,Ln.prototype.visitUint32=Rn,Ln.prototype.visitUint64=Rn,Ln.prototype.visitFloat=Un,Ln.prototype.visitFloat16=Un,Ln.prototype.visitFloat32=Un,Ln.prototype.visitFloat64=Un,Ln.prototype.visitUtf8=Fn,Ln.prototype.visitBinary=Fn,Ln.prototype.visitFixedSizeBinary=function(e,t){return e===t||Bn(e,t)&&e.byteWidth===t.byteWidth},Ln.prototype.visitDate=jn,Ln.prototype.visitDateDay=jn,Ln.prototype.visitDateMillisecond=jn,Ln.prototype.visitTimestamp=Vn,Ln.prototype.visitTimestampSecond=Vn,Ln.prototype.visitTimestampMillisecond=Vn,Ln.prototype.visitTimestampMicrosecond=Vn,Ln.prototype.visitTimestampNanosecond=Vn,Ln.prototype.visitTime=Hn,Ln.prototype.visitTimeSecond=Hn,Ln.prototype.visitTimeMillisecond=Hn,Ln.prototype.visitTimeMicrosecond=Hn,Ln.prototype.visitTimeNanosecond=Hn,Ln.prototype.visitDecimal=Fn,Ln.prototype.visitList=function(e,t){return e===t||Bn(e,t)&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)},Ln.prototype.visitStruct=function(e,t){return e===t||Bn(e,t)&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)},Ln.prototype.visitUnion=Yn,Ln.prototype.visitDenseUnion=Yn,Ln.prototype.visitSparseUnion=Yn,Ln.prototype.visitDictionary=function(e,t){return e===t||Bn(e,t)&&e.id===t.id&&e.isOrdered===t.isOrdered&&Xn.visit(e.indices,t.indices)&&Xn.visit(e.dictionary,t.dictionary)},Ln.prototype.visitInterval=Wn,Ln.prototype.visitIntervalDayTime=Wn,Ln.prototype.visitIntervalYearMonth=Wn,Ln.prototype.visitFixedSizeList=function(e,t){return e===t||Bn(e,t)&&e.listSize===t.listSize&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)},Ln.prototype.visitMap=function(e,t){return e===t||Bn(e,t)&&e.keysSorted===t.keysSorted&&e.children.length===t.children.length&&Xn.compareManyFields(e.children,t.children)};const Xn=new Ln;function qn(e,t){return Xn.compareSchemas(e,t)}var Qn,Gn;class Jn{constructor(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];switch(t.length){case 2:if([this.schema]=t,!(this.schema instanceof zn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");if([,this.data=On({nullCount:0,type:new Me(this.schema.fields),children:this.schema.fields.map(e=>On({type:e.type,nullCount:0}))})]=t,!(this.data instanceof Nn))throw new TypeError("RecordBatch constructor expects a [Schema, Data] pair.");[this.schema,this.data]=Kn(this.schema,this.data.children);break;case 1:{const[e]=t,{fields:n,children:r,length:i}=Object.keys(e).reduce((t,n,r)=>(t.children[r]=e[n],t.length=Math.max(t.length,e[n].length),t.fields[r]=Dn.new({name:n,type:e[n].type,nullable:!0}),t),{length:0,fields:new Array,children:new Array}),o=new zn(n),a=On({type:new Me(n),length:i,children:r,nullCount:0});[this.schema,this.data]=Kn(o,a.children,i);break}default:throw new TypeError("RecordBatch constructor expects an Object mapping names to child Data, or a [Schema, Data] pair.")}}get dictionaries(){return this._dictionaries||(this._dictionaries=Zn(this.schema.fields,this.data.children))}get numCols(){return this.schema.fields.length}get numRows(){return this.data.length}get nullCount(){return this.data.nullCount}isValid(e){return this.data.getValid(e)}get(e){return Bt.visit(this.data,e)}set(e,t){return ft.visit(this.data,e,t)}indexOf(e,t){return yn.visit(this.data,e,t)}getByteLength(e){return kn.visit(this.data,e)}[Symbol.iterator](){return bn.visit(new In([this.data]))}toArray(){return[...this]}concat(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return new nr(this.schema,[this,...t])}slice(e,t){const[n]=new In([this.data]).slice(e,t).data;return new Jn(this.schema,n)}getChild(e){var t;return this.getChildAt(null===(t=this.schema.fields)||void 0===t?void 0:t.findIndex(t=>t.name===e))}getChildAt(e){return e>-1&&e<this.schema.fields.length?new In([this.data.children[e]]):null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=this.data;if(e>-1&&e<this.numCols){t||(t=new In([On({type:new ge,length:this.numRows})]));const i=n.fields.slice(),o=r.children.slice(),a=i[e].clone({type:t.type});[i[e],o[e]]=[a,t.data[0]],n=new zn(i,new Map(this.schema.metadata)),r=On({type:new Me(i),children:o})}return new Jn(n,r)}select(e){const t=this.schema.select(e),n=new Me(t.fields),r=[];for(const i of e){const e=this.schema.fields.findIndex(e=>e.name===i);~e&&(r[e]=this.data.children[e])}return new Jn(t,On({type:n,length:this.numRows,children:r}))}selectAt(e){const t=this.schema.selectAt(e),n=e.map(e=>this.data.children[e]).filter(Boolean),r=On({type:new Me(t.fields),length:this.numRows,children:n});return new Jn(t,r)}}function Kn(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:t.reduce((e,t)=>Math.max(e,t.length),0);var r;const i=[...e.fields],o=[...t],a=(n+63&-64)>>3;for(const[l,s]of e.fields.entries()){const e=t[l];e&&e.length===n||(i[l]=s.clone({nullable:!0}),o[l]=null!==(r=null===e||void 0===e?void 0:e._changeLengthAndBackfillNullBitmap(n))&&void 0!==r?r:On({type:s.type,length:n,nullCount:n,nullBitmap:new Uint8Array(a)}))}return[e.assign(i),On({type:new Me(i),length:n,children:o})]}function Zn(e,t){let n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:new Map;for(let r=-1,i=e.length;++r<i;){const i=e[r].type,o=t[r];if(me.isDictionary(i))if(n.has(i.id)){if(n.get(i.id)!==o.dictionary)throw new Error("Cannot create Schema containing two different dictionaries with the same Id")}else o.dictionary&&n.set(i.id,o.dictionary);i.children&&i.children.length>0&&Zn(i.children,o.children,n)}return n}Qn=Symbol.toStringTag,Jn[Qn]=(e=>(e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,"RecordBatch"))(Jn.prototype);function er(e,t){return function(e,t){const n=[...e.fields],r=[],i={numBatches:t.reduce((e,t)=>Math.max(e,t.length),0)};let o=0,a=0,l=-1;const s=t.length;let u,c=[];for(;i.numBatches-- >0;){for(a=Number.POSITIVE_INFINITY,l=-1;++l<s;)c[l]=u=t[l].shift(),a=Math.min(a,u?u.length:a);Number.isFinite(a)&&(c=tr(n,a,c,t,i),a>0&&(r[o++]=On({type:new Me(n),length:a,nullCount:0,children:c.slice()})))}return[e=e.assign(n),r.map(t=>new Jn(e,t))]}(e,t.map(e=>e.data.concat()))}function tr(e,t,n,r,i){var o;const a=(t+63&-64)>>3;for(let l=-1,s=r.length;++l<s;){const s=n[l],u=null===s||void 0===s?void 0:s.length;if(u>=t)u===t?n[l]=s:(n[l]=s.slice(0,t),i.numBatches=Math.max(i.numBatches,r[l].unshift(s.slice(t,u-t))));else{const r=e[l];e[l]=r.clone({nullable:!0}),n[l]=null!==(o=null===s||void 0===s?void 0:s._changeLengthAndBackfillNullBitmap(t))&&void 0!==o?o:On({type:r.type,length:t,nullCount:t,nullBitmap:new Uint8Array(a)})}}return n}class nr{constructor(){for(var e,t,n=arguments.length,r=new Array(n),i=0;i<n;i++)r[i]=arguments[i];if(0===r.length)return this.batches=[],this.schema=new zn([]),this._offsets=[0],this;let o,a;r[0]instanceof zn&&(o=r.shift()),r[r.length-1]instanceof Uint32Array&&(a=r.pop());const l=e=>{if(e){if(e instanceof Jn)return[e];if(e instanceof nr)return e.batches;if(e instanceof Nn){if(e.type instanceof Me)return[new Jn(new zn(e.type.children),e)]}else{if(Array.isArray(e))return e.flatMap(e=>l(e));if("function"===typeof e[Symbol.iterator])return[...e].flatMap(e=>l(e));if("object"===typeof e){const t=Object.keys(e),n=t.map(t=>new In([e[t]])),r=new zn(t.map((e,t)=>new Dn(String(e),n[t].type))),[,i]=er(r,n);return 0===i.length?[new Jn(e)]:i}}}return[]},s=r.flatMap(e=>l(e));if(o=null!==(t=null!==o&&void 0!==o?o:null===(e=s[0])||void 0===e?void 0:e.schema)&&void 0!==t?t:new zn([]),!(o instanceof zn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");for(const u of s){if(!(u instanceof Jn))throw new TypeError("Table constructor expects a [Schema, RecordBatch[]] pair.");if(!qn(o,u.schema))throw new TypeError("Table and inner RecordBatch schemas must be equivalent.")}this.schema=o,this.batches=s,this._offsets=null!==a&&void 0!==a?a:Kt(this.data)}get data(){return this.batches.map(e=>{let{data:t}=e;return t})}get numCols(){return this.schema.fields.length}get numRows(){return this.data.reduce((e,t)=>e+t.length,0)}get nullCount(){return-1===this._nullCount&&(this._nullCount=Jt(this.data)),this._nullCount}isValid(e){return!1}get(e){return null}set(e,t){}indexOf(e,t){return-1}getByteLength(e){return 0}[Symbol.iterator](){return this.batches.length>0?bn.visit(new In(this.data)):new Array(0)[Symbol.iterator]()}toArray(){return[...this]}toString(){return`[\n  ${this.toArray().join(",\n  ")}\n]`}concat(){const e=this.schema;for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];const i=this.data.concat(n.flatMap(e=>{let{data:t}=e;return t}));return new nr(e,i.map(t=>new Jn(e,t)))}slice(e,t){const n=this.schema;[e,t]=Yt({length:this.numRows},e,t);const r=Zt(this.data,this._offsets,e,t);return new nr(n,r.map(e=>new Jn(n,e)))}getChild(e){return this.getChildAt(this.schema.fields.findIndex(t=>t.name===e))}getChildAt(e){if(e>-1&&e<this.schema.fields.length){const t=this.data.map(t=>t.children[e]);if(0===t.length){const{type:n}=this.schema.fields[e],r=On({type:n,length:0,nullCount:0});t.push(r._changeLengthAndBackfillNullBitmap(this.numRows))}return new In(t)}return null}setChild(e,t){var n;return this.setChildAt(null===(n=this.schema.fields)||void 0===n?void 0:n.findIndex(t=>t.name===e),t)}setChildAt(e,t){let n=this.schema,r=[...this.batches];if(e>-1&&e<this.numCols){t||(t=new In([On({type:new ge,length:this.numRows})]));const i=n.fields.slice(),o=i[e].clone({type:t.type}),a=this.schema.fields.map((e,t)=>this.getChildAt(t));[i[e],a[e]]=[o,t],[n,r]=er(n,a)}return new nr(n,r)}select(e){const t=this.schema.fields.reduce((e,t,n)=>e.set(t.name,n),new Map);return this.selectAt(e.map(e=>t.get(e)).filter(e=>e>-1))}selectAt(e){const t=this.schema.selectAt(e),n=this.batches.map(t=>t.selectAt(e));return new nr(t,n)}assign(e){const t=this.schema.fields,[n,r]=e.schema.fields.reduce((e,n,r)=>{const[i,o]=e,a=t.findIndex(e=>e.name===n.name);return~a?o[a]=r:i.push(r),e},[[],[]]),i=this.schema.assign(e.schema),o=[...t.map((e,t)=>[t,r[t]]).map(t=>{let[n,r]=t;return void 0===r?this.getChildAt(n):e.getChildAt(r)}),...n.map(t=>e.getChildAt(t))].filter(Boolean);return new nr(...er(i,o))}}Gn=Symbol.toStringTag,nr[Gn]=(e=>(e.schema=null,e.batches=[],e._offsets=new Uint32Array([0]),e._nullCount=-1,e[Symbol.isConcatSpreadable]=!0,e.isValid=nn(tn),e.get=nn(Bt.getVisitFn(A.Struct)),e.set=rn(ft.getVisitFn(A.Struct)),e.indexOf=on(yn.getVisitFn(A.Struct)),e.getByteLength=nn(kn.getVisitFn(A.Struct)),"Table"))(nr.prototype);var rr,ir=function(){function e(e,t,n,r){var i=this;this.getCell=function(e,t){var n=e<i.headerRows&&t<i.headerColumns,r=e>=i.headerRows&&t<i.headerColumns,o=e<i.headerRows&&t>=i.headerColumns;if(n){var a=["blank"];return t>0&&a.push("level"+e),{type:"blank",classNames:a.join(" "),content:""}}if(o)return{type:"columns",classNames:(a=["col_heading","level"+e,"col"+(s=t-i.headerColumns)]).join(" "),content:i.getContent(i.columnsTable,s,e)};if(r){a=["row_heading","level"+t,"row"+(l=e-i.headerRows)];return{type:"index",id:"T_"+i.uuid+"level"+t+"_row"+l,classNames:a.join(" "),content:i.getContent(i.indexTable,l,t)}}a=["data","row"+(l=e-i.headerRows),"col"+(s=t-i.headerColumns)];var l,s,u=i.styler?i.getContent(i.styler.displayValuesTable,l,s):i.getContent(i.dataTable,l,s);return{type:"data",id:"T_"+i.uuid+"row"+l+"_col"+s,classNames:a.join(" "),content:u}},this.getContent=function(e,t,n){var r=e.getColumnAt(n);return null===r?"":i.getColumnTypeId(e,n)===A.Timestamp?i.nanosToDate(r.get(t)):r.get(t)},this.dataTable=nr.from(e),this.indexTable=nr.from(t),this.columnsTable=nr.from(n),this.styler=r?{caption:r.caption,displayValuesTable:nr.from(r.displayValues),styles:r.styles,uuid:r.uuid}:void 0}return Object.defineProperty(e.prototype,"rows",{get:function(){return this.indexTable.length+this.columnsTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columns",{get:function(){return this.indexTable.numCols+this.columnsTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerRows",{get:function(){return this.rows-this.dataRows},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"headerColumns",{get:function(){return this.columns-this.dataColumns},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataRows",{get:function(){return this.dataTable.length},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"dataColumns",{get:function(){return this.dataTable.numCols},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"uuid",{get:function(){return this.styler&&this.styler.uuid},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"caption",{get:function(){return this.styler&&this.styler.caption},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"styles",{get:function(){return this.styler&&this.styler.styles},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"table",{get:function(){return this.dataTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"index",{get:function(){return this.indexTable},enumerable:!0,configurable:!0}),Object.defineProperty(e.prototype,"columnTable",{get:function(){return this.columnsTable},enumerable:!0,configurable:!0}),e.prototype.serialize=function(){return{data:this.dataTable.serialize(),index:this.indexTable.serialize(),columns:this.columnsTable.serialize()}},e.prototype.getColumnTypeId=function(e,t){return e.schema.fields[t].type.typeId},e.prototype.nanosToDate=function(e){return new Date(e/1e6)},e}(),or=function(){return or=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var i in t=arguments[n])Object.prototype.hasOwnProperty.call(t,i)&&(e[i]=t[i]);return e},or.apply(this,arguments)};!function(e){e.COMPONENT_READY="streamlit:componentReady",e.SET_COMPONENT_VALUE="streamlit:setComponentValue",e.SET_FRAME_HEIGHT="streamlit:setFrameHeight"}(rr||(rr={}));var ar=function(){function e(){}return e.API_VERSION=1,e.RENDER_EVENT="streamlit:render",e.events=new _,e.registeredMessageListener=!1,e.setComponentReady=function(){e.registeredMessageListener||(window.addEventListener("message",e.onMessageEvent),e.registeredMessageListener=!0),e.sendBackMsg(rr.COMPONENT_READY,{apiVersion:e.API_VERSION})},e.setFrameHeight=function(t){void 0===t&&(t=document.body.scrollHeight),t!==e.lastFrameHeight&&(e.lastFrameHeight=t,e.sendBackMsg(rr.SET_FRAME_HEIGHT,{height:t}))},e.setComponentValue=function(t){var n;t instanceof ir?(n="dataframe",t=t.serialize()):!function(e){var t=!1;try{t=e instanceof BigInt64Array||e instanceof BigUint64Array}catch(n){}return e instanceof Int8Array||e instanceof Uint8Array||e instanceof Uint8ClampedArray||e instanceof Int16Array||e instanceof Uint16Array||e instanceof Int32Array||e instanceof Uint32Array||e instanceof Float32Array||e instanceof Float64Array||t}(t)?t instanceof ArrayBuffer?(n="bytes",t=new Uint8Array(t)):n="json":(n="bytes",t=new Uint8Array(t.buffer)),e.sendBackMsg(rr.SET_COMPONENT_VALUE,{value:t,dataType:n})},e.onMessageEvent=function(t){if(t.data.type===e.RENDER_EVENT)e.onRenderMessage(t.data)},e.onRenderMessage=function(t){var n=t.args;null==n&&(console.error("Got null args in onRenderMessage. This should never happen"),n={});var r=t.dfs&&t.dfs.length>0?e.argsDataframeToObject(t.dfs):{};n=or(or({},n),r);var i=Boolean(t.disabled),o=t.theme;o&&lr(o);var a={disabled:i,args:n,theme:o},l=new CustomEvent(e.RENDER_EVENT,{detail:a});e.events.dispatchEvent(l)},e.argsDataframeToObject=function(t){var n=t.map(function(t){var n=t.key,r=t.value;return[n,e.toArrowTable(r)]});return Object.fromEntries(n)},e.toArrowTable=function(e){var t=e.data,n=t.data,r=t.index,i=t.columns,o=t.styler;return new ir(n,r,i,o)},e.sendBackMsg=function(e,t){window.parent.postMessage(or({isStreamlitMessage:!0,type:e},t),"*")},e}(),lr=function(e){var t=document.createElement("style");document.head.appendChild(t),t.innerHTML="\n    :root {\n      --primary-color: "+e.primaryColor+";\n      --background-color: "+e.backgroundColor+";\n      --secondary-background-color: "+e.secondaryBackgroundColor+";\n      --text-color: "+e.textColor+";\n      --font: "+e.font+";\n    }\n\n    body {\n      background-color: var(--background-color);\n      color: var(--text-color);\n    }\n  "};var sr=function(){var e=function(t,n){return e=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n])},e(t,n)};return function(t,n){function r(){this.constructor=t}e(t,n),t.prototype=null===n?Object.create(n):(r.prototype=n.prototype,new r)}}();!function(e){function t(){return null!==e&&e.apply(this,arguments)||this}sr(t,e),t.prototype.componentDidMount=function(){ar.setFrameHeight()},t.prototype.componentDidUpdate=function(){ar.setFrameHeight()}}(l.PureComponent);function ur(){}function cr(e){return null==e?ur:function(){return this.querySelector(e)}}function fr(){return[]}function dr(e){return null==e?fr:function(){return this.querySelectorAll(e)}}function hr(e){return function(){return null==(t=e.apply(this,arguments))?[]:Array.isArray(t)?t:Array.from(t);var t}}function pr(e){return function(){return this.matches(e)}}function yr(e){return function(t){return t.matches(e)}}var mr=Array.prototype.find;function gr(){return this.firstElementChild}var vr=Array.prototype.filter;function br(){return Array.from(this.children)}function wr(e){return new Array(e.length)}function xr(e,t){this.ownerDocument=e.ownerDocument,this.namespaceURI=e.namespaceURI,this._next=null,this._parent=e,this.__data__=t}function Sr(e,t,n,r,i,o){for(var a,l=0,s=t.length,u=o.length;l<u;++l)(a=t[l])?(a.__data__=o[l],r[l]=a):n[l]=new xr(e,o[l]);for(;l<s;++l)(a=t[l])&&(i[l]=a)}function _r(e,t,n,r,i,o,a){var l,s,u,c=new Map,f=t.length,d=o.length,h=new Array(f);for(l=0;l<f;++l)(s=t[l])&&(h[l]=u=a.call(s,s.__data__,l,t)+"",c.has(u)?i[l]=s:c.set(u,s));for(l=0;l<d;++l)u=a.call(e,o[l],l,o)+"",(s=c.get(u))?(r[l]=s,s.__data__=o[l],c.delete(u)):n[l]=new xr(e,o[l]);for(l=0;l<f;++l)(s=t[l])&&c.get(h[l])===s&&(i[l]=s)}function kr(e){return e.__data__}function Tr(e){return"object"===typeof e&&"length"in e?e:Array.from(e)}function Er(e,t){return e<t?-1:e>t?1:e>=t?0:NaN}xr.prototype={constructor:xr,appendChild:function(e){return this._parent.insertBefore(e,this._next)},insertBefore:function(e,t){return this._parent.insertBefore(e,t)},querySelector:function(e){return this._parent.querySelector(e)},querySelectorAll:function(e){return this._parent.querySelectorAll(e)}};var Cr="http://www.w3.org/1999/xhtml";const Ir={svg:"http://www.w3.org/2000/svg",xhtml:Cr,xlink:"http://www.w3.org/1999/xlink",xml:"http://www.w3.org/XML/1998/namespace",xmlns:"http://www.w3.org/2000/xmlns/"};function Mr(e){var t=e+="",n=t.indexOf(":");return n>=0&&"xmlns"!==(t=e.slice(0,n))&&(e=e.slice(n+1)),Ir.hasOwnProperty(t)?{space:Ir[t],local:e}:e}function Nr(e){return function(){this.removeAttribute(e)}}function Ar(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Or(e,t){return function(){this.setAttribute(e,t)}}function zr(e,t){return function(){this.setAttributeNS(e.space,e.local,t)}}function Dr(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttribute(e):this.setAttribute(e,n)}}function $r(e,t){return function(){var n=t.apply(this,arguments);null==n?this.removeAttributeNS(e.space,e.local):this.setAttributeNS(e.space,e.local,n)}}function Pr(e){return e.ownerDocument&&e.ownerDocument.defaultView||e.document&&e||e.defaultView}function Lr(e){return function(){this.style.removeProperty(e)}}function Br(e,t,n){return function(){this.style.setProperty(e,t,n)}}function Fr(e,t,n){return function(){var r=t.apply(this,arguments);null==r?this.style.removeProperty(e):this.style.setProperty(e,r,n)}}function Rr(e,t){return e.style.getPropertyValue(t)||Pr(e).getComputedStyle(e,null).getPropertyValue(t)}function Ur(e){return function(){delete this[e]}}function jr(e,t){return function(){this[e]=t}}function Vr(e,t){return function(){var n=t.apply(this,arguments);null==n?delete this[e]:this[e]=n}}function Hr(e){return e.trim().split(/^|\s+/)}function Yr(e){return e.classList||new Wr(e)}function Wr(e){this._node=e,this._names=Hr(e.getAttribute("class")||"")}function Xr(e,t){for(var n=Yr(e),r=-1,i=t.length;++r<i;)n.add(t[r])}function qr(e,t){for(var n=Yr(e),r=-1,i=t.length;++r<i;)n.remove(t[r])}function Qr(e){return function(){Xr(this,e)}}function Gr(e){return function(){qr(this,e)}}function Jr(e,t){return function(){(t.apply(this,arguments)?Xr:qr)(this,e)}}function Kr(){this.textContent=""}function Zr(e){return function(){this.textContent=e}}function ei(e){return function(){var t=e.apply(this,arguments);this.textContent=null==t?"":t}}function ti(){this.innerHTML=""}function ni(e){return function(){this.innerHTML=e}}function ri(e){return function(){var t=e.apply(this,arguments);this.innerHTML=null==t?"":t}}function ii(){this.nextSibling&&this.parentNode.appendChild(this)}function oi(){this.previousSibling&&this.parentNode.insertBefore(this,this.parentNode.firstChild)}function ai(e){return function(){var t=this.ownerDocument,n=this.namespaceURI;return n===Cr&&t.documentElement.namespaceURI===Cr?t.createElement(e):t.createElementNS(n,e)}}function li(e){return function(){return this.ownerDocument.createElementNS(e.space,e.local)}}function si(e){var t=Mr(e);return(t.local?li:ai)(t)}function ui(){return null}function ci(){var e=this.parentNode;e&&e.removeChild(this)}function fi(){var e=this.cloneNode(!1),t=this.parentNode;return t?t.insertBefore(e,this.nextSibling):e}function di(){var e=this.cloneNode(!0),t=this.parentNode;return t?t.insertBefore(e,this.nextSibling):e}function hi(e){return function(){var t=this.__on;if(t){for(var n,r=0,i=-1,o=t.length;r<o;++r)n=t[r],e.type&&n.type!==e.type||n.name!==e.name?t[++i]=n:this.removeEventListener(n.type,n.listener,n.options);++i?t.length=i:delete this.__on}}}function pi(e,t,n){return function(){var r,i=this.__on,o=function(e){return function(t){e.call(this,t,this.__data__)}}(t);if(i)for(var a=0,l=i.length;a<l;++a)if((r=i[a]).type===e.type&&r.name===e.name)return this.removeEventListener(r.type,r.listener,r.options),this.addEventListener(r.type,r.listener=o,r.options=n),void(r.value=t);this.addEventListener(e.type,o,n),r={type:e.type,name:e.name,value:t,listener:o,options:n},i?i.push(r):this.__on=[r]}}function yi(e,t,n){var r=Pr(e),i=r.CustomEvent;"function"===typeof i?i=new i(t,n):(i=r.document.createEvent("Event"),n?(i.initEvent(t,n.bubbles,n.cancelable),i.detail=n.detail):i.initEvent(t,!1,!1)),e.dispatchEvent(i)}function mi(e,t){return function(){return yi(this,e,t)}}function gi(e,t){return function(){return yi(this,e,t.apply(this,arguments))}}Wr.prototype={add:function(e){this._names.indexOf(e)<0&&(this._names.push(e),this._node.setAttribute("class",this._names.join(" ")))},remove:function(e){var t=this._names.indexOf(e);t>=0&&(this._names.splice(t,1),this._node.setAttribute("class",this._names.join(" ")))},contains:function(e){return this._names.indexOf(e)>=0}};var vi=[null];function bi(e,t){this._groups=e,this._parents=t}function wi(){return new bi([[document.documentElement]],vi)}bi.prototype=wi.prototype={constructor:bi,select:function(e){"function"!==typeof e&&(e=cr(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a,l=t[i],s=l.length,u=r[i]=new Array(s),c=0;c<s;++c)(o=l[c])&&(a=e.call(o,o.__data__,c,l))&&("__data__"in o&&(a.__data__=o.__data__),u[c]=a);return new bi(r,this._parents)},selectAll:function(e){e="function"===typeof e?hr(e):dr(e);for(var t=this._groups,n=t.length,r=[],i=[],o=0;o<n;++o)for(var a,l=t[o],s=l.length,u=0;u<s;++u)(a=l[u])&&(r.push(e.call(a,a.__data__,u,l)),i.push(a));return new bi(r,i)},selectChild:function(e){return this.select(null==e?gr:function(e){return function(){return mr.call(this.children,e)}}("function"===typeof e?e:yr(e)))},selectChildren:function(e){return this.selectAll(null==e?br:function(e){return function(){return vr.call(this.children,e)}}("function"===typeof e?e:yr(e)))},filter:function(e){"function"!==typeof e&&(e=pr(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],l=a.length,s=r[i]=[],u=0;u<l;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&s.push(o);return new bi(r,this._parents)},data:function(e,t){if(!arguments.length)return Array.from(this,kr);var n,r=t?_r:Sr,i=this._parents,o=this._groups;"function"!==typeof e&&(n=e,e=function(){return n});for(var a=o.length,l=new Array(a),s=new Array(a),u=new Array(a),c=0;c<a;++c){var f=i[c],d=o[c],h=d.length,p=Tr(e.call(f,f&&f.__data__,c,i)),y=p.length,m=s[c]=new Array(y),g=l[c]=new Array(y);r(f,d,m,g,u[c]=new Array(h),p,t);for(var v,b,w=0,x=0;w<y;++w)if(v=m[w]){for(w>=x&&(x=w+1);!(b=g[x])&&++x<y;);v._next=b||null}}return(l=new bi(l,i))._enter=s,l._exit=u,l},enter:function(){return new bi(this._enter||this._groups.map(wr),this._parents)},exit:function(){return new bi(this._exit||this._groups.map(wr),this._parents)},join:function(e,t,n){var r=this.enter(),i=this,o=this.exit();return"function"===typeof e?(r=e(r))&&(r=r.selection()):r=r.append(e+""),null!=t&&(i=t(i))&&(i=i.selection()),null==n?o.remove():n(o),r&&i?r.merge(i).order():i},merge:function(e){for(var t=e.selection?e.selection():e,n=this._groups,r=t._groups,i=n.length,o=r.length,a=Math.min(i,o),l=new Array(i),s=0;s<a;++s)for(var u,c=n[s],f=r[s],d=c.length,h=l[s]=new Array(d),p=0;p<d;++p)(u=c[p]||f[p])&&(h[p]=u);for(;s<i;++s)l[s]=n[s];return new bi(l,this._parents)},selection:function(){return this},order:function(){for(var e=this._groups,t=-1,n=e.length;++t<n;)for(var r,i=e[t],o=i.length-1,a=i[o];--o>=0;)(r=i[o])&&(a&&4^r.compareDocumentPosition(a)&&a.parentNode.insertBefore(r,a),a=r);return this},sort:function(e){function t(t,n){return t&&n?e(t.__data__,n.__data__):!t-!n}e||(e=Er);for(var n=this._groups,r=n.length,i=new Array(r),o=0;o<r;++o){for(var a,l=n[o],s=l.length,u=i[o]=new Array(s),c=0;c<s;++c)(a=l[c])&&(u[c]=a);u.sort(t)}return new bi(i,this._parents).order()},call:function(){var e=arguments[0];return arguments[0]=this,e.apply(null,arguments),this},nodes:function(){return Array.from(this)},node:function(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r=e[t],i=0,o=r.length;i<o;++i){var a=r[i];if(a)return a}return null},size:function(){let e=0;for(const t of this)++e;return e},empty:function(){return!this.node()},each:function(e){for(var t=this._groups,n=0,r=t.length;n<r;++n)for(var i,o=t[n],a=0,l=o.length;a<l;++a)(i=o[a])&&e.call(i,i.__data__,a,o);return this},attr:function(e,t){var n=Mr(e);if(arguments.length<2){var r=this.node();return n.local?r.getAttributeNS(n.space,n.local):r.getAttribute(n)}return this.each((null==t?n.local?Ar:Nr:"function"===typeof t?n.local?$r:Dr:n.local?zr:Or)(n,t))},style:function(e,t,n){return arguments.length>1?this.each((null==t?Lr:"function"===typeof t?Fr:Br)(e,t,null==n?"":n)):Rr(this.node(),e)},property:function(e,t){return arguments.length>1?this.each((null==t?Ur:"function"===typeof t?Vr:jr)(e,t)):this.node()[e]},classed:function(e,t){var n=Hr(e+"");if(arguments.length<2){for(var r=Yr(this.node()),i=-1,o=n.length;++i<o;)if(!r.contains(n[i]))return!1;return!0}return this.each(("function"===typeof t?Jr:t?Qr:Gr)(n,t))},text:function(e){return arguments.length?this.each(null==e?Kr:("function"===typeof e?ei:Zr)(e)):this.node().textContent},html:function(e){return arguments.length?this.each(null==e?ti:("function"===typeof e?ri:ni)(e)):this.node().innerHTML},raise:function(){return this.each(ii)},lower:function(){return this.each(oi)},append:function(e){var t="function"===typeof e?e:si(e);return this.select(function(){return this.appendChild(t.apply(this,arguments))})},insert:function(e,t){var n="function"===typeof e?e:si(e),r=null==t?ui:"function"===typeof t?t:cr(t);return this.select(function(){return this.insertBefore(n.apply(this,arguments),r.apply(this,arguments)||null)})},remove:function(){return this.each(ci)},clone:function(e){return this.select(e?di:fi)},datum:function(e){return arguments.length?this.property("__data__",e):this.node().__data__},on:function(e,t,n){var r,i,o=function(e){return e.trim().split(/^|\s+/).map(function(e){var t="",n=e.indexOf(".");return n>=0&&(t=e.slice(n+1),e=e.slice(0,n)),{type:e,name:t}})}(e+""),a=o.length;if(!(arguments.length<2)){for(l=t?pi:hi,r=0;r<a;++r)this.each(l(o[r],t,n));return this}var l=this.node().__on;if(l)for(var s,u=0,c=l.length;u<c;++u)for(r=0,s=l[u];r<a;++r)if((i=o[r]).type===s.type&&i.name===s.name)return s.value},dispatch:function(e,t){return this.each(("function"===typeof t?gi:mi)(e,t))},[Symbol.iterator]:function*(){for(var e=this._groups,t=0,n=e.length;t<n;++t)for(var r,i=e[t],o=0,a=i.length;o<a;++o)(r=i[o])&&(yield r)}};const xi=wi;function Si(e){return"string"===typeof e?new bi([[document.querySelector(e)]],[document.documentElement]):new bi([[e]],vi)}function _i(e){var t=0,n=e.children,r=n&&n.length;if(r)for(;--r>=0;)t+=n[r].value;else t=1;e.value=t}function ki(e,t){e instanceof Map?(e=[void 0,e],void 0===t&&(t=Ei)):void 0===t&&(t=Ti);for(var n,r,i,o,a,l=new Mi(e),s=[l];n=s.pop();)if((i=t(n.data))&&(a=(i=Array.from(i)).length))for(n.children=i,o=a-1;o>=0;--o)s.push(r=i[o]=new Mi(i[o])),r.parent=n,r.depth=n.depth+1;return l.eachBefore(Ii)}function Ti(e){return e.children}function Ei(e){return Array.isArray(e)?e[1]:null}function Ci(e){void 0!==e.data.value&&(e.value=e.data.value),e.data=e.data.data}function Ii(e){var t=0;do{e.height=t}while((e=e.parent)&&e.height<++t)}function Mi(e){this.data=e,this.depth=this.height=0,this.parent=null}function Ni(e,t){return e.parent===t.parent?1:2}function Ai(e){var t=e.children;return t?t[0]:e.t}function Oi(e){var t=e.children;return t?t[t.length-1]:e.t}function zi(e,t,n){var r=n/(t.i-e.i);t.c-=r,t.s+=n,e.c+=r,t.z+=n,t.m+=n}function Di(e,t,n){return e.a.parent===t.parent?e.a:n}function $i(e,t){this._=e,this.parent=null,this.children=null,this.A=null,this.a=this,this.z=0,this.m=0,this.c=0,this.s=0,this.t=null,this.i=t}function Pi(e){return null==e?null:function(e){if("function"!==typeof e)throw new Error;return e}(e)}Mi.prototype=ki.prototype={constructor:Mi,count:function(){return this.eachAfter(_i)},each:function(e,t){let n=-1;for(const r of this)e.call(t,r,++n,this);return this},eachAfter:function(e,t){for(var n,r,i,o=this,a=[o],l=[],s=-1;o=a.pop();)if(l.push(o),n=o.children)for(r=0,i=n.length;r<i;++r)a.push(n[r]);for(;o=l.pop();)e.call(t,o,++s,this);return this},eachBefore:function(e,t){for(var n,r,i=this,o=[i],a=-1;i=o.pop();)if(e.call(t,i,++a,this),n=i.children)for(r=n.length-1;r>=0;--r)o.push(n[r]);return this},find:function(e,t){let n=-1;for(const r of this)if(e.call(t,r,++n,this))return r},sum:function(e){return this.eachAfter(function(t){for(var n=+e(t.data)||0,r=t.children,i=r&&r.length;--i>=0;)n+=r[i].value;t.value=n})},sort:function(e){return this.eachBefore(function(t){t.children&&t.children.sort(e)})},path:function(e){for(var t=this,n=function(e,t){if(e===t)return e;var n=e.ancestors(),r=t.ancestors(),i=null;e=n.pop(),t=r.pop();for(;e===t;)i=e,e=n.pop(),t=r.pop();return i}(t,e),r=[t];t!==n;)t=t.parent,r.push(t);for(var i=r.length;e!==n;)r.splice(i,0,e),e=e.parent;return r},ancestors:function(){for(var e=this,t=[e];e=e.parent;)t.push(e);return t},descendants:function(){return Array.from(this)},leaves:function(){var e=[];return this.eachBefore(function(t){t.children||e.push(t)}),e},links:function(){var e=this,t=[];return e.each(function(n){n!==e&&t.push({source:n.parent,target:n})}),t},copy:function(){return ki(this).eachBefore(Ci)},[Symbol.iterator]:function*(){var e,t,n,r,i=this,o=[i];do{for(e=o.reverse(),o=[];i=e.pop();)if(yield i,t=i.children)for(n=0,r=t.length;n<r;++n)o.push(t[n])}while(o.length)}},$i.prototype=Object.create(Mi.prototype);var Li={depth:-1},Bi={},Fi={};function Ri(e){return e.id}function Ui(e){return e.parentId}function ji(e){let t=e.length;if(t<2)return"";for(;--t>1&&!Vi(e,t););return e.slice(0,t)}function Vi(e,t){if("/"===e[t]){let n=0;for(;t>0&&"\\"===e[--t];)++n;if(0===(1&n))return!0}return!1}var Hi={value:()=>{}};function Yi(){for(var e,t=0,n=arguments.length,r={};t<n;++t){if(!(e=arguments[t]+"")||e in r||/[\s.]/.test(e))throw new Error("illegal type: "+e);r[e]=[]}return new Wi(r)}function Wi(e){this._=e}function Xi(e,t){for(var n,r=0,i=e.length;r<i;++r)if((n=e[r]).name===t)return n.value}function qi(e,t,n){for(var r=0,i=e.length;r<i;++r)if(e[r].name===t){e[r]=Hi,e=e.slice(0,r).concat(e.slice(r+1));break}return null!=n&&e.push({name:t,value:n}),e}Wi.prototype=Yi.prototype={constructor:Wi,on:function(e,t){var n,r,i=this._,o=(r=i,(e+"").trim().split(/^|\s+/).map(function(e){var t="",n=e.indexOf(".");if(n>=0&&(t=e.slice(n+1),e=e.slice(0,n)),e&&!r.hasOwnProperty(e))throw new Error("unknown type: "+e);return{type:e,name:t}})),a=-1,l=o.length;if(!(arguments.length<2)){if(null!=t&&"function"!==typeof t)throw new Error("invalid callback: "+t);for(;++a<l;)if(n=(e=o[a]).type)i[n]=qi(i[n],e.name,t);else if(null==t)for(n in i)i[n]=qi(i[n],e.name,null);return this}for(;++a<l;)if((n=(e=o[a]).type)&&(n=Xi(i[n],e.name)))return n},copy:function(){var e={},t=this._;for(var n in t)e[n]=t[n].slice();return new Wi(e)},call:function(e,t){if((n=arguments.length-2)>0)for(var n,r,i=new Array(n),o=0;o<n;++o)i[o]=arguments[o+2];if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(o=0,n=(r=this._[e]).length;o<n;++o)r[o].value.apply(t,i)},apply:function(e,t,n){if(!this._.hasOwnProperty(e))throw new Error("unknown type: "+e);for(var r=this._[e],i=0,o=r.length;i<o;++i)r[i].value.apply(t,n)}};const Qi=Yi,Gi={capture:!0,passive:!1};function Ji(e){e.preventDefault(),e.stopImmediatePropagation()}function Ki(e){return((e=Math.exp(e))+1/e)/2}const Zi=function e(t,n,r){function i(e,i){var o,a,l=e[0],s=e[1],u=e[2],c=i[0],f=i[1],d=i[2],h=c-l,p=f-s,y=h*h+p*p;if(y<1e-12)a=Math.log(d/u)/t,o=function(e){return[l+e*h,s+e*p,u*Math.exp(t*e*a)]};else{var m=Math.sqrt(y),g=(d*d-u*u+r*y)/(2*u*n*m),v=(d*d-u*u-r*y)/(2*d*n*m),b=Math.log(Math.sqrt(g*g+1)-g),w=Math.log(Math.sqrt(v*v+1)-v);a=(w-b)/t,o=function(e){var r,i=e*a,o=Ki(b),c=u/(n*m)*(o*(r=t*i+b,((r=Math.exp(2*r))-1)/(r+1))-function(e){return((e=Math.exp(e))-1/e)/2}(b));return[l+c*h,s+c*p,u*o/Ki(t*i+b)]}}return o.duration=1e3*a*t/Math.SQRT2,o}return i.rho=function(t){var n=Math.max(.001,+t),r=n*n;return e(n,r,r*r)},i}(Math.SQRT2,2,4);function eo(e,t){if(e=function(e){let t;for(;t=e.sourceEvent;)e=t;return e}(e),void 0===t&&(t=e.currentTarget),t){var n=t.ownerSVGElement||t;if(n.createSVGPoint){var r=n.createSVGPoint();return r.x=e.clientX,r.y=e.clientY,[(r=r.matrixTransform(t.getScreenCTM().inverse())).x,r.y]}if(t.getBoundingClientRect){var i=t.getBoundingClientRect();return[e.clientX-i.left-t.clientLeft,e.clientY-i.top-t.clientTop]}}return[e.pageX,e.pageY]}var to,no,ro=0,io=0,oo=0,ao=0,lo=0,so=0,uo="object"===typeof performance&&performance.now?performance:Date,co="object"===typeof window&&window.requestAnimationFrame?window.requestAnimationFrame.bind(window):function(e){setTimeout(e,17)};function fo(){return lo||(co(ho),lo=uo.now()+so)}function ho(){lo=0}function po(){this._call=this._time=this._next=null}function yo(e,t,n){var r=new po;return r.restart(e,t,n),r}function mo(){lo=(ao=uo.now())+so,ro=io=0;try{!function(){fo(),++ro;for(var e,t=to;t;)(e=lo-t._time)>=0&&t._call.call(void 0,e),t=t._next;--ro}()}finally{ro=0,function(){var e,t,n=to,r=1/0;for(;n;)n._call?(r>n._time&&(r=n._time),e=n,n=n._next):(t=n._next,n._next=null,n=e?e._next=t:to=t);no=e,vo(r)}(),lo=0}}function go(){var e=uo.now(),t=e-ao;t>1e3&&(so-=t,ao=e)}function vo(e){ro||(io&&(io=clearTimeout(io)),e-lo>24?(e<1/0&&(io=setTimeout(mo,e-uo.now()-so)),oo&&(oo=clearInterval(oo))):(oo||(ao=uo.now(),oo=setInterval(go,1e3)),ro=1,co(mo)))}function bo(e,t,n){var r=new po;return t=null==t?0:+t,r.restart(n=>{r.stop(),e(n+t)},t,n),r}po.prototype=yo.prototype={constructor:po,restart:function(e,t,n){if("function"!==typeof e)throw new TypeError("callback is not a function");n=(null==n?fo():+n)+(null==t?0:+t),this._next||no===this||(no?no._next=this:to=this,no=this),this._call=e,this._time=n,vo()},stop:function(){this._call&&(this._call=null,this._time=1/0,vo())}};var wo=Qi("start","end","cancel","interrupt"),xo=[];function So(e,t,n,r,i,o){var a=e.__transition;if(a){if(n in a)return}else e.__transition={};!function(e,t,n){var r,i=e.__transition;function o(e){n.state=1,n.timer.restart(a,n.delay,n.time),n.delay<=e&&a(e-n.delay)}function a(o){var u,c,f,d;if(1!==n.state)return s();for(u in i)if((d=i[u]).name===n.name){if(3===d.state)return bo(a);4===d.state?(d.state=6,d.timer.stop(),d.on.call("interrupt",e,e.__data__,d.index,d.group),delete i[u]):+u<t&&(d.state=6,d.timer.stop(),d.on.call("cancel",e,e.__data__,d.index,d.group),delete i[u])}if(bo(function(){3===n.state&&(n.state=4,n.timer.restart(l,n.delay,n.time),l(o))}),n.state=2,n.on.call("start",e,e.__data__,n.index,n.group),2===n.state){for(n.state=3,r=new Array(f=n.tween.length),u=0,c=-1;u<f;++u)(d=n.tween[u].value.call(e,e.__data__,n.index,n.group))&&(r[++c]=d);r.length=c+1}}function l(t){for(var i=t<n.duration?n.ease.call(null,t/n.duration):(n.timer.restart(s),n.state=5,1),o=-1,a=r.length;++o<a;)r[o].call(e,i);5===n.state&&(n.on.call("end",e,e.__data__,n.index,n.group),s())}function s(){for(var r in n.state=6,n.timer.stop(),delete i[t],i)return;delete e.__transition}i[t]=n,n.timer=yo(o,0,n.time)}(e,n,{name:t,index:r,group:i,on:wo,tween:xo,time:o.time,delay:o.delay,duration:o.duration,ease:o.ease,timer:null,state:0})}function _o(e,t){var n=To(e,t);if(n.state>0)throw new Error("too late; already scheduled");return n}function ko(e,t){var n=To(e,t);if(n.state>3)throw new Error("too late; already running");return n}function To(e,t){var n=e.__transition;if(!n||!(n=n[t]))throw new Error("transition not found");return n}function Eo(e,t){var n,r,i,o=e.__transition,a=!0;if(o){for(i in t=null==t?null:t+"",o)(n=o[i]).name===t?(r=n.state>2&&n.state<5,n.state=6,n.timer.stop(),n.on.call(r?"interrupt":"cancel",e,e.__data__,n.index,n.group),delete o[i]):a=!1;a&&delete e.__transition}}function Co(e,t){return e=+e,t=+t,function(n){return e*(1-n)+t*n}}var Io,Mo=180/Math.PI,No={translateX:0,translateY:0,rotate:0,skewX:0,scaleX:1,scaleY:1};function Ao(e,t,n,r,i,o){var a,l,s;return(a=Math.sqrt(e*e+t*t))&&(e/=a,t/=a),(s=e*n+t*r)&&(n-=e*s,r-=t*s),(l=Math.sqrt(n*n+r*r))&&(n/=l,r/=l,s/=l),e*r<t*n&&(e=-e,t=-t,s=-s,a=-a),{translateX:i,translateY:o,rotate:Math.atan2(t,e)*Mo,skewX:Math.atan(s)*Mo,scaleX:a,scaleY:l}}function Oo(e,t,n,r){function i(e){return e.length?e.pop()+" ":""}return function(o,a){var l=[],s=[];return o=e(o),a=e(a),function(e,r,i,o,a,l){if(e!==i||r!==o){var s=a.push("translate(",null,t,null,n);l.push({i:s-4,x:Co(e,i)},{i:s-2,x:Co(r,o)})}else(i||o)&&a.push("translate("+i+t+o+n)}(o.translateX,o.translateY,a.translateX,a.translateY,l,s),function(e,t,n,o){e!==t?(e-t>180?t+=360:t-e>180&&(e+=360),o.push({i:n.push(i(n)+"rotate(",null,r)-2,x:Co(e,t)})):t&&n.push(i(n)+"rotate("+t+r)}(o.rotate,a.rotate,l,s),function(e,t,n,o){e!==t?o.push({i:n.push(i(n)+"skewX(",null,r)-2,x:Co(e,t)}):t&&n.push(i(n)+"skewX("+t+r)}(o.skewX,a.skewX,l,s),function(e,t,n,r,o,a){if(e!==n||t!==r){var l=o.push(i(o)+"scale(",null,",",null,")");a.push({i:l-4,x:Co(e,n)},{i:l-2,x:Co(t,r)})}else 1===n&&1===r||o.push(i(o)+"scale("+n+","+r+")")}(o.scaleX,o.scaleY,a.scaleX,a.scaleY,l,s),o=a=null,function(e){for(var t,n=-1,r=s.length;++n<r;)l[(t=s[n]).i]=t.x(e);return l.join("")}}}var zo=Oo(function(e){const t=new("function"===typeof DOMMatrix?DOMMatrix:WebKitCSSMatrix)(e+"");return t.isIdentity?No:Ao(t.a,t.b,t.c,t.d,t.e,t.f)},"px, ","px)","deg)"),Do=Oo(function(e){return null==e?No:(Io||(Io=document.createElementNS("http://www.w3.org/2000/svg","g")),Io.setAttribute("transform",e),(e=Io.transform.baseVal.consolidate())?Ao((e=e.matrix).a,e.b,e.c,e.d,e.e,e.f):No)},", ",")",")");function $o(e,t){var n,r;return function(){var i=ko(this,e),o=i.tween;if(o!==n)for(var a=0,l=(r=n=o).length;a<l;++a)if(r[a].name===t){(r=r.slice()).splice(a,1);break}i.tween=r}}function Po(e,t,n){var r,i;if("function"!==typeof n)throw new Error;return function(){var o=ko(this,e),a=o.tween;if(a!==r){i=(r=a).slice();for(var l={name:t,value:n},s=0,u=i.length;s<u;++s)if(i[s].name===t){i[s]=l;break}s===u&&i.push(l)}o.tween=i}}function Lo(e,t,n){var r=e._id;return e.each(function(){var e=ko(this,r);(e.value||(e.value={}))[t]=n.apply(this,arguments)}),function(e){return To(e,r).value[t]}}function Bo(e,t,n){e.prototype=t.prototype=n,n.constructor=e}function Fo(e,t){var n=Object.create(e.prototype);for(var r in t)n[r]=t[r];return n}function Ro(){}var Uo=.7,jo=1/Uo,Vo="\\s*([+-]?\\d+)\\s*",Ho="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)\\s*",Yo="\\s*([+-]?(?:\\d*\\.)?\\d+(?:[eE][+-]?\\d+)?)%\\s*",Wo=/^#([0-9a-f]{3,8})$/,Xo=new RegExp(`^rgb\\(${Vo},${Vo},${Vo}\\)$`),qo=new RegExp(`^rgb\\(${Yo},${Yo},${Yo}\\)$`),Qo=new RegExp(`^rgba\\(${Vo},${Vo},${Vo},${Ho}\\)$`),Go=new RegExp(`^rgba\\(${Yo},${Yo},${Yo},${Ho}\\)$`),Jo=new RegExp(`^hsl\\(${Ho},${Yo},${Yo}\\)$`),Ko=new RegExp(`^hsla\\(${Ho},${Yo},${Yo},${Ho}\\)$`),Zo={aliceblue:15792383,antiquewhite:16444375,aqua:65535,aquamarine:8388564,azure:15794175,beige:16119260,bisque:16770244,black:0,blanchedalmond:16772045,blue:255,blueviolet:9055202,brown:10824234,burlywood:14596231,cadetblue:6266528,chartreuse:8388352,chocolate:13789470,coral:16744272,cornflowerblue:6591981,cornsilk:16775388,crimson:14423100,cyan:65535,darkblue:139,darkcyan:35723,darkgoldenrod:12092939,darkgray:11119017,darkgreen:25600,darkgrey:11119017,darkkhaki:12433259,darkmagenta:9109643,darkolivegreen:5597999,darkorange:16747520,darkorchid:10040012,darkred:9109504,darksalmon:15308410,darkseagreen:9419919,darkslateblue:4734347,darkslategray:3100495,darkslategrey:3100495,darkturquoise:52945,darkviolet:9699539,deeppink:16716947,deepskyblue:49151,dimgray:6908265,dimgrey:6908265,dodgerblue:2003199,firebrick:11674146,floralwhite:16775920,forestgreen:2263842,fuchsia:16711935,gainsboro:14474460,ghostwhite:16316671,gold:16766720,goldenrod:14329120,gray:8421504,green:32768,greenyellow:11403055,grey:8421504,honeydew:15794160,hotpink:16738740,indianred:13458524,indigo:4915330,ivory:16777200,khaki:15787660,lavender:15132410,lavenderblush:16773365,lawngreen:8190976,lemonchiffon:16775885,lightblue:11393254,lightcoral:15761536,lightcyan:14745599,lightgoldenrodyellow:16448210,lightgray:13882323,lightgreen:9498256,lightgrey:13882323,lightpink:16758465,lightsalmon:16752762,lightseagreen:2142890,lightskyblue:8900346,lightslategray:7833753,lightslategrey:7833753,lightsteelblue:11584734,lightyellow:16777184,lime:65280,limegreen:3329330,linen:16445670,magenta:16711935,maroon:8388608,mediumaquamarine:6737322,mediumblue:205,mediumorchid:12211667,mediumpurple:9662683,mediumseagreen:3978097,mediumslateblue:8087790,mediumspringgreen:64154,mediumturquoise:4772300,mediumvioletred:13047173,midnightblue:1644912,mintcream:16121850,mistyrose:16770273,moccasin:16770229,navajowhite:16768685,navy:128,oldlace:16643558,olive:8421376,olivedrab:7048739,orange:16753920,orangered:16729344,orchid:14315734,palegoldenrod:15657130,palegreen:10025880,paleturquoise:11529966,palevioletred:14381203,papayawhip:16773077,peachpuff:16767673,peru:13468991,pink:16761035,plum:14524637,powderblue:11591910,purple:8388736,rebeccapurple:6697881,red:16711680,rosybrown:12357519,royalblue:4286945,saddlebrown:9127187,salmon:16416882,sandybrown:16032864,seagreen:3050327,seashell:16774638,sienna:10506797,silver:12632256,skyblue:8900331,slateblue:6970061,slategray:7372944,slategrey:7372944,snow:16775930,springgreen:65407,steelblue:4620980,tan:13808780,teal:32896,thistle:14204888,tomato:16737095,turquoise:4251856,violet:15631086,wheat:16113331,white:16777215,whitesmoke:16119285,yellow:16776960,yellowgreen:10145074};function ea(){return this.rgb().formatHex()}function ta(){return this.rgb().formatRgb()}function na(e){var t,n;return e=(e+"").trim().toLowerCase(),(t=Wo.exec(e))?(n=t[1].length,t=parseInt(t[1],16),6===n?ra(t):3===n?new aa(t>>8&15|t>>4&240,t>>4&15|240&t,(15&t)<<4|15&t,1):8===n?ia(t>>24&255,t>>16&255,t>>8&255,(255&t)/255):4===n?ia(t>>12&15|t>>8&240,t>>8&15|t>>4&240,t>>4&15|240&t,((15&t)<<4|15&t)/255):null):(t=Xo.exec(e))?new aa(t[1],t[2],t[3],1):(t=qo.exec(e))?new aa(255*t[1]/100,255*t[2]/100,255*t[3]/100,1):(t=Qo.exec(e))?ia(t[1],t[2],t[3],t[4]):(t=Go.exec(e))?ia(255*t[1]/100,255*t[2]/100,255*t[3]/100,t[4]):(t=Jo.exec(e))?da(t[1],t[2]/100,t[3]/100,1):(t=Ko.exec(e))?da(t[1],t[2]/100,t[3]/100,t[4]):Zo.hasOwnProperty(e)?ra(Zo[e]):"transparent"===e?new aa(NaN,NaN,NaN,0):null}function ra(e){return new aa(e>>16&255,e>>8&255,255&e,1)}function ia(e,t,n,r){return r<=0&&(e=t=n=NaN),new aa(e,t,n,r)}function oa(e,t,n,r){return 1===arguments.length?((i=e)instanceof Ro||(i=na(i)),i?new aa((i=i.rgb()).r,i.g,i.b,i.opacity):new aa):new aa(e,t,n,null==r?1:r);var i}function aa(e,t,n,r){this.r=+e,this.g=+t,this.b=+n,this.opacity=+r}function la(){return`#${fa(this.r)}${fa(this.g)}${fa(this.b)}`}function sa(){const e=ua(this.opacity);return`${1===e?"rgb(":"rgba("}${ca(this.r)}, ${ca(this.g)}, ${ca(this.b)}${1===e?")":`, ${e})`}`}function ua(e){return isNaN(e)?1:Math.max(0,Math.min(1,e))}function ca(e){return Math.max(0,Math.min(255,Math.round(e)||0))}function fa(e){return((e=ca(e))<16?"0":"")+e.toString(16)}function da(e,t,n,r){return r<=0?e=t=n=NaN:n<=0||n>=1?e=t=NaN:t<=0&&(e=NaN),new pa(e,t,n,r)}function ha(e){if(e instanceof pa)return new pa(e.h,e.s,e.l,e.opacity);if(e instanceof Ro||(e=na(e)),!e)return new pa;if(e instanceof pa)return e;var t=(e=e.rgb()).r/255,n=e.g/255,r=e.b/255,i=Math.min(t,n,r),o=Math.max(t,n,r),a=NaN,l=o-i,s=(o+i)/2;return l?(a=t===o?(n-r)/l+6*(n<r):n===o?(r-t)/l+2:(t-n)/l+4,l/=s<.5?o+i:2-o-i,a*=60):l=s>0&&s<1?0:a,new pa(a,l,s,e.opacity)}function pa(e,t,n,r){this.h=+e,this.s=+t,this.l=+n,this.opacity=+r}function ya(e){return(e=(e||0)%360)<0?e+360:e}function ma(e){return Math.max(0,Math.min(1,e||0))}function ga(e,t,n){return 255*(e<60?t+(n-t)*e/60:e<180?n:e<240?t+(n-t)*(240-e)/60:t)}function va(e,t,n,r,i){var o=e*e,a=o*e;return((1-3*e+3*o-a)*t+(4-6*o+3*a)*n+(1+3*e+3*o-3*a)*r+a*i)/6}Bo(Ro,na,{copy(e){return Object.assign(new this.constructor,this,e)},displayable(){return this.rgb().displayable()},hex:ea,formatHex:ea,formatHex8:function(){return this.rgb().formatHex8()},formatHsl:function(){return ha(this).formatHsl()},formatRgb:ta,toString:ta}),Bo(aa,oa,Fo(Ro,{brighter(e){return e=null==e?jo:Math.pow(jo,e),new aa(this.r*e,this.g*e,this.b*e,this.opacity)},darker(e){return e=null==e?Uo:Math.pow(Uo,e),new aa(this.r*e,this.g*e,this.b*e,this.opacity)},rgb(){return this},clamp(){return new aa(ca(this.r),ca(this.g),ca(this.b),ua(this.opacity))},displayable(){return-.5<=this.r&&this.r<255.5&&-.5<=this.g&&this.g<255.5&&-.5<=this.b&&this.b<255.5&&0<=this.opacity&&this.opacity<=1},hex:la,formatHex:la,formatHex8:function(){return`#${fa(this.r)}${fa(this.g)}${fa(this.b)}${fa(255*(isNaN(this.opacity)?1:this.opacity))}`},formatRgb:sa,toString:sa})),Bo(pa,function(e,t,n,r){return 1===arguments.length?ha(e):new pa(e,t,n,null==r?1:r)},Fo(Ro,{brighter(e){return e=null==e?jo:Math.pow(jo,e),new pa(this.h,this.s,this.l*e,this.opacity)},darker(e){return e=null==e?Uo:Math.pow(Uo,e),new pa(this.h,this.s,this.l*e,this.opacity)},rgb(){var e=this.h%360+360*(this.h<0),t=isNaN(e)||isNaN(this.s)?0:this.s,n=this.l,r=n+(n<.5?n:1-n)*t,i=2*n-r;return new aa(ga(e>=240?e-240:e+120,i,r),ga(e,i,r),ga(e<120?e+240:e-120,i,r),this.opacity)},clamp(){return new pa(ya(this.h),ma(this.s),ma(this.l),ua(this.opacity))},displayable(){return(0<=this.s&&this.s<=1||isNaN(this.s))&&0<=this.l&&this.l<=1&&0<=this.opacity&&this.opacity<=1},formatHsl(){const e=ua(this.opacity);return`${1===e?"hsl(":"hsla("}${ya(this.h)}, ${100*ma(this.s)}%, ${100*ma(this.l)}%${1===e?")":`, ${e})`}`}}));const ba=e=>()=>e;function wa(e,t){return function(n){return e+n*t}}function xa(e){return 1===(e=+e)?Sa:function(t,n){return n-t?function(e,t,n){return e=Math.pow(e,n),t=Math.pow(t,n)-e,n=1/n,function(r){return Math.pow(e+r*t,n)}}(t,n,e):ba(isNaN(t)?n:t)}}function Sa(e,t){var n=t-e;return n?wa(e,n):ba(isNaN(e)?t:e)}const _a=function e(t){var n=xa(t);function r(e,t){var r=n((e=oa(e)).r,(t=oa(t)).r),i=n(e.g,t.g),o=n(e.b,t.b),a=Sa(e.opacity,t.opacity);return function(t){return e.r=r(t),e.g=i(t),e.b=o(t),e.opacity=a(t),e+""}}return r.gamma=e,r}(1);function ka(e){return function(t){var n,r,i=t.length,o=new Array(i),a=new Array(i),l=new Array(i);for(n=0;n<i;++n)r=oa(t[n]),o[n]=r.r||0,a[n]=r.g||0,l[n]=r.b||0;return o=e(o),a=e(a),l=e(l),r.opacity=1,function(e){return r.r=o(e),r.g=a(e),r.b=l(e),r+""}}}ka(function(e){var t=e.length-1;return function(n){var r=n<=0?n=0:n>=1?(n=1,t-1):Math.floor(n*t),i=e[r],o=e[r+1],a=r>0?e[r-1]:2*i-o,l=r<t-1?e[r+2]:2*o-i;return va((n-r/t)*t,a,i,o,l)}}),ka(function(e){var t=e.length;return function(n){var r=Math.floor(((n%=1)<0?++n:n)*t),i=e[(r+t-1)%t],o=e[r%t],a=e[(r+1)%t],l=e[(r+2)%t];return va((n-r/t)*t,i,o,a,l)}});var Ta=/[-+]?(?:\d+\.?\d*|\.?\d+)(?:[eE][-+]?\d+)?/g,Ea=new RegExp(Ta.source,"g");function Ca(e,t){var n,r,i,o=Ta.lastIndex=Ea.lastIndex=0,a=-1,l=[],s=[];for(e+="",t+="";(n=Ta.exec(e))&&(r=Ea.exec(t));)(i=r.index)>o&&(i=t.slice(o,i),l[a]?l[a]+=i:l[++a]=i),(n=n[0])===(r=r[0])?l[a]?l[a]+=r:l[++a]=r:(l[++a]=null,s.push({i:a,x:Co(n,r)})),o=Ea.lastIndex;return o<t.length&&(i=t.slice(o),l[a]?l[a]+=i:l[++a]=i),l.length<2?s[0]?function(e){return function(t){return e(t)+""}}(s[0].x):function(e){return function(){return e}}(t):(t=s.length,function(e){for(var n,r=0;r<t;++r)l[(n=s[r]).i]=n.x(e);return l.join("")})}function Ia(e,t){var n;return("number"===typeof t?Co:t instanceof na?_a:(n=na(t))?(t=n,_a):Ca)(e,t)}function Ma(e){return function(){this.removeAttribute(e)}}function Na(e){return function(){this.removeAttributeNS(e.space,e.local)}}function Aa(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttribute(e);return a===o?null:a===r?i:i=t(r=a,n)}}function Oa(e,t,n){var r,i,o=n+"";return function(){var a=this.getAttributeNS(e.space,e.local);return a===o?null:a===r?i:i=t(r=a,n)}}function za(e,t,n){var r,i,o;return function(){var a,l,s=n(this);if(null!=s)return(a=this.getAttribute(e))===(l=s+"")?null:a===r&&l===i?o:(i=l,o=t(r=a,s));this.removeAttribute(e)}}function Da(e,t,n){var r,i,o;return function(){var a,l,s=n(this);if(null!=s)return(a=this.getAttributeNS(e.space,e.local))===(l=s+"")?null:a===r&&l===i?o:(i=l,o=t(r=a,s));this.removeAttributeNS(e.space,e.local)}}function $a(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttributeNS(e.space,e.local,t.call(this,n))}}(e,i)),n}return i._value=t,i}function Pa(e,t){var n,r;function i(){var i=t.apply(this,arguments);return i!==r&&(n=(r=i)&&function(e,t){return function(n){this.setAttribute(e,t.call(this,n))}}(e,i)),n}return i._value=t,i}function La(e,t){return function(){_o(this,e).delay=+t.apply(this,arguments)}}function Ba(e,t){return t=+t,function(){_o(this,e).delay=t}}function Fa(e,t){return function(){ko(this,e).duration=+t.apply(this,arguments)}}function Ra(e,t){return t=+t,function(){ko(this,e).duration=t}}var Ua=xi.prototype.constructor;function ja(e){return function(){this.style.removeProperty(e)}}var Va=0;function Ha(e,t,n,r){this._groups=e,this._parents=t,this._name=n,this._id=r}function Ya(){return++Va}var Wa=xi.prototype;Ha.prototype=function(e){return xi().transition(e)}.prototype={constructor:Ha,select:function(e){var t=this._name,n=this._id;"function"!==typeof e&&(e=cr(e));for(var r=this._groups,i=r.length,o=new Array(i),a=0;a<i;++a)for(var l,s,u=r[a],c=u.length,f=o[a]=new Array(c),d=0;d<c;++d)(l=u[d])&&(s=e.call(l,l.__data__,d,u))&&("__data__"in l&&(s.__data__=l.__data__),f[d]=s,So(f[d],t,n,d,f,To(l,n)));return new Ha(o,this._parents,t,n)},selectAll:function(e){var t=this._name,n=this._id;"function"!==typeof e&&(e=dr(e));for(var r=this._groups,i=r.length,o=[],a=[],l=0;l<i;++l)for(var s,u=r[l],c=u.length,f=0;f<c;++f)if(s=u[f]){for(var d,h=e.call(s,s.__data__,f,u),p=To(s,n),y=0,m=h.length;y<m;++y)(d=h[y])&&So(d,t,n,y,h,p);o.push(h),a.push(s)}return new Ha(o,a,t,n)},selectChild:Wa.selectChild,selectChildren:Wa.selectChildren,filter:function(e){"function"!==typeof e&&(e=pr(e));for(var t=this._groups,n=t.length,r=new Array(n),i=0;i<n;++i)for(var o,a=t[i],l=a.length,s=r[i]=[],u=0;u<l;++u)(o=a[u])&&e.call(o,o.__data__,u,a)&&s.push(o);return new Ha(r,this._parents,this._name,this._id)},merge:function(e){if(e._id!==this._id)throw new Error;for(var t=this._groups,n=e._groups,r=t.length,i=n.length,o=Math.min(r,i),a=new Array(r),l=0;l<o;++l)for(var s,u=t[l],c=n[l],f=u.length,d=a[l]=new Array(f),h=0;h<f;++h)(s=u[h]||c[h])&&(d[h]=s);for(;l<r;++l)a[l]=t[l];return new Ha(a,this._parents,this._name,this._id)},selection:function(){return new Ua(this._groups,this._parents)},transition:function(){for(var e=this._name,t=this._id,n=Ya(),r=this._groups,i=r.length,o=0;o<i;++o)for(var a,l=r[o],s=l.length,u=0;u<s;++u)if(a=l[u]){var c=To(a,t);So(a,e,n,u,l,{time:c.time+c.delay+c.duration,delay:0,duration:c.duration,ease:c.ease})}return new Ha(r,this._parents,e,n)},call:Wa.call,nodes:Wa.nodes,node:Wa.node,size:Wa.size,empty:Wa.empty,each:Wa.each,on:function(e,t){var n=this._id;return arguments.length<2?To(this.node(),n).on.on(e):this.each(function(e,t,n){var r,i,o=function(e){return(e+"").trim().split(/^|\s+/).every(function(e){var t=e.indexOf(".");return t>=0&&(e=e.slice(0,t)),!e||"start"===e})}(t)?_o:ko;return function(){var a=o(this,e),l=a.on;l!==r&&(i=(r=l).copy()).on(t,n),a.on=i}}(n,e,t))},attr:function(e,t){var n=Mr(e),r="transform"===n?Do:Ia;return this.attrTween(e,"function"===typeof t?(n.local?Da:za)(n,r,Lo(this,"attr."+e,t)):null==t?(n.local?Na:Ma)(n):(n.local?Oa:Aa)(n,r,t))},attrTween:function(e,t){var n="attr."+e;if(arguments.length<2)return(n=this.tween(n))&&n._value;if(null==t)return this.tween(n,null);if("function"!==typeof t)throw new Error;var r=Mr(e);return this.tween(n,(r.local?$a:Pa)(r,t))},style:function(e,t,n){var r="transform"===(e+="")?zo:Ia;return null==t?this.styleTween(e,function(e,t){var n,r,i;return function(){var o=Rr(this,e),a=(this.style.removeProperty(e),Rr(this,e));return o===a?null:o===n&&a===r?i:i=t(n=o,r=a)}}(e,r)).on("end.style."+e,ja(e)):"function"===typeof t?this.styleTween(e,function(e,t,n){var r,i,o;return function(){var a=Rr(this,e),l=n(this),s=l+"";return null==l&&(this.style.removeProperty(e),s=l=Rr(this,e)),a===s?null:a===r&&s===i?o:(i=s,o=t(r=a,l))}}(e,r,Lo(this,"style."+e,t))).each(function(e,t){var n,r,i,o,a="style."+t,l="end."+a;return function(){var s=ko(this,e),u=s.on,c=null==s.value[a]?o||(o=ja(t)):void 0;u===n&&i===c||(r=(n=u).copy()).on(l,i=c),s.on=r}}(this._id,e)):this.styleTween(e,function(e,t,n){var r,i,o=n+"";return function(){var a=Rr(this,e);return a===o?null:a===r?i:i=t(r=a,n)}}(e,r,t),n).on("end.style."+e,null)},styleTween:function(e,t,n){var r="style."+(e+="");if(arguments.length<2)return(r=this.tween(r))&&r._value;if(null==t)return this.tween(r,null);if("function"!==typeof t)throw new Error;return this.tween(r,function(e,t,n){var r,i;function o(){var o=t.apply(this,arguments);return o!==i&&(r=(i=o)&&function(e,t,n){return function(r){this.style.setProperty(e,t.call(this,r),n)}}(e,o,n)),r}return o._value=t,o}(e,t,null==n?"":n))},text:function(e){return this.tween("text","function"===typeof e?function(e){return function(){var t=e(this);this.textContent=null==t?"":t}}(Lo(this,"text",e)):function(e){return function(){this.textContent=e}}(null==e?"":e+""))},textTween:function(e){var t="text";if(arguments.length<1)return(t=this.tween(t))&&t._value;if(null==e)return this.tween(t,null);if("function"!==typeof e)throw new Error;return this.tween(t,function(e){var t,n;function r(){var r=e.apply(this,arguments);return r!==n&&(t=(n=r)&&function(e){return function(t){this.textContent=e.call(this,t)}}(r)),t}return r._value=e,r}(e))},remove:function(){return this.on("end.remove",function(e){return function(){var t=this.parentNode;for(var n in this.__transition)if(+n!==e)return;t&&t.removeChild(this)}}(this._id))},tween:function(e,t){var n=this._id;if(e+="",arguments.length<2){for(var r,i=To(this.node(),n).tween,o=0,a=i.length;o<a;++o)if((r=i[o]).name===e)return r.value;return null}return this.each((null==t?$o:Po)(n,e,t))},delay:function(e){var t=this._id;return arguments.length?this.each(("function"===typeof e?La:Ba)(t,e)):To(this.node(),t).delay},duration:function(e){var t=this._id;return arguments.length?this.each(("function"===typeof e?Fa:Ra)(t,e)):To(this.node(),t).duration},ease:function(e){var t=this._id;return arguments.length?this.each(function(e,t){if("function"!==typeof t)throw new Error;return function(){ko(this,e).ease=t}}(t,e)):To(this.node(),t).ease},easeVarying:function(e){if("function"!==typeof e)throw new Error;return this.each(function(e,t){return function(){var n=t.apply(this,arguments);if("function"!==typeof n)throw new Error;ko(this,e).ease=n}}(this._id,e))},end:function(){var e,t,n=this,r=n._id,i=n.size();return new Promise(function(o,a){var l={value:a},s={value:function(){0===--i&&o()}};n.each(function(){var n=ko(this,r),i=n.on;i!==e&&((t=(e=i).copy())._.cancel.push(l),t._.interrupt.push(l),t._.end.push(s)),n.on=t}),0===i&&o()})},[Symbol.iterator]:Wa[Symbol.iterator]};var Xa={time:null,delay:0,duration:250,ease:function(e){return((e*=2)<=1?e*e*e:(e-=2)*e*e+2)/2}};function qa(e,t){for(var n;!(n=e.__transition)||!(n=n[t]);)if(!(e=e.parentNode))throw new Error(`transition ${t} not found`);return n}xi.prototype.interrupt=function(e){return this.each(function(){Eo(this,e)})},xi.prototype.transition=function(e){var t,n;e instanceof Ha?(t=e._id,e=e._name):(t=Ya(),(n=Xa).time=fo(),e=null==e?null:e+"");for(var r=this._groups,i=r.length,o=0;o<i;++o)for(var a,l=r[o],s=l.length,u=0;u<s;++u)(a=l[u])&&So(a,e,t,u,l,n||qa(a,t));return new Ha(r,this._parents,e,t)};const Qa=e=>()=>e;function Ga(e,t){let{sourceEvent:n,target:r,transform:i,dispatch:o}=t;Object.defineProperties(this,{type:{value:e,enumerable:!0,configurable:!0},sourceEvent:{value:n,enumerable:!0,configurable:!0},target:{value:r,enumerable:!0,configurable:!0},transform:{value:i,enumerable:!0,configurable:!0},_:{value:o}})}function Ja(e,t,n){this.k=e,this.x=t,this.y=n}Ja.prototype={constructor:Ja,scale:function(e){return 1===e?this:new Ja(this.k*e,this.x,this.y)},translate:function(e,t){return 0===e&0===t?this:new Ja(this.k,this.x+this.k*e,this.y+this.k*t)},apply:function(e){return[e[0]*this.k+this.x,e[1]*this.k+this.y]},applyX:function(e){return e*this.k+this.x},applyY:function(e){return e*this.k+this.y},invert:function(e){return[(e[0]-this.x)/this.k,(e[1]-this.y)/this.k]},invertX:function(e){return(e-this.x)/this.k},invertY:function(e){return(e-this.y)/this.k},rescaleX:function(e){return e.copy().domain(e.range().map(this.invertX,this).map(e.invert,e))},rescaleY:function(e){return e.copy().domain(e.range().map(this.invertY,this).map(e.invert,e))},toString:function(){return"translate("+this.x+","+this.y+") scale("+this.k+")"}};var Ka=new Ja(1,0,0);function Za(e){e.stopImmediatePropagation()}function el(e){e.preventDefault(),e.stopImmediatePropagation()}function tl(e){return(!e.ctrlKey||"wheel"===e.type)&&!e.button}function nl(){var e=this;return e instanceof SVGElement?(e=e.ownerSVGElement||e).hasAttribute("viewBox")?[[(e=e.viewBox.baseVal).x,e.y],[e.x+e.width,e.y+e.height]]:[[0,0],[e.width.baseVal.value,e.height.baseVal.value]]:[[0,0],[e.clientWidth,e.clientHeight]]}function rl(){return this.__zoom||Ka}function il(e){return-e.deltaY*(1===e.deltaMode?.05:e.deltaMode?1:.002)*(e.ctrlKey?10:1)}function ol(){return navigator.maxTouchPoints||"ontouchstart"in this}function al(e,t,n){var r=e.invertX(t[0][0])-n[0][0],i=e.invertX(t[1][0])-n[1][0],o=e.invertY(t[0][1])-n[0][1],a=e.invertY(t[1][1])-n[1][1];return e.translate(i>r?(r+i)/2:Math.min(0,r)||Math.max(0,i),a>o?(o+a)/2:Math.min(0,o)||Math.max(0,a))}function ll(e){var t=0,n=e.children,r=n&&n.length;if(r)for(;--r>=0;)t+=n[r].value;else t=1;e.value=t}function sl(e,t){var n,r,i,o,a,l=new dl(e),s=+e.value&&(l.value=e.value),u=[l];for(null==t&&(t=ul);n=u.pop();)if(s&&(n.value=+n.data.value),(i=t(n.data))&&(a=i.length))for(n.children=new Array(a),o=a-1;o>=0;--o)u.push(r=n.children[o]=new dl(i[o])),r.parent=n,r.depth=n.depth+1;return l.eachBefore(fl)}function ul(e){return e.children}function cl(e){e.data=e.data.data}function fl(e){var t=0;do{e.height=t}while((e=e.parent)&&e.height<++t)}function dl(e){this.data=e,this.depth=this.height=0,this.parent=null}Ja.prototype,dl.prototype=sl.prototype={constructor:dl,count:function(){return this.eachAfter(ll)},each:function(e){var t,n,r,i,o=this,a=[o];do{for(t=a.reverse(),a=[];o=t.pop();)if(e(o),n=o.children)for(r=0,i=n.length;r<i;++r)a.push(n[r])}while(a.length);return this},eachAfter:function(e){for(var t,n,r,i=this,o=[i],a=[];i=o.pop();)if(a.push(i),t=i.children)for(n=0,r=t.length;n<r;++n)o.push(t[n]);for(;i=a.pop();)e(i);return this},eachBefore:function(e){for(var t,n,r=this,i=[r];r=i.pop();)if(e(r),t=r.children)for(n=t.length-1;n>=0;--n)i.push(t[n]);return this},sum:function(e){return this.eachAfter(function(t){for(var n=+e(t.data)||0,r=t.children,i=r&&r.length;--i>=0;)n+=r[i].value;t.value=n})},sort:function(e){return this.eachBefore(function(t){t.children&&t.children.sort(e)})},path:function(e){for(var t=this,n=function(e,t){if(e===t)return e;var n=e.ancestors(),r=t.ancestors(),i=null;e=n.pop(),t=r.pop();for(;e===t;)i=e,e=n.pop(),t=r.pop();return i}(t,e),r=[t];t!==n;)t=t.parent,r.push(t);for(var i=r.length;e!==n;)r.splice(i,0,e),e=e.parent;return r},ancestors:function(){for(var e=this,t=[e];e=e.parent;)t.push(e);return t},descendants:function(){var e=[];return this.each(function(t){e.push(t)}),e},leaves:function(){var e=[];return this.eachBefore(function(t){t.children||e.push(t)}),e},links:function(){var e=this,t=[];return e.each(function(n){n!==e&&t.push({source:n.parent,target:n})}),t},copy:function(){return sl(this).eachBefore(cl)}};const{rE:hl}={rE:"2.1.2"},pl=Object.freeze({children:e=>e.children,nodeSize:e=>e.data.size,spacing:0});function yl(e){const t=Object.assign({},pl,e);function n(e){const n=t[e];return"function"===typeof n?n:()=>n}function r(e){const t=o(function(){const e=i(),t=n("nodeSize"),r=n("spacing");return class extends e{constructor(e){super(e),Object.assign(this,{x:0,y:0,relX:0,prelim:0,shift:0,change:0,lExt:this,lExtRelX:0,lThr:null,rExt:this,rExtRelX:0,rThr:null})}get size(){return t(this.data)}spacing(e){return r(this.data,e.data)}get x(){return this.data.x}set x(e){this.data.x=e}get y(){return this.data.y}set y(e){this.data.y=e}update(){return ml(this),gl(this),this}}}(),e,e=>e.children);return t.update(),t.data}function i(){const e=n("nodeSize"),t=n("spacing");return class n extends sl.prototype.constructor{constructor(e){super(e)}copy(){const e=o(this.constructor,this,e=>e.children);return e.each(e=>e.data=e.data.data),e}get size(){return e(this)}spacing(e){return t(this,e)}get nodes(){return this.descendants()}get xSize(){return this.size[0]}get ySize(){return this.size[1]}get top(){return this.y}get bottom(){return this.y+this.ySize}get left(){return this.x-this.xSize/2}get right(){return this.x+this.xSize/2}get root(){const e=this.ancestors();return e[e.length-1]}get numChildren(){return this.hasChildren?this.children.length:0}get hasChildren(){return!this.noChildren}get noChildren(){return null===this.children}get firstChild(){return this.hasChildren?this.children[0]:null}get lastChild(){return this.hasChildren?this.children[this.numChildren-1]:null}get extents(){return(this.children||[]).reduce((e,t)=>n.maxExtents(e,t.extents),this.nodeExtents)}get nodeExtents(){return{top:this.top,bottom:this.bottom,left:this.left,right:this.right}}static maxExtents(e,t){return{top:Math.min(e.top,t.top),bottom:Math.max(e.bottom,t.bottom),left:Math.min(e.left,t.left),right:Math.max(e.right,t.right)}}}}function o(e,t,n){const r=(t,i)=>{const o=new e(t);Object.assign(o,{parent:i,depth:null===i?0:i.depth+1,height:0,length:1});const a=n(t)||[];return o.children=0===a.length?null:a.map(e=>r(e,o)),o.children&&Object.assign(o,o.children.reduce((e,t)=>({height:Math.max(e.height,t.height+1),length:e.length+t.length}),o)),o};return r(t,null)}return Object.assign(r,{nodeSize(e){return arguments.length?(t.nodeSize=e,r):t.nodeSize},spacing(e){return arguments.length?(t.spacing=e,r):t.spacing},children(e){return arguments.length?(t.children=e,r):t.children},hierarchy(e,n){const r="undefined"===typeof n?t.children:n;return o(i(),e,r)},dump(e){const t=n("nodeSize"),r=e=>n=>{const i=e+"  ",o=e+"    ",{x:a,y:l}=n,s=t(n),u=n.children||[],c=0===u.length?" ":`,${i}children: [${o}${u.map(r(o)).join(o)}${i}],${e}`;return`{ size: [${s.join(", ")}],${i}x: ${a}, y: ${l}${c}},`};return r("\n")(e)}}),r}yl.version=hl;const ml=function(e){let t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:0;return e.y=t,(e.children||[]).reduce((t,n)=>{const[r,i]=t;ml(n,e.y+e.ySize);const o=(0===r?n.lExt:n.rExt).bottom;0!==r&&bl(e,r,i);return[r+1,Cl(o,r,i)]},[0,null]),vl(e),El(e),e},gl=(e,t,n)=>{"undefined"===typeof t&&(t=-e.relX-e.prelim,n=0);const r=t+e.relX;return e.relX=r+e.prelim-n,e.prelim=0,e.x=n+e.relX,(e.children||[]).forEach(t=>gl(t,r,e.x)),e},vl=e=>{(e.children||[]).reduce((e,t)=>{const[n,r]=e,i=n+t.shift,o=r+i+t.change;return t.relX+=o,[i,o]},[0,0])},bl=(e,t,n)=>{const r=e.children[t-1],i=e.children[t];let o=r,a=r.relX,l=i,s=i.relX,u=!0;for(;o&&l;){o.bottom>n.lowY&&(n=n.next);const r=a+o.prelim-(s+l.prelim)+o.xSize/2+l.xSize/2+o.spacing(l);(r>0||r<0&&u)&&(s+=r,wl(i,r),xl(e,t,n.index,r)),u=!1;const c=o.bottom,f=l.bottom;c<=f&&(o=_l(o),o&&(a+=o.relX)),c>=f&&(l=Sl(l),l&&(s+=l.relX))}!o&&l?kl(e,t,l,s):o&&!l&&Tl(e,t,o,a)},wl=(e,t)=>{e.relX+=t,e.lExtRelX+=t,e.rExtRelX+=t},xl=(e,t,n,r)=>{const i=e.children[t],o=t-n;if(o>1){const t=r/o;e.children[n+1].shift+=t,i.shift-=t,i.change-=r-t}},Sl=e=>e.hasChildren?e.firstChild:e.lThr,_l=e=>e.hasChildren?e.lastChild:e.rThr,kl=(e,t,n,r)=>{const i=e.firstChild,o=i.lExt,a=e.children[t];o.lThr=n;const l=r-n.relX-i.lExtRelX;o.relX+=l,o.prelim-=l,i.lExt=a.lExt,i.lExtRelX=a.lExtRelX},Tl=(e,t,n,r)=>{const i=e.children[t],o=i.rExt,a=e.children[t-1];o.rThr=n;const l=r-n.relX-i.rExtRelX;o.relX+=l,o.prelim-=l,i.rExt=a.rExt,i.rExtRelX=a.rExtRelX},El=e=>{if(e.hasChildren){const t=e.firstChild,n=e.lastChild,r=(t.prelim+t.relX-t.xSize/2+n.relX+n.prelim+n.xSize/2)/2;Object.assign(e,{prelim:r,lExt:t.lExt,lExtRelX:t.lExtRelX,rExt:n.rExt,rExtRelX:n.rExtRelX})}},Cl=(e,t,n)=>{for(;null!==n&&e>=n.lowY;)n=n.next;return{lowY:e,index:t,next:n}};var Il=Array.prototype.slice;function Ml(e){return function(){return e}}class Nl{constructor(e,t){this._context=e,this._x=t}areaStart(){this._line=0}areaEnd(){this._line=NaN}lineStart(){this._point=0}lineEnd(){(this._line||0!==this._line&&1===this._point)&&this._context.closePath(),this._line=1-this._line}point(e,t){switch(e=+e,t=+t,this._point){case 0:this._point=1,this._line?this._context.lineTo(e,t):this._context.moveTo(e,t);break;case 1:this._point=2;default:this._x?this._context.bezierCurveTo(this._x0=(this._x0+e)/2,this._y0,this._x0,t,e,t):this._context.bezierCurveTo(this._x0,this._y0=(this._y0+t)/2,e,this._y0,e,t)}this._x0=e,this._y0=t}}function Al(e){return new Nl(e,!0)}const Ol=Math.PI,zl=2*Ol,Dl=1e-6,$l=zl-Dl;function Pl(e){this._+=e[0];for(let t=1,n=e.length;t<n;++t)this._+=arguments[t]+e[t]}class Ll{constructor(e){this._x0=this._y0=this._x1=this._y1=null,this._="",this._append=null==e?Pl:function(e){let t=Math.floor(e);if(!(t>=0))throw new Error(`invalid digits: ${e}`);if(t>15)return Pl;const n=10**t;return function(e){this._+=e[0];for(let t=1,r=e.length;t<r;++t)this._+=Math.round(arguments[t]*n)/n+e[t]}}(e)}moveTo(e,t){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}`}closePath(){null!==this._x1&&(this._x1=this._x0,this._y1=this._y0,this._append`Z`)}lineTo(e,t){this._append`L${this._x1=+e},${this._y1=+t}`}quadraticCurveTo(e,t,n,r){this._append`Q${+e},${+t},${this._x1=+n},${this._y1=+r}`}bezierCurveTo(e,t,n,r,i,o){this._append`C${+e},${+t},${+n},${+r},${this._x1=+i},${this._y1=+o}`}arcTo(e,t,n,r,i){if(e=+e,t=+t,n=+n,r=+r,(i=+i)<0)throw new Error(`negative radius: ${i}`);let o=this._x1,a=this._y1,l=n-e,s=r-t,u=o-e,c=a-t,f=u*u+c*c;if(null===this._x1)this._append`M${this._x1=e},${this._y1=t}`;else if(f>Dl)if(Math.abs(c*l-s*u)>Dl&&i){let d=n-o,h=r-a,p=l*l+s*s,y=d*d+h*h,m=Math.sqrt(p),g=Math.sqrt(f),v=i*Math.tan((Ol-Math.acos((p+f-y)/(2*m*g)))/2),b=v/g,w=v/m;Math.abs(b-1)>Dl&&this._append`L${e+b*u},${t+b*c}`,this._append`A${i},${i},0,0,${+(c*d>u*h)},${this._x1=e+w*l},${this._y1=t+w*s}`}else this._append`L${this._x1=e},${this._y1=t}`;else;}arc(e,t,n,r,i,o){if(e=+e,t=+t,o=!!o,(n=+n)<0)throw new Error(`negative radius: ${n}`);let a=n*Math.cos(r),l=n*Math.sin(r),s=e+a,u=t+l,c=1^o,f=o?r-i:i-r;null===this._x1?this._append`M${s},${u}`:(Math.abs(this._x1-s)>Dl||Math.abs(this._y1-u)>Dl)&&this._append`L${s},${u}`,n&&(f<0&&(f=f%zl+zl),f>$l?this._append`A${n},${n},0,1,${c},${e-a},${t-l}A${n},${n},0,1,${c},${this._x1=s},${this._y1=u}`:f>Dl&&this._append`A${n},${n},0,${+(f>=Ol)},${c},${this._x1=e+n*Math.cos(i)},${this._y1=t+n*Math.sin(i)}`)}rect(e,t,n,r){this._append`M${this._x0=this._x1=+e},${this._y0=this._y1=+t}h${n=+n}v${+r}h${-n}Z`}toString(){return this._}}function Bl(e){return e[0]}function Fl(e){return e[1]}function Rl(e){return e.source}function Ul(e){return e.target}function jl(e){let t=Rl,n=Ul,r=Bl,i=Fl,o=null,a=null,l=function(e){let t=3;return e.digits=function(n){if(!arguments.length)return t;if(null==n)t=null;else{const e=Math.floor(n);if(!(e>=0))throw new RangeError(`invalid digits: ${n}`);t=e}return e},()=>new Ll(t)}(s);function s(){let s;const u=Il.call(arguments),c=t.apply(this,u),f=n.apply(this,u);if(null==o&&(a=e(s=l())),a.lineStart(),u[0]=c,a.point(+r.apply(this,u),+i.apply(this,u)),u[0]=f,a.point(+r.apply(this,u),+i.apply(this,u)),a.lineEnd(),s)return a=null,s+""||null}return s.source=function(e){return arguments.length?(t=e,s):t},s.target=function(e){return arguments.length?(n=e,s):n},s.x=function(e){return arguments.length?(r="function"===typeof e?e:Ml(+e),s):r},s.y=function(e){return arguments.length?(i="function"===typeof e?e:Ml(+e),s):i},s.context=function(t){return arguments.length?(null==t?o=a=null:a=e(o=t),s):o},s}const Vl={selection:xi,select:Si,max:function(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n<r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let i of e)null!=(i=t(i,++r,e))&&(n<i||void 0===n&&i>=i)&&(n=i)}return n},min:function(e,t){let n;if(void 0===t)for(const r of e)null!=r&&(n>r||void 0===n&&r>=r)&&(n=r);else{let r=-1;for(let i of e)null!=(i=t(i,++r,e))&&(n>i||void 0===n&&i>=i)&&(n=i)}return n},sum:function(e,t){let n=0;if(void 0===t)for(let r of e)(r=+r)&&(n+=r);else{let r=-1;for(let i of e)(i=+t(i,++r,e))&&(n+=i)}return n},cumsum:function(e,t){var n=0,r=0;return Float64Array.from(e,void 0===t?e=>n+=+e||0:i=>n+=+t(i,r++,e)||0)},tree:function(){var e=Ni,t=1,n=1,r=null;function i(i){var s=function(e){for(var t,n,r,i,o,a=new $i(e,0),l=[a];t=l.pop();)if(r=t._.children)for(t.children=new Array(o=r.length),i=o-1;i>=0;--i)l.push(n=t.children[i]=new $i(r[i],i)),n.parent=t;return(a.parent=new $i(null,0)).children=[a],a}(i);if(s.eachAfter(o),s.parent.m=-s.z,s.eachBefore(a),r)i.eachBefore(l);else{var u=i,c=i,f=i;i.eachBefore(function(e){e.x<u.x&&(u=e),e.x>c.x&&(c=e),e.depth>f.depth&&(f=e)});var d=u===c?1:e(u,c)/2,h=d-u.x,p=t/(c.x+d+h),y=n/(f.depth||1);i.eachBefore(function(e){e.x=(e.x+h)*p,e.y=e.depth*y})}return i}function o(t){var n=t.children,r=t.parent.children,i=t.i?r[t.i-1]:null;if(n){!function(e){for(var t,n=0,r=0,i=e.children,o=i.length;--o>=0;)(t=i[o]).z+=n,t.m+=n,n+=t.s+(r+=t.c)}(t);var o=(n[0].z+n[n.length-1].z)/2;i?(t.z=i.z+e(t._,i._),t.m=t.z-o):t.z=o}else i&&(t.z=i.z+e(t._,i._));t.parent.A=function(t,n,r){if(n){for(var i,o=t,a=t,l=n,s=o.parent.children[0],u=o.m,c=a.m,f=l.m,d=s.m;l=Oi(l),o=Ai(o),l&&o;)s=Ai(s),(a=Oi(a)).a=t,(i=l.z+f-o.z-u+e(l._,o._))>0&&(zi(Di(l,t,r),t,i),u+=i,c+=i),f+=l.m,u+=o.m,d+=s.m,c+=a.m;l&&!Oi(a)&&(a.t=l,a.m+=f-c),o&&!Ai(s)&&(s.t=o,s.m+=u-d,r=t)}return r}(t,i,t.parent.A||r[0])}function a(e){e._.x=e.z+e.parent.m,e.m+=e.parent.m}function l(e){e.x*=t,e.y=e.depth*n}return i.separation=function(t){return arguments.length?(e=t,i):e},i.size=function(e){return arguments.length?(r=!1,t=+e[0],n=+e[1],i):r?null:[t,n]},i.nodeSize=function(e){return arguments.length?(r=!0,t=+e[0],n=+e[1],i):r?[t,n]:null},i},stratify:function(){var e,t=Ri,n=Ui;function r(r){var i,o,a,l,s,u,c,f,d=Array.from(r),h=t,p=n,y=new Map;if(null!=e){const t=d.map((t,n)=>function(e){e=`${e}`;let t=e.length;Vi(e,t-1)&&!Vi(e,t-2)&&(e=e.slice(0,-1));return"/"===e[0]?e:`/${e}`}(e(t,n,r))),n=t.map(ji),i=new Set(t).add("");for(const e of n)i.has(e)||(i.add(e),t.push(e),n.push(ji(e)),d.push(Fi));h=(e,n)=>t[n],p=(e,t)=>n[t]}for(a=0,i=d.length;a<i;++a)o=d[a],u=d[a]=new Mi(o),null!=(c=h(o,a,r))&&(c+="")&&(f=u.id=c,y.set(f,y.has(f)?Bi:u)),null!=(c=p(o,a,r))&&(c+="")&&(u.parent=c);for(a=0;a<i;++a)if(c=(u=d[a]).parent){if(!(s=y.get(c)))throw new Error("missing: "+c);if(s===Bi)throw new Error("ambiguous: "+c);s.children?s.children.push(u):s.children=[u],u.parent=s}else{if(l)throw new Error("multiple roots");l=u}if(!l)throw new Error("no root");if(null!=e){for(;l.data===Fi&&1===l.children.length;)l=l.children[0],--i;for(let e=d.length-1;e>=0&&(u=d[e]).data===Fi;--e)u.data=null}if(l.parent=Li,l.eachBefore(function(e){e.depth=e.parent.depth+1,--i}).eachBefore(Ii),l.parent=null,i>0)throw new Error("cycle");return l}return r.id=function(e){return arguments.length?(t=Pi(e),r):t},r.parentId=function(e){return arguments.length?(n=Pi(e),r):n},r.path=function(t){return arguments.length?(e=Pi(t),r):e},r},zoom:function(){var e,t,n,r=tl,i=nl,o=al,a=il,l=ol,s=[0,1/0],u=[[-1/0,-1/0],[1/0,1/0]],c=250,f=Zi,d=Qi("start","zoom","end"),h=0,p=10;function y(e){e.property("__zoom",rl).on("wheel.zoom",S,{passive:!1}).on("mousedown.zoom",_).on("dblclick.zoom",k).filter(l).on("touchstart.zoom",T).on("touchmove.zoom",E).on("touchend.zoom touchcancel.zoom",C).style("-webkit-tap-highlight-color","rgba(0,0,0,0)")}function m(e,t){return(t=Math.max(s[0],Math.min(s[1],t)))===e.k?e:new Ja(t,e.x,e.y)}function g(e,t,n){var r=t[0]-n[0]*e.k,i=t[1]-n[1]*e.k;return r===e.x&&i===e.y?e:new Ja(e.k,r,i)}function v(e){return[(+e[0][0]+ +e[1][0])/2,(+e[0][1]+ +e[1][1])/2]}function b(e,t,n,r){e.on("start.zoom",function(){w(this,arguments).event(r).start()}).on("interrupt.zoom end.zoom",function(){w(this,arguments).event(r).end()}).tween("zoom",function(){var e=this,o=arguments,a=w(e,o).event(r),l=i.apply(e,o),s=null==n?v(l):"function"===typeof n?n.apply(e,o):n,u=Math.max(l[1][0]-l[0][0],l[1][1]-l[0][1]),c=e.__zoom,d="function"===typeof t?t.apply(e,o):t,h=f(c.invert(s).concat(u/c.k),d.invert(s).concat(u/d.k));return function(e){if(1===e)e=d;else{var t=h(e),n=u/t[2];e=new Ja(n,s[0]-t[0]*n,s[1]-t[1]*n)}a.zoom(null,e)}})}function w(e,t,n){return!n&&e.__zooming||new x(e,t)}function x(e,t){this.that=e,this.args=t,this.active=0,this.sourceEvent=null,this.extent=i.apply(e,t),this.taps=0}function S(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),i=1;i<t;i++)n[i-1]=arguments[i];if(r.apply(this,arguments)){var l=w(this,n).event(e),c=this.__zoom,f=Math.max(s[0],Math.min(s[1],c.k*Math.pow(2,a.apply(this,arguments)))),d=eo(e);if(l.wheel)l.mouse[0][0]===d[0]&&l.mouse[0][1]===d[1]||(l.mouse[1]=c.invert(l.mouse[0]=d)),clearTimeout(l.wheel);else{if(c.k===f)return;l.mouse=[d,c.invert(d)],Eo(this),l.start()}el(e),l.wheel=setTimeout(function(){l.wheel=null,l.end()},150),l.zoom("mouse",o(g(m(c,f),l.mouse[0],l.mouse[1]),l.extent,u))}}function _(e){for(var t=arguments.length,i=new Array(t>1?t-1:0),a=1;a<t;a++)i[a-1]=arguments[a];if(!n&&r.apply(this,arguments)){var l=e.currentTarget,s=w(this,i,!0).event(e),c=Si(e.view).on("mousemove.zoom",function(e){if(el(e),!s.moved){var t=e.clientX-d,n=e.clientY-p;s.moved=t*t+n*n>h}s.event(e).zoom("mouse",o(g(s.that.__zoom,s.mouse[0]=eo(e,l),s.mouse[1]),s.extent,u))},!0).on("mouseup.zoom",function(e){c.on("mousemove.zoom mouseup.zoom",null),function(e,t){var n=e.document.documentElement,r=Si(e).on("dragstart.drag",null);t&&(r.on("click.drag",Ji,Gi),setTimeout(function(){r.on("click.drag",null)},0)),"onselectstart"in n?r.on("selectstart.drag",null):(n.style.MozUserSelect=n.__noselect,delete n.__noselect)}(e.view,s.moved),el(e),s.event(e).end()},!0),f=eo(e,l),d=e.clientX,p=e.clientY;!function(e){var t=e.document.documentElement,n=Si(e).on("dragstart.drag",Ji,Gi);"onselectstart"in t?n.on("selectstart.drag",Ji,Gi):(t.__noselect=t.style.MozUserSelect,t.style.MozUserSelect="none")}(e.view),Za(e),s.mouse=[f,this.__zoom.invert(f)],Eo(this),s.start()}}function k(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),a=1;a<t;a++)n[a-1]=arguments[a];if(r.apply(this,arguments)){var l=this.__zoom,s=eo(e.changedTouches?e.changedTouches[0]:e,this),f=l.invert(s),d=l.k*(e.shiftKey?.5:2),h=o(g(m(l,d),s,f),i.apply(this,n),u);el(e),c>0?Si(this).transition().duration(c).call(b,h,s,e):Si(this).call(y.transform,h,s,e)}}function T(n){for(var i=arguments.length,o=new Array(i>1?i-1:0),a=1;a<i;a++)o[a-1]=arguments[a];if(r.apply(this,arguments)){var l,s,u,c,f=n.touches,d=f.length,h=w(this,o,n.changedTouches.length===d).event(n);for(Za(n),s=0;s<d;++s)c=[c=eo(u=f[s],this),this.__zoom.invert(c),u.identifier],h.touch0?h.touch1||h.touch0[2]===c[2]||(h.touch1=c,h.taps=0):(h.touch0=c,l=!0,h.taps=1+!!e);e&&(e=clearTimeout(e)),l&&(h.taps<2&&(t=c[0],e=setTimeout(function(){e=null},500)),Eo(this),h.start())}}function E(e){if(this.__zooming){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];var i,a,l,s,c=w(this,n).event(e),f=e.changedTouches,d=f.length;for(el(e),i=0;i<d;++i)l=eo(a=f[i],this),c.touch0&&c.touch0[2]===a.identifier?c.touch0[0]=l:c.touch1&&c.touch1[2]===a.identifier&&(c.touch1[0]=l);if(a=c.that.__zoom,c.touch1){var h=c.touch0[0],p=c.touch0[1],y=c.touch1[0],v=c.touch1[1],b=(b=y[0]-h[0])*b+(b=y[1]-h[1])*b,x=(x=v[0]-p[0])*x+(x=v[1]-p[1])*x;a=m(a,Math.sqrt(b/x)),l=[(h[0]+y[0])/2,(h[1]+y[1])/2],s=[(p[0]+v[0])/2,(p[1]+v[1])/2]}else{if(!c.touch0)return;l=c.touch0[0],s=c.touch0[1]}c.zoom("touch",o(g(a,l,s),c.extent,u))}}function C(e){for(var r=arguments.length,i=new Array(r>1?r-1:0),o=1;o<r;o++)i[o-1]=arguments[o];if(this.__zooming){var a,l,s=w(this,i).event(e),u=e.changedTouches,c=u.length;for(Za(e),n&&clearTimeout(n),n=setTimeout(function(){n=null},500),a=0;a<c;++a)l=u[a],s.touch0&&s.touch0[2]===l.identifier?delete s.touch0:s.touch1&&s.touch1[2]===l.identifier&&delete s.touch1;if(s.touch1&&!s.touch0&&(s.touch0=s.touch1,delete s.touch1),s.touch0)s.touch0[1]=this.__zoom.invert(s.touch0[0]);else if(s.end(),2===s.taps&&(l=eo(l,this),Math.hypot(t[0]-l[0],t[1]-l[1])<p)){var f=Si(this).on("dblclick.zoom");f&&f.apply(this,arguments)}}}return y.transform=function(e,t,n,r){var i=e.selection?e.selection():e;i.property("__zoom",rl),e!==i?b(e,t,n,r):i.interrupt().each(function(){w(this,arguments).event(r).start().zoom(null,"function"===typeof t?t.apply(this,arguments):t).end()})},y.scaleBy=function(e,t,n,r){y.scaleTo(e,function(){return this.__zoom.k*("function"===typeof t?t.apply(this,arguments):t)},n,r)},y.scaleTo=function(e,t,n,r){y.transform(e,function(){var e=i.apply(this,arguments),r=this.__zoom,a=null==n?v(e):"function"===typeof n?n.apply(this,arguments):n,l=r.invert(a),s="function"===typeof t?t.apply(this,arguments):t;return o(g(m(r,s),a,l),e,u)},n,r)},y.translateBy=function(e,t,n,r){y.transform(e,function(){return o(this.__zoom.translate("function"===typeof t?t.apply(this,arguments):t,"function"===typeof n?n.apply(this,arguments):n),i.apply(this,arguments),u)},null,r)},y.translateTo=function(e,t,n,r,a){y.transform(e,function(){var e=i.apply(this,arguments),a=this.__zoom,l=null==r?v(e):"function"===typeof r?r.apply(this,arguments):r;return o(Ka.translate(l[0],l[1]).scale(a.k).translate("function"===typeof t?-t.apply(this,arguments):-t,"function"===typeof n?-n.apply(this,arguments):-n),e,u)},r,a)},x.prototype={event:function(e){return e&&(this.sourceEvent=e),this},start:function(){return 1===++this.active&&(this.that.__zooming=this,this.emit("start")),this},zoom:function(e,t){return this.mouse&&"mouse"!==e&&(this.mouse[1]=t.invert(this.mouse[0])),this.touch0&&"touch"!==e&&(this.touch0[1]=t.invert(this.touch0[0])),this.touch1&&"touch"!==e&&(this.touch1[1]=t.invert(this.touch1[0])),this.that.__zoom=t,this.emit("zoom"),this},end:function(){return 0===--this.active&&(delete this.that.__zooming,this.emit("end")),this},emit:function(e){var t=Si(this.that).datum();d.call(e,this.that,new Ga(e,{sourceEvent:this.sourceEvent,target:y,type:e,transform:this.that.__zoom,dispatch:d}),t)}},y.wheelDelta=function(e){return arguments.length?(a="function"===typeof e?e:Qa(+e),y):a},y.filter=function(e){return arguments.length?(r="function"===typeof e?e:Qa(!!e),y):r},y.touchable=function(e){return arguments.length?(l="function"===typeof e?e:Qa(!!e),y):l},y.extent=function(e){return arguments.length?(i="function"===typeof e?e:Qa([[+e[0][0],+e[0][1]],[+e[1][0],+e[1][1]]]),y):i},y.scaleExtent=function(e){return arguments.length?(s[0]=+e[0],s[1]=+e[1],y):[s[0],s[1]]},y.translateExtent=function(e){return arguments.length?(u[0][0]=+e[0][0],u[1][0]=+e[1][0],u[0][1]=+e[0][1],u[1][1]=+e[1][1],y):[[u[0][0],u[0][1]],[u[1][0],u[1][1]]]},y.constrain=function(e){return arguments.length?(o=e,y):o},y.duration=function(e){return arguments.length?(c=+e,y):c},y.interpolate=function(e){return arguments.length?(f=e,y):f},y.on=function(){var e=d.on.apply(d,arguments);return e===d?y:e},y.clickDistance=function(e){return arguments.length?(h=(e=+e)*e,y):Math.sqrt(h)},y.tapDistance=function(e){return arguments.length?(p=+e,y):p},y},zoomIdentity:Ka,linkHorizontal:function(){return jl(Al)}};class Hl{constructor(){const e={id:`ID${Math.floor(1e6*Math.random())}`,firstDraw:!0,svgWidth:800,svgHeight:window.innerHeight-100,scaleExtent:[.001,20],container:"body",defaultTextFill:"#2C3E50",defaultFont:"Helvetica",ctx:document.createElement("canvas").getContext("2d"),data:null,duration:400,setActiveNodeCentered:!0,expandLevel:1,compact:!0,rootMargin:40,nodeDefaultBackground:"none",connections:[],lastTransform:{x:0,y:0,k:1},nodeId:e=>e.nodeId||e.id,parentNodeId:e=>e.parentNodeId||e.parentId,backgroundColor:"none",zoomBehavior:null,defs:function(e,t){return`<defs>\n                    ${t.map(t=>{const n=this.getTextWidth(t.label,{ctx:e.ctx,fontSize:2,defaultFont:e.defaultFont});return`\n                       <marker id="${t.from+"_"+t.to}" refX="${t._source.x<t._target.x?-7:7}" refY="5" markerWidth="500"  markerHeight="500"  orient="${t._source.x<t._target.x?"auto":"auto-start-reverse"}" >\n                       <rect rx=0.5 width=${t.label?n+3:0} height=3 y=1  fill="#152785"></rect>\n                       <text font-size="2px" x=1 fill="white" y=3>${t.label||""}</text>\n                       </marker>\n\n                       <marker id="arrow-${t.from+"_"+t.to}"  markerWidth="500"  markerHeight="500"  refY="2"  refX="1" orient="${t._source.x<t._target.x?"auto":"auto-start-reverse"}" >\n                       <path transform="translate(0)" d='M0,0 V4 L2,2 Z' fill='#152785' />\n                       </marker>\n                    `}).join("")}\n                    </defs>\n                    `},connectionsUpdate:function(e,t,n){Vl.select(this).attr("stroke",e=>"#152785").attr("stroke-linecap","round").attr("stroke-width",e=>"5").attr("pointer-events","none").attr("marker-start",e=>`url(#${e.from+"_"+e.to})`).attr("marker-end",e=>`url(#arrow-${e.from+"_"+e.to})`)},linkUpdate:function(e,t,n){Vl.select(this).attr("stroke",e=>e.data._upToTheRootHighlighted?"#152785":"lightgray").attr("stroke-width",e=>e.data._upToTheRootHighlighted?5:2),e.data._upToTheRootHighlighted&&Vl.select(this).raise()},nodeUpdate:function(e,t,n){Vl.select(this).select(".node-rect").attr("stroke",e=>e.data._highlighted||e.data._upToTheRootHighlighted?"#152785":"none").attr("stroke-width",e.data._highlighted||e.data._upToTheRootHighlighted?10:1)},nodeWidth:e=>250,nodeHeight:e=>150,siblingsMargin:e=>20,childrenMargin:e=>60,neightbourMargin:(e,t)=>80,compactMarginPair:e=>100,compactMarginBetween:e=>20,onNodeClick:e=>e,linkGroupArc:Vl.linkHorizontal().x(e=>e.x).y(e=>e.y),nodeContent:e=>`<div style="padding:5px;font-size:10px;">Sample Node(id=${e.id}), override using <br/> <br/> \n            <code>chart<br/>\n            &nbsp;.nodeContent({data}=>{ <br/>\n             &nbsp;&nbsp;&nbsp;&nbsp;return '' // Custom HTML <br/>\n             &nbsp;})</code>\n             <br/> <br/>\n             Or check different <a href="https://github.com/bumbeishvili/org-chart#jump-to-examples" target="_blank">layout examples</a>\n             \n             </div>`,layout:"top",buttonContent:e=>{let{node:t,state:n}=e;return`<div style="border-radius:3px;padding:3px;font-size:10px;margin:auto auto;background-color:lightgray"> ${{left:e=>e?'<div style="margin-top:-10px;line-height:1.2;font-size:25px;height:22px">\u2039</div>':'<div style="margin-top:-10px;font-size:25px;height:23px">\u203a</div>',bottom:e=>e?'<div style="margin-top:-20px;font-size:25px">\u02ec</div>':'<div style="margin-top:0px;line-height:1.2;height:11px;font-size:25px">\u02c6</div>',right:e=>e?'<div style="margin-top:-10px;font-size:25px;height:23px">\u203a</div>':'<div style="margin-top:-10px;line-height:1.2;font-size:25px;height:22px">\u2039</div>',top:e=>e?'<div style="margin-top:0px;line-height:1.2;height:11px;font-size:25px">\u02c6</div>':'<div style="margin-top:-20px;font-size:25px">\u02ec</div>'}[n.layout](t.children)}  </div>`},layoutBindings:{left:{nodeLeftX:e=>0,nodeRightX:e=>e.width,nodeTopY:e=>-e.height/2,nodeBottomY:e=>e.height/2,nodeJoinX:e=>e.x+e.width,nodeJoinY:e=>e.y-e.height/2,linkJoinX:e=>e.x+e.width,linkJoinY:e=>e.y,linkX:e=>e.x,linkY:e=>e.y,linkCompactXStart:e=>e.x+e.width/2,linkCompactYStart:e=>e.y+(e.compactEven?e.height/2:-e.height/2),compactLinkMidX:(e,t)=>e.firstCompactNode.x,compactLinkMidY:(e,t)=>e.firstCompactNode.y+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,linkParentX:e=>e.parent.x+e.parent.width,linkParentY:e=>e.parent.y,buttonX:e=>e.width,buttonY:e=>e.height/2,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o}=e;return`translate(${n},${r}) scale(${i})`},compactDimension:{sizeColumn:e=>e.height,sizeRow:e=>e.width,reverse:e=>e.slice().reverse()},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[t+r,n+i]},zoomTransform:e=>{let{centerY:t,scale:n}=e;return`translate(0,${t}) scale(${n})`},diagonal:this.hdiagonal.bind(this),swap:e=>{const t=e.x;e.x=e.y,e.y=t},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t},${n-i/2})`}},top:{nodeLeftX:e=>-e.width/2,nodeRightX:e=>e.width/2,nodeTopY:e=>0,nodeBottomY:e=>e.height,nodeJoinX:e=>e.x-e.width/2,nodeJoinY:e=>e.y+e.height,linkJoinX:e=>e.x,linkJoinY:e=>e.y+e.height,linkCompactXStart:e=>e.x+(e.compactEven?e.width/2:-e.width/2),linkCompactYStart:e=>e.y+e.height/2,compactLinkMidX:(e,t)=>e.firstCompactNode.x+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,compactLinkMidY:e=>e.firstCompactNode.y,compactDimension:{sizeColumn:e=>e.width,sizeRow:e=>e.height,reverse:e=>e},linkX:e=>e.x,linkY:e=>e.y,linkParentX:e=>e.parent.x,linkParentY:e=>e.parent.y+e.parent.height,buttonX:e=>e.width/2,buttonY:e=>e.height,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o}=e;return`translate(${o},${n}) scale(${i})`},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a,compactViewIndex:l}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[n+r,t+i]},zoomTransform:e=>{let{centerX:t,scale:n}=e;return`translate(${t},0}) scale(${n})`},diagonal:this.diagonal.bind(this),swap:e=>{},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t-r/2},${n})`}},bottom:{nodeLeftX:e=>-e.width/2,nodeRightX:e=>e.width/2,nodeTopY:e=>-e.height,nodeBottomY:e=>0,nodeJoinX:e=>e.x-e.width/2,nodeJoinY:e=>e.y-e.height-e.height,linkJoinX:e=>e.x,linkJoinY:e=>e.y-e.height,linkCompactXStart:e=>e.x+(e.compactEven?e.width/2:-e.width/2),linkCompactYStart:e=>e.y-e.height/2,compactLinkMidX:(e,t)=>e.firstCompactNode.x+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,compactLinkMidY:e=>e.firstCompactNode.y,linkX:e=>e.x,linkY:e=>e.y,compactDimension:{sizeColumn:e=>e.width,sizeRow:e=>e.height,reverse:e=>e},linkParentX:e=>e.parent.x,linkParentY:e=>e.parent.y-e.parent.height,buttonX:e=>e.width/2,buttonY:e=>0,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o,chartHeight:a}=e;return`translate(${o},${a-n}) scale(${i})`},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[n+r,t+i]},zoomTransform:e=>{let{centerX:t,scale:n}=e;return`translate(${t},0}) scale(${n})`},diagonal:this.diagonal.bind(this),swap:e=>{e.y=-e.y},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t-r/2},${n-i})`}},right:{nodeLeftX:e=>-e.width,nodeRightX:e=>0,nodeTopY:e=>-e.height/2,nodeBottomY:e=>e.height/2,nodeJoinX:e=>e.x-e.width-e.width,nodeJoinY:e=>e.y-e.height/2,linkJoinX:e=>e.x-e.width,linkJoinY:e=>e.y,linkX:e=>e.x,linkY:e=>e.y,linkParentX:e=>e.parent.x-e.parent.width,linkParentY:e=>e.parent.y,buttonX:e=>0,buttonY:e=>e.height/2,linkCompactXStart:e=>e.x-e.width/2,linkCompactYStart:e=>e.y+(e.compactEven?e.height/2:-e.height/2),compactLinkMidX:(e,t)=>e.firstCompactNode.x,compactLinkMidY:(e,t)=>e.firstCompactNode.y+e.firstCompactNode.flexCompactDim[0]/4+t.compactMarginPair(e)/4,centerTransform:e=>{let{root:t,rootMargin:n,centerY:r,scale:i,centerX:o,chartWidth:a}=e;return`translate(${a-n},${r}) scale(${i})`},nodeFlexSize:e=>{let{height:t,width:n,siblingsMargin:r,childrenMargin:i,state:o,node:a}=e;if(o.compact&&a.flexCompactDim){return[a.flexCompactDim[0],a.flexCompactDim[1]]}return[t+r,n+i]},compactDimension:{sizeColumn:e=>e.height,sizeRow:e=>e.width,reverse:e=>e.slice().reverse()},zoomTransform:e=>{let{centerY:t,scale:n}=e;return`translate(0,${t}) scale(${n})`},diagonal:this.hdiagonal.bind(this),swap:e=>{const t=e.x;e.x=-e.y,e.y=t},nodeUpdateTransform:e=>{let{x:t,y:n,width:r,height:i}=e;return`translate(${t-r},${n-i/2})`}}}};this.getChartState=()=>e,Object.keys(e).forEach(t=>{this[t]=function(n){return arguments.length?(e[t]=n,this):e[t]}}),this.initializeEnterExitUpdatePattern()}initializeEnterExitUpdatePattern(){Vl.selection.prototype.patternify=function(e){var t=e.selector,n=e.tag,r=e.data||[t],i=this.selectAll("."+t).data(r,(e,t)=>"object"===typeof e&&e.id?e.id:t);return i.exit().remove(),(i=i.enter().append(n).merge(i)).attr("class",t),i}}getNodeChildren(e,t){let{data:n,children:r,_children:i}=e;return t.push(n),r&&r.forEach(e=>{this.getNodeChildren(e,t)}),i&&i.forEach(e=>{this.getNodeChildren(e,t)}),t}initialZoom(e){return this.getChartState().lastTransform.k=e,this}render(){const e=this.getChartState();if(!e.data||0==e.data.length)return console.log("ORG CHART - Data is empty"),this;const t=Vl.select(e.container),n=t.node().getBoundingClientRect();n.width>0&&(e.svgWidth=n.width);const r={id:`ID${Math.floor(1e6*Math.random())}`,chartWidth:e.svgWidth,chartHeight:e.svgHeight};if(e.calc=r,r.centerX=r.chartWidth/2,r.centerY=r.chartHeight/2,e.firstDraw){const t={zoom:null};t.zoom=Vl.zoom().on("zoom",(e,t)=>this.zoomed(e,t)).scaleExtent(e.scaleExtent),e.zoomBehavior=t.zoom}e.flexTreeLayout=yl({nodeSize:t=>{const n=e.nodeWidth(t),r=e.nodeHeight(t),i=e.siblingsMargin(t),o=e.childrenMargin(t);return e.layoutBindings[e.layout].nodeFlexSize({state:e,node:t,width:n,height:r,siblingsMargin:i,childrenMargin:o})}}).spacing((t,n)=>t.parent==n.parent?0:e.neightbourMargin(t,n)),this.setLayouts({expandNodesFirst:!1});const i=t.patternify({tag:"svg",selector:"svg-chart-container"}).style("background-color",e.backgroundColor).attr("width",e.svgWidth).attr("height",e.svgHeight).attr("font-family",e.defaultFont);e.firstDraw&&i.call(e.zoomBehavior).on("dblclick.zoom",null).attr("cursor","move"),e.svg=i;const o=i.patternify({tag:"g",selector:"chart"});return e.centerG=o.patternify({tag:"g",selector:"center-group"}),e.linksWrapper=e.centerG.patternify({tag:"g",selector:"links-wrapper"}),e.nodesWrapper=e.centerG.patternify({tag:"g",selector:"nodes-wrapper"}),e.connectionsWrapper=e.centerG.patternify({tag:"g",selector:"connections-wrapper"}),e.defsWrapper=i.patternify({tag:"g",selector:"defs-wrapper"}),e.firstDraw&&e.centerG.attr("transform",()=>e.layoutBindings[e.layout].centerTransform({centerX:r.centerX,centerY:r.centerY,scale:e.lastTransform.k,rootMargin:e.rootMargin,root:e.root,chartHeight:r.chartHeight,chartWidth:r.chartWidth})),e.chart=o,this.update(e.root),Vl.select(window).on(`resize.${e.id}`,()=>{const t=Vl.select(e.container).node().getBoundingClientRect();e.svg.attr("width",t.width)}),e.firstDraw&&(e.firstDraw=!1),this}addNode(e){const t=this.getChartState(),n=t.allNodes.filter(n=>{let{data:r}=n;return t.nodeId(r)===t.nodeId(e)})[0],r=t.allNodes.filter(n=>{let{data:r}=n;return t.nodeId(r)===t.parentNodeId(e)})[0];return n?(console.log(`ORG CHART - ADD - Node with id "${t.nodeId(e)}" already exists in tree`),this):r?(e._centered&&!e._expanded&&(e._expanded=!0),t.data.push(e),this.updateNodesState(),this):(console.log(`ORG CHART - ADD - Parent node with id "${t.parentNodeId(e)}" not found in the tree`),this)}removeNode(e){const t=this.getChartState(),n=t.allNodes.filter(n=>{let{data:r}=n;return t.nodeId(r)==e})[0];if(!n)return console.log(`ORG CHART - REMOVE - Node with id "${e}" not found in the tree`),this;n.descendants().forEach(e=>e.data._filteredOut=!0);this.getNodeChildren(n,[],t.nodeId).forEach(e=>e._filtered=!0),t.data=t.data.filter(e=>!e._filtered);return this.updateNodesState.bind(this)(),this}groupBy(e,t,n){const r={};return e.forEach(e=>{const n=t(e);r[n]||(r[n]=[]),r[n].push(e)}),Object.keys(r).forEach(e=>{r[e]=n(r[e])}),Object.entries(r)}calculateCompactFlexDimensions(e){const t=this.getChartState();e.eachBefore(e=>{e.firstCompact=null,e.compactEven=null,e.flexCompactDim=null,e.firstCompactNode=null}),e.eachBefore(e=>{if(e.children&&e.children.length>1){const n=e.children.filter(e=>!e.children);if(n.length<2)return;n.forEach((e,t)=>{t||(e.firstCompact=!0),e.compactEven=!(t%2),e.row=Math.floor(t/2)});const r=Vl.max(n.filter(e=>e.compactEven),t.layoutBindings[t.layout].compactDimension.sizeColumn),i=Vl.max(n.filter(e=>!e.compactEven),t.layoutBindings[t.layout].compactDimension.sizeColumn),o=2*Math.max(r,i),a=this.groupBy(n,e=>e.row,e=>Vl.max(e,e=>t.layoutBindings[t.layout].compactDimension.sizeRow(e)+t.compactMarginBetween(e))),l=Vl.sum(a.map(e=>e[1]));n.forEach(e=>{e.firstCompactNode=n[0],e.firstCompact?e.flexCompactDim=[o+t.compactMarginPair(e),l-t.compactMarginBetween(e)]:e.flexCompactDim=[0,0]}),e.flexCompactDim=null}})}calculateCompactFlexPositions(e){const t=this.getChartState();e.eachBefore(e=>{if(e.children){const n=e.children.filter(e=>e.flexCompactDim),r=n[0];if(!r)return;n.forEach((e,n,i)=>{0==n&&(r.x-=r.flexCompactDim[0]/2),n&n%2-1?e.x=r.x+.25*r.flexCompactDim[0]-t.compactMarginPair(e)/4:n&&(e.x=r.x+.75*r.flexCompactDim[0]+t.compactMarginPair(e)/4)});const i=r.x+.5*r.flexCompactDim[0];r.x=r.x+.25*r.flexCompactDim[0]-t.compactMarginPair(r)/4;const o=e.x-i;Math.abs(o)<10&&n.forEach(e=>e.x+=o);const a=this.groupBy(n,e=>e.row,e=>Vl.max(e,e=>t.layoutBindings[t.layout].compactDimension.sizeRow(e))),l=Vl.cumsum(a.map(e=>e[1]+t.compactMarginBetween(e)));n.forEach((e,t)=>{e.row?e.y=r.y+l[e.row-1]:e.y=r.y})}})}update(e){let{x0:t,y0:n,x:r=0,y:i=0,width:o,height:a}=e;const l=this.getChartState();l.calc;l.compact&&this.calculateCompactFlexDimensions(l.root);const s=l.flexTreeLayout(l.root);l.compact&&this.calculateCompactFlexPositions(l.root);const u=s.descendants(),c=s.descendants().slice(1);u.forEach(l.layoutBindings[l.layout].swap);const f=l.connections,d={};l.allNodes.forEach(e=>d[l.nodeId(e.data)]=e);const h={};u.forEach(e=>h[l.nodeId(e.data)]=e),f.forEach(e=>{const t=d[e.from],n=d[e.to];e._source=t,e._target=n});const p=f.filter(e=>h[e.from]&&h[e.to]),y=l.defs.bind(this)(l,p);y!==l.defsWrapper.html()&&l.defsWrapper.html(y);const m=l.linksWrapper.selectAll("path.link").data(c,e=>l.nodeId(e.data)),g=m.enter().insert("path","g").attr("class","link").attr("d",e=>{const r={x:l.layoutBindings[l.layout].linkJoinX({x:t,y:n,width:o,height:a}),y:l.layoutBindings[l.layout].linkJoinY({x:t,y:n,width:o,height:a})};return l.layoutBindings[l.layout].diagonal(r,r,r)}).merge(m);g.attr("fill","none"),g.each(l.linkUpdate),g.transition().duration(l.duration).attr("d",e=>{const t=l.compact&&e.flexCompactDim?{x:l.layoutBindings[l.layout].compactLinkMidX(e,l),y:l.layoutBindings[l.layout].compactLinkMidY(e,l)}:{x:l.layoutBindings[l.layout].linkX(e),y:l.layoutBindings[l.layout].linkY(e)},n={x:l.layoutBindings[l.layout].linkParentX(e),y:l.layoutBindings[l.layout].linkParentY(e)},r=l.compact&&e.flexCompactDim?{x:l.layoutBindings[l.layout].linkCompactXStart(e),y:l.layoutBindings[l.layout].linkCompactYStart(e)}:t;return l.layoutBindings[l.layout].diagonal(t,n,r)});m.exit().transition().duration(l.duration).attr("d",e=>{const t={x:l.layoutBindings[l.layout].linkJoinX({x:r,y:i,width:o,height:a}),y:l.layoutBindings[l.layout].linkJoinY({x:r,y:i,width:o,height:a})};return l.layoutBindings[l.layout].diagonal(t,t)}).remove();const v=l.connectionsWrapper.selectAll("path.connection").data(p),b=v.enter().insert("path","g").attr("class","connection").attr("d",e=>{const r={x:l.layoutBindings[l.layout].linkJoinX({x:t,y:n,width:o,height:a}),y:l.layoutBindings[l.layout].linkJoinY({x:t,y:n,width:o,height:a})};return l.layoutBindings[l.layout].diagonal(r,r)}).merge(v);b.attr("fill","none"),b.transition().duration(l.duration).attr("d",e=>{const t=l.layoutBindings[l.layout].linkX({x:e._source.x,y:e._source.y,width:e._source.width,height:e._source.height}),n=l.layoutBindings[l.layout].linkY({x:e._source.x,y:e._source.y,width:e._source.width,height:e._source.height}),r=l.layoutBindings[l.layout].linkJoinX({x:e._target.x,y:e._target.y,width:e._target.width,height:e._target.height}),i=l.layoutBindings[l.layout].linkJoinY({x:e._target.x,y:e._target.y,width:e._target.width,height:e._target.height});return l.linkGroupArc({source:{x:t,y:n},target:{x:r,y:i}})}),b.each(l.connectionsUpdate);v.exit().transition().duration(l.duration).attr("opacity",0).remove();const w=l.nodesWrapper.selectAll("g.node").data(u,e=>{let{data:t}=e;return l.nodeId(t)}),x=w.enter().append("g").attr("class","node").attr("transform",e=>{if(e==l.root)return`translate(${t},${n})`;return`translate(${l.layoutBindings[l.layout].nodeJoinX({x:t,y:n,width:o,height:a})},${l.layoutBindings[l.layout].nodeJoinY({x:t,y:n,width:o,height:a})})`}).attr("cursor","pointer").on("click",(e,t)=>{let{data:n}=t;[...e.srcElement.classList].includes("node-button-foreign-object")||l.onNodeClick(l.nodeId(n))});x.patternify({tag:"rect",selector:"node-rect",data:e=>[e]});const S=x.merge(w).style("font","12px sans-serif");S.patternify({tag:"foreignObject",selector:"node-foreign-object",data:e=>[e]}).style("overflow","visible").patternify({tag:"xhtml:div",selector:"node-foreign-object-div",data:e=>[e]}),this.restyleForeignObjectElements();const _=x.patternify({tag:"g",selector:"node-button-g",data:e=>[e]}).on("click",(e,t)=>this.onButtonClick(e,t)).on("keydown",(e,t)=>{"Enter"!==e.key&&" "!==e.key&&"Spacebar"!==e.key||this.onButtonClick(e,t)});_.patternify({tag:"rect",selector:"node-button-rect",data:e=>[e]}).attr("opacity",0).attr("pointer-events","all").attr("width",40).attr("height",40).attr("x",-20).attr("y",-20);_.patternify({tag:"foreignObject",selector:"node-button-foreign-object",data:e=>[e]}).attr("width",40).attr("height",40).attr("x",-20).attr("y",-20).style("overflow","visible").patternify({tag:"xhtml:div",selector:"node-button-div",data:e=>[e]}).style("pointer-events","none").style("display","flex").style("width","100%").style("height","100%");S.transition().attr("opacity",0).duration(l.duration).attr("transform",e=>{let{x:t,y:n,width:r,height:i}=e;return l.layoutBindings[l.layout].nodeUpdateTransform({x:t,y:n,width:r,height:i})}).attr("opacity",1),S.select(".node-rect").attr("width",e=>{let{width:t}=e;return t}).attr("height",e=>{let{height:t}=e;return t}).attr("x",e=>{let{width:t}=e;return 0}).attr("y",e=>{let{height:t}=e;return 0}).attr("cursor","pointer").attr("rx",3).attr("fill",l.nodeDefaultBackground),S.select(".node-button-g").attr("transform",e=>{let{data:t,width:n,height:r}=e;return`translate(${l.layoutBindings[l.layout].buttonX({width:n,height:r})},${l.layoutBindings[l.layout].buttonY({width:n,height:r})})`}).attr("display",e=>{let{data:t}=e;return t._directSubordinates>0?null:"none"}).attr("opacity",e=>{let{children:t,_children:n}=e;return t||n?1:0}),S.select(".node-button-foreign-object .node-button-div").html(e=>l.buttonContent({node:e,state:l})),S.select(".node-button-text").attr("text-anchor","middle").attr("alignment-baseline","middle").attr("fill",l.defaultTextFill).attr("font-size",e=>{let{children:t}=e;return t?40:26}).text(e=>{let{children:t}=e;return t?"-":"+"}).attr("y",this.isEdge()?10:0),S.each(l.nodeUpdate);w.exit().attr("opacity",1).transition().duration(l.duration).attr("transform",e=>`translate(${l.layoutBindings[l.layout].nodeJoinX({x:r,y:i,width:o,height:a})},${l.layoutBindings[l.layout].nodeJoinY({x:r,y:i,width:o,height:a})})`).on("end",function(){Vl.select(this).remove()}).attr("opacity",0);u.forEach(e=>{e.x0=e.x,e.y0=e.y});const k=l.allNodes.filter(e=>e.data._centered)[0];if(k){const e=k.data._centeredWithDescendants?k.descendants().filter((e,t)=>t<7):[k];k.data._centeredWithDescendants=null,k.data._centered=null,this.fit({animate:!0,scale:!1,nodes:e})}}isEdge(){return window.navigator.userAgent.includes("Edge")}hdiagonal(e,t,n){const r=e.x,i=e.y,o=t.x,a=t.y;let l=n&&n.x||r,s=n&&n.y||i,u=o-r<0?-1:1,c=a-i<0?-1:1,f=Math.abs(o-r)/2<35?Math.abs(o-r)/2:35;f=Math.abs(a-i)/2<f?Math.abs(a-i)/2:f;Math.abs(a-i);let d=Math.abs(o-r)/2-f;return`\n                  M ${l} ${s}\n                  L ${l} ${i}\n                  L ${r} ${i}\n                  L ${r+d*u} ${i}\n                  C ${r+d*u+f*u} ${i} \n                    ${r+d*u+f*u} ${i} \n                    ${r+d*u+f*u} ${i+f*c}\n                  L ${r+d*u+f*u} ${a-f*c} \n                  C ${r+d*u+f*u}  ${a} \n                    ${r+d*u+f*u}  ${a} \n                    ${o-d*u}  ${a}\n                  L ${o} ${a}\n       `}diagonal(e,t,n){const r=e.x,i=e.y,o=t.x,a=t.y;let l=n&&n.x||r,s=n&&n.y||i,u=o-r<0?-1:1,c=a-i<0?-1:1,f=Math.abs(o-r)/2<35?Math.abs(o-r)/2:35;f=Math.abs(a-i)/2<f?Math.abs(a-i)/2:f;let d=Math.abs(a-i)/2-f;return`\n                  M ${l} ${s}\n                  L ${r} ${s}\n                  L ${r} ${i}\n                  L ${r} ${i+d*c}\n                  C  ${r} ${i+d*c+f*c} ${r} ${i+d*c+f*c} ${r+f*u} ${i+d*c+f*c}\n                  L ${r+(Math.abs(o-r)-2*f)*u+f*u} ${i+d*c+f*c}\n                  C  ${o}  ${i+d*c+f*c} ${o}  ${i+d*c+f*c} ${o} ${a-d*c}\n                  L ${o} ${a}\n       `}restyleForeignObjectElements(){const e=this.getChartState();e.svg.selectAll(".node-foreign-object").attr("width",e=>{let{width:t}=e;return t}).attr("height",e=>{let{height:t}=e;return t}).attr("x",e=>{let{width:t}=e;return 0}).attr("y",e=>{let{height:t}=e;return 0}),e.svg.selectAll(".node-foreign-object-div").style("width",e=>{let{width:t}=e;return`${t}px`}).style("height",e=>{let{height:t}=e;return`${t}px`}).html(function(t,n,r){return e.nodeContent.bind(this)(t,n,r,e)})}onButtonClick(e,t){this.getChartState().setActiveNodeCentered&&(t.data._centered=!0,t.data._centeredWithDescendants=!0),t.children?(t._children=t.children,t.children=null,this.setExpansionFlagToChildren(t,!1)):(t.children=t._children,t._children=null,t.children&&t.children.forEach(e=>{let{data:t}=e;return t._expanded=!0})),this.update(t)}setExpansionFlagToChildren(e,t){let{data:n,children:r,_children:i}=e;n._expanded=t,r&&r.forEach(e=>{this.setExpansionFlagToChildren(e,t)}),i&&i.forEach(e=>{this.setExpansionFlagToChildren(e,t)})}expandSomeNodes(e){if(e.data._expanded){let t=e.parent;for(;t;)t._children&&(t.children=t._children),t=t.parent}e._children&&e._children.forEach(e=>this.expandSomeNodes(e)),e.children&&e.children.forEach(e=>this.expandSomeNodes(e))}updateNodesState(){const e=this.getChartState();this.setLayouts({expandNodesFirst:!0}),this.update(e.root)}setLayouts(e){let{expandNodesFirst:t=!0}=e;const n=this.getChartState();n.root=Vl.stratify().id(e=>n.nodeId(e)).parentId(e=>n.parentNodeId(e))(n.data),n.root.each((e,t,r)=>{let i=n.nodeWidth(e),o=n.nodeHeight(e);Object.assign(e,{width:i,height:o})}),n.root.x0=0,n.root.y0=0,n.allNodes=n.root.descendants(),n.allNodes.forEach(e=>{Object.assign(e.data,{_directSubordinates:e.children?e.children.length:0,_totalSubordinates:e.descendants().length-1})}),n.root.children&&(t&&n.root.children.forEach(this.expand),n.root.children.forEach(e=>this.collapse(e)),0==n.expandLevel&&(n.root._children=n.root.children,n.root.children=null),[n.root].forEach(e=>this.expandSomeNodes(e)))}collapse(e){e.children&&(e._children=e.children,e._children.forEach(e=>this.collapse(e)),e.children=null)}expand(e){e._children&&(e.children=e._children,e.children.forEach(e=>this.expand(e)),e._children=null)}zoomed(e,t){const n=this.getChartState(),r=n.chart,i=e.transform;n.lastTransform=i,r.attr("transform",i),this.isEdge()&&this.restyleForeignObjectElements()}zoomTreeBounds(e){let{x0:t,x1:n,y0:r,y1:i,params:o={animate:!0,scale:!0}}=e;const{centerG:a,svgWidth:l,svgHeight:s,svg:u,zoomBehavior:c,duration:f,lastTransform:d}=this.getChartState();let h=Math.min(8,.9/Math.max((n-t)/l,(i-r)/s)),p=Vl.zoomIdentity.translate(l/2,s/2);p=p.scale(o.scale?h:d.k),p=p.translate(-(t+n)/2,-(r+i)/2),u.transition().duration(o.animate?f:0).call(c.transform,p),a.transition().duration(o.animate?f:0).attr("transform","translate(0,0)")}fit(){let{animate:e=!0,nodes:t,scale:n=!0}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const r=this.getChartState(),{root:i}=r;let o=t||i.descendants();const a=Vl.min(o,e=>e.x+r.layoutBindings[r.layout].nodeLeftX(e)),l=Vl.max(o,e=>e.x+r.layoutBindings[r.layout].nodeRightX(e)),s=Vl.min(o,e=>e.y+r.layoutBindings[r.layout].nodeTopY(e)),u=Vl.max(o,e=>e.y+r.layoutBindings[r.layout].nodeBottomY(e));return this.zoomTreeBounds({params:{animate:e,scale:n},x0:a-50,x1:l+50,y0:s-50,y1:u+50}),this}setExpanded(e){let t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];const n=this.getChartState(),r=n.allNodes.filter(t=>{let{data:r}=t;return n.nodeId(r)==e})[0];return r?(r.data._expanded=t,this):(console.log(`ORG CHART - ${t?"EXPAND":"COLLAPSE"} - Node with id (${e})  not found in the tree`),this)}setCentered(e){const t=this.getChartState(),n=t.allNodes.filter(n=>t.nodeId(n.data)===e)[0];return n?(n.data._centered=!0,n.data._expanded=!0,this):(console.log(`ORG CHART - CENTER - Node with id (${e}) not found in the tree`),this)}setHighlighted(e){const t=this.getChartState(),n=t.allNodes.filter(n=>t.nodeId(n.data)===e)[0];return n?(n.data._highlighted=!0,n.data._expanded=!0,n.data._centered=!0,this):(console.log(`ORG CHART - HIGHLIGHT - Node with id (${e})  not found in the tree`),this)}setUpToTheRootHighlighted(e){const t=this.getChartState(),n=t.allNodes.filter(n=>t.nodeId(n.data)===e)[0];return n?(n.data._upToTheRootHighlighted=!0,n.data._expanded=!0,n.ancestors().forEach(e=>e.data._upToTheRootHighlighted=!0),this):(console.log(`ORG CHART - HIGHLIGHTROOT - Node with id (${e}) not found in the tree`),this)}clearHighlighting(){const e=this.getChartState();e.allNodes.forEach(e=>{e.data._highlighted=!1,e.data._upToTheRootHighlighted=!1}),this.update(e.root)}fullscreen(e){const t=this.getChartState(),n=Vl.select(e||t.container).node();Vl.select(document).on("fullscreenchange."+t.id,function(e){(document.fullscreenElement||document.mozFullscreenElement||document.webkitFullscreenElement)==n?setTimeout(e=>{t.svg.attr("height",window.innerHeight-40)},500):t.svg.attr("height",t.svgHeight)}),n.requestFullscreen?n.requestFullscreen():n.mozRequestFullScreen?n.mozRequestFullScreen():n.webkitRequestFullscreen?n.webkitRequestFullscreen():n.msRequestFullscreen&&n.msRequestFullscreen()}zoomIn(){const{svg:e,zoomBehavior:t}=this.getChartState();e.transition().call(t.scaleBy,1.3)}zoomOut(){const{svg:e,zoomBehavior:t}=this.getChartState();e.transition().call(t.scaleBy,.78)}toDataURL(e,t){var n=new XMLHttpRequest;n.onload=function(){var e=new FileReader;e.onloadend=function(){t(e.result)},e.readAsDataURL(n.response)},n.open("GET",e),n.responseType="blob",n.send()}exportImg(){let{full:e=!1,scale:t=3,onLoad:n=e=>e,save:r=!0}=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};const i=this,o=this.getChartState(),{svg:a,root:l}=o;let s=0;const u=a.selectAll("img");let c=u.size();const f=()=>{JSON.parse(JSON.stringify(i.lastTransform()));const o=i.duration();e&&i.fit();const{svg:a}=i.getChartState();setTimeout(e=>{i.downloadImage({node:a.node(),scale:t,isSvg:!1,onAlreadySerialized:e=>{i.update(l)},onLoad:n,save:r})},e?o+10:0)};c>0?u.each(function(){i.toDataURL(this.src,e=>{this.src=e,++s==c&&f()})}):f()}exportSvg(){const{svg:e}=this.getChartState();return this.downloadImage({node:e.node(),scale:3,isSvg:!0}),this}expandAll(){const{allNodes:e,root:t}=this.getChartState();return e.forEach(e=>e.data._expanded=!0),this.render(),this}collapseAll(){const{allNodes:e,root:t}=this.getChartState();return e.forEach(e=>e.data._expanded=!1),this.expandLevel(0),this.render(),this}downloadImage(e){let{node:t,scale:n=2,isSvg:r=!1,save:i=!0,onAlreadySerialized:o=e=>{},onLoad:a=e=>{}}=e;const l=t;if(r){let e=d(l);return e='<?xml version="1.0" standalone="no"?>\r\n'+e,f(c="data:image/svg+xml;charset=utf-8,"+encodeURIComponent(e),"graph.svg"),void o()}const s=n,u=document.createElement("img");u.onload=function(){const e=document.createElement("canvas"),t=l.getBoundingClientRect();e.width=t.width*s,e.height=t.height*s;const n=e.getContext("2d");n.fillStyle="#FAFAFA",n.fillRect(0,0,t.width*s,t.height*s),n.drawImage(u,0,0,t.width*s,t.height*s);let r=e.toDataURL("image/png");a&&a(r),i&&f(r,"graph.png")};var c="data:image/svg+xml; charset=utf8, "+encodeURIComponent(d(l));function f(e,t){var n=document.createElement("a");"string"===typeof n.download?(document.body.appendChild(n),n.download=t,n.href=e,n.click(),document.body.removeChild(n)):location.replace(e)}function d(e){const t="http://www.w3.org/2000/xmlns/";e=e.cloneNode(!0);const n=window.location.href+"#",r=document.createTreeWalker(e,NodeFilter.SHOW_ELEMENT,null,!1);for(;r.nextNode();)for(const e of r.currentNode.attributes)e.value.includes(n)&&(e.value=e.value.replace(n,"#"));e.setAttributeNS(t,"xmlns","http://www.w3.org/2000/svg"),e.setAttributeNS(t,"xmlns:xlink","http://www.w3.org/1999/xlink");return(new XMLSerializer).serializeToString(e)}o(),u.src=c}getTextWidth(e){let{fontSize:t=14,fontWeight:n=400,defaultFont:r="Helvetice",ctx:i}=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};i.font=`${n||""} ${t}px ${r} `;return i.measureText(e).width}}var Yl=n(579);const Wl=function(e){var t=function(t){function n(n){var r=t.call(this,n)||this;return r.componentDidMount=function(){ar.events.addEventListener(ar.RENDER_EVENT,r.onRenderEvent),ar.setComponentReady()},r.componentDidUpdate=function(){null!=r.state.componentError&&ar.setFrameHeight()},r.componentWillUnmount=function(){ar.events.removeEventListener(ar.RENDER_EVENT,r.onRenderEvent)},r.onRenderEvent=function(e){var t=e;r.setState({renderData:t.detail})},r.render=function(){return null!=r.state.componentError?l.createElement("div",null,l.createElement("h1",null,"Component Error"),l.createElement("span",null,r.state.componentError.message)):null==r.state.renderData?null:l.createElement(e,{width:window.innerWidth,disabled:r.state.renderData.disabled,args:r.state.renderData.args,theme:r.state.renderData.theme})},r.state={renderData:void 0,componentError:void 0},r}return sr(n,t),n.getDerivedStateFromError=function(e){return{componentError:e}},n}(l.PureComponent);return a()(t,e)}((()=>{const oc_demo=[{id:"100",parentId:"",name:"Steven",lastName:"King",position:"COO"},{id:"101",parentId:"100",name:"Neena",lastName:"Kochhar",position:"Admin VP"}],oc_apply=(e,t,n)=>"keyframe"===n.type?(e.clear(),n.nodes.forEach(t=>e.set(t.id,t)),!0):n.base===t&&(n.removed.forEach(t=>e.delete(t)),n.updated.forEach(t=>e.set(t.id,Object.assign({},e.get(t.id),t))),n.added.forEach(t=>e.set(t.id,t)),!0);return e=>{var t,n,o;const i=(0,r.useRef)(null),a=(0,r.useRef)(null),c=(0,r.useRef)(new Map),s=(0,r.useRef)(null),{args:u}=e,f=null!==(t=u.frame)&&void 0!==t?t:null,l=null!==(n=u.height)&&void 0!==n?n:600;return(0,r.useEffect)(()=>{const t=document.createElement("link");t.href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&display=swap",t.rel="stylesheet",document.head.appendChild(t);const n=document.createElement("link");n.href="https://fonts.googleapis.com/css2?family=Quantico:wght@400;700&display=swap",n.rel="stylesheet",document.head.appendChild(n)},[]),(0,r.useEffect)(()=>{const e=i.current;if(!e)return;let t;if(f){if(f.version===s.current)return;if(!oc_apply(c.current,s.current,f))return void ar.setComponentValue({rejected:f.version});s.current=f.version,t=Array.from(c.current.values())}else t=null!==(o=u.data)&&void 0!==o?o:oc_demo;if(a.current&&a.current.svgHeight()===l)return void a.current.data(t).render();e.innerHTML="";const w=e.getBoundingClientRect().width;a.current=(new Hl).container(e).data(t).rootMargin(100).nodeWidth(e=>330).nodeHeight(e=>170).childrenMargin(e=>90).compactMarginBetween(e=>65).compactMarginPair(e=>100).neightbourMargin(()=>50).siblingsMargin(()=>100).compact(!1).linkUpdate(function(){this.setAttribute("stroke","#00F0FF"),this.setAttribute("stroke-opacity","0.8"),this.setAttribute("stroke-width","2")}).buttonContent(e=>{let{node:t}=e;return`<div style="color:#00F0FF;border-radius:5px;padding:3px;font-family:'Orbitron';font-size:10px;margin:auto auto;background-color:#0B0F1A;border: 1px solid #00F0FF"> \n          <span style="font-family:'Orbitron'; font-size:9px">${t.children?"\u25b2":"\u25bc"}</span> ${t.data._directSubordinates} </div>`}).nodeContent(e=>{const t="#00F0FF",n="#D8F3FF",r=`0 0 10px ${t}, 0 0 20px ${t}`,i=`<svg width=150 height=75 style="opacity:0.8"><path d="M 0,15 L15,0 L135,0 L150,15 L150,60 L135,75 L15,75 L0,60" fill="${t}" stroke="${t}"/></svg>`,o=Array.from({length:5},()=>Math.floor(25*Math.random()+5));return`\n          <div class="left-top" style="position:absolute;left:-10px;top:-10px">${i}</div>\n          <div class="right-top" style="position:absolute;right:-10px;top:-10px">${i}</div>\n          <div class="right-bottom" style="position:absolute;right:-10px;bottom:-14px">${i}</div>\n          <div class="left-bottom" style="position:absolute;left:-10px;bottom:-14px">${i}</div>\n\n          <div style="font-family:'Quantico', sans-serif; background-color:#0B0F1A; color:${n}; position:absolute; width:${e.width}px; height:${e.height}px; border:2px solid ${t}; border-radius:8px;">\n            \n            \x3c!-- Info Text --\x3e\n            <div style="position:absolute; top:10px; right:20px; text-align:right; font-family:'Orbitron', sans-serif;">\n              <div style="font-size:14px; color:${n}; font-weight:bold;">${e.data.name}</div>\n              <div style="font-size:12px;">${e.data.positionName||""}</div>\n              <div style="font-size:11px;">${e.data.id||""}</div>\n            </div>\n\n            \x3c!-- Avatar --\x3e\n            <div style="position:absolute; top:35px; left:${(e.width-80)/2}px;">\n              <img src="${e.data.imageUrl}" style="width:80px; height:80px; border-radius:50%; border:2px solid ${t}; box-shadow:${r};" />\n            </div>\n\n            \x3c!-- Simulated Pie / Progress Bars --\x3e\n            <div style="position:absolute; top:105px; left:20px;">\n              <div style="font-size:10px; margin-bottom:4px; color:${n}; font-family:'Orbitron', sans-serif;">Workload</div>\n              <svg width="130" height="30">\n                ${o.map((e,t)=>`<rect width="10" x="${20*t}" height="${e}" y="${30-e}" fill="#00F0FF" rx="2" />`).join("")}\n              </svg>\n            </div>\n          </div>\n        `}).svgWidth(w).svgHeight(l),a.current.render().fit()},[u.data,f,l]),(0,Yl.jsx)("div",{ref:i,style:{width:"100%",height:`${l}px`}})}})());i.createRoot(document.getElementById("root")).render((0,Yl.jsx)(Wl,{}))})();
+//# sourceMappingURL=main.9f0b232e.js.map
\ No newline at end of file
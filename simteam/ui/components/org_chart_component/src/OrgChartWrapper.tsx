@@ -1,26 +1,58 @@
 import { useEffect, useRef } from "react";
 import {
+  Streamlit,
   withStreamlitConnection,
   ComponentProps,
 } from "streamlit-component-lib";
 import { OrgChart } from "d3-org-chart";
 
+type OrgNode = { id: string; parentId?: string | null; [field: string]: any };
+
+// Update protocol from OrgIndex.frame: every node, or the changes from `base`
+type Frame =
+  | { type: "keyframe"; version: string; nodes: OrgNode[] }
+  | {
+      type: "delta";
+      base: string;
+      version: string;
+      added: OrgNode[];
+      updated: OrgNode[]; // changed fields only, plus id
+      removed: string[];
+    };
+
+const DEMO_DATA = [
+  { id: "100", parentId: "", name: "Steven", lastName: "King", position: "COO" },
+  { id: "101", parentId: "100", name: "Neena", lastName: "Kochhar", position: "Admin VP" },
+];
+
+/**
+ * Apply `frame` to `nodes` in place. Returns false if it is a delta from a
+ * version other than `version` (the one the nodes are at).
+ */
+const applyFrame = (nodes: Map<string, OrgNode>, version: string | null, frame: Frame): boolean => {
+  if (frame.type === "keyframe") {
+    nodes.clear();
+    frame.nodes.forEach((node) => nodes.set(node.id, node));
+    return true;
+  }
+  if (frame.base !== version) return false;
+  frame.removed.forEach((id) => nodes.delete(id));
+  frame.updated.forEach((patch) => nodes.set(patch.id, { ...nodes.get(patch.id), ...patch }));
+  frame.added.forEach((node) => nodes.set(node.id, node));
+  return true;
+};
+
 const OrgChartWrapper = (props: ComponentProps) => {
   const chartRef = useRef<HTMLDivElement>(null);
+  const chart = useRef<any>(null);
+  const nodes = useRef<Map<string, OrgNode>>(new Map());
+  const version = useRef<string | null>(null);
   const { args } = props;
 
-  const data =
-    args.data ?? [
-      { id: "100", parentId: "", name: "Steven", lastName: "King", position: "COO" },
-      { id: "101", parentId: "100", name: "Neena", lastName: "Kochhar", position: "Admin VP" },
-    ];
-
+  const frame: Frame | null = args.frame ?? null;
   const height = args.height ?? 600;
 
   useEffect(() => {
-    const container = chartRef.current;
-    if (!container) return;
-
     // Inject Orbitron and Quantico fonts
     const linkOrbitron = document.createElement("link");
     linkOrbitron.href = "https://fonts.googleapis.com/css2?family=Orbitron:wght@400;700&display=swap";
@@ -31,11 +63,36 @@ const OrgChartWrapper = (props: ComponentProps) => {
     linkQuantico.href = "https://fonts.googleapis.com/css2?family=Quantico:wght@400;700&display=swap";
     linkQuantico.rel = "stylesheet";
     document.head.appendChild(linkQuantico);
+  }, []);
+
+  useEffect(() => {
+    const container = chartRef.current;
+    if (!container) return;
+
+    let data: OrgNode[];
+    if (frame) {
+      if (frame.version === version.current) return; // rerun with nothing new
+      if (!applyFrame(nodes.current, version.current, frame)) {
+        // Our nodes are not the delta's base: ask the app for a keyframe
+        Streamlit.setComponentValue({ rejected: frame.version });
+        return;
+      }
+      version.current = frame.version;
+      data = Array.from(nodes.current.values());
+    } else {
+      data = args.data ?? DEMO_DATA;
+    }
+
+    // Keep the existing chart (and its zoom/expanded nodes) across updates
+    if (chart.current && chart.current.svgHeight() === height) {
+      chart.current.data(data).render();
+      return;
+    }
 
     container.innerHTML = "";
     const width = container.getBoundingClientRect().width;
 
-    const chart = new OrgChart()
+    chart.current = new OrgChart()
       .container(container)
       .data(data)
       .rootMargin(100)
@@ -104,10 +161,9 @@ const OrgChartWrapper = (props: ComponentProps) => {
         `;
       })
       .svgWidth(width)
-      .svgHeight(height)
-      .render()
-      .fit();
-  }, [args.data, args.height]);
+      .svgHeight(height);
+    chart.current.render().fit();
+  }, [args.data, frame, height]);
 
   return (
     <div
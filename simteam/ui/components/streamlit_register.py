@@ -1,5 +1,6 @@
 # components/streamlit_register.py
 import os
+import streamlit as st
 import streamlit.components.v1 as components
 
 _build_path = os.path.join(
@@ -8,6 +9,42 @@ _build_path = os.path.join(
 )
 _org_chart = components.declare_component("org_chart", path=_build_path)
 
-def render_org_chart(data=None, key=None, height=500):
-    """height=600 sets the iframe height statically."""
-    return _org_chart(data=data, key=key, height=height)
+def render_org_chart(data=None, key=None, height=500, frame=None):
+    """
+    Render the org chart from a full node list (`data`) or an update `frame`
+    (see `OrgIndex.frame`). height=600 sets the iframe height statically.
+    """
+    return _org_chart(data=data, frame=frame, key=key, height=height, default=None)
+
+
+def _sent_key(key):
+    return f"{key}__sent"
+
+
+def render_org_chart_at(org_index, day, key, height=500):
+    """
+    Render `org_index` as of `day`, sending the component only what changed
+    since the frame it was last sent.
+
+    The component keeps its nodes between reruns and applies deltas to them.
+    If it cannot (e.g. its iframe was recreated), it reports the rejected
+    version as its value and the next rerun sends a keyframe.
+    """
+    sent = st.session_state.get(_sent_key(key))  # (version, type) of the last frame
+    rejected = (st.session_state.get(key) or {}).get("rejected")
+
+    base = None
+    if sent and not (sent[1] == "delta" and rejected == sent[0]):
+        base = sent[0]
+
+    frame = org_index.frame(day, base)
+    st.session_state[_sent_key(key)] = (frame["version"], frame["type"])
+    return render_org_chart(frame=frame, key=key, height=height)
+
+
+def forget_org_chart(key):
+    """
+    Call on runs that do not render the chart: its component is unmounted,
+    so the next render starts from a keyframe.
+    """
+    st.session_state.pop(_sent_key(key), None)
@@ -7,9 +7,8 @@ import os
 import time
 from typing import Iterator
 
-from app.data_loader import load_event_log, load_temps
-from app.org_builder import build_org_structure
-from components.streamlit_register import render_org_chart
+from app.data_loader import load_org_index
+from components.streamlit_register import forget_org_chart, render_org_chart_at
 from pydanticai.async_call import get_sql_response
 
 # --- Load custom CSS ---
@@ -87,17 +86,16 @@ with st.sidebar:
             show_help("app/help_text/date_picker.md")
 
     # --- Load data ---
+    # Cached across reruns; only revalidated with the API once the TTL expires
     with st.spinner("Fetching event log..."):
-        df = load_event_log()
-        temp_list = load_temps()
+        org_index = load_org_index()
 
-    if df.empty:
+    if not org_index.dates:
         st.warning("No data available.")
         st.stop()
 
-    df["date"] = pd.to_datetime(df["date"])
-    min_date = df["date"].min().date()
-    max_date = df["date"].max().date()
+    min_date = org_index.min_date
+    max_date = org_index.max_date
 
     # --- Initialise date state ---
     if "selected_date" not in st.session_state:
@@ -131,7 +129,7 @@ with st.sidebar:
     st.session_state.selected_date = selected_date
 
     # --- Filter for selected date ---
-    df_day = df[df["date"].dt.date == selected_date]
+    df_day = org_index.events_on(selected_date)
 
     # --- Event Console Text Generator ---
     def console_stream_chars() -> Iterator[str]:
@@ -176,8 +174,11 @@ with st.sidebar:
 
 # --- Main Body ---
 
-# Build org data
-actives, temps = build_org_structure(df, temp_list=temp_list, date=selected_date.isoformat())
+# Org data for the selected date, precomputed per day in the index
+actives, temps = org_index.org_at(selected_date)
+
+if selected_tab != 'ORG CHART':
+    forget_org_chart("org_chart")
 
 if selected_tab == 'ABOUT':
     def stream_readme() -> Iterator[str]:
@@ -201,7 +202,8 @@ elif selected_tab == 'ORG CHART':
     with col2:
         if st.button(":blue-badge[:material/info:]", type='tertiary'):
             show_help("app/help_text/org_chart.md")
-    render_org_chart(actives + temps, key="org_chart", height=400)
+    # Only the changes since the previously shown date are sent to the chart
+    render_org_chart_at(org_index, selected_date, key="org_chart", height=400)
 
 elif selected_tab == 'AI CHATBOT':
     # --- AI Assistant Header ---